@@ -0,0 +1,365 @@
+"""Synthetic XDR fixtures shared by the benchmark scripts.
+
+The fixtures are built deterministically from SDK objects so the benchmarks
+do not depend on network access or on large binary files being checked in.
+The ledger produced by :func:`build_ledger_close_meta` mirrors the shape of
+a protocol 23+ ``LedgerCloseMetaV2``: a generalized transaction set, one
+``TransactionResultMetaV1`` per transaction with ledger entry changes,
+contract events and Soroban return values. Soroban transactions can also
+upload contract code, to give the ledger large opaque payloads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from stellar_sdk import (
+    Account,
+    Address,
+    Asset,
+    Keypair,
+    Network,
+    StrKey,
+    TransactionBuilder,
+    scval,
+)
+from stellar_sdk import xdr as stellar_xdr
+
+__all__ = [
+    "build_ledger_close_meta",
+    "build_ledger_close_meta_batch",
+    "build_transaction_envelopes",
+]
+
+_NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
+_CONTRACT_ID = StrKey.encode_contract(hashlib.sha256(b"benchmark-contract").digest())
+
+
+def _keypair(index: int) -> Keypair:
+    return Keypair.from_raw_ed25519_seed(
+        hashlib.sha256(f"benchmark-{index}".encode()).digest()
+    )
+
+
+def _hash(*parts: object) -> stellar_xdr.Hash:
+    data = "/".join(str(part) for part in parts).encode()
+    return stellar_xdr.Hash(hashlib.sha256(data).digest())
+
+
+def build_transaction_envelopes(
+    count: int, soroban_ratio: float = 0.5
+) -> list[stellar_xdr.TransactionEnvelope]:
+    """Build ``count`` signed envelopes, mixing payments and contract calls."""
+    envelopes = []
+    soroban_every = max(1, round(1 / soroban_ratio)) if soroban_ratio else 0
+    for i in range(count):
+        source = _keypair(i)
+        destination = _keypair(i + 1)
+        builder = TransactionBuilder(
+            Account(source.public_key, 1_000_000 + i),
+            network_passphrase=_NETWORK_PASSPHRASE,
+            base_fee=100,
+        ).set_timeout(300)
+        if soroban_every and i % soroban_every == 0:
+            builder.append_invoke_contract_function_op(
+                contract_id=_CONTRACT_ID,
+                function_name="transfer",
+                parameters=[
+                    scval.to_address(source.public_key),
+                    scval.to_address(destination.public_key),
+                    scval.to_int128(10_000_000 * (i + 1)),
+                ],
+            )
+        else:
+            builder.append_payment_op(
+                destination=destination.public_key,
+                asset=Asset.native(),
+                amount="10.5",
+            )
+        envelope = builder.build()
+        envelope.sign(source)
+        envelopes.append(envelope.to_xdr_object())
+    return envelopes
+
+
+def _account_entry(index: int, balance: int) -> stellar_xdr.LedgerEntry:
+    account = stellar_xdr.AccountEntry(
+        account_id=_keypair(index).xdr_account_id(),
+        balance=stellar_xdr.Int64(balance),
+        seq_num=stellar_xdr.SequenceNumber(stellar_xdr.Int64(1_000_000 + index)),
+        num_sub_entries=stellar_xdr.Uint32(0),
+        inflation_dest=None,
+        flags=stellar_xdr.Uint32(0),
+        home_domain=stellar_xdr.String32(b""),
+        thresholds=stellar_xdr.Thresholds(b"\x01\x00\x00\x00"),
+        signers=[],
+        ext=stellar_xdr.AccountEntryExt(v=0),
+    )
+    return stellar_xdr.LedgerEntry(
+        last_modified_ledger_seq=stellar_xdr.Uint32(100),
+        data=stellar_xdr.LedgerEntryData(
+            type=stellar_xdr.LedgerEntryType.ACCOUNT, account=account
+        ),
+        ext=stellar_xdr.LedgerEntryExt(v=0),
+    )
+
+
+def _balance_entry(index: int, amount: int) -> stellar_xdr.LedgerEntry:
+    holder = scval.to_address(_keypair(index).public_key)
+    contract_data = stellar_xdr.ContractDataEntry(
+        ext=stellar_xdr.ExtensionPoint(v=0),
+        contract=Address(_CONTRACT_ID).to_xdr_sc_address(),
+        key=scval.to_vec([scval.to_symbol("Balance"), holder]),
+        durability=stellar_xdr.ContractDataDurability.PERSISTENT,
+        val=scval.to_map(
+            {
+                scval.to_symbol("amount"): scval.to_int128(amount),
+                scval.to_symbol("authorized"): scval.to_bool(True),
+                scval.to_symbol("clawback"): scval.to_bool(False),
+            }
+        ),
+    )
+    return stellar_xdr.LedgerEntry(
+        last_modified_ledger_seq=stellar_xdr.Uint32(100),
+        data=stellar_xdr.LedgerEntryData(
+            type=stellar_xdr.LedgerEntryType.CONTRACT_DATA,
+            contract_data=contract_data,
+        ),
+        ext=stellar_xdr.LedgerEntryExt(v=0),
+    )
+
+
+def _state_and_update(
+    before: stellar_xdr.LedgerEntry, after: stellar_xdr.LedgerEntry
+) -> list[stellar_xdr.LedgerEntryChange]:
+    return [
+        stellar_xdr.LedgerEntryChange(
+            type=stellar_xdr.LedgerEntryChangeType.LEDGER_ENTRY_STATE, state=before
+        ),
+        stellar_xdr.LedgerEntryChange(
+            type=stellar_xdr.LedgerEntryChangeType.LEDGER_ENTRY_UPDATED, updated=after
+        ),
+    ]
+
+
+def _contract_code_entry(index: int, wasm_size: int) -> stellar_xdr.LedgerEntry:
+    code = hashlib.shake_256(f"wasm-{index}".encode()).digest(wasm_size)
+    contract_code = stellar_xdr.ContractCodeEntry(
+        ext=stellar_xdr.ContractCodeEntryExt(v=0),
+        hash=stellar_xdr.Hash(hashlib.sha256(code).digest()),
+        code=code,
+    )
+    return stellar_xdr.LedgerEntry(
+        last_modified_ledger_seq=stellar_xdr.Uint32(100),
+        data=stellar_xdr.LedgerEntryData(
+            type=stellar_xdr.LedgerEntryType.CONTRACT_CODE,
+            contract_code=contract_code,
+        ),
+        ext=stellar_xdr.LedgerEntryExt(v=0),
+    )
+
+
+def _transfer_event(index: int, amount: int) -> stellar_xdr.ContractEvent:
+    return stellar_xdr.ContractEvent(
+        ext=stellar_xdr.ExtensionPoint(v=0),
+        contract_id=stellar_xdr.ContractID(
+            stellar_xdr.Hash(StrKey.decode_contract(_CONTRACT_ID))
+        ),
+        type=stellar_xdr.ContractEventType.CONTRACT,
+        body=stellar_xdr.ContractEventBody(
+            v=0,
+            v0=stellar_xdr.ContractEventV0(
+                topics=[
+                    scval.to_symbol("transfer"),
+                    scval.to_address(_keypair(index).public_key),
+                    scval.to_address(_keypair(index + 1).public_key),
+                    scval.to_string("native"),
+                ],
+                data=scval.to_int128(amount),
+            ),
+        ),
+    )
+
+
+def _result_meta(
+    index: int, envelope: stellar_xdr.TransactionEnvelope, wasm_size: int
+) -> stellar_xdr.TransactionResultMetaV1:
+    assert envelope.v1 is not None
+    is_soroban = (
+        envelope.v1.tx.operations[0].body.type
+        == stellar_xdr.OperationType.INVOKE_HOST_FUNCTION
+    )
+    amount = 10_000_000 * (index + 1)
+    if is_soroban:
+        tr = stellar_xdr.OperationResultTr(
+            type=stellar_xdr.OperationType.INVOKE_HOST_FUNCTION,
+            invoke_host_function_result=stellar_xdr.InvokeHostFunctionResult(
+                code=stellar_xdr.InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS,
+                success=_hash("success", index),
+            ),
+        )
+        op_changes = _state_and_update(
+            _balance_entry(index, amount * 3), _balance_entry(index, amount * 2)
+        ) + _state_and_update(
+            _balance_entry(index + 1, amount), _balance_entry(index + 1, amount * 2)
+        )
+        if wasm_size:
+            op_changes.append(
+                stellar_xdr.LedgerEntryChange(
+                    type=stellar_xdr.LedgerEntryChangeType.LEDGER_ENTRY_CREATED,
+                    created=_contract_code_entry(index, wasm_size),
+                )
+            )
+        op_events = [_transfer_event(index, amount)]
+        soroban_meta = stellar_xdr.SorobanTransactionMetaV2(
+            ext=stellar_xdr.SorobanTransactionMetaExt(v=0),
+            return_value=scval.to_void(),
+        )
+    else:
+        tr = stellar_xdr.OperationResultTr(
+            type=stellar_xdr.OperationType.PAYMENT,
+            payment_result=stellar_xdr.PaymentResult(
+                code=stellar_xdr.PaymentResultCode.PAYMENT_SUCCESS
+            ),
+        )
+        op_changes = _state_and_update(
+            _account_entry(index, 1_000_000_000), _account_entry(index, 895_000_000)
+        ) + _state_and_update(
+            _account_entry(index + 1, 1_000_000_000),
+            _account_entry(index + 1, 1_105_000_000),
+        )
+        op_events = []
+        soroban_meta = None
+
+    result = stellar_xdr.TransactionResult(
+        fee_charged=stellar_xdr.Int64(100),
+        result=stellar_xdr.TransactionResultResult(
+            code=stellar_xdr.TransactionResultCode.txSUCCESS,
+            results=[
+                stellar_xdr.OperationResult(
+                    code=stellar_xdr.OperationResultCode.opINNER, tr=tr
+                )
+            ],
+        ),
+        ext=stellar_xdr.TransactionResultExt(v=0),
+    )
+    tx_hash = hashlib.sha256(envelope.to_xdr_bytes()).digest()
+    meta = stellar_xdr.TransactionMetaV4(
+        ext=stellar_xdr.ExtensionPoint(v=0),
+        tx_changes_before=stellar_xdr.LedgerEntryChanges(
+            _state_and_update(
+                _account_entry(index, 1_000_000_100),
+                _account_entry(index, 1_000_000_000),
+            )
+        ),
+        operations=[
+            stellar_xdr.OperationMetaV2(
+                ext=stellar_xdr.ExtensionPoint(v=0),
+                changes=stellar_xdr.LedgerEntryChanges(op_changes),
+                events=op_events,
+            )
+        ],
+        tx_changes_after=stellar_xdr.LedgerEntryChanges([]),
+        soroban_meta=soroban_meta,
+        events=[],
+        diagnostic_events=[],
+    )
+    return stellar_xdr.TransactionResultMetaV1(
+        ext=stellar_xdr.ExtensionPoint(v=0),
+        result=stellar_xdr.TransactionResultPair(
+            transaction_hash=stellar_xdr.Hash(tx_hash), result=result
+        ),
+        fee_processing=stellar_xdr.LedgerEntryChanges(
+            _state_and_update(
+                _account_entry(index, 1_000_000_200),
+                _account_entry(index, 1_000_000_100),
+            )
+        ),
+        tx_apply_processing=stellar_xdr.TransactionMeta(v=4, v4=meta),
+        post_tx_apply_fee_processing=stellar_xdr.LedgerEntryChanges([]),
+    )
+
+
+def build_ledger_close_meta(
+    num_transactions: int = 100, ledger_seq: int = 1_000_000, wasm_size: int = 0
+) -> stellar_xdr.LedgerCloseMeta:
+    """Build a ``LedgerCloseMeta`` (v2) with ``num_transactions`` applied transactions.
+
+    When ``wasm_size`` is set, every Soroban transaction also creates a
+    contract code entry holding ``wasm_size`` bytes of code.
+    """
+    envelopes = build_transaction_envelopes(num_transactions)
+    header = stellar_xdr.LedgerHeader(
+        ledger_version=stellar_xdr.Uint32(23),
+        previous_ledger_hash=_hash("ledger", ledger_seq - 1),
+        scp_value=stellar_xdr.StellarValue(
+            tx_set_hash=_hash("tx-set", ledger_seq),
+            close_time=stellar_xdr.TimePoint(stellar_xdr.Uint64(1_700_000_000)),
+            upgrades=[],
+            ext=stellar_xdr.StellarValueExt(
+                v=stellar_xdr.StellarValueType.STELLAR_VALUE_BASIC
+            ),
+        ),
+        tx_set_result_hash=_hash("tx-set-result", ledger_seq),
+        bucket_list_hash=_hash("bucket-list", ledger_seq),
+        ledger_seq=stellar_xdr.Uint32(ledger_seq),
+        total_coins=stellar_xdr.Int64(1_000_000_000_000_000_000),
+        fee_pool=stellar_xdr.Int64(12_345_678_900),
+        inflation_seq=stellar_xdr.Uint32(0),
+        id_pool=stellar_xdr.Uint64(123_456_789),
+        base_fee=stellar_xdr.Uint32(100),
+        base_reserve=stellar_xdr.Uint32(5_000_000),
+        max_tx_set_size=stellar_xdr.Uint32(1000),
+        skip_list=[_hash("skip", ledger_seq, i) for i in range(4)],
+        ext=stellar_xdr.LedgerHeaderExt(v=0),
+    )
+    tx_set = stellar_xdr.GeneralizedTransactionSet(
+        v=1,
+        v1_tx_set=stellar_xdr.TransactionSetV1(
+            previous_ledger_hash=_hash("ledger", ledger_seq - 1),
+            phases=[
+                stellar_xdr.TransactionPhase(
+                    v=0,
+                    v0_components=[
+                        stellar_xdr.TxSetComponent(
+                            type=stellar_xdr.TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE,
+                            txs_maybe_discounted_fee=stellar_xdr.TxSetComponentTxsMaybeDiscountedFee(
+                                base_fee=stellar_xdr.Int64(100), txs=envelopes
+                            ),
+                        )
+                    ],
+                )
+            ],
+        ),
+    )
+    meta = stellar_xdr.LedgerCloseMetaV2(
+        ext=stellar_xdr.LedgerCloseMetaExt(v=0),
+        ledger_header=stellar_xdr.LedgerHeaderHistoryEntry(
+            hash=_hash("ledger", ledger_seq),
+            header=header,
+            ext=stellar_xdr.LedgerHeaderHistoryEntryExt(v=0),
+        ),
+        tx_set=tx_set,
+        tx_processing=[
+            _result_meta(i, env, wasm_size) for i, env in enumerate(envelopes)
+        ],
+        upgrades_processing=[],
+        scp_info=[],
+        total_byte_size_of_live_soroban_state=stellar_xdr.Uint64(10_000_000),
+        evicted_keys=[],
+    )
+    return stellar_xdr.LedgerCloseMeta(v=2, v2=meta)
+
+
+def build_ledger_close_meta_batch(
+    num_ledgers: int = 4, num_transactions: int = 100, start_sequence: int = 1_000_000
+) -> stellar_xdr.LedgerCloseMetaBatch:
+    """Build a ``LedgerCloseMetaBatch`` of consecutive synthetic ledgers."""
+    return stellar_xdr.LedgerCloseMetaBatch(
+        start_sequence=stellar_xdr.Uint32(start_sequence),
+        end_sequence=stellar_xdr.Uint32(start_sequence + num_ledgers - 1),
+        ledger_close_metas=[
+            build_ledger_close_meta(num_transactions, start_sequence + i)
+            for i in range(num_ledgers)
+        ],
+    )
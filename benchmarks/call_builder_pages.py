@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Time walking the pages of a call builder by hand and with ``iter_records``.
+
+Serves ``--pages`` pages of ``--records`` records from a local HTTP server
+which waits ``--latency`` milliseconds before each response, as a remote
+Horizon server does, and walks them with ``call()`` and ``next()``, and with
+``iter_records`` per prefetch depth. Each record is processed for
+``--work`` milliseconds.
+
+Usage:
+    python benchmarks/call_builder_pages.py
+    python benchmarks/call_builder_pages.py --latency 100 --work 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from stellar_sdk import Server
+
+
+def _serve(pages: int, records: int, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query.get("cursor", ["0"])[0])
+            time.sleep(latency)
+            body = {
+                "_links": {
+                    "next": {
+                        "href": f"http://127.0.0.1:{self.server.server_address[1]}"
+                        f"/payments?cursor={page + 1}&limit={records}&order=asc"
+                    }
+                },
+                "_embedded": {
+                    "records": (
+                        [
+                            {"id": f"{page}-{i}", "paging_token": str(page + 1)}
+                            for i in range(records)
+                        ]
+                        if page < pages
+                        else []
+                    )
+                },
+            }
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--records", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=50, help="milliseconds")
+    parser.add_argument("--work", type=float, default=0.25, help="milliseconds")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    http_server = _serve(args.pages, args.records, args.latency / 1000)
+    horizon_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    work = args.work / 1000
+
+    def _process(record: dict) -> None:
+        end = time.perf_counter() + work
+        while time.perf_counter() < end:
+            pass
+
+    def _by_hand() -> None:
+        with Server(horizon_url) as server:
+            call_builder = server.payments().limit(args.records).order(desc=False)
+            resp = call_builder.call()
+            while records := resp["_embedded"]["records"]:
+                for record in records:
+                    _process(record)
+                resp = call_builder.next()
+
+    def _iter_records(prefetch: int) -> Callable[[], None]:
+        def _run() -> None:
+            with Server(horizon_url) as server:
+                call_builder = server.payments().limit(args.records).order(desc=False)
+                for record in call_builder.iter_records(prefetch):
+                    _process(record)
+
+        return _run
+
+    print(
+        f"{args.pages} pages of {args.records} records, "
+        f"{args.latency} ms latency, {args.work} ms per record"
+    )
+    for label, func in [
+        ("call + next", _by_hand),
+        ("iter_records prefetch=0", _iter_records(0)),
+        ("iter_records prefetch=1", _iter_records(1)),
+        ("iter_records prefetch=2", _iter_records(2)),
+    ]:
+        print(f"{label:<32}{_measure(func, args.rounds) * 1000:>10.3f} ms")
+    http_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Time reading the operations of a ledger range with ``HistoryScanner``.
+
+Serves ``--ledgers`` ledgers of ``--operations`` operations each from a local
+HTTP server which waits ``--latency`` milliseconds before each response, as a
+remote Horizon server does, and reads them with one cursor (``iter_records``)
+and with ``HistoryScanner`` per number of shards, in order and unordered.
+
+Usage:
+    python benchmarks/history_scan.py
+    python benchmarks/history_scan.py --ledgers 1000 --latency 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from stellar_sdk import HistoryScanner, RequestsClient, Server
+from stellar_sdk.sep.toid import TOID
+
+_FIRST_LEDGER = 1000
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # Accepts the connections of all the worker threads at once.
+    request_queue_size = 128
+
+
+def _serve(ledgers: int, operations: int, latency: float) -> ThreadingHTTPServer:
+    operation_ids = [
+        TOID(ledger, 1, operation).to_int64()
+        for ledger in range(_FIRST_LEDGER, _FIRST_LEDGER + ledgers)
+        for operation in range(1, operations + 1)
+    ]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            query = parse_qs(urlparse(self.path).query)
+            cursor = int(query.get("cursor", ["0"])[0])
+            limit = int(query["limit"][0])
+            time.sleep(latency)
+            page = [i for i in operation_ids if i > cursor][:limit]
+            next_cursor = page[-1] if page else cursor
+            body = {
+                "_links": {
+                    "next": {
+                        "href": f"http://127.0.0.1:{self.server.server_address[1]}"
+                        f"/operations?cursor={next_cursor}&limit={limit}&order=asc"
+                    }
+                },
+                "_embedded": {
+                    "records": [{"id": str(i), "paging_token": str(i)} for i in page]
+                },
+            }
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = _HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ledgers", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=50, help="milliseconds")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    http_server = _serve(args.ledgers, args.operations, args.latency / 1000)
+    horizon_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    end_ledger = _FIRST_LEDGER + args.ledgers - 1
+    total = args.ledgers * args.operations
+
+    def _one_cursor() -> None:
+        with Server(horizon_url) as server:
+            call_builder = server.operations().limit(args.limit).order(desc=False)
+            count = sum(1 for _ in call_builder.iter_records())
+        assert count == total
+
+    def _scan(shards: int, ordered: bool) -> Callable[[], None]:
+        def _run() -> None:
+            scanner = HistoryScanner(
+                _FIRST_LEDGER, end_ledger, shards=shards, limit=args.limit
+            )
+            # Keeps a connection open for each worker thread.
+            client = RequestsClient(pool_size=shards)
+            with Server(horizon_url, client) as server:
+                count = sum(1 for _ in scanner.scan(server.operations(), ordered))
+            assert count == total
+
+        return _run
+
+    print(
+        f"{args.ledgers} ledgers of {args.operations} operations, "
+        f"{args.limit} records per page, {args.latency} ms latency"
+    )
+    benchmarks: list[tuple[str, Callable[[], None]]] = [("one cursor", _one_cursor)]
+    for shards in (1, 4, 16):
+        benchmarks.append((f"HistoryScanner shards={shards}", _scan(shards, True)))
+    benchmarks.append(("  unordered, shards=16", _scan(16, False)))
+    for label, func in benchmarks:
+        print(f"{label:<32}{_measure(func, args.rounds) * 1000:>10.3f} ms")
+    http_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
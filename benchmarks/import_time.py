@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Measure how long it takes to import the SDK.
+
+Each measurement runs in a fresh interpreter with ``-X importtime`` and
+reports the cumulative import time of the requested module, the number of
+``stellar_sdk`` modules that ended up loaded and the wall time of the whole
+process. The median over several runs is printed.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module stellar_sdk.xdr --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+_SCRIPT = (
+    "import sys; import {module}; "
+    "print(sum(1 for m in sys.modules if m.split('.')[0] == 'stellar_sdk'))"
+)
+
+
+def _measure(module: str) -> tuple[int, int, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    cumulative = 0
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            cumulative = int(fields[1])
+    return cumulative, int(proc.stdout), wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="stellar_sdk")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    _measure(args.module)  # warm up the bytecode cache
+    results = [_measure(args.module) for _ in range(args.runs)]
+    cumulative = statistics.median(r[0] for r in results)
+    wall = statistics.median(r[2] for r in results)
+    print(f"module: {args.module}, {args.runs} runs")
+    print(f"cumulative import time: {cumulative / 1000:.1f} ms")
+    print(f"stellar_sdk modules loaded: {results[-1][1]}")
+    print(f"interpreter wall time: {wall * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Time loading accounts from many threads against a rate-limited server
+with and without a ``RateLimiter``.
+
+Serves accounts from a local HTTP server which, as Horizon does, allows
+``--limit`` requests in each window of ``--window`` seconds, reports the
+rate limit in the ``X-RateLimit-*`` headers of its responses, and answers
+``429 Too Many Requests`` with a ``Retry-After`` header once none remain.
+``--threads`` threads each load ``--requests`` accounts through a
+``RequestsClient``, which retries the ``429`` responses after their
+``Retry-After``, with and without a ``RateLimiter``. Prints the time, the
+number of ``429`` responses and the number of failed loads.
+
+Usage:
+    python benchmarks/rate_limiter.py
+    python benchmarks/rate_limiter.py --threads 16 --limit 100 --window 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from stellar_sdk import Keypair, RequestsClient, Server
+from stellar_sdk.client.rate_limiter import RateLimiter
+from stellar_sdk.exceptions import BaseHorizonError
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # Accepts the connections of all the threads at once.
+    request_queue_size = 1024
+    throttled = 0
+
+
+def _serve(limit: int, window: float) -> _HTTPServer:
+    lock = threading.Lock()
+    state = {"window_end": 0.0, "remaining": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            with lock:
+                now = time.monotonic()
+                if now >= state["window_end"]:
+                    state["window_end"] = now + window
+                    state["remaining"] = limit
+                allowed = state["remaining"] > 0
+                if allowed:
+                    state["remaining"] -= 1
+                else:
+                    self.server.throttled += 1  # type: ignore[attr-defined]
+                remaining = state["remaining"]
+                reset = math.ceil(state["window_end"] - now)
+            if allowed:
+                account_id = self.path.rsplit("/", 1)[1]
+                data = json.dumps(
+                    {"account_id": account_id, "sequence": "1", "signers": []}
+                ).encode()
+                self.send_response(200)
+            else:
+                data = json.dumps({"status": 429, "title": "Rate Limit Exceeded"})
+                data = data.encode()
+                self.send_response(429)
+                self.send_header("Retry-After", str(reset))
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("X-RateLimit-Limit", str(limit))
+            self.send_header("X-RateLimit-Remaining", str(remaining))
+            self.send_header("X-RateLimit-Reset", str(reset))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = _HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _run(
+    horizon_url: str,
+    account_ids: list[str],
+    requests: int,
+    rate_limiter: RateLimiter | None,
+) -> int:
+    failed = 0
+    client = RequestsClient(pool_size=len(account_ids), rate_limiter=rate_limiter)
+    with Server(horizon_url, client) as server:
+
+        def load(account_id: str) -> None:
+            nonlocal failed
+            try:
+                server.load_account(account_id)
+            except BaseHorizonError:
+                failed += 1
+
+        with ThreadPoolExecutor(len(account_ids)) as executor:
+            for _ in executor.map(load, account_ids * requests):
+                pass
+    return failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=50, help="per thread")
+    parser.add_argument("--limit", type=int, default=100, help="per window")
+    parser.add_argument("--window", type=float, default=1, help="seconds")
+    args = parser.parse_args()
+
+    account_ids = [Keypair.random().public_key for _ in range(args.threads)]
+    print(
+        f"{args.threads} threads loading {args.requests} accounts each, "
+        f"{args.limit} requests per {args.window} s"
+    )
+    for label, rate_limiter in [
+        ("RequestsClient", None),
+        ("  rate_limiter=RateLimiter()", RateLimiter()),
+    ]:
+        # A fresh server starts with a fresh window.
+        http_server = _serve(args.limit, args.window)
+        horizon_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+        start = time.perf_counter()
+        failed = _run(horizon_url, account_ids, args.requests, rate_limiter)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<32}{elapsed * 1000:>10.3f} ms"
+            f"{http_server.throttled:>8} throttled{failed:>6} failed"
+        )
+        http_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
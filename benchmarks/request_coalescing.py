@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Time loading the same accounts from many coroutines with and without
+request coalescing.
+
+Serves accounts from a local HTTP server which waits ``--latency``
+milliseconds before each response, as a remote Horizon server does, and runs
+``--rounds`` rounds in which ``--concurrency`` coroutines each load one of
+``--accounts`` accounts with ``ServerAsync.load_account``, through an
+``AiohttpClient`` with and without ``coalesce=True``. Prints the time and the
+number of requests the server received.
+
+Usage:
+    python benchmarks/request_coalescing.py
+    python benchmarks/request_coalescing.py --concurrency 200 --accounts 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from stellar_sdk import AiohttpClient, Keypair, ServerAsync
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # Accepts the connections of all the coroutines at once.
+    request_queue_size = 1024
+    requests = 0
+
+
+def _serve(latency: float) -> _HTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.server.requests += 1  # type: ignore[attr-defined]
+            time.sleep(latency)
+            account_id = self.path.rsplit("/", 1)[1]
+            data = json.dumps(
+                {"account_id": account_id, "sequence": "1", "signers": []}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = _HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(
+    horizon_url: str, account_ids: list[str], args: argparse.Namespace, coalesce: bool
+) -> None:
+    client = AiohttpClient(pool_size=args.concurrency, coalesce=coalesce)
+    async with ServerAsync(horizon_url, client) as server:
+        for _ in range(args.rounds):
+            await asyncio.gather(
+                *(
+                    server.load_account(account_ids[i % len(account_ids)])
+                    for i in range(args.concurrency)
+                )
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=50, help="milliseconds")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    http_server = _serve(args.latency / 1000)
+    horizon_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    account_ids = [Keypair.random().public_key for _ in range(args.accounts)]
+
+    print(
+        f"{args.rounds} rounds of {args.concurrency} coroutines loading "
+        f"{args.accounts} accounts, {args.latency} ms latency"
+    )
+    for label, coalesce in [("AiohttpClient", False), ("  coalesce=True", True)]:
+        http_server.requests = 0
+        start = time.perf_counter()
+        asyncio.run(_run(horizon_url, account_ids, args, coalesce))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<32}{elapsed * 1000:>10.3f} ms{http_server.requests:>8} requests"
+        )
+    http_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
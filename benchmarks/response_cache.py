@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Time looking up the same transactions repeatedly with and without a
+``CachingClient``.
+
+Serves transactions from a local HTTP server which waits ``--latency``
+milliseconds before each response, as a remote Horizon server does, and
+looks up ``--lookups`` transactions among ``--transactions`` distinct ones
+with a ``RequestsClient``, and with a ``CachingClient`` over a
+``MemoryResponseCache`` and over a ``SQLiteResponseCache``.
+
+Usage:
+    python benchmarks/response_cache.py
+    python benchmarks/response_cache.py --transactions 500 --lookups 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from stellar_sdk import RequestsClient, Server
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.client.caching_client import CachingClient
+from stellar_sdk.client.response_cache import MemoryResponseCache, SQLiteResponseCache
+
+
+def _serve(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            transaction_hash = self.path.rsplit("/", 1)[1]
+            data = json.dumps(
+                {"hash": transaction_hash, "envelope_xdr": "A" * 1000}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=100)
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=20, help="milliseconds")
+    args = parser.parse_args()
+
+    http_server = _serve(args.latency / 1000)
+    horizon_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    hashes = [
+        hashlib.sha256(str(i).encode()).hexdigest() for i in range(args.transactions)
+    ]
+    lookups = random.Random(0).choices(hashes, k=args.lookups)
+
+    def _run(client_factory: Callable[[], BaseSyncClient]) -> float:
+        start = time.perf_counter()
+        with Server(horizon_url, client_factory()) as server:
+            for transaction_hash in lookups:
+                server.transactions().transaction(transaction_hash).call()
+        return time.perf_counter() - start
+
+    print(
+        f"{args.lookups} lookups of {args.transactions} transactions, "
+        f"{args.latency} ms latency"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "horizon.sqlite3"
+        for label, client_factory in [
+            ("RequestsClient", RequestsClient),
+            (
+                "CachingClient memory",
+                lambda: CachingClient(RequestsClient(), MemoryResponseCache()),
+            ),
+            (
+                "CachingClient SQLite",
+                lambda: CachingClient(RequestsClient(), SQLiteResponseCache(path)),
+            ),
+            (
+                "  warm SQLite file",
+                lambda: CachingClient(RequestsClient(), SQLiteResponseCache(path)),
+            ),
+        ]:
+            print(f"{label:<32}{_run(client_factory) * 1000:>10.3f} ms")
+    http_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Time parsing transaction envelopes eagerly and lazily.
+
+Builds ``--envelopes`` signed envelopes of ``--operations`` operations each,
+of several operation types, and times ``TransactionEnvelope.from_xdr`` with
+and without ``lazy=True``, on its own, followed by ``hash()`` (as an indexer
+does), and followed by reading one operation, which creates all of them. Also
+times creating the operations of one transaction with
+``Operation.from_xdr_object``, which dispatches on the operation type, against
+scanning the ``Operation`` subclasses for the type.
+
+Usage:
+    python benchmarks/transaction_parse.py
+    python benchmarks/transaction_parse.py --envelopes 500 --operations 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from stellar_sdk import (
+    Account,
+    Asset,
+    Keypair,
+    Network,
+    TransactionBuilder,
+    TransactionEnvelope,
+)
+from stellar_sdk import xdr as stellar_xdr
+from stellar_sdk.operation import Operation
+
+_NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
+
+
+def _build(operations: int) -> str:
+    source = Keypair.random()
+    asset = Asset("USD", Keypair.random().public_key)
+    builder = TransactionBuilder(
+        Account(source.public_key, 1), _NETWORK_PASSPHRASE, 100
+    ).set_timeout(30)
+    for i in range(operations):
+        destination = Keypair.random().public_key
+        kind = i % 4
+        if kind == 0:
+            builder.append_payment_op(destination, asset, "10.5")
+        elif kind == 1:
+            builder.append_create_account_op(destination, "2")
+        elif kind == 2:
+            builder.append_change_trust_op(asset, source=destination)
+        else:
+            builder.append_manage_data_op(f"key-{i}", b"value")
+    envelope = builder.build()
+    envelope.sign(source)
+    return envelope.to_xdr()
+
+
+def _scan(xdr_object: stellar_xdr.Operation) -> Operation:
+    for sub_cls in Operation.__subclasses__():
+        if xdr_object.body.type == sub_cls._XDR_OPERATION_TYPE:
+            return sub_cls.from_xdr_object(xdr_object)
+    raise NotImplementedError
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--envelopes", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    xdrs = [_build(args.operations) for _ in range(args.envelopes)]
+    operations = (
+        TransactionEnvelope.from_xdr(xdrs[0], _NETWORK_PASSPHRASE)
+        .transaction.to_xdr_object()
+        .operations
+    )
+
+    def _parse(lazy: bool, then: Callable[[TransactionEnvelope], object]):
+        def _run() -> None:
+            for xdr in xdrs:
+                then(TransactionEnvelope.from_xdr(xdr, _NETWORK_PASSPHRASE, lazy=lazy))
+
+        return _run
+
+    def _nothing(te: TransactionEnvelope) -> None:
+        pass
+
+    def _first_operation(te: TransactionEnvelope) -> None:
+        te.transaction.operations[0]
+
+    def _hash(te: TransactionEnvelope) -> None:
+        te.hash()
+
+    print(f"{args.envelopes} envelopes, {args.operations} operations each")
+    for label, func in [
+        ("from_xdr", _parse(False, _nothing)),
+        ("from_xdr lazy", _parse(True, _nothing)),
+        ("from_xdr + hash", _parse(False, _hash)),
+        ("from_xdr lazy + hash", _parse(True, _hash)),
+        ("from_xdr lazy + operations[0]", _parse(True, _first_operation)),
+        (
+            "Operation.from_xdr_object",
+            lambda: list(map(Operation.from_xdr_object, operations)),
+        ),
+        ("  scanning subclasses", lambda: list(map(_scan, operations))),
+    ]:
+        print(f"{label:<32}{_measure(func, args.rounds) * 1000:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
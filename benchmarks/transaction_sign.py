@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Time signing a transaction envelope with many signers and serializing it.
+
+Builds a ``TransactionEnvelope`` with ``--operations`` payments, signs it
+with ``--signers`` keypairs, one ``sign()`` call at a time and with
+``sign_many``, and converts it to base64 XDR, which is what a multisig
+service does for every transaction. Also times ``hash()`` and ``to_xdr()``
+on their own, and signing ``--envelopes`` envelopes with ``sign_envelopes``
+in this thread and on a thread pool.
+
+Usage:
+    python benchmarks/transaction_sign.py
+    python benchmarks/transaction_sign.py --operations 100 --signers 20
+    python benchmarks/transaction_sign.py --envelopes 2000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+
+from stellar_sdk import (
+    Account,
+    Asset,
+    Keypair,
+    Network,
+    TransactionBuilder,
+    TransactionEnvelope,
+    sign_envelopes,
+)
+
+
+def _build(operations: int) -> TransactionEnvelope:
+    source = Account(Keypair.random().public_key, 1)
+    builder = TransactionBuilder(source, Network.TESTNET_NETWORK_PASSPHRASE, 100)
+    for _ in range(operations):
+        builder.append_payment_op(Keypair.random().public_key, Asset.native(), "1")
+    return builder.set_timeout(30).build()
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=50)
+    parser.add_argument("--signers", type=int, default=20)
+    parser.add_argument("--envelopes", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    signers = [Keypair.random() for _ in range(args.signers)]
+    te = _build(args.operations)
+
+    def _sign_and_serialize() -> None:
+        te.signatures = []
+        for signer in signers:
+            te.sign(signer)
+        te.to_xdr()
+
+    def _sign_many_and_serialize() -> None:
+        te.signatures = []
+        te.sign_many(signers)
+        te.to_xdr()
+
+    envelopes = [_build(1) for _ in range(args.envelopes)]
+
+    def _sign_envelopes(workers: int | None) -> Callable[[], None]:
+        def _sign() -> None:
+            for envelope in envelopes:
+                envelope.signatures = []
+            sign_envelopes(envelopes, signers, workers=workers)
+
+        return _sign
+
+    def _sign_each() -> None:
+        for envelope in envelopes:
+            envelope.signatures = []
+            for signer in signers:
+                envelope.sign(signer)
+
+    print(f"{args.operations} operations, {args.signers} signers")
+    for label, func in [
+        (f"sign x{args.signers} + to_xdr", _sign_and_serialize),
+        ("sign_many + to_xdr", _sign_many_and_serialize),
+        ("hash", te.hash),
+        ("to_xdr", te.to_xdr),
+        (f"sign x{args.signers} x{args.envelopes}", _sign_each),
+        (f"sign_envelopes x{args.envelopes}", _sign_envelopes(None)),
+        (f"  with {args.workers} threads", _sign_envelopes(args.workers)),
+    ]:
+        print(f"{label:<28}{_measure(func, args.rounds) * 1000:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Compare building signed payment transactions with a TransactionBuilder
+and with a TransactionTemplate.
+
+Builds, signs and serializes ``--payments`` payment transactions from one
+source account that differ in destination, amount, memo and sequence
+number, as a payout service does, once with a ``TransactionBuilder`` per
+transaction and once with ``TransactionTemplate.sign``, and reports the
+number of signed envelopes per second.
+
+Usage:
+    python benchmarks/transaction_template.py
+    python benchmarks/transaction_template.py --payments 10000 --rounds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from stellar_sdk import (
+    Account,
+    Asset,
+    IdMemo,
+    Keypair,
+    Network,
+    TransactionBuilder,
+    TransactionTemplate,
+)
+
+_ASSET = Asset("USD", "GCDNJUBQSX7AJWLJACMJ7I4BC3Z47BQUTMHEICZLE6MU4KQBRYG5JY6B")
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payments", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    signer = Keypair.random()
+    payouts = [
+        (Keypair.random().public_key, f"{i + 1}.25", IdMemo(i))
+        for i in range(args.payments)
+    ]
+
+    def _builder() -> None:
+        account = Account(signer.public_key, 1)
+        for destination, amount, memo in payouts:
+            te = (
+                TransactionBuilder(account, Network.PUBLIC_NETWORK_PASSPHRASE, 100)
+                .add_time_bounds(0, 1700000000)
+                .add_memo(memo)
+                .append_payment_op(destination, _ASSET, amount)
+                .build()
+            )
+            te.sign(signer)
+            te.to_xdr()
+
+    def _template() -> None:
+        builder = (
+            TransactionBuilder(
+                Account(signer.public_key, 1), Network.PUBLIC_NETWORK_PASSPHRASE, 100
+            )
+            .add_time_bounds(0, 1700000000)
+            .append_payment_op(signer.public_key, _ASSET, "1")
+        )
+        template = TransactionTemplate.from_builder(builder, [signer])
+        for destination, amount, memo in payouts:
+            template.sign(destination, amount, memo)
+
+    print(f"{args.payments} payments")
+    print(f"{'':<24}{'time':>12}{'envelopes/s':>14}")
+    baseline = None
+    for label, func in [
+        ("TransactionBuilder", _builder),
+        ("TransactionTemplate", _template),
+    ]:
+        elapsed = _measure(func, args.rounds)
+        baseline = baseline or elapsed
+        print(
+            f"{label:<24}{elapsed * 1000:>9.1f} ms{args.payments / elapsed:>14,.0f}"
+            f"{baseline / elapsed:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
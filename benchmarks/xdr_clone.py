@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Compare ways of copying XDR objects.
+
+Copies transaction envelopes and a synthetic ``LedgerCloseMeta`` (see
+``_fixtures.py``) with the generated ``clone()``, with ``clone(deep=False)``,
+with ``copy.deepcopy`` as it behaved before the generated classes defined
+``__deepcopy__``, and with a ``to_xdr_bytes``/``from_xdr_bytes`` round-trip.
+
+Usage:
+    python benchmarks/xdr_clone.py
+    python benchmarks/xdr_clone.py --transactions 500 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import time
+from collections.abc import Callable, Iterator
+
+from _fixtures import build_ledger_close_meta, build_transaction_envelopes
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+@contextlib.contextmanager
+def _generic_deepcopy() -> Iterator[None]:
+    # Make copy.deepcopy fall back to its generic __reduce_ex__ path.
+    classes = [
+        cls
+        for cls in vars(stellar_xdr).values()
+        if isinstance(cls, type)
+        and "__deepcopy__" in cls.__dict__
+        and cls.__module__.startswith("stellar_sdk.xdr.")
+    ]
+    methods = [cls.__dict__["__deepcopy__"] for cls in classes]
+    for cls in classes:
+        del cls.__deepcopy__
+    try:
+        yield
+    finally:
+        for cls, method in zip(classes, methods, strict=True):
+            cls.__deepcopy__ = method
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def _report(label: str, values: list, rounds: int) -> None:
+    cls = type(values[0])
+    print(label)
+    print(f"  {'mode':<24}{'time':>12}{'speedup':>10}")
+    with _generic_deepcopy():
+        baseline = _measure(lambda: [copy.deepcopy(v) for v in values], rounds)
+    for mode, func in [
+        ("deepcopy (generic)", None),
+        (
+            "xdr round-trip",
+            lambda: [cls.from_xdr_bytes(v.to_xdr_bytes()) for v in values],
+        ),
+        ("clone()", lambda: [v.clone() for v in values]),
+        ("clone(deep=False)", lambda: [v.clone(deep=False) for v in values]),
+    ]:
+        elapsed = baseline if func is None else _measure(func, rounds)
+        print(f"  {mode:<24}{elapsed * 1000:>9.3f} ms{baseline / elapsed:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    _report(
+        f"{args.transactions} envelopes",
+        build_transaction_envelopes(args.transactions),
+        args.rounds,
+    )
+    _report(
+        "LedgerCloseMeta", [build_ledger_close_meta(args.transactions)], args.rounds
+    )
+
+
+if __name__ == "__main__":
+    main()
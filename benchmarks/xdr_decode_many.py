@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare decoding many base64 XDR values serially and with ``decode_many``.
+
+Decodes the ``TransactionMeta`` of every transaction of synthetic ledgers
+(see ``_fixtures.py``), as found in the ``result_meta_xdr`` of transaction
+records, with ``TransactionMeta.from_xdr`` in a loop and with
+``decode_many`` for an increasing number of worker processes, up to the
+number of CPUs. Each is run returning the decoded values, and with a
+``transform`` that only returns the number of contract events, which shows
+how the decoding itself scales once the results sent back are small.
+
+Usage:
+    python benchmarks/xdr_decode_many.py
+    python benchmarks/xdr_decode_many.py --ledgers 50 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _event_count(meta: stellar_xdr.TransactionMeta) -> int:
+    assert meta.v4 is not None
+    return sum(len(operation.events) for operation in meta.v4.operations)
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, elapsed: float, baseline: float) -> None:
+    print(f"{label:<36}{elapsed * 1000:>10.1f} ms{baseline / elapsed:>9.2f}x")
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ledgers", type=int, default=20)
+    parser.add_argument("--transactions", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))),
+    )
+    args = parser.parse_args()
+
+    meta = build_ledger_close_meta(args.transactions)
+    assert meta.v2 is not None
+    ledger = [r.tx_apply_processing.to_xdr() for r in meta.v2.tx_processing]
+    items = ledger * args.ledgers
+    size = sum(len(item) for item in items)
+    print(f"{len(items):,} TransactionMeta values, {size:,} base64 bytes, {cpus} CPUs")
+    print(f"{'decode':<36}{'time':>13}{'speedup':>10}")
+
+    for label, transform in [("", None), (", transform", _event_count)]:
+        if transform is None:
+            serial = _measure(
+                lambda: [stellar_xdr.TransactionMeta.from_xdr(i) for i in items],
+                args.rounds,
+            )
+        else:
+            serial = _measure(
+                lambda: [
+                    _event_count(stellar_xdr.TransactionMeta.from_xdr(i)) for i in items
+                ],
+                args.rounds,
+            )
+        _report(f"from_xdr loop{label}", serial, serial)
+        for workers in args.workers:
+            # Start the pool outside of the measurement, as a long-running
+            # process would.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                executor.submit(abs, 0).result()
+                decode = functools.partial(
+                    stellar_xdr.decode_many,
+                    stellar_xdr.TransactionMeta,
+                    items,
+                    workers=workers,
+                    transform=transform,
+                    executor=executor,
+                )
+                elapsed = _measure(decode, args.rounds)
+            _report(f"decode_many, {workers} workers{label}", elapsed, serial)
+
+
+if __name__ == "__main__":
+    main()
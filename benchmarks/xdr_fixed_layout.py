@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Compare member-by-member and fixed-layout codecs of fixed-size XDR types.
+
+Structs and typedefs whose encoding has a fixed size are packed and unpacked
+with a single precompiled ``struct.Struct`` call (``FixedLayout``). For each
+of a few such types this script times the generated ``pack``/``unpack``
+against a reference codec that makes one ``Packer``/``Unpacker`` call per
+member, as the generated code did before fixed layouts.
+
+Usage:
+    python benchmarks/xdr_fixed_layout.py
+    python benchmarks/xdr_fixed_layout.py --number 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+from xdrlib3 import Packer, Unpacker
+
+from stellar_sdk import xdr as stellar_xdr
+from stellar_sdk.xdr.base import Hyper, Integer, UnsignedHyper, UnsignedInteger
+
+# Reference codecs: one call per member, mirroring the previously generated code.
+
+
+def _pack_int32(value: stellar_xdr.Int32, packer: Packer) -> None:
+    Integer(value.int32).pack(packer)
+
+
+def _pack_int64(value: stellar_xdr.Int64, packer: Packer) -> None:
+    Hyper(value.int64).pack(packer)
+
+
+def _pack_uint32(value: stellar_xdr.Uint32, packer: Packer) -> None:
+    UnsignedInteger(value.uint32).pack(packer)
+
+
+def _pack_uint64(value: stellar_xdr.Uint64, packer: Packer) -> None:
+    UnsignedHyper(value.uint64).pack(packer)
+
+
+def _unpack_int32(unpacker: Unpacker) -> stellar_xdr.Int32:
+    return stellar_xdr.Int32(Integer.unpack(unpacker))
+
+
+def _unpack_int64(unpacker: Unpacker) -> stellar_xdr.Int64:
+    return stellar_xdr.Int64(Hyper.unpack(unpacker))
+
+
+def _unpack_uint32(unpacker: Unpacker) -> stellar_xdr.Uint32:
+    return stellar_xdr.Uint32(UnsignedInteger.unpack(unpacker))
+
+
+def _unpack_uint64(unpacker: Unpacker) -> stellar_xdr.Uint64:
+    return stellar_xdr.Uint64(UnsignedHyper.unpack(unpacker))
+
+
+def _pack_price(value: stellar_xdr.Price, packer: Packer) -> None:
+    _pack_int32(value.n, packer)
+    _pack_int32(value.d, packer)
+
+
+def _unpack_price(unpacker: Unpacker) -> stellar_xdr.Price:
+    return stellar_xdr.Price(n=_unpack_int32(unpacker), d=_unpack_int32(unpacker))
+
+
+def _pack_int128_parts(value: stellar_xdr.Int128Parts, packer: Packer) -> None:
+    _pack_int64(value.hi, packer)
+    _pack_uint64(value.lo, packer)
+
+
+def _unpack_int128_parts(unpacker: Unpacker) -> stellar_xdr.Int128Parts:
+    return stellar_xdr.Int128Parts(
+        hi=_unpack_int64(unpacker), lo=_unpack_uint64(unpacker)
+    )
+
+
+def _pack_uint256_parts(value: stellar_xdr.UInt256Parts, packer: Packer) -> None:
+    for part in (value.hi_hi, value.hi_lo, value.lo_hi, value.lo_lo):
+        _pack_uint64(part, packer)
+
+
+def _unpack_uint256_parts(unpacker: Unpacker) -> stellar_xdr.UInt256Parts:
+    return stellar_xdr.UInt256Parts(
+        hi_hi=_unpack_uint64(unpacker),
+        hi_lo=_unpack_uint64(unpacker),
+        lo_hi=_unpack_uint64(unpacker),
+        lo_lo=_unpack_uint64(unpacker),
+    )
+
+
+def _pack_time_bounds(value: stellar_xdr.TimeBounds, packer: Packer) -> None:
+    _pack_uint64(value.min_time.time_point, packer)
+    _pack_uint64(value.max_time.time_point, packer)
+
+
+def _unpack_time_bounds(unpacker: Unpacker) -> stellar_xdr.TimeBounds:
+    return stellar_xdr.TimeBounds(
+        min_time=stellar_xdr.TimePoint(_unpack_uint64(unpacker)),
+        max_time=stellar_xdr.TimePoint(_unpack_uint64(unpacker)),
+    )
+
+
+def _pack_ledger_bounds(value: stellar_xdr.LedgerBounds, packer: Packer) -> None:
+    _pack_uint32(value.min_ledger, packer)
+    _pack_uint32(value.max_ledger, packer)
+
+
+def _unpack_ledger_bounds(unpacker: Unpacker) -> stellar_xdr.LedgerBounds:
+    return stellar_xdr.LedgerBounds(
+        min_ledger=_unpack_uint32(unpacker), max_ledger=_unpack_uint32(unpacker)
+    )
+
+
+def _pack_sc_nonce_key(value: stellar_xdr.SCNonceKey, packer: Packer) -> None:
+    _pack_int64(value.nonce, packer)
+
+
+def _unpack_sc_nonce_key(unpacker: Unpacker) -> stellar_xdr.SCNonceKey:
+    return stellar_xdr.SCNonceKey(nonce=_unpack_int64(unpacker))
+
+
+def _cases() -> list[tuple[object, Callable, Callable]]:
+    return [
+        (
+            stellar_xdr.Price(n=stellar_xdr.Int32(3), d=stellar_xdr.Int32(7)),
+            _pack_price,
+            _unpack_price,
+        ),
+        (
+            stellar_xdr.Int128Parts(
+                hi=stellar_xdr.Int64(-(2**40)), lo=stellar_xdr.Uint64(2**63)
+            ),
+            _pack_int128_parts,
+            _unpack_int128_parts,
+        ),
+        (
+            stellar_xdr.UInt256Parts(
+                hi_hi=stellar_xdr.Uint64(1),
+                hi_lo=stellar_xdr.Uint64(2),
+                lo_hi=stellar_xdr.Uint64(3),
+                lo_lo=stellar_xdr.Uint64(4),
+            ),
+            _pack_uint256_parts,
+            _unpack_uint256_parts,
+        ),
+        (
+            stellar_xdr.TimeBounds(
+                min_time=stellar_xdr.TimePoint(stellar_xdr.Uint64(0)),
+                max_time=stellar_xdr.TimePoint(stellar_xdr.Uint64(1_700_000_000)),
+            ),
+            _pack_time_bounds,
+            _unpack_time_bounds,
+        ),
+        (
+            stellar_xdr.LedgerBounds(
+                min_ledger=stellar_xdr.Uint32(10), max_ledger=stellar_xdr.Uint32(20)
+            ),
+            _pack_ledger_bounds,
+            _unpack_ledger_bounds,
+        ),
+        (
+            stellar_xdr.SCNonceKey(nonce=stellar_xdr.Int64(123456789)),
+            _pack_sc_nonce_key,
+            _unpack_sc_nonce_key,
+        ),
+    ]
+
+
+def _time(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def _compare(
+    value, legacy_pack: Callable, legacy_unpack: Callable, number: int
+) -> None:
+    xdr_type = type(value)
+    data = value.to_xdr_bytes()
+    packer = Packer()
+    legacy_pack(value, packer)
+    assert packer.get_buffer() == data
+    assert legacy_unpack(Unpacker(data)) == value
+
+    pack_old = _time(lambda: legacy_pack(value, Packer()), number)
+    pack_new = _time(lambda: value.pack(Packer()), number)
+    unpack_old = _time(lambda: legacy_unpack(Unpacker(data)), number)
+    unpack_new = _time(lambda: xdr_type.unpack(Unpacker(data)), number)
+    print(
+        f"{xdr_type.__name__:<14}{pack_old:>7.2f} us{pack_new:>7.2f} us"
+        f"{pack_old / pack_new:>8.1f}x"
+        f"{unpack_old:>9.2f} us{unpack_new:>9.2f} us"
+        f"{unpack_old / unpack_new:>8.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'type':<14}{'pack old':>10}{'pack new':>10}{'speedup':>9}"
+        f"{'unpack old':>12}{'unpack new':>12}{'speedup':>9}"
+    )
+    for value, legacy_pack, legacy_unpack in _cases():
+        _compare(value, legacy_pack, legacy_unpack, args.number)
+
+
+if __name__ == "__main__":
+    main()
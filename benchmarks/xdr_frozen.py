@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare dict lookups keyed by mutable and by frozen XDR values.
+
+Builds a dict keyed by contract-data ``LedgerKey`` values and reports the time to look every entry up with equal
+but distinct key objects, as happens when the keys are decoded from
+different sources. Mutable keys are hashed and compared member by member on
+every lookup, frozen keys (see ``freeze()``) only once. Values containing
+arrays, such as ``SCVal`` vectors and maps, can only be used as keys when
+frozen.
+
+Usage:
+    python benchmarks/xdr_frozen.py
+    python benchmarks/xdr_frozen.py --entries 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from stellar_sdk import Keypair, scval
+from stellar_sdk import xdr as stellar_xdr
+
+
+def build_key(index: int) -> stellar_xdr.LedgerKey:
+    contract = Keypair.from_raw_ed25519_seed(bytes(32)).public_key
+    return stellar_xdr.LedgerKey(
+        stellar_xdr.LedgerEntryType.CONTRACT_DATA,
+        contract_data=stellar_xdr.LedgerKeyContractData(
+            contract=scval.to_address(contract).address,
+            key=scval.to_int128(index * 10**20),
+            durability=stellar_xdr.ContractDataDurability.PERSISTENT,
+        ),
+    )
+
+
+def _lookups(table: dict, probes: list) -> float:
+    start = time.perf_counter()
+    for probe in probes:
+        table[probe]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50_000)
+    args = parser.parse_args()
+
+    keys = [build_key(i) for i in range(args.entries)]
+    data = [key.to_xdr_bytes() for key in keys]
+    probes = [stellar_xdr.LedgerKey.from_xdr_bytes(d) for d in data]
+    start = time.perf_counter()
+    frozen_keys = [key.freeze() for key in keys]
+    elapsed = time.perf_counter() - start
+    print(f"freeze: {elapsed / args.entries * 1e6:.2f} us per key")
+    frozen_probes = [probe.freeze() for probe in probes]
+
+    table = {key: i for i, key in enumerate(keys)}
+    frozen_table = {key: i for i, key in enumerate(frozen_keys)}
+    print(f"{'keys':<10}{'first lookup':>16}{'next lookups':>16}")
+    for label, lookup_table, lookup_probes in [
+        ("mutable", table, probes),
+        ("frozen", frozen_table, frozen_probes),
+    ]:
+        first = _lookups(lookup_table, lookup_probes)
+        again = _lookups(lookup_table, lookup_probes)
+        print(
+            f"{label:<10}{first / args.entries * 1e6:>13.2f} us"
+            f"{again / args.entries * 1e6:>13.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
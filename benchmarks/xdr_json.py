@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare the ways of encoding and decoding XDR ledger metadata as SEP-51 JSON.
+
+Encodes a synthetic ``LedgerCloseMeta`` (see ``_fixtures.py``) with
+``json.dumps(to_json_dict())``, which is what ``to_json`` used to do, with
+``to_json``, and with ``dump_xdr_json`` writing to a file, and reports the
+time and the peak memory allocated by each. Then decodes the JSON with
+``from_json`` using each installed JSON backend (``json``, ``orjson``,
+``ujson``), and with ``iter_xdr_json`` from a JSON Lines file.
+
+Usage:
+    python benchmarks/xdr_json.py
+    python benchmarks/xdr_json.py --transactions 500 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _measure(func: Callable[[], object], rounds: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def _report(label: str, elapsed: float, peak: int | None = None) -> None:
+    memory = f"{peak / 1024 / 1024:>9.1f} MiB" if peak is not None else ""
+    print(f"{label:<32}{elapsed * 1000:>9.2f} ms{memory}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    meta = build_ledger_close_meta(args.transactions)
+    text = meta.to_json()
+    print(f"JSON size: {len(text):,} bytes, {args.transactions} transactions")
+    print(f"{'encode':<32}{'time':>12}{'peak memory':>13}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ledger.json")
+
+        def _dump() -> None:
+            with open(path, "w") as f:
+                stellar_xdr.dump_xdr_json(meta, f)
+
+        for label, func in [
+            ("json.dumps(to_json_dict())", lambda: json.dumps(meta.to_json_dict())),
+            ("to_json", meta.to_json),
+            ("dump_xdr_json to a file", _dump),
+        ]:
+            _report(label, *_measure(func, args.rounds))
+
+        print(f"{'decode':<32}{'time':>12}")
+        for backend in ("json", "orjson", "ujson"):
+            if importlib.util.find_spec(backend) is None:
+                print(f"from_json ({backend}){'not installed':>24}")
+                continue
+            stellar_xdr.set_json_backend(backend)
+            elapsed, _ = _measure(
+                lambda: stellar_xdr.LedgerCloseMeta.from_json(text), args.rounds
+            )
+            _report(f"from_json ({backend})", elapsed)
+
+        stellar_xdr.set_json_backend()
+        lines_path = os.path.join(tmp, "ledgers.jsonl")
+        with open(lines_path, "w") as f:
+            f.write(text + "\n")
+        elapsed, _ = _measure(
+            lambda: list(
+                stellar_xdr.iter_xdr_json(lines_path, stellar_xdr.LedgerCloseMeta)
+            ),
+            args.rounds,
+        )
+        _report(f"iter_xdr_json ({stellar_xdr.set_json_backend()})", elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Measure the memory footprint of decoded XDR ledger metadata.
+
+Decodes a synthetic ``LedgerCloseMeta`` (see ``_fixtures.py``) several times
+and reports how many bytes the decoded object trees keep alive, per ledger,
+together with the decode throughput. Run it on two revisions to compare
+generator changes.
+
+Usage:
+    python benchmarks/xdr_memory.py
+    python benchmarks/xdr_memory.py --transactions 500 --ledgers 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _count_objects(obj: object) -> int:
+    count = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        count += 1
+        if isinstance(item, list):
+            stack.extend(item)
+        elif hasattr(item, "__slots__") or hasattr(item, "__dict__"):
+            for name in getattr(item, "__slots__", ()) or vars(item):
+                value = getattr(item, name)
+                if value is not None and not isinstance(value, (int, bytes)):
+                    stack.append(value)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--ledgers", type=int, default=10)
+    args = parser.parse_args()
+
+    xdr_bytes = build_ledger_close_meta(args.transactions).to_xdr_bytes()
+    print(f"ledger size: {len(xdr_bytes):,} bytes, {args.transactions} transactions")
+
+    start = time.perf_counter()
+    for _ in range(args.ledgers):
+        stellar_xdr.LedgerCloseMeta.from_xdr_bytes(xdr_bytes)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    decoded = [
+        stellar_xdr.LedgerCloseMeta.from_xdr_bytes(xdr_bytes)
+        for _ in range(args.ledgers)
+    ]
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_ledger = (current - baseline) / args.ledgers
+    print(f"objects per ledger: {_count_objects(decoded[0]):,}")
+    print(f"retained bytes per ledger: {per_ledger:,.0f}")
+    print(f"peak traced bytes: {peak - baseline:,}")
+    print(f"decode time per ledger: {elapsed / args.ledgers * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
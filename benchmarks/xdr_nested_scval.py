@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Measure the codec of nested SCVal vectors and maps.
+
+Builds wide (one level, many entries) and deep (many levels, one entry
+each) ``SCVal`` vectors and maps and reports, per value, the time to encode
+it with ``to_xdr_bytes``, to decode it with ``SCVal.from_xdr_bytes`` and to
+convert it with ``scval.to_native``.
+
+Usage:
+    python benchmarks/xdr_nested_scval.py
+    python benchmarks/xdr_nested_scval.py --width 5000 --number 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from stellar_sdk import scval
+from stellar_sdk import xdr as stellar_xdr
+
+
+def build_values(width: int, depth: int) -> dict[str, stellar_xdr.SCVal]:
+    deep_vec = scval.to_uint32(1)
+    deep_map = scval.to_uint32(1)
+    for i in range(depth):
+        deep_vec = scval.to_vec([deep_vec, scval.to_uint32(i)])
+        deep_map = scval.to_map({scval.to_uint32(i): deep_map})
+    return {
+        f"wide vec ({width})": scval.to_vec([scval.to_uint64(i) for i in range(width)]),
+        f"wide map ({width})": scval.to_map(
+            {scval.to_symbol(f"k{i}"): scval.to_int128(i) for i in range(width)}
+        ),
+        f"deep vec ({depth})": deep_vec,
+        f"deep map ({depth})": deep_map,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=150)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'value':<20}{'encode':>12}{'decode':>12}{'to_native':>12}")
+    for label, value in build_values(args.width, args.depth).items():
+        data = value.to_xdr_bytes()
+        times = [
+            min(timeit.repeat(func, number=args.number, repeat=3)) / args.number
+            for func in (
+                value.to_xdr_bytes,
+                lambda data=data: stellar_xdr.SCVal.from_xdr_bytes(data),
+                lambda value=value: scval.to_native(value),
+            )
+        ]
+        print(f"{label:<20}" + "".join(f"{t * 1000:>9.3f} ms" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Measure decoding of SCVal-heavy contract event data.
+
+Builds a contract-event-like ``SCVal`` vector (symbols, an address, a map of
+``i128`` amounts and a mix of other value types) and reports the time to
+decode it with ``SCVal.from_xdr_bytes``, along with the time to decode a
+single ``SCValType`` discriminant.
+
+Usage:
+    python benchmarks/xdr_scval.py
+    python benchmarks/xdr_scval.py --entries 100 --number 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from stellar_sdk import Keypair, scval
+from stellar_sdk import xdr as stellar_xdr
+
+
+def build_event(entries: int) -> stellar_xdr.SCVal:
+    keypair = Keypair.from_raw_ed25519_seed(bytes(range(32)))
+    return scval.to_vec(
+        [
+            scval.to_symbol("transfer"),
+            scval.to_address(keypair.public_key),
+            scval.to_map(
+                {
+                    scval.to_symbol(f"k{i}"): scval.to_int128(i * 10**20)
+                    for i in range(entries)
+                }
+            ),
+            scval.to_uint64(5),
+            scval.to_bool(True),
+            scval.to_string("memo"),
+            scval.to_bytes(b"abc"),
+            scval.to_duration(1),
+            scval.to_int256(-5),
+            scval.to_void(),
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10)
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    data = build_event(args.entries).to_xdr_bytes()
+    elapsed = min(
+        timeit.repeat(
+            lambda: stellar_xdr.SCVal.from_xdr_bytes(data),
+            number=args.number,
+            repeat=5,
+        )
+    )
+    print(f"SCVal event ({len(data)} bytes): {elapsed / args.number * 1e6:.1f} us")
+
+    enum_data = stellar_xdr.SCValType.SCV_MAP.to_xdr_bytes()
+    number = args.number * 20
+    elapsed = min(
+        timeit.repeat(
+            lambda: stellar_xdr.SCValType.unpack(stellar_xdr.make_unpacker(enum_data)),
+            number=number,
+            repeat=5,
+        )
+    )
+    print(f"SCValType.unpack: {elapsed / number * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
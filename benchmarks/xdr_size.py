@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Compare computing the encoded size of XDR values with packing them.
+
+Reports the time to get the encoded length of transaction envelopes and of a
+synthetic ``LedgerCloseMeta`` (see ``_fixtures.py``) with ``xdr_size()`` and
+with ``len(to_xdr_bytes())``.
+
+Usage:
+    python benchmarks/xdr_size.py
+    python benchmarks/xdr_size.py --transactions 500 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from _fixtures import build_ledger_close_meta, build_transaction_envelopes
+
+
+def _measure(func: Callable[[], object], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    envelopes = build_transaction_envelopes(args.transactions)
+    ledger = build_ledger_close_meta(args.transactions)
+    print(f"{'value':<28}{'to_xdr_bytes':>14}{'xdr_size':>12}{'speedup':>10}")
+    for label, values in [
+        (f"{args.transactions} envelopes", envelopes),
+        ("LedgerCloseMeta", [ledger]),
+    ]:
+        for value in values:
+            assert value.xdr_size() == len(value.to_xdr_bytes())
+        packed = _measure(
+            lambda values=values: [len(v.to_xdr_bytes()) for v in values], args.rounds
+        )
+        sized = _measure(
+            lambda values=values: [v.xdr_size() for v in values], args.rounds
+        )
+        print(
+            f"{label:<28}{packed * 1000:>11.2f} ms{sized * 1000:>9.2f} ms"
+            f"{packed / sized:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Compare full decoding of XDR ledger metadata with field projection.
+
+Decodes the same synthetic ``LedgerCloseMeta`` (see ``_fixtures.py``) three
+ways: in full with ``from_xdr_bytes``, with ``decode_fields`` selecting a few
+values (the ledger sequence and the hash of every transaction), and with
+``skip``, which walks the encoding without building any objects.
+
+Usage:
+    python benchmarks/xdr_skip.py
+    python benchmarks/xdr_skip.py --transactions 500 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+PATHS = [
+    "v2.ledger_header.header.ledger_seq",
+    "v2.tx_processing.result.transaction_hash",
+]
+
+
+def _full(data: bytes) -> None:
+    stellar_xdr.LedgerCloseMeta.from_xdr_bytes(data)
+
+
+def _project(data: bytes) -> None:
+    stellar_xdr.LedgerCloseMeta.decode_fields(data, PATHS)
+
+
+def _skip(data: bytes) -> None:
+    stellar_xdr.LedgerCloseMeta.skip(stellar_xdr.make_unpacker(data))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    xdr_bytes = build_ledger_close_meta(args.transactions).to_xdr_bytes()
+    print(f"ledger size: {len(xdr_bytes):,} bytes, {args.transactions} transactions")
+    print(f"{'mode':<16}{'time':>12}{'speedup':>10}")
+    baseline = None
+    for label, func in [
+        ("from_xdr_bytes", _full),
+        ("decode_fields", _project),
+        ("skip", _skip),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            func(xdr_bytes)
+        elapsed = (time.perf_counter() - start) / args.rounds
+        baseline = baseline or elapsed
+        print(f"{label:<16}{elapsed * 1000:>9.2f} ms{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Measure the throughput of the record-marked XDR stream reader.
+
+Writes a temporary file of record-marked ``LedgerCloseMeta`` values (see
+``_fixtures.py``), plain and gzip-compressed, and reads it back with
+``iter_xdr_frames`` (framing only) and ``iter_xdr_records`` (framing and
+decoding). Throughput is reported in MB/s of uncompressed XDR, together
+with the peak memory traced while reading, which stays around the size of
+one record regardless of the file size.
+
+Usage:
+    python benchmarks/xdr_stream.py
+    python benchmarks/xdr_stream.py --ledgers 50 --transactions 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import tempfile
+import time
+import tracemalloc
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _run(label: str, read, size: int) -> None:
+    start = time.perf_counter()
+    count = sum(1 for _ in read())
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in read():
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32}{count:>8}{size / elapsed / 1e6:>12.1f}{peak / 1e6:>14.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ledgers", type=int, default=20)
+    parser.add_argument("--transactions", type=int, default=100)
+    args = parser.parse_args()
+
+    records = [
+        stellar_xdr.pack_xdr_record(
+            build_ledger_close_meta(args.transactions, 1_000_000 + i)
+        )
+        for i in range(args.ledgers)
+    ]
+    data = b"".join(records)
+    size = len(data)
+    print(f"stream size: {size:,} bytes, {args.ledgers} ledgers")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "ledgers.xdr")
+        compressed = os.path.join(tmp, "ledgers.xdr.gz")
+        with open(plain, "wb") as f:
+            f.write(data)
+        with gzip.open(compressed, "wb") as f:
+            f.write(data)
+        del records, data
+
+        print(f"{'reader':<32}{'records':>8}{'MB/s':>12}{'peak MB':>14}")
+        for label, path in (("file", plain), ("gzip file", compressed)):
+            _run(
+                f"frames, {label}",
+                lambda path=path: stellar_xdr.iter_xdr_frames(path),
+                size,
+            )
+            _run(
+                f"records, {label}",
+                lambda path=path: stellar_xdr.iter_xdr_records(
+                    path, stellar_xdr.LedgerCloseMeta
+                ),
+                size,
+            )
+            _run(
+                f"records, {label}, zero_copy",
+                lambda path=path: stellar_xdr.iter_xdr_records(
+                    path, stellar_xdr.LedgerCloseMeta, zero_copy=True
+                ),
+                size,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Compare full decoding of XDR ledger metadata with lazy views.
+
+Reads the same few values (the ledger sequence and the hash of every
+transaction) from a synthetic ``LedgerCloseMeta`` (see ``_fixtures.py``)
+after decoding it in full with ``from_xdr_bytes``, through a ``view`` and
+with ``decode_fields``. It also times a view that only reads the ledger
+sequence, and turning a view into the generated class with
+``to_xdr_object``.
+
+Usage:
+    python benchmarks/xdr_view.py
+    python benchmarks/xdr_view.py --transactions 500 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _full(data: bytes) -> None:
+    meta = stellar_xdr.LedgerCloseMeta.from_xdr_bytes(data).v2
+    _ = meta.ledger_header.header.ledger_seq
+    _ = [item.result.transaction_hash for item in meta.tx_processing]
+
+
+def _view(data: bytes) -> None:
+    meta = stellar_xdr.LedgerCloseMeta.view(data).v2
+    _ = meta.ledger_header.header.ledger_seq
+    _ = [item.result.transaction_hash for item in meta.tx_processing]
+
+
+def _view_header(data: bytes) -> None:
+    _ = stellar_xdr.LedgerCloseMeta.view(data).v2.ledger_header.header.ledger_seq
+
+
+def _project(data: bytes) -> None:
+    stellar_xdr.LedgerCloseMeta.decode_fields(
+        data,
+        [
+            "v2.ledger_header.header.ledger_seq",
+            "v2.tx_processing.result.transaction_hash",
+        ],
+    )
+
+
+def _to_xdr_object(data: bytes) -> None:
+    stellar_xdr.LedgerCloseMeta.view(data).to_xdr_object()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    xdr_bytes = build_ledger_close_meta(args.transactions).to_xdr_bytes()
+    print(f"ledger size: {len(xdr_bytes):,} bytes, {args.transactions} transactions")
+    print(f"{'mode':<20}{'time':>12}{'speedup':>10}")
+    baseline = None
+    for label, func in [
+        ("from_xdr_bytes", _full),
+        ("view", _view),
+        ("view, header only", _view_header),
+        ("decode_fields", _project),
+        ("view.to_xdr_object", _to_xdr_object),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            func(xdr_bytes)
+        elapsed = (time.perf_counter() - start) / args.rounds
+        baseline = baseline or elapsed
+        print(f"{label:<20}{elapsed * 1000:>9.2f} ms{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Compare copying and zero-copy decoding of XDR ledger metadata.
+
+Decodes the same synthetic ``LedgerCloseMeta`` (see ``_fixtures.py``) from
+``bytes``, from a ``bytearray`` (which is copied to ``bytes`` first) and
+from a ``bytearray`` with ``zero_copy=True``, where large opaque values such
+as contract code are returned as views of the input buffer. For each mode
+it reports the bytes allocated while decoding, the bytes retained by the
+decoded tree and the decode time. The input buffer itself is not counted,
+even though zero-copy results keep it alive.
+
+Usage:
+    python benchmarks/xdr_zero_copy.py
+    python benchmarks/xdr_zero_copy.py --transactions 500 --wasm-size 65536
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from _fixtures import build_ledger_close_meta
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _measure(data: stellar_xdr.XdrBuffer, zero_copy: bool, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        stellar_xdr.LedgerCloseMeta.from_xdr_bytes(data, zero_copy=zero_copy)
+    elapsed = (time.perf_counter() - start) / rounds
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    decoded = stellar_xdr.LedgerCloseMeta.from_xdr_bytes(data, zero_copy=zero_copy)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del decoded
+    return peak - baseline, current - baseline, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--wasm-size", type=int, default=32 * 1024)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    xdr_bytes = build_ledger_close_meta(
+        args.transactions, wasm_size=args.wasm_size
+    ).to_xdr_bytes()
+    print(
+        f"ledger size: {len(xdr_bytes):,} bytes, {args.transactions} transactions, "
+        f"{args.wasm_size:,} bytes of code per Soroban transaction"
+    )
+    modes = [
+        ("bytes", xdr_bytes, False),
+        ("bytearray", bytearray(xdr_bytes), False),
+        ("bytearray, zero_copy", bytearray(xdr_bytes), True),
+    ]
+    print(f"{'input':<22}{'allocated':>14}{'retained':>14}{'decode':>12}")
+    for label, data, zero_copy in modes:
+        peak, retained, elapsed = _measure(data, zero_copy, args.rounds)
+        print(f"{label:<22}{peak:>14,}{retained:>14,}{elapsed * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
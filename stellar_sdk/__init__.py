@@ -1,3 +1,7 @@
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING
+
 from . import scval
 from .__version__ import (
     __author__,
@@ -12,11 +16,16 @@ from .__version__ import (
 from .account import *
 from .address import *
 from .asset import *
-from .client.requests_client import RequestsClient
+from .base_channel_pool import *
+from .base_transaction_envelope import *
+from .channel_pool import *
+from .channel_pool_async import *
 from .decorated_signature import *
 from .fee_bump_transaction import *
 from .fee_bump_transaction_envelope import *
 from .helpers import *
+from .history_scanner import *
+from .history_scanner_async import *
 from .keypair import *
 from .ledger_bounds import *
 from .liquidity_pool_asset import *
@@ -27,21 +36,69 @@ from .network import *
 from .operation import *
 from .preconditions import *
 from .price import *
-from .server import *
 from .signer import *
 from .signer_key import *
 from .soroban_data_builder import *
-from .soroban_server import *
 from .strkey import *
 from .time_bounds import *
 from .transaction import *
 from .transaction_builder import *
 from .transaction_envelope import *
+from .transaction_planner import *
+from .transaction_template import *
 
-# aiohttp required
-try:
+if TYPE_CHECKING:
     from .client.aiohttp_client import AiohttpClient
+    from .client.requests_client import RequestsClient
+    from .server import *
     from .server_async import ServerAsync
+    from .soroban_server import *
     from .soroban_server_async import SorobanServerAsync
-except ImportError:
-    pass
+
+# The network clients and servers pull in requests, aiohttp and pydantic,
+# which dominate the import time of the package. They are only imported
+# when one of these names is first accessed.
+_LAZY_IMPORTS = {
+    "RequestsClient": ".client.requests_client",
+    "Server": ".server",
+    "Durability": ".soroban_server",
+    "SorobanServer": ".soroban_server",
+    "AiohttpClient": ".client.aiohttp_client",
+    "ServerAsync": ".server_async",
+    "SorobanServerAsync": ".soroban_server_async",
+}
+
+# aiohttp required
+_AIOHTTP_IMPORTS = {"AiohttpClient", "ServerAsync", "SorobanServerAsync"}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        if name not in _AIOHTTP_IMPORTS:
+            raise
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}, "
+            f"please install aiohttp and aiohttp-sse-client to use it"
+        ) from e
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+
+
+__all__ = [
+    name
+    for name in globals()
+    if not name.startswith("_") and name not in ("TYPE_CHECKING", "importlib")
+]
+__all__ += [name for name in _LAZY_IMPORTS if name not in _AIOHTTP_IMPORTS]
+if importlib.util.find_spec("aiohttp") is not None:
+    __all__ += sorted(_AIOHTTP_IMPORTS)
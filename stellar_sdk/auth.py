@@ -1,4 +1,3 @@
-import copy
 import itertools
 import random
 from collections.abc import Callable, Sequence
@@ -298,7 +297,7 @@ def authorize_entry(
     if isinstance(entry, str):
         entry = stellar_xdr.SorobanAuthorizationEntry.from_xdr(entry)
     else:
-        entry = copy.deepcopy(entry)
+        entry = entry.clone()
 
     if (
         entry.credentials.type
@@ -541,7 +540,7 @@ def build_with_delegates_entry(
     if isinstance(entry, str):
         entry = stellar_xdr.SorobanAuthorizationEntry.from_xdr(entry)
     else:
-        entry = copy.deepcopy(entry)
+        entry = entry.clone()
 
     if entry.credentials.type not in (
         stellar_xdr.SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS,
@@ -0,0 +1,102 @@
+import contextlib
+from collections.abc import Iterable
+
+from .account import Account
+from .exceptions import BadRequestError, SignatureExistError
+from .fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
+from .keypair import Keypair
+from .transaction_builder import TransactionBuilder
+from .transaction_envelope import TransactionEnvelope
+
+__all__ = ["ChannelAccount"]
+
+_BAD_SEQUENCE = "tx_bad_seq"
+
+
+class ChannelAccount:
+    """A channel account, leased from a :class:`ChannelPool
+    <stellar_sdk.channel_pool.ChannelPool>` or a :class:`ChannelPoolAsync
+    <stellar_sdk.channel_pool_async.ChannelPoolAsync>` to build one
+    transaction at a time.
+
+    :param keypair: The keypair of the channel account.
+    """
+
+    def __init__(self, keypair: Keypair) -> None:
+        self.keypair: Keypair = keypair
+        self._account: Account | None = None
+
+    @property
+    def account(self) -> Account:
+        """The channel account, with its sequence number, to use as the source
+        account of a :class:`TransactionBuilder
+        <stellar_sdk.transaction_builder.TransactionBuilder>`.
+
+        :raises: :exc:`ValueError`: if the channel account is not leased.
+        """
+        if self._account is None:
+            raise ValueError("The channel account is not leased.")
+        return self._account
+
+    def __repr__(self):
+        return f"<ChannelAccount [account_id={self.keypair.public_key}]>"
+
+
+class BaseChannelPool:
+    def __init__(
+        self,
+        channels: Iterable[Keypair | str],
+        network_passphrase: str,
+        fee_source: Keypair | str | None = None,
+        base_fee: int = 100,
+    ) -> None:
+        self.network_passphrase: str = network_passphrase
+        if isinstance(fee_source, str):
+            fee_source = Keypair.from_secret(fee_source)
+        self.fee_source: Keypair | None = fee_source
+        self.base_fee: int = base_fee
+        self._channels: list[ChannelAccount] = [
+            ChannelAccount(
+                Keypair.from_secret(channel) if isinstance(channel, str) else channel
+            )
+            for channel in channels
+        ]
+        if not self._channels:
+            raise ValueError("At least one channel account is required.")
+
+    def _prepare(
+        self, channel: ChannelAccount, transaction_envelope: TransactionEnvelope
+    ) -> TransactionEnvelope | FeeBumpTransactionEnvelope:
+        with contextlib.suppress(SignatureExistError):
+            transaction_envelope.sign(channel.keypair)
+        if self.fee_source is None:
+            return transaction_envelope
+        fee_bump_envelope = TransactionBuilder.build_fee_bump_transaction(
+            self.fee_source.public_key,
+            self.base_fee,
+            transaction_envelope,
+            self.network_passphrase,
+        )
+        fee_bump_envelope.sign(self.fee_source)
+        return fee_bump_envelope
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [channels={len(self._channels)}, "
+            f"network_passphrase={self.network_passphrase}, "
+            f"fee_source={self.fee_source.public_key if self.fee_source else None}, "
+            f"base_fee={self.base_fee}]>"
+        )
+
+
+def _is_bad_sequence(error: BadRequestError) -> bool:
+    # Horizon reports the result code of the inner transaction of a fee bump
+    # transaction separately.
+    result_codes = (error.extras or {}).get("result_codes") or {}
+    return _BAD_SEQUENCE in (
+        result_codes.get("transaction"),
+        result_codes.get("inner_transaction"),
+    )
@@ -0,0 +1,66 @@
+import copy
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .sep.toid import TOID
+
+if TYPE_CHECKING:
+    from .call_builder.base import BaseCallBuilder
+
+_CallBuilderT = TypeVar("_CallBuilderT", bound="BaseCallBuilder")
+
+
+class BaseHistoryScanner:
+    def __init__(
+        self,
+        start_ledger: int,
+        end_ledger: int,
+        shards: int = 8,
+        workers: int | None = None,
+        limit: int = 200,
+        buffer: int = 4,
+    ) -> None:
+        if shards < 1:
+            raise ValueError(f"shards must be positive, got {shards}.")
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}.")
+        if buffer < 1:
+            raise ValueError(f"buffer must be positive, got {buffer}.")
+        # Validates the ledger sequences.
+        TOID.ledger_range_inclusive(start_ledger, end_ledger)
+        self.start_ledger: int = start_ledger
+        self.end_ledger: int = end_ledger
+        self.limit: int = limit
+        self.buffer: int = buffer
+        ledgers = end_ledger - start_ledger + 1
+        count = min(shards, ledgers)
+        bounds = [start_ledger + ledgers * i // count for i in range(count + 1)]
+        self.ranges: list[tuple[int, int]] = [
+            TOID.ledger_range_inclusive(bounds[i], bounds[i + 1] - 1)
+            for i in range(count)
+        ]
+        self.workers: int = len(self.ranges) if workers is None else workers
+
+    def _shard(self, call_builder: _CallBuilderT, start: int) -> _CallBuilderT:
+        shard = copy.copy(call_builder)
+        shard.params = dict(call_builder.params)
+        shard.prev_href = shard.next_href = None
+        return shard.cursor(start).order(desc=False).limit(self.limit)
+
+    @staticmethod
+    def _in_range(
+        records: list[dict[str, Any]], end: int
+    ) -> tuple[list[dict[str, Any]], bool]:
+        # Returns the records before the end of the shard, and whether the end
+        # has been reached. The paging tokens of effects and trades are the id
+        # of their operation followed by an index.
+        for index, record in enumerate(records):
+            if int(record["paging_token"].split("-", 1)[0]) >= end:
+                return records[:index], True
+        return records, False
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [start_ledger={self.start_ledger}, "
+            f"end_ledger={self.end_ledger}, shards={len(self.ranges)}, "
+            f"workers={self.workers}, limit={self.limit}, buffer={self.buffer}]>"
+        )
@@ -1,7 +1,12 @@
+import base64
+import itertools
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Generic, TypeVar
 
+from xdrlib3 import Packer
+
 from . import xdr as stellar_xdr
 from .decorated_signature import DecoratedSignature
 from .exceptions import SignatureExistError
@@ -9,6 +14,8 @@ from .keypair import Keypair
 from .network import Network
 from .utils import hex_to_bytes, sha256
 
+__all__ = ["sign_envelopes"]
+
 T = TypeVar("T")
 
 
@@ -63,6 +70,30 @@ class BaseTransactionEnvelope(Generic[T]):
         else:
             self.signatures.append(sig)
 
+    def sign_many(self, signers: Iterable[Keypair | str]) -> None:
+        """Sign this transaction envelope with each of the given keypairs.
+
+        The envelope is hashed once for all signers. Use :func:`sign_envelopes`
+        to sign many envelopes with the same keypairs.
+
+        :param signers: The keypairs or secrets to use for signing this
+            transaction envelope.
+        :raise: :exc:`SignatureExistError <stellar_sdk.exception.SignatureExistError>`:
+            if one of the signatures already exists, or if a keypair is given
+            twice. No signature is added in that case.
+        """
+        keypairs = _to_keypairs(signers)
+        hints = [keypair.signature_hint() for keypair in keypairs]
+        self._add_signatures(_sign_hashes(keypairs, hints, [self.hash()])[0])
+
+    def _add_signatures(self, signatures: list[DecoratedSignature]) -> None:
+        existing = set(self.signatures)
+        for sig in signatures:
+            if sig in existing:
+                raise SignatureExistError("The keypair has already signed.")
+            existing.add(sig)
+        self.signatures.extend(signatures)
+
     @abstractmethod
     def signature_base(self) -> bytes:
         """Get the signature base of this transaction envelope.
@@ -110,32 +141,47 @@ class BaseTransactionEnvelope(Generic[T]):
 
         :return: XDR TransactionEnvelope base64 string object
         """
-        return self.to_xdr_object().to_xdr()
+        return base64.b64encode(self._xdr_bytes()).decode()
+
+    def _xdr_bytes(self) -> bytes:
+        return self.to_xdr_object().to_xdr_bytes()
+
+    def _signatures_xdr_bytes(self) -> bytes:
+        return _pack_signatures(self.signatures)
 
     @classmethod
     def from_xdr_object(
-        cls, xdr_object: stellar_xdr.TransactionEnvelope, network_passphrase: str
+        cls,
+        xdr_object: stellar_xdr.TransactionEnvelope,
+        network_passphrase: str,
+        lazy: bool = False,
     ) -> T:
         """Create a new :class:`BaseTransactionEnvelope` from an XDR object.
 
         :param xdr_object: The XDR object that represents a transaction envelope.
         :param network_passphrase: The network to connect to for verifying and retrieving additional attributes from.
+        :param lazy: Create the operations of the transaction when they are
+            accessed, see :meth:`Transaction.from_xdr_object
+            <stellar_sdk.transaction.Transaction.from_xdr_object>`.
         :return: A new :class:`TransactionEnvelope` object from the given XDR TransactionEnvelope object.
         """
         raise NotImplementedError("The method has not been implemented.")
 
     @classmethod
-    def from_xdr(cls, xdr: str, network_passphrase: str) -> T:
+    def from_xdr(cls, xdr: str, network_passphrase: str, lazy: bool = False) -> T:
         """Create a new :class:`BaseTransactionEnvelope` from an XDR string.
 
         :param xdr: The XDR string that represents a transaction
             envelope.
         :param network_passphrase: which network this transaction envelope is associated with.
+        :param lazy: Create the operations of the transaction when they are
+            accessed, see :meth:`Transaction.from_xdr_object
+            <stellar_sdk.transaction.Transaction.from_xdr_object>`.
 
         :return: A new :class:`BaseTransactionEnvelope` object from the given XDR TransactionEnvelope base64 string object.
         """
         xdr_object = stellar_xdr.TransactionEnvelope.from_xdr(xdr)
-        return cls.from_xdr_object(xdr_object, network_passphrase)
+        return cls.from_xdr_object(xdr_object, network_passphrase, lazy)
 
     @abstractmethod
     def __hash__(self) -> int:
@@ -150,3 +196,85 @@ class BaseTransactionEnvelope(Generic[T]):
             f"<BaseTransactionEnvelope [network_passphrase={self.network_passphrase}, "
             f"signatures={self.signatures}]>"
         )
+
+
+def sign_envelopes(
+    envelopes: Iterable[BaseTransactionEnvelope],
+    signers: Iterable[Keypair | str],
+    workers: int | None = None,
+    chunk_size: int = 64,
+    executor: Executor | None = None,
+) -> None:
+    """Sign each of the given transaction envelopes with each of the given
+    keypairs.
+
+    Each envelope is hashed once, and each keypair's signature hint is
+    computed once for all envelopes. The signatures are computed in this
+    thread, or, with ``workers`` or ``executor``, in chunks of
+    ``chunk_size`` envelopes on an executor. Signing releases the GIL, so a
+    :class:`~concurrent.futures.ThreadPoolExecutor` scales with the number of
+    CPUs. A :class:`~concurrent.futures.ProcessPoolExecutor` also works, but
+    the secret keys are then sent to its worker processes.
+
+    :param envelopes: The transaction envelopes to sign.
+    :param signers: The keypairs or secrets to use for signing the envelopes.
+    :param workers: The number of threads to sign with, by default the
+        envelopes are signed in this thread.
+    :param chunk_size: The number of envelopes signed by a worker at a time.
+    :param executor: An executor to sign on instead of a new thread pool,
+        it is not shut down.
+    :raise: :exc:`SignatureExistError <stellar_sdk.exception.SignatureExistError>`:
+        if one of the signatures already exists in an envelope, or if a
+        keypair is given twice. The envelope gets no new signature, and the
+        envelopes after it are not signed.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+    keypairs = _to_keypairs(signers)
+    hints = [keypair.signature_hint() for keypair in keypairs]
+    envelopes = list(envelopes)
+    hashes = [envelope.hash() for envelope in envelopes]
+    if executor is None and workers is None:
+        signatures = _sign_hashes(keypairs, hints, hashes)
+    else:
+        pool = executor or ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(_sign_hashes, keypairs, hints, hashes[i : i + chunk_size])
+                for i in range(0, len(hashes), chunk_size)
+            ]
+            signatures = list(
+                itertools.chain.from_iterable(future.result() for future in futures)
+            )
+        finally:
+            if executor is None:
+                pool.shutdown()
+    for envelope, envelope_signatures in zip(envelopes, signatures, strict=True):
+        envelope._add_signatures(envelope_signatures)
+
+
+def _to_keypairs(signers: Iterable[Keypair | str]) -> list[Keypair]:
+    return [
+        Keypair.from_secret(signer) if isinstance(signer, str) else signer
+        for signer in signers
+    ]
+
+
+def _pack_signatures(signatures: Sequence[DecoratedSignature]) -> bytes:
+    packer = Packer()
+    packer.pack_uint(len(signatures))
+    for signature in signatures:
+        signature.to_xdr_object().pack(packer)
+    return packer.get_buffer()
+
+
+def _sign_hashes(
+    keypairs: list[Keypair], hints: list[bytes], hashes: list[bytes]
+) -> list[list[DecoratedSignature]]:
+    return [
+        [
+            DecoratedSignature(hint, keypair.sign(tx_hash))
+            for keypair, hint in zip(keypairs, hints, strict=True)
+        ]
+        for tx_hash in hashes
+    ]
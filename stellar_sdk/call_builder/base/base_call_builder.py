@@ -1,6 +1,8 @@
-from collections.abc import AsyncGenerator, Coroutine, Generator, Mapping
+from collections.abc import AsyncGenerator, Callable, Coroutine, Generator, Mapping
 from typing import Any
 
+from ...exceptions import NotPageableError
+
 __all__ = ["BaseCallBuilder"]
 
 
@@ -50,6 +52,37 @@ class BaseCallBuilder:
         """
         raise NotImplementedError
 
+    def iter_records(
+        self, prefetch: int = 1, checkpoint: Callable[[str], Any] | None = None
+    ) -> AsyncGenerator[dict[str, Any], None] | Generator[dict[str, Any], None, None]:
+        """Iterates over the records of all the pages, starting with the page
+        of this builder's current configuration.
+
+        The next page is requested while the records of the current one are
+        consumed: in a background thread with a synchronous client, in a task
+        with an asynchronous client. The iteration ends at the first empty page,
+        so use :meth:`order` to walk the records in ascending order and
+        :meth:`limit` to choose the page size.
+
+        See `Pagination <https://developers.stellar.org/docs/data/apis/horizon/api-reference/structure/pagination>`__
+
+        :param prefetch: The maximum number of pages fetched ahead of the
+            records being consumed. With ``0``, each page is requested when the
+            previous one has been consumed.
+        :param checkpoint: A function called with the paging token of the last
+            record of each page, after all the records of the page have been
+            consumed. Resuming from that cursor with :meth:`cursor` does not
+            skip any record.
+        :return: If it is called synchronous, it will return ``Generator``, If
+            it is called asynchronously, it will return ``AsyncGenerator``.
+        :raises:
+            | :exc:`ValueError`: if ``prefetch`` is negative.
+            | :exc:`NotPageableError <stellar_sdk.exceptions.NotPageableError>`: if a
+                response is not a page of records.
+            | The exceptions of :meth:`call`.
+        """
+        raise NotImplementedError
+
     def next(self):
         raise NotImplementedError
 
@@ -111,6 +144,19 @@ class BaseCallBuilder:
         if next_page:
             self.next_href = next_page.get("href")
 
+    @staticmethod
+    def _page_records(response: dict[str, Any]) -> list[dict[str, Any]]:
+        records = response.get("_embedded", {}).get("records")
+        if records is None:
+            raise NotPageableError("The response is not a page of records.")
+        return records
+
+    @staticmethod
+    def _next_page_href(response: dict[str, Any]) -> str | None:
+        # Follow the link of each page rather than ``next_href``, which is
+        # shared with the other methods of the builder.
+        return response.get("_links", {}).get("next", {}).get("href")
+
     def _add_query_params(
         self, params: Mapping[str, str | float | int | bool | None]
     ) -> None:
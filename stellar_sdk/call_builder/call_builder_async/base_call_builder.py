@@ -1,4 +1,7 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import contextlib
+import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Any
 
 from ...call_builder.base.base_call_builder import BaseCallBuilder as _BaseCallBuilder
@@ -69,6 +72,110 @@ class BaseCallBuilder(_BaseCallBuilder):
         while True:
             yield await stream.__anext__()
 
+    def iter_records(
+        self,
+        prefetch: int = 1,
+        checkpoint: Callable[[str], Awaitable[Any] | Any] | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Iterates over the records of all the pages, starting with the page
+        of this builder's current configuration.
+
+        The next pages are requested in a background task while the records
+        of the current one are consumed. The iteration ends at the first empty
+        page, so use :meth:`order` to walk the records in ascending order and
+        :meth:`limit` to choose the page size. An example::
+
+            from stellar_sdk import ServerAsync
+
+            async with ServerAsync("https://horizon-testnet.stellar.org") as server:
+                payments = server.payments().for_account(account_id).order(desc=False).limit(200)
+                async for payment in payments.iter_records(prefetch=2, checkpoint=save_cursor):
+                    await process(payment)
+
+        See `Pagination <https://developers.stellar.org/docs/data/apis/horizon/api-reference/structure/pagination>`__
+
+        :param prefetch: The maximum number of pages fetched ahead of the page
+            being consumed. With ``0``, each page is requested once the
+            previous one has been consumed.
+        :param checkpoint: A function or coroutine function called with the
+            paging token of the last record of each page, once all the records
+            of the page have been consumed. Resuming from that cursor with
+            :meth:`cursor` does not skip any record.
+        :return: An async generator of the records.
+        :raises:
+            | :exc:`ValueError`: if ``prefetch`` is negative.
+            | :exc:`NotPageableError <stellar_sdk.exceptions.NotPageableError>`: if a
+                response is not a page of records.
+            | The exceptions of :meth:`call`, when the page is reached.
+        """
+        if prefetch < 0:
+            raise ValueError(f"prefetch must not be negative, got {prefetch}.")
+        pages = self._pages() if prefetch == 0 else self._prefetch_pages(prefetch)
+        return self._iter_records(pages, checkpoint)
+
+    async def _iter_records(
+        self,
+        pages: AsyncGenerator[list[dict[str, Any]], None],
+        checkpoint: Callable[[str], Awaitable[Any] | Any] | None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        async with contextlib.aclosing(pages):
+            async for records in pages:
+                for record in records:
+                    yield record
+                paging_token = records[-1].get("paging_token")
+                if checkpoint is not None and paging_token is not None:
+                    result = checkpoint(paging_token)
+                    if inspect.isawaitable(result):
+                        await result
+
+    async def _pages(self) -> AsyncGenerator[list[dict[str, Any]], None]:
+        url: str | None = urljoin_with_query(self.horizon_url, self.endpoint)
+        params: dict | None = self.params
+        while url is not None:
+            resp = await self._call(url, params)
+            records = self._page_records(resp)
+            if not records:
+                return
+            yield records
+            url, params = self._next_page_href(resp), None
+
+    async def _prefetch_pages(
+        self, prefetch: int
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        # The task takes a slot before requesting a page, and the slot is
+        # given back when the page is consumed.
+        slots = asyncio.Semaphore(prefetch)
+        results: asyncio.Queue[list[dict[str, Any]] | Exception | None] = (
+            asyncio.Queue()
+        )
+
+        async def fetch() -> None:
+            try:
+                async with contextlib.aclosing(self._pages()) as pages:
+                    while True:
+                        await slots.acquire()
+                        records = await anext(pages, None)
+                        results.put_nowait(records)
+                        if records is None:
+                            return
+            except Exception as e:
+                results.put_nowait(e)
+
+        task = asyncio.create_task(fetch())
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    return
+                if isinstance(result, Exception):
+                    raise result
+                slots.release()
+                yield result
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
     async def next(self) -> dict[str, Any]:
         if self.next_href is None:
             raise NotPageableError("The next page does not exist.")
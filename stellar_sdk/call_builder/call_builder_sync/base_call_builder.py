@@ -1,4 +1,6 @@
-from collections.abc import Generator
+import queue
+import threading
+from collections.abc import Callable, Generator
 from typing import Any
 
 from ...call_builder.base.base_call_builder import BaseCallBuilder as _BaseCallBuilder
@@ -65,6 +67,115 @@ class BaseCallBuilder(_BaseCallBuilder):
         url = urljoin_with_query(self.horizon_url, self.endpoint)
         return self.client.stream(url, self.params)
 
+    def iter_records(
+        self, prefetch: int = 1, checkpoint: Callable[[str], Any] | None = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """Iterates over the records of all the pages, starting with the page
+        of this builder's current configuration.
+
+        The next pages are requested in a background thread while the records
+        of the current one are consumed. The iteration ends at the first empty
+        page, so use :meth:`order` to walk the records in ascending order and
+        :meth:`limit` to choose the page size. An example::
+
+            from stellar_sdk import Server
+
+            server = Server("https://horizon-testnet.stellar.org")
+            payments = server.payments().for_account(account_id).order(desc=False).limit(200)
+            for payment in payments.iter_records(prefetch=2, checkpoint=save_cursor):
+                process(payment)
+
+        See `Pagination <https://developers.stellar.org/docs/data/apis/horizon/api-reference/structure/pagination>`__
+
+        :param prefetch: The maximum number of pages fetched ahead of the page
+            being consumed. With ``0``, each page is requested in the calling
+            thread once the previous one has been consumed.
+        :param checkpoint: A function called with the paging token of the last
+            record of each page, once all the records of the page have been
+            consumed. Resuming from that cursor with :meth:`cursor` does not
+            skip any record.
+        :return: A generator of the records.
+        :raises:
+            | :exc:`ValueError`: if ``prefetch`` is negative.
+            | :exc:`NotPageableError <stellar_sdk.exceptions.NotPageableError>`: if a
+                response is not a page of records.
+            | The exceptions of :meth:`call`, when the page is reached.
+        """
+        if prefetch < 0:
+            raise ValueError(f"prefetch must not be negative, got {prefetch}.")
+        pages = self._pages() if prefetch == 0 else self._prefetch_pages(prefetch)
+        return self._iter_records(pages, checkpoint)
+
+    def _iter_records(
+        self,
+        pages: Generator[list[dict[str, Any]], None, None],
+        checkpoint: Callable[[str], Any] | None,
+    ) -> Generator[dict[str, Any], None, None]:
+        try:
+            for records in pages:
+                yield from records
+                paging_token = records[-1].get("paging_token")
+                if checkpoint is not None and paging_token is not None:
+                    checkpoint(paging_token)
+        finally:
+            pages.close()
+
+    def _pages(self) -> Generator[list[dict[str, Any]], None, None]:
+        url: str | None = urljoin_with_query(self.horizon_url, self.endpoint)
+        params: dict | None = self.params
+        while url is not None:
+            resp = self._call(url, params)
+            records = self._page_records(resp)
+            if not records:
+                return
+            yield records
+            url, params = self._next_page_href(resp), None
+
+    def _prefetch_pages(
+        self, prefetch: int
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        # The thread takes a slot before requesting a page, and the slot is
+        # given back when the page is consumed.
+        slots = threading.Semaphore(prefetch)
+        results: queue.SimpleQueue[list[dict[str, Any]] | Exception | None] = (
+            queue.SimpleQueue()
+        )
+        stop = threading.Event()
+
+        def fetch() -> None:
+            pages = self._pages()
+            try:
+                while True:
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    records = next(pages, None)
+                    results.put(records)
+                    if records is None:
+                        return
+            except Exception as e:
+                results.put(e)
+            finally:
+                pages.close()
+
+        thread = threading.Thread(target=fetch, daemon=True)
+        thread.start()
+        try:
+            while True:
+                result = results.get()
+                if result is None:
+                    return
+                if isinstance(result, Exception):
+                    raise result
+                slots.release()
+                yield result
+        finally:
+            # The thread is not joined, so closing the iterator does not wait
+            # for a page being fetched: the thread stops once it is received.
+            stop.set()
+
     def next(self) -> dict[str, Any]:
         if self.next_href is None:
             raise NotPageableError("The next page does not exist.")
@@ -0,0 +1,176 @@
+import contextlib
+import queue
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .base_channel_pool import BaseChannelPool, ChannelAccount, _is_bad_sequence
+from .base_transaction_envelope import _to_keypairs
+from .exceptions import BadRequestError
+from .keypair import Keypair
+from .transaction_envelope import TransactionEnvelope
+
+if TYPE_CHECKING:
+    from .server import Server
+
+__all__ = ["ChannelPool"]
+
+
+class ChannelPool(BaseChannelPool):
+    """The :class:`ChannelPool` object, which submits transactions concurrently
+    from a pool of channel accounts.
+
+    The sequence number of an account can only be used by one transaction at
+    a time, so transactions with the same source account must be submitted
+    one after another. A channel pool spreads the transactions over several
+    channel accounts instead: each transaction is built with a channel
+    account as its source account, which is leased to one thread at a time,
+    while the operations can use any source account, such as the account
+    holding the funds.
+
+    The channel accounts are loaded from Horizon when they are first leased,
+    and their sequence numbers are then tracked locally. A channel account is
+    loaded again after a lease ends with an error, such as a transaction
+    rejected with ``tx_bad_seq``, or a timeout which leaves the sequence
+    number of the account unknown.
+
+    When a fee source is given, each transaction is wrapped in a fee bump
+    transaction paid by the fee source, so the channel accounts only need the
+    minimum balance.
+
+    This class is thread-safe.
+
+    An example::
+
+        from stellar_sdk import Asset, ChannelPool, Keypair, Network, Server, TransactionBuilder
+
+        server = Server("https://horizon-testnet.stellar.org")
+        funder = Keypair.from_secret("SBFZCHU5645DOKRWYBXVOXY2ELGJKFRX6VGGPRYUWHQ7PMXXJNDZFMKD")
+        channels = [Keypair.from_secret(secret) for secret in channel_secrets]
+        pool = ChannelPool(server, channels, Network.TESTNET_NETWORK_PASSPHRASE, fee_source=funder)
+
+        def build(channel):
+            return (
+                TransactionBuilder(channel.account, Network.TESTNET_NETWORK_PASSPHRASE)
+                .append_payment_op(destination, Asset.native(), "10", source=funder.public_key)
+                .set_timeout(30)
+                .build()
+            )
+
+        response = pool.submit_transaction(build, signers=[funder])
+
+    :param server: The server to load the channel accounts from and submit
+        the transactions to.
+    :param channels: The keypairs or secrets of the channel accounts.
+    :param network_passphrase: The network to connect to for verifying and
+        retrieving additional attributes from.
+    :param fee_source: The keypair or secret of the account paying the fees,
+        if the transactions should be wrapped in fee bump transactions.
+    :param base_fee: The base fee of the fee bump transactions, in stroops.
+    :raises: :exc:`ValueError`: if no channel account is given.
+    """
+
+    def __init__(
+        self,
+        server: "Server",
+        channels: Iterable[Keypair | str],
+        network_passphrase: str,
+        fee_source: Keypair | str | None = None,
+        base_fee: int = 100,
+    ) -> None:
+        super().__init__(channels, network_passphrase, fee_source, base_fee)
+        self.server: Server = server
+        self._idle: queue.Queue[ChannelAccount] = queue.Queue()
+        for channel in self._channels:
+            self._idle.put(channel)
+
+    @property
+    def available(self) -> int:
+        """The number of channel accounts which are not leased."""
+        return self._idle.qsize()
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[ChannelAccount]:
+        """Lease a channel account, waiting until one is available.
+
+        The channel account is returned to the pool when the ``with`` block
+        exits, and is loaded again on its next lease if the block raised an
+        exception. Build at most one transaction with it in the block,
+        :class:`TransactionBuilder <stellar_sdk.transaction_builder.TransactionBuilder>`
+        increments its sequence number.
+
+        :param timeout: The number of seconds to wait for a channel account,
+            by default wait forever.
+        :return: A context manager yielding the leased :class:`ChannelAccount`.
+        :raises: :exc:`TimeoutError`: if no channel account became available
+            within the timeout.
+        """
+        try:
+            channel = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No channel account became available within {timeout} seconds."
+            ) from None
+        try:
+            if channel._account is None:
+                channel._account = self.server.load_account(channel.keypair)
+            yield channel
+        except BaseException:
+            channel._account = None
+            raise
+        finally:
+            self._idle.put(channel)
+
+    def submit_transaction(
+        self,
+        build: Callable[[ChannelAccount], TransactionEnvelope],
+        signers: Iterable[Keypair | str] = (),
+        skip_memo_required_check: bool = False,
+        max_attempts: int = 3,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Build a transaction with a leased channel account, sign it and
+        submit it.
+
+        The transaction is signed by the channel account, the given signers
+        and, if the pool has a fee source, wrapped in a fee bump transaction
+        signed by the fee source. If it is rejected with ``tx_bad_seq``, the
+        channel account is loaded again and ``build`` is called again with the
+        next available channel account.
+
+        :param build: A function building the transaction from the leased
+            :class:`ChannelAccount`, with :attr:`ChannelAccount.account` as
+            its source account.
+        :param signers: The keypairs or secrets of the other signers of the
+            transaction, such as the source accounts of the operations.
+        :param skip_memo_required_check: Allow skipping memo
+        :param max_attempts: The maximum number of times to build and submit
+            the transaction.
+        :param timeout: The number of seconds to wait for a channel account,
+            by default wait forever.
+        :return: the response from server
+        :raises:
+            :exc:`TimeoutError <TimeoutError>`: if no channel account became
+            available within the timeout.
+            :exc:`BadRequestError <stellar_sdk.exceptions.BadRequestError>`: if
+            the transaction failed, or was rejected with ``tx_bad_seq``
+            ``max_attempts`` times.
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be positive, got {max_attempts}.")
+        # The signers are used again when the transaction is built again.
+        keypairs = _to_keypairs(signers)
+        attempt = 1
+        while True:
+            with self.lease(timeout) as channel:
+                transaction_envelope = build(channel)
+                transaction_envelope.sign_many(keypairs)
+                try:
+                    return self.server.submit_transaction(
+                        self._prepare(channel, transaction_envelope),
+                        skip_memo_required_check,
+                    )
+                except BadRequestError as e:
+                    if attempt == max_attempts or not _is_bad_sequence(e):
+                        raise
+                    channel._account = None
+            attempt += 1
@@ -0,0 +1,166 @@
+import asyncio
+import contextlib
+import inspect
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .base_channel_pool import BaseChannelPool, ChannelAccount, _is_bad_sequence
+from .base_transaction_envelope import _to_keypairs
+from .exceptions import BadRequestError
+from .keypair import Keypair
+from .transaction_envelope import TransactionEnvelope
+
+if TYPE_CHECKING:
+    from .server_async import ServerAsync
+
+__all__ = ["ChannelPoolAsync"]
+
+
+class ChannelPoolAsync(BaseChannelPool):
+    """The :class:`ChannelPoolAsync` object, which submits transactions
+    concurrently from a pool of channel accounts.
+
+    This is the asyncio version of :class:`ChannelPool
+    <stellar_sdk.channel_pool.ChannelPool>`, see it for details. It is safe
+    to use from many tasks of the same event loop, but not from several
+    threads.
+
+    An example::
+
+        import asyncio
+        from stellar_sdk import ChannelPoolAsync, Network, ServerAsync, TransactionBuilder
+
+        async def main():
+            async with ServerAsync("https://horizon-testnet.stellar.org") as server:
+                pool = ChannelPoolAsync(
+                    server, channel_secrets, Network.TESTNET_NETWORK_PASSPHRASE, fee_source=funder
+                )
+                await asyncio.gather(
+                    *(pool.submit_transaction(build, signers=[funder]) for build in builds)
+                )
+
+        asyncio.run(main())
+
+    :param server: The server to load the channel accounts from and submit
+        the transactions to.
+    :param channels: The keypairs or secrets of the channel accounts.
+    :param network_passphrase: The network to connect to for verifying and
+        retrieving additional attributes from.
+    :param fee_source: The keypair or secret of the account paying the fees,
+        if the transactions should be wrapped in fee bump transactions.
+    :param base_fee: The base fee of the fee bump transactions, in stroops.
+    :raises: :exc:`ValueError`: if no channel account is given.
+    """
+
+    def __init__(
+        self,
+        server: "ServerAsync",
+        channels: Iterable[Keypair | str],
+        network_passphrase: str,
+        fee_source: Keypair | str | None = None,
+        base_fee: int = 100,
+    ) -> None:
+        super().__init__(channels, network_passphrase, fee_source, base_fee)
+        self.server: ServerAsync = server
+        self._idle: asyncio.Queue[ChannelAccount] = asyncio.Queue()
+        for channel in self._channels:
+            self._idle.put_nowait(channel)
+
+    @property
+    def available(self) -> int:
+        """The number of channel accounts which are not leased."""
+        return self._idle.qsize()
+
+    @contextlib.asynccontextmanager
+    async def lease(
+        self, timeout: float | None = None
+    ) -> AsyncIterator[ChannelAccount]:
+        """Lease a channel account, waiting until one is available.
+
+        The channel account is returned to the pool when the ``async with``
+        block exits, and is loaded again on its next lease if the block raised
+        an exception. Build at most one transaction with it in the block,
+        :class:`TransactionBuilder <stellar_sdk.transaction_builder.TransactionBuilder>`
+        increments its sequence number.
+
+        :param timeout: The number of seconds to wait for a channel account,
+            by default wait forever.
+        :return: An async context manager yielding the leased
+            :class:`ChannelAccount`.
+        :raises: :exc:`TimeoutError`: if no channel account became available
+            within the timeout.
+        """
+        try:
+            channel = await asyncio.wait_for(self._idle.get(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"No channel account became available within {timeout} seconds."
+            ) from None
+        try:
+            if channel._account is None:
+                channel._account = await self.server.load_account(channel.keypair)
+            yield channel
+        except BaseException:
+            channel._account = None
+            raise
+        finally:
+            self._idle.put_nowait(channel)
+
+    async def submit_transaction(
+        self,
+        build: Callable[
+            [ChannelAccount], TransactionEnvelope | Awaitable[TransactionEnvelope]
+        ],
+        signers: Iterable[Keypair | str] = (),
+        skip_memo_required_check: bool = False,
+        max_attempts: int = 3,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Build a transaction with a leased channel account, sign it and
+        submit it.
+
+        The transaction is signed by the channel account, the given signers
+        and, if the pool has a fee source, wrapped in a fee bump transaction
+        signed by the fee source. If it is rejected with ``tx_bad_seq``, the
+        channel account is loaded again and ``build`` is called again with the
+        next available channel account.
+
+        :param build: A function or coroutine function building the
+            transaction from the leased :class:`ChannelAccount`, with
+            :attr:`ChannelAccount.account` as its source account.
+        :param signers: The keypairs or secrets of the other signers of the
+            transaction, such as the source accounts of the operations.
+        :param skip_memo_required_check: Allow skipping memo
+        :param max_attempts: The maximum number of times to build and submit
+            the transaction.
+        :param timeout: The number of seconds to wait for a channel account,
+            by default wait forever.
+        :return: the response from server
+        :raises:
+            :exc:`TimeoutError <TimeoutError>`: if no channel account became
+            available within the timeout.
+            :exc:`BadRequestError <stellar_sdk.exceptions.BadRequestError>`: if
+            the transaction failed, or was rejected with ``tx_bad_seq``
+            ``max_attempts`` times.
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be positive, got {max_attempts}.")
+        # The signers are used again when the transaction is built again.
+        keypairs = _to_keypairs(signers)
+        attempt = 1
+        while True:
+            async with self.lease(timeout) as channel:
+                transaction_envelope = build(channel)
+                if inspect.isawaitable(transaction_envelope):
+                    transaction_envelope = await transaction_envelope
+                transaction_envelope.sign_many(keypairs)
+                try:
+                    return await self.server.submit_transaction(
+                        self._prepare(channel, transaction_envelope),
+                        skip_memo_required_check,
+                    )
+                except BadRequestError as e:
+                    if attempt == max_attempts or not _is_bad_sequence(e):
+                        raise
+                    channel._account = None
+            attempt += 1
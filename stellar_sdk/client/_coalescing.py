@@ -0,0 +1,135 @@
+"""Single-flight coalescing of identical GET requests, shared by the HTTP
+clients."""
+
+import asyncio
+import re
+import threading
+from collections.abc import Awaitable, Callable, Iterable
+from urllib.parse import urlsplit
+
+from .response import Response
+from .response_cache import _cache_key
+
+_Key = tuple[str, int | None]
+
+
+class _Coalescer:
+    def __init__(self, exclude: Iterable[str] = ()) -> None:
+        self.exclude: list[re.Pattern[str]] = [re.compile(p) for p in exclude]
+
+    def _key(
+        self, url: str, params: dict[str, str] | None, max_content_size: int | None
+    ) -> _Key | None:
+        path = urlsplit(url).path
+        if any(pattern.search(path) for pattern in self.exclude):
+            return None
+        return _cache_key(url, params), max_content_size
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} [exclude={[p.pattern for p in self.exclude]}]>"
+        )
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Response | None = None
+        self.error: BaseException | None = None
+
+
+class SyncCoalescer(_Coalescer):
+    """Runs one request at a time for each url, params and content size
+    limit, and hands its response or exception to all the threads which
+    asked for it while it was in flight."""
+
+    def __init__(self, exclude: Iterable[str] = ()) -> None:
+        super().__init__(exclude)
+        self._flights: dict[_Key, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        get: Callable[[str, dict[str, str] | None, int | None], Response],
+        url: str,
+        params: dict[str, str] | None,
+        max_content_size: int | None,
+    ) -> Response:
+        key = self._key(url, params, max_content_size)
+        if key is None:
+            return get(url, params, max_content_size)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.response is not None
+            return flight.response
+        try:
+            flight.response = get(url, params, max_content_size)
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class _AsyncFlight:
+    def __init__(self, task: "asyncio.Task[Response]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncCoalescer(_Coalescer):
+    """Runs one request at a time for each url, params and content size
+    limit in a task, which all the coroutines asking for it while it is in
+    flight await. The task is cancelled when all of them are cancelled."""
+
+    def __init__(self, exclude: Iterable[str] = ()) -> None:
+        super().__init__(exclude)
+        self._flights: dict[_Key, _AsyncFlight] = {}
+
+    async def get(
+        self,
+        get: Callable[[str, dict[str, str] | None, int | None], Awaitable[Response]],
+        url: str,
+        params: dict[str, str] | None,
+        max_content_size: int | None,
+    ) -> Response:
+        key = self._key(url, params, max_content_size)
+        if key is None:
+            return await get(url, params, max_content_size)
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _AsyncFlight(
+                asyncio.ensure_future(get(url, params, max_content_size))
+            )
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._land(key, task))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                # The next request must not wait for the cancelled one.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _land(self, key: _Key, task: "asyncio.Task[Response]") -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Marks the exception as retrieved when all the waiters are gone.
+            task.exception()
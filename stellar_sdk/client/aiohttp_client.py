@@ -2,7 +2,7 @@
 import asyncio
 import json
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from typing import Any
 
 from ..__version__ import __version__
@@ -12,7 +12,9 @@ from ..exceptions import (
     StreamClientError,
 )
 from . import defines
+from ._coalescing import AsyncCoalescer
 from .base_async_client import BaseAsyncClient
+from .rate_limiter import RateLimiter, RequestPriority
 from .response import Response
 
 logger = logging.getLogger(__name__)
@@ -81,6 +83,15 @@ class AiohttpClient(BaseAsyncClient):
     :param backoff_factor: a backoff factor to apply between attempts after the second try
     :param user_agent: the server can use it to identify you
     :param custom_headers: any additional HTTP headers to add in requests
+    :param coalesce: share one request between the identical GET requests
+        (same url, params and content size limit) made while it is in flight,
+        such as loading the same account from many coroutines at once
+    :param coalesce_exclude: regular expressions matched against the path of
+        the request url, whose GET requests are never shared
+    :param rate_limiter: pace the requests by the rate limit Horizon reports,
+        sending transaction submissions before reads and retrying the ``429``
+        responses up to three times, see
+        :class:`RateLimiter <stellar_sdk.client.rate_limiter.RateLimiter>`
     """
 
     def __init__(
@@ -91,6 +102,9 @@ class AiohttpClient(BaseAsyncClient):
         backoff_factor: float | None = DEFAULT_BACKOFF_FACTOR,
         user_agent: str | None = None,
         custom_headers: dict[str, str] | None = None,
+        coalesce: bool = False,
+        coalesce_exclude: Iterable[str] = (),
+        rate_limiter: RateLimiter | None = None,
         **kwargs,
     ) -> None:
         if not _AIOHTTP_DEPS_INSTALLED:
@@ -117,6 +131,10 @@ class AiohttpClient(BaseAsyncClient):
 
         self._session: aiohttp.ClientSession | None = None
         self._sse_session: aiohttp.ClientSession | None = None
+        self._coalescer: AsyncCoalescer | None = (
+            AsyncCoalescer(coalesce_exclude) if coalesce else None
+        )
+        self.rate_limiter: RateLimiter | None = rate_limiter
 
     async def get(
         self,
@@ -135,6 +153,27 @@ class AiohttpClient(BaseAsyncClient):
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         :raise: :exc:`ContentSizeLimitExceededError <stellar_sdk.exceptions.ContentSizeLimitExceededError>`
         """
+        if self._coalescer is not None:
+            return await self._coalescer.get(self._get, url, params, max_content_size)
+        return await self._get(url, params, max_content_size)
+
+    async def _get(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        max_content_size: int | None,
+    ) -> Response:
+        return await self._limit(
+            RequestPriority.READ,
+            lambda: self._send_get(url, params, max_content_size),
+        )
+
+    async def _send_get(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        max_content_size: int | None,
+    ) -> Response:
         await self.__init_session()
         assert self._session is not None
         try:
@@ -152,6 +191,19 @@ class AiohttpClient(BaseAsyncClient):
         except aiohttp.ClientError as e:  # TODO: need more research
             raise ConnectionError(e) from e
 
+    async def _limit(
+        self, priority: RequestPriority, send: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        if self.rate_limiter is None:
+            return await send()
+        for _ in range(DEFAULT_NUM_RETRIES + 1):
+            await self.rate_limiter.acquire_async(priority)
+            response = await send()
+            self.rate_limiter.update(response.status_code, response.headers)
+            if response.status_code != 429:
+                break
+        return response
+
     async def _read_with_limit(
         self, response: "aiohttp.ClientResponse", max_content_size: int
     ) -> str:
@@ -186,6 +238,16 @@ class AiohttpClient(BaseAsyncClient):
         :return: the response from server
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         """
+        return await self._limit(
+            RequestPriority.SUBMIT, lambda: self._send_post(url, data, json_data)
+        )
+
+    async def _send_post(
+        self,
+        url: str,
+        data: dict[str, str] | None,
+        json_data: dict[str, Any] | None,
+    ) -> Response:
         await self.__init_session()
         assert self._session is not None
         try:
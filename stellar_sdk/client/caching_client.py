@@ -0,0 +1,136 @@
+from collections.abc import Generator
+from typing import Any
+
+from .base_sync_client import BaseSyncClient
+from .response import Response
+from .response_cache import MemoryResponseCache, ResponseCache, _cache_key, _cache_ttl
+
+__all__ = ["CachingClient"]
+
+
+class CachingClient(BaseSyncClient):
+    """The :class:`CachingClient` object, which wraps a synchronous http
+    client and answers GET requests from a cache of earlier responses.
+
+    A successful response is stored:
+
+    * until it is removed from the cache, or for ``immutable_ttl`` seconds, if
+      it is a Horizon resource which never changes once it is returned: a
+      ledger, a transaction or an operation, the operations, payments and
+      effects of a transaction, the effects of an operation, and the non-empty
+      pages of the transactions, operations, payments and effects of a ledger;
+    * for the ``max-age`` of its ``Cache-Control`` header otherwise, or for
+      ``default_ttl`` seconds without one.
+
+    Responses whose ``Cache-Control`` header is ``no-store`` or ``no-cache``
+    bypass the cache: they are never stored, even for an immutable resource
+    or with a ``max-age``, so every request for them is sent again. ``no-cache``
+    allows storing a response as long as it is revalidated before it is
+    reused, but the wrapped clients cannot send the conditional
+    ``If-None-Match`` requests this needs. POST requests and streams are
+    passed to the wrapped client.
+
+    An example::
+
+        from stellar_sdk import RequestsClient, Server
+        from stellar_sdk.client.caching_client import CachingClient
+        from stellar_sdk.client.response_cache import SQLiteResponseCache
+
+        client = CachingClient(RequestsClient(), SQLiteResponseCache("horizon.sqlite3"))
+        with Server("https://horizon.stellar.org", client) as server:
+            server.transactions().transaction(transaction_hash).call()
+
+    :param client: the client sending the requests
+    :param cache: the cache of the responses, by default a
+        :class:`MemoryResponseCache <stellar_sdk.client.response_cache.MemoryResponseCache>`
+    :param default_ttl: the number of seconds to store the other responses
+        for, by default they are not stored
+    :param immutable_ttl: the number of seconds to store the responses of
+        immutable resources for, by default until they are removed
+    """
+
+    def __init__(
+        self,
+        client: BaseSyncClient,
+        cache: ResponseCache | None = None,
+        default_ttl: float = 0,
+        immutable_ttl: float | None = None,
+    ) -> None:
+        self.client: BaseSyncClient = client
+        self.cache: ResponseCache = MemoryResponseCache() if cache is None else cache
+        self.default_ttl: float = default_ttl
+        self.immutable_ttl: float | None = immutable_ttl
+
+    def get(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        max_content_size: int | None = None,
+    ) -> Response:
+        """Perform HTTP GET request, or return the stored response.
+
+        :param url: the request url
+        :param params: the request params
+        :param max_content_size: the maximum allowed response content size in bytes.
+            If the response exceeds this limit, a :exc:`ContentSizeLimitExceededError` is raised.
+            If None, no limit is applied.
+        :return: the response from server
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        :raise: :exc:`ContentSizeLimitExceededError <stellar_sdk.exceptions.ContentSizeLimitExceededError>`
+        """
+        key = _cache_key(url, params)
+        response = self.cache.get(key)
+        if response is not None and (
+            max_content_size is None or len(response.text) <= max_content_size
+        ):
+            return response
+        response = self.client.get(url, params, max_content_size)
+        ttl = _cache_ttl(url, response, self.default_ttl, self.immutable_ttl)
+        if ttl != 0:
+            self.cache.set(key, response, ttl)
+        return response
+
+    def post(
+        self,
+        url: str,
+        data: dict[str, str] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> Response:
+        """Perform HTTP POST request with the wrapped client.
+
+        :param url: the request url
+        :param data: the data send to server
+        :param json_data: the json data send to server
+        :return: the response from server
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        return self.client.post(url, data, json_data)
+
+    def stream(
+        self, url: str, params: dict[str, str] | None = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """Creates an EventSource with the wrapped client.
+
+        :param url: the request url
+        :param params: the request params
+        :return: a dict Generator for server response
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        return self.client.stream(url, params)
+
+    def close(self) -> None:
+        """Close the wrapped client and the cache."""
+        self.client.close()
+        self.cache.close()
+
+    def __enter__(self) -> "CachingClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self):
+        return (
+            f"<CachingClient [client={self.client}, cache={self.cache}, "
+            f"default_ttl={self.default_ttl}, immutable_ttl={self.immutable_ttl}]>"
+        )
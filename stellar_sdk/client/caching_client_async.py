@@ -0,0 +1,123 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from .base_async_client import BaseAsyncClient
+from .response import Response
+from .response_cache import MemoryResponseCache, ResponseCache, _cache_key, _cache_ttl
+
+__all__ = ["CachingClientAsync"]
+
+
+class CachingClientAsync(BaseAsyncClient):
+    """The :class:`CachingClientAsync` object, which wraps an asynchronous
+    http client and answers GET requests from a cache of earlier responses.
+
+    This is the asyncio version of :class:`CachingClient
+    <stellar_sdk.client.caching_client.CachingClient>`, see it for the
+    responses which are stored. The cache is used from the event loop, so a
+    :class:`SQLiteResponseCache <stellar_sdk.client.response_cache.SQLiteResponseCache>`
+    should be on a local disk.
+
+    An example::
+
+        from stellar_sdk import AiohttpClient, ServerAsync
+        from stellar_sdk.client.caching_client_async import CachingClientAsync
+
+        client = CachingClientAsync(AiohttpClient())
+        async with ServerAsync("https://horizon.stellar.org", client) as server:
+            await server.ledgers().ledger(50_000_000).call()
+
+    :param client: the client sending the requests
+    :param cache: the cache of the responses, by default a
+        :class:`MemoryResponseCache <stellar_sdk.client.response_cache.MemoryResponseCache>`
+    :param default_ttl: the number of seconds to store the other responses
+        for, by default they are not stored
+    :param immutable_ttl: the number of seconds to store the responses of
+        immutable resources for, by default until they are removed
+    """
+
+    def __init__(
+        self,
+        client: BaseAsyncClient,
+        cache: ResponseCache | None = None,
+        default_ttl: float = 0,
+        immutable_ttl: float | None = None,
+    ) -> None:
+        self.client: BaseAsyncClient = client
+        self.cache: ResponseCache = MemoryResponseCache() if cache is None else cache
+        self.default_ttl: float = default_ttl
+        self.immutable_ttl: float | None = immutable_ttl
+
+    async def get(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        max_content_size: int | None = None,
+    ) -> Response:
+        """Perform HTTP GET request, or return the stored response.
+
+        :param url: the request url
+        :param params: the request params
+        :param max_content_size: the maximum allowed response content size in bytes.
+            If the response exceeds this limit, a :exc:`ContentSizeLimitExceededError` is raised.
+            If None, no limit is applied.
+        :return: the response from server
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        :raise: :exc:`ContentSizeLimitExceededError <stellar_sdk.exceptions.ContentSizeLimitExceededError>`
+        """
+        key = _cache_key(url, params)
+        response = self.cache.get(key)
+        if response is not None and (
+            max_content_size is None or len(response.text) <= max_content_size
+        ):
+            return response
+        response = await self.client.get(url, params, max_content_size)
+        ttl = _cache_ttl(url, response, self.default_ttl, self.immutable_ttl)
+        if ttl != 0:
+            self.cache.set(key, response, ttl)
+        return response
+
+    async def post(
+        self,
+        url: str,
+        data: dict[str, str] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> Response:
+        """Perform HTTP POST request with the wrapped client.
+
+        :param url: the request url
+        :param data: the data send to server
+        :param json_data: the json data send to server
+        :return: the response from server
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        return await self.client.post(url, data, json_data)
+
+    def stream(
+        self, url: str, params: dict[str, str] | None = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Creates an EventSource with the wrapped client.
+
+        :param url: the request url
+        :param params: the request params
+        :return: a dict AsyncGenerator for server response
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        return self.client.stream(url, params)
+
+    async def close(self) -> None:
+        """Close the wrapped client and the cache."""
+        await self.client.close()
+        self.cache.close()
+
+    async def __aenter__(self) -> "CachingClientAsync":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def __repr__(self):
+        return (
+            f"<CachingClientAsync [client={self.client}, cache={self.cache}, "
+            f"default_ttl={self.default_ttl}, immutable_ttl={self.immutable_ttl}]>"
+        )
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from enum import IntEnum
+from typing import Any
+
+__all__ = ["RateLimiter", "RequestPriority"]
+
+# The minimum pause between two attempts to send a request.
+_MIN_DELAY = 0.001
+# The pause after a 429 response without Retry-After or X-RateLimit-Reset.
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+class RequestPriority(IntEnum):
+    """The priority of a request paced by a :class:`RateLimiter`."""
+
+    SUBMIT = 0
+    """Transaction submissions, which are sent before any waiting read."""
+    READ = 1
+    """Other requests."""
+
+
+class RateLimiter:
+    """The :class:`RateLimiter` object, which paces the requests of one or
+    more HTTP clients with a token bucket, following the rate limit Horizon
+    reports in the ``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset`` headers of its responses.
+
+    After each response, the requests remaining in the current window are
+    spread evenly over the seconds until the window resets, so the requests
+    are sent at the allowed rate instead of in bursts followed by ``429 Too
+    Many Requests`` responses. The requests sent since are counted against the
+    remaining ones, and once none remain, no request is sent until the window
+    resets, or until the ``Retry-After`` of a ``429`` response. While a
+    transaction submission waits, reads wait too.
+
+    A rate limiter is safe to share between threads, and between the
+    coroutines of one event loop. Pass it to a :class:`RequestsClient
+    <stellar_sdk.client.requests_client.RequestsClient>` or an
+    :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`::
+
+        from stellar_sdk import RequestsClient, Server
+        from stellar_sdk.client.rate_limiter import RateLimiter
+
+        rate_limiter = RateLimiter()
+        server = Server("https://horizon.stellar.org", RequestsClient(rate_limiter=rate_limiter))
+
+    :param rate: the maximum number of requests per second, by default only
+        the rate limit reported by Horizon applies
+    :param burst: the number of requests which can be sent at once after a
+        pause
+    :raises: :exc:`ValueError`: if ``rate`` or ``burst`` is not positive.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 1) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}.")
+        if burst < 1:
+            raise ValueError(f"burst must be positive, got {burst}.")
+        self.max_rate: float | None = rate
+        self.burst: int = burst
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.wait_time: float = 0.0
+        self._horizon_rate: float | None = None
+        self._reset_at: float | None = None
+        self._paused_until: float = 0.0
+        self._tokens: float = burst
+        self._updated: float = time.monotonic()
+        self._waiting: list[int] = [0] * len(RequestPriority)
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float | None:
+        """The number of requests per second currently allowed, ``None`` if
+        there is no limit."""
+        rates = [r for r in (self.max_rate, self._horizon_rate) if r is not None]
+        return min(rates) if rates else None
+
+    def acquire(self, priority: RequestPriority = RequestPriority.READ) -> None:
+        """Wait until a request can be sent.
+
+        :param priority: the priority of the request
+        """
+        start = self._start_waiting(priority)
+        try:
+            while (delay := self._reserve(priority)) > 0:
+                time.sleep(delay)
+        finally:
+            self._stop_waiting(priority, start)
+
+    async def acquire_async(
+        self, priority: RequestPriority = RequestPriority.READ
+    ) -> None:
+        """Wait until a request can be sent, without blocking the event loop.
+
+        :param priority: the priority of the request
+        """
+        start = self._start_waiting(priority)
+        try:
+            while (delay := self._reserve(priority)) > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self._stop_waiting(priority, start)
+
+    def _start_waiting(self, priority: RequestPriority) -> float:
+        with self._lock:
+            self._waiting[priority] += 1
+        return time.monotonic()
+
+    def _stop_waiting(self, priority: RequestPriority, start: float) -> None:
+        with self._lock:
+            self._waiting[priority] -= 1
+            self.wait_time += time.monotonic() - start
+
+    def _reserve(self, priority: RequestPriority) -> float:
+        # Takes a token and returns 0, or returns the number of seconds to
+        # wait before trying again.
+        with self._lock:
+            now = time.monotonic()
+            if self._reset_at is not None and now >= self._reset_at:
+                # A new window has started, with its full limit.
+                self.remaining = self.limit
+                self._reset_at = None
+                self._horizon_rate = None
+            rate = self.rate
+            if rate is not None:
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * rate
+                )
+            self._updated = now
+            if now < self._paused_until:
+                return self._paused_until - now
+            if any(self._waiting[: int(priority)]):
+                return max(_MIN_DELAY, 1 / rate if rate else 0)
+            if self.remaining is not None and self.remaining <= 0:
+                if self._reset_at is None:
+                    return _DEFAULT_RETRY_AFTER
+                return self._reset_at - now
+            if rate is not None:
+                if self._tokens < 1:
+                    return max(_MIN_DELAY, (1 - self._tokens) / rate)
+                self._tokens -= 1
+            if self.remaining is not None:
+                self.remaining -= 1
+            self.requests += 1
+            return 0
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Update the rate limit from a response.
+
+        :param status_code: the status code of the response
+        :param headers: the headers of the response
+        """
+        values = {name.lower(): value for name, value in headers.items()}
+        limit = _parse_number(values.get("x-ratelimit-limit"))
+        remaining = _parse_number(values.get("x-ratelimit-remaining"))
+        reset = _parse_number(values.get("x-ratelimit-reset"))
+        retry_after = _parse_number(values.get("retry-after"))
+        with self._lock:
+            now = time.monotonic()
+            if limit is not None:
+                self.limit = int(limit)
+            if remaining is not None and reset is not None:
+                reset_at = now + reset
+                if (
+                    self.remaining is not None
+                    and self._reset_at is not None
+                    and abs(reset_at - self._reset_at) <= 1
+                ):
+                    # The requests sent since this one are not counted yet.
+                    remaining = min(remaining, self.remaining)
+                self.remaining = int(remaining)
+                self._reset_at = reset_at
+                # Horizon rounds the seconds until the reset up, the remaining
+                # requests can be sent at once in the last one.
+                self._horizon_rate = remaining / (reset - 1) if reset > 1 else None
+            if status_code == 429:
+                self.throttled += 1
+                if retry_after is None:
+                    retry_after = reset if reset else _DEFAULT_RETRY_AFTER
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self._tokens = 0
+
+    def metrics(self) -> dict[str, Any]:
+        """The counters and the current state of the rate limiter.
+
+        :return: a dict with ``requests``, the number of requests sent;
+            ``throttled``, the number of ``429`` responses; ``wait_time``, the
+            total number of seconds the requests waited; ``rate``, the
+            requests per second currently allowed; ``limit``, ``remaining``
+            and ``reset``, the rate limit reported by Horizon, with the number
+            of seconds until its window resets; and ``waiting``, the number of
+            requests waiting by priority.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "wait_time": self.wait_time,
+                "rate": self.rate,
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset": (
+                    None if self._reset_at is None else max(0.0, self._reset_at - now)
+                ),
+                "waiting": {
+                    priority.name.lower(): self._waiting[priority]
+                    for priority in RequestPriority
+                },
+            }
+
+    def __repr__(self):
+        return (
+            f"<RateLimiter [rate={self.rate}, burst={self.burst}, "
+            f"limit={self.limit}, remaining={self.remaining}]>"
+        )
+
+
+def _parse_number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
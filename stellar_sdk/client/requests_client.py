@@ -1,7 +1,7 @@
 import json
 import logging
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from typing import Any
 
 import requests
@@ -20,6 +20,8 @@ from ..exceptions import (
     StreamClientError,
 )
 from . import defines
+from ._coalescing import SyncCoalescer
+from .rate_limiter import RateLimiter, RequestPriority
 
 DEFAULT_NUM_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
@@ -34,6 +36,12 @@ logger = logging.getLogger(__name__)
 __all__ = ["RequestsClient"]
 
 
+class _RateLimitedRetry(Retry):
+    # The 429 responses are retried by RequestsClient._limit instead, so that
+    # the rate limiter sees them and pauses.
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES - {429}
+
+
 class RequestsClient(BaseSyncClient):
     """The :class:`RequestsClient` object is a synchronous http client,
     which represents the interface for making requests to a server instance.
@@ -46,6 +54,15 @@ class RequestsClient(BaseSyncClient):
     :param session: the request session
     :param stream_session: the stream request session
     :param custom_headers: any additional HTTP headers to add in requests
+    :param coalesce: share one request between the identical GET requests
+        (same url, params and content size limit) made while it is in flight,
+        such as loading the same account from many threads at once
+    :param coalesce_exclude: regular expressions matched against the path of
+        the request url, whose GET requests are never shared
+    :param rate_limiter: pace the requests by the rate limit Horizon reports,
+        sending transaction submissions before reads and retrying the ``429``
+        responses up to ``num_retries`` times, see
+        :class:`RateLimiter <stellar_sdk.client.rate_limiter.RateLimiter>`
     """
 
     def __init__(
@@ -58,6 +75,9 @@ class RequestsClient(BaseSyncClient):
         session: Session | None = None,
         stream_session: Session | None = None,
         custom_headers: dict[str, str] | None = None,
+        coalesce: bool = False,
+        coalesce_exclude: Iterable[str] = (),
+        rate_limiter: RateLimiter | None = None,
     ):
         self.pool_size: int = pool_size
         self.num_retries: int = num_retries
@@ -65,13 +85,14 @@ class RequestsClient(BaseSyncClient):
         self.post_timeout: float = post_timeout
         self.backoff_factor: float = backoff_factor
 
+        retry_class = Retry if rate_limiter is None else _RateLimitedRetry
         # adding 504 to the tuple of statuses to retry
-        self.status_forcelist = (*Retry.RETRY_AFTER_STATUS_CODES, 504)
+        self.status_forcelist = (*retry_class.RETRY_AFTER_STATUS_CODES, 504)
 
         # configure standard session
 
         # configure retry handler
-        retry = Retry(
+        retry = retry_class(
             total=self.num_retries,
             backoff_factor=self.backoff_factor,
             redirect=0,
@@ -102,6 +123,10 @@ class RequestsClient(BaseSyncClient):
             session.mount("https://", adapter)
         self._session: Session = session
         self._stream_session: Session | None = stream_session
+        self._coalescer: SyncCoalescer | None = (
+            SyncCoalescer(coalesce_exclude) if coalesce else None
+        )
+        self.rate_limiter: RateLimiter | None = rate_limiter
 
     def get(
         self,
@@ -120,6 +145,27 @@ class RequestsClient(BaseSyncClient):
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         :raise: :exc:`ContentSizeLimitExceededError <stellar_sdk.exceptions.ContentSizeLimitExceededError>`
         """
+        if self._coalescer is not None:
+            return self._coalescer.get(self._get, url, params, max_content_size)
+        return self._get(url, params, max_content_size)
+
+    def _get(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        max_content_size: int | None,
+    ) -> Response:
+        return self._limit(
+            RequestPriority.READ,
+            lambda: self._send_get(url, params, max_content_size),
+        )
+
+    def _send_get(
+        self,
+        url: str,
+        params: dict[str, str] | None,
+        max_content_size: int | None,
+    ) -> Response:
         try:
             resp = self._session.get(
                 url,
@@ -141,6 +187,21 @@ class RequestsClient(BaseSyncClient):
             url=resp.url,
         )
 
+    def _limit(
+        self, priority: RequestPriority, send: Callable[[], Response]
+    ) -> Response:
+        # Without a rate limiter, the session retries 429 responses itself,
+        # after their Retry-After.
+        if self.rate_limiter is None:
+            return send()
+        for _ in range(self.num_retries + 1):
+            self.rate_limiter.acquire(priority)
+            response = send()
+            self.rate_limiter.update(response.status_code, response.headers)
+            if response.status_code != 429:
+                break
+        return response
+
     def _read_with_limit(self, resp: requests.Response, max_content_size: int) -> str:
         """Read response content with size limit using streaming."""
         chunks = []
@@ -173,6 +234,16 @@ class RequestsClient(BaseSyncClient):
         :return: the response from server
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         """
+        return self._limit(
+            RequestPriority.SUBMIT, lambda: self._send_post(url, data, json_data)
+        )
+
+    def _send_post(
+        self,
+        url: str,
+        data: dict[str, str] | None,
+        json_data: dict[str, Any] | None,
+    ) -> Response:
         try:
             resp = self._session.post(
                 url, data=data, json=json_data, timeout=self.post_timeout
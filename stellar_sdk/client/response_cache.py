@@ -0,0 +1,222 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from os import PathLike
+from urllib.parse import urlencode, urlsplit
+
+from .response import Response
+
+__all__ = ["MemoryResponseCache", "ResponseCache", "SQLiteResponseCache"]
+
+# The Horizon resources which never change once they have been returned: a
+# ledger is only returned once it is closed, and so are its transactions and
+# operations.
+_IMMUTABLE_PATHS = re.compile(
+    r"/(?:"
+    r"ledgers/\d+|"
+    r"transactions/[0-9a-fA-F]{64}(?:/(?:operations|payments|effects))?|"
+    r"operations/\d+(?:/effects)?"
+    r")/?$"
+)
+# The records of a ledger, which are only complete once the ledger is closed.
+_LEDGER_RECORDS_PATHS = re.compile(
+    r"/ledgers/\d+/(?:transactions|operations|payments|effects)/?$"
+)
+_MAX_AGE = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+class ResponseCache(metaclass=ABCMeta):
+    """This is an abstract class, and if you want to store the responses of
+    a :class:`CachingClient <stellar_sdk.client.caching_client.CachingClient>`
+    elsewhere, you **must** implement this class.
+
+    The implementations must be safe to use from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Response | None:
+        """Get a response which has not expired.
+
+        :param key: the request url, with its params
+        :return: the response, or ``None`` if there is none
+        """
+
+    @abstractmethod
+    def set(self, key: str, response: Response, ttl: float | None) -> None:
+        """Store a response.
+
+        :param key: the request url, with its params
+        :param response: the response to store
+        :param ttl: the number of seconds the response is valid for, ``None``
+            if it never expires
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the responses."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the resources of the cache."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """The :class:`MemoryResponseCache` object, which keeps the most recently
+    used responses in memory.
+
+    :param max_entries: the maximum number of responses kept, the least
+        recently used ones are removed first
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}.")
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, tuple[Response, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Response | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: Response, ttl: float | None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (response, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<MemoryResponseCache [max_entries={self.max_entries}]>"
+
+
+class SQLiteResponseCache(ResponseCache):
+    """The :class:`SQLiteResponseCache` object, which stores the responses in
+    a SQLite database, so that they are shared by several processes and kept
+    across runs.
+
+    :param path: the path of the database file, which is created if it does
+        not exist
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self.path: str | PathLike[str] = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, status_code INTEGER, text TEXT, "
+                "headers TEXT, url TEXT, expires REAL)"
+            )
+
+    def get(self, key: str) -> Response | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, text, headers, url, expires FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            status_code, text, headers, url, expires = row
+            if expires is not None and expires <= time.time():
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE key = ?", (key,)
+                    )
+                return None
+        return Response(status_code, text, json.loads(headers), url)
+
+    def set(self, key: str, response: Response, ttl: float | None) -> None:
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    response.text,
+                    json.dumps(response.headers),
+                    response.url,
+                    expires,
+                ),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __repr__(self):
+        return f"<SQLiteResponseCache [path={self.path}]>"
+
+
+def _cache_key(url: str, params: dict[str, str] | None) -> str:
+    if not params:
+        return url
+    separator = "&" if urlsplit(url).query else "?"
+    return f"{url}{separator}{urlencode(sorted(params.items()))}"
+
+
+def _cache_ttl(
+    url: str,
+    response: Response,
+    default_ttl: float,
+    immutable_ttl: float | None,
+) -> float | None:
+    """Returns the number of seconds to keep the response for, ``None`` to
+    keep it until it is removed, or ``0`` not to keep it."""
+    if response.status_code != 200:
+        return 0
+    cache_control = ""
+    for name, value in response.headers.items():
+        if name.lower() == "cache-control":
+            cache_control = value.lower()
+            break
+    # A no-cache response may only be reused after revalidating it, which
+    # the wrapped clients cannot do, so it is not stored either.
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    path = urlsplit(url).path
+    if _IMMUTABLE_PATHS.search(path):
+        return immutable_ttl
+    if _LEDGER_RECORDS_PATHS.search(path):
+        # Horizon may list the records of a ledger it has not ingested yet
+        # as an empty page.
+        try:
+            records = response.json()["_embedded"]["records"]
+        except (ValueError, KeyError, TypeError):
+            records = None
+        if records:
+            return immutable_ttl
+    max_age = _MAX_AGE.search(cache_control)
+    if max_age is not None:
+        return int(max_age.group(1))
+    return default_ttl
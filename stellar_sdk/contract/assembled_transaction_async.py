@@ -407,20 +407,23 @@ class AssembledTransactionAsync(Generic[T]):
         assert isinstance(op, InvokeHostFunction)
 
         signed_any = False
-        for i, e in enumerate(op.auth):
+        # Assign the list back so the operation's memoized XDR is rebuilt.
+        auth = list(op.auth)
+        for i, e in enumerate(auth):
             addr_auth = _get_address_credentials(e.credentials)
             if addr_auth is None:
                 continue
             entry_address = Address.from_xdr_sc_address(addr_auth.address).address
             if entry_address != target_address.address:
                 continue
-            op.auth[i] = authorize_entry(
+            auth[i] = authorize_entry(
                 e,
                 signer,
                 valid_until_ledger_sequence,
                 self.built_transaction.network_passphrase,
             )
             signed_any = True
+        op.auth = auth
 
         if signed_any and self._authorization_requires_preparation(target_address):
             self._mark_needs_preparation(
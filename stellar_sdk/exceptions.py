@@ -1,5 +1,6 @@
 import contextlib
 from json import JSONDecodeError
+from typing import TYPE_CHECKING
 
 from .client.response import Response
 
@@ -34,7 +35,8 @@ __all__ = [
     "UnknownRequestError",
 ]
 
-from .soroban_rpc import SimulateTransactionResponse
+if TYPE_CHECKING:
+    from .soroban_rpc import SimulateTransactionResponse
 
 
 class SdkError(Exception):
@@ -187,7 +189,7 @@ class PrepareTransactionException(SdkError):
     """The exception is thrown when trying to prepare a transaction."""
 
     def __init__(
-        self, message: str, simulate_transaction_response: SimulateTransactionResponse
+        self, message: str, simulate_transaction_response: "SimulateTransactionResponse"
     ) -> None:
         super().__init__(message)
         self.message = message
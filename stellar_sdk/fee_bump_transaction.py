@@ -1,3 +1,5 @@
+from xdrlib3 import Packer
+
 from . import xdr as stellar_xdr
 from .keypair import Keypair
 from .muxed_account import MuxedAccount
@@ -58,14 +60,36 @@ class FeeBumpTransaction:
             ext=ext,
         )
 
+    def _xdr_bytes(self) -> bytes:
+        # Packed around the memoized encoding of the inner transaction, so
+        # only the fee source, the fee and the inner signatures are encoded.
+        packer = Packer()
+        self.fee_source.to_xdr_object().pack(packer)
+        stellar_xdr.Int64(self.fee).pack(packer)
+        stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX.pack(packer)
+        head = packer.get_buffer()
+        packer = Packer()
+        stellar_xdr.FeeBumpTransactionExt(0).pack(packer)
+        return (
+            head
+            + self.inner_transaction_envelope._body_xdr_bytes()
+            + packer.get_buffer()
+        )
+
     @classmethod
     def from_xdr_object(
-        cls, xdr_object: stellar_xdr.FeeBumpTransaction, network_passphrase: str
+        cls,
+        xdr_object: stellar_xdr.FeeBumpTransaction,
+        network_passphrase: str,
+        lazy: bool = False,
     ) -> "FeeBumpTransaction":
         """Create a new :class:`FeeBumpTransaction` from an XDR object.
 
         :param xdr_object: The XDR object that represents a fee bump transaction.
         :param network_passphrase: The network to connect to for verifying and retrieving additional attributes from.
+        :param lazy: Create the operations of the inner transaction when they
+            are accessed, see :meth:`Transaction.from_xdr_object
+            <stellar_sdk.transaction.Transaction.from_xdr_object>`.
 
         :return: A new :class:`FeeBumpTransaction` object from the given XDR Transaction object.
         """
@@ -74,7 +98,7 @@ class FeeBumpTransaction:
             type=stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX, v1=xdr_object.inner_tx.v1
         )
         inner_transaction_envelope = TransactionEnvelope.from_xdr_object(
-            te, network_passphrase
+            te, network_passphrase, lazy
         )
         tx = cls(
             fee_source=source,
@@ -84,16 +108,21 @@ class FeeBumpTransaction:
         return tx
 
     @classmethod
-    def from_xdr(cls, xdr: str, network_passphrase: str) -> "FeeBumpTransaction":
+    def from_xdr(
+        cls, xdr: str, network_passphrase: str, lazy: bool = False
+    ) -> "FeeBumpTransaction":
         """Create a new :class:`FeeBumpTransaction` from an XDR string.
 
         :param xdr: The XDR string that represents a transaction.
         :param network_passphrase: The network to connect to for verifying and retrieving additional attributes from.
+        :param lazy: Create the operations of the inner transaction when they
+            are accessed, see :meth:`Transaction.from_xdr_object
+            <stellar_sdk.transaction.Transaction.from_xdr_object>`.
 
         :return: A new :class:`FeeBumpTransaction` object from the given XDR FeeBumpTransaction base64 string object.
         """
         xdr_object = stellar_xdr.FeeBumpTransaction.from_xdr(xdr)
-        return cls.from_xdr_object(xdr_object, network_passphrase)
+        return cls.from_xdr_object(xdr_object, network_passphrase, lazy)
 
     def __hash__(self):
         return hash(
@@ -54,8 +54,7 @@ class FeeBumpTransactionEnvelope(BaseTransactionEnvelope["FeeBumpTransactionEnve
         network_id = self._network_id
         packer = Packer()
         stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP.pack(packer)
-        self.transaction.to_xdr_object().pack(packer)
-        return network_id + packer.get_buffer()
+        return network_id + packer.get_buffer() + self.transaction._xdr_bytes()
 
     @staticmethod
     def is_fee_bump_transaction_envelope(xdr: str | bytes) -> bool:
@@ -87,21 +86,36 @@ class FeeBumpTransactionEnvelope(BaseTransactionEnvelope["FeeBumpTransactionEnve
         tx_envelope = stellar_xdr.FeeBumpTransactionEnvelope(tx, signatures)
         return stellar_xdr.TransactionEnvelope(type=te_type, fee_bump=tx_envelope)
 
+    def _xdr_bytes(self) -> bytes:
+        packer = Packer()
+        stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP.pack(packer)
+        return (
+            packer.get_buffer()
+            + self.transaction._xdr_bytes()
+            + self._signatures_xdr_bytes()
+        )
+
     @classmethod
     def from_xdr_object(
-        cls, xdr_object: stellar_xdr.TransactionEnvelope, network_passphrase: str
+        cls,
+        xdr_object: stellar_xdr.TransactionEnvelope,
+        network_passphrase: str,
+        lazy: bool = False,
     ) -> "FeeBumpTransactionEnvelope":
         """Create a new :class:`FeeBumpTransactionEnvelope` from an XDR object.
 
         :param xdr_object: The XDR object that represents a fee bump transaction envelope.
         :param network_passphrase: The network to connect to for verifying and retrieving additional attributes from.
+        :param lazy: Create the operations of the inner transaction when they
+            are accessed, see :meth:`Transaction.from_xdr_object
+            <stellar_sdk.transaction.Transaction.from_xdr_object>`.
         :return: A new :class:`FeeBumpTransactionEnvelope` object from the given XDR TransactionEnvelope object.
         """
         te_type = xdr_object.type
         if te_type == stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
             assert xdr_object.fee_bump is not None
             tx = FeeBumpTransaction.from_xdr_object(
-                xdr_object.fee_bump.tx, network_passphrase
+                xdr_object.fee_bump.tx, network_passphrase, lazy
             )
         else:
             raise ValueError("Invalid EnvelopeType: %d.", xdr_object.type)
@@ -0,0 +1,119 @@
+import queue
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .base_history_scanner import BaseHistoryScanner
+
+if TYPE_CHECKING:
+    from .call_builder.call_builder_sync import BaseCallBuilder
+
+__all__ = ["HistoryScanner"]
+
+_Page = list[dict[str, Any]] | Exception | None
+
+
+class HistoryScanner(BaseHistoryScanner):
+    """The :class:`HistoryScanner` object, which reads the history of a range
+    of ledgers from Horizon with many requests in parallel.
+
+    The ledger range is split into ``shards`` ranges of about the same number
+    of ledgers, and each range is read from its own cursor, the :class:`TOID
+    <stellar_sdk.sep.toid.TOID>` of its first ledger, in a thread pool of
+    ``workers`` threads. The records can be yielded in the same order as
+    reading the whole range with one cursor, or as soon as they arrive.
+
+    The call builder should list records whose paging token is a TOID, such
+    as :meth:`Server.operations() <stellar_sdk.server.Server.operations>`,
+    :meth:`Server.payments() <stellar_sdk.server.Server.payments>`,
+    :meth:`Server.effects() <stellar_sdk.server.Server.effects>` and
+    :meth:`Server.transactions() <stellar_sdk.server.Server.transactions>`,
+    filtered as needed. Its cursor, order and limit are replaced with those
+    of each range.
+
+    An example::
+
+        from stellar_sdk import HistoryScanner, Server
+
+        with Server("https://horizon.stellar.org") as server:
+            scanner = HistoryScanner(50_000_000, 50_100_000, shards=16)
+            for operation in scanner.scan(server.operations().include_failed(True)):
+                process(operation)
+
+    :param start_ledger: The first ledger of the range.
+    :param end_ledger: The last ledger of the range.
+    :param shards: The number of ranges to split the ledger range into. There
+        are fewer ranges if there are fewer ledgers.
+    :param workers: The number of ranges read at the same time, by default
+        all of them.
+    :param limit: The number of records requested per page.
+    :param buffer: The maximum number of pages of each range read before they
+        are yielded.
+    :raises: :exc:`ValueError`: if the ledger range is empty, or if ``shards``,
+        ``workers`` or ``buffer`` is not positive.
+    """
+
+    def scan(
+        self, call_builder: "BaseCallBuilder", ordered: bool = True
+    ) -> Generator[dict[str, Any], None, None]:
+        """Read the records of the ledger range.
+
+        :param call_builder: The call builder listing the records.
+        :param ordered: Yield the records in ascending order. Otherwise, yield
+            the records of each page as soon as it is read, which keeps all
+            the workers busy.
+        :return: A generator of the records. Closing it stops the threads.
+        :raises: The exceptions of :meth:`call
+            <stellar_sdk.call_builder.call_builder_sync.BaseCallBuilder.call>`.
+        """
+        if ordered:
+            queues: list[queue.Queue[_Page]] = [
+                queue.Queue(self.buffer) for _ in self.ranges
+            ]
+        else:
+            queues = [queue.Queue(self.buffer * len(self.ranges))] * len(self.ranges)
+        stop = threading.Event()
+
+        def put(results: "queue.Queue[_Page]", page: _Page) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(page, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def read(index: int) -> None:
+            start, end = self.ranges[index]
+            pages = self._shard(call_builder, start)._pages()
+            try:
+                for records in pages:
+                    records, done = self._in_range(records, end)
+                    if records and not put(queues[index], records):
+                        return
+                    if done:
+                        break
+                put(queues[index], None)
+            except Exception as e:
+                put(queues[index], e)
+            finally:
+                pages.close()
+
+        executor = ThreadPoolExecutor(self.workers, "HistoryScanner")
+        try:
+            for index in range(len(self.ranges)):
+                executor.submit(read, index)
+            for results in queues[: len(queues) if ordered else 1]:
+                remaining = 1 if ordered else len(self.ranges)
+                while remaining:
+                    page = results.get()
+                    if page is None:
+                        remaining -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        yield from page
+        finally:
+            stop.set()
+            executor.shutdown(cancel_futures=True)
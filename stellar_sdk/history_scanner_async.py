@@ -0,0 +1,106 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any
+
+from .base_history_scanner import BaseHistoryScanner
+
+if TYPE_CHECKING:
+    from .call_builder.call_builder_async import BaseCallBuilder
+
+__all__ = ["HistoryScannerAsync"]
+
+_Page = list[dict[str, Any]] | Exception | None
+
+
+class HistoryScannerAsync(BaseHistoryScanner):
+    """The :class:`HistoryScannerAsync` object, which reads the history of a
+    range of ledgers from Horizon with many requests in parallel.
+
+    This is the asyncio version of :class:`HistoryScanner
+    <stellar_sdk.history_scanner.HistoryScanner>`, see it for details. Each
+    range is read in its own task, and at most ``workers`` ranges are read at
+    the same time.
+
+    An example::
+
+        import asyncio
+        from stellar_sdk import HistoryScannerAsync, ServerAsync
+
+        async def main():
+            async with ServerAsync("https://horizon.stellar.org") as server:
+                scanner = HistoryScannerAsync(50_000_000, 50_100_000, shards=16)
+                async for payment in scanner.scan(server.payments(), ordered=False):
+                    await process(payment)
+
+        asyncio.run(main())
+
+    :param start_ledger: The first ledger of the range.
+    :param end_ledger: The last ledger of the range.
+    :param shards: The number of ranges to split the ledger range into. There
+        are fewer ranges if there are fewer ledgers.
+    :param workers: The number of ranges read at the same time, by default
+        all of them.
+    :param limit: The number of records requested per page.
+    :param buffer: The maximum number of pages of each range read before they
+        are yielded.
+    :raises: :exc:`ValueError`: if the ledger range is empty, or if ``shards``,
+        ``workers`` or ``buffer`` is not positive.
+    """
+
+    async def scan(
+        self, call_builder: "BaseCallBuilder", ordered: bool = True
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Read the records of the ledger range.
+
+        :param call_builder: The call builder listing the records.
+        :param ordered: Yield the records in ascending order. Otherwise, yield
+            the records of each page as soon as it is read, which keeps all
+            the workers busy.
+        :return: An async generator of the records. Closing it cancels the
+            tasks.
+        :raises: The exceptions of :meth:`call
+            <stellar_sdk.call_builder.call_builder_async.BaseCallBuilder.call>`.
+        """
+        if ordered:
+            queues: list[asyncio.Queue[_Page]] = [
+                asyncio.Queue(self.buffer) for _ in self.ranges
+            ]
+        else:
+            queues = [asyncio.Queue(self.buffer * len(self.ranges))] * len(self.ranges)
+        workers = asyncio.Semaphore(self.workers)
+
+        async def read(index: int) -> None:
+            start, end = self.ranges[index]
+            async with workers:
+                try:
+                    async with contextlib.aclosing(
+                        self._shard(call_builder, start)._pages()
+                    ) as pages:
+                        async for records in pages:
+                            records, done = self._in_range(records, end)
+                            if records:
+                                await queues[index].put(records)
+                            if done:
+                                break
+                    await queues[index].put(None)
+                except Exception as e:
+                    await queues[index].put(e)
+
+        tasks = [asyncio.create_task(read(index)) for index in range(len(self.ranges))]
+        try:
+            for results in queues[: len(queues) if ordered else 1]:
+                remaining = 1 if ordered else len(self.ranges)
+                while remaining:
+                    page = await results.get()
+                    if page is None:
+                        remaining -= 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        for record in page:
+                            yield record
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
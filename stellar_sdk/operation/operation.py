@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from decimal import Decimal
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from .. import utils
 from .. import xdr as stellar_xdr
@@ -31,18 +31,43 @@ class Operation(metaclass=ABCMeta):
     The :class:`Operation` class is typically not used, but rather one of its
     subclasses is typically included in transactions.
 
+    The XDR object and the XDR encoding of an operation are built once and
+    memoized until one of its attributes is assigned. Values changed in place,
+    such as an element of the ``auth`` list of
+    :class:`InvokeHostFunction <stellar_sdk.operation.InvokeHostFunction>`,
+    are not detected: assign the attribute again after changing them.
+
     :param source: The source account for the operation. Defaults to the
         transaction's source account.
 
     """
 
     _XDR_OPERATION_TYPE: ClassVar[stellar_xdr.OperationType]
+    # The subclass of each operation type, filled in as the subclasses are
+    # defined, so that from_xdr_object does not scan the subclasses.
+    _OPERATION_CLASSES: ClassVar[
+        dict[stellar_xdr.OperationType, type["Operation"]]
+    ] = {}
+    _xdr_object_cache: stellar_xdr.Operation | None = None
+    _xdr_bytes_cache: bytes | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        operation_type = cls.__dict__.get("_XDR_OPERATION_TYPE")
+        if operation_type is not None:
+            Operation._OPERATION_CLASSES.setdefault(operation_type, cls)
 
     def __init__(self, source: MuxedAccount | str | None = None) -> None:
         if isinstance(source, str):
             source = MuxedAccount.from_account(source)
         self.source: MuxedAccount | None = source
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_xdr_object_cache", None)
+            super().__setattr__("_xdr_bytes_cache", None)
+
     @staticmethod
     def to_xdr_amount(value: str | Decimal) -> int:
         """Converts an amount to the appropriate value to send over the network
@@ -88,10 +113,24 @@ class Operation(metaclass=ABCMeta):
         :class:`Operation`.
 
         """
-        source_account = None
-        if self.source:
-            source_account = self.source.to_xdr_object()
-        return stellar_xdr.Operation(source_account, self._to_operation_body())
+        return self._xdr_object().clone()
+
+    def _xdr_object(self) -> stellar_xdr.Operation:
+        # The memoized XDR object is shared with the transactions that
+        # contain this operation, so it must not be handed out or modified.
+        if self._xdr_object_cache is None:
+            source_account = None
+            if self.source:
+                source_account = self.source.to_xdr_object()
+            self._xdr_object_cache = stellar_xdr.Operation(
+                source_account, self._to_operation_body()
+            )
+        return self._xdr_object_cache
+
+    def _xdr_bytes(self) -> bytes:
+        if self._xdr_bytes_cache is None:
+            self._xdr_bytes_cache = self._xdr_object().to_xdr_bytes()
+        return self._xdr_bytes_cache
 
     @classmethod
     def from_xdr_object(cls, xdr_object: stellar_xdr.Operation) -> "Operation":
@@ -101,12 +140,12 @@ class Operation(metaclass=ABCMeta):
         :param xdr_object: The XDR object to create an :class:`Operation` (or
             subclass) instance from.
         """
-        for sub_cls in cls.__subclasses__():
-            if xdr_object.body.type == sub_cls._XDR_OPERATION_TYPE:
-                return sub_cls.from_xdr_object(xdr_object)
-        raise NotImplementedError(
-            f"Operation of type={xdr_object.body.type} is not implemented."
-        )
+        sub_cls = Operation._OPERATION_CLASSES.get(xdr_object.body.type)
+        if sub_cls is None:
+            raise NotImplementedError(
+                f"Operation of type={xdr_object.body.type} is not implemented."
+            )
+        return sub_cls.from_xdr_object(xdr_object)
 
     @staticmethod
     def get_source_from_xdr_obj(
@@ -122,9 +161,9 @@ class Operation(metaclass=ABCMeta):
         return None
 
     def __hash__(self):
-        return hash(self.to_xdr_object())
+        return hash(self._xdr_bytes())
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return self.to_xdr_object() == other.to_xdr_object()
+        return self._xdr_bytes() == other._xdr_bytes()
@@ -1,5 +1,5 @@
 import functools
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from . import xdr as stellar_xdr
@@ -72,8 +72,8 @@ def to_native(
       - SCV_I32, SCV_U32 -> `int`
       - SCV_I64, SCV_U64, SCV_I128, SCV_U128, SCV_I256, SCV_U256 -> `int`
       - SCV_TIMEPOINT, SCV_DURATION -> `int`
-      - SCV_VEC -> `list` of any of the above (via recursion)
-      - SCV_MAP -> `dict` with keys and values of any of the above (via recursion)
+      - SCV_VEC -> `list` of any of the above
+      - SCV_MAP -> `dict` with keys and values of any of the above
       - SCV_BOOL -> `bool`
       - SCV_BYTES -> `bytes`
       - SCV_SYMBOL -> `str`
@@ -87,6 +87,58 @@ def to_native(
     :return: The native Python type.
     """
     sc_val = _parse_sc_val(sc_val)
+    if sc_val.type not in _CONTAINER_TYPES:
+        return _leaf_to_native(sc_val)
+    # Vectors and maps are converted with an explicit stack rather than by
+    # recursion, so deeply nested values don't hit the recursion limit. A
+    # frame is (container, items) with the vector items or the map entries
+    # still to convert. Map keys are rarely vectors or maps, which can't be
+    # dict keys anyway, so they are converted by a call to to_native.
+    result: list[Any] = []
+    stack: list[tuple[Any, Iterator[Any]]] = [(result, iter((sc_val,)))]
+    while stack:
+        container, items = stack[-1]
+        if type(container) is list:
+            for value in items:
+                if value.type in _CONTAINER_TYPES:
+                    child = _container_frame(value)
+                    container.append(child[0])
+                    stack.append(child)
+                    break
+                container.append(_leaf_to_native(value))
+            else:
+                stack.pop()
+        else:
+            for entry in items:
+                key = (
+                    to_native(entry.key)
+                    if entry.key.type in _CONTAINER_TYPES
+                    else _leaf_to_native(entry.key)
+                )
+                value = entry.val
+                if value.type in _CONTAINER_TYPES:
+                    child = _container_frame(value)
+                    container[key] = child[0]
+                    stack.append(child)
+                    break
+                container[key] = _leaf_to_native(value)
+            else:
+                stack.pop()
+    return result[0]
+
+
+_CONTAINER_TYPES = (stellar_xdr.SCValType.SCV_VEC, stellar_xdr.SCValType.SCV_MAP)
+
+
+def _container_frame(sc_val: stellar_xdr.SCVal) -> tuple[Any, Iterator[Any]]:
+    if sc_val.type == stellar_xdr.SCValType.SCV_VEC:
+        assert sc_val.vec is not None
+        return [], iter(sc_val.vec.sc_vec)
+    assert sc_val.map is not None
+    return {}, iter(sc_val.map.sc_map)
+
+
+def _leaf_to_native(sc_val: stellar_xdr.SCVal) -> Any:
     if sc_val.type == stellar_xdr.SCValType.SCV_BOOL:
         return sc_val.b
     if sc_val.type == stellar_xdr.SCValType.SCV_VOID:
@@ -121,14 +173,6 @@ def to_native(
             return s
     if sc_val.type == stellar_xdr.SCValType.SCV_SYMBOL:
         return from_symbol(sc_val)
-    if sc_val.type == stellar_xdr.SCValType.SCV_VEC:
-        assert sc_val.vec is not None
-        return [to_native(val) for val in sc_val.vec.sc_vec]
-    if sc_val.type == stellar_xdr.SCValType.SCV_MAP:
-        assert sc_val.map is not None
-        return {
-            to_native(entry.key): to_native(entry.val) for entry in sc_val.map.sc_map
-        }
     if sc_val.type == stellar_xdr.SCValType.SCV_ADDRESS:
         return from_address(sc_val)
     return sc_val
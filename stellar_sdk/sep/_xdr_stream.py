@@ -6,6 +6,7 @@ from typing import Protocol, TypeVar
 from xdrlib3 import ConversionError, Packer, Unpacker
 
 from .. import xdr as stellar_xdr
+from ..xdr.stream import _iter_entries
 from .exceptions import InvalidWasmError
 
 __all__ = [
@@ -69,24 +70,11 @@ def _parse_xdr_stream(
     if not isinstance(data, bytes):
         raise TypeError("data must be bytes")
 
-    unpacker = Unpacker(data)
-    entries: list[_XdrEntry] = []
-    while unpacker.get_position() < len(data):
-        before = unpacker.get_position()
-        try:
-            entry = unpack_entry(unpacker)
-        except (EOFError, ValueError, ConversionError) as exc:
-            raise InvalidWasmError(f"Invalid XDR stream for {entry_name}.") from exc
-        after = unpacker.get_position()
-        if after <= before:
-            raise InvalidWasmError(
-                f"Invalid XDR stream for {entry_name}: decoder made no progress."
-            )
-        entries.append(entry)
-
-    if unpacker.get_position() != len(data):
-        raise InvalidWasmError(f"Invalid XDR stream for {entry_name}: trailing bytes.")
-    return tuple(entries)
+    try:
+        return tuple(_iter_entries(Unpacker(data), unpack_entry))
+    except (EOFError, ValueError, ConversionError) as exc:
+        detail = f": {exc}" if str(exc) else "."
+        raise InvalidWasmError(f"Invalid XDR stream for {entry_name}{detail}") from exc
 
 
 def _serialize_xdr_stream(entries: Iterable[_XdrPackable]) -> bytes:
@@ -1,4 +1,6 @@
+import operator
 from collections.abc import Sequence
+from typing import Any
 
 from . import xdr as stellar_xdr
 from .keypair import Keypair
@@ -53,8 +55,27 @@ class Transaction:
     :param v1: When this value is set to ``True``, V1 transactions will be generated,
         otherwise V0 transactions will be generated.
         See `CAP-0015 <https://github.com/stellar/stellar-protocol/blob/master/core/cap-0015.md>`__ for more information.
+
+    The XDR object and the XDR encoding of a transaction are built once and
+    memoized, so that hashing, signing and serializing it many times encodes
+    it only once. They are rebuilt when an attribute of the transaction or of
+    one of its operations is assigned, or when operations are added to,
+    removed from or replaced in :attr:`operations`. Values changed in place,
+    such as the :attr:`soroban_data` XDR object, are not detected: assign the
+    attribute again after changing them.
+
+    A transaction parsed with ``lazy=True``, see :meth:`from_xdr_object`,
+    creates its operations from their XDR objects only when :attr:`operations`
+    is first accessed.
     """
 
+    _xdr_object_cache: stellar_xdr.Transaction | stellar_xdr.TransactionV0 | None = None
+    _xdr_bytes_cache: bytes | None = None
+    # The XDR objects of the operations of a lazily parsed transaction, until
+    # the operations are created.
+    _operation_xdr_objects: list[stellar_xdr.Operation] | None = None
+    _operations: list[Operation]
+
     def __init__(
         self,
         source: MuxedAccount | Keypair | str,
@@ -92,6 +113,34 @@ class Transaction:
         )
         self.v1: bool = v1
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            super().__setattr__("_xdr_object_cache", None)
+            super().__setattr__("_xdr_bytes_cache", None)
+
+    @property
+    def operations(self) -> list[Operation]:
+        """The operations of the transaction."""
+        self._ensure_operations()
+        return self._operations
+
+    @operations.setter
+    def operations(self, operations: list[Operation]) -> None:
+        self._operations = operations
+        self._operation_xdr_objects = None
+
+    def _ensure_operations(self) -> None:
+        # Creates the operations of a lazily parsed transaction. They encode
+        # as the operations of an eagerly parsed one, so the memoized XDR
+        # object is rebuilt from them.
+        if self._operation_xdr_objects is not None:
+            self._operations = [
+                Operation.from_xdr_object(xdr_object)
+                for xdr_object in self._operation_xdr_objects
+            ]
+            self._operation_xdr_objects = None
+
     def get_claimable_balance_id(self, operation_index: int) -> str:
         """Calculate the claimable balance ID for an operation within the transaction.
 
@@ -134,8 +183,37 @@ class Transaction:
 
         :return: XDR Transaction object
         """
+        return self._xdr_object().clone()
+
+    def _xdr_object(self) -> stellar_xdr.Transaction | stellar_xdr.TransactionV0:
+        # The memoized object holds the memoized XDR objects of the
+        # operations, so comparing them by identity tells whether an
+        # operation has changed since it was built.
+        if self._operation_xdr_objects is not None:
+            operations = self._operation_xdr_objects
+        else:
+            operations = [operation._xdr_object() for operation in self.operations]
+        cached = self._xdr_object_cache
+        if (
+            cached is not None
+            and len(cached.operations) == len(operations)
+            and all(map(operator.is_, cached.operations, operations))
+        ):
+            return cached
+        self._xdr_object_cache = self._build_xdr_object(operations)
+        self._xdr_bytes_cache = None
+        return self._xdr_object_cache
+
+    def _xdr_bytes(self) -> bytes:
+        xdr_object = self._xdr_object()
+        if self._xdr_bytes_cache is None:
+            self._xdr_bytes_cache = xdr_object.to_xdr_bytes()
+        return self._xdr_bytes_cache
+
+    def _build_xdr_object(
+        self, operations: list[stellar_xdr.Operation]
+    ) -> stellar_xdr.Transaction | stellar_xdr.TransactionV0:
         memo = self.memo.to_xdr_object()
-        operations = [operation.to_xdr_object() for operation in self.operations]
         fee = stellar_xdr.Uint32(self.fee)
         sequence = stellar_xdr.SequenceNumber(stellar_xdr.Int64(self.sequence))
         if not self.v1:
@@ -188,14 +266,26 @@ class Transaction:
         cls,
         xdr_object: stellar_xdr.Transaction | stellar_xdr.TransactionV0,
         v1: bool = True,
+        lazy: bool = False,
     ) -> "Transaction":
         """Create a new :class:`Transaction` from an XDR object.
 
+        With ``lazy=True``, the XDR objects of the operations are kept, and
+        the :class:`Operation <stellar_sdk.operation.Operation>` objects are
+        only created when :attr:`operations` is first accessed. Until then,
+        the XDR object is kept as the memoized XDR object of the transaction,
+        so hashing and serializing it do not encode it again. Reading a few
+        values of many parsed transactions is much faster this way, but the
+        XDR object must not be modified afterwards. Once :attr:`operations`
+        has been accessed, the transaction is encoded from its attributes, as
+        an eagerly parsed one is.
+
         :param xdr_object: The XDR object that represents a transaction.
         :param v1: Temporary feature flag to allow alpha testing of Stellar Protocol 13 transactions.
             We will remove this once all transactions are supposed to be v1.
             See `CAP-0015 <https://github.com/stellar/stellar-protocol/blob/master/core/cap-0015.md>`_
             for more information.
+        :param lazy: Create the operations when they are accessed.
 
         :return: A new :class:`Transaction` object from the given XDR Transaction object.
         """
@@ -224,7 +314,9 @@ class Transaction:
         sequence = xdr_object.seq_num.sequence_number.int64
         fee = xdr_object.fee.uint32
         memo = Memo.from_xdr_object(xdr_object.memo)
-        operations = list(map(Operation.from_xdr_object, xdr_object.operations))
+        operations = (
+            [] if lazy else list(map(Operation.from_xdr_object, xdr_object.operations))
+        )
 
         tx = cls(
             source=source,
@@ -236,10 +328,13 @@ class Transaction:
             soroban_data=soroban_data,
             v1=v1,
         )
+        if lazy:
+            tx._operation_xdr_objects = list(xdr_object.operations)
+            tx._xdr_object_cache = xdr_object
         return tx
 
     @classmethod
-    def from_xdr(cls, xdr: str, v1: bool = True) -> "Transaction":
+    def from_xdr(cls, xdr: str, v1: bool = True, lazy: bool = False) -> "Transaction":
         """Create a new :class:`Transaction` from an XDR string.
 
         :param xdr: The XDR string that represents a transaction.
@@ -247,14 +342,16 @@ class Transaction:
             We will remove this once all transactions are supposed to be v1.
             See `CAP-0015 <https://github.com/stellar/stellar-protocol/blob/master/core/cap-0015.md>`_
             for more information.
+        :param lazy: Create the operations when they are accessed, see
+            :meth:`from_xdr_object`.
 
         :return: A new :class:`Transaction` object from the given XDR Transaction base64 string object.
         """
         if v1:
             xdr_object = stellar_xdr.Transaction.from_xdr(xdr)
-            return cls.from_xdr_object(xdr_object, v1)
+            return cls.from_xdr_object(xdr_object, v1, lazy)
         xdr_object_v0 = stellar_xdr.TransactionV0.from_xdr(xdr)
-        return cls.from_xdr_object(xdr_object_v0, v1)
+        return cls.from_xdr_object(xdr_object_v0, v1, lazy)
 
     def is_soroban_transaction(self) -> bool:
         if len(self.operations) != 1:
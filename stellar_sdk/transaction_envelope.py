@@ -59,8 +59,7 @@ class TransactionEnvelope(BaseTransactionEnvelope["TransactionEnvelope"]):
             tx.v1 = True
         packer = Packer()
         stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX.pack(packer)
-        tx.to_xdr_object().pack(packer)
-        return network_id + packer.get_buffer()
+        return network_id + packer.get_buffer() + tx._xdr_bytes()
 
     def sign_extra_signers_payload(self, signer: Keypair | str) -> None:
         """Sign this extra signers' payload with a given keypair.
@@ -114,6 +113,19 @@ class TransactionEnvelope(BaseTransactionEnvelope["TransactionEnvelope"]):
             tx_v0_envelope = stellar_xdr.TransactionV0Envelope(tx, signatures)
             return stellar_xdr.TransactionEnvelope(type=te_type, v0=tx_v0_envelope)
 
+    def _xdr_bytes(self) -> bytes:
+        # The envelope is packed around the memoized encoding of the
+        # transaction instead of being rebuilt as an XDR object.
+        packer = Packer()
+        if self.transaction.v1:
+            stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX.pack(packer)
+        else:
+            stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX_V0.pack(packer)
+        return packer.get_buffer() + self._body_xdr_bytes()
+
+    def _body_xdr_bytes(self) -> bytes:
+        return self.transaction._xdr_bytes() + self._signatures_xdr_bytes()
+
     def to_transaction_envelope_v1(self) -> "TransactionEnvelope":
         """Create a new :class:`TransactionEnvelope`, if the internal tx is not v1, we will convert it to v1."""
         tx = copy.deepcopy(self.transaction)
@@ -122,12 +134,18 @@ class TransactionEnvelope(BaseTransactionEnvelope["TransactionEnvelope"]):
 
     @classmethod
     def from_xdr_object(
-        cls, xdr_object: stellar_xdr.TransactionEnvelope, network_passphrase: str
+        cls,
+        xdr_object: stellar_xdr.TransactionEnvelope,
+        network_passphrase: str,
+        lazy: bool = False,
     ) -> "TransactionEnvelope":
         """Create a new :class:`TransactionEnvelope` from an XDR object.
 
         :param xdr_object: The XDR object that represents a transaction envelope.
         :param network_passphrase: The network to connect to for verifying and retrieving additional attributes from.
+        :param lazy: Create the operations of the transaction when they are
+            accessed, see :meth:`Transaction.from_xdr_object
+            <stellar_sdk.transaction.Transaction.from_xdr_object>`.
 
         :return: A new :class:`TransactionEnvelope` object from the given XDR TransactionEnvelope object.
         """
@@ -135,14 +153,14 @@ class TransactionEnvelope(BaseTransactionEnvelope["TransactionEnvelope"]):
         if te_type == stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX_V0:
             assert xdr_object.v0 is not None
             assert xdr_object.v0.signatures is not None
-            tx = Transaction.from_xdr_object(xdr_object.v0.tx, v1=False)
+            tx = Transaction.from_xdr_object(xdr_object.v0.tx, v1=False, lazy=lazy)
             signatures = [
                 DecoratedSignature.from_xdr_object(s) for s in xdr_object.v0.signatures
             ]
         elif te_type == stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX:
             assert xdr_object.v1 is not None
             assert xdr_object.v1.signatures is not None
-            tx = Transaction.from_xdr_object(xdr_object.v1.tx, v1=True)
+            tx = Transaction.from_xdr_object(xdr_object.v1.tx, v1=True, lazy=lazy)
             signatures = [
                 DecoratedSignature.from_xdr_object(s) for s in xdr_object.v1.signatures
             ]
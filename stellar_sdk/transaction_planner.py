@@ -0,0 +1,225 @@
+import warnings
+from collections.abc import Iterable, Iterator
+
+from .account import Account
+from .keypair import Keypair
+from .memo import Memo, NoneMemo
+from .network import Network
+from .operation import (
+    ExtendFootprintTTL,
+    InvokeHostFunction,
+    Operation,
+    RestoreFootprint,
+)
+from .preconditions import Preconditions
+from .time_bounds import TimeBounds
+from .transaction import Transaction
+from .transaction_builder import MIN_BASE_FEE, TransactionBuilder
+from .transaction_envelope import TransactionEnvelope
+
+__all__ = ["TransactionPlanner"]
+
+MAX_OPERATIONS_PER_TRANSACTION = 100
+MAX_TRANSACTION_SIZE = 100 * 1024
+
+# The encoded size of a DecoratedSignature with an ed25519 signature: the
+# signature hint, the length of the signature and the signature.
+_SIGNATURE_SIZE = 4 + 4 + 64
+_SOROBAN_OPERATIONS = (InvokeHostFunction, ExtendFootprintTTL, RestoreFootprint)
+
+
+class TransactionPlanner:
+    """The :class:`TransactionPlanner` object, which splits a long list of
+    operations into as few transactions as possible.
+
+    Operations are added to a transaction in the given order until it holds
+    ``max_operations`` operations, or until the next operation would make the
+    signed transaction envelope larger than ``max_size`` bytes. The size
+    includes one ed25519 signature for the transaction's source account and
+    for each other source account of its operations. Since operations are
+    never reordered, an operation may depend on the effects of the operations
+    before it, such as a :class:`ChangeTrust <stellar_sdk.operation.ChangeTrust>`
+    following the :class:`CreateAccount <stellar_sdk.operation.CreateAccount>`
+    of the same account, as long as they end up in the same transaction or
+    the transactions are submitted in order.
+
+    The transactions are built with a :class:`TransactionBuilder
+    <stellar_sdk.transaction_builder.TransactionBuilder>` one at a time, when
+    they are requested, so a job of millions of operations never holds more
+    than one transaction in memory, as long as the operations are given as an
+    iterator too. Each transaction pays ``base_fee`` per operation and uses
+    the next sequence number of the source account. They must be submitted in
+    the order they are built.
+
+    Soroban operations need a simulated transaction of their own and cannot be
+    planned.
+
+    An example::
+
+        from stellar_sdk import Asset, Keypair, Network, Server, TransactionPlanner
+        from stellar_sdk.operation import Payment
+
+        server = Server("https://horizon-testnet.stellar.org")
+        distributor = Keypair.from_secret("SBFZCHU5645DOKRWYBXVOXY2ELGJKFRX6VGGPRYUWHQ7PMXXJNDZFMKD")
+        planner = TransactionPlanner(
+            server.load_account(distributor.public_key),
+            Network.TESTNET_NETWORK_PASSPHRASE,
+            signers=[distributor],
+            timeout=300,
+        )
+        operations = (Payment(destination, asset, "10") for destination in destinations)
+        for transaction_envelope in planner.build(operations):
+            server.submit_transaction(transaction_envelope)
+
+    :param source_account: The source account of the transactions. Its
+        sequence number is incremented for each transaction built.
+    :param network_passphrase: The network to connect to for verifying and
+        retrieving additional attributes from.
+    :param base_fee: Max fee you're willing to pay per operation in the
+        transactions (**in stroops**).
+    :param signers: The keypairs or secrets to sign the transactions with.
+        Each transaction is signed by the keypairs of its source account and
+        of the source accounts of its operations.
+    :param timeout: The number of seconds each transaction is valid for,
+        counted from the time it is built. By default, the transactions have
+        infinite time bounds, and a warning is emitted once, when the planner
+        is created.
+    :param memo: The memo of the transactions.
+    :param max_operations: The maximum number of operations in a transaction.
+    :param max_size: The maximum size of a signed transaction envelope, in
+        bytes.
+    :raises: :exc:`ValueError`: if ``max_operations`` is not between 1 and 100.
+    """
+
+    def __init__(
+        self,
+        source_account: Account,
+        network_passphrase: str = Network.TESTNET_NETWORK_PASSPHRASE,
+        base_fee: int = MIN_BASE_FEE,
+        signers: Iterable[Keypair | str] = (),
+        timeout: int | None = None,
+        memo: Memo | None = None,
+        max_operations: int = MAX_OPERATIONS_PER_TRANSACTION,
+        max_size: int = MAX_TRANSACTION_SIZE,
+    ) -> None:
+        if not 1 <= max_operations <= MAX_OPERATIONS_PER_TRANSACTION:
+            raise ValueError(
+                f"max_operations must be between 1 and "
+                f"{MAX_OPERATIONS_PER_TRANSACTION}, got {max_operations}."
+            )
+        self.source_account: Account = source_account
+        self.network_passphrase: str = network_passphrase
+        self.base_fee: int = base_fee
+        self.timeout: int | None = timeout
+        self.memo: Memo = NoneMemo() if memo is None else memo
+        self.max_operations: int = max_operations
+        self.max_size: int = max_size
+        if timeout is None:
+            warnings.warn(
+                "It looks like you haven't set a timeout for the planned transactions, "
+                "we strongly recommend that you set it. "
+                "You can learn why you should set it up through this link: "
+                "https://www.stellar.org/developers-blog/transaction-submission-timeouts-and-dynamic-fees-faq",
+                stacklevel=2,
+            )
+        self._signers: dict[str, Keypair] = {}
+        for signer in signers:
+            keypair = Keypair.from_secret(signer) if isinstance(signer, str) else signer
+            self._signers[keypair.public_key] = keypair
+        # The size of a signed envelope without operations: the transaction
+        # and the signature of its source account.
+        preconditions = Preconditions(time_bounds=TimeBounds(0, 0))
+        empty = Transaction(source_account.account, 0, 0, [], self.memo, preconditions)
+        self._base_size: int = (
+            TransactionEnvelope(empty, network_passphrase).to_xdr_object().xdr_size()
+            + _SIGNATURE_SIZE
+        )
+
+    def plan(self, operations: Iterable[Operation]) -> Iterator[list[Operation]]:
+        """Split the operations into the operations of each transaction.
+
+        :param operations: The operations to split, in the order they should
+            be executed.
+        :return: An iterator over the operations of each transaction.
+        :raises: :exc:`ValueError`: if an operation is a Soroban operation, or
+            does not fit in a transaction on its own.
+        """
+        source = self.source_account.account.account_id
+        batch: list[Operation] = []
+        sources = {source}
+        size = self._base_size
+        for index, operation in enumerate(operations):
+            if isinstance(operation, _SOROBAN_OPERATIONS):
+                raise ValueError(
+                    f"The operation at index {index} is a Soroban operation, "
+                    f"which must be the only operation of its transaction."
+                )
+            op_source = operation.source.account_id if operation.source else source
+            op_size = len(operation._xdr_bytes())
+            signature_size = 0 if op_source in sources else _SIGNATURE_SIZE
+            if batch and (
+                len(batch) == self.max_operations
+                or size + op_size + signature_size > self.max_size
+            ):
+                yield batch
+                batch = []
+                sources = {source}
+                size = self._base_size
+                signature_size = 0 if op_source in sources else _SIGNATURE_SIZE
+            if size + op_size + signature_size > self.max_size:
+                raise ValueError(
+                    f"The operation at index {index} does not fit in a "
+                    f"transaction of at most {self.max_size} bytes."
+                )
+            batch.append(operation)
+            sources.add(op_source)
+            size += op_size + signature_size
+        if batch:
+            yield batch
+
+    def build(self, operations: Iterable[Operation]) -> Iterator[TransactionEnvelope]:
+        """Build and sign the transactions executing the operations.
+
+        The transactions are built lazily: each one increments the sequence
+        number of the source account when it is requested.
+
+        :param operations: The operations to execute, in order.
+        :return: An iterator over the signed transaction envelopes.
+        :raises: :exc:`ValueError`: if an operation is a Soroban operation, or
+            does not fit in a transaction on its own.
+        """
+        for batch in self.plan(operations):
+            builder = TransactionBuilder(
+                self.source_account, self.network_passphrase, self.base_fee
+            ).add_memo(self.memo)
+            # Infinite time bounds, so the builder does not warn about each
+            # transaction.
+            if self.timeout is None:
+                builder.add_time_bounds(0, 0)
+            else:
+                builder.set_timeout(self.timeout)
+            builder.operations = batch
+            transaction_envelope = builder.build()
+            transaction_envelope.sign_many(
+                self._signers[account_id]
+                for account_id in self._signer_ids(batch)
+                if account_id in self._signers
+            )
+            yield transaction_envelope
+
+    def _signer_ids(self, operations: list[Operation]) -> dict[str, None]:
+        # An ordered set of the source accounts, starting with the source
+        # account of the transaction.
+        account_ids = {self.source_account.account.account_id: None}
+        for operation in operations:
+            if operation.source is not None:
+                account_ids[operation.source.account_id] = None
+        return account_ids
+
+    def __repr__(self):
+        return (
+            f"<TransactionPlanner [source_account={self.source_account}, "
+            f"network_passphrase={self.network_passphrase}, "
+            f"base_fee={self.base_fee}, timeout={self.timeout}, memo={self.memo}, "
+            f"max_operations={self.max_operations}, max_size={self.max_size}]>"
+        )
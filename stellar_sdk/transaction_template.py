@@ -0,0 +1,242 @@
+import base64
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from xdrlib3 import Packer
+
+from . import xdr as stellar_xdr
+from .base_transaction_envelope import _to_keypairs
+from .keypair import Keypair
+from .memo import Memo
+from .muxed_account import MuxedAccount
+from .network import Network
+from .operation.payment import Payment
+from .strkey import StrKey
+from .transaction_builder import TransactionBuilder
+from .transaction_envelope import TransactionEnvelope
+from .utils import sha256, to_xdr_amount
+
+__all__ = ["SignedTransactionXdr", "TransactionTemplate"]
+
+_INT64 = struct.Struct(">q")
+_UINT32 = struct.Struct(">I")
+
+
+@dataclass(frozen=True)
+class SignedTransactionXdr:
+    """A transaction envelope built by :meth:`TransactionTemplate.sign`."""
+
+    sequence: int
+    """The sequence number of the transaction."""
+    hash: bytes
+    """The hash of the transaction, as returned by :meth:`TransactionEnvelope.hash`."""
+    xdr: str
+    """The base64 encoded XDR of the signed transaction envelope."""
+
+    def hash_hex(self) -> str:
+        """Return the hex encoded hash of the transaction.
+
+        :return: The hex encoded hash of the transaction.
+        """
+        return self.hash.hex()
+
+
+class TransactionTemplate:
+    """The :class:`TransactionTemplate` object, which builds and signs many
+    payment transactions that only differ in their destination, amount, memo
+    and sequence number.
+
+    The template is made from a transaction with exactly one
+    :class:`Payment <stellar_sdk.operation.Payment>` operation. It encodes
+    that transaction once, and then builds each transaction by joining the
+    encoded parts that do not change with the encoded sequence number, memo,
+    destination and amount, without creating any transaction, operation or
+    XDR object. The source account, fee, preconditions, asset and the other
+    operations of the transaction are the same for all of them.
+
+    Building, hashing and signing a transaction this way is several times
+    faster than building it with a :class:`TransactionBuilder`, and most of
+    the remaining time is spent computing the ed25519 signatures.
+
+    The template is not thread-safe: it hands out sequence numbers.
+
+    :param transaction_envelope: The transaction to use as a template. Its
+        signatures are ignored.
+    :param signers: The keypairs or secrets to sign the transactions with.
+    :raises: :exc:`ValueError`: if the transaction is not a V1 transaction
+        with exactly one :class:`Payment <stellar_sdk.operation.Payment>`
+        operation.
+    """
+
+    def __init__(
+        self,
+        transaction_envelope: TransactionEnvelope,
+        signers: Iterable[Keypair | str] = (),
+    ) -> None:
+        transaction = transaction_envelope.transaction
+        if not transaction.v1:
+            raise ValueError("Only V1 transactions can be used as a template.")
+        payment_indexes = [
+            i for i, op in enumerate(transaction.operations) if isinstance(op, Payment)
+        ]
+        if len(payment_indexes) != 1:
+            raise ValueError(
+                "The transaction must contain exactly one Payment operation, "
+                f"got {len(payment_indexes)}."
+            )
+        tx = transaction.to_xdr_object()
+        assert isinstance(tx, stellar_xdr.Transaction)
+        index = payment_indexes[0]
+        payment = tx.operations[index]
+        payment_op = payment.body.payment_op
+        assert payment_op is not None
+
+        self.network_passphrase: str = transaction_envelope.network_passphrase
+        self.sequence: int = transaction.sequence
+        self._keypairs: list[Keypair] = _to_keypairs(signers)
+        # The encoded signatures are the signature hint and the length of the
+        # ed25519 signature followed by the signature.
+        self._signature_prefixes: list[bytes] = [
+            kp.signature_hint() + _UINT32.pack(64) for kp in self._keypairs
+        ]
+        self._signature_count: bytes = _UINT32.pack(len(self._keypairs))
+
+        envelope_type = _pack(stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX)
+        self._envelope_type: bytes = envelope_type
+        self._signature_base_prefix: bytes = (
+            Network(self.network_passphrase).network_id() + envelope_type
+        )
+        self._ed25519_key_type: bytes = _pack(
+            stellar_xdr.CryptoKeyType.KEY_TYPE_ED25519
+        )
+        self._source_and_fee: bytes = _pack(tx.source_account, tx.fee)
+        self._cond: bytes = _pack(tx.cond)
+        self._memo: bytes = _pack(tx.memo)
+        packer = Packer()
+        packer.pack_uint(len(tx.operations))
+        payment_tail = _pack(
+            payment_op.destination, payment_op.asset, payment_op.amount
+        )
+        self._operations_head: bytes = (
+            packer.get_buffer()
+            + _pack(*tx.operations[:index])
+            + payment.to_xdr_bytes()[: -len(payment_tail)]
+        )
+        self._asset: bytes = _pack(payment_op.asset)
+        self._operations_tail: bytes = _pack(*tx.operations[index + 1 :], tx.ext)
+
+    @classmethod
+    def from_builder(
+        cls, builder: TransactionBuilder, signers: Iterable[Keypair | str] = ()
+    ) -> "TransactionTemplate":
+        """Create a :class:`TransactionTemplate` from a :class:`TransactionBuilder`.
+
+        This calls :meth:`TransactionBuilder.build`, which increments the
+        sequence number of the builder's source account. The first transaction
+        built by the template uses the sequence number of the transaction
+        built here.
+
+        :param builder: The builder with the template transaction, its
+            payment is typically a placeholder.
+        :param signers: The keypairs or secrets to sign the transactions with.
+        :return: A new :class:`TransactionTemplate`.
+        """
+        return cls(builder.build(), signers)
+
+    def transaction_xdr_bytes(
+        self,
+        destination: MuxedAccount | str,
+        amount: str | Decimal,
+        memo: Memo | None = None,
+        sequence: int | None = None,
+    ) -> bytes:
+        """Get the XDR encoding of a transaction built from this template.
+
+        :param destination: The destination account of the payment.
+        :param amount: The amount of the payment.
+        :param memo: The memo of the transaction, by default the memo of the
+            template transaction.
+        :param sequence: The sequence number of the transaction, by default
+            :attr:`sequence`, which is then incremented.
+        :return: The XDR encoding of the ``Transaction``.
+        """
+        if sequence is None:
+            sequence = self.sequence
+            self.sequence += 1
+        if isinstance(destination, str) and destination.startswith("G"):
+            destination_bytes = self._ed25519_key_type + (
+                StrKey.decode_ed25519_public_key(destination)
+            )
+        else:
+            if isinstance(destination, str):
+                destination = MuxedAccount.from_account(destination)
+            destination_bytes = _pack(destination.to_xdr_object())
+        return b"".join(
+            (
+                self._source_and_fee,
+                _INT64.pack(sequence),
+                self._cond,
+                self._memo if memo is None else _pack(memo.to_xdr_object()),
+                self._operations_head,
+                destination_bytes,
+                self._asset,
+                _INT64.pack(to_xdr_amount(amount)),
+                self._operations_tail,
+            )
+        )
+
+    def sign(
+        self,
+        destination: MuxedAccount | str,
+        amount: str | Decimal,
+        memo: Memo | None = None,
+        sequence: int | None = None,
+    ) -> SignedTransactionXdr:
+        """Build a transaction from this template and sign it with the
+        template's signers.
+
+        :param destination: The destination account of the payment.
+        :param amount: The amount of the payment.
+        :param memo: The memo of the transaction, by default the memo of the
+            template transaction.
+        :param sequence: The sequence number of the transaction, by default
+            :attr:`sequence`, which is then incremented.
+        :return: The sequence number, hash and base64 encoded XDR envelope
+            of the signed transaction.
+        """
+        if sequence is None:
+            sequence = self.sequence
+            self.sequence += 1
+        tx_bytes = self.transaction_xdr_bytes(destination, amount, memo, sequence)
+        tx_hash = sha256(self._signature_base_prefix + tx_bytes)
+        envelope = b"".join(
+            (
+                self._envelope_type,
+                tx_bytes,
+                self._signature_count,
+                *(
+                    prefix + keypair.sign(tx_hash)
+                    for keypair, prefix in zip(
+                        self._keypairs, self._signature_prefixes, strict=True
+                    )
+                ),
+            )
+        )
+        return SignedTransactionXdr(
+            sequence, tx_hash, base64.b64encode(envelope).decode()
+        )
+
+    def __repr__(self):
+        return (
+            f"<TransactionTemplate [network_passphrase={self.network_passphrase}, "
+            f"sequence={self.sequence}]>"
+        )
+
+
+def _pack(*values) -> bytes:
+    packer = Packer()
+    for value in values:
+        value.pack(packer)
+    return packer.get_buffer()
@@ -1,475 +1,1489 @@
 # Automatically generated by xdrgen
 # DO NOT EDIT or your changes may be overwritten
-from .account_entry import *
-from .account_entry_ext import *
-from .account_entry_extension_v1 import *
-from .account_entry_extension_v1_ext import *
-from .account_entry_extension_v2 import *
-from .account_entry_extension_v2_ext import *
-from .account_entry_extension_v3 import *
-from .account_flags import *
-from .account_id import *
-from .account_merge_result import *
-from .account_merge_result_code import *
-from .allow_trust_op import *
-from .allow_trust_result import *
-from .allow_trust_result_code import *
-from .alpha_num4 import *
-from .alpha_num12 import *
-from .asset import *
-from .asset_code import *
-from .asset_code4 import *
-from .asset_code12 import *
-from .asset_type import *
-from .auth import *
-from .auth_cert import *
-from .authenticated_message import *
-from .authenticated_message_v0 import *
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import *
-from .begin_sponsoring_future_reserves_op import *
-from .begin_sponsoring_future_reserves_result import *
-from .begin_sponsoring_future_reserves_result_code import *
-from .binary_fuse_filter_type import *
-from .bucket_entry import *
-from .bucket_entry_type import *
-from .bucket_list_type import *
-from .bucket_metadata import *
-from .bucket_metadata_ext import *
-from .bump_sequence_op import *
-from .bump_sequence_result import *
-from .bump_sequence_result_code import *
-from .change_trust_asset import *
-from .change_trust_op import *
-from .change_trust_result import *
-from .change_trust_result_code import *
-from .claim_atom import *
-from .claim_atom_type import *
-from .claim_claimable_balance_op import *
-from .claim_claimable_balance_result import *
-from .claim_claimable_balance_result_code import *
-from .claim_liquidity_atom import *
-from .claim_offer_atom import *
-from .claim_offer_atom_v0 import *
-from .claim_predicate import *
-from .claim_predicate_type import *
-from .claimable_balance_entry import *
-from .claimable_balance_entry_ext import *
-from .claimable_balance_entry_extension_v1 import *
-from .claimable_balance_entry_extension_v1_ext import *
-from .claimable_balance_flags import *
-from .claimable_balance_id import *
-from .claimable_balance_id_type import *
-from .claimant import *
-from .claimant_type import *
-from .claimant_v0 import *
-from .clawback_claimable_balance_op import *
-from .clawback_claimable_balance_result import *
-from .clawback_claimable_balance_result_code import *
-from .clawback_op import *
-from .clawback_result import *
-from .clawback_result_code import *
-from .config_setting_contract_bandwidth_v0 import *
-from .config_setting_contract_compute_v0 import *
-from .config_setting_contract_events_v0 import *
-from .config_setting_contract_execution_lanes_v0 import *
-from .config_setting_contract_historical_data_v0 import *
-from .config_setting_contract_ledger_cost_ext_v0 import *
-from .config_setting_contract_ledger_cost_v0 import *
-from .config_setting_contract_parallel_compute_v0 import *
-from .config_setting_entry import *
-from .config_setting_id import *
-from .config_setting_scp_timing import *
-from .config_upgrade_set import *
-from .config_upgrade_set_key import *
 from .constants import *
-from .contract_code_cost_inputs import *
-from .contract_code_entry import *
-from .contract_code_entry_ext import *
-from .contract_code_entry_v1 import *
-from .contract_cost_param_entry import *
-from .contract_cost_params import *
-from .contract_cost_type import *
-from .contract_data_durability import *
-from .contract_data_entry import *
-from .contract_event import *
-from .contract_event_body import *
-from .contract_event_type import *
-from .contract_event_v0 import *
-from .contract_executable import *
-from .contract_executable_type import *
-from .contract_id import *
-from .contract_id_preimage import *
-from .contract_id_preimage_from_address import *
-from .contract_id_preimage_type import *
-from .create_account_op import *
-from .create_account_result import *
-from .create_account_result_code import *
-from .create_claimable_balance_op import *
-from .create_claimable_balance_result import *
-from .create_claimable_balance_result_code import *
-from .create_contract_args import *
-from .create_contract_args_v2 import *
-from .create_passive_sell_offer_op import *
-from .crypto_key_type import *
-from .curve25519_public import *
-from .curve25519_secret import *
-from .data_entry import *
-from .data_entry_ext import *
-from .data_value import *
-from .decorated_signature import *
-from .dependent_tx_cluster import *
-from .diagnostic_event import *
-from .dont_have import *
-from .duration import *
-from .encoded_ledger_key import *
-from .encrypted_body import *
-from .end_sponsoring_future_reserves_result import *
-from .end_sponsoring_future_reserves_result_code import *
-from .envelope_type import *
-from .error import *
-from .error_code import *
-from .eviction_iterator import *
-from .extend_footprint_ttl_op import *
-from .extend_footprint_ttl_result import *
-from .extend_footprint_ttl_result_code import *
-from .extension_point import *
-from .fee_bump_transaction import *
-from .fee_bump_transaction_envelope import *
-from .fee_bump_transaction_ext import *
-from .fee_bump_transaction_inner_tx import *
-from .flood_advert import *
-from .flood_demand import *
-from .freeze_bypass_txs import *
-from .freeze_bypass_txs_delta import *
-from .frozen_ledger_keys import *
-from .frozen_ledger_keys_delta import *
-from .generalized_transaction_set import *
-from .hash import *
-from .hash_id_preimage import *
-from .hash_id_preimage_contract_id import *
-from .hash_id_preimage_operation_id import *
-from .hash_id_preimage_revoke_id import *
-from .hash_id_preimage_soroban_authorization import *
-from .hash_id_preimage_soroban_authorization_with_address import *
-from .hello import *
-from .hmac_sha256_key import *
-from .hmac_sha256_mac import *
-from .host_function import *
-from .host_function_type import *
-from .hot_archive_bucket_entry import *
-from .hot_archive_bucket_entry_type import *
-from .inflation_payout import *
-from .inflation_result import *
-from .inflation_result_code import *
-from .inner_transaction_result import *
-from .inner_transaction_result_ext import *
-from .inner_transaction_result_pair import *
-from .inner_transaction_result_result import *
-from .int32 import *
-from .int64 import *
-from .int128_parts import *
-from .int256_parts import *
-from .invoke_contract_args import *
-from .invoke_host_function_op import *
-from .invoke_host_function_result import *
-from .invoke_host_function_result_code import *
-from .invoke_host_function_success_pre_image import *
-from .ip_addr_type import *
-from .ledger_bounds import *
-from .ledger_close_meta import *
-from .ledger_close_meta_batch import *
-from .ledger_close_meta_ext import *
-from .ledger_close_meta_ext_v1 import *
-from .ledger_close_meta_v0 import *
-from .ledger_close_meta_v1 import *
-from .ledger_close_meta_v2 import *
-from .ledger_close_value_signature import *
-from .ledger_entry import *
-from .ledger_entry_change import *
-from .ledger_entry_change_type import *
-from .ledger_entry_changes import *
-from .ledger_entry_data import *
-from .ledger_entry_ext import *
-from .ledger_entry_extension_v1 import *
-from .ledger_entry_extension_v1_ext import *
-from .ledger_entry_type import *
-from .ledger_footprint import *
-from .ledger_header import *
-from .ledger_header_ext import *
-from .ledger_header_extension_v1 import *
-from .ledger_header_extension_v1_ext import *
-from .ledger_header_flags import *
-from .ledger_header_history_entry import *
-from .ledger_header_history_entry_ext import *
-from .ledger_key import *
-from .ledger_key_account import *
-from .ledger_key_claimable_balance import *
-from .ledger_key_config_setting import *
-from .ledger_key_contract_code import *
-from .ledger_key_contract_data import *
-from .ledger_key_data import *
-from .ledger_key_liquidity_pool import *
-from .ledger_key_offer import *
-from .ledger_key_trust_line import *
-from .ledger_key_ttl import *
-from .ledger_scp_messages import *
-from .ledger_upgrade import *
-from .ledger_upgrade_type import *
-from .liabilities import *
-from .liquidity_pool_constant_product_parameters import *
-from .liquidity_pool_deposit_op import *
-from .liquidity_pool_deposit_result import *
-from .liquidity_pool_deposit_result_code import *
-from .liquidity_pool_entry import *
-from .liquidity_pool_entry_body import *
-from .liquidity_pool_entry_constant_product import *
-from .liquidity_pool_parameters import *
-from .liquidity_pool_type import *
-from .liquidity_pool_withdraw_op import *
-from .liquidity_pool_withdraw_result import *
-from .liquidity_pool_withdraw_result_code import *
-from .manage_buy_offer_op import *
-from .manage_buy_offer_result import *
-from .manage_buy_offer_result_code import *
-from .manage_data_op import *
-from .manage_data_result import *
-from .manage_data_result_code import *
-from .manage_offer_effect import *
-from .manage_offer_success_result import *
-from .manage_offer_success_result_offer import *
-from .manage_sell_offer_op import *
-from .manage_sell_offer_result import *
-from .manage_sell_offer_result_code import *
-from .memo import *
-from .memo_type import *
-from .message_type import *
-from .muxed_account import *
-from .muxed_account_med25519 import *
-from .muxed_ed25519_account import *
-from .node_id import *
-from .offer_entry import *
-from .offer_entry_ext import *
-from .offer_entry_flags import *
-from .operation import *
-from .operation_body import *
-from .operation_meta import *
-from .operation_meta_v2 import *
-from .operation_result import *
-from .operation_result_code import *
-from .operation_result_tr import *
-from .operation_type import *
-from .parallel_tx_execution_stage import *
-from .parallel_txs_component import *
-from .path_payment_strict_receive_op import *
-from .path_payment_strict_receive_result import *
-from .path_payment_strict_receive_result_code import *
-from .path_payment_strict_receive_result_success import *
-from .path_payment_strict_send_op import *
-from .path_payment_strict_send_result import *
-from .path_payment_strict_send_result_code import *
-from .path_payment_strict_send_result_success import *
-from .payment_op import *
-from .payment_result import *
-from .payment_result_code import *
-from .peer_address import *
-from .peer_address_ip import *
-from .peer_stats import *
-from .persisted_scp_state import *
-from .persisted_scp_state_v0 import *
-from .persisted_scp_state_v1 import *
-from .pool_id import *
-from .precondition_type import *
-from .preconditions import *
-from .preconditions_v2 import *
-from .price import *
-from .public_key import *
-from .public_key_type import *
-from .restore_footprint_op import *
-from .restore_footprint_result import *
-from .restore_footprint_result_code import *
-from .revoke_sponsorship_op import *
-from .revoke_sponsorship_op_signer import *
-from .revoke_sponsorship_result import *
-from .revoke_sponsorship_result_code import *
-from .revoke_sponsorship_type import *
-from .sc_address import *
-from .sc_address_type import *
-from .sc_bytes import *
-from .sc_contract_instance import *
-from .sc_env_meta_entry import *
-from .sc_env_meta_entry_interface_version import *
-from .sc_env_meta_kind import *
-from .sc_error import *
-from .sc_error_code import *
-from .sc_error_type import *
-from .sc_map import *
-from .sc_map_entry import *
-from .sc_meta_entry import *
-from .sc_meta_kind import *
-from .sc_meta_v0 import *
-from .sc_nonce_key import *
-from .sc_spec_entry import *
-from .sc_spec_entry_kind import *
-from .sc_spec_event_data_format import *
-from .sc_spec_event_param_location_v0 import *
-from .sc_spec_event_param_v0 import *
-from .sc_spec_event_v0 import *
-from .sc_spec_function_input_v0 import *
-from .sc_spec_function_v0 import *
-from .sc_spec_type import *
-from .sc_spec_type_bytes_n import *
-from .sc_spec_type_def import *
-from .sc_spec_type_map import *
-from .sc_spec_type_option import *
-from .sc_spec_type_result import *
-from .sc_spec_type_tuple import *
-from .sc_spec_type_udt import *
-from .sc_spec_type_vec import *
-from .sc_spec_udt_enum_case_v0 import *
-from .sc_spec_udt_enum_v0 import *
-from .sc_spec_udt_error_enum_case_v0 import *
-from .sc_spec_udt_error_enum_v0 import *
-from .sc_spec_udt_struct_field_v0 import *
-from .sc_spec_udt_struct_v0 import *
-from .sc_spec_udt_union_case_tuple_v0 import *
-from .sc_spec_udt_union_case_v0 import *
-from .sc_spec_udt_union_case_v0_kind import *
-from .sc_spec_udt_union_case_void_v0 import *
-from .sc_spec_udt_union_v0 import *
-from .sc_string import *
-from .sc_symbol import *
-from .sc_val import *
-from .sc_val_type import *
-from .sc_vec import *
-from .scp_ballot import *
-from .scp_envelope import *
-from .scp_history_entry import *
-from .scp_history_entry_v0 import *
-from .scp_nomination import *
-from .scp_quorum_set import *
-from .scp_statement import *
-from .scp_statement_confirm import *
-from .scp_statement_externalize import *
-from .scp_statement_pledges import *
-from .scp_statement_prepare import *
-from .scp_statement_type import *
-from .send_more import *
-from .send_more_extended import *
-from .sequence_number import *
-from .serialized_binary_fuse_filter import *
-from .set_options_op import *
-from .set_options_result import *
-from .set_options_result_code import *
-from .set_trust_line_flags_op import *
-from .set_trust_line_flags_result import *
-from .set_trust_line_flags_result_code import *
-from .short_hash_seed import *
-from .signature import *
-from .signature_hint import *
-from .signed_time_sliced_survey_request_message import *
-from .signed_time_sliced_survey_response_message import *
-from .signed_time_sliced_survey_start_collecting_message import *
-from .signed_time_sliced_survey_stop_collecting_message import *
-from .signer import *
-from .signer_key import *
-from .signer_key_ed25519_signed_payload import *
-from .signer_key_type import *
-from .simple_payment_result import *
-from .soroban_address_credentials import *
-from .soroban_address_credentials_with_delegates import *
-from .soroban_authorization_entries import *
-from .soroban_authorization_entry import *
-from .soroban_authorized_function import *
-from .soroban_authorized_function_type import *
-from .soroban_authorized_invocation import *
-from .soroban_credentials import *
-from .soroban_credentials_type import *
-from .soroban_delegate_signature import *
-from .soroban_resources import *
-from .soroban_resources_ext_v0 import *
-from .soroban_transaction_data import *
-from .soroban_transaction_data_ext import *
-from .soroban_transaction_meta import *
-from .soroban_transaction_meta_ext import *
-from .soroban_transaction_meta_ext_v1 import *
-from .soroban_transaction_meta_v2 import *
-from .sponsorship_descriptor import *
-from .state_archival_settings import *
-from .stellar_message import *
-from .stellar_value import *
-from .stellar_value_ext import *
-from .stellar_value_type import *
-from .stored_debug_transaction_set import *
-from .stored_transaction_set import *
-from .string32 import *
-from .string64 import *
-from .survey_message_command_type import *
-from .survey_message_response_type import *
-from .survey_request_message import *
-from .survey_response_body import *
-from .survey_response_message import *
-from .threshold_indexes import *
-from .thresholds import *
-from .time_bounds import *
-from .time_point import *
-from .time_sliced_node_data import *
-from .time_sliced_peer_data import *
-from .time_sliced_peer_data_list import *
-from .time_sliced_survey_request_message import *
-from .time_sliced_survey_response_message import *
-from .time_sliced_survey_start_collecting_message import *
-from .time_sliced_survey_stop_collecting_message import *
-from .topology_response_body_v2 import *
-from .transaction import *
-from .transaction_envelope import *
-from .transaction_event import *
-from .transaction_event_stage import *
-from .transaction_ext import *
-from .transaction_history_entry import *
-from .transaction_history_entry_ext import *
-from .transaction_history_result_entry import *
-from .transaction_history_result_entry_ext import *
-from .transaction_meta import *
-from .transaction_meta_v1 import *
-from .transaction_meta_v2 import *
-from .transaction_meta_v3 import *
-from .transaction_meta_v4 import *
-from .transaction_phase import *
-from .transaction_result import *
-from .transaction_result_code import *
-from .transaction_result_ext import *
-from .transaction_result_meta import *
-from .transaction_result_meta_v1 import *
-from .transaction_result_pair import *
-from .transaction_result_result import *
-from .transaction_result_set import *
-from .transaction_set import *
-from .transaction_set_v1 import *
-from .transaction_signature_payload import *
-from .transaction_signature_payload_tagged_transaction import *
-from .transaction_v0 import *
-from .transaction_v0_envelope import *
-from .transaction_v0_ext import *
-from .transaction_v1_envelope import *
-from .trust_line_asset import *
-from .trust_line_entry import *
-from .trust_line_entry_ext import *
-from .trust_line_entry_extension_v2 import *
-from .trust_line_entry_extension_v2_ext import *
-from .trust_line_entry_v1 import *
-from .trust_line_entry_v1_ext import *
-from .trust_line_flags import *
-from .ttl_entry import *
-from .tx_advert_vector import *
-from .tx_demand_vector import *
-from .tx_set_component import *
-from .tx_set_component_txs_maybe_discounted_fee import *
-from .tx_set_component_type import *
-from .u_int128_parts import *
-from .u_int256_parts import *
-from .uint32 import *
-from .uint64 import *
-from .uint256 import *
-from .upgrade_entry_meta import *
-from .upgrade_type import *
-from .value import *
+from .stream import *
+
+if TYPE_CHECKING:
+    from .account_entry import *
+    from .account_entry_ext import *
+    from .account_entry_extension_v1 import *
+    from .account_entry_extension_v1_ext import *
+    from .account_entry_extension_v2 import *
+    from .account_entry_extension_v2_ext import *
+    from .account_entry_extension_v3 import *
+    from .account_flags import *
+    from .account_id import *
+    from .account_merge_result import *
+    from .account_merge_result_code import *
+    from .allow_trust_op import *
+    from .allow_trust_result import *
+    from .allow_trust_result_code import *
+    from .alpha_num4 import *
+    from .alpha_num12 import *
+    from .asset import *
+    from .asset_code import *
+    from .asset_code4 import *
+    from .asset_code12 import *
+    from .asset_type import *
+    from .auth import *
+    from .auth_cert import *
+    from .authenticated_message import *
+    from .authenticated_message_v0 import *
+    from .begin_sponsoring_future_reserves_op import *
+    from .begin_sponsoring_future_reserves_result import *
+    from .begin_sponsoring_future_reserves_result_code import *
+    from .binary_fuse_filter_type import *
+    from .bucket_entry import *
+    from .bucket_entry_type import *
+    from .bucket_list_type import *
+    from .bucket_metadata import *
+    from .bucket_metadata_ext import *
+    from .bump_sequence_op import *
+    from .bump_sequence_result import *
+    from .bump_sequence_result_code import *
+    from .change_trust_asset import *
+    from .change_trust_op import *
+    from .change_trust_result import *
+    from .change_trust_result_code import *
+    from .claim_atom import *
+    from .claim_atom_type import *
+    from .claim_claimable_balance_op import *
+    from .claim_claimable_balance_result import *
+    from .claim_claimable_balance_result_code import *
+    from .claim_liquidity_atom import *
+    from .claim_offer_atom import *
+    from .claim_offer_atom_v0 import *
+    from .claim_predicate import *
+    from .claim_predicate_type import *
+    from .claimable_balance_entry import *
+    from .claimable_balance_entry_ext import *
+    from .claimable_balance_entry_extension_v1 import *
+    from .claimable_balance_entry_extension_v1_ext import *
+    from .claimable_balance_flags import *
+    from .claimable_balance_id import *
+    from .claimable_balance_id_type import *
+    from .claimant import *
+    from .claimant_type import *
+    from .claimant_v0 import *
+    from .clawback_claimable_balance_op import *
+    from .clawback_claimable_balance_result import *
+    from .clawback_claimable_balance_result_code import *
+    from .clawback_op import *
+    from .clawback_result import *
+    from .clawback_result_code import *
+    from .config_setting_contract_bandwidth_v0 import *
+    from .config_setting_contract_compute_v0 import *
+    from .config_setting_contract_events_v0 import *
+    from .config_setting_contract_execution_lanes_v0 import *
+    from .config_setting_contract_historical_data_v0 import *
+    from .config_setting_contract_ledger_cost_ext_v0 import *
+    from .config_setting_contract_ledger_cost_v0 import *
+    from .config_setting_contract_parallel_compute_v0 import *
+    from .config_setting_entry import *
+    from .config_setting_id import *
+    from .config_setting_scp_timing import *
+    from .config_upgrade_set import *
+    from .config_upgrade_set_key import *
+    from .contract_code_cost_inputs import *
+    from .contract_code_entry import *
+    from .contract_code_entry_ext import *
+    from .contract_code_entry_v1 import *
+    from .contract_cost_param_entry import *
+    from .contract_cost_params import *
+    from .contract_cost_type import *
+    from .contract_data_durability import *
+    from .contract_data_entry import *
+    from .contract_event import *
+    from .contract_event_body import *
+    from .contract_event_type import *
+    from .contract_event_v0 import *
+    from .contract_executable import *
+    from .contract_executable_type import *
+    from .contract_id import *
+    from .contract_id_preimage import *
+    from .contract_id_preimage_from_address import *
+    from .contract_id_preimage_type import *
+    from .create_account_op import *
+    from .create_account_result import *
+    from .create_account_result_code import *
+    from .create_claimable_balance_op import *
+    from .create_claimable_balance_result import *
+    from .create_claimable_balance_result_code import *
+    from .create_contract_args import *
+    from .create_contract_args_v2 import *
+    from .create_passive_sell_offer_op import *
+    from .crypto_key_type import *
+    from .curve25519_public import *
+    from .curve25519_secret import *
+    from .data_entry import *
+    from .data_entry_ext import *
+    from .data_value import *
+    from .decorated_signature import *
+    from .dependent_tx_cluster import *
+    from .diagnostic_event import *
+    from .dont_have import *
+    from .duration import *
+    from .encoded_ledger_key import *
+    from .encrypted_body import *
+    from .end_sponsoring_future_reserves_result import *
+    from .end_sponsoring_future_reserves_result_code import *
+    from .envelope_type import *
+    from .error import *
+    from .error_code import *
+    from .eviction_iterator import *
+    from .extend_footprint_ttl_op import *
+    from .extend_footprint_ttl_result import *
+    from .extend_footprint_ttl_result_code import *
+    from .extension_point import *
+    from .fee_bump_transaction import *
+    from .fee_bump_transaction_envelope import *
+    from .fee_bump_transaction_ext import *
+    from .fee_bump_transaction_inner_tx import *
+    from .flood_advert import *
+    from .flood_demand import *
+    from .freeze_bypass_txs import *
+    from .freeze_bypass_txs_delta import *
+    from .frozen_ledger_keys import *
+    from .frozen_ledger_keys_delta import *
+    from .generalized_transaction_set import *
+    from .hash import *
+    from .hash_id_preimage import *
+    from .hash_id_preimage_contract_id import *
+    from .hash_id_preimage_operation_id import *
+    from .hash_id_preimage_revoke_id import *
+    from .hash_id_preimage_soroban_authorization import *
+    from .hash_id_preimage_soroban_authorization_with_address import *
+    from .hello import *
+    from .hmac_sha256_key import *
+    from .hmac_sha256_mac import *
+    from .host_function import *
+    from .host_function_type import *
+    from .hot_archive_bucket_entry import *
+    from .hot_archive_bucket_entry_type import *
+    from .inflation_payout import *
+    from .inflation_result import *
+    from .inflation_result_code import *
+    from .inner_transaction_result import *
+    from .inner_transaction_result_ext import *
+    from .inner_transaction_result_pair import *
+    from .inner_transaction_result_result import *
+    from .int32 import *
+    from .int64 import *
+    from .int128_parts import *
+    from .int256_parts import *
+    from .invoke_contract_args import *
+    from .invoke_host_function_op import *
+    from .invoke_host_function_result import *
+    from .invoke_host_function_result_code import *
+    from .invoke_host_function_success_pre_image import *
+    from .ip_addr_type import *
+    from .ledger_bounds import *
+    from .ledger_close_meta import *
+    from .ledger_close_meta_batch import *
+    from .ledger_close_meta_ext import *
+    from .ledger_close_meta_ext_v1 import *
+    from .ledger_close_meta_v0 import *
+    from .ledger_close_meta_v1 import *
+    from .ledger_close_meta_v2 import *
+    from .ledger_close_value_signature import *
+    from .ledger_entry import *
+    from .ledger_entry_change import *
+    from .ledger_entry_change_type import *
+    from .ledger_entry_changes import *
+    from .ledger_entry_data import *
+    from .ledger_entry_ext import *
+    from .ledger_entry_extension_v1 import *
+    from .ledger_entry_extension_v1_ext import *
+    from .ledger_entry_type import *
+    from .ledger_footprint import *
+    from .ledger_header import *
+    from .ledger_header_ext import *
+    from .ledger_header_extension_v1 import *
+    from .ledger_header_extension_v1_ext import *
+    from .ledger_header_flags import *
+    from .ledger_header_history_entry import *
+    from .ledger_header_history_entry_ext import *
+    from .ledger_key import *
+    from .ledger_key_account import *
+    from .ledger_key_claimable_balance import *
+    from .ledger_key_config_setting import *
+    from .ledger_key_contract_code import *
+    from .ledger_key_contract_data import *
+    from .ledger_key_data import *
+    from .ledger_key_liquidity_pool import *
+    from .ledger_key_offer import *
+    from .ledger_key_trust_line import *
+    from .ledger_key_ttl import *
+    from .ledger_scp_messages import *
+    from .ledger_upgrade import *
+    from .ledger_upgrade_type import *
+    from .liabilities import *
+    from .liquidity_pool_constant_product_parameters import *
+    from .liquidity_pool_deposit_op import *
+    from .liquidity_pool_deposit_result import *
+    from .liquidity_pool_deposit_result_code import *
+    from .liquidity_pool_entry import *
+    from .liquidity_pool_entry_body import *
+    from .liquidity_pool_entry_constant_product import *
+    from .liquidity_pool_parameters import *
+    from .liquidity_pool_type import *
+    from .liquidity_pool_withdraw_op import *
+    from .liquidity_pool_withdraw_result import *
+    from .liquidity_pool_withdraw_result_code import *
+    from .manage_buy_offer_op import *
+    from .manage_buy_offer_result import *
+    from .manage_buy_offer_result_code import *
+    from .manage_data_op import *
+    from .manage_data_result import *
+    from .manage_data_result_code import *
+    from .manage_offer_effect import *
+    from .manage_offer_success_result import *
+    from .manage_offer_success_result_offer import *
+    from .manage_sell_offer_op import *
+    from .manage_sell_offer_result import *
+    from .manage_sell_offer_result_code import *
+    from .memo import *
+    from .memo_type import *
+    from .message_type import *
+    from .muxed_account import *
+    from .muxed_account_med25519 import *
+    from .muxed_ed25519_account import *
+    from .node_id import *
+    from .offer_entry import *
+    from .offer_entry_ext import *
+    from .offer_entry_flags import *
+    from .operation import *
+    from .operation_body import *
+    from .operation_meta import *
+    from .operation_meta_v2 import *
+    from .operation_result import *
+    from .operation_result_code import *
+    from .operation_result_tr import *
+    from .operation_type import *
+    from .parallel_tx_execution_stage import *
+    from .parallel_txs_component import *
+    from .path_payment_strict_receive_op import *
+    from .path_payment_strict_receive_result import *
+    from .path_payment_strict_receive_result_code import *
+    from .path_payment_strict_receive_result_success import *
+    from .path_payment_strict_send_op import *
+    from .path_payment_strict_send_result import *
+    from .path_payment_strict_send_result_code import *
+    from .path_payment_strict_send_result_success import *
+    from .payment_op import *
+    from .payment_result import *
+    from .payment_result_code import *
+    from .peer_address import *
+    from .peer_address_ip import *
+    from .peer_stats import *
+    from .persisted_scp_state import *
+    from .persisted_scp_state_v0 import *
+    from .persisted_scp_state_v1 import *
+    from .pool_id import *
+    from .precondition_type import *
+    from .preconditions import *
+    from .preconditions_v2 import *
+    from .price import *
+    from .public_key import *
+    from .public_key_type import *
+    from .restore_footprint_op import *
+    from .restore_footprint_result import *
+    from .restore_footprint_result_code import *
+    from .revoke_sponsorship_op import *
+    from .revoke_sponsorship_op_signer import *
+    from .revoke_sponsorship_result import *
+    from .revoke_sponsorship_result_code import *
+    from .revoke_sponsorship_type import *
+    from .sc_address import *
+    from .sc_address_type import *
+    from .sc_bytes import *
+    from .sc_contract_instance import *
+    from .sc_env_meta_entry import *
+    from .sc_env_meta_entry_interface_version import *
+    from .sc_env_meta_kind import *
+    from .sc_error import *
+    from .sc_error_code import *
+    from .sc_error_type import *
+    from .sc_map import *
+    from .sc_map_entry import *
+    from .sc_meta_entry import *
+    from .sc_meta_kind import *
+    from .sc_meta_v0 import *
+    from .sc_nonce_key import *
+    from .sc_spec_entry import *
+    from .sc_spec_entry_kind import *
+    from .sc_spec_event_data_format import *
+    from .sc_spec_event_param_location_v0 import *
+    from .sc_spec_event_param_v0 import *
+    from .sc_spec_event_v0 import *
+    from .sc_spec_function_input_v0 import *
+    from .sc_spec_function_v0 import *
+    from .sc_spec_type import *
+    from .sc_spec_type_bytes_n import *
+    from .sc_spec_type_def import *
+    from .sc_spec_type_map import *
+    from .sc_spec_type_option import *
+    from .sc_spec_type_result import *
+    from .sc_spec_type_tuple import *
+    from .sc_spec_type_udt import *
+    from .sc_spec_type_vec import *
+    from .sc_spec_udt_enum_case_v0 import *
+    from .sc_spec_udt_enum_v0 import *
+    from .sc_spec_udt_error_enum_case_v0 import *
+    from .sc_spec_udt_error_enum_v0 import *
+    from .sc_spec_udt_struct_field_v0 import *
+    from .sc_spec_udt_struct_v0 import *
+    from .sc_spec_udt_union_case_tuple_v0 import *
+    from .sc_spec_udt_union_case_v0 import *
+    from .sc_spec_udt_union_case_v0_kind import *
+    from .sc_spec_udt_union_case_void_v0 import *
+    from .sc_spec_udt_union_v0 import *
+    from .sc_string import *
+    from .sc_symbol import *
+    from .sc_val import *
+    from .sc_val_type import *
+    from .sc_vec import *
+    from .scp_ballot import *
+    from .scp_envelope import *
+    from .scp_history_entry import *
+    from .scp_history_entry_v0 import *
+    from .scp_nomination import *
+    from .scp_quorum_set import *
+    from .scp_statement import *
+    from .scp_statement_confirm import *
+    from .scp_statement_externalize import *
+    from .scp_statement_pledges import *
+    from .scp_statement_prepare import *
+    from .scp_statement_type import *
+    from .send_more import *
+    from .send_more_extended import *
+    from .sequence_number import *
+    from .serialized_binary_fuse_filter import *
+    from .set_options_op import *
+    from .set_options_result import *
+    from .set_options_result_code import *
+    from .set_trust_line_flags_op import *
+    from .set_trust_line_flags_result import *
+    from .set_trust_line_flags_result_code import *
+    from .short_hash_seed import *
+    from .signature import *
+    from .signature_hint import *
+    from .signed_time_sliced_survey_request_message import *
+    from .signed_time_sliced_survey_response_message import *
+    from .signed_time_sliced_survey_start_collecting_message import *
+    from .signed_time_sliced_survey_stop_collecting_message import *
+    from .signer import *
+    from .signer_key import *
+    from .signer_key_ed25519_signed_payload import *
+    from .signer_key_type import *
+    from .simple_payment_result import *
+    from .soroban_address_credentials import *
+    from .soroban_address_credentials_with_delegates import *
+    from .soroban_authorization_entries import *
+    from .soroban_authorization_entry import *
+    from .soroban_authorized_function import *
+    from .soroban_authorized_function_type import *
+    from .soroban_authorized_invocation import *
+    from .soroban_credentials import *
+    from .soroban_credentials_type import *
+    from .soroban_delegate_signature import *
+    from .soroban_resources import *
+    from .soroban_resources_ext_v0 import *
+    from .soroban_transaction_data import *
+    from .soroban_transaction_data_ext import *
+    from .soroban_transaction_meta import *
+    from .soroban_transaction_meta_ext import *
+    from .soroban_transaction_meta_ext_v1 import *
+    from .soroban_transaction_meta_v2 import *
+    from .sponsorship_descriptor import *
+    from .state_archival_settings import *
+    from .stellar_message import *
+    from .stellar_value import *
+    from .stellar_value_ext import *
+    from .stellar_value_type import *
+    from .stored_debug_transaction_set import *
+    from .stored_transaction_set import *
+    from .string32 import *
+    from .string64 import *
+    from .survey_message_command_type import *
+    from .survey_message_response_type import *
+    from .survey_request_message import *
+    from .survey_response_body import *
+    from .survey_response_message import *
+    from .threshold_indexes import *
+    from .thresholds import *
+    from .time_bounds import *
+    from .time_point import *
+    from .time_sliced_node_data import *
+    from .time_sliced_peer_data import *
+    from .time_sliced_peer_data_list import *
+    from .time_sliced_survey_request_message import *
+    from .time_sliced_survey_response_message import *
+    from .time_sliced_survey_start_collecting_message import *
+    from .time_sliced_survey_stop_collecting_message import *
+    from .topology_response_body_v2 import *
+    from .transaction import *
+    from .transaction_envelope import *
+    from .transaction_event import *
+    from .transaction_event_stage import *
+    from .transaction_ext import *
+    from .transaction_history_entry import *
+    from .transaction_history_entry_ext import *
+    from .transaction_history_result_entry import *
+    from .transaction_history_result_entry_ext import *
+    from .transaction_meta import *
+    from .transaction_meta_v1 import *
+    from .transaction_meta_v2 import *
+    from .transaction_meta_v3 import *
+    from .transaction_meta_v4 import *
+    from .transaction_phase import *
+    from .transaction_result import *
+    from .transaction_result_code import *
+    from .transaction_result_ext import *
+    from .transaction_result_meta import *
+    from .transaction_result_meta_v1 import *
+    from .transaction_result_pair import *
+    from .transaction_result_result import *
+    from .transaction_result_set import *
+    from .transaction_set import *
+    from .transaction_set_v1 import *
+    from .transaction_signature_payload import *
+    from .transaction_signature_payload_tagged_transaction import *
+    from .transaction_v0 import *
+    from .transaction_v0_envelope import *
+    from .transaction_v0_ext import *
+    from .transaction_v1_envelope import *
+    from .trust_line_asset import *
+    from .trust_line_entry import *
+    from .trust_line_entry_ext import *
+    from .trust_line_entry_extension_v2 import *
+    from .trust_line_entry_extension_v2_ext import *
+    from .trust_line_entry_v1 import *
+    from .trust_line_entry_v1_ext import *
+    from .trust_line_flags import *
+    from .ttl_entry import *
+    from .tx_advert_vector import *
+    from .tx_demand_vector import *
+    from .tx_set_component import *
+    from .tx_set_component_txs_maybe_discounted_fee import *
+    from .tx_set_component_type import *
+    from .u_int128_parts import *
+    from .u_int256_parts import *
+    from .uint32 import *
+    from .uint64 import *
+    from .uint256 import *
+    from .upgrade_entry_meta import *
+    from .upgrade_type import *
+    from .value import *
+_LAZY_IMPORTS = {
+    "AccountEntry": "account_entry",
+    "AccountEntryExt": "account_entry_ext",
+    "AccountEntryExtensionV1": "account_entry_extension_v1",
+    "AccountEntryExtensionV1Ext": "account_entry_extension_v1_ext",
+    "AccountEntryExtensionV2": "account_entry_extension_v2",
+    "AccountEntryExtensionV2Ext": "account_entry_extension_v2_ext",
+    "AccountEntryExtensionV3": "account_entry_extension_v3",
+    "AccountFlags": "account_flags",
+    "AccountID": "account_id",
+    "AccountMergeResult": "account_merge_result",
+    "AccountMergeResultCode": "account_merge_result_code",
+    "AllowTrustOp": "allow_trust_op",
+    "AllowTrustResult": "allow_trust_result",
+    "AllowTrustResultCode": "allow_trust_result_code",
+    "AlphaNum4": "alpha_num4",
+    "AlphaNum12": "alpha_num12",
+    "Asset": "asset",
+    "AssetCode": "asset_code",
+    "AssetCode4": "asset_code4",
+    "AssetCode12": "asset_code12",
+    "AssetType": "asset_type",
+    "Auth": "auth",
+    "AuthCert": "auth_cert",
+    "AuthenticatedMessage": "authenticated_message",
+    "AuthenticatedMessageV0": "authenticated_message_v0",
+    "BeginSponsoringFutureReservesOp": "begin_sponsoring_future_reserves_op",
+    "BeginSponsoringFutureReservesResult": "begin_sponsoring_future_reserves_result",
+    "BeginSponsoringFutureReservesResultCode": "begin_sponsoring_future_reserves_result_code",
+    "BinaryFuseFilterType": "binary_fuse_filter_type",
+    "BucketEntry": "bucket_entry",
+    "BucketEntryType": "bucket_entry_type",
+    "BucketListType": "bucket_list_type",
+    "BucketMetadata": "bucket_metadata",
+    "BucketMetadataExt": "bucket_metadata_ext",
+    "BumpSequenceOp": "bump_sequence_op",
+    "BumpSequenceResult": "bump_sequence_result",
+    "BumpSequenceResultCode": "bump_sequence_result_code",
+    "ChangeTrustAsset": "change_trust_asset",
+    "ChangeTrustOp": "change_trust_op",
+    "ChangeTrustResult": "change_trust_result",
+    "ChangeTrustResultCode": "change_trust_result_code",
+    "ClaimAtom": "claim_atom",
+    "ClaimAtomType": "claim_atom_type",
+    "ClaimClaimableBalanceOp": "claim_claimable_balance_op",
+    "ClaimClaimableBalanceResult": "claim_claimable_balance_result",
+    "ClaimClaimableBalanceResultCode": "claim_claimable_balance_result_code",
+    "ClaimLiquidityAtom": "claim_liquidity_atom",
+    "ClaimOfferAtom": "claim_offer_atom",
+    "ClaimOfferAtomV0": "claim_offer_atom_v0",
+    "ClaimPredicate": "claim_predicate",
+    "ClaimPredicateType": "claim_predicate_type",
+    "ClaimableBalanceEntry": "claimable_balance_entry",
+    "ClaimableBalanceEntryExt": "claimable_balance_entry_ext",
+    "ClaimableBalanceEntryExtensionV1": "claimable_balance_entry_extension_v1",
+    "ClaimableBalanceEntryExtensionV1Ext": "claimable_balance_entry_extension_v1_ext",
+    "ClaimableBalanceFlags": "claimable_balance_flags",
+    "ClaimableBalanceID": "claimable_balance_id",
+    "ClaimableBalanceIDType": "claimable_balance_id_type",
+    "Claimant": "claimant",
+    "ClaimantType": "claimant_type",
+    "ClaimantV0": "claimant_v0",
+    "ClawbackClaimableBalanceOp": "clawback_claimable_balance_op",
+    "ClawbackClaimableBalanceResult": "clawback_claimable_balance_result",
+    "ClawbackClaimableBalanceResultCode": "clawback_claimable_balance_result_code",
+    "ClawbackOp": "clawback_op",
+    "ClawbackResult": "clawback_result",
+    "ClawbackResultCode": "clawback_result_code",
+    "ConfigSettingContractBandwidthV0": "config_setting_contract_bandwidth_v0",
+    "ConfigSettingContractComputeV0": "config_setting_contract_compute_v0",
+    "ConfigSettingContractEventsV0": "config_setting_contract_events_v0",
+    "ConfigSettingContractExecutionLanesV0": "config_setting_contract_execution_lanes_v0",
+    "ConfigSettingContractHistoricalDataV0": "config_setting_contract_historical_data_v0",
+    "ConfigSettingContractLedgerCostExtV0": "config_setting_contract_ledger_cost_ext_v0",
+    "ConfigSettingContractLedgerCostV0": "config_setting_contract_ledger_cost_v0",
+    "ConfigSettingContractParallelComputeV0": "config_setting_contract_parallel_compute_v0",
+    "ConfigSettingEntry": "config_setting_entry",
+    "ConfigSettingID": "config_setting_id",
+    "ConfigSettingSCPTiming": "config_setting_scp_timing",
+    "ConfigUpgradeSet": "config_upgrade_set",
+    "ConfigUpgradeSetKey": "config_upgrade_set_key",
+    "ContractCodeCostInputs": "contract_code_cost_inputs",
+    "ContractCodeEntry": "contract_code_entry",
+    "ContractCodeEntryExt": "contract_code_entry_ext",
+    "ContractCodeEntryV1": "contract_code_entry_v1",
+    "ContractCostParamEntry": "contract_cost_param_entry",
+    "ContractCostParams": "contract_cost_params",
+    "ContractCostType": "contract_cost_type",
+    "ContractDataDurability": "contract_data_durability",
+    "ContractDataEntry": "contract_data_entry",
+    "ContractEvent": "contract_event",
+    "ContractEventBody": "contract_event_body",
+    "ContractEventType": "contract_event_type",
+    "ContractEventV0": "contract_event_v0",
+    "ContractExecutable": "contract_executable",
+    "ContractExecutableType": "contract_executable_type",
+    "ContractID": "contract_id",
+    "ContractIDPreimage": "contract_id_preimage",
+    "ContractIDPreimageFromAddress": "contract_id_preimage_from_address",
+    "ContractIDPreimageType": "contract_id_preimage_type",
+    "CreateAccountOp": "create_account_op",
+    "CreateAccountResult": "create_account_result",
+    "CreateAccountResultCode": "create_account_result_code",
+    "CreateClaimableBalanceOp": "create_claimable_balance_op",
+    "CreateClaimableBalanceResult": "create_claimable_balance_result",
+    "CreateClaimableBalanceResultCode": "create_claimable_balance_result_code",
+    "CreateContractArgs": "create_contract_args",
+    "CreateContractArgsV2": "create_contract_args_v2",
+    "CreatePassiveSellOfferOp": "create_passive_sell_offer_op",
+    "CryptoKeyType": "crypto_key_type",
+    "Curve25519Public": "curve25519_public",
+    "Curve25519Secret": "curve25519_secret",
+    "DataEntry": "data_entry",
+    "DataEntryExt": "data_entry_ext",
+    "DataValue": "data_value",
+    "DecoratedSignature": "decorated_signature",
+    "DependentTxCluster": "dependent_tx_cluster",
+    "DiagnosticEvent": "diagnostic_event",
+    "DontHave": "dont_have",
+    "Duration": "duration",
+    "EncodedLedgerKey": "encoded_ledger_key",
+    "EncryptedBody": "encrypted_body",
+    "EndSponsoringFutureReservesResult": "end_sponsoring_future_reserves_result",
+    "EndSponsoringFutureReservesResultCode": "end_sponsoring_future_reserves_result_code",
+    "EnvelopeType": "envelope_type",
+    "Error": "error",
+    "ErrorCode": "error_code",
+    "EvictionIterator": "eviction_iterator",
+    "ExtendFootprintTTLOp": "extend_footprint_ttl_op",
+    "ExtendFootprintTTLResult": "extend_footprint_ttl_result",
+    "ExtendFootprintTTLResultCode": "extend_footprint_ttl_result_code",
+    "ExtensionPoint": "extension_point",
+    "FeeBumpTransaction": "fee_bump_transaction",
+    "FeeBumpTransactionEnvelope": "fee_bump_transaction_envelope",
+    "FeeBumpTransactionExt": "fee_bump_transaction_ext",
+    "FeeBumpTransactionInnerTx": "fee_bump_transaction_inner_tx",
+    "FloodAdvert": "flood_advert",
+    "FloodDemand": "flood_demand",
+    "FreezeBypassTxs": "freeze_bypass_txs",
+    "FreezeBypassTxsDelta": "freeze_bypass_txs_delta",
+    "FrozenLedgerKeys": "frozen_ledger_keys",
+    "FrozenLedgerKeysDelta": "frozen_ledger_keys_delta",
+    "GeneralizedTransactionSet": "generalized_transaction_set",
+    "Hash": "hash",
+    "HashIDPreimage": "hash_id_preimage",
+    "HashIDPreimageContractID": "hash_id_preimage_contract_id",
+    "HashIDPreimageOperationID": "hash_id_preimage_operation_id",
+    "HashIDPreimageRevokeID": "hash_id_preimage_revoke_id",
+    "HashIDPreimageSorobanAuthorization": "hash_id_preimage_soroban_authorization",
+    "HashIDPreimageSorobanAuthorizationWithAddress": "hash_id_preimage_soroban_authorization_with_address",
+    "Hello": "hello",
+    "HmacSha256Key": "hmac_sha256_key",
+    "HmacSha256Mac": "hmac_sha256_mac",
+    "HostFunction": "host_function",
+    "HostFunctionType": "host_function_type",
+    "HotArchiveBucketEntry": "hot_archive_bucket_entry",
+    "HotArchiveBucketEntryType": "hot_archive_bucket_entry_type",
+    "InflationPayout": "inflation_payout",
+    "InflationResult": "inflation_result",
+    "InflationResultCode": "inflation_result_code",
+    "InnerTransactionResult": "inner_transaction_result",
+    "InnerTransactionResultExt": "inner_transaction_result_ext",
+    "InnerTransactionResultPair": "inner_transaction_result_pair",
+    "InnerTransactionResultResult": "inner_transaction_result_result",
+    "Int32": "int32",
+    "Int64": "int64",
+    "Int128Parts": "int128_parts",
+    "Int256Parts": "int256_parts",
+    "InvokeContractArgs": "invoke_contract_args",
+    "InvokeHostFunctionOp": "invoke_host_function_op",
+    "InvokeHostFunctionResult": "invoke_host_function_result",
+    "InvokeHostFunctionResultCode": "invoke_host_function_result_code",
+    "InvokeHostFunctionSuccessPreImage": "invoke_host_function_success_pre_image",
+    "IPAddrType": "ip_addr_type",
+    "LedgerBounds": "ledger_bounds",
+    "LedgerCloseMeta": "ledger_close_meta",
+    "LedgerCloseMetaBatch": "ledger_close_meta_batch",
+    "LedgerCloseMetaExt": "ledger_close_meta_ext",
+    "LedgerCloseMetaExtV1": "ledger_close_meta_ext_v1",
+    "LedgerCloseMetaV0": "ledger_close_meta_v0",
+    "LedgerCloseMetaV1": "ledger_close_meta_v1",
+    "LedgerCloseMetaV2": "ledger_close_meta_v2",
+    "LedgerCloseValueSignature": "ledger_close_value_signature",
+    "LedgerEntry": "ledger_entry",
+    "LedgerEntryChange": "ledger_entry_change",
+    "LedgerEntryChangeType": "ledger_entry_change_type",
+    "LedgerEntryChanges": "ledger_entry_changes",
+    "LedgerEntryData": "ledger_entry_data",
+    "LedgerEntryExt": "ledger_entry_ext",
+    "LedgerEntryExtensionV1": "ledger_entry_extension_v1",
+    "LedgerEntryExtensionV1Ext": "ledger_entry_extension_v1_ext",
+    "LedgerEntryType": "ledger_entry_type",
+    "LedgerFootprint": "ledger_footprint",
+    "LedgerHeader": "ledger_header",
+    "LedgerHeaderExt": "ledger_header_ext",
+    "LedgerHeaderExtensionV1": "ledger_header_extension_v1",
+    "LedgerHeaderExtensionV1Ext": "ledger_header_extension_v1_ext",
+    "LedgerHeaderFlags": "ledger_header_flags",
+    "LedgerHeaderHistoryEntry": "ledger_header_history_entry",
+    "LedgerHeaderHistoryEntryExt": "ledger_header_history_entry_ext",
+    "LedgerKey": "ledger_key",
+    "LedgerKeyAccount": "ledger_key_account",
+    "LedgerKeyClaimableBalance": "ledger_key_claimable_balance",
+    "LedgerKeyConfigSetting": "ledger_key_config_setting",
+    "LedgerKeyContractCode": "ledger_key_contract_code",
+    "LedgerKeyContractData": "ledger_key_contract_data",
+    "LedgerKeyData": "ledger_key_data",
+    "LedgerKeyLiquidityPool": "ledger_key_liquidity_pool",
+    "LedgerKeyOffer": "ledger_key_offer",
+    "LedgerKeyTrustLine": "ledger_key_trust_line",
+    "LedgerKeyTtl": "ledger_key_ttl",
+    "LedgerSCPMessages": "ledger_scp_messages",
+    "LedgerUpgrade": "ledger_upgrade",
+    "LedgerUpgradeType": "ledger_upgrade_type",
+    "Liabilities": "liabilities",
+    "LiquidityPoolConstantProductParameters": "liquidity_pool_constant_product_parameters",
+    "LiquidityPoolDepositOp": "liquidity_pool_deposit_op",
+    "LiquidityPoolDepositResult": "liquidity_pool_deposit_result",
+    "LiquidityPoolDepositResultCode": "liquidity_pool_deposit_result_code",
+    "LiquidityPoolEntry": "liquidity_pool_entry",
+    "LiquidityPoolEntryBody": "liquidity_pool_entry_body",
+    "LiquidityPoolEntryConstantProduct": "liquidity_pool_entry_constant_product",
+    "LiquidityPoolParameters": "liquidity_pool_parameters",
+    "LiquidityPoolType": "liquidity_pool_type",
+    "LiquidityPoolWithdrawOp": "liquidity_pool_withdraw_op",
+    "LiquidityPoolWithdrawResult": "liquidity_pool_withdraw_result",
+    "LiquidityPoolWithdrawResultCode": "liquidity_pool_withdraw_result_code",
+    "ManageBuyOfferOp": "manage_buy_offer_op",
+    "ManageBuyOfferResult": "manage_buy_offer_result",
+    "ManageBuyOfferResultCode": "manage_buy_offer_result_code",
+    "ManageDataOp": "manage_data_op",
+    "ManageDataResult": "manage_data_result",
+    "ManageDataResultCode": "manage_data_result_code",
+    "ManageOfferEffect": "manage_offer_effect",
+    "ManageOfferSuccessResult": "manage_offer_success_result",
+    "ManageOfferSuccessResultOffer": "manage_offer_success_result_offer",
+    "ManageSellOfferOp": "manage_sell_offer_op",
+    "ManageSellOfferResult": "manage_sell_offer_result",
+    "ManageSellOfferResultCode": "manage_sell_offer_result_code",
+    "Memo": "memo",
+    "MemoType": "memo_type",
+    "MessageType": "message_type",
+    "MuxedAccount": "muxed_account",
+    "MuxedAccountMed25519": "muxed_account_med25519",
+    "MuxedEd25519Account": "muxed_ed25519_account",
+    "NodeID": "node_id",
+    "OfferEntry": "offer_entry",
+    "OfferEntryExt": "offer_entry_ext",
+    "OfferEntryFlags": "offer_entry_flags",
+    "Operation": "operation",
+    "OperationBody": "operation_body",
+    "OperationMeta": "operation_meta",
+    "OperationMetaV2": "operation_meta_v2",
+    "OperationResult": "operation_result",
+    "OperationResultCode": "operation_result_code",
+    "OperationResultTr": "operation_result_tr",
+    "OperationType": "operation_type",
+    "ParallelTxExecutionStage": "parallel_tx_execution_stage",
+    "ParallelTxsComponent": "parallel_txs_component",
+    "PathPaymentStrictReceiveOp": "path_payment_strict_receive_op",
+    "PathPaymentStrictReceiveResult": "path_payment_strict_receive_result",
+    "PathPaymentStrictReceiveResultCode": "path_payment_strict_receive_result_code",
+    "PathPaymentStrictReceiveResultSuccess": "path_payment_strict_receive_result_success",
+    "PathPaymentStrictSendOp": "path_payment_strict_send_op",
+    "PathPaymentStrictSendResult": "path_payment_strict_send_result",
+    "PathPaymentStrictSendResultCode": "path_payment_strict_send_result_code",
+    "PathPaymentStrictSendResultSuccess": "path_payment_strict_send_result_success",
+    "PaymentOp": "payment_op",
+    "PaymentResult": "payment_result",
+    "PaymentResultCode": "payment_result_code",
+    "PeerAddress": "peer_address",
+    "PeerAddressIp": "peer_address_ip",
+    "PeerStats": "peer_stats",
+    "PersistedSCPState": "persisted_scp_state",
+    "PersistedSCPStateV0": "persisted_scp_state_v0",
+    "PersistedSCPStateV1": "persisted_scp_state_v1",
+    "PoolID": "pool_id",
+    "PreconditionType": "precondition_type",
+    "Preconditions": "preconditions",
+    "PreconditionsV2": "preconditions_v2",
+    "Price": "price",
+    "PublicKey": "public_key",
+    "PublicKeyType": "public_key_type",
+    "RestoreFootprintOp": "restore_footprint_op",
+    "RestoreFootprintResult": "restore_footprint_result",
+    "RestoreFootprintResultCode": "restore_footprint_result_code",
+    "RevokeSponsorshipOp": "revoke_sponsorship_op",
+    "RevokeSponsorshipOpSigner": "revoke_sponsorship_op_signer",
+    "RevokeSponsorshipResult": "revoke_sponsorship_result",
+    "RevokeSponsorshipResultCode": "revoke_sponsorship_result_code",
+    "RevokeSponsorshipType": "revoke_sponsorship_type",
+    "SCAddress": "sc_address",
+    "SCAddressType": "sc_address_type",
+    "SCBytes": "sc_bytes",
+    "SCContractInstance": "sc_contract_instance",
+    "SCEnvMetaEntry": "sc_env_meta_entry",
+    "SCEnvMetaEntryInterfaceVersion": "sc_env_meta_entry_interface_version",
+    "SCEnvMetaKind": "sc_env_meta_kind",
+    "SCError": "sc_error",
+    "SCErrorCode": "sc_error_code",
+    "SCErrorType": "sc_error_type",
+    "SCMap": "sc_map",
+    "SCMapEntry": "sc_map_entry",
+    "SCMetaEntry": "sc_meta_entry",
+    "SCMetaKind": "sc_meta_kind",
+    "SCMetaV0": "sc_meta_v0",
+    "SCNonceKey": "sc_nonce_key",
+    "SCSpecEntry": "sc_spec_entry",
+    "SCSpecEntryKind": "sc_spec_entry_kind",
+    "SCSpecEventDataFormat": "sc_spec_event_data_format",
+    "SCSpecEventParamLocationV0": "sc_spec_event_param_location_v0",
+    "SCSpecEventParamV0": "sc_spec_event_param_v0",
+    "SCSpecEventV0": "sc_spec_event_v0",
+    "SCSpecFunctionInputV0": "sc_spec_function_input_v0",
+    "SCSpecFunctionV0": "sc_spec_function_v0",
+    "SCSpecType": "sc_spec_type",
+    "SCSpecTypeBytesN": "sc_spec_type_bytes_n",
+    "SCSpecTypeDef": "sc_spec_type_def",
+    "SCSpecTypeMap": "sc_spec_type_map",
+    "SCSpecTypeOption": "sc_spec_type_option",
+    "SCSpecTypeResult": "sc_spec_type_result",
+    "SCSpecTypeTuple": "sc_spec_type_tuple",
+    "SCSpecTypeUDT": "sc_spec_type_udt",
+    "SCSpecTypeVec": "sc_spec_type_vec",
+    "SCSpecUDTEnumCaseV0": "sc_spec_udt_enum_case_v0",
+    "SCSpecUDTEnumV0": "sc_spec_udt_enum_v0",
+    "SCSpecUDTErrorEnumCaseV0": "sc_spec_udt_error_enum_case_v0",
+    "SCSpecUDTErrorEnumV0": "sc_spec_udt_error_enum_v0",
+    "SCSpecUDTStructFieldV0": "sc_spec_udt_struct_field_v0",
+    "SCSpecUDTStructV0": "sc_spec_udt_struct_v0",
+    "SCSpecUDTUnionCaseTupleV0": "sc_spec_udt_union_case_tuple_v0",
+    "SCSpecUDTUnionCaseV0": "sc_spec_udt_union_case_v0",
+    "SCSpecUDTUnionCaseV0Kind": "sc_spec_udt_union_case_v0_kind",
+    "SCSpecUDTUnionCaseVoidV0": "sc_spec_udt_union_case_void_v0",
+    "SCSpecUDTUnionV0": "sc_spec_udt_union_v0",
+    "SCString": "sc_string",
+    "SCSymbol": "sc_symbol",
+    "SCVal": "sc_val",
+    "SCValType": "sc_val_type",
+    "SCVec": "sc_vec",
+    "SCPBallot": "scp_ballot",
+    "SCPEnvelope": "scp_envelope",
+    "SCPHistoryEntry": "scp_history_entry",
+    "SCPHistoryEntryV0": "scp_history_entry_v0",
+    "SCPNomination": "scp_nomination",
+    "SCPQuorumSet": "scp_quorum_set",
+    "SCPStatement": "scp_statement",
+    "SCPStatementConfirm": "scp_statement_confirm",
+    "SCPStatementExternalize": "scp_statement_externalize",
+    "SCPStatementPledges": "scp_statement_pledges",
+    "SCPStatementPrepare": "scp_statement_prepare",
+    "SCPStatementType": "scp_statement_type",
+    "SendMore": "send_more",
+    "SendMoreExtended": "send_more_extended",
+    "SequenceNumber": "sequence_number",
+    "SerializedBinaryFuseFilter": "serialized_binary_fuse_filter",
+    "SetOptionsOp": "set_options_op",
+    "SetOptionsResult": "set_options_result",
+    "SetOptionsResultCode": "set_options_result_code",
+    "SetTrustLineFlagsOp": "set_trust_line_flags_op",
+    "SetTrustLineFlagsResult": "set_trust_line_flags_result",
+    "SetTrustLineFlagsResultCode": "set_trust_line_flags_result_code",
+    "ShortHashSeed": "short_hash_seed",
+    "Signature": "signature",
+    "SignatureHint": "signature_hint",
+    "SignedTimeSlicedSurveyRequestMessage": "signed_time_sliced_survey_request_message",
+    "SignedTimeSlicedSurveyResponseMessage": "signed_time_sliced_survey_response_message",
+    "SignedTimeSlicedSurveyStartCollectingMessage": "signed_time_sliced_survey_start_collecting_message",
+    "SignedTimeSlicedSurveyStopCollectingMessage": "signed_time_sliced_survey_stop_collecting_message",
+    "Signer": "signer",
+    "SignerKey": "signer_key",
+    "SignerKeyEd25519SignedPayload": "signer_key_ed25519_signed_payload",
+    "SignerKeyType": "signer_key_type",
+    "SimplePaymentResult": "simple_payment_result",
+    "SorobanAddressCredentials": "soroban_address_credentials",
+    "SorobanAddressCredentialsWithDelegates": "soroban_address_credentials_with_delegates",
+    "SorobanAuthorizationEntries": "soroban_authorization_entries",
+    "SorobanAuthorizationEntry": "soroban_authorization_entry",
+    "SorobanAuthorizedFunction": "soroban_authorized_function",
+    "SorobanAuthorizedFunctionType": "soroban_authorized_function_type",
+    "SorobanAuthorizedInvocation": "soroban_authorized_invocation",
+    "SorobanCredentials": "soroban_credentials",
+    "SorobanCredentialsType": "soroban_credentials_type",
+    "SorobanDelegateSignature": "soroban_delegate_signature",
+    "SorobanResources": "soroban_resources",
+    "SorobanResourcesExtV0": "soroban_resources_ext_v0",
+    "SorobanTransactionData": "soroban_transaction_data",
+    "SorobanTransactionDataExt": "soroban_transaction_data_ext",
+    "SorobanTransactionMeta": "soroban_transaction_meta",
+    "SorobanTransactionMetaExt": "soroban_transaction_meta_ext",
+    "SorobanTransactionMetaExtV1": "soroban_transaction_meta_ext_v1",
+    "SorobanTransactionMetaV2": "soroban_transaction_meta_v2",
+    "SponsorshipDescriptor": "sponsorship_descriptor",
+    "StateArchivalSettings": "state_archival_settings",
+    "StellarMessage": "stellar_message",
+    "StellarValue": "stellar_value",
+    "StellarValueExt": "stellar_value_ext",
+    "StellarValueType": "stellar_value_type",
+    "StoredDebugTransactionSet": "stored_debug_transaction_set",
+    "StoredTransactionSet": "stored_transaction_set",
+    "String32": "string32",
+    "String64": "string64",
+    "SurveyMessageCommandType": "survey_message_command_type",
+    "SurveyMessageResponseType": "survey_message_response_type",
+    "SurveyRequestMessage": "survey_request_message",
+    "SurveyResponseBody": "survey_response_body",
+    "SurveyResponseMessage": "survey_response_message",
+    "ThresholdIndexes": "threshold_indexes",
+    "Thresholds": "thresholds",
+    "TimeBounds": "time_bounds",
+    "TimePoint": "time_point",
+    "TimeSlicedNodeData": "time_sliced_node_data",
+    "TimeSlicedPeerData": "time_sliced_peer_data",
+    "TimeSlicedPeerDataList": "time_sliced_peer_data_list",
+    "TimeSlicedSurveyRequestMessage": "time_sliced_survey_request_message",
+    "TimeSlicedSurveyResponseMessage": "time_sliced_survey_response_message",
+    "TimeSlicedSurveyStartCollectingMessage": "time_sliced_survey_start_collecting_message",
+    "TimeSlicedSurveyStopCollectingMessage": "time_sliced_survey_stop_collecting_message",
+    "TopologyResponseBodyV2": "topology_response_body_v2",
+    "Transaction": "transaction",
+    "TransactionEnvelope": "transaction_envelope",
+    "TransactionEvent": "transaction_event",
+    "TransactionEventStage": "transaction_event_stage",
+    "TransactionExt": "transaction_ext",
+    "TransactionHistoryEntry": "transaction_history_entry",
+    "TransactionHistoryEntryExt": "transaction_history_entry_ext",
+    "TransactionHistoryResultEntry": "transaction_history_result_entry",
+    "TransactionHistoryResultEntryExt": "transaction_history_result_entry_ext",
+    "TransactionMeta": "transaction_meta",
+    "TransactionMetaV1": "transaction_meta_v1",
+    "TransactionMetaV2": "transaction_meta_v2",
+    "TransactionMetaV3": "transaction_meta_v3",
+    "TransactionMetaV4": "transaction_meta_v4",
+    "TransactionPhase": "transaction_phase",
+    "TransactionResult": "transaction_result",
+    "TransactionResultCode": "transaction_result_code",
+    "TransactionResultExt": "transaction_result_ext",
+    "TransactionResultMeta": "transaction_result_meta",
+    "TransactionResultMetaV1": "transaction_result_meta_v1",
+    "TransactionResultPair": "transaction_result_pair",
+    "TransactionResultResult": "transaction_result_result",
+    "TransactionResultSet": "transaction_result_set",
+    "TransactionSet": "transaction_set",
+    "TransactionSetV1": "transaction_set_v1",
+    "TransactionSignaturePayload": "transaction_signature_payload",
+    "TransactionSignaturePayloadTaggedTransaction": "transaction_signature_payload_tagged_transaction",
+    "TransactionV0": "transaction_v0",
+    "TransactionV0Envelope": "transaction_v0_envelope",
+    "TransactionV0Ext": "transaction_v0_ext",
+    "TransactionV1Envelope": "transaction_v1_envelope",
+    "TrustLineAsset": "trust_line_asset",
+    "TrustLineEntry": "trust_line_entry",
+    "TrustLineEntryExt": "trust_line_entry_ext",
+    "TrustLineEntryExtensionV2": "trust_line_entry_extension_v2",
+    "TrustLineEntryExtensionV2Ext": "trust_line_entry_extension_v2_ext",
+    "TrustLineEntryV1": "trust_line_entry_v1",
+    "TrustLineEntryV1Ext": "trust_line_entry_v1_ext",
+    "TrustLineFlags": "trust_line_flags",
+    "TTLEntry": "ttl_entry",
+    "TxAdvertVector": "tx_advert_vector",
+    "TxDemandVector": "tx_demand_vector",
+    "TxSetComponent": "tx_set_component",
+    "TxSetComponentTxsMaybeDiscountedFee": "tx_set_component_txs_maybe_discounted_fee",
+    "TxSetComponentType": "tx_set_component_type",
+    "UInt128Parts": "u_int128_parts",
+    "UInt256Parts": "u_int256_parts",
+    "Uint32": "uint32",
+    "Uint64": "uint64",
+    "Uint256": "uint256",
+    "UpgradeEntryMeta": "upgrade_entry_meta",
+    "UpgradeType": "upgrade_type",
+    "Value": "value",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+
+
+__all__ = [
+    "AUTH_MSG_FLAG_FLOW_CONTROL_BYTES_REQUESTED",
+    "CONTRACT_COST_COUNT_LIMIT",
+    "DEFAULT_DECODE_CHUNK_SIZE",
+    "DEFAULT_MAX_RECORD_SIZE",
+    "DEFAULT_XDR_MAX_DEPTH",
+    "LIQUIDITY_POOL_FEE_V18",
+    "MASK_ACCOUNT_FLAGS",
+    "MASK_ACCOUNT_FLAGS_V17",
+    "MASK_CLAIMABLE_BALANCE_FLAGS",
+    "MASK_LEDGER_HEADER_FLAGS",
+    "MASK_OFFERENTRY_FLAGS",
+    "MASK_TRUSTLINE_FLAGS",
+    "MASK_TRUSTLINE_FLAGS_V13",
+    "MASK_TRUSTLINE_FLAGS_V17",
+    "MAX_OPS_PER_TX",
+    "MAX_SIGNERS",
+    "SCSYMBOL_LIMIT",
+    "SC_SPEC_DOC_LIMIT",
+    "TX_ADVERT_VECTOR_MAX_SIZE",
+    "TX_DEMAND_VECTOR_MAX_SIZE",
+    "ZERO_COPY_MIN_SIZE",
+    "AccountEntry",
+    "AccountEntryExt",
+    "AccountEntryExtensionV1",
+    "AccountEntryExtensionV1Ext",
+    "AccountEntryExtensionV2",
+    "AccountEntryExtensionV2Ext",
+    "AccountEntryExtensionV3",
+    "AccountFlags",
+    "AccountID",
+    "AccountMergeResult",
+    "AccountMergeResultCode",
+    "AllowTrustOp",
+    "AllowTrustResult",
+    "AllowTrustResultCode",
+    "AlphaNum4",
+    "AlphaNum12",
+    "Asset",
+    "AssetCode",
+    "AssetCode4",
+    "AssetCode12",
+    "AssetType",
+    "Auth",
+    "AuthCert",
+    "AuthenticatedMessage",
+    "AuthenticatedMessageV0",
+    "BeginSponsoringFutureReservesOp",
+    "BeginSponsoringFutureReservesResult",
+    "BeginSponsoringFutureReservesResultCode",
+    "BinaryFuseFilterType",
+    "Boolean",
+    "BucketEntry",
+    "BucketEntryType",
+    "BucketListType",
+    "BucketMetadata",
+    "BucketMetadataExt",
+    "BumpSequenceOp",
+    "BumpSequenceResult",
+    "BumpSequenceResultCode",
+    "ChangeTrustAsset",
+    "ChangeTrustOp",
+    "ChangeTrustResult",
+    "ChangeTrustResultCode",
+    "ClaimAtom",
+    "ClaimAtomType",
+    "ClaimClaimableBalanceOp",
+    "ClaimClaimableBalanceResult",
+    "ClaimClaimableBalanceResultCode",
+    "ClaimLiquidityAtom",
+    "ClaimOfferAtom",
+    "ClaimOfferAtomV0",
+    "ClaimPredicate",
+    "ClaimPredicateType",
+    "ClaimableBalanceEntry",
+    "ClaimableBalanceEntryExt",
+    "ClaimableBalanceEntryExtensionV1",
+    "ClaimableBalanceEntryExtensionV1Ext",
+    "ClaimableBalanceFlags",
+    "ClaimableBalanceID",
+    "ClaimableBalanceIDType",
+    "Claimant",
+    "ClaimantType",
+    "ClaimantV0",
+    "ClawbackClaimableBalanceOp",
+    "ClawbackClaimableBalanceResult",
+    "ClawbackClaimableBalanceResultCode",
+    "ClawbackOp",
+    "ClawbackResult",
+    "ClawbackResultCode",
+    "ConfigSettingContractBandwidthV0",
+    "ConfigSettingContractComputeV0",
+    "ConfigSettingContractEventsV0",
+    "ConfigSettingContractExecutionLanesV0",
+    "ConfigSettingContractHistoricalDataV0",
+    "ConfigSettingContractLedgerCostExtV0",
+    "ConfigSettingContractLedgerCostV0",
+    "ConfigSettingContractParallelComputeV0",
+    "ConfigSettingEntry",
+    "ConfigSettingID",
+    "ConfigSettingSCPTiming",
+    "ConfigUpgradeSet",
+    "ConfigUpgradeSetKey",
+    "ContractCodeCostInputs",
+    "ContractCodeEntry",
+    "ContractCodeEntryExt",
+    "ContractCodeEntryV1",
+    "ContractCostParamEntry",
+    "ContractCostParams",
+    "ContractCostType",
+    "ContractDataDurability",
+    "ContractDataEntry",
+    "ContractEvent",
+    "ContractEventBody",
+    "ContractEventType",
+    "ContractEventV0",
+    "ContractExecutable",
+    "ContractExecutableType",
+    "ContractID",
+    "ContractIDPreimage",
+    "ContractIDPreimageFromAddress",
+    "ContractIDPreimageType",
+    "CreateAccountOp",
+    "CreateAccountResult",
+    "CreateAccountResultCode",
+    "CreateClaimableBalanceOp",
+    "CreateClaimableBalanceResult",
+    "CreateClaimableBalanceResultCode",
+    "CreateContractArgs",
+    "CreateContractArgsV2",
+    "CreatePassiveSellOfferOp",
+    "CryptoKeyType",
+    "Curve25519Public",
+    "Curve25519Secret",
+    "DataEntry",
+    "DataEntryExt",
+    "DataValue",
+    "DecoratedSignature",
+    "DependentTxCluster",
+    "DiagnosticEvent",
+    "DontHave",
+    "Double",
+    "Duration",
+    "EncodedLedgerKey",
+    "EncryptedBody",
+    "EndSponsoringFutureReservesResult",
+    "EndSponsoringFutureReservesResultCode",
+    "EnvelopeType",
+    "Error",
+    "ErrorCode",
+    "EvictionIterator",
+    "ExtendFootprintTTLOp",
+    "ExtendFootprintTTLResult",
+    "ExtendFootprintTTLResultCode",
+    "ExtensionPoint",
+    "FeeBumpTransaction",
+    "FeeBumpTransactionEnvelope",
+    "FeeBumpTransactionExt",
+    "FeeBumpTransactionInnerTx",
+    "FixedLayout",
+    "Float",
+    "FloodAdvert",
+    "FloodDemand",
+    "FreezeBypassTxs",
+    "FreezeBypassTxsDelta",
+    "FrozenLedgerKeys",
+    "FrozenLedgerKeysDelta",
+    "FrozenXdr",
+    "GeneralizedTransactionSet",
+    "Hash",
+    "HashIDPreimage",
+    "HashIDPreimageContractID",
+    "HashIDPreimageOperationID",
+    "HashIDPreimageRevokeID",
+    "HashIDPreimageSorobanAuthorization",
+    "HashIDPreimageSorobanAuthorizationWithAddress",
+    "Hello",
+    "HmacSha256Key",
+    "HmacSha256Mac",
+    "HostFunction",
+    "HostFunctionType",
+    "HotArchiveBucketEntry",
+    "HotArchiveBucketEntryType",
+    "Hyper",
+    "IPAddrType",
+    "InflationPayout",
+    "InflationResult",
+    "InflationResultCode",
+    "InnerTransactionResult",
+    "InnerTransactionResultExt",
+    "InnerTransactionResultPair",
+    "InnerTransactionResultResult",
+    "Int32",
+    "Int64",
+    "Int128Parts",
+    "Int256Parts",
+    "Integer",
+    "InvokeContractArgs",
+    "InvokeHostFunctionOp",
+    "InvokeHostFunctionResult",
+    "InvokeHostFunctionResultCode",
+    "InvokeHostFunctionSuccessPreImage",
+    "LedgerBounds",
+    "LedgerCloseMeta",
+    "LedgerCloseMetaBatch",
+    "LedgerCloseMetaExt",
+    "LedgerCloseMetaExtV1",
+    "LedgerCloseMetaV0",
+    "LedgerCloseMetaV1",
+    "LedgerCloseMetaV2",
+    "LedgerCloseValueSignature",
+    "LedgerEntry",
+    "LedgerEntryChange",
+    "LedgerEntryChangeType",
+    "LedgerEntryChanges",
+    "LedgerEntryData",
+    "LedgerEntryExt",
+    "LedgerEntryExtensionV1",
+    "LedgerEntryExtensionV1Ext",
+    "LedgerEntryType",
+    "LedgerFootprint",
+    "LedgerHeader",
+    "LedgerHeaderExt",
+    "LedgerHeaderExtensionV1",
+    "LedgerHeaderExtensionV1Ext",
+    "LedgerHeaderFlags",
+    "LedgerHeaderHistoryEntry",
+    "LedgerHeaderHistoryEntryExt",
+    "LedgerKey",
+    "LedgerKeyAccount",
+    "LedgerKeyClaimableBalance",
+    "LedgerKeyConfigSetting",
+    "LedgerKeyContractCode",
+    "LedgerKeyContractData",
+    "LedgerKeyData",
+    "LedgerKeyLiquidityPool",
+    "LedgerKeyOffer",
+    "LedgerKeyTrustLine",
+    "LedgerKeyTtl",
+    "LedgerSCPMessages",
+    "LedgerUpgrade",
+    "LedgerUpgradeType",
+    "Liabilities",
+    "LiquidityPoolConstantProductParameters",
+    "LiquidityPoolDepositOp",
+    "LiquidityPoolDepositResult",
+    "LiquidityPoolDepositResultCode",
+    "LiquidityPoolEntry",
+    "LiquidityPoolEntryBody",
+    "LiquidityPoolEntryConstantProduct",
+    "LiquidityPoolParameters",
+    "LiquidityPoolType",
+    "LiquidityPoolWithdrawOp",
+    "LiquidityPoolWithdrawResult",
+    "LiquidityPoolWithdrawResultCode",
+    "ManageBuyOfferOp",
+    "ManageBuyOfferResult",
+    "ManageBuyOfferResultCode",
+    "ManageDataOp",
+    "ManageDataResult",
+    "ManageDataResultCode",
+    "ManageOfferEffect",
+    "ManageOfferSuccessResult",
+    "ManageOfferSuccessResultOffer",
+    "ManageSellOfferOp",
+    "ManageSellOfferResult",
+    "ManageSellOfferResultCode",
+    "Memo",
+    "MemoType",
+    "MessageType",
+    "MuxedAccount",
+    "MuxedAccountMed25519",
+    "MuxedEd25519Account",
+    "NodeID",
+    "OfferEntry",
+    "OfferEntryExt",
+    "OfferEntryFlags",
+    "Opaque",
+    "Operation",
+    "OperationBody",
+    "OperationMeta",
+    "OperationMetaV2",
+    "OperationResult",
+    "OperationResultCode",
+    "OperationResultTr",
+    "OperationType",
+    "ParallelTxExecutionStage",
+    "ParallelTxsComponent",
+    "PathPaymentStrictReceiveOp",
+    "PathPaymentStrictReceiveResult",
+    "PathPaymentStrictReceiveResultCode",
+    "PathPaymentStrictReceiveResultSuccess",
+    "PathPaymentStrictSendOp",
+    "PathPaymentStrictSendResult",
+    "PathPaymentStrictSendResultCode",
+    "PathPaymentStrictSendResultSuccess",
+    "PaymentOp",
+    "PaymentResult",
+    "PaymentResultCode",
+    "PeerAddress",
+    "PeerAddressIp",
+    "PeerStats",
+    "PersistedSCPState",
+    "PersistedSCPStateV0",
+    "PersistedSCPStateV1",
+    "PoolID",
+    "PreconditionType",
+    "Preconditions",
+    "PreconditionsV2",
+    "Price",
+    "PublicKey",
+    "PublicKeyType",
+    "RestoreFootprintOp",
+    "RestoreFootprintResult",
+    "RestoreFootprintResultCode",
+    "RevokeSponsorshipOp",
+    "RevokeSponsorshipOpSigner",
+    "RevokeSponsorshipResult",
+    "RevokeSponsorshipResultCode",
+    "RevokeSponsorshipType",
+    "SCAddress",
+    "SCAddressType",
+    "SCBytes",
+    "SCContractInstance",
+    "SCEnvMetaEntry",
+    "SCEnvMetaEntryInterfaceVersion",
+    "SCEnvMetaKind",
+    "SCError",
+    "SCErrorCode",
+    "SCErrorType",
+    "SCMap",
+    "SCMapEntry",
+    "SCMetaEntry",
+    "SCMetaKind",
+    "SCMetaV0",
+    "SCNonceKey",
+    "SCPBallot",
+    "SCPEnvelope",
+    "SCPHistoryEntry",
+    "SCPHistoryEntryV0",
+    "SCPNomination",
+    "SCPQuorumSet",
+    "SCPStatement",
+    "SCPStatementConfirm",
+    "SCPStatementExternalize",
+    "SCPStatementPledges",
+    "SCPStatementPrepare",
+    "SCPStatementType",
+    "SCSpecEntry",
+    "SCSpecEntryKind",
+    "SCSpecEventDataFormat",
+    "SCSpecEventParamLocationV0",
+    "SCSpecEventParamV0",
+    "SCSpecEventV0",
+    "SCSpecFunctionInputV0",
+    "SCSpecFunctionV0",
+    "SCSpecType",
+    "SCSpecTypeBytesN",
+    "SCSpecTypeDef",
+    "SCSpecTypeMap",
+    "SCSpecTypeOption",
+    "SCSpecTypeResult",
+    "SCSpecTypeTuple",
+    "SCSpecTypeUDT",
+    "SCSpecTypeVec",
+    "SCSpecUDTEnumCaseV0",
+    "SCSpecUDTEnumV0",
+    "SCSpecUDTErrorEnumCaseV0",
+    "SCSpecUDTErrorEnumV0",
+    "SCSpecUDTStructFieldV0",
+    "SCSpecUDTStructV0",
+    "SCSpecUDTUnionCaseTupleV0",
+    "SCSpecUDTUnionCaseV0",
+    "SCSpecUDTUnionCaseV0Kind",
+    "SCSpecUDTUnionCaseVoidV0",
+    "SCSpecUDTUnionV0",
+    "SCString",
+    "SCSymbol",
+    "SCVal",
+    "SCValType",
+    "SCVec",
+    "SendMore",
+    "SendMoreExtended",
+    "SequenceNumber",
+    "SerializedBinaryFuseFilter",
+    "SetOptionsOp",
+    "SetOptionsResult",
+    "SetOptionsResultCode",
+    "SetTrustLineFlagsOp",
+    "SetTrustLineFlagsResult",
+    "SetTrustLineFlagsResultCode",
+    "ShortHashSeed",
+    "Signature",
+    "SignatureHint",
+    "SignedTimeSlicedSurveyRequestMessage",
+    "SignedTimeSlicedSurveyResponseMessage",
+    "SignedTimeSlicedSurveyStartCollectingMessage",
+    "SignedTimeSlicedSurveyStopCollectingMessage",
+    "Signer",
+    "SignerKey",
+    "SignerKeyEd25519SignedPayload",
+    "SignerKeyType",
+    "SimplePaymentResult",
+    "SorobanAddressCredentials",
+    "SorobanAddressCredentialsWithDelegates",
+    "SorobanAuthorizationEntries",
+    "SorobanAuthorizationEntry",
+    "SorobanAuthorizedFunction",
+    "SorobanAuthorizedFunctionType",
+    "SorobanAuthorizedInvocation",
+    "SorobanCredentials",
+    "SorobanCredentialsType",
+    "SorobanDelegateSignature",
+    "SorobanResources",
+    "SorobanResourcesExtV0",
+    "SorobanTransactionData",
+    "SorobanTransactionDataExt",
+    "SorobanTransactionMeta",
+    "SorobanTransactionMetaExt",
+    "SorobanTransactionMetaExtV1",
+    "SorobanTransactionMetaV2",
+    "SponsorshipDescriptor",
+    "StateArchivalSettings",
+    "StellarMessage",
+    "StellarValue",
+    "StellarValueExt",
+    "StellarValueType",
+    "StoredDebugTransactionSet",
+    "StoredTransactionSet",
+    "String",
+    "String32",
+    "String64",
+    "SurveyMessageCommandType",
+    "SurveyMessageResponseType",
+    "SurveyRequestMessage",
+    "SurveyResponseBody",
+    "SurveyResponseMessage",
+    "TTLEntry",
+    "ThresholdIndexes",
+    "Thresholds",
+    "TimeBounds",
+    "TimePoint",
+    "TimeSlicedNodeData",
+    "TimeSlicedPeerData",
+    "TimeSlicedPeerDataList",
+    "TimeSlicedSurveyRequestMessage",
+    "TimeSlicedSurveyResponseMessage",
+    "TimeSlicedSurveyStartCollectingMessage",
+    "TimeSlicedSurveyStopCollectingMessage",
+    "TopologyResponseBodyV2",
+    "Transaction",
+    "TransactionEnvelope",
+    "TransactionEvent",
+    "TransactionEventStage",
+    "TransactionExt",
+    "TransactionHistoryEntry",
+    "TransactionHistoryEntryExt",
+    "TransactionHistoryResultEntry",
+    "TransactionHistoryResultEntryExt",
+    "TransactionMeta",
+    "TransactionMetaV1",
+    "TransactionMetaV2",
+    "TransactionMetaV3",
+    "TransactionMetaV4",
+    "TransactionPhase",
+    "TransactionResult",
+    "TransactionResultCode",
+    "TransactionResultExt",
+    "TransactionResultMeta",
+    "TransactionResultMetaV1",
+    "TransactionResultPair",
+    "TransactionResultResult",
+    "TransactionResultSet",
+    "TransactionSet",
+    "TransactionSetV1",
+    "TransactionSignaturePayload",
+    "TransactionSignaturePayloadTaggedTransaction",
+    "TransactionV0",
+    "TransactionV0Envelope",
+    "TransactionV0Ext",
+    "TransactionV1Envelope",
+    "TrustLineAsset",
+    "TrustLineEntry",
+    "TrustLineEntryExt",
+    "TrustLineEntryExtensionV2",
+    "TrustLineEntryExtensionV2Ext",
+    "TrustLineEntryV1",
+    "TrustLineEntryV1Ext",
+    "TrustLineFlags",
+    "TxAdvertVector",
+    "TxDemandVector",
+    "TxSetComponent",
+    "TxSetComponentTxsMaybeDiscountedFee",
+    "TxSetComponentType",
+    "UInt128Parts",
+    "UInt256Parts",
+    "Uint32",
+    "Uint64",
+    "Uint256",
+    "UnsignedHyper",
+    "UnsignedInteger",
+    "UpgradeEntryMeta",
+    "UpgradeType",
+    "Value",
+    "XdrBuffer",
+    "XdrSource",
+    "XdrView",
+    "decode_many",
+    "dump_xdr_json",
+    "iter_decode_many",
+    "iter_xdr_entries",
+    "iter_xdr_frames",
+    "iter_xdr_json",
+    "iter_xdr_records",
+    "make_frozen",
+    "make_unpacker",
+    "make_view",
+    "pack_xdr_record",
+    "set_json_backend",
+]
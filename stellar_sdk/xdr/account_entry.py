@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_entry_ext import AccountEntryExt
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import MAX_SIGNERS
 from .int64 import Int64
 from .sequence_number import SequenceNumber
@@ -55,6 +69,19 @@ class AccountEntry:
         };
     """
 
+    __slots__ = (
+        "account_id",
+        "balance",
+        "ext",
+        "flags",
+        "home_domain",
+        "inflation_dest",
+        "num_sub_entries",
+        "seq_num",
+        "signers",
+        "thresholds",
+    )
+
     def __init__(
         self,
         account_id: AccountID,
@@ -102,6 +129,18 @@ class AccountEntry:
             signers_item.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            28
+            + self.account_id.xdr_size()
+            + 4
+            + (self.inflation_dest.xdr_size() if self.inflation_dest is not None else 0)
+            + self.home_domain.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.signers)
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -143,16 +182,173 @@ class AccountEntry:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        SequenceNumber.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            AccountID.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        String32.skip(unpacker, depth_limit - 1)
+        Thresholds.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"signers length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Signer.skip(unpacker, depth_limit - 1)
+        AccountEntryExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "account_id" in fields:
+            _result["account_id"] = AccountID.unpack_fields(
+                unpacker, fields["account_id"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "balance" in fields:
+            _result["balance"] = Int64.unpack_fields(
+                unpacker, fields["balance"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "seq_num" in fields:
+            _result["seq_num"] = SequenceNumber.unpack_fields(
+                unpacker, fields["seq_num"], depth_limit - 1
+            )
+        else:
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        if "num_sub_entries" in fields:
+            _result["num_sub_entries"] = Uint32.unpack_fields(
+                unpacker, fields["num_sub_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "inflation_dest" in fields:
+            _result["inflation_dest"] = (
+                AccountID.unpack_fields(
+                    unpacker, fields["inflation_dest"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                AccountID.skip(unpacker, depth_limit - 1)
+        if "flags" in fields:
+            _result["flags"] = Uint32.unpack_fields(
+                unpacker, fields["flags"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "home_domain" in fields:
+            _result["home_domain"] = String32.unpack_fields(
+                unpacker, fields["home_domain"], depth_limit - 1
+            )
+        else:
+            String32.skip(unpacker, depth_limit - 1)
+        if "thresholds" in fields:
+            _result["thresholds"] = Thresholds.unpack_fields(
+                unpacker, fields["thresholds"], depth_limit - 1
+            )
+        else:
+            Thresholds.skip(unpacker, depth_limit - 1)
+        if "signers" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"signers length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["signers"] = []
+            for _ in range(length):
+                _result["signers"].append(
+                    Signer.unpack_fields(unpacker, fields["signers"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"signers length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Signer.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = AccountEntryExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            AccountEntryExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "account_id", AccountID.unpack(unpacker, depth_limit - 1)
+        yield "balance", Int64.unpack(unpacker, depth_limit - 1)
+        yield "seq_num", SequenceNumber.unpack(unpacker, depth_limit - 1)
+        yield "num_sub_entries", Uint32.unpack(unpacker, depth_limit - 1)
+        yield (
+            "inflation_dest",
+            AccountID.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield "flags", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "home_domain", String32.unpack(unpacker, depth_limit - 1)
+        yield "thresholds", Thresholds.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"signers length {length} exceeds remaining input length {_remaining}"
+            )
+        signers = []
+        for _ in range(length):
+            signers.append(Signer.unpack(unpacker, depth_limit - 1))
+        yield "signers", signers
+        yield "ext", view_at(AccountEntryExt, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AccountEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -167,11 +363,11 @@ class AccountEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -218,6 +414,56 @@ class AccountEntry:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"account_id": ')
+        self.account_id._write_json(write)
+        write(', "balance": ')
+        self.balance._write_json(write)
+        write(', "seq_num": ')
+        self.seq_num._write_json(write)
+        write(', "num_sub_entries": ')
+        self.num_sub_entries._write_json(write)
+        write(', "inflation_dest": ')
+        if self.inflation_dest is None:
+            write("null")
+        else:
+            self.inflation_dest._write_json(write)
+        write(', "flags": ')
+        self.flags._write_json(write)
+        write(', "home_domain": ')
+        self.home_domain._write_json(write)
+        write(', "thresholds": ')
+        self.thresholds._write_json(write)
+        write(', "signers": ')
+        write_json_array(write, self.signers)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AccountEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.account_id = self.account_id.clone()
+        result.balance = self.balance.clone()
+        result.seq_num = self.seq_num.clone()
+        result.num_sub_entries = self.num_sub_entries.clone()
+        result.inflation_dest = (
+            self.inflation_dest.clone() if self.inflation_dest is not None else None
+        )
+        result.flags = self.flags.clone()
+        result.home_domain = self.home_domain.clone()
+        result.thresholds = self.thresholds.clone()
+        result.signers = [item.clone() for item in self.signers]
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountEntry:
+        return self.clone()
+
+    def freeze(self) -> AccountEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_entry_extension_v1_ext import AccountEntryExtensionV1Ext
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .liabilities import Liabilities
 
 __all__ = ["AccountEntryExtensionV1"]
@@ -33,6 +46,8 @@ class AccountEntryExtensionV1:
         };
     """
 
+    __slots__ = ("ext", "liabilities")
+
     def __init__(
         self,
         liabilities: Liabilities,
@@ -45,6 +60,9 @@ class AccountEntryExtensionV1:
         self.liabilities.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 16 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -58,16 +76,69 @@ class AccountEntryExtensionV1:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Liabilities.skip(unpacker, depth_limit - 1)
+        AccountEntryExtensionV1Ext.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountEntryExtensionV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "liabilities" in fields:
+            _result["liabilities"] = Liabilities.unpack_fields(
+                unpacker, fields["liabilities"], depth_limit - 1
+            )
+        else:
+            Liabilities.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = AccountEntryExtensionV1Ext.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            AccountEntryExtensionV1Ext.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "liabilities", Liabilities.unpack(unpacker, depth_limit - 1)
+        yield "ext", view_at(AccountEntryExtensionV1Ext, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountEntryExtensionV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AccountEntryExtensionV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +153,11 @@ class AccountEntryExtensionV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountEntryExtensionV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -103,6 +174,27 @@ class AccountEntryExtensionV1:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"liabilities": ')
+        self.liabilities._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AccountEntryExtensionV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.liabilities = self.liabilities.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountEntryExtensionV1:
+        return self.clone()
+
+    def freeze(self) -> AccountEntryExtensionV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_entry_extension_v2 import AccountEntryExtensionV2
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 
 __all__ = ["AccountEntryExtensionV1Ext"]
 
@@ -26,6 +40,8 @@ class AccountEntryExtensionV1Ext:
             }
     """
 
+    __slots__ = ("v", "v2")
+
     def __init__(
         self,
         v: int,
@@ -45,18 +61,87 @@ class AccountEntryExtensionV1Ext:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            return 4
+        if self.v == 2:
+            assert self.v2 is not None
+            return 4 + self.v2.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> AccountEntryExtensionV1Ext:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
         if v == 0:
-            return cls(v=v)
+            return
         if v == 2:
-            v2 = AccountEntryExtensionV2.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v2=v2)
+            AccountEntryExtensionV2.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountEntryExtensionV1Ext:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            return _result
+        if v == 2:
+            if "v2" in fields:
+                _result["v2"] = AccountEntryExtensionV2.unpack_fields(
+                    unpacker, fields["v2"], depth_limit - 1
+                )
+            else:
+                AccountEntryExtensionV2.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        yield "v", v
+        if v == 0:
+            return
+        if v == 2:
+            yield "v2", view_at(AccountEntryExtensionV2, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -65,10 +150,12 @@ class AccountEntryExtensionV1Ext:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountEntryExtensionV1Ext:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AccountEntryExtensionV1Ext:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +170,11 @@ class AccountEntryExtensionV1Ext:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountEntryExtensionV1Ext:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -117,6 +204,32 @@ class AccountEntryExtensionV1Ext:
             return cls(v=v, v2=v2)
         raise ValueError(f"Unknown key '{key}' for AccountEntryExtensionV1Ext")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            write('"v0"')
+            return
+        if self.v == 2:
+            assert self.v2 is not None
+            write('{"v2": ')
+            self.v2._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in AccountEntryExtensionV1Ext: {self.v}")
+
+    def clone(self, deep: bool = True) -> AccountEntryExtensionV1Ext:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.v2 = self.v2.clone() if self.v2 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountEntryExtensionV1Ext:
+        return self.clone()
+
+    def freeze(self) -> AccountEntryExtensionV1Ext:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -136,3 +249,22 @@ class AccountEntryExtensionV1Ext:
         if self.v2 is not None:
             out.append(f"v2={self.v2}")
         return f"<AccountEntryExtensionV1Ext [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> AccountEntryExtensionV1Ext:
+    return cls(v=v)
+
+
+def _unpack_v2(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> AccountEntryExtensionV1Ext:
+    v2 = AccountEntryExtensionV2.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v2=v2)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_void,
+    2: _unpack_v2,
+}
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_entry_extension_v2_ext import AccountEntryExtensionV2Ext
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import MAX_SIGNERS
 from .sponsorship_descriptor import SponsorshipDescriptor
 from .uint32 import Uint32
@@ -37,6 +50,8 @@ class AccountEntryExtensionV2:
         };
     """
 
+    __slots__ = ("ext", "num_sponsored", "num_sponsoring", "signer_sponsoring_i_ds")
+
     def __init__(
         self,
         num_sponsored: Uint32,
@@ -62,6 +77,14 @@ class AccountEntryExtensionV2:
             signer_sponsoring_i_ds_item.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            8
+            + 4
+            + sum(item.xdr_size() for item in self.signer_sponsoring_i_ds)
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -89,16 +112,120 @@ class AccountEntryExtensionV2:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"signer_sponsoring_i_ds length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SponsorshipDescriptor.skip(unpacker, depth_limit - 1)
+        AccountEntryExtensionV2Ext.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountEntryExtensionV2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "num_sponsored" in fields:
+            _result["num_sponsored"] = Uint32.unpack_fields(
+                unpacker, fields["num_sponsored"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "num_sponsoring" in fields:
+            _result["num_sponsoring"] = Uint32.unpack_fields(
+                unpacker, fields["num_sponsoring"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "signer_sponsoring_i_ds" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"signer_sponsoring_i_ds length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["signer_sponsoring_i_ds"] = []
+            for _ in range(length):
+                _result["signer_sponsoring_i_ds"].append(
+                    SponsorshipDescriptor.unpack_fields(
+                        unpacker, fields["signer_sponsoring_i_ds"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"signer_sponsoring_i_ds length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SponsorshipDescriptor.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = AccountEntryExtensionV2Ext.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            AccountEntryExtensionV2Ext.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "num_sponsored", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "num_sponsoring", Uint32.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"signer_sponsoring_i_ds length {length} exceeds remaining input length {_remaining}"
+            )
+        signer_sponsoring_i_ds = []
+        for _ in range(length):
+            signer_sponsoring_i_ds.append(
+                SponsorshipDescriptor.unpack(unpacker, depth_limit - 1)
+            )
+        yield "signer_sponsoring_i_ds", signer_sponsoring_i_ds
+        yield "ext", AccountEntryExtensionV2Ext.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountEntryExtensionV2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AccountEntryExtensionV2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -113,11 +240,11 @@ class AccountEntryExtensionV2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountEntryExtensionV2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -145,6 +272,35 @@ class AccountEntryExtensionV2:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"num_sponsored": ')
+        self.num_sponsored._write_json(write)
+        write(', "num_sponsoring": ')
+        self.num_sponsoring._write_json(write)
+        write(', "signer_sponsoring_i_ds": ')
+        write_json_array(write, self.signer_sponsoring_i_ds)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AccountEntryExtensionV2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.num_sponsored = self.num_sponsored.clone()
+        result.num_sponsoring = self.num_sponsoring.clone()
+        result.signer_sponsoring_i_ds = [
+            item.clone() for item in self.signer_sponsoring_i_ds
+        ]
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountEntryExtensionV2:
+        return self.clone()
+
+    def freeze(self) -> AccountEntryExtensionV2:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
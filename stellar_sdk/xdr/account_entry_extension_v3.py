@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .extension_point import ExtensionPoint
 from .time_point import TimePoint
 from .uint32 import Uint32
@@ -33,6 +43,8 @@ class AccountEntryExtensionV3:
         };
     """
 
+    __slots__ = ("ext", "seq_ledger", "seq_time")
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -48,6 +60,9 @@ class AccountEntryExtensionV3:
         self.seq_ledger.pack(packer)
         self.seq_time.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 12 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -63,16 +78,65 @@ class AccountEntryExtensionV3:
             seq_time=seq_time,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        TimePoint.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountEntryExtensionV3:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "seq_ledger" in fields:
+            _result["seq_ledger"] = Uint32.unpack_fields(
+                unpacker, fields["seq_ledger"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "seq_time" in fields:
+            _result["seq_time"] = TimePoint.unpack_fields(
+                unpacker, fields["seq_time"], depth_limit - 1
+            )
+        else:
+            TimePoint.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountEntryExtensionV3:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AccountEntryExtensionV3:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -87,11 +151,11 @@ class AccountEntryExtensionV3:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountEntryExtensionV3:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -111,6 +175,30 @@ class AccountEntryExtensionV3:
             seq_time=seq_time,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "seq_ledger": ')
+        self.seq_ledger._write_json(write)
+        write(', "seq_time": ')
+        self.seq_time._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AccountEntryExtensionV3:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.seq_ledger = self.seq_ledger.clone()
+        result.seq_time = self.seq_time.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountEntryExtensionV3:
+        return self.clone()
+
+    def freeze(self) -> AccountEntryExtensionV3:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
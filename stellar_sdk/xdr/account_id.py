@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .public_key import PublicKey
 
 __all__ = ["AccountID"]
@@ -20,12 +31,17 @@ class AccountID:
         typedef PublicKey AccountID;
     """
 
+    __slots__ = ("account_id",)
+
     def __init__(self, account_id: PublicKey) -> None:
         self.account_id = account_id
 
     def pack(self, packer: Packer) -> None:
         self.account_id.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.account_id.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -35,16 +51,49 @@ class AccountID:
         account_id = PublicKey.unpack(unpacker, depth_limit - 1)
         return cls(account_id)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        PublicKey.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountID:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "account_id" in fields:
+            _result["account_id"] = PublicKey.unpack_fields(
+                unpacker, fields["account_id"], depth_limit - 1
+            )
+        else:
+            PublicKey.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountID:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AccountID:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -59,11 +108,11 @@ class AccountID:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountID:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         from ..strkey import StrKey
@@ -83,6 +132,22 @@ class AccountID:
             PublicKey(type=PublicKeyType.PUBLIC_KEY_TYPE_ED25519, ed25519=Uint256(raw))
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> AccountID:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.account_id = self.account_id.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountID:
+        return self.clone()
+
+    def freeze(self) -> AccountID:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.account_id,))
 
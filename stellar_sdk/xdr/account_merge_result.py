@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_merge_result_code import AccountMergeResultCode
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
 __all__ = ["AccountMergeResult"]
@@ -33,6 +43,8 @@ class AccountMergeResult:
         };
     """
 
+    __slots__ = ("code", "source_account_balance")
+
     def __init__(
         self,
         code: AccountMergeResultCode,
@@ -64,42 +76,119 @@ class AccountMergeResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_SUCCESS:
+            return 12
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_MALFORMED:
+            return 4
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_NO_ACCOUNT:
+            return 4
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_IMMUTABLE_SET:
+            return 4
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_HAS_SUB_ENTRIES:
+            return 4
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_SEQNUM_TOO_FAR:
+            return 4
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_DEST_FULL:
+            return 4
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_IS_SPONSOR:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> AccountMergeResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = AccountMergeResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = AccountMergeResultCode.unpack(unpacker)
         if code == AccountMergeResultCode.ACCOUNT_MERGE_SUCCESS:
-            source_account_balance = Int64.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, source_account_balance=source_account_balance)
+            Int64.skip(unpacker, depth_limit - 1)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_MALFORMED:
-            return cls(code=code)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_NO_ACCOUNT:
-            return cls(code=code)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_IMMUTABLE_SET:
-            return cls(code=code)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_HAS_SUB_ENTRIES:
-            return cls(code=code)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_SEQNUM_TOO_FAR:
-            return cls(code=code)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_DEST_FULL:
-            return cls(code=code)
+            return
         if code == AccountMergeResultCode.ACCOUNT_MERGE_IS_SPONSOR:
-            return cls(code=code)
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AccountMergeResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = AccountMergeResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_SUCCESS:
+            if "source_account_balance" in fields:
+                _result["source_account_balance"] = Int64.unpack_fields(
+                    unpacker, fields["source_account_balance"], depth_limit - 1
+                )
+            else:
+                Int64.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_MALFORMED:
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_NO_ACCOUNT:
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_IMMUTABLE_SET:
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_HAS_SUB_ENTRIES:
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_SEQNUM_TOO_FAR:
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_DEST_FULL:
+            return _result
+        if code == AccountMergeResultCode.ACCOUNT_MERGE_IS_SPONSOR:
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AccountMergeResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AccountMergeResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -114,11 +203,11 @@ class AccountMergeResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AccountMergeResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == AccountMergeResultCode.ACCOUNT_MERGE_SUCCESS:
@@ -168,6 +257,54 @@ class AccountMergeResult:
             return cls(code=code, source_account_balance=source_account_balance)
         raise ValueError(f"Unknown key '{key}' for AccountMergeResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_SUCCESS:
+            assert self.source_account_balance is not None
+            write('{"success": ')
+            self.source_account_balance._write_json(write)
+            write("}")
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_NO_ACCOUNT:
+            write('"no_account"')
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_IMMUTABLE_SET:
+            write('"immutable_set"')
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_HAS_SUB_ENTRIES:
+            write('"has_sub_entries"')
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_SEQNUM_TOO_FAR:
+            write('"seqnum_too_far"')
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_DEST_FULL:
+            write('"dest_full"')
+            return
+        if self.code == AccountMergeResultCode.ACCOUNT_MERGE_IS_SPONSOR:
+            write('"is_sponsor"')
+            return
+        raise ValueError(f"Unknown code in AccountMergeResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> AccountMergeResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.source_account_balance = (
+            self.source_account_balance.clone()
+            if self.source_account_balance is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AccountMergeResult:
+        return self.clone()
+
+    def freeze(self) -> AccountMergeResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -190,3 +327,26 @@ class AccountMergeResult:
         if self.source_account_balance is not None:
             out.append(f"source_account_balance={self.source_account_balance}")
         return f"<AccountMergeResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> AccountMergeResult:
+    return cls(code=code)
+
+
+def _unpack_source_account_balance(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> AccountMergeResult:
+    source_account_balance = Int64.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, source_account_balance=source_account_balance)
+
+
+_UNPACK_ARMS = {
+    AccountMergeResultCode.ACCOUNT_MERGE_SUCCESS: _unpack_source_account_balance,
+    AccountMergeResultCode.ACCOUNT_MERGE_MALFORMED: _unpack_void,
+    AccountMergeResultCode.ACCOUNT_MERGE_NO_ACCOUNT: _unpack_void,
+    AccountMergeResultCode.ACCOUNT_MERGE_IMMUTABLE_SET: _unpack_void,
+    AccountMergeResultCode.ACCOUNT_MERGE_HAS_SUB_ENTRIES: _unpack_void,
+    AccountMergeResultCode.ACCOUNT_MERGE_SEQNUM_TOO_FAR: _unpack_void,
+    AccountMergeResultCode.ACCOUNT_MERGE_DEST_FULL: _unpack_void,
+    AccountMergeResultCode.ACCOUNT_MERGE_IS_SPONSOR: _unpack_void,
+}
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
 from .asset_code import AssetCode
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
 __all__ = ["AllowTrustOp"]
@@ -29,6 +39,8 @@ class AllowTrustOp:
         };
     """
 
+    __slots__ = ("asset", "authorize", "trustor")
+
     def __init__(
         self,
         trustor: AccountID,
@@ -44,6 +56,9 @@ class AllowTrustOp:
         self.asset.pack(packer)
         self.authorize.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.trustor.xdr_size() + self.asset.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -59,16 +74,63 @@ class AllowTrustOp:
             authorize=authorize,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        AssetCode.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AllowTrustOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "trustor" in fields:
+            _result["trustor"] = AccountID.unpack_fields(
+                unpacker, fields["trustor"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "asset" in fields:
+            _result["asset"] = AssetCode.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            AssetCode.skip(unpacker, depth_limit - 1)
+        if "authorize" in fields:
+            _result["authorize"] = Uint32.unpack_fields(
+                unpacker, fields["authorize"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AllowTrustOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AllowTrustOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +145,11 @@ class AllowTrustOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AllowTrustOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -107,6 +169,30 @@ class AllowTrustOp:
             authorize=authorize,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"trustor": ')
+        self.trustor._write_json(write)
+        write(', "asset": ')
+        self.asset._write_json(write)
+        write(', "authorize": ')
+        self.authorize._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AllowTrustOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.trustor = self.trustor.clone()
+        result.asset = self.asset.clone()
+        result.authorize = self.authorize.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AllowTrustOp:
+        return self.clone()
+
+    def freeze(self) -> AllowTrustOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
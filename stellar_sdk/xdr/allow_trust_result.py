@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .allow_trust_result_code import AllowTrustResultCode
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["AllowTrustResult"]
 
@@ -31,6 +41,8 @@ class AllowTrustResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: AllowTrustResultCode,
@@ -55,6 +67,23 @@ class AllowTrustResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_SUCCESS:
+            return 4
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_MALFORMED:
+            return 4
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_NO_TRUST_LINE:
+            return 4
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_TRUST_NOT_REQUIRED:
+            return 4
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_CANT_REVOKE:
+            return 4
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_SELF_NOT_ALLOWED:
+            return 4
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_LOW_RESERVE:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -62,32 +91,82 @@ class AllowTrustResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = AllowTrustResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = AllowTrustResultCode.unpack(unpacker)
+        if code == AllowTrustResultCode.ALLOW_TRUST_SUCCESS:
+            return
+        if code == AllowTrustResultCode.ALLOW_TRUST_MALFORMED:
+            return
+        if code == AllowTrustResultCode.ALLOW_TRUST_NO_TRUST_LINE:
+            return
+        if code == AllowTrustResultCode.ALLOW_TRUST_TRUST_NOT_REQUIRED:
+            return
+        if code == AllowTrustResultCode.ALLOW_TRUST_CANT_REVOKE:
+            return
+        if code == AllowTrustResultCode.ALLOW_TRUST_SELF_NOT_ALLOWED:
+            return
+        if code == AllowTrustResultCode.ALLOW_TRUST_LOW_RESERVE:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AllowTrustResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = AllowTrustResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == AllowTrustResultCode.ALLOW_TRUST_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == AllowTrustResultCode.ALLOW_TRUST_MALFORMED:
-            return cls(code=code)
+            return _result
         if code == AllowTrustResultCode.ALLOW_TRUST_NO_TRUST_LINE:
-            return cls(code=code)
+            return _result
         if code == AllowTrustResultCode.ALLOW_TRUST_TRUST_NOT_REQUIRED:
-            return cls(code=code)
+            return _result
         if code == AllowTrustResultCode.ALLOW_TRUST_CANT_REVOKE:
-            return cls(code=code)
+            return _result
         if code == AllowTrustResultCode.ALLOW_TRUST_SELF_NOT_ALLOWED:
-            return cls(code=code)
+            return _result
         if code == AllowTrustResultCode.ALLOW_TRUST_LOW_RESERVE:
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AllowTrustResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AllowTrustResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -102,11 +181,11 @@ class AllowTrustResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AllowTrustResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == AllowTrustResultCode.ALLOW_TRUST_SUCCESS:
@@ -142,6 +221,43 @@ class AllowTrustResult:
         code = AllowTrustResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_SUCCESS:
+            write('"success"')
+            return
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_NO_TRUST_LINE:
+            write('"no_trust_line"')
+            return
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_TRUST_NOT_REQUIRED:
+            write('"trust_not_required"')
+            return
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_CANT_REVOKE:
+            write('"cant_revoke"')
+            return
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_SELF_NOT_ALLOWED:
+            write('"self_not_allowed"')
+            return
+        if self.code == AllowTrustResultCode.ALLOW_TRUST_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        raise ValueError(f"Unknown code in AllowTrustResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> AllowTrustResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AllowTrustResult:
+        return self.clone()
+
+    def freeze(self) -> AllowTrustResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -154,3 +270,18 @@ class AllowTrustResult:
         out = []
         out.append(f"code={self.code}")
         return f"<AllowTrustResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> AllowTrustResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    AllowTrustResultCode.ALLOW_TRUST_SUCCESS: _unpack_void,
+    AllowTrustResultCode.ALLOW_TRUST_MALFORMED: _unpack_void,
+    AllowTrustResultCode.ALLOW_TRUST_NO_TRUST_LINE: _unpack_void,
+    AllowTrustResultCode.ALLOW_TRUST_TRUST_NOT_REQUIRED: _unpack_void,
+    AllowTrustResultCode.ALLOW_TRUST_CANT_REVOKE: _unpack_void,
+    AllowTrustResultCode.ALLOW_TRUST_SELF_NOT_ALLOWED: _unpack_void,
+    AllowTrustResultCode.ALLOW_TRUST_LOW_RESERVE: _unpack_void,
+}
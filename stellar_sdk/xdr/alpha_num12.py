@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
 from .asset_code12 import AssetCode12
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["AlphaNum12"]
 
@@ -25,6 +35,8 @@ class AlphaNum12:
         };
     """
 
+    __slots__ = ("asset_code", "issuer")
+
     def __init__(
         self,
         asset_code: AssetCode12,
@@ -37,6 +49,9 @@ class AlphaNum12:
         self.asset_code.pack(packer)
         self.issuer.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 12 + self.issuer.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,56 @@ class AlphaNum12:
             issuer=issuer,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AssetCode12.skip(unpacker, depth_limit - 1)
+        AccountID.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AlphaNum12:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "asset_code" in fields:
+            _result["asset_code"] = AssetCode12.unpack_fields(
+                unpacker, fields["asset_code"], depth_limit - 1
+            )
+        else:
+            AssetCode12.skip(unpacker, depth_limit - 1)
+        if "issuer" in fields:
+            _result["issuer"] = AccountID.unpack_fields(
+                unpacker, fields["issuer"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AlphaNum12:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AlphaNum12:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +129,11 @@ class AlphaNum12:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AlphaNum12:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +150,27 @@ class AlphaNum12:
             issuer=issuer,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"asset_code": ')
+        self.asset_code._write_json(write)
+        write(', "issuer": ')
+        self.issuer._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AlphaNum12:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.asset_code = self.asset_code.clone()
+        result.issuer = self.issuer.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AlphaNum12:
+        return self.clone()
+
+    def freeze(self) -> AlphaNum12:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .alpha_num4 import AlphaNum4
 from .alpha_num12 import AlphaNum12
 from .asset_type import AssetType
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["Asset"]
 
@@ -34,6 +44,8 @@ class Asset:
         };
     """
 
+    __slots__ = ("alpha_num4", "alpha_num12", "type")
+
     def __init__(
         self,
         type: AssetType,
@@ -60,33 +72,96 @@ class Asset:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == AssetType.ASSET_TYPE_NATIVE:
+            return 4
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
+            assert self.alpha_num4 is not None
+            return 4 + self.alpha_num4.xdr_size()
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
+            assert self.alpha_num12 is not None
+            return 4 + self.alpha_num12.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> Asset:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = AssetType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = AssetType.unpack(unpacker)
         if type == AssetType.ASSET_TYPE_NATIVE:
-            return cls(type=type)
+            return
         if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
-            alpha_num4 = AlphaNum4.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, alpha_num4=alpha_num4)
+            AlphaNum4.skip(unpacker, depth_limit - 1)
+            return
         if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
-            alpha_num12 = AlphaNum12.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, alpha_num12=alpha_num12)
+            AlphaNum12.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Asset:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = AssetType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == AssetType.ASSET_TYPE_NATIVE:
+            return _result
+        if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
+            if "alpha_num4" in fields:
+                _result["alpha_num4"] = AlphaNum4.unpack_fields(
+                    unpacker, fields["alpha_num4"], depth_limit - 1
+                )
+            else:
+                AlphaNum4.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
+            if "alpha_num12" in fields:
+                _result["alpha_num12"] = AlphaNum12.unpack_fields(
+                    unpacker, fields["alpha_num12"], depth_limit - 1
+                )
+            else:
+                AlphaNum12.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Asset:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Asset:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -101,11 +176,11 @@ class Asset:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Asset:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == AssetType.ASSET_TYPE_NATIVE:
@@ -141,6 +216,43 @@ class Asset:
             return cls(type=type, alpha_num12=alpha_num12)
         raise ValueError(f"Unknown key '{key}' for Asset")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == AssetType.ASSET_TYPE_NATIVE:
+            write('"native"')
+            return
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
+            assert self.alpha_num4 is not None
+            write('{"credit_alphanum4": ')
+            self.alpha_num4._write_json(write)
+            write("}")
+            return
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
+            assert self.alpha_num12 is not None
+            write('{"credit_alphanum12": ')
+            self.alpha_num12._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in Asset: {self.type}")
+
+    def clone(self, deep: bool = True) -> Asset:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.alpha_num4 = (
+            self.alpha_num4.clone() if self.alpha_num4 is not None else None
+        )
+        result.alpha_num12 = (
+            self.alpha_num12.clone() if self.alpha_num12 is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Asset:
+        return self.clone()
+
+    def freeze(self) -> Asset:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -167,3 +279,24 @@ class Asset:
         if self.alpha_num12 is not None:
             out.append(f"alpha_num12={self.alpha_num12}")
         return f"<Asset [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> Asset:
+    return cls(type=type)
+
+
+def _unpack_alpha_num4(cls, type, unpacker: Unpacker, depth_limit: int) -> Asset:
+    alpha_num4 = AlphaNum4.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, alpha_num4=alpha_num4)
+
+
+def _unpack_alpha_num12(cls, type, unpacker: Unpacker, depth_limit: int) -> Asset:
+    alpha_num12 = AlphaNum12.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, alpha_num12=alpha_num12)
+
+
+_UNPACK_ARMS = {
+    AssetType.ASSET_TYPE_NATIVE: _unpack_void,
+    AssetType.ASSET_TYPE_CREDIT_ALPHANUM4: _unpack_alpha_num4,
+    AssetType.ASSET_TYPE_CREDIT_ALPHANUM12: _unpack_alpha_num12,
+}
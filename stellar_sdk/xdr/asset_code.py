@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset_code4 import AssetCode4
 from .asset_code12 import AssetCode12
 from .asset_type import AssetType
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["AssetCode"]
 
@@ -31,6 +41,8 @@ class AssetCode:
         };
     """
 
+    __slots__ = ("asset_code4", "asset_code12", "type")
+
     def __init__(
         self,
         type: AssetType,
@@ -55,31 +67,88 @@ class AssetCode:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
+            return 8
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
+            return 16
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> AssetCode:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = AssetType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = AssetType.unpack(unpacker)
         if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
-            asset_code4 = AssetCode4.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, asset_code4=asset_code4)
+            AssetCode4.skip(unpacker, depth_limit - 1)
+            return
         if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
-            asset_code12 = AssetCode12.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, asset_code12=asset_code12)
+            AssetCode12.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AssetCode:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = AssetType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
+            if "asset_code4" in fields:
+                _result["asset_code4"] = AssetCode4.unpack_fields(
+                    unpacker, fields["asset_code4"], depth_limit - 1
+                )
+            else:
+                AssetCode4.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
+            if "asset_code12" in fields:
+                _result["asset_code12"] = AssetCode12.unpack_fields(
+                    unpacker, fields["asset_code12"], depth_limit - 1
+                )
+            else:
+                AssetCode12.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AssetCode:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AssetCode:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -94,11 +163,11 @@ class AssetCode:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AssetCode:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
@@ -125,6 +194,40 @@ class AssetCode:
             return cls(type=type, asset_code12=asset_code12)
         raise ValueError(f"Unknown key '{key}' for AssetCode")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM4:
+            assert self.asset_code4 is not None
+            write('{"credit_alphanum4": ')
+            self.asset_code4._write_json(write)
+            write("}")
+            return
+        if self.type == AssetType.ASSET_TYPE_CREDIT_ALPHANUM12:
+            assert self.asset_code12 is not None
+            write('{"credit_alphanum12": ')
+            self.asset_code12._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in AssetCode: {self.type}")
+
+    def clone(self, deep: bool = True) -> AssetCode:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.asset_code4 = (
+            self.asset_code4.clone() if self.asset_code4 is not None else None
+        )
+        result.asset_code12 = (
+            self.asset_code12.clone() if self.asset_code12 is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AssetCode:
+        return self.clone()
+
+    def freeze(self) -> AssetCode:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -151,3 +254,19 @@ class AssetCode:
         if self.asset_code12 is not None:
             out.append(f"asset_code12={self.asset_code12}")
         return f"<AssetCode [{', '.join(out)}]>"
+
+
+def _unpack_asset_code4(cls, type, unpacker: Unpacker, depth_limit: int) -> AssetCode:
+    asset_code4 = AssetCode4.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, asset_code4=asset_code4)
+
+
+def _unpack_asset_code12(cls, type, unpacker: Unpacker, depth_limit: int) -> AssetCode:
+    asset_code12 = AssetCode12.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, asset_code12=asset_code12)
+
+
+_UNPACK_ARMS = {
+    AssetType.ASSET_TYPE_CREDIT_ALPHANUM4: _unpack_asset_code4,
+    AssetType.ASSET_TYPE_CREDIT_ALPHANUM12: _unpack_asset_code12,
+}
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["AssetCode4"]
 
@@ -19,6 +31,8 @@ class AssetCode4:
         typedef opaque AssetCode4[4];
     """
 
+    __slots__ = ("asset_code4",)
+
     def __init__(self, asset_code4: bytes) -> None:
         _expect_length = 4
         if asset_code4 and len(asset_code4) != _expect_length:
@@ -30,6 +44,9 @@ class AssetCode4:
     def pack(self, packer: Packer) -> None:
         Opaque(self.asset_code4, 4, True).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -39,16 +56,49 @@ class AssetCode4:
         asset_code4 = Opaque.unpack(unpacker, 4, True)
         return cls(asset_code4)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 4, True)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AssetCode4:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "asset_code4" in fields:
+            _result["asset_code4"] = Opaque.unpack_fields(
+                unpacker, fields["asset_code4"], 4, True
+            )
+        else:
+            Opaque.skip(unpacker, 4, True)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AssetCode4:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AssetCode4:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +113,11 @@ class AssetCode4:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AssetCode4:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return self.asset_code4.rstrip(b"\x00").decode("ascii")
@@ -76,6 +126,22 @@ class AssetCode4:
     def from_json_dict(cls, json_value: str) -> AssetCode4:
         return cls(json_value.encode("ascii").ljust(4, b"\x00"))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> AssetCode4:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.asset_code4 = self.asset_code4
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AssetCode4:
+        return self.clone()
+
+    def freeze(self) -> AssetCode4:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.asset_code4,))
 
@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
-
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    Integer,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
+
+_LAYOUT = FixedLayout(">i")
 __all__ = ["Auth"]
 
 
@@ -22,6 +36,8 @@ class Auth:
         };
     """
 
+    __slots__ = ("flags",)
+
     def __init__(
         self,
         flags: int,
@@ -29,7 +45,10 @@ class Auth:
         self.flags = flags
 
     def pack(self, packer: Packer) -> None:
-        Integer(self.flags).pack(packer)
+        _LAYOUT.write(packer, self.flags)
+
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(
@@ -37,21 +56,52 @@ class Auth:
     ) -> Auth:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        flags = Integer.unpack(unpacker)
+        (flags,) = _LAYOUT.read(unpacker)
         return cls(
             flags=flags,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Auth:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "flags" in fields:
+            _result["flags"] = Integer.unpack_fields(unpacker, fields["flags"])
+        else:
+            Integer.skip(unpacker)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Auth:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Auth:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -66,11 +116,11 @@ class Auth:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Auth:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -84,6 +134,24 @@ class Auth:
             flags=flags,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"flags": ')
+        write(json_encode(Integer.to_json_dict(self.flags)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> Auth:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.flags = self.flags
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Auth:
+        return self.clone()
+
+    def freeze(self) -> Auth:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.flags,))
 
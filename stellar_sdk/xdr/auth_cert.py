@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .curve25519_public import Curve25519Public
 from .signature import Signature
 from .uint64 import Uint64
@@ -27,6 +37,8 @@ class AuthCert:
         };
     """
 
+    __slots__ = ("expiration", "pubkey", "sig")
+
     def __init__(
         self,
         pubkey: Curve25519Public,
@@ -42,6 +54,9 @@ class AuthCert:
         self.expiration.pack(packer)
         self.sig.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 40 + self.sig.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +72,63 @@ class AuthCert:
             sig=sig,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Curve25519Public.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Signature.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AuthCert:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "pubkey" in fields:
+            _result["pubkey"] = Curve25519Public.unpack_fields(
+                unpacker, fields["pubkey"], depth_limit - 1
+            )
+        else:
+            Curve25519Public.skip(unpacker, depth_limit - 1)
+        if "expiration" in fields:
+            _result["expiration"] = Uint64.unpack_fields(
+                unpacker, fields["expiration"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "sig" in fields:
+            _result["sig"] = Signature.unpack_fields(
+                unpacker, fields["sig"], depth_limit - 1
+            )
+        else:
+            Signature.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AuthCert:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> AuthCert:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +143,11 @@ class AuthCert:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AuthCert:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +167,30 @@ class AuthCert:
             sig=sig,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"pubkey": ')
+        self.pubkey._write_json(write)
+        write(', "expiration": ')
+        self.expiration._write_json(write)
+        write(', "sig": ')
+        self.sig._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AuthCert:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.pubkey = self.pubkey.clone()
+        result.expiration = self.expiration.clone()
+        result.sig = self.sig.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AuthCert:
+        return self.clone()
+
+    def freeze(self) -> AuthCert:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .authenticated_message_v0 import AuthenticatedMessageV0
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
 __all__ = ["AuthenticatedMessage"]
@@ -30,6 +43,8 @@ class AuthenticatedMessage:
         };
     """
 
+    __slots__ = ("v", "v0")
+
     def __init__(
         self,
         v: Uint32,
@@ -47,16 +62,79 @@ class AuthenticatedMessage:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v.uint32 == 0:
+            assert self.v0 is not None
+            return 4 + self.v0.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> AuthenticatedMessage:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Uint32.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v.uint32)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Uint32.unpack(unpacker)
         if v.uint32 == 0:
-            v0 = AuthenticatedMessageV0.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v0=v0)
+            AuthenticatedMessageV0.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AuthenticatedMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Uint32.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v.uint32 == 0:
+            if "v0" in fields:
+                _result["v0"] = AuthenticatedMessageV0.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                AuthenticatedMessageV0.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Uint32.unpack(unpacker)
+        yield "v", v
+        if v.uint32 == 0:
+            yield "v0", view_at(AuthenticatedMessageV0, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -65,10 +143,12 @@ class AuthenticatedMessage:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AuthenticatedMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AuthenticatedMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +163,11 @@ class AuthenticatedMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AuthenticatedMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v.uint32 == 0:
@@ -108,6 +188,29 @@ class AuthenticatedMessage:
             return cls(v=v, v0=v0)
         raise ValueError(f"Unknown key '{key}' for AuthenticatedMessage")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v.uint32 == 0:
+            assert self.v0 is not None
+            write('{"v0": ')
+            self.v0._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in AuthenticatedMessage: {self.v}")
+
+    def clone(self, deep: bool = True) -> AuthenticatedMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v.clone()
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AuthenticatedMessage:
+        return self.clone()
+
+    def freeze(self) -> AuthenticatedMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -127,3 +230,13 @@ class AuthenticatedMessage:
         if self.v0 is not None:
             out.append(f"v0={self.v0}")
         return f"<AuthenticatedMessage [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, v, unpacker: Unpacker, depth_limit: int) -> AuthenticatedMessage:
+    v0 = AuthenticatedMessageV0.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v0=v0)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_v0,
+}
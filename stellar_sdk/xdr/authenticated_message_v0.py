@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .hmac_sha256_mac import HmacSha256Mac
 from .stellar_message import StellarMessage
 from .uint64 import Uint64
@@ -27,6 +40,8 @@ class AuthenticatedMessageV0:
             }
     """
 
+    __slots__ = ("mac", "message", "sequence")
+
     def __init__(
         self,
         sequence: Uint64,
@@ -42,6 +57,9 @@ class AuthenticatedMessageV0:
         self.message.pack(packer)
         self.mac.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 40 + self.message.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +75,79 @@ class AuthenticatedMessageV0:
             mac=mac,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint64.skip(unpacker, depth_limit - 1)
+        StellarMessage.skip(unpacker, depth_limit - 1)
+        HmacSha256Mac.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | AuthenticatedMessageV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sequence" in fields:
+            _result["sequence"] = Uint64.unpack_fields(
+                unpacker, fields["sequence"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "message" in fields:
+            _result["message"] = StellarMessage.unpack_fields(
+                unpacker, fields["message"], depth_limit - 1
+            )
+        else:
+            StellarMessage.skip(unpacker, depth_limit - 1)
+        if "mac" in fields:
+            _result["mac"] = HmacSha256Mac.unpack_fields(
+                unpacker, fields["mac"], depth_limit - 1
+            )
+        else:
+            HmacSha256Mac.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "sequence", Uint64.unpack(unpacker, depth_limit - 1)
+        message = view_at(StellarMessage, unpacker, depth_limit - 1)
+        yield "message", message
+        StellarMessage.skip(unpacker, depth_limit - 1)
+        yield "mac", HmacSha256Mac.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> AuthenticatedMessageV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> AuthenticatedMessageV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +162,11 @@ class AuthenticatedMessageV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> AuthenticatedMessageV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +186,30 @@ class AuthenticatedMessageV0:
             mac=mac,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"sequence": ')
+        self.sequence._write_json(write)
+        write(', "message": ')
+        self.message._write_json(write)
+        write(', "mac": ')
+        self.mac._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> AuthenticatedMessageV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sequence = self.sequence.clone()
+        result.message = self.message.clone()
+        result.mac = self.mac.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> AuthenticatedMessageV0:
+        return self.clone()
+
+    def freeze(self) -> AuthenticatedMessageV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
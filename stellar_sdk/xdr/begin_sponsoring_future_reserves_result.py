@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .begin_sponsoring_future_reserves_result_code import (
     BeginSponsoringFutureReservesResultCode,
 )
@@ -31,6 +41,8 @@ class BeginSponsoringFutureReservesResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: BeginSponsoringFutureReservesResultCode,
@@ -61,6 +73,29 @@ class BeginSponsoringFutureReservesResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_SUCCESS
+        ):
+            return 4
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_MALFORMED
+        ):
+            return 4
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_ALREADY_SPONSORED
+        ):
+            return 4
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_RECURSIVE
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -68,38 +103,94 @@ class BeginSponsoringFutureReservesResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = BeginSponsoringFutureReservesResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = BeginSponsoringFutureReservesResultCode.unpack(unpacker)
+        if (
+            code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_SUCCESS
+        ):
+            return
+        if (
+            code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_MALFORMED
+        ):
+            return
+        if (
+            code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_ALREADY_SPONSORED
+        ):
+            return
+        if (
+            code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_RECURSIVE
+        ):
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | BeginSponsoringFutureReservesResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = BeginSponsoringFutureReservesResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if (
             code
             == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_SUCCESS
         ):
-            return cls(code=code)
+            return _result
         if (
             code
             == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_MALFORMED
         ):
-            return cls(code=code)
+            return _result
         if (
             code
             == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_ALREADY_SPONSORED
         ):
-            return cls(code=code)
+            return _result
         if (
             code
             == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_RECURSIVE
         ):
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> BeginSponsoringFutureReservesResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> BeginSponsoringFutureReservesResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -114,11 +205,11 @@ class BeginSponsoringFutureReservesResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> BeginSponsoringFutureReservesResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -159,6 +250,48 @@ class BeginSponsoringFutureReservesResult:
         code = BeginSponsoringFutureReservesResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_SUCCESS
+        ):
+            write('"success"')
+            return
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_MALFORMED
+        ):
+            write('"malformed"')
+            return
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_ALREADY_SPONSORED
+        ):
+            write('"already_sponsored"')
+            return
+        if (
+            self.code
+            == BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_RECURSIVE
+        ):
+            write('"recursive"')
+            return
+        raise ValueError(
+            f"Unknown code in BeginSponsoringFutureReservesResult: {self.code}"
+        )
+
+    def clone(self, deep: bool = True) -> BeginSponsoringFutureReservesResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> BeginSponsoringFutureReservesResult:
+        return self.clone()
+
+    def freeze(self) -> BeginSponsoringFutureReservesResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -171,3 +304,17 @@ class BeginSponsoringFutureReservesResult:
         out = []
         out.append(f"code={self.code}")
         return f"<BeginSponsoringFutureReservesResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> BeginSponsoringFutureReservesResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_SUCCESS: _unpack_void,
+    BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_MALFORMED: _unpack_void,
+    BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_ALREADY_SPONSORED: _unpack_void,
+    BeginSponsoringFutureReservesResultCode.BEGIN_SPONSORING_FUTURE_RESERVES_RECURSIVE: _unpack_void,
+}
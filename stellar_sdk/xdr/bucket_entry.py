@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .bucket_entry_type import BucketEntryType
 from .bucket_metadata import BucketMetadata
 from .ledger_entry import LedgerEntry
@@ -33,6 +46,8 @@ class BucketEntry:
         };
     """
 
+    __slots__ = ("dead_entry", "live_entry", "meta_entry", "type")
+
     def __init__(
         self,
         type: BucketEntryType,
@@ -69,25 +84,130 @@ class BucketEntry:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == BucketEntryType.LIVEENTRY:
+            assert self.live_entry is not None
+            return 4 + self.live_entry.xdr_size()
+        if self.type == BucketEntryType.INITENTRY:
+            assert self.live_entry is not None
+            return 4 + self.live_entry.xdr_size()
+        if self.type == BucketEntryType.DEADENTRY:
+            assert self.dead_entry is not None
+            return 4 + self.dead_entry.xdr_size()
+        if self.type == BucketEntryType.METAENTRY:
+            assert self.meta_entry is not None
+            return 4 + self.meta_entry.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> BucketEntry:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = BucketEntryType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = BucketEntryType.unpack(unpacker)
         if type == BucketEntryType.LIVEENTRY:
-            live_entry = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, live_entry=live_entry)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == BucketEntryType.INITENTRY:
-            live_entry = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, live_entry=live_entry)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == BucketEntryType.DEADENTRY:
-            dead_entry = LedgerKey.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, dead_entry=dead_entry)
+            LedgerKey.skip(unpacker, depth_limit - 1)
+            return
         if type == BucketEntryType.METAENTRY:
-            meta_entry = BucketMetadata.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, meta_entry=meta_entry)
+            BucketMetadata.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | BucketEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = BucketEntryType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == BucketEntryType.LIVEENTRY:
+            if "live_entry" in fields:
+                _result["live_entry"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["live_entry"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == BucketEntryType.INITENTRY:
+            if "live_entry" in fields:
+                _result["live_entry"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["live_entry"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == BucketEntryType.DEADENTRY:
+            if "dead_entry" in fields:
+                _result["dead_entry"] = LedgerKey.unpack_fields(
+                    unpacker, fields["dead_entry"], depth_limit - 1
+                )
+            else:
+                LedgerKey.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == BucketEntryType.METAENTRY:
+            if "meta_entry" in fields:
+                _result["meta_entry"] = BucketMetadata.unpack_fields(
+                    unpacker, fields["meta_entry"], depth_limit - 1
+                )
+            else:
+                BucketMetadata.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = BucketEntryType.unpack(unpacker)
+        yield "type", type
+        if type == BucketEntryType.LIVEENTRY:
+            yield "live_entry", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
+        if type == BucketEntryType.INITENTRY:
+            yield "live_entry", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
+        if type == BucketEntryType.DEADENTRY:
+            yield "dead_entry", view_at(LedgerKey, unpacker, depth_limit - 1)
+            return
+        if type == BucketEntryType.METAENTRY:
+            yield "meta_entry", BucketMetadata.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -96,10 +216,10 @@ class BucketEntry:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> BucketEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> BucketEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -114,11 +234,11 @@ class BucketEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> BucketEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == BucketEntryType.LIVEENTRY:
@@ -157,6 +277,55 @@ class BucketEntry:
             return cls(type=type, meta_entry=meta_entry)
         raise ValueError(f"Unknown key '{key}' for BucketEntry")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == BucketEntryType.LIVEENTRY:
+            assert self.live_entry is not None
+            write('{"liveentry": ')
+            self.live_entry._write_json(write)
+            write("}")
+            return
+        if self.type == BucketEntryType.INITENTRY:
+            assert self.live_entry is not None
+            write('{"initentry": ')
+            self.live_entry._write_json(write)
+            write("}")
+            return
+        if self.type == BucketEntryType.DEADENTRY:
+            assert self.dead_entry is not None
+            write('{"deadentry": ')
+            self.dead_entry._write_json(write)
+            write("}")
+            return
+        if self.type == BucketEntryType.METAENTRY:
+            assert self.meta_entry is not None
+            write('{"metaentry": ')
+            self.meta_entry._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in BucketEntry: {self.type}")
+
+    def clone(self, deep: bool = True) -> BucketEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.live_entry = (
+            self.live_entry.clone() if self.live_entry is not None else None
+        )
+        result.dead_entry = (
+            self.dead_entry.clone() if self.dead_entry is not None else None
+        )
+        result.meta_entry = (
+            self.meta_entry.clone() if self.meta_entry is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> BucketEntry:
+        return self.clone()
+
+    def freeze(self) -> BucketEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -187,3 +356,26 @@ class BucketEntry:
         if self.meta_entry is not None:
             out.append(f"meta_entry={self.meta_entry}")
         return f"<BucketEntry [{', '.join(out)}]>"
+
+
+def _unpack_live_entry(cls, type, unpacker: Unpacker, depth_limit: int) -> BucketEntry:
+    live_entry = LedgerEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, live_entry=live_entry)
+
+
+def _unpack_dead_entry(cls, type, unpacker: Unpacker, depth_limit: int) -> BucketEntry:
+    dead_entry = LedgerKey.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, dead_entry=dead_entry)
+
+
+def _unpack_meta_entry(cls, type, unpacker: Unpacker, depth_limit: int) -> BucketEntry:
+    meta_entry = BucketMetadata.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, meta_entry=meta_entry)
+
+
+_UNPACK_ARMS = {
+    BucketEntryType.LIVEENTRY: _unpack_live_entry,
+    BucketEntryType.INITENTRY: _unpack_live_entry,
+    BucketEntryType.DEADENTRY: _unpack_dead_entry,
+    BucketEntryType.METAENTRY: _unpack_meta_entry,
+}
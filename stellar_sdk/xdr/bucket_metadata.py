@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .bucket_metadata_ext import BucketMetadataExt
 from .uint32 import Uint32
 
@@ -35,6 +45,8 @@ class BucketMetadata:
         };
     """
 
+    __slots__ = ("ext", "ledger_version")
+
     def __init__(
         self,
         ledger_version: Uint32,
@@ -47,6 +59,9 @@ class BucketMetadata:
         self.ledger_version.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -60,16 +75,56 @@ class BucketMetadata:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        BucketMetadataExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | BucketMetadata:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_version" in fields:
+            _result["ledger_version"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_version"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = BucketMetadataExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            BucketMetadataExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> BucketMetadata:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> BucketMetadata:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -84,11 +139,11 @@ class BucketMetadata:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> BucketMetadata:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +160,27 @@ class BucketMetadata:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_version": ')
+        self.ledger_version._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> BucketMetadata:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_version = self.ledger_version.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> BucketMetadata:
+        return self.clone()
+
+    def freeze(self) -> BucketMetadata:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .bucket_list_type import BucketListType
 
 __all__ = ["BucketMetadataExt"]
@@ -26,6 +37,8 @@ class BucketMetadataExt:
             }
     """
 
+    __slots__ = ("bucket_list_type", "v")
+
     def __init__(
         self,
         v: int,
@@ -45,30 +58,83 @@ class BucketMetadataExt:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            return 4
+        if self.v == 1:
+            return 8
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> BucketMetadataExt:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
         if v == 0:
-            return cls(v=v)
+            return
         if v == 1:
-            bucket_list_type = BucketListType.unpack(unpacker)
-            return cls(v=v, bucket_list_type=bucket_list_type)
+            BucketListType.skip(unpacker)
+            return
         raise ValueError("Invalid v.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | BucketMetadataExt:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            return _result
+        if v == 1:
+            if "bucket_list_type" in fields:
+                _result["bucket_list_type"] = BucketListType.unpack_fields(
+                    unpacker, fields["bucket_list_type"]
+                )
+            else:
+                BucketListType.skip(unpacker)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> BucketMetadataExt:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> BucketMetadataExt:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +149,11 @@ class BucketMetadataExt:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> BucketMetadataExt:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -117,6 +183,32 @@ class BucketMetadataExt:
             return cls(v=v, bucket_list_type=bucket_list_type)
         raise ValueError(f"Unknown key '{key}' for BucketMetadataExt")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            write('"v0"')
+            return
+        if self.v == 1:
+            assert self.bucket_list_type is not None
+            write('{"v1": ')
+            self.bucket_list_type._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in BucketMetadataExt: {self.v}")
+
+    def clone(self, deep: bool = True) -> BucketMetadataExt:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.bucket_list_type = self.bucket_list_type
+        return result
+
+    def __deepcopy__(self, memo: dict) -> BucketMetadataExt:
+        return self.clone()
+
+    def freeze(self) -> BucketMetadataExt:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -136,3 +228,20 @@ class BucketMetadataExt:
         if self.bucket_list_type is not None:
             out.append(f"bucket_list_type={self.bucket_list_type}")
         return f"<BucketMetadataExt [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, v, unpacker: Unpacker, depth_limit: int) -> BucketMetadataExt:
+    return cls(v=v)
+
+
+def _unpack_bucket_list_type(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> BucketMetadataExt:
+    bucket_list_type = BucketListType.unpack(unpacker)
+    return cls(v=v, bucket_list_type=bucket_list_type)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_void,
+    1: _unpack_bucket_list_type,
+}
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
+from .int64 import Int64
 from .sequence_number import SequenceNumber
 
+_LAYOUT = FixedLayout(">q")
 __all__ = ["BumpSequenceOp"]
 
 
@@ -23,6 +36,8 @@ class BumpSequenceOp:
         };
     """
 
+    __slots__ = ("bump_to",)
+
     def __init__(
         self,
         bump_to: SequenceNumber,
@@ -30,7 +45,10 @@ class BumpSequenceOp:
         self.bump_to = bump_to
 
     def pack(self, packer: Packer) -> None:
-        self.bump_to.pack(packer)
+        _LAYOUT.write(packer, self.bump_to.sequence_number.int64)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -38,21 +56,54 @@ class BumpSequenceOp:
     ) -> BumpSequenceOp:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        bump_to = SequenceNumber.unpack(unpacker, depth_limit - 1)
+        (bump_to,) = _LAYOUT.read(unpacker)
         return cls(
-            bump_to=bump_to,
+            bump_to=SequenceNumber(Int64(bump_to)),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | BumpSequenceOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "bump_to" in fields:
+            _result["bump_to"] = SequenceNumber.unpack_fields(
+                unpacker, fields["bump_to"], depth_limit - 1
+            )
+        else:
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> BumpSequenceOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> BumpSequenceOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +118,11 @@ class BumpSequenceOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> BumpSequenceOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +136,24 @@ class BumpSequenceOp:
             bump_to=bump_to,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"bump_to": ')
+        self.bump_to._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> BumpSequenceOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.bump_to = self.bump_to.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> BumpSequenceOp:
+        return self.clone()
+
+    def freeze(self) -> BumpSequenceOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.bump_to,))
 
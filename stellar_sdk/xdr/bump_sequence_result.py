@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .bump_sequence_result_code import BumpSequenceResultCode
 
 __all__ = ["BumpSequenceResult"]
@@ -26,6 +36,8 @@ class BumpSequenceResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: BumpSequenceResultCode,
@@ -40,29 +52,76 @@ class BumpSequenceResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == BumpSequenceResultCode.BUMP_SEQUENCE_SUCCESS:
+            return 4
+        if self.code == BumpSequenceResultCode.BUMP_SEQUENCE_BAD_SEQ:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> BumpSequenceResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = BumpSequenceResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = BumpSequenceResultCode.unpack(unpacker)
         if code == BumpSequenceResultCode.BUMP_SEQUENCE_SUCCESS:
-            return cls(code=code)
+            return
         if code == BumpSequenceResultCode.BUMP_SEQUENCE_BAD_SEQ:
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | BumpSequenceResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = BumpSequenceResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == BumpSequenceResultCode.BUMP_SEQUENCE_SUCCESS:
+            return _result
+        if code == BumpSequenceResultCode.BUMP_SEQUENCE_BAD_SEQ:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> BumpSequenceResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> BumpSequenceResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -77,11 +136,11 @@ class BumpSequenceResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> BumpSequenceResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == BumpSequenceResultCode.BUMP_SEQUENCE_SUCCESS:
@@ -102,6 +161,28 @@ class BumpSequenceResult:
         code = BumpSequenceResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == BumpSequenceResultCode.BUMP_SEQUENCE_SUCCESS:
+            write('"success"')
+            return
+        if self.code == BumpSequenceResultCode.BUMP_SEQUENCE_BAD_SEQ:
+            write('"bad_seq"')
+            return
+        raise ValueError(f"Unknown code in BumpSequenceResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> BumpSequenceResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> BumpSequenceResult:
+        return self.clone()
+
+    def freeze(self) -> BumpSequenceResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -114,3 +195,13 @@ class BumpSequenceResult:
         out = []
         out.append(f"code={self.code}")
         return f"<BumpSequenceResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> BumpSequenceResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    BumpSequenceResultCode.BUMP_SEQUENCE_SUCCESS: _unpack_void,
+    BumpSequenceResultCode.BUMP_SEQUENCE_BAD_SEQ: _unpack_void,
+}
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .change_trust_asset import ChangeTrustAsset
 from .int64 import Int64
 
@@ -27,6 +37,8 @@ class ChangeTrustOp:
         };
     """
 
+    __slots__ = ("limit", "line")
+
     def __init__(
         self,
         line: ChangeTrustAsset,
@@ -39,6 +51,9 @@ class ChangeTrustOp:
         self.line.pack(packer)
         self.limit.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.line.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -52,16 +67,56 @@ class ChangeTrustOp:
             limit=limit,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ChangeTrustAsset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ChangeTrustOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "line" in fields:
+            _result["line"] = ChangeTrustAsset.unpack_fields(
+                unpacker, fields["line"], depth_limit - 1
+            )
+        else:
+            ChangeTrustAsset.skip(unpacker, depth_limit - 1)
+        if "limit" in fields:
+            _result["limit"] = Int64.unpack_fields(
+                unpacker, fields["limit"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ChangeTrustOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ChangeTrustOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -76,11 +131,11 @@ class ChangeTrustOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ChangeTrustOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -97,6 +152,27 @@ class ChangeTrustOp:
             limit=limit,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"line": ')
+        self.line._write_json(write)
+        write(', "limit": ')
+        self.limit._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ChangeTrustOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.line = self.line.clone()
+        result.limit = self.limit.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ChangeTrustOp:
+        return self.clone()
+
+    def freeze(self) -> ChangeTrustOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
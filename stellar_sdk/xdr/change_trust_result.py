@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .change_trust_result_code import ChangeTrustResultCode
 
 __all__ = ["ChangeTrustResult"]
@@ -33,6 +43,8 @@ class ChangeTrustResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: ChangeTrustResultCode,
@@ -64,6 +76,30 @@ class ChangeTrustResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_SUCCESS:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_MALFORMED:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_NO_ISSUER:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_INVALID_LIMIT:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_LOW_RESERVE:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_SELF_NOT_ALLOWED:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_TRUST_LINE_MISSING:
+            return 4
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_CANNOT_DELETE:
+            return 4
+        if (
+            self.code
+            == ChangeTrustResultCode.CHANGE_TRUST_NOT_AUTH_MAINTAIN_LIABILITIES
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,36 +107,90 @@ class ChangeTrustResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ChangeTrustResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ChangeTrustResultCode.unpack(unpacker)
+        if code == ChangeTrustResultCode.CHANGE_TRUST_SUCCESS:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_MALFORMED:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_NO_ISSUER:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_INVALID_LIMIT:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_LOW_RESERVE:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_SELF_NOT_ALLOWED:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_TRUST_LINE_MISSING:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_CANNOT_DELETE:
+            return
+        if code == ChangeTrustResultCode.CHANGE_TRUST_NOT_AUTH_MAINTAIN_LIABILITIES:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ChangeTrustResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ChangeTrustResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == ChangeTrustResultCode.CHANGE_TRUST_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_MALFORMED:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_NO_ISSUER:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_INVALID_LIMIT:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_LOW_RESERVE:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_SELF_NOT_ALLOWED:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_TRUST_LINE_MISSING:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_CANNOT_DELETE:
-            return cls(code=code)
+            return _result
         if code == ChangeTrustResultCode.CHANGE_TRUST_NOT_AUTH_MAINTAIN_LIABILITIES:
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ChangeTrustResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ChangeTrustResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -115,11 +205,11 @@ class ChangeTrustResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ChangeTrustResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == ChangeTrustResultCode.CHANGE_TRUST_SUCCESS:
@@ -164,6 +254,52 @@ class ChangeTrustResult:
         code = ChangeTrustResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_SUCCESS:
+            write('"success"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_NO_ISSUER:
+            write('"no_issuer"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_INVALID_LIMIT:
+            write('"invalid_limit"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_SELF_NOT_ALLOWED:
+            write('"self_not_allowed"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_TRUST_LINE_MISSING:
+            write('"trust_line_missing"')
+            return
+        if self.code == ChangeTrustResultCode.CHANGE_TRUST_CANNOT_DELETE:
+            write('"cannot_delete"')
+            return
+        if (
+            self.code
+            == ChangeTrustResultCode.CHANGE_TRUST_NOT_AUTH_MAINTAIN_LIABILITIES
+        ):
+            write('"not_auth_maintain_liabilities"')
+            return
+        raise ValueError(f"Unknown code in ChangeTrustResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ChangeTrustResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ChangeTrustResult:
+        return self.clone()
+
+    def freeze(self) -> ChangeTrustResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -176,3 +312,20 @@ class ChangeTrustResult:
         out = []
         out.append(f"code={self.code}")
         return f"<ChangeTrustResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> ChangeTrustResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    ChangeTrustResultCode.CHANGE_TRUST_SUCCESS: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_MALFORMED: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_NO_ISSUER: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_INVALID_LIMIT: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_LOW_RESERVE: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_SELF_NOT_ALLOWED: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_TRUST_LINE_MISSING: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_CANNOT_DELETE: _unpack_void,
+    ChangeTrustResultCode.CHANGE_TRUST_NOT_AUTH_MAINTAIN_LIABILITIES: _unpack_void,
+}
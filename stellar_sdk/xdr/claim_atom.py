@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .claim_atom_type import ClaimAtomType
 from .claim_liquidity_atom import ClaimLiquidityAtom
 from .claim_offer_atom import ClaimOfferAtom
@@ -31,6 +41,8 @@ class ClaimAtom:
         };
     """
 
+    __slots__ = ("liquidity_pool", "order_book", "type", "v0")
+
     def __init__(
         self,
         type: ClaimAtomType,
@@ -62,34 +74,104 @@ class ClaimAtom:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_V0:
+            assert self.v0 is not None
+            return 4 + self.v0.xdr_size()
+        if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_ORDER_BOOK:
+            assert self.order_book is not None
+            return 4 + self.order_book.xdr_size()
+        if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_LIQUIDITY_POOL:
+            assert self.liquidity_pool is not None
+            return 4 + self.liquidity_pool.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ClaimAtom:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ClaimAtomType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = ClaimAtomType.unpack(unpacker)
         if type == ClaimAtomType.CLAIM_ATOM_TYPE_V0:
-            v0 = ClaimOfferAtomV0.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v0=v0)
+            ClaimOfferAtomV0.skip(unpacker, depth_limit - 1)
+            return
         if type == ClaimAtomType.CLAIM_ATOM_TYPE_ORDER_BOOK:
-            order_book = ClaimOfferAtom.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, order_book=order_book)
+            ClaimOfferAtom.skip(unpacker, depth_limit - 1)
+            return
         if type == ClaimAtomType.CLAIM_ATOM_TYPE_LIQUIDITY_POOL:
-            liquidity_pool = ClaimLiquidityAtom.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, liquidity_pool=liquidity_pool)
+            ClaimLiquidityAtom.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimAtom:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = ClaimAtomType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == ClaimAtomType.CLAIM_ATOM_TYPE_V0:
+            if "v0" in fields:
+                _result["v0"] = ClaimOfferAtomV0.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                ClaimOfferAtomV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ClaimAtomType.CLAIM_ATOM_TYPE_ORDER_BOOK:
+            if "order_book" in fields:
+                _result["order_book"] = ClaimOfferAtom.unpack_fields(
+                    unpacker, fields["order_book"], depth_limit - 1
+                )
+            else:
+                ClaimOfferAtom.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ClaimAtomType.CLAIM_ATOM_TYPE_LIQUIDITY_POOL:
+            if "liquidity_pool" in fields:
+                _result["liquidity_pool"] = ClaimLiquidityAtom.unpack_fields(
+                    unpacker, fields["liquidity_pool"], depth_limit - 1
+                )
+            else:
+                ClaimLiquidityAtom.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimAtom:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClaimAtom:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -104,11 +186,11 @@ class ClaimAtom:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimAtom:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_V0:
@@ -143,6 +225,47 @@ class ClaimAtom:
             return cls(type=type, liquidity_pool=liquidity_pool)
         raise ValueError(f"Unknown key '{key}' for ClaimAtom")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_V0:
+            assert self.v0 is not None
+            write('{"v0": ')
+            self.v0._write_json(write)
+            write("}")
+            return
+        if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_ORDER_BOOK:
+            assert self.order_book is not None
+            write('{"order_book": ')
+            self.order_book._write_json(write)
+            write("}")
+            return
+        if self.type == ClaimAtomType.CLAIM_ATOM_TYPE_LIQUIDITY_POOL:
+            assert self.liquidity_pool is not None
+            write('{"liquidity_pool": ')
+            self.liquidity_pool._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in ClaimAtom: {self.type}")
+
+    def clone(self, deep: bool = True) -> ClaimAtom:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        result.order_book = (
+            self.order_book.clone() if self.order_book is not None else None
+        )
+        result.liquidity_pool = (
+            self.liquidity_pool.clone() if self.liquidity_pool is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimAtom:
+        return self.clone()
+
+    def freeze(self) -> ClaimAtom:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -173,3 +296,27 @@ class ClaimAtom:
         if self.liquidity_pool is not None:
             out.append(f"liquidity_pool={self.liquidity_pool}")
         return f"<ClaimAtom [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, type, unpacker: Unpacker, depth_limit: int) -> ClaimAtom:
+    v0 = ClaimOfferAtomV0.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v0=v0)
+
+
+def _unpack_order_book(cls, type, unpacker: Unpacker, depth_limit: int) -> ClaimAtom:
+    order_book = ClaimOfferAtom.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, order_book=order_book)
+
+
+def _unpack_liquidity_pool(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ClaimAtom:
+    liquidity_pool = ClaimLiquidityAtom.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, liquidity_pool=liquidity_pool)
+
+
+_UNPACK_ARMS = {
+    ClaimAtomType.CLAIM_ATOM_TYPE_V0: _unpack_v0,
+    ClaimAtomType.CLAIM_ATOM_TYPE_ORDER_BOOK: _unpack_order_book,
+    ClaimAtomType.CLAIM_ATOM_TYPE_LIQUIDITY_POOL: _unpack_liquidity_pool,
+}
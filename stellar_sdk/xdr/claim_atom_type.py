@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _CLAIM_ATOM_TYPE_MAP = {0: "v0", 1: "order_book", 2: "liquidity_pool"}
 _CLAIM_ATOM_TYPE_REVERSE_MAP = {"v0": 0, "order_book": 1, "liquidity_pool": 2}
 __all__ = ["ClaimAtomType"]
@@ -32,10 +41,25 @@ class ClaimAtomType(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> ClaimAtomType:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid ClaimAtomType")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None) -> ClaimAtomType:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -43,10 +67,10 @@ class ClaimAtomType(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimAtomType:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClaimAtomType:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -61,11 +85,11 @@ class ClaimAtomType(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimAtomType:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _CLAIM_ATOM_TYPE_MAP[self.value]
@@ -73,3 +97,15 @@ class ClaimAtomType(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> ClaimAtomType:
         return cls(_CLAIM_ATOM_TYPE_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_CLAIM_ATOM_TYPE_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> ClaimAtomType:
+        return self
+
+    def freeze(self) -> ClaimAtomType:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in ClaimAtomType}
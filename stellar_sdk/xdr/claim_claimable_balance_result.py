@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .claim_claimable_balance_result_code import ClaimClaimableBalanceResultCode
 
 __all__ = ["ClaimClaimableBalanceResult"]
@@ -31,6 +41,8 @@ class ClaimClaimableBalanceResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: ClaimClaimableBalanceResultCode,
@@ -73,48 +85,142 @@ class ClaimClaimableBalanceResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_SUCCESS:
+            return 4
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_DOES_NOT_EXIST
+        ):
+            return 4
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_CANNOT_CLAIM
+        ):
+            return 4
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_LINE_FULL
+        ):
+            return 4
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NO_TRUST
+        ):
+            return 4
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NOT_AUTHORIZED
+        ):
+            return 4
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_TRUSTLINE_FROZEN
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ClaimClaimableBalanceResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ClaimClaimableBalanceResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ClaimClaimableBalanceResultCode.unpack(unpacker)
         if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_SUCCESS:
-            return cls(code=code)
+            return
         if (
             code
             == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_DOES_NOT_EXIST
         ):
-            return cls(code=code)
+            return
         if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_CANNOT_CLAIM:
-            return cls(code=code)
+            return
         if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_LINE_FULL:
-            return cls(code=code)
+            return
         if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NO_TRUST:
-            return cls(code=code)
+            return
         if (
             code
             == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NOT_AUTHORIZED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_TRUSTLINE_FROZEN
         ):
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimClaimableBalanceResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ClaimClaimableBalanceResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_SUCCESS:
+            return _result
+        if (
+            code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_DOES_NOT_EXIST
+        ):
+            return _result
+        if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_CANNOT_CLAIM:
+            return _result
+        if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_LINE_FULL:
+            return _result
+        if code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NO_TRUST:
+            return _result
+        if (
+            code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NOT_AUTHORIZED
+        ):
+            return _result
+        if (
+            code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_TRUSTLINE_FROZEN
+        ):
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimClaimableBalanceResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClaimClaimableBalanceResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -129,11 +235,11 @@ class ClaimClaimableBalanceResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimClaimableBalanceResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_SUCCESS:
@@ -187,6 +293,61 @@ class ClaimClaimableBalanceResult:
         code = ClaimClaimableBalanceResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_SUCCESS:
+            write('"success"')
+            return
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_DOES_NOT_EXIST
+        ):
+            write('"does_not_exist"')
+            return
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_CANNOT_CLAIM
+        ):
+            write('"cannot_claim"')
+            return
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_LINE_FULL
+        ):
+            write('"line_full"')
+            return
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NO_TRUST
+        ):
+            write('"no_trust"')
+            return
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NOT_AUTHORIZED
+        ):
+            write('"not_authorized"')
+            return
+        if (
+            self.code
+            == ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_TRUSTLINE_FROZEN
+        ):
+            write('"trustline_frozen"')
+            return
+        raise ValueError(f"Unknown code in ClaimClaimableBalanceResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ClaimClaimableBalanceResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimClaimableBalanceResult:
+        return self.clone()
+
+    def freeze(self) -> ClaimClaimableBalanceResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -199,3 +360,20 @@ class ClaimClaimableBalanceResult:
         out = []
         out.append(f"code={self.code}")
         return f"<ClaimClaimableBalanceResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> ClaimClaimableBalanceResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_SUCCESS: _unpack_void,
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_DOES_NOT_EXIST: _unpack_void,
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_CANNOT_CLAIM: _unpack_void,
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_LINE_FULL: _unpack_void,
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NO_TRUST: _unpack_void,
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_NOT_AUTHORIZED: _unpack_void,
+    ClaimClaimableBalanceResultCode.CLAIM_CLAIMABLE_BALANCE_TRUSTLINE_FROZEN: _unpack_void,
+}
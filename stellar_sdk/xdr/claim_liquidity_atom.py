@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .pool_id import PoolID
 
@@ -33,6 +43,14 @@ class ClaimLiquidityAtom:
         };
     """
 
+    __slots__ = (
+        "amount_bought",
+        "amount_sold",
+        "asset_bought",
+        "asset_sold",
+        "liquidity_pool_id",
+    )
+
     def __init__(
         self,
         liquidity_pool_id: PoolID,
@@ -54,6 +72,9 @@ class ClaimLiquidityAtom:
         self.asset_bought.pack(packer)
         self.amount_bought.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 48 + self.asset_sold.xdr_size() + self.asset_bought.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -73,16 +94,79 @@ class ClaimLiquidityAtom:
             amount_bought=amount_bought,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        PoolID.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimLiquidityAtom:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "liquidity_pool_id" in fields:
+            _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                unpacker, fields["liquidity_pool_id"], depth_limit - 1
+            )
+        else:
+            PoolID.skip(unpacker, depth_limit - 1)
+        if "asset_sold" in fields:
+            _result["asset_sold"] = Asset.unpack_fields(
+                unpacker, fields["asset_sold"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount_sold" in fields:
+            _result["amount_sold"] = Int64.unpack_fields(
+                unpacker, fields["amount_sold"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "asset_bought" in fields:
+            _result["asset_bought"] = Asset.unpack_fields(
+                unpacker, fields["asset_bought"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount_bought" in fields:
+            _result["amount_bought"] = Int64.unpack_fields(
+                unpacker, fields["amount_bought"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimLiquidityAtom:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClaimLiquidityAtom:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +181,11 @@ class ClaimLiquidityAtom:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimLiquidityAtom:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -127,6 +211,36 @@ class ClaimLiquidityAtom:
             amount_bought=amount_bought,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"liquidity_pool_id": ')
+        self.liquidity_pool_id._write_json(write)
+        write(', "asset_sold": ')
+        self.asset_sold._write_json(write)
+        write(', "amount_sold": ')
+        self.amount_sold._write_json(write)
+        write(', "asset_bought": ')
+        self.asset_bought._write_json(write)
+        write(', "amount_bought": ')
+        self.amount_bought._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ClaimLiquidityAtom:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.liquidity_pool_id = self.liquidity_pool_id.clone()
+        result.asset_sold = self.asset_sold.clone()
+        result.amount_sold = self.amount_sold.clone()
+        result.asset_bought = self.asset_bought.clone()
+        result.amount_bought = self.amount_bought.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimLiquidityAtom:
+        return self.clone()
+
+    def freeze(self) -> ClaimLiquidityAtom:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
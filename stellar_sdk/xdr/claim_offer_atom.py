@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
 __all__ = ["ClaimOfferAtom"]
@@ -35,6 +45,15 @@ class ClaimOfferAtom:
         };
     """
 
+    __slots__ = (
+        "amount_bought",
+        "amount_sold",
+        "asset_bought",
+        "asset_sold",
+        "offer_id",
+        "seller_id",
+    )
+
     def __init__(
         self,
         seller_id: AccountID,
@@ -59,6 +78,14 @@ class ClaimOfferAtom:
         self.asset_bought.pack(packer)
         self.amount_bought.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            24
+            + self.seller_id.xdr_size()
+            + self.asset_sold.xdr_size()
+            + self.asset_bought.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -80,16 +107,84 @@ class ClaimOfferAtom:
             amount_bought=amount_bought,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimOfferAtom:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "seller_id" in fields:
+            _result["seller_id"] = AccountID.unpack_fields(
+                unpacker, fields["seller_id"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "offer_id" in fields:
+            _result["offer_id"] = Int64.unpack_fields(
+                unpacker, fields["offer_id"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "asset_sold" in fields:
+            _result["asset_sold"] = Asset.unpack_fields(
+                unpacker, fields["asset_sold"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount_sold" in fields:
+            _result["amount_sold"] = Int64.unpack_fields(
+                unpacker, fields["amount_sold"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "asset_bought" in fields:
+            _result["asset_bought"] = Asset.unpack_fields(
+                unpacker, fields["asset_bought"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount_bought" in fields:
+            _result["amount_bought"] = Int64.unpack_fields(
+                unpacker, fields["amount_bought"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimOfferAtom:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClaimOfferAtom:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -104,11 +199,11 @@ class ClaimOfferAtom:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimOfferAtom:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -137,6 +232,39 @@ class ClaimOfferAtom:
             amount_bought=amount_bought,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"seller_id": ')
+        self.seller_id._write_json(write)
+        write(', "offer_id": ')
+        self.offer_id._write_json(write)
+        write(', "asset_sold": ')
+        self.asset_sold._write_json(write)
+        write(', "amount_sold": ')
+        self.amount_sold._write_json(write)
+        write(', "asset_bought": ')
+        self.asset_bought._write_json(write)
+        write(', "amount_bought": ')
+        self.amount_bought._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ClaimOfferAtom:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.seller_id = self.seller_id.clone()
+        result.offer_id = self.offer_id.clone()
+        result.asset_sold = self.asset_sold.clone()
+        result.amount_sold = self.amount_sold.clone()
+        result.asset_bought = self.asset_bought.clone()
+        result.amount_bought = self.amount_bought.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimOfferAtom:
+        return self.clone()
+
+    def freeze(self) -> ClaimOfferAtom:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .claim_predicate_type import ClaimPredicateType
 from .int64 import Int64
 
@@ -36,6 +51,15 @@ class ClaimPredicate:
         };
     """
 
+    __slots__ = (
+        "abs_before",
+        "and_predicates",
+        "not_predicate",
+        "or_predicates",
+        "rel_before",
+        "type",
+    )
+
     def __init__(
         self,
         type: ClaimPredicateType,
@@ -101,15 +125,200 @@ class ClaimPredicate:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL:
+            return 4
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_AND:
+            assert self.and_predicates is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.and_predicates)
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_OR:
+            assert self.or_predicates is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.or_predicates)
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_NOT:
+            assert self.not_predicate is not None
+            return (
+                4
+                + 4
+                + (
+                    self.not_predicate.xdr_size()
+                    if self.not_predicate is not None
+                    else 0
+                )
+            )
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_ABSOLUTE_TIME:
+            return 12
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_RELATIVE_TIME:
+            return 12
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ClaimPredicate:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ClaimPredicateType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = ClaimPredicateType.unpack(unpacker)
         if type == ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL:
-            return cls(type=type)
+            return
+        if type == ClaimPredicateType.CLAIM_PREDICATE_AND:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"and_predicates length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ClaimPredicate.skip(unpacker, depth_limit - 1)
+            return
+        if type == ClaimPredicateType.CLAIM_PREDICATE_OR:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"or_predicates length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ClaimPredicate.skip(unpacker, depth_limit - 1)
+            return
+        if type == ClaimPredicateType.CLAIM_PREDICATE_NOT:
+            if unpacker.unpack_uint():
+                ClaimPredicate.skip(unpacker, depth_limit - 1)
+            return
+        if type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_ABSOLUTE_TIME:
+            Int64.skip(unpacker, depth_limit - 1)
+            return
+        if type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_RELATIVE_TIME:
+            Int64.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimPredicate:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = ClaimPredicateType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL:
+            return _result
+        if type == ClaimPredicateType.CLAIM_PREDICATE_AND:
+            if "and_predicates" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"and_predicates length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["and_predicates"] = []
+                for _ in range(length):
+                    _result["and_predicates"].append(
+                        ClaimPredicate.unpack_fields(
+                            unpacker, fields["and_predicates"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"and_predicates length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    ClaimPredicate.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ClaimPredicateType.CLAIM_PREDICATE_OR:
+            if "or_predicates" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"or_predicates length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["or_predicates"] = []
+                for _ in range(length):
+                    _result["or_predicates"].append(
+                        ClaimPredicate.unpack_fields(
+                            unpacker, fields["or_predicates"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"or_predicates length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    ClaimPredicate.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ClaimPredicateType.CLAIM_PREDICATE_NOT:
+            if "not_predicate" in fields:
+                _result["not_predicate"] = (
+                    ClaimPredicate.unpack_fields(
+                        unpacker, fields["not_predicate"], depth_limit - 1
+                    )
+                    if unpacker.unpack_uint()
+                    else None
+                )
+            else:
+                if unpacker.unpack_uint():
+                    ClaimPredicate.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_ABSOLUTE_TIME:
+            if "abs_before" in fields:
+                _result["abs_before"] = Int64.unpack_fields(
+                    unpacker, fields["abs_before"], depth_limit - 1
+                )
+            else:
+                Int64.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_RELATIVE_TIME:
+            if "rel_before" in fields:
+                _result["rel_before"] = Int64.unpack_fields(
+                    unpacker, fields["rel_before"], depth_limit - 1
+                )
+            else:
+                Int64.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ClaimPredicateType.unpack(unpacker)
+        yield "type", type
+        if type == ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL:
+            return
         if type == ClaimPredicateType.CLAIM_PREDICATE_AND:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -119,8 +328,11 @@ class ClaimPredicate:
                 )
             and_predicates = []
             for _ in range(length):
-                and_predicates.append(ClaimPredicate.unpack(unpacker, depth_limit - 1))
-            return cls(type=type, and_predicates=and_predicates)
+                and_predicates.append(
+                    unpack_view(ClaimPredicate, unpacker, depth_limit - 1)
+                )
+            yield "and_predicates", and_predicates
+            return
         if type == ClaimPredicateType.CLAIM_PREDICATE_OR:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -130,21 +342,25 @@ class ClaimPredicate:
                 )
             or_predicates = []
             for _ in range(length):
-                or_predicates.append(ClaimPredicate.unpack(unpacker, depth_limit - 1))
-            return cls(type=type, or_predicates=or_predicates)
+                or_predicates.append(
+                    unpack_view(ClaimPredicate, unpacker, depth_limit - 1)
+                )
+            yield "or_predicates", or_predicates
+            return
         if type == ClaimPredicateType.CLAIM_PREDICATE_NOT:
-            not_predicate = (
-                ClaimPredicate.unpack(unpacker, depth_limit - 1)
+            yield (
+                "not_predicate",
+                view_at(ClaimPredicate, unpacker, depth_limit - 1)
                 if unpacker.unpack_uint()
-                else None
+                else None,
             )
-            return cls(type=type, not_predicate=not_predicate)
+            return
         if type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_ABSOLUTE_TIME:
-            abs_before = Int64.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, abs_before=abs_before)
+            yield "abs_before", Int64.unpack(unpacker, depth_limit - 1)
+            return
         if type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_RELATIVE_TIME:
-            rel_before = Int64.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, rel_before=rel_before)
+            yield "rel_before", Int64.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -153,10 +369,10 @@ class ClaimPredicate:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimPredicate:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClaimPredicate:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -171,11 +387,11 @@ class ClaimPredicate:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimPredicate:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL:
@@ -233,6 +449,74 @@ class ClaimPredicate:
             return cls(type=type, rel_before=rel_before)
         raise ValueError(f"Unknown key '{key}' for ClaimPredicate")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL:
+            write('"unconditional"')
+            return
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_AND:
+            assert self.and_predicates is not None
+            write('{"and": ')
+            write_json_array(write, self.and_predicates)
+            write("}")
+            return
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_OR:
+            assert self.or_predicates is not None
+            write('{"or": ')
+            write_json_array(write, self.or_predicates)
+            write("}")
+            return
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_NOT:
+            assert self.not_predicate is not None
+            write('{"not": ')
+            self.not_predicate._write_json(write)
+            write("}")
+            return
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_ABSOLUTE_TIME:
+            assert self.abs_before is not None
+            write('{"before_absolute_time": ')
+            self.abs_before._write_json(write)
+            write("}")
+            return
+        if self.type == ClaimPredicateType.CLAIM_PREDICATE_BEFORE_RELATIVE_TIME:
+            assert self.rel_before is not None
+            write('{"before_relative_time": ')
+            self.rel_before._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in ClaimPredicate: {self.type}")
+
+    def clone(self, deep: bool = True) -> ClaimPredicate:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.and_predicates = (
+            [item.clone() for item in self.and_predicates]
+            if self.and_predicates is not None
+            else None
+        )
+        result.or_predicates = (
+            [item.clone() for item in self.or_predicates]
+            if self.or_predicates is not None
+            else None
+        )
+        result.not_predicate = (
+            self.not_predicate.clone() if self.not_predicate is not None else None
+        )
+        result.abs_before = (
+            self.abs_before.clone() if self.abs_before is not None else None
+        )
+        result.rel_before = (
+            self.rel_before.clone() if self.rel_before is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimPredicate:
+        return self.clone()
+
+    def freeze(self) -> ClaimPredicate:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -271,3 +555,72 @@ class ClaimPredicate:
         if self.rel_before is not None:
             out.append(f"rel_before={self.rel_before}")
         return f"<ClaimPredicate [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> ClaimPredicate:
+    return cls(type=type)
+
+
+def _unpack_and_predicates(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ClaimPredicate:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"and_predicates length {length} exceeds remaining input length {_remaining}"
+        )
+    and_predicates = []
+    for _ in range(length):
+        and_predicates.append(ClaimPredicate.unpack(unpacker, depth_limit - 1))
+    return cls(type=type, and_predicates=and_predicates)
+
+
+def _unpack_or_predicates(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ClaimPredicate:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"or_predicates length {length} exceeds remaining input length {_remaining}"
+        )
+    or_predicates = []
+    for _ in range(length):
+        or_predicates.append(ClaimPredicate.unpack(unpacker, depth_limit - 1))
+    return cls(type=type, or_predicates=or_predicates)
+
+
+def _unpack_not_predicate(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ClaimPredicate:
+    not_predicate = (
+        ClaimPredicate.unpack(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint()
+        else None
+    )
+    return cls(type=type, not_predicate=not_predicate)
+
+
+def _unpack_abs_before(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ClaimPredicate:
+    abs_before = Int64.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, abs_before=abs_before)
+
+
+def _unpack_rel_before(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ClaimPredicate:
+    rel_before = Int64.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, rel_before=rel_before)
+
+
+_UNPACK_ARMS = {
+    ClaimPredicateType.CLAIM_PREDICATE_UNCONDITIONAL: _unpack_void,
+    ClaimPredicateType.CLAIM_PREDICATE_AND: _unpack_and_predicates,
+    ClaimPredicateType.CLAIM_PREDICATE_OR: _unpack_or_predicates,
+    ClaimPredicateType.CLAIM_PREDICATE_NOT: _unpack_not_predicate,
+    ClaimPredicateType.CLAIM_PREDICATE_BEFORE_ABSOLUTE_TIME: _unpack_abs_before,
+    ClaimPredicateType.CLAIM_PREDICATE_BEFORE_RELATIVE_TIME: _unpack_rel_before,
+}
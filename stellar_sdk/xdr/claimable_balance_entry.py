@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .claimable_balance_entry_ext import ClaimableBalanceEntryExt
 from .claimable_balance_id import ClaimableBalanceID
 from .claimant import Claimant
@@ -47,6 +61,8 @@ class ClaimableBalanceEntry:
         };
     """
 
+    __slots__ = ("amount", "asset", "balance_id", "claimants", "ext")
+
     def __init__(
         self,
         balance_id: ClaimableBalanceID,
@@ -75,6 +91,16 @@ class ClaimableBalanceEntry:
         self.amount.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            8
+            + self.balance_id.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.claimants)
+            + self.asset.xdr_size()
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -102,16 +128,126 @@ class ClaimableBalanceEntry:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ClaimableBalanceID.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"claimants length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Claimant.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        ClaimableBalanceEntryExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimableBalanceEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "balance_id" in fields:
+            _result["balance_id"] = ClaimableBalanceID.unpack_fields(
+                unpacker, fields["balance_id"], depth_limit - 1
+            )
+        else:
+            ClaimableBalanceID.skip(unpacker, depth_limit - 1)
+        if "claimants" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"claimants length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["claimants"] = []
+            for _ in range(length):
+                _result["claimants"].append(
+                    Claimant.unpack_fields(
+                        unpacker, fields["claimants"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"claimants length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Claimant.skip(unpacker, depth_limit - 1)
+        if "asset" in fields:
+            _result["asset"] = Asset.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount" in fields:
+            _result["amount"] = Int64.unpack_fields(
+                unpacker, fields["amount"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = ClaimableBalanceEntryExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ClaimableBalanceEntryExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "balance_id", ClaimableBalanceID.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"claimants length {length} exceeds remaining input length {_remaining}"
+            )
+        claimants = []
+        for _ in range(length):
+            claimants.append(unpack_view(Claimant, unpacker, depth_limit - 1))
+        yield "claimants", claimants
+        yield "asset", Asset.unpack(unpacker, depth_limit - 1)
+        yield "amount", Int64.unpack(unpacker, depth_limit - 1)
+        yield "ext", ClaimableBalanceEntryExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimableBalanceEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClaimableBalanceEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -126,11 +262,11 @@ class ClaimableBalanceEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimableBalanceEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -156,6 +292,36 @@ class ClaimableBalanceEntry:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"balance_id": ')
+        self.balance_id._write_json(write)
+        write(', "claimants": ')
+        write_json_array(write, self.claimants)
+        write(', "asset": ')
+        self.asset._write_json(write)
+        write(', "amount": ')
+        self.amount._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ClaimableBalanceEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.balance_id = self.balance_id.clone()
+        result.claimants = [item.clone() for item in self.claimants]
+        result.asset = self.asset.clone()
+        result.amount = self.amount.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimableBalanceEntry:
+        return self.clone()
+
+    def freeze(self) -> ClaimableBalanceEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .claimable_balance_entry_extension_v1_ext import (
     ClaimableBalanceEntryExtensionV1Ext,
 )
@@ -33,6 +43,8 @@ class ClaimableBalanceEntryExtensionV1:
         };
     """
 
+    __slots__ = ("ext", "flags")
+
     def __init__(
         self,
         ext: ClaimableBalanceEntryExtensionV1Ext,
@@ -45,6 +57,9 @@ class ClaimableBalanceEntryExtensionV1:
         self.ext.pack(packer)
         self.flags.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -58,16 +73,58 @@ class ClaimableBalanceEntryExtensionV1:
             flags=flags,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ClaimableBalanceEntryExtensionV1Ext.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimableBalanceEntryExtensionV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ClaimableBalanceEntryExtensionV1Ext.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ClaimableBalanceEntryExtensionV1Ext.skip(unpacker, depth_limit - 1)
+        if "flags" in fields:
+            _result["flags"] = Uint32.unpack_fields(
+                unpacker, fields["flags"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimableBalanceEntryExtensionV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClaimableBalanceEntryExtensionV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +139,11 @@ class ClaimableBalanceEntryExtensionV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimableBalanceEntryExtensionV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -103,6 +160,27 @@ class ClaimableBalanceEntryExtensionV1:
             flags=flags,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "flags": ')
+        self.flags._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ClaimableBalanceEntryExtensionV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.flags = self.flags.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimableBalanceEntryExtensionV1:
+        return self.clone()
+
+    def freeze(self) -> ClaimableBalanceEntryExtensionV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["ClaimableBalanceEntryExtensionV1Ext"]
 
@@ -23,6 +34,8 @@ class ClaimableBalanceEntryExtensionV1Ext:
             }
     """
 
+    __slots__ = ("v",)
+
     def __init__(
         self,
         v: int,
@@ -35,6 +48,11 @@ class ClaimableBalanceEntryExtensionV1Ext:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            return 4
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -42,20 +60,58 @@ class ClaimableBalanceEntryExtensionV1Ext:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        if v == 0:
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimableBalanceEntryExtensionV1Ext:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
         if v == 0:
-            return cls(v=v)
+            return _result
         raise ValueError("Invalid v.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimableBalanceEntryExtensionV1Ext:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClaimableBalanceEntryExtensionV1Ext:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -70,11 +126,11 @@ class ClaimableBalanceEntryExtensionV1Ext:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimableBalanceEntryExtensionV1Ext:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -90,6 +146,25 @@ class ClaimableBalanceEntryExtensionV1Ext:
         v = int(json_value[1:])
         return cls(v=v)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            write('"v0"')
+            return
+        raise ValueError(f"Unknown v in ClaimableBalanceEntryExtensionV1Ext: {self.v}")
+
+    def clone(self, deep: bool = True) -> ClaimableBalanceEntryExtensionV1Ext:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimableBalanceEntryExtensionV1Ext:
+        return self.clone()
+
+    def freeze(self) -> ClaimableBalanceEntryExtensionV1Ext:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.v,))
 
@@ -102,3 +177,14 @@ class ClaimableBalanceEntryExtensionV1Ext:
         out = []
         out.append(f"v={self.v}")
         return f"<ClaimableBalanceEntryExtensionV1Ext [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> ClaimableBalanceEntryExtensionV1Ext:
+    return cls(v=v)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_void,
+}
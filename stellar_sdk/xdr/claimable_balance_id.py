@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .claimable_balance_id_type import ClaimableBalanceIDType
 from .hash import Hash
 
@@ -25,6 +36,8 @@ class ClaimableBalanceID:
         };
     """
 
+    __slots__ = ("type", "v0")
+
     def __init__(
         self,
         type: ClaimableBalanceIDType,
@@ -42,28 +55,77 @@ class ClaimableBalanceID:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == ClaimableBalanceIDType.CLAIMABLE_BALANCE_ID_TYPE_V0:
+            return 36
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ClaimableBalanceID:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ClaimableBalanceIDType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = ClaimableBalanceIDType.unpack(unpacker)
         if type == ClaimableBalanceIDType.CLAIMABLE_BALANCE_ID_TYPE_V0:
-            v0 = Hash.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v0=v0)
+            Hash.skip(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimableBalanceID:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = ClaimableBalanceIDType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == ClaimableBalanceIDType.CLAIMABLE_BALANCE_ID_TYPE_V0:
+            if "v0" in fields:
+                _result["v0"] = Hash.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                Hash.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimableBalanceID:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClaimableBalanceID:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +140,11 @@ class ClaimableBalanceID:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimableBalanceID:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         from ..strkey import StrKey
@@ -96,6 +158,23 @@ class ClaimableBalanceID:
         raw = StrKey.decode_claimable_balance(json_value)
         return cls.from_xdr_bytes(b"\x00\x00\x00" + raw)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> ClaimableBalanceID:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimableBalanceID:
+        return self.clone()
+
+    def freeze(self) -> ClaimableBalanceID:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -115,3 +194,13 @@ class ClaimableBalanceID:
         if self.v0 is not None:
             out.append(f"v0={self.v0}")
         return f"<ClaimableBalanceID [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, type, unpacker: Unpacker, depth_limit: int) -> ClaimableBalanceID:
+    v0 = Hash.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v0=v0)
+
+
+_UNPACK_ARMS = {
+    ClaimableBalanceIDType.CLAIMABLE_BALANCE_ID_TYPE_V0: _unpack_v0,
+}
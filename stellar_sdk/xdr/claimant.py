@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .claimant_type import ClaimantType
 from .claimant_v0 import ClaimantV0
 
@@ -29,6 +42,8 @@ class Claimant:
         };
     """
 
+    __slots__ = ("type", "v0")
+
     def __init__(
         self,
         type: ClaimantType,
@@ -46,16 +61,79 @@ class Claimant:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == ClaimantType.CLAIMANT_TYPE_V0:
+            assert self.v0 is not None
+            return 4 + self.v0.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> Claimant:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ClaimantType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = ClaimantType.unpack(unpacker)
         if type == ClaimantType.CLAIMANT_TYPE_V0:
-            v0 = ClaimantV0.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v0=v0)
+            ClaimantV0.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Claimant:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = ClaimantType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == ClaimantType.CLAIMANT_TYPE_V0:
+            if "v0" in fields:
+                _result["v0"] = ClaimantV0.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                ClaimantV0.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ClaimantType.unpack(unpacker)
+        yield "type", type
+        if type == ClaimantType.CLAIMANT_TYPE_V0:
+            yield "v0", view_at(ClaimantV0, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -64,10 +142,10 @@ class Claimant:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Claimant:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Claimant:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +160,11 @@ class Claimant:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Claimant:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == ClaimantType.CLAIMANT_TYPE_V0:
@@ -107,6 +185,29 @@ class Claimant:
             return cls(type=type, v0=v0)
         raise ValueError(f"Unknown key '{key}' for Claimant")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == ClaimantType.CLAIMANT_TYPE_V0:
+            assert self.v0 is not None
+            write('{"claimant_type_v0": ')
+            self.v0._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in Claimant: {self.type}")
+
+    def clone(self, deep: bool = True) -> Claimant:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Claimant:
+        return self.clone()
+
+    def freeze(self) -> Claimant:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -126,3 +227,13 @@ class Claimant:
         if self.v0 is not None:
             out.append(f"v0={self.v0}")
         return f"<Claimant [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, type, unpacker: Unpacker, depth_limit: int) -> Claimant:
+    v0 = ClaimantV0.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v0=v0)
+
+
+_UNPACK_ARMS = {
+    ClaimantType.CLAIMANT_TYPE_V0: _unpack_v0,
+}
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .claim_predicate import ClaimPredicate
 
 __all__ = ["ClaimantV0"]
@@ -25,6 +38,8 @@ class ClaimantV0:
             }
     """
 
+    __slots__ = ("destination", "predicate")
+
     def __init__(
         self,
         destination: AccountID,
@@ -37,6 +52,9 @@ class ClaimantV0:
         self.destination.pack(packer)
         self.predicate.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.destination.xdr_size() + self.predicate.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +68,67 @@ class ClaimantV0:
             predicate=predicate,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        ClaimPredicate.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClaimantV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "destination" in fields:
+            _result["destination"] = AccountID.unpack_fields(
+                unpacker, fields["destination"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "predicate" in fields:
+            _result["predicate"] = ClaimPredicate.unpack_fields(
+                unpacker, fields["predicate"], depth_limit - 1
+            )
+        else:
+            ClaimPredicate.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "destination", AccountID.unpack(unpacker, depth_limit - 1)
+        yield "predicate", view_at(ClaimPredicate, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClaimantV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClaimantV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +143,11 @@ class ClaimantV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClaimantV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +164,27 @@ class ClaimantV0:
             predicate=predicate,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"destination": ')
+        self.destination._write_json(write)
+        write(', "predicate": ')
+        self.predicate._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ClaimantV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.destination = self.destination.clone()
+        result.predicate = self.predicate.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClaimantV0:
+        return self.clone()
+
+    def freeze(self) -> ClaimantV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .clawback_claimable_balance_result_code import ClawbackClaimableBalanceResultCode
 
 __all__ = ["ClawbackClaimableBalanceResult"]
@@ -29,6 +39,8 @@ class ClawbackClaimableBalanceResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: ClawbackClaimableBalanceResultCode,
@@ -59,10 +71,43 @@ class ClawbackClaimableBalanceResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_SUCCESS
+        ):
+            return 4
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_DOES_NOT_EXIST
+        ):
+            return 4
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_ISSUER
+        ):
+            return 4
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_CLAWBACK_ENABLED
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ClawbackClaimableBalanceResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ClawbackClaimableBalanceResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ClawbackClaimableBalanceResultCode.unpack(unpacker)
@@ -70,34 +115,80 @@ class ClawbackClaimableBalanceResult:
             code
             == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_SUCCESS
         ):
-            return cls(code=code)
+            return
         if (
             code
             == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_DOES_NOT_EXIST
         ):
-            return cls(code=code)
+            return
         if (
             code
             == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_ISSUER
         ):
-            return cls(code=code)
+            return
         if (
             code
             == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_CLAWBACK_ENABLED
         ):
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClawbackClaimableBalanceResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ClawbackClaimableBalanceResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if (
+            code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_SUCCESS
+        ):
+            return _result
+        if (
+            code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_DOES_NOT_EXIST
+        ):
+            return _result
+        if (
+            code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_ISSUER
+        ):
+            return _result
+        if (
+            code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_CLAWBACK_ENABLED
+        ):
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClawbackClaimableBalanceResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ClawbackClaimableBalanceResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -112,11 +203,11 @@ class ClawbackClaimableBalanceResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClawbackClaimableBalanceResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -155,6 +246,46 @@ class ClawbackClaimableBalanceResult:
         code = ClawbackClaimableBalanceResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_SUCCESS
+        ):
+            write('"success"')
+            return
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_DOES_NOT_EXIST
+        ):
+            write('"does_not_exist"')
+            return
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_ISSUER
+        ):
+            write('"not_issuer"')
+            return
+        if (
+            self.code
+            == ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_CLAWBACK_ENABLED
+        ):
+            write('"not_clawback_enabled"')
+            return
+        raise ValueError(f"Unknown code in ClawbackClaimableBalanceResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ClawbackClaimableBalanceResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClawbackClaimableBalanceResult:
+        return self.clone()
+
+    def freeze(self) -> ClawbackClaimableBalanceResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -167,3 +298,17 @@ class ClawbackClaimableBalanceResult:
         out = []
         out.append(f"code={self.code}")
         return f"<ClawbackClaimableBalanceResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> ClawbackClaimableBalanceResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_SUCCESS: _unpack_void,
+    ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_DOES_NOT_EXIST: _unpack_void,
+    ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_ISSUER: _unpack_void,
+    ClawbackClaimableBalanceResultCode.CLAWBACK_CLAIMABLE_BALANCE_NOT_CLAWBACK_ENABLED: _unpack_void,
+}
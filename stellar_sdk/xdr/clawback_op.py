@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .muxed_account import MuxedAccount
 
@@ -27,6 +37,8 @@ class ClawbackOp:
         };
     """
 
+    __slots__ = ("amount", "asset", "from_")
+
     def __init__(
         self,
         asset: Asset,
@@ -42,6 +54,9 @@ class ClawbackOp:
         self.from_.pack(packer)
         self.amount.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.asset.xdr_size() + self.from_.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +72,63 @@ class ClawbackOp:
             amount=amount,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Asset.skip(unpacker, depth_limit - 1)
+        MuxedAccount.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClawbackOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "asset" in fields:
+            _result["asset"] = Asset.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "from_" in fields:
+            _result["from_"] = MuxedAccount.unpack_fields(
+                unpacker, fields["from_"], depth_limit - 1
+            )
+        else:
+            MuxedAccount.skip(unpacker, depth_limit - 1)
+        if "amount" in fields:
+            _result["amount"] = Int64.unpack_fields(
+                unpacker, fields["amount"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClawbackOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClawbackOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +143,11 @@ class ClawbackOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClawbackOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +167,30 @@ class ClawbackOp:
             amount=amount,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"asset": ')
+        self.asset._write_json(write)
+        write(', "from_": ')
+        self.from_._write_json(write)
+        write(', "amount": ')
+        self.amount._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ClawbackOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.asset = self.asset.clone()
+        result.from_ = self.from_.clone()
+        result.amount = self.amount.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClawbackOp:
+        return self.clone()
+
+    def freeze(self) -> ClawbackOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
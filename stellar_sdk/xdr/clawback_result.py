@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .clawback_result_code import ClawbackResultCode
 
 __all__ = ["ClawbackResult"]
@@ -29,6 +39,8 @@ class ClawbackResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: ClawbackResultCode,
@@ -49,35 +61,92 @@ class ClawbackResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == ClawbackResultCode.CLAWBACK_SUCCESS:
+            return 4
+        if self.code == ClawbackResultCode.CLAWBACK_MALFORMED:
+            return 4
+        if self.code == ClawbackResultCode.CLAWBACK_NOT_CLAWBACK_ENABLED:
+            return 4
+        if self.code == ClawbackResultCode.CLAWBACK_NO_TRUST:
+            return 4
+        if self.code == ClawbackResultCode.CLAWBACK_UNDERFUNDED:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ClawbackResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ClawbackResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ClawbackResultCode.unpack(unpacker)
         if code == ClawbackResultCode.CLAWBACK_SUCCESS:
-            return cls(code=code)
+            return
         if code == ClawbackResultCode.CLAWBACK_MALFORMED:
-            return cls(code=code)
+            return
         if code == ClawbackResultCode.CLAWBACK_NOT_CLAWBACK_ENABLED:
-            return cls(code=code)
+            return
         if code == ClawbackResultCode.CLAWBACK_NO_TRUST:
-            return cls(code=code)
+            return
         if code == ClawbackResultCode.CLAWBACK_UNDERFUNDED:
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ClawbackResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ClawbackResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == ClawbackResultCode.CLAWBACK_SUCCESS:
+            return _result
+        if code == ClawbackResultCode.CLAWBACK_MALFORMED:
+            return _result
+        if code == ClawbackResultCode.CLAWBACK_NOT_CLAWBACK_ENABLED:
+            return _result
+        if code == ClawbackResultCode.CLAWBACK_NO_TRUST:
+            return _result
+        if code == ClawbackResultCode.CLAWBACK_UNDERFUNDED:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ClawbackResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ClawbackResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +161,11 @@ class ClawbackResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ClawbackResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == ClawbackResultCode.CLAWBACK_SUCCESS:
@@ -126,6 +195,37 @@ class ClawbackResult:
         code = ClawbackResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == ClawbackResultCode.CLAWBACK_SUCCESS:
+            write('"success"')
+            return
+        if self.code == ClawbackResultCode.CLAWBACK_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == ClawbackResultCode.CLAWBACK_NOT_CLAWBACK_ENABLED:
+            write('"not_clawback_enabled"')
+            return
+        if self.code == ClawbackResultCode.CLAWBACK_NO_TRUST:
+            write('"no_trust"')
+            return
+        if self.code == ClawbackResultCode.CLAWBACK_UNDERFUNDED:
+            write('"underfunded"')
+            return
+        raise ValueError(f"Unknown code in ClawbackResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ClawbackResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ClawbackResult:
+        return self.clone()
+
+    def freeze(self) -> ClawbackResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -138,3 +238,16 @@ class ClawbackResult:
         out = []
         out.append(f"code={self.code}")
         return f"<ClawbackResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> ClawbackResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    ClawbackResultCode.CLAWBACK_SUCCESS: _unpack_void,
+    ClawbackResultCode.CLAWBACK_MALFORMED: _unpack_void,
+    ClawbackResultCode.CLAWBACK_NOT_CLAWBACK_ENABLED: _unpack_void,
+    ClawbackResultCode.CLAWBACK_NO_TRUST: _unpack_void,
+    ClawbackResultCode.CLAWBACK_UNDERFUNDED: _unpack_void,
+}
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">IIq")
 __all__ = ["ConfigSettingContractBandwidthV0"]
 
 
@@ -30,6 +42,8 @@ class ConfigSettingContractBandwidthV0:
         };
     """
 
+    __slots__ = ("fee_tx_size1_kb", "ledger_max_txs_size_bytes", "tx_max_size_bytes")
+
     def __init__(
         self,
         ledger_max_txs_size_bytes: Uint32,
@@ -41,9 +55,15 @@ class ConfigSettingContractBandwidthV0:
         self.fee_tx_size1_kb = fee_tx_size1_kb
 
     def pack(self, packer: Packer) -> None:
-        self.ledger_max_txs_size_bytes.pack(packer)
-        self.tx_max_size_bytes.pack(packer)
-        self.fee_tx_size1_kb.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.ledger_max_txs_size_bytes.uint32,
+            self.tx_max_size_bytes.uint32,
+            self.fee_tx_size1_kb.int64,
+        )
+
+    def xdr_size(self) -> int:
+        return 16
 
     @classmethod
     def unpack(
@@ -51,25 +71,72 @@ class ConfigSettingContractBandwidthV0:
     ) -> ConfigSettingContractBandwidthV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        ledger_max_txs_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-        tx_max_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-        fee_tx_size1_kb = Int64.unpack(unpacker, depth_limit - 1)
+        ledger_max_txs_size_bytes, tx_max_size_bytes, fee_tx_size1_kb = _LAYOUT.read(
+            unpacker
+        )
         return cls(
-            ledger_max_txs_size_bytes=ledger_max_txs_size_bytes,
-            tx_max_size_bytes=tx_max_size_bytes,
-            fee_tx_size1_kb=fee_tx_size1_kb,
+            ledger_max_txs_size_bytes=Uint32(ledger_max_txs_size_bytes),
+            tx_max_size_bytes=Uint32(tx_max_size_bytes),
+            fee_tx_size1_kb=Int64(fee_tx_size1_kb),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractBandwidthV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_max_txs_size_bytes" in fields:
+            _result["ledger_max_txs_size_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_txs_size_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "tx_max_size_bytes" in fields:
+            _result["tx_max_size_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["tx_max_size_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "fee_tx_size1_kb" in fields:
+            _result["fee_tx_size1_kb"] = Int64.unpack_fields(
+                unpacker, fields["fee_tx_size1_kb"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractBandwidthV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractBandwidthV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -84,11 +151,11 @@ class ConfigSettingContractBandwidthV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractBandwidthV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +177,30 @@ class ConfigSettingContractBandwidthV0:
             fee_tx_size1_kb=fee_tx_size1_kb,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_max_txs_size_bytes": ')
+        self.ledger_max_txs_size_bytes._write_json(write)
+        write(', "tx_max_size_bytes": ')
+        self.tx_max_size_bytes._write_json(write)
+        write(', "fee_tx_size1_kb": ')
+        self.fee_tx_size1_kb._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractBandwidthV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_max_txs_size_bytes = self.ledger_max_txs_size_bytes.clone()
+        result.tx_max_size_bytes = self.tx_max_size_bytes.clone()
+        result.fee_tx_size1_kb = self.fee_tx_size1_kb.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractBandwidthV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractBandwidthV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
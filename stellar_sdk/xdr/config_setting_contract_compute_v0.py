@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">qqqI")
 __all__ = ["ConfigSettingContractComputeV0"]
 
 
@@ -33,6 +45,13 @@ class ConfigSettingContractComputeV0:
         };
     """
 
+    __slots__ = (
+        "fee_rate_per_instructions_increment",
+        "ledger_max_instructions",
+        "tx_max_instructions",
+        "tx_memory_limit",
+    )
+
     def __init__(
         self,
         ledger_max_instructions: Int64,
@@ -46,10 +65,16 @@ class ConfigSettingContractComputeV0:
         self.tx_memory_limit = tx_memory_limit
 
     def pack(self, packer: Packer) -> None:
-        self.ledger_max_instructions.pack(packer)
-        self.tx_max_instructions.pack(packer)
-        self.fee_rate_per_instructions_increment.pack(packer)
-        self.tx_memory_limit.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.ledger_max_instructions.int64,
+            self.tx_max_instructions.int64,
+            self.fee_rate_per_instructions_increment.int64,
+            self.tx_memory_limit.uint32,
+        )
+
+    def xdr_size(self) -> int:
+        return 28
 
     @classmethod
     def unpack(
@@ -57,27 +82,84 @@ class ConfigSettingContractComputeV0:
     ) -> ConfigSettingContractComputeV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        ledger_max_instructions = Int64.unpack(unpacker, depth_limit - 1)
-        tx_max_instructions = Int64.unpack(unpacker, depth_limit - 1)
-        fee_rate_per_instructions_increment = Int64.unpack(unpacker, depth_limit - 1)
-        tx_memory_limit = Uint32.unpack(unpacker, depth_limit - 1)
+        (
+            ledger_max_instructions,
+            tx_max_instructions,
+            fee_rate_per_instructions_increment,
+            tx_memory_limit,
+        ) = _LAYOUT.read(unpacker)
         return cls(
-            ledger_max_instructions=ledger_max_instructions,
-            tx_max_instructions=tx_max_instructions,
-            fee_rate_per_instructions_increment=fee_rate_per_instructions_increment,
-            tx_memory_limit=tx_memory_limit,
+            ledger_max_instructions=Int64(ledger_max_instructions),
+            tx_max_instructions=Int64(tx_max_instructions),
+            fee_rate_per_instructions_increment=Int64(
+                fee_rate_per_instructions_increment
+            ),
+            tx_memory_limit=Uint32(tx_memory_limit),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractComputeV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_max_instructions" in fields:
+            _result["ledger_max_instructions"] = Int64.unpack_fields(
+                unpacker, fields["ledger_max_instructions"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "tx_max_instructions" in fields:
+            _result["tx_max_instructions"] = Int64.unpack_fields(
+                unpacker, fields["tx_max_instructions"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "fee_rate_per_instructions_increment" in fields:
+            _result["fee_rate_per_instructions_increment"] = Int64.unpack_fields(
+                unpacker, fields["fee_rate_per_instructions_increment"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "tx_memory_limit" in fields:
+            _result["tx_memory_limit"] = Uint32.unpack_fields(
+                unpacker, fields["tx_memory_limit"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractComputeV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractComputeV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +174,11 @@ class ConfigSettingContractComputeV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractComputeV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -123,6 +205,35 @@ class ConfigSettingContractComputeV0:
             tx_memory_limit=tx_memory_limit,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_max_instructions": ')
+        self.ledger_max_instructions._write_json(write)
+        write(', "tx_max_instructions": ')
+        self.tx_max_instructions._write_json(write)
+        write(', "fee_rate_per_instructions_increment": ')
+        self.fee_rate_per_instructions_increment._write_json(write)
+        write(', "tx_memory_limit": ')
+        self.tx_memory_limit._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractComputeV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_max_instructions = self.ledger_max_instructions.clone()
+        result.tx_max_instructions = self.tx_max_instructions.clone()
+        result.fee_rate_per_instructions_increment = (
+            self.fee_rate_per_instructions_increment.clone()
+        )
+        result.tx_memory_limit = self.tx_memory_limit.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractComputeV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractComputeV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
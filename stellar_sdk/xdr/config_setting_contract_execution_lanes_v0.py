@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">I")
 __all__ = ["ConfigSettingContractExecutionLanesV0"]
 
 
@@ -24,6 +36,8 @@ class ConfigSettingContractExecutionLanesV0:
         };
     """
 
+    __slots__ = ("ledger_max_tx_count",)
+
     def __init__(
         self,
         ledger_max_tx_count: Uint32,
@@ -31,7 +45,10 @@ class ConfigSettingContractExecutionLanesV0:
         self.ledger_max_tx_count = ledger_max_tx_count
 
     def pack(self, packer: Packer) -> None:
-        self.ledger_max_tx_count.pack(packer)
+        _LAYOUT.write(packer, self.ledger_max_tx_count.uint32)
+
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(
@@ -39,21 +56,56 @@ class ConfigSettingContractExecutionLanesV0:
     ) -> ConfigSettingContractExecutionLanesV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        ledger_max_tx_count = Uint32.unpack(unpacker, depth_limit - 1)
+        (ledger_max_tx_count,) = _LAYOUT.read(unpacker)
         return cls(
-            ledger_max_tx_count=ledger_max_tx_count,
+            ledger_max_tx_count=Uint32(ledger_max_tx_count),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractExecutionLanesV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_max_tx_count" in fields:
+            _result["ledger_max_tx_count"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_tx_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractExecutionLanesV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractExecutionLanesV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -68,11 +120,11 @@ class ConfigSettingContractExecutionLanesV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractExecutionLanesV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -86,6 +138,24 @@ class ConfigSettingContractExecutionLanesV0:
             ledger_max_tx_count=ledger_max_tx_count,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_max_tx_count": ')
+        self.ledger_max_tx_count._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractExecutionLanesV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_max_tx_count = self.ledger_max_tx_count.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractExecutionLanesV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractExecutionLanesV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.ledger_max_tx_count,))
 
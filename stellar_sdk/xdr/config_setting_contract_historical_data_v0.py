@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
+_LAYOUT = FixedLayout(">q")
 __all__ = ["ConfigSettingContractHistoricalDataV0"]
 
 
@@ -23,6 +35,8 @@ class ConfigSettingContractHistoricalDataV0:
         };
     """
 
+    __slots__ = ("fee_historical1_kb",)
+
     def __init__(
         self,
         fee_historical1_kb: Int64,
@@ -30,7 +44,10 @@ class ConfigSettingContractHistoricalDataV0:
         self.fee_historical1_kb = fee_historical1_kb
 
     def pack(self, packer: Packer) -> None:
-        self.fee_historical1_kb.pack(packer)
+        _LAYOUT.write(packer, self.fee_historical1_kb.int64)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -38,21 +55,56 @@ class ConfigSettingContractHistoricalDataV0:
     ) -> ConfigSettingContractHistoricalDataV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        fee_historical1_kb = Int64.unpack(unpacker, depth_limit - 1)
+        (fee_historical1_kb,) = _LAYOUT.read(unpacker)
         return cls(
-            fee_historical1_kb=fee_historical1_kb,
+            fee_historical1_kb=Int64(fee_historical1_kb),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractHistoricalDataV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "fee_historical1_kb" in fields:
+            _result["fee_historical1_kb"] = Int64.unpack_fields(
+                unpacker, fields["fee_historical1_kb"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractHistoricalDataV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractHistoricalDataV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +119,11 @@ class ConfigSettingContractHistoricalDataV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractHistoricalDataV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +137,24 @@ class ConfigSettingContractHistoricalDataV0:
             fee_historical1_kb=fee_historical1_kb,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"fee_historical1_kb": ')
+        self.fee_historical1_kb._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractHistoricalDataV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.fee_historical1_kb = self.fee_historical1_kb.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractHistoricalDataV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractHistoricalDataV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.fee_historical1_kb,))
 
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">Iq")
 __all__ = ["ConfigSettingContractLedgerCostExtV0"]
 
 
@@ -29,6 +41,8 @@ class ConfigSettingContractLedgerCostExtV0:
         };
     """
 
+    __slots__ = ("fee_write1_kb", "tx_max_footprint_entries")
+
     def __init__(
         self,
         tx_max_footprint_entries: Uint32,
@@ -38,8 +52,12 @@ class ConfigSettingContractLedgerCostExtV0:
         self.fee_write1_kb = fee_write1_kb
 
     def pack(self, packer: Packer) -> None:
-        self.tx_max_footprint_entries.pack(packer)
-        self.fee_write1_kb.pack(packer)
+        _LAYOUT.write(
+            packer, self.tx_max_footprint_entries.uint32, self.fee_write1_kb.int64
+        )
+
+    def xdr_size(self) -> int:
+        return 12
 
     @classmethod
     def unpack(
@@ -47,23 +65,63 @@ class ConfigSettingContractLedgerCostExtV0:
     ) -> ConfigSettingContractLedgerCostExtV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        tx_max_footprint_entries = Uint32.unpack(unpacker, depth_limit - 1)
-        fee_write1_kb = Int64.unpack(unpacker, depth_limit - 1)
+        tx_max_footprint_entries, fee_write1_kb = _LAYOUT.read(unpacker)
         return cls(
-            tx_max_footprint_entries=tx_max_footprint_entries,
-            fee_write1_kb=fee_write1_kb,
+            tx_max_footprint_entries=Uint32(tx_max_footprint_entries),
+            fee_write1_kb=Int64(fee_write1_kb),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractLedgerCostExtV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_max_footprint_entries" in fields:
+            _result["tx_max_footprint_entries"] = Uint32.unpack_fields(
+                unpacker, fields["tx_max_footprint_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "fee_write1_kb" in fields:
+            _result["fee_write1_kb"] = Int64.unpack_fields(
+                unpacker, fields["fee_write1_kb"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractLedgerCostExtV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractLedgerCostExtV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +136,11 @@ class ConfigSettingContractLedgerCostExtV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractLedgerCostExtV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -101,6 +159,27 @@ class ConfigSettingContractLedgerCostExtV0:
             fee_write1_kb=fee_write1_kb,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx_max_footprint_entries": ')
+        self.tx_max_footprint_entries._write_json(write)
+        write(', "fee_write1_kb": ')
+        self.fee_write1_kb._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractLedgerCostExtV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_max_footprint_entries = self.tx_max_footprint_entries.clone()
+        result.fee_write1_kb = self.fee_write1_kb.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractLedgerCostExtV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractLedgerCostExtV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
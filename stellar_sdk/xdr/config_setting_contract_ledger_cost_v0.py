@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">IIIIIIIIqqqqqqI")
 __all__ = ["ConfigSettingContractLedgerCostV0"]
 
 
@@ -55,6 +67,24 @@ class ConfigSettingContractLedgerCostV0:
         };
     """
 
+    __slots__ = (
+        "fee_disk_read1_kb",
+        "fee_disk_read_ledger_entry",
+        "fee_write_ledger_entry",
+        "ledger_max_disk_read_bytes",
+        "ledger_max_disk_read_entries",
+        "ledger_max_write_bytes",
+        "ledger_max_write_ledger_entries",
+        "rent_fee1_kb_soroban_state_size_high",
+        "rent_fee1_kb_soroban_state_size_low",
+        "soroban_state_rent_fee_growth_factor",
+        "soroban_state_target_size_bytes",
+        "tx_max_disk_read_bytes",
+        "tx_max_disk_read_entries",
+        "tx_max_write_bytes",
+        "tx_max_write_ledger_entries",
+    )
+
     def __init__(
         self,
         ledger_max_disk_read_entries: Uint32,
@@ -90,21 +120,27 @@ class ConfigSettingContractLedgerCostV0:
         self.soroban_state_rent_fee_growth_factor = soroban_state_rent_fee_growth_factor
 
     def pack(self, packer: Packer) -> None:
-        self.ledger_max_disk_read_entries.pack(packer)
-        self.ledger_max_disk_read_bytes.pack(packer)
-        self.ledger_max_write_ledger_entries.pack(packer)
-        self.ledger_max_write_bytes.pack(packer)
-        self.tx_max_disk_read_entries.pack(packer)
-        self.tx_max_disk_read_bytes.pack(packer)
-        self.tx_max_write_ledger_entries.pack(packer)
-        self.tx_max_write_bytes.pack(packer)
-        self.fee_disk_read_ledger_entry.pack(packer)
-        self.fee_write_ledger_entry.pack(packer)
-        self.fee_disk_read1_kb.pack(packer)
-        self.soroban_state_target_size_bytes.pack(packer)
-        self.rent_fee1_kb_soroban_state_size_low.pack(packer)
-        self.rent_fee1_kb_soroban_state_size_high.pack(packer)
-        self.soroban_state_rent_fee_growth_factor.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.ledger_max_disk_read_entries.uint32,
+            self.ledger_max_disk_read_bytes.uint32,
+            self.ledger_max_write_ledger_entries.uint32,
+            self.ledger_max_write_bytes.uint32,
+            self.tx_max_disk_read_entries.uint32,
+            self.tx_max_disk_read_bytes.uint32,
+            self.tx_max_write_ledger_entries.uint32,
+            self.tx_max_write_bytes.uint32,
+            self.fee_disk_read_ledger_entry.int64,
+            self.fee_write_ledger_entry.int64,
+            self.fee_disk_read1_kb.int64,
+            self.soroban_state_target_size_bytes.int64,
+            self.rent_fee1_kb_soroban_state_size_low.int64,
+            self.rent_fee1_kb_soroban_state_size_high.int64,
+            self.soroban_state_rent_fee_growth_factor.uint32,
+        )
+
+    def xdr_size(self) -> int:
+        return 84
 
     @classmethod
     def unpack(
@@ -112,49 +148,180 @@ class ConfigSettingContractLedgerCostV0:
     ) -> ConfigSettingContractLedgerCostV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        ledger_max_disk_read_entries = Uint32.unpack(unpacker, depth_limit - 1)
-        ledger_max_disk_read_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-        ledger_max_write_ledger_entries = Uint32.unpack(unpacker, depth_limit - 1)
-        ledger_max_write_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-        tx_max_disk_read_entries = Uint32.unpack(unpacker, depth_limit - 1)
-        tx_max_disk_read_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-        tx_max_write_ledger_entries = Uint32.unpack(unpacker, depth_limit - 1)
-        tx_max_write_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-        fee_disk_read_ledger_entry = Int64.unpack(unpacker, depth_limit - 1)
-        fee_write_ledger_entry = Int64.unpack(unpacker, depth_limit - 1)
-        fee_disk_read1_kb = Int64.unpack(unpacker, depth_limit - 1)
-        soroban_state_target_size_bytes = Int64.unpack(unpacker, depth_limit - 1)
-        rent_fee1_kb_soroban_state_size_low = Int64.unpack(unpacker, depth_limit - 1)
-        rent_fee1_kb_soroban_state_size_high = Int64.unpack(unpacker, depth_limit - 1)
-        soroban_state_rent_fee_growth_factor = Uint32.unpack(unpacker, depth_limit - 1)
+        (
+            ledger_max_disk_read_entries,
+            ledger_max_disk_read_bytes,
+            ledger_max_write_ledger_entries,
+            ledger_max_write_bytes,
+            tx_max_disk_read_entries,
+            tx_max_disk_read_bytes,
+            tx_max_write_ledger_entries,
+            tx_max_write_bytes,
+            fee_disk_read_ledger_entry,
+            fee_write_ledger_entry,
+            fee_disk_read1_kb,
+            soroban_state_target_size_bytes,
+            rent_fee1_kb_soroban_state_size_low,
+            rent_fee1_kb_soroban_state_size_high,
+            soroban_state_rent_fee_growth_factor,
+        ) = _LAYOUT.read(unpacker)
         return cls(
-            ledger_max_disk_read_entries=ledger_max_disk_read_entries,
-            ledger_max_disk_read_bytes=ledger_max_disk_read_bytes,
-            ledger_max_write_ledger_entries=ledger_max_write_ledger_entries,
-            ledger_max_write_bytes=ledger_max_write_bytes,
-            tx_max_disk_read_entries=tx_max_disk_read_entries,
-            tx_max_disk_read_bytes=tx_max_disk_read_bytes,
-            tx_max_write_ledger_entries=tx_max_write_ledger_entries,
-            tx_max_write_bytes=tx_max_write_bytes,
-            fee_disk_read_ledger_entry=fee_disk_read_ledger_entry,
-            fee_write_ledger_entry=fee_write_ledger_entry,
-            fee_disk_read1_kb=fee_disk_read1_kb,
-            soroban_state_target_size_bytes=soroban_state_target_size_bytes,
-            rent_fee1_kb_soroban_state_size_low=rent_fee1_kb_soroban_state_size_low,
-            rent_fee1_kb_soroban_state_size_high=rent_fee1_kb_soroban_state_size_high,
-            soroban_state_rent_fee_growth_factor=soroban_state_rent_fee_growth_factor,
+            ledger_max_disk_read_entries=Uint32(ledger_max_disk_read_entries),
+            ledger_max_disk_read_bytes=Uint32(ledger_max_disk_read_bytes),
+            ledger_max_write_ledger_entries=Uint32(ledger_max_write_ledger_entries),
+            ledger_max_write_bytes=Uint32(ledger_max_write_bytes),
+            tx_max_disk_read_entries=Uint32(tx_max_disk_read_entries),
+            tx_max_disk_read_bytes=Uint32(tx_max_disk_read_bytes),
+            tx_max_write_ledger_entries=Uint32(tx_max_write_ledger_entries),
+            tx_max_write_bytes=Uint32(tx_max_write_bytes),
+            fee_disk_read_ledger_entry=Int64(fee_disk_read_ledger_entry),
+            fee_write_ledger_entry=Int64(fee_write_ledger_entry),
+            fee_disk_read1_kb=Int64(fee_disk_read1_kb),
+            soroban_state_target_size_bytes=Int64(soroban_state_target_size_bytes),
+            rent_fee1_kb_soroban_state_size_low=Int64(
+                rent_fee1_kb_soroban_state_size_low
+            ),
+            rent_fee1_kb_soroban_state_size_high=Int64(
+                rent_fee1_kb_soroban_state_size_high
+            ),
+            soroban_state_rent_fee_growth_factor=Uint32(
+                soroban_state_rent_fee_growth_factor
+            ),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractLedgerCostV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_max_disk_read_entries" in fields:
+            _result["ledger_max_disk_read_entries"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_disk_read_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ledger_max_disk_read_bytes" in fields:
+            _result["ledger_max_disk_read_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_disk_read_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ledger_max_write_ledger_entries" in fields:
+            _result["ledger_max_write_ledger_entries"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_write_ledger_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ledger_max_write_bytes" in fields:
+            _result["ledger_max_write_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_write_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "tx_max_disk_read_entries" in fields:
+            _result["tx_max_disk_read_entries"] = Uint32.unpack_fields(
+                unpacker, fields["tx_max_disk_read_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "tx_max_disk_read_bytes" in fields:
+            _result["tx_max_disk_read_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["tx_max_disk_read_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "tx_max_write_ledger_entries" in fields:
+            _result["tx_max_write_ledger_entries"] = Uint32.unpack_fields(
+                unpacker, fields["tx_max_write_ledger_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "tx_max_write_bytes" in fields:
+            _result["tx_max_write_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["tx_max_write_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "fee_disk_read_ledger_entry" in fields:
+            _result["fee_disk_read_ledger_entry"] = Int64.unpack_fields(
+                unpacker, fields["fee_disk_read_ledger_entry"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "fee_write_ledger_entry" in fields:
+            _result["fee_write_ledger_entry"] = Int64.unpack_fields(
+                unpacker, fields["fee_write_ledger_entry"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "fee_disk_read1_kb" in fields:
+            _result["fee_disk_read1_kb"] = Int64.unpack_fields(
+                unpacker, fields["fee_disk_read1_kb"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "soroban_state_target_size_bytes" in fields:
+            _result["soroban_state_target_size_bytes"] = Int64.unpack_fields(
+                unpacker, fields["soroban_state_target_size_bytes"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "rent_fee1_kb_soroban_state_size_low" in fields:
+            _result["rent_fee1_kb_soroban_state_size_low"] = Int64.unpack_fields(
+                unpacker, fields["rent_fee1_kb_soroban_state_size_low"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "rent_fee1_kb_soroban_state_size_high" in fields:
+            _result["rent_fee1_kb_soroban_state_size_high"] = Int64.unpack_fields(
+                unpacker,
+                fields["rent_fee1_kb_soroban_state_size_high"],
+                depth_limit - 1,
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "soroban_state_rent_fee_growth_factor" in fields:
+            _result["soroban_state_rent_fee_growth_factor"] = Uint32.unpack_fields(
+                unpacker,
+                fields["soroban_state_rent_fee_growth_factor"],
+                depth_limit - 1,
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractLedgerCostV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractLedgerCostV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -169,11 +336,11 @@ class ConfigSettingContractLedgerCostV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractLedgerCostV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -255,6 +422,76 @@ class ConfigSettingContractLedgerCostV0:
             soroban_state_rent_fee_growth_factor=soroban_state_rent_fee_growth_factor,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_max_disk_read_entries": ')
+        self.ledger_max_disk_read_entries._write_json(write)
+        write(', "ledger_max_disk_read_bytes": ')
+        self.ledger_max_disk_read_bytes._write_json(write)
+        write(', "ledger_max_write_ledger_entries": ')
+        self.ledger_max_write_ledger_entries._write_json(write)
+        write(', "ledger_max_write_bytes": ')
+        self.ledger_max_write_bytes._write_json(write)
+        write(', "tx_max_disk_read_entries": ')
+        self.tx_max_disk_read_entries._write_json(write)
+        write(', "tx_max_disk_read_bytes": ')
+        self.tx_max_disk_read_bytes._write_json(write)
+        write(', "tx_max_write_ledger_entries": ')
+        self.tx_max_write_ledger_entries._write_json(write)
+        write(', "tx_max_write_bytes": ')
+        self.tx_max_write_bytes._write_json(write)
+        write(', "fee_disk_read_ledger_entry": ')
+        self.fee_disk_read_ledger_entry._write_json(write)
+        write(', "fee_write_ledger_entry": ')
+        self.fee_write_ledger_entry._write_json(write)
+        write(', "fee_disk_read1_kb": ')
+        self.fee_disk_read1_kb._write_json(write)
+        write(', "soroban_state_target_size_bytes": ')
+        self.soroban_state_target_size_bytes._write_json(write)
+        write(', "rent_fee1_kb_soroban_state_size_low": ')
+        self.rent_fee1_kb_soroban_state_size_low._write_json(write)
+        write(', "rent_fee1_kb_soroban_state_size_high": ')
+        self.rent_fee1_kb_soroban_state_size_high._write_json(write)
+        write(', "soroban_state_rent_fee_growth_factor": ')
+        self.soroban_state_rent_fee_growth_factor._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractLedgerCostV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_max_disk_read_entries = self.ledger_max_disk_read_entries.clone()
+        result.ledger_max_disk_read_bytes = self.ledger_max_disk_read_bytes.clone()
+        result.ledger_max_write_ledger_entries = (
+            self.ledger_max_write_ledger_entries.clone()
+        )
+        result.ledger_max_write_bytes = self.ledger_max_write_bytes.clone()
+        result.tx_max_disk_read_entries = self.tx_max_disk_read_entries.clone()
+        result.tx_max_disk_read_bytes = self.tx_max_disk_read_bytes.clone()
+        result.tx_max_write_ledger_entries = self.tx_max_write_ledger_entries.clone()
+        result.tx_max_write_bytes = self.tx_max_write_bytes.clone()
+        result.fee_disk_read_ledger_entry = self.fee_disk_read_ledger_entry.clone()
+        result.fee_write_ledger_entry = self.fee_write_ledger_entry.clone()
+        result.fee_disk_read1_kb = self.fee_disk_read1_kb.clone()
+        result.soroban_state_target_size_bytes = (
+            self.soroban_state_target_size_bytes.clone()
+        )
+        result.rent_fee1_kb_soroban_state_size_low = (
+            self.rent_fee1_kb_soroban_state_size_low.clone()
+        )
+        result.rent_fee1_kb_soroban_state_size_high = (
+            self.rent_fee1_kb_soroban_state_size_high.clone()
+        )
+        result.soroban_state_rent_fee_growth_factor = (
+            self.soroban_state_rent_fee_growth_factor.clone()
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractLedgerCostV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractLedgerCostV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
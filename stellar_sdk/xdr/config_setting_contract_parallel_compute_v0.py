@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">I")
 __all__ = ["ConfigSettingContractParallelComputeV0"]
 
 
@@ -27,6 +39,8 @@ class ConfigSettingContractParallelComputeV0:
         };
     """
 
+    __slots__ = ("ledger_max_dependent_tx_clusters",)
+
     def __init__(
         self,
         ledger_max_dependent_tx_clusters: Uint32,
@@ -34,7 +48,10 @@ class ConfigSettingContractParallelComputeV0:
         self.ledger_max_dependent_tx_clusters = ledger_max_dependent_tx_clusters
 
     def pack(self, packer: Packer) -> None:
-        self.ledger_max_dependent_tx_clusters.pack(packer)
+        _LAYOUT.write(packer, self.ledger_max_dependent_tx_clusters.uint32)
+
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(
@@ -42,21 +59,56 @@ class ConfigSettingContractParallelComputeV0:
     ) -> ConfigSettingContractParallelComputeV0:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        ledger_max_dependent_tx_clusters = Uint32.unpack(unpacker, depth_limit - 1)
+        (ledger_max_dependent_tx_clusters,) = _LAYOUT.read(unpacker)
         return cls(
-            ledger_max_dependent_tx_clusters=ledger_max_dependent_tx_clusters,
+            ledger_max_dependent_tx_clusters=Uint32(ledger_max_dependent_tx_clusters),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingContractParallelComputeV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_max_dependent_tx_clusters" in fields:
+            _result["ledger_max_dependent_tx_clusters"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_max_dependent_tx_clusters"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingContractParallelComputeV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingContractParallelComputeV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -71,11 +123,11 @@ class ConfigSettingContractParallelComputeV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingContractParallelComputeV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -91,6 +143,26 @@ class ConfigSettingContractParallelComputeV0:
             ledger_max_dependent_tx_clusters=ledger_max_dependent_tx_clusters,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_max_dependent_tx_clusters": ')
+        self.ledger_max_dependent_tx_clusters._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingContractParallelComputeV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_max_dependent_tx_clusters = (
+            self.ledger_max_dependent_tx_clusters.clone()
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingContractParallelComputeV0:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingContractParallelComputeV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.ledger_max_dependent_tx_clusters,))
 
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .config_setting_contract_bandwidth_v0 import ConfigSettingContractBandwidthV0
 from .config_setting_contract_compute_v0 import ConfigSettingContractComputeV0
 from .config_setting_contract_events_v0 import ConfigSettingContractEventsV0
@@ -90,6 +104,31 @@ class ConfigSettingEntry:
         };
     """
 
+    __slots__ = (
+        "config_setting_id",
+        "contract_bandwidth",
+        "contract_compute",
+        "contract_cost_params_cpu_insns",
+        "contract_cost_params_mem_bytes",
+        "contract_data_entry_size_bytes",
+        "contract_data_key_size_bytes",
+        "contract_events",
+        "contract_execution_lanes",
+        "contract_historical_data",
+        "contract_ledger_cost",
+        "contract_ledger_cost_ext",
+        "contract_max_size_bytes",
+        "contract_parallel_compute",
+        "contract_scp_timing",
+        "eviction_iterator",
+        "freeze_bypass_txs",
+        "freeze_bypass_txs_delta",
+        "frozen_ledger_keys",
+        "frozen_ledger_keys_delta",
+        "live_soroban_state_size_window",
+        "state_archival_settings",
+    )
+
     def __init__(
         self,
         config_setting_id: ConfigSettingID,
@@ -301,116 +340,570 @@ class ConfigSettingEntry:
             return
         raise ValueError("Invalid config_setting_id.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_MAX_SIZE_BYTES
+        ):
+            return 8
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_COMPUTE_V0:
+            return 32
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_V0
+        ):
+            return 88
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_HISTORICAL_DATA_V0
+        ):
+            return 12
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EVENTS_V0:
+            return 16
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_BANDWIDTH_V0
+        ):
+            return 20
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_CPU_INSTRUCTIONS
+        ):
+            assert self.contract_cost_params_cpu_insns is not None
+            return 4 + self.contract_cost_params_cpu_insns.xdr_size()
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_MEMORY_BYTES
+        ):
+            assert self.contract_cost_params_mem_bytes is not None
+            return 4 + self.contract_cost_params_mem_bytes.xdr_size()
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_KEY_SIZE_BYTES
+        ):
+            return 8
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_ENTRY_SIZE_BYTES
+        ):
+            return 8
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_STATE_ARCHIVAL:
+            return 52
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_EXECUTION_LANES
+        ):
+            return 8
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_LIVE_SOROBAN_STATE_SIZE_WINDOW
+        ):
+            assert self.live_soroban_state_size_window is not None
+            return 4 + 4 + 8 * len(self.live_soroban_state_size_window)
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_EVICTION_ITERATOR:
+            return 20
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_PARALLEL_COMPUTE_V0
+        ):
+            return 8
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_EXT_V0
+        ):
+            return 16
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_SCP_TIMING:
+            return 24
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS:
+            assert self.frozen_ledger_keys is not None
+            return 4 + self.frozen_ledger_keys.xdr_size()
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS_DELTA
+        ):
+            assert self.frozen_ledger_keys_delta is not None
+            return 4 + self.frozen_ledger_keys_delta.xdr_size()
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS:
+            assert self.freeze_bypass_txs is not None
+            return 4 + self.freeze_bypass_txs.xdr_size()
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS_DELTA
+        ):
+            assert self.freeze_bypass_txs_delta is not None
+            return 4 + self.freeze_bypass_txs_delta.xdr_size()
+        raise ValueError("Invalid config_setting_id.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ConfigSettingEntry:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        config_setting_id = ConfigSettingID.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(config_setting_id)
+        if unpack_arm is None:
+            raise ValueError("Invalid config_setting_id.")
+        return unpack_arm(cls, config_setting_id, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         config_setting_id = ConfigSettingID.unpack(unpacker)
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_MAX_SIZE_BYTES:
-            contract_max_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_max_size_bytes=contract_max_size_bytes,
-            )
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_COMPUTE_V0:
-            contract_compute = ConfigSettingContractComputeV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id, contract_compute=contract_compute
-            )
+            ConfigSettingContractComputeV0.skip(unpacker, depth_limit - 1)
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_V0:
-            contract_ledger_cost = ConfigSettingContractLedgerCostV0.unpack(
-                unpacker, depth_limit - 1
+            ConfigSettingContractLedgerCostV0.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_HISTORICAL_DATA_V0
+        ):
+            ConfigSettingContractHistoricalDataV0.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EVENTS_V0:
+            ConfigSettingContractEventsV0.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_BANDWIDTH_V0:
+            ConfigSettingContractBandwidthV0.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_CPU_INSTRUCTIONS
+        ):
+            ContractCostParams.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_MEMORY_BYTES
+        ):
+            ContractCostParams.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_KEY_SIZE_BYTES
+        ):
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_ENTRY_SIZE_BYTES
+        ):
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_STATE_ARCHIVAL:
+            StateArchivalSettings.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EXECUTION_LANES:
+            ConfigSettingContractExecutionLanesV0.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_LIVE_SOROBAN_STATE_SIZE_WINDOW
+        ):
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"live_soroban_state_size_window length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Uint64.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_EVICTION_ITERATOR:
+            EvictionIterator.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_PARALLEL_COMPUTE_V0
+        ):
+            ConfigSettingContractParallelComputeV0.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_EXT_V0
+        ):
+            ConfigSettingContractLedgerCostExtV0.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_SCP_TIMING:
+            ConfigSettingSCPTiming.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS:
+            FrozenLedgerKeys.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS_DELTA:
+            FrozenLedgerKeysDelta.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS:
+            FreezeBypassTxs.skip(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS_DELTA:
+            FreezeBypassTxsDelta.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid config_setting_id.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        config_setting_id = ConfigSettingID.unpack(unpacker)
+        if "config_setting_id" in fields:
+            _result["config_setting_id"] = config_setting_id
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_MAX_SIZE_BYTES:
+            if "contract_max_size_bytes" in fields:
+                _result["contract_max_size_bytes"] = Uint32.unpack_fields(
+                    unpacker, fields["contract_max_size_bytes"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_COMPUTE_V0:
+            if "contract_compute" in fields:
+                _result["contract_compute"] = (
+                    ConfigSettingContractComputeV0.unpack_fields(
+                        unpacker, fields["contract_compute"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractComputeV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_V0:
+            if "contract_ledger_cost" in fields:
+                _result["contract_ledger_cost"] = (
+                    ConfigSettingContractLedgerCostV0.unpack_fields(
+                        unpacker, fields["contract_ledger_cost"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractLedgerCostV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_HISTORICAL_DATA_V0
+        ):
+            if "contract_historical_data" in fields:
+                _result["contract_historical_data"] = (
+                    ConfigSettingContractHistoricalDataV0.unpack_fields(
+                        unpacker, fields["contract_historical_data"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractHistoricalDataV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EVENTS_V0:
+            if "contract_events" in fields:
+                _result["contract_events"] = (
+                    ConfigSettingContractEventsV0.unpack_fields(
+                        unpacker, fields["contract_events"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractEventsV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_BANDWIDTH_V0:
+            if "contract_bandwidth" in fields:
+                _result["contract_bandwidth"] = (
+                    ConfigSettingContractBandwidthV0.unpack_fields(
+                        unpacker, fields["contract_bandwidth"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractBandwidthV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_CPU_INSTRUCTIONS
+        ):
+            if "contract_cost_params_cpu_insns" in fields:
+                _result["contract_cost_params_cpu_insns"] = (
+                    ContractCostParams.unpack_fields(
+                        unpacker,
+                        fields["contract_cost_params_cpu_insns"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                ContractCostParams.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_MEMORY_BYTES
+        ):
+            if "contract_cost_params_mem_bytes" in fields:
+                _result["contract_cost_params_mem_bytes"] = (
+                    ContractCostParams.unpack_fields(
+                        unpacker,
+                        fields["contract_cost_params_mem_bytes"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                ContractCostParams.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_KEY_SIZE_BYTES
+        ):
+            if "contract_data_key_size_bytes" in fields:
+                _result["contract_data_key_size_bytes"] = Uint32.unpack_fields(
+                    unpacker, fields["contract_data_key_size_bytes"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_ENTRY_SIZE_BYTES
+        ):
+            if "contract_data_entry_size_bytes" in fields:
+                _result["contract_data_entry_size_bytes"] = Uint32.unpack_fields(
+                    unpacker, fields["contract_data_entry_size_bytes"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_STATE_ARCHIVAL:
+            if "state_archival_settings" in fields:
+                _result["state_archival_settings"] = (
+                    StateArchivalSettings.unpack_fields(
+                        unpacker, fields["state_archival_settings"], depth_limit - 1
+                    )
+                )
+            else:
+                StateArchivalSettings.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EXECUTION_LANES:
+            if "contract_execution_lanes" in fields:
+                _result["contract_execution_lanes"] = (
+                    ConfigSettingContractExecutionLanesV0.unpack_fields(
+                        unpacker, fields["contract_execution_lanes"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractExecutionLanesV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_LIVE_SOROBAN_STATE_SIZE_WINDOW
+        ):
+            if "live_soroban_state_size_window" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"live_soroban_state_size_window length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["live_soroban_state_size_window"] = []
+                for _ in range(length):
+                    _result["live_soroban_state_size_window"].append(
+                        Uint64.unpack_fields(
+                            unpacker,
+                            fields["live_soroban_state_size_window"],
+                            depth_limit - 1,
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"live_soroban_state_size_window length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    Uint64.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_EVICTION_ITERATOR:
+            if "eviction_iterator" in fields:
+                _result["eviction_iterator"] = EvictionIterator.unpack_fields(
+                    unpacker, fields["eviction_iterator"], depth_limit - 1
+                )
+            else:
+                EvictionIterator.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_PARALLEL_COMPUTE_V0
+        ):
+            if "contract_parallel_compute" in fields:
+                _result["contract_parallel_compute"] = (
+                    ConfigSettingContractParallelComputeV0.unpack_fields(
+                        unpacker, fields["contract_parallel_compute"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractParallelComputeV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_EXT_V0
+        ):
+            if "contract_ledger_cost_ext" in fields:
+                _result["contract_ledger_cost_ext"] = (
+                    ConfigSettingContractLedgerCostExtV0.unpack_fields(
+                        unpacker, fields["contract_ledger_cost_ext"], depth_limit - 1
+                    )
+                )
+            else:
+                ConfigSettingContractLedgerCostExtV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_SCP_TIMING:
+            if "contract_scp_timing" in fields:
+                _result["contract_scp_timing"] = ConfigSettingSCPTiming.unpack_fields(
+                    unpacker, fields["contract_scp_timing"], depth_limit - 1
+                )
+            else:
+                ConfigSettingSCPTiming.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS:
+            if "frozen_ledger_keys" in fields:
+                _result["frozen_ledger_keys"] = FrozenLedgerKeys.unpack_fields(
+                    unpacker, fields["frozen_ledger_keys"], depth_limit - 1
+                )
+            else:
+                FrozenLedgerKeys.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS_DELTA:
+            if "frozen_ledger_keys_delta" in fields:
+                _result["frozen_ledger_keys_delta"] = (
+                    FrozenLedgerKeysDelta.unpack_fields(
+                        unpacker, fields["frozen_ledger_keys_delta"], depth_limit - 1
+                    )
+                )
+            else:
+                FrozenLedgerKeysDelta.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS:
+            if "freeze_bypass_txs" in fields:
+                _result["freeze_bypass_txs"] = FreezeBypassTxs.unpack_fields(
+                    unpacker, fields["freeze_bypass_txs"], depth_limit - 1
+                )
+            else:
+                FreezeBypassTxs.skip(unpacker, depth_limit - 1)
+            return _result
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS_DELTA:
+            if "freeze_bypass_txs_delta" in fields:
+                _result["freeze_bypass_txs_delta"] = FreezeBypassTxsDelta.unpack_fields(
+                    unpacker, fields["freeze_bypass_txs_delta"], depth_limit - 1
+                )
+            else:
+                FreezeBypassTxsDelta.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid config_setting_id.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        config_setting_id = ConfigSettingID.unpack(unpacker)
+        yield "config_setting_id", config_setting_id
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_MAX_SIZE_BYTES:
+            yield "contract_max_size_bytes", Uint32.unpack(unpacker, depth_limit - 1)
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_COMPUTE_V0:
+            yield (
+                "contract_compute",
+                ConfigSettingContractComputeV0.unpack(unpacker, depth_limit - 1),
             )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_ledger_cost=contract_ledger_cost,
+            return
+        if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_V0:
+            yield (
+                "contract_ledger_cost",
+                ConfigSettingContractLedgerCostV0.unpack(unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_HISTORICAL_DATA_V0
         ):
-            contract_historical_data = ConfigSettingContractHistoricalDataV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_historical_data=contract_historical_data,
+            yield (
+                "contract_historical_data",
+                ConfigSettingContractHistoricalDataV0.unpack(unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EVENTS_V0:
-            contract_events = ConfigSettingContractEventsV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id, contract_events=contract_events
+            yield (
+                "contract_events",
+                ConfigSettingContractEventsV0.unpack(unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_BANDWIDTH_V0:
-            contract_bandwidth = ConfigSettingContractBandwidthV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_bandwidth=contract_bandwidth,
+            yield (
+                "contract_bandwidth",
+                ConfigSettingContractBandwidthV0.unpack(unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_CPU_INSTRUCTIONS
         ):
-            contract_cost_params_cpu_insns = ContractCostParams.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_cost_params_cpu_insns=contract_cost_params_cpu_insns,
+            yield (
+                "contract_cost_params_cpu_insns",
+                view_at(ContractCostParams, unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_MEMORY_BYTES
         ):
-            contract_cost_params_mem_bytes = ContractCostParams.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_cost_params_mem_bytes=contract_cost_params_mem_bytes,
+            yield (
+                "contract_cost_params_mem_bytes",
+                view_at(ContractCostParams, unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_KEY_SIZE_BYTES
         ):
-            contract_data_key_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_data_key_size_bytes=contract_data_key_size_bytes,
+            yield (
+                "contract_data_key_size_bytes",
+                Uint32.unpack(unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_ENTRY_SIZE_BYTES
         ):
-            contract_data_entry_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_data_entry_size_bytes=contract_data_entry_size_bytes,
+            yield (
+                "contract_data_entry_size_bytes",
+                Uint32.unpack(unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_STATE_ARCHIVAL:
-            state_archival_settings = StateArchivalSettings.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                state_archival_settings=state_archival_settings,
+            yield (
+                "state_archival_settings",
+                StateArchivalSettings.unpack(unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EXECUTION_LANES:
-            contract_execution_lanes = ConfigSettingContractExecutionLanesV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_execution_lanes=contract_execution_lanes,
+            yield (
+                "contract_execution_lanes",
+                ConfigSettingContractExecutionLanesV0.unpack(unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_LIVE_SOROBAN_STATE_SIZE_WINDOW
@@ -426,72 +919,64 @@ class ConfigSettingEntry:
                 live_soroban_state_size_window.append(
                     Uint64.unpack(unpacker, depth_limit - 1)
                 )
-            return cls(
-                config_setting_id=config_setting_id,
-                live_soroban_state_size_window=live_soroban_state_size_window,
-            )
+            yield "live_soroban_state_size_window", live_soroban_state_size_window
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_EVICTION_ITERATOR:
-            eviction_iterator = EvictionIterator.unpack(unpacker, depth_limit - 1)
-            return cls(
-                config_setting_id=config_setting_id, eviction_iterator=eviction_iterator
+            yield (
+                "eviction_iterator",
+                EvictionIterator.unpack(unpacker, depth_limit - 1),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_PARALLEL_COMPUTE_V0
         ):
-            contract_parallel_compute = ConfigSettingContractParallelComputeV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_parallel_compute=contract_parallel_compute,
+            yield (
+                "contract_parallel_compute",
+                ConfigSettingContractParallelComputeV0.unpack(
+                    unpacker, depth_limit - 1
+                ),
             )
+            return
         if (
             config_setting_id
             == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_EXT_V0
         ):
-            contract_ledger_cost_ext = ConfigSettingContractLedgerCostExtV0.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_ledger_cost_ext=contract_ledger_cost_ext,
+            yield (
+                "contract_ledger_cost_ext",
+                ConfigSettingContractLedgerCostExtV0.unpack(unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_SCP_TIMING:
-            contract_scp_timing = ConfigSettingSCPTiming.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                contract_scp_timing=contract_scp_timing,
+            yield (
+                "contract_scp_timing",
+                ConfigSettingSCPTiming.unpack(unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS:
-            frozen_ledger_keys = FrozenLedgerKeys.unpack(unpacker, depth_limit - 1)
-            return cls(
-                config_setting_id=config_setting_id,
-                frozen_ledger_keys=frozen_ledger_keys,
+            yield (
+                "frozen_ledger_keys",
+                view_at(FrozenLedgerKeys, unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS_DELTA:
-            frozen_ledger_keys_delta = FrozenLedgerKeysDelta.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                frozen_ledger_keys_delta=frozen_ledger_keys_delta,
+            yield (
+                "frozen_ledger_keys_delta",
+                view_at(FrozenLedgerKeysDelta, unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS:
-            freeze_bypass_txs = FreezeBypassTxs.unpack(unpacker, depth_limit - 1)
-            return cls(
-                config_setting_id=config_setting_id, freeze_bypass_txs=freeze_bypass_txs
+            yield (
+                "freeze_bypass_txs",
+                view_at(FreezeBypassTxs, unpacker, depth_limit - 1),
             )
+            return
         if config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS_DELTA:
-            freeze_bypass_txs_delta = FreezeBypassTxsDelta.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                config_setting_id=config_setting_id,
-                freeze_bypass_txs_delta=freeze_bypass_txs_delta,
+            yield (
+                "freeze_bypass_txs_delta",
+                view_at(FreezeBypassTxsDelta, unpacker, depth_limit - 1),
             )
+            return
         raise ValueError("Invalid config_setting_id.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -500,10 +985,12 @@ class ConfigSettingEntry:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -518,11 +1005,11 @@ class ConfigSettingEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -843,6 +1330,293 @@ class ConfigSettingEntry:
             )
         raise ValueError(f"Unknown key '{key}' for ConfigSettingEntry")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_MAX_SIZE_BYTES
+        ):
+            assert self.contract_max_size_bytes is not None
+            write('{"contract_max_size_bytes": ')
+            self.contract_max_size_bytes._write_json(write)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_COMPUTE_V0:
+            assert self.contract_compute is not None
+            write('{"contract_compute_v0": ')
+            self.contract_compute._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_V0
+        ):
+            assert self.contract_ledger_cost is not None
+            write('{"contract_ledger_cost_v0": ')
+            self.contract_ledger_cost._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_HISTORICAL_DATA_V0
+        ):
+            assert self.contract_historical_data is not None
+            write('{"contract_historical_data_v0": ')
+            self.contract_historical_data._write_json(write)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_CONTRACT_EVENTS_V0:
+            assert self.contract_events is not None
+            write('{"contract_events_v0": ')
+            self.contract_events._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_BANDWIDTH_V0
+        ):
+            assert self.contract_bandwidth is not None
+            write('{"contract_bandwidth_v0": ')
+            self.contract_bandwidth._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_CPU_INSTRUCTIONS
+        ):
+            assert self.contract_cost_params_cpu_insns is not None
+            write('{"contract_cost_params_cpu_instructions": ')
+            self.contract_cost_params_cpu_insns._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_MEMORY_BYTES
+        ):
+            assert self.contract_cost_params_mem_bytes is not None
+            write('{"contract_cost_params_memory_bytes": ')
+            self.contract_cost_params_mem_bytes._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_KEY_SIZE_BYTES
+        ):
+            assert self.contract_data_key_size_bytes is not None
+            write('{"contract_data_key_size_bytes": ')
+            self.contract_data_key_size_bytes._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_ENTRY_SIZE_BYTES
+        ):
+            assert self.contract_data_entry_size_bytes is not None
+            write('{"contract_data_entry_size_bytes": ')
+            self.contract_data_entry_size_bytes._write_json(write)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_STATE_ARCHIVAL:
+            assert self.state_archival_settings is not None
+            write('{"state_archival": ')
+            self.state_archival_settings._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_EXECUTION_LANES
+        ):
+            assert self.contract_execution_lanes is not None
+            write('{"contract_execution_lanes": ')
+            self.contract_execution_lanes._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_LIVE_SOROBAN_STATE_SIZE_WINDOW
+        ):
+            assert self.live_soroban_state_size_window is not None
+            write('{"live_soroban_state_size_window": ')
+            write_json_array(write, self.live_soroban_state_size_window)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_EVICTION_ITERATOR:
+            assert self.eviction_iterator is not None
+            write('{"eviction_iterator": ')
+            self.eviction_iterator._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_PARALLEL_COMPUTE_V0
+        ):
+            assert self.contract_parallel_compute is not None
+            write('{"contract_parallel_compute_v0": ')
+            self.contract_parallel_compute._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_EXT_V0
+        ):
+            assert self.contract_ledger_cost_ext is not None
+            write('{"contract_ledger_cost_ext_v0": ')
+            self.contract_ledger_cost_ext._write_json(write)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_SCP_TIMING:
+            assert self.contract_scp_timing is not None
+            write('{"scp_timing": ')
+            self.contract_scp_timing._write_json(write)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS:
+            assert self.frozen_ledger_keys is not None
+            write('{"frozen_ledger_keys": ')
+            self.frozen_ledger_keys._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS_DELTA
+        ):
+            assert self.frozen_ledger_keys_delta is not None
+            write('{"frozen_ledger_keys_delta": ')
+            self.frozen_ledger_keys_delta._write_json(write)
+            write("}")
+            return
+        if self.config_setting_id == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS:
+            assert self.freeze_bypass_txs is not None
+            write('{"freeze_bypass_txs": ')
+            self.freeze_bypass_txs._write_json(write)
+            write("}")
+            return
+        if (
+            self.config_setting_id
+            == ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS_DELTA
+        ):
+            assert self.freeze_bypass_txs_delta is not None
+            write('{"freeze_bypass_txs_delta": ')
+            self.freeze_bypass_txs_delta._write_json(write)
+            write("}")
+            return
+        raise ValueError(
+            f"Unknown config_setting_id in ConfigSettingEntry: {self.config_setting_id}"
+        )
+
+    def clone(self, deep: bool = True) -> ConfigSettingEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.config_setting_id = self.config_setting_id
+        result.contract_max_size_bytes = (
+            self.contract_max_size_bytes.clone()
+            if self.contract_max_size_bytes is not None
+            else None
+        )
+        result.contract_compute = (
+            self.contract_compute.clone() if self.contract_compute is not None else None
+        )
+        result.contract_ledger_cost = (
+            self.contract_ledger_cost.clone()
+            if self.contract_ledger_cost is not None
+            else None
+        )
+        result.contract_historical_data = (
+            self.contract_historical_data.clone()
+            if self.contract_historical_data is not None
+            else None
+        )
+        result.contract_events = (
+            self.contract_events.clone() if self.contract_events is not None else None
+        )
+        result.contract_bandwidth = (
+            self.contract_bandwidth.clone()
+            if self.contract_bandwidth is not None
+            else None
+        )
+        result.contract_cost_params_cpu_insns = (
+            self.contract_cost_params_cpu_insns.clone()
+            if self.contract_cost_params_cpu_insns is not None
+            else None
+        )
+        result.contract_cost_params_mem_bytes = (
+            self.contract_cost_params_mem_bytes.clone()
+            if self.contract_cost_params_mem_bytes is not None
+            else None
+        )
+        result.contract_data_key_size_bytes = (
+            self.contract_data_key_size_bytes.clone()
+            if self.contract_data_key_size_bytes is not None
+            else None
+        )
+        result.contract_data_entry_size_bytes = (
+            self.contract_data_entry_size_bytes.clone()
+            if self.contract_data_entry_size_bytes is not None
+            else None
+        )
+        result.state_archival_settings = (
+            self.state_archival_settings.clone()
+            if self.state_archival_settings is not None
+            else None
+        )
+        result.contract_execution_lanes = (
+            self.contract_execution_lanes.clone()
+            if self.contract_execution_lanes is not None
+            else None
+        )
+        result.live_soroban_state_size_window = (
+            [item.clone() for item in self.live_soroban_state_size_window]
+            if self.live_soroban_state_size_window is not None
+            else None
+        )
+        result.eviction_iterator = (
+            self.eviction_iterator.clone()
+            if self.eviction_iterator is not None
+            else None
+        )
+        result.contract_parallel_compute = (
+            self.contract_parallel_compute.clone()
+            if self.contract_parallel_compute is not None
+            else None
+        )
+        result.contract_ledger_cost_ext = (
+            self.contract_ledger_cost_ext.clone()
+            if self.contract_ledger_cost_ext is not None
+            else None
+        )
+        result.contract_scp_timing = (
+            self.contract_scp_timing.clone()
+            if self.contract_scp_timing is not None
+            else None
+        )
+        result.frozen_ledger_keys = (
+            self.frozen_ledger_keys.clone()
+            if self.frozen_ledger_keys is not None
+            else None
+        )
+        result.frozen_ledger_keys_delta = (
+            self.frozen_ledger_keys_delta.clone()
+            if self.frozen_ledger_keys_delta is not None
+            else None
+        )
+        result.freeze_bypass_txs = (
+            self.freeze_bypass_txs.clone()
+            if self.freeze_bypass_txs is not None
+            else None
+        )
+        result.freeze_bypass_txs_delta = (
+            self.freeze_bypass_txs_delta.clone()
+            if self.freeze_bypass_txs_delta is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingEntry:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -959,3 +1733,250 @@ class ConfigSettingEntry:
         if self.freeze_bypass_txs_delta is not None:
             out.append(f"freeze_bypass_txs_delta={self.freeze_bypass_txs_delta}")
         return f"<ConfigSettingEntry [{', '.join(out)}]>"
+
+
+def _unpack_contract_max_size_bytes(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_max_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_max_size_bytes=contract_max_size_bytes,
+    )
+
+
+def _unpack_contract_compute(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_compute = ConfigSettingContractComputeV0.unpack(unpacker, depth_limit - 1)
+    return cls(config_setting_id=config_setting_id, contract_compute=contract_compute)
+
+
+def _unpack_contract_ledger_cost(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_ledger_cost = ConfigSettingContractLedgerCostV0.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_ledger_cost=contract_ledger_cost,
+    )
+
+
+def _unpack_contract_historical_data(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_historical_data = ConfigSettingContractHistoricalDataV0.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_historical_data=contract_historical_data,
+    )
+
+
+def _unpack_contract_events(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_events = ConfigSettingContractEventsV0.unpack(unpacker, depth_limit - 1)
+    return cls(config_setting_id=config_setting_id, contract_events=contract_events)
+
+
+def _unpack_contract_bandwidth(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_bandwidth = ConfigSettingContractBandwidthV0.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_bandwidth=contract_bandwidth,
+    )
+
+
+def _unpack_contract_cost_params_cpu_insns(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_cost_params_cpu_insns = ContractCostParams.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_cost_params_cpu_insns=contract_cost_params_cpu_insns,
+    )
+
+
+def _unpack_contract_cost_params_mem_bytes(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_cost_params_mem_bytes = ContractCostParams.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_cost_params_mem_bytes=contract_cost_params_mem_bytes,
+    )
+
+
+def _unpack_contract_data_key_size_bytes(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_data_key_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_data_key_size_bytes=contract_data_key_size_bytes,
+    )
+
+
+def _unpack_contract_data_entry_size_bytes(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_data_entry_size_bytes = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_data_entry_size_bytes=contract_data_entry_size_bytes,
+    )
+
+
+def _unpack_state_archival_settings(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    state_archival_settings = StateArchivalSettings.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        state_archival_settings=state_archival_settings,
+    )
+
+
+def _unpack_contract_execution_lanes(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_execution_lanes = ConfigSettingContractExecutionLanesV0.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_execution_lanes=contract_execution_lanes,
+    )
+
+
+def _unpack_live_soroban_state_size_window(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"live_soroban_state_size_window length {length} exceeds remaining input length {_remaining}"
+        )
+    live_soroban_state_size_window = []
+    for _ in range(length):
+        live_soroban_state_size_window.append(Uint64.unpack(unpacker, depth_limit - 1))
+    return cls(
+        config_setting_id=config_setting_id,
+        live_soroban_state_size_window=live_soroban_state_size_window,
+    )
+
+
+def _unpack_eviction_iterator(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    eviction_iterator = EvictionIterator.unpack(unpacker, depth_limit - 1)
+    return cls(config_setting_id=config_setting_id, eviction_iterator=eviction_iterator)
+
+
+def _unpack_contract_parallel_compute(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_parallel_compute = ConfigSettingContractParallelComputeV0.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_parallel_compute=contract_parallel_compute,
+    )
+
+
+def _unpack_contract_ledger_cost_ext(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_ledger_cost_ext = ConfigSettingContractLedgerCostExtV0.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_ledger_cost_ext=contract_ledger_cost_ext,
+    )
+
+
+def _unpack_contract_scp_timing(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    contract_scp_timing = ConfigSettingSCPTiming.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        contract_scp_timing=contract_scp_timing,
+    )
+
+
+def _unpack_frozen_ledger_keys(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    frozen_ledger_keys = FrozenLedgerKeys.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        frozen_ledger_keys=frozen_ledger_keys,
+    )
+
+
+def _unpack_frozen_ledger_keys_delta(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    frozen_ledger_keys_delta = FrozenLedgerKeysDelta.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        frozen_ledger_keys_delta=frozen_ledger_keys_delta,
+    )
+
+
+def _unpack_freeze_bypass_txs(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    freeze_bypass_txs = FreezeBypassTxs.unpack(unpacker, depth_limit - 1)
+    return cls(config_setting_id=config_setting_id, freeze_bypass_txs=freeze_bypass_txs)
+
+
+def _unpack_freeze_bypass_txs_delta(
+    cls, config_setting_id, unpacker: Unpacker, depth_limit: int
+) -> ConfigSettingEntry:
+    freeze_bypass_txs_delta = FreezeBypassTxsDelta.unpack(unpacker, depth_limit - 1)
+    return cls(
+        config_setting_id=config_setting_id,
+        freeze_bypass_txs_delta=freeze_bypass_txs_delta,
+    )
+
+
+_UNPACK_ARMS = {
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_MAX_SIZE_BYTES: _unpack_contract_max_size_bytes,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_COMPUTE_V0: _unpack_contract_compute,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_V0: _unpack_contract_ledger_cost,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_HISTORICAL_DATA_V0: _unpack_contract_historical_data,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_EVENTS_V0: _unpack_contract_events,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_BANDWIDTH_V0: _unpack_contract_bandwidth,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_CPU_INSTRUCTIONS: _unpack_contract_cost_params_cpu_insns,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_COST_PARAMS_MEMORY_BYTES: _unpack_contract_cost_params_mem_bytes,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_KEY_SIZE_BYTES: _unpack_contract_data_key_size_bytes,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_DATA_ENTRY_SIZE_BYTES: _unpack_contract_data_entry_size_bytes,
+    ConfigSettingID.CONFIG_SETTING_STATE_ARCHIVAL: _unpack_state_archival_settings,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_EXECUTION_LANES: _unpack_contract_execution_lanes,
+    ConfigSettingID.CONFIG_SETTING_LIVE_SOROBAN_STATE_SIZE_WINDOW: _unpack_live_soroban_state_size_window,
+    ConfigSettingID.CONFIG_SETTING_EVICTION_ITERATOR: _unpack_eviction_iterator,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_PARALLEL_COMPUTE_V0: _unpack_contract_parallel_compute,
+    ConfigSettingID.CONFIG_SETTING_CONTRACT_LEDGER_COST_EXT_V0: _unpack_contract_ledger_cost_ext,
+    ConfigSettingID.CONFIG_SETTING_SCP_TIMING: _unpack_contract_scp_timing,
+    ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS: _unpack_frozen_ledger_keys,
+    ConfigSettingID.CONFIG_SETTING_FROZEN_LEDGER_KEYS_DELTA: _unpack_frozen_ledger_keys_delta,
+    ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS: _unpack_freeze_bypass_txs,
+    ConfigSettingID.CONFIG_SETTING_FREEZE_BYPASS_TXS_DELTA: _unpack_freeze_bypass_txs_delta,
+}
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">IIIII")
 __all__ = ["ConfigSettingSCPTiming"]
 
 
@@ -26,6 +38,14 @@ class ConfigSettingSCPTiming:
         };
     """
 
+    __slots__ = (
+        "ballot_timeout_increment_milliseconds",
+        "ballot_timeout_initial_milliseconds",
+        "ledger_target_close_time_milliseconds",
+        "nomination_timeout_increment_milliseconds",
+        "nomination_timeout_initial_milliseconds",
+    )
+
     def __init__(
         self,
         ledger_target_close_time_milliseconds: Uint32,
@@ -49,11 +69,17 @@ class ConfigSettingSCPTiming:
         )
 
     def pack(self, packer: Packer) -> None:
-        self.ledger_target_close_time_milliseconds.pack(packer)
-        self.nomination_timeout_initial_milliseconds.pack(packer)
-        self.nomination_timeout_increment_milliseconds.pack(packer)
-        self.ballot_timeout_initial_milliseconds.pack(packer)
-        self.ballot_timeout_increment_milliseconds.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.ledger_target_close_time_milliseconds.uint32,
+            self.nomination_timeout_initial_milliseconds.uint32,
+            self.nomination_timeout_increment_milliseconds.uint32,
+            self.ballot_timeout_initial_milliseconds.uint32,
+            self.ballot_timeout_increment_milliseconds.uint32,
+        )
+
+    def xdr_size(self) -> int:
+        return 20
 
     @classmethod
     def unpack(
@@ -61,33 +87,108 @@ class ConfigSettingSCPTiming:
     ) -> ConfigSettingSCPTiming:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        ledger_target_close_time_milliseconds = Uint32.unpack(unpacker, depth_limit - 1)
-        nomination_timeout_initial_milliseconds = Uint32.unpack(
-            unpacker, depth_limit - 1
-        )
-        nomination_timeout_increment_milliseconds = Uint32.unpack(
-            unpacker, depth_limit - 1
-        )
-        ballot_timeout_initial_milliseconds = Uint32.unpack(unpacker, depth_limit - 1)
-        ballot_timeout_increment_milliseconds = Uint32.unpack(unpacker, depth_limit - 1)
+        (
+            ledger_target_close_time_milliseconds,
+            nomination_timeout_initial_milliseconds,
+            nomination_timeout_increment_milliseconds,
+            ballot_timeout_initial_milliseconds,
+            ballot_timeout_increment_milliseconds,
+        ) = _LAYOUT.read(unpacker)
         return cls(
-            ledger_target_close_time_milliseconds=ledger_target_close_time_milliseconds,
-            nomination_timeout_initial_milliseconds=nomination_timeout_initial_milliseconds,
-            nomination_timeout_increment_milliseconds=nomination_timeout_increment_milliseconds,
-            ballot_timeout_initial_milliseconds=ballot_timeout_initial_milliseconds,
-            ballot_timeout_increment_milliseconds=ballot_timeout_increment_milliseconds,
+            ledger_target_close_time_milliseconds=Uint32(
+                ledger_target_close_time_milliseconds
+            ),
+            nomination_timeout_initial_milliseconds=Uint32(
+                nomination_timeout_initial_milliseconds
+            ),
+            nomination_timeout_increment_milliseconds=Uint32(
+                nomination_timeout_increment_milliseconds
+            ),
+            ballot_timeout_initial_milliseconds=Uint32(
+                ballot_timeout_initial_milliseconds
+            ),
+            ballot_timeout_increment_milliseconds=Uint32(
+                ballot_timeout_increment_milliseconds
+            ),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigSettingSCPTiming:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_target_close_time_milliseconds" in fields:
+            _result["ledger_target_close_time_milliseconds"] = Uint32.unpack_fields(
+                unpacker,
+                fields["ledger_target_close_time_milliseconds"],
+                depth_limit - 1,
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "nomination_timeout_initial_milliseconds" in fields:
+            _result["nomination_timeout_initial_milliseconds"] = Uint32.unpack_fields(
+                unpacker,
+                fields["nomination_timeout_initial_milliseconds"],
+                depth_limit - 1,
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "nomination_timeout_increment_milliseconds" in fields:
+            _result["nomination_timeout_increment_milliseconds"] = Uint32.unpack_fields(
+                unpacker,
+                fields["nomination_timeout_increment_milliseconds"],
+                depth_limit - 1,
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ballot_timeout_initial_milliseconds" in fields:
+            _result["ballot_timeout_initial_milliseconds"] = Uint32.unpack_fields(
+                unpacker, fields["ballot_timeout_initial_milliseconds"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ballot_timeout_increment_milliseconds" in fields:
+            _result["ballot_timeout_increment_milliseconds"] = Uint32.unpack_fields(
+                unpacker,
+                fields["ballot_timeout_increment_milliseconds"],
+                depth_limit - 1,
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigSettingSCPTiming:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigSettingSCPTiming:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -102,11 +203,11 @@ class ConfigSettingSCPTiming:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigSettingSCPTiming:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -142,6 +243,46 @@ class ConfigSettingSCPTiming:
             ballot_timeout_increment_milliseconds=ballot_timeout_increment_milliseconds,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_target_close_time_milliseconds": ')
+        self.ledger_target_close_time_milliseconds._write_json(write)
+        write(', "nomination_timeout_initial_milliseconds": ')
+        self.nomination_timeout_initial_milliseconds._write_json(write)
+        write(', "nomination_timeout_increment_milliseconds": ')
+        self.nomination_timeout_increment_milliseconds._write_json(write)
+        write(', "ballot_timeout_initial_milliseconds": ')
+        self.ballot_timeout_initial_milliseconds._write_json(write)
+        write(', "ballot_timeout_increment_milliseconds": ')
+        self.ballot_timeout_increment_milliseconds._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigSettingSCPTiming:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_target_close_time_milliseconds = (
+            self.ledger_target_close_time_milliseconds.clone()
+        )
+        result.nomination_timeout_initial_milliseconds = (
+            self.nomination_timeout_initial_milliseconds.clone()
+        )
+        result.nomination_timeout_increment_milliseconds = (
+            self.nomination_timeout_increment_milliseconds.clone()
+        )
+        result.ballot_timeout_initial_milliseconds = (
+            self.ballot_timeout_initial_milliseconds.clone()
+        )
+        result.ballot_timeout_increment_milliseconds = (
+            self.ballot_timeout_increment_milliseconds.clone()
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigSettingSCPTiming:
+        return self.clone()
+
+    def freeze(self) -> ConfigSettingSCPTiming:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .config_setting_entry import ConfigSettingEntry
 
 __all__ = ["ConfigUpgradeSet"]
@@ -22,6 +36,8 @@ class ConfigUpgradeSet:
         };
     """
 
+    __slots__ = ("updated_entry",)
+
     def __init__(
         self,
         updated_entry: list[ConfigSettingEntry],
@@ -38,6 +54,9 @@ class ConfigUpgradeSet:
         for updated_entry_item in self.updated_entry:
             updated_entry_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.updated_entry)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +76,96 @@ class ConfigUpgradeSet:
             updated_entry=updated_entry,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"updated_entry length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ConfigSettingEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigUpgradeSet:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "updated_entry" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"updated_entry length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["updated_entry"] = []
+            for _ in range(length):
+                _result["updated_entry"].append(
+                    ConfigSettingEntry.unpack_fields(
+                        unpacker, fields["updated_entry"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"updated_entry length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ConfigSettingEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"updated_entry length {length} exceeds remaining input length {_remaining}"
+            )
+        updated_entry = []
+        for _ in range(length):
+            updated_entry.append(
+                unpack_view(ConfigSettingEntry, unpacker, depth_limit - 1)
+            )
+        yield "updated_entry", updated_entry
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigUpgradeSet:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigUpgradeSet:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +180,11 @@ class ConfigUpgradeSet:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigUpgradeSet:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -102,6 +201,24 @@ class ConfigUpgradeSet:
             updated_entry=updated_entry,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"updated_entry": ')
+        write_json_array(write, self.updated_entry)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigUpgradeSet:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.updated_entry = [item.clone() for item in self.updated_entry]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigUpgradeSet:
+        return self.clone()
+
+    def freeze(self) -> ConfigUpgradeSet:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.updated_entry,))
 
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .contract_id import ContractID
 from .hash import Hash
 
+_LAYOUT = FixedLayout(">32s32s")
 __all__ = ["ConfigUpgradeSetKey"]
 
 
@@ -24,6 +36,8 @@ class ConfigUpgradeSetKey:
         };
     """
 
+    __slots__ = ("content_hash", "contract_id")
+
     def __init__(
         self,
         contract_id: ContractID,
@@ -33,8 +47,10 @@ class ConfigUpgradeSetKey:
         self.content_hash = content_hash
 
     def pack(self, packer: Packer) -> None:
-        self.contract_id.pack(packer)
-        self.content_hash.pack(packer)
+        _LAYOUT.write(packer, self.contract_id.contract_id.hash, self.content_hash.hash)
+
+    def xdr_size(self) -> int:
+        return 64
 
     @classmethod
     def unpack(
@@ -42,23 +58,63 @@ class ConfigUpgradeSetKey:
     ) -> ConfigUpgradeSetKey:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        contract_id = ContractID.unpack(unpacker, depth_limit - 1)
-        content_hash = Hash.unpack(unpacker, depth_limit - 1)
+        contract_id, content_hash = _LAYOUT.read(unpacker)
         return cls(
-            contract_id=contract_id,
-            content_hash=content_hash,
+            contract_id=ContractID(Hash(contract_id)),
+            content_hash=Hash(content_hash),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ConfigUpgradeSetKey:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "contract_id" in fields:
+            _result["contract_id"] = ContractID.unpack_fields(
+                unpacker, fields["contract_id"], depth_limit - 1
+            )
+        else:
+            ContractID.skip(unpacker, depth_limit - 1)
+        if "content_hash" in fields:
+            _result["content_hash"] = Hash.unpack_fields(
+                unpacker, fields["content_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ConfigUpgradeSetKey:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ConfigUpgradeSetKey:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +129,11 @@ class ConfigUpgradeSetKey:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ConfigUpgradeSetKey:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +150,27 @@ class ConfigUpgradeSetKey:
             content_hash=content_hash,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"contract_id": ')
+        self.contract_id._write_json(write)
+        write(', "content_hash": ')
+        self.content_hash._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ConfigUpgradeSetKey:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.contract_id = self.contract_id.clone()
+        result.content_hash = self.content_hash.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ConfigUpgradeSetKey:
+        return self.clone()
+
+    def freeze(self) -> ConfigUpgradeSetKey:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
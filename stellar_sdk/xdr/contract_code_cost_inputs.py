@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .extension_point import ExtensionPoint
 from .uint32 import Uint32
 
@@ -33,6 +43,20 @@ class ContractCodeCostInputs:
         };
     """
 
+    __slots__ = (
+        "ext",
+        "n_data_segment_bytes",
+        "n_data_segments",
+        "n_elem_segments",
+        "n_exports",
+        "n_functions",
+        "n_globals",
+        "n_imports",
+        "n_instructions",
+        "n_table_entries",
+        "n_types",
+    )
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -72,6 +96,9 @@ class ContractCodeCostInputs:
         self.n_exports.pack(packer)
         self.n_data_segment_bytes.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 40 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -103,16 +130,121 @@ class ContractCodeCostInputs:
             n_data_segment_bytes=n_data_segment_bytes,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractCodeCostInputs:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "n_instructions" in fields:
+            _result["n_instructions"] = Uint32.unpack_fields(
+                unpacker, fields["n_instructions"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_functions" in fields:
+            _result["n_functions"] = Uint32.unpack_fields(
+                unpacker, fields["n_functions"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_globals" in fields:
+            _result["n_globals"] = Uint32.unpack_fields(
+                unpacker, fields["n_globals"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_table_entries" in fields:
+            _result["n_table_entries"] = Uint32.unpack_fields(
+                unpacker, fields["n_table_entries"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_types" in fields:
+            _result["n_types"] = Uint32.unpack_fields(
+                unpacker, fields["n_types"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_data_segments" in fields:
+            _result["n_data_segments"] = Uint32.unpack_fields(
+                unpacker, fields["n_data_segments"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_elem_segments" in fields:
+            _result["n_elem_segments"] = Uint32.unpack_fields(
+                unpacker, fields["n_elem_segments"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_imports" in fields:
+            _result["n_imports"] = Uint32.unpack_fields(
+                unpacker, fields["n_imports"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_exports" in fields:
+            _result["n_exports"] = Uint32.unpack_fields(
+                unpacker, fields["n_exports"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_data_segment_bytes" in fields:
+            _result["n_data_segment_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["n_data_segment_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractCodeCostInputs:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractCodeCostInputs:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -127,11 +259,11 @@ class ContractCodeCostInputs:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractCodeCostInputs:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -175,6 +307,54 @@ class ContractCodeCostInputs:
             n_data_segment_bytes=n_data_segment_bytes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "n_instructions": ')
+        self.n_instructions._write_json(write)
+        write(', "n_functions": ')
+        self.n_functions._write_json(write)
+        write(', "n_globals": ')
+        self.n_globals._write_json(write)
+        write(', "n_table_entries": ')
+        self.n_table_entries._write_json(write)
+        write(', "n_types": ')
+        self.n_types._write_json(write)
+        write(', "n_data_segments": ')
+        self.n_data_segments._write_json(write)
+        write(', "n_elem_segments": ')
+        self.n_elem_segments._write_json(write)
+        write(', "n_imports": ')
+        self.n_imports._write_json(write)
+        write(', "n_exports": ')
+        self.n_exports._write_json(write)
+        write(', "n_data_segment_bytes": ')
+        self.n_data_segment_bytes._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ContractCodeCostInputs:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.n_instructions = self.n_instructions.clone()
+        result.n_functions = self.n_functions.clone()
+        result.n_globals = self.n_globals.clone()
+        result.n_table_entries = self.n_table_entries.clone()
+        result.n_types = self.n_types.clone()
+        result.n_data_segments = self.n_data_segments.clone()
+        result.n_elem_segments = self.n_elem_segments.clone()
+        result.n_imports = self.n_imports.clone()
+        result.n_exports = self.n_exports.clone()
+        result.n_data_segment_bytes = self.n_data_segment_bytes.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractCodeCostInputs:
+        return self.clone()
+
+    def freeze(self) -> ContractCodeCostInputs:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .contract_code_entry_ext import ContractCodeEntryExt
 from .hash import Hash
 
@@ -36,6 +48,8 @@ class ContractCodeEntry:
         };
     """
 
+    __slots__ = ("code", "ext", "hash")
+
     def __init__(
         self,
         ext: ContractCodeEntryExt,
@@ -56,6 +70,9 @@ class ContractCodeEntry:
         self.hash.pack(packer)
         Opaque(self.code, 4294967295, False).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + self.ext.xdr_size() + 4 + (len(self.code) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,16 +88,65 @@ class ContractCodeEntry:
             code=code,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ContractCodeEntryExt.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+        Opaque.skip(unpacker, 4294967295, False)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractCodeEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ContractCodeEntryExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ContractCodeEntryExt.skip(unpacker, depth_limit - 1)
+        if "hash" in fields:
+            _result["hash"] = Hash.unpack_fields(
+                unpacker, fields["hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "code" in fields:
+            _result["code"] = Opaque.unpack_fields(
+                unpacker, fields["code"], 4294967295, False
+            )
+        else:
+            Opaque.skip(unpacker, 4294967295, False)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractCodeEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractCodeEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +161,11 @@ class ContractCodeEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractCodeEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -119,6 +185,30 @@ class ContractCodeEntry:
             code=code,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "hash": ')
+        self.hash._write_json(write)
+        write(', "code": ')
+        write(json_encode(Opaque.to_json_dict(self.code)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> ContractCodeEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.hash = self.hash.clone()
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractCodeEntry:
+        return self.clone()
+
+    def freeze(self) -> ContractCodeEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .contract_code_cost_inputs import ContractCodeCostInputs
 from .extension_point import ExtensionPoint
 
@@ -25,6 +35,8 @@ class ContractCodeEntryV1:
                     }
     """
 
+    __slots__ = ("cost_inputs", "ext")
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -37,6 +49,9 @@ class ContractCodeEntryV1:
         self.ext.pack(packer)
         self.cost_inputs.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.ext.xdr_size() + self.cost_inputs.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class ContractCodeEntryV1:
             cost_inputs=cost_inputs,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        ContractCodeCostInputs.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractCodeEntryV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "cost_inputs" in fields:
+            _result["cost_inputs"] = ContractCodeCostInputs.unpack_fields(
+                unpacker, fields["cost_inputs"], depth_limit - 1
+            )
+        else:
+            ContractCodeCostInputs.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractCodeEntryV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractCodeEntryV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class ContractCodeEntryV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractCodeEntryV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class ContractCodeEntryV1:
             cost_inputs=cost_inputs,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "cost_inputs": ')
+        self.cost_inputs._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ContractCodeEntryV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.cost_inputs = self.cost_inputs.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractCodeEntryV1:
+        return self.clone()
+
+    def freeze(self) -> ContractCodeEntryV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .extension_point import ExtensionPoint
 from .int64 import Int64
 
@@ -27,6 +37,8 @@ class ContractCostParamEntry:
         };
     """
 
+    __slots__ = ("const_term", "ext", "linear_term")
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -42,6 +54,9 @@ class ContractCostParamEntry:
         self.const_term.pack(packer)
         self.linear_term.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 16 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +72,65 @@ class ContractCostParamEntry:
             linear_term=linear_term,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractCostParamEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "const_term" in fields:
+            _result["const_term"] = Int64.unpack_fields(
+                unpacker, fields["const_term"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "linear_term" in fields:
+            _result["linear_term"] = Int64.unpack_fields(
+                unpacker, fields["linear_term"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractCostParamEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractCostParamEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +145,11 @@ class ContractCostParamEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractCostParamEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +169,30 @@ class ContractCostParamEntry:
             linear_term=linear_term,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "const_term": ')
+        self.const_term._write_json(write)
+        write(', "linear_term": ')
+        self.linear_term._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ContractCostParamEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.const_term = self.const_term.clone()
+        result.linear_term = self.linear_term.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractCostParamEntry:
+        return self.clone()
+
+    def freeze(self) -> ContractCostParamEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import CONTRACT_COST_COUNT_LIMIT
 from .contract_cost_param_entry import ContractCostParamEntry
 
@@ -21,6 +34,8 @@ class ContractCostParams:
         typedef ContractCostParamEntry ContractCostParams<CONTRACT_COST_COUNT_LIMIT>;
     """
 
+    __slots__ = ("contract_cost_params",)
+
     def __init__(self, contract_cost_params: list[ContractCostParamEntry]) -> None:
         _expect_max_length = CONTRACT_COST_COUNT_LIMIT
         if contract_cost_params and len(contract_cost_params) > _expect_max_length:
@@ -34,6 +49,9 @@ class ContractCostParams:
         for contract_cost_params_item in self.contract_cost_params:
             contract_cost_params_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.contract_cost_params)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -53,16 +71,96 @@ class ContractCostParams:
             )
         return cls(contract_cost_params)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"contract_cost_params length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ContractCostParamEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractCostParams:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "contract_cost_params" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"contract_cost_params length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["contract_cost_params"] = []
+            for _ in range(length):
+                _result["contract_cost_params"].append(
+                    ContractCostParamEntry.unpack_fields(
+                        unpacker, fields["contract_cost_params"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"contract_cost_params length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ContractCostParamEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"contract_cost_params length {length} exceeds remaining input length {_remaining}"
+            )
+        contract_cost_params = []
+        for _ in range(length):
+            contract_cost_params.append(
+                ContractCostParamEntry.unpack(unpacker, depth_limit - 1)
+            )
+        yield "contract_cost_params", contract_cost_params
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractCostParams:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractCostParams:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -77,11 +175,11 @@ class ContractCostParams:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractCostParams:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.contract_cost_params]
@@ -90,6 +188,24 @@ class ContractCostParams:
     def from_json_dict(cls, json_value: list) -> ContractCostParams:
         return cls([ContractCostParamEntry.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.contract_cost_params)
+
+    def clone(self, deep: bool = True) -> ContractCostParams:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.contract_cost_params = [
+            item.clone() for item in self.contract_cost_params
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractCostParams:
+        return self.clone()
+
+    def freeze(self) -> ContractCostParams:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.contract_cost_params,))
 
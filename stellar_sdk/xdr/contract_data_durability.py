@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _CONTRACT_DATA_DURABILITY_MAP = {0: "temporary", 1: "persistent"}
 _CONTRACT_DATA_DURABILITY_REVERSE_MAP = {"temporary": 0, "persistent": 1}
 __all__ = ["ContractDataDurability"]
@@ -29,10 +38,27 @@ class ContractDataDurability(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> ContractDataDurability:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid ContractDataDurability")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls, unpacker: Unpacker, fields: dict | None
+    ) -> ContractDataDurability:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -40,10 +66,12 @@ class ContractDataDurability(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractDataDurability:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractDataDurability:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -58,11 +86,11 @@ class ContractDataDurability(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractDataDurability:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _CONTRACT_DATA_DURABILITY_MAP[self.value]
@@ -70,3 +98,15 @@ class ContractDataDurability(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> ContractDataDurability:
         return cls(_CONTRACT_DATA_DURABILITY_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_CONTRACT_DATA_DURABILITY_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> ContractDataDurability:
+        return self
+
+    def freeze(self) -> ContractDataDurability:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in ContractDataDurability}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .contract_event_body import ContractEventBody
 from .contract_event_type import ContractEventType
 from .contract_id import ContractID
@@ -42,6 +55,8 @@ class ContractEvent:
         };
     """
 
+    __slots__ = ("body", "contract_id", "ext", "type")
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -64,6 +79,15 @@ class ContractEvent:
         self.type.pack(packer)
         self.body.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + self.ext.xdr_size()
+            + 4
+            + (32 if self.contract_id is not None else 0)
+            + self.body.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -85,16 +109,92 @@ class ContractEvent:
             body=body,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            ContractID.skip(unpacker, depth_limit - 1)
+        ContractEventType.skip(unpacker)
+        ContractEventBody.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractEvent:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "contract_id" in fields:
+            _result["contract_id"] = (
+                ContractID.unpack_fields(
+                    unpacker, fields["contract_id"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                ContractID.skip(unpacker, depth_limit - 1)
+        if "type" in fields:
+            _result["type"] = ContractEventType.unpack_fields(unpacker, fields["type"])
+        else:
+            ContractEventType.skip(unpacker)
+        if "body" in fields:
+            _result["body"] = ContractEventBody.unpack_fields(
+                unpacker, fields["body"], depth_limit - 1
+            )
+        else:
+            ContractEventBody.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", ExtensionPoint.unpack(unpacker, depth_limit - 1)
+        yield (
+            "contract_id",
+            ContractID.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield "type", ContractEventType.unpack(unpacker)
+        yield "body", view_at(ContractEventBody, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractEvent:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ContractEvent:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -109,11 +209,11 @@ class ContractEvent:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractEvent:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -142,6 +242,38 @@ class ContractEvent:
             body=body,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "contract_id": ')
+        if self.contract_id is None:
+            write("null")
+        else:
+            self.contract_id._write_json(write)
+        write(', "type": ')
+        self.type._write_json(write)
+        write(', "body": ')
+        self.body._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ContractEvent:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.contract_id = (
+            self.contract_id.clone() if self.contract_id is not None else None
+        )
+        result.type = self.type
+        result.body = self.body.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractEvent:
+        return self.clone()
+
+    def freeze(self) -> ContractEvent:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
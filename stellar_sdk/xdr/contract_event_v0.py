@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .sc_val import SCVal
 
 __all__ = ["ContractEventV0"]
@@ -24,6 +39,8 @@ class ContractEventV0:
                 }
     """
 
+    __slots__ = ("data", "topics")
+
     def __init__(
         self,
         topics: list[SCVal],
@@ -43,6 +60,9 @@ class ContractEventV0:
             topics_item.pack(packer)
         self.data.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.topics) + self.data.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -64,16 +84,98 @@ class ContractEventV0:
             data=data,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"topics length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCVal.skip(unpacker, depth_limit - 1)
+        SCVal.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractEventV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "topics" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"topics length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["topics"] = []
+            for _ in range(length):
+                _result["topics"].append(
+                    SCVal.unpack_fields(unpacker, fields["topics"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"topics length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCVal.skip(unpacker, depth_limit - 1)
+        if "data" in fields:
+            _result["data"] = SCVal.unpack_fields(
+                unpacker, fields["data"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"topics length {length} exceeds remaining input length {_remaining}"
+            )
+        topics = []
+        for _ in range(length):
+            topics.append(unpack_view(SCVal, unpacker, depth_limit - 1))
+        yield "topics", topics
+        yield "data", view_at(SCVal, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractEventV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ContractEventV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -88,11 +190,11 @@ class ContractEventV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractEventV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -109,6 +211,27 @@ class ContractEventV0:
             data=data,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"topics": ')
+        write_json_array(write, self.topics)
+        write(', "data": ')
+        self.data._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ContractEventV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.topics = [item.clone() for item in self.topics]
+        result.data = self.data.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractEventV0:
+        return self.clone()
+
+    def freeze(self) -> ContractEventV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .contract_executable_type import ContractExecutableType
 from .hash import Hash
 
@@ -27,6 +37,8 @@ class ContractExecutable:
         };
     """
 
+    __slots__ = ("type", "wasm_hash")
+
     def __init__(
         self,
         type: ContractExecutableType,
@@ -46,30 +58,83 @@ class ContractExecutable:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
+            return 36
+        if self.type == ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET:
+            return 4
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ContractExecutable:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ContractExecutableType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = ContractExecutableType.unpack(unpacker)
         if type == ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
-            wasm_hash = Hash.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, wasm_hash=wasm_hash)
+            Hash.skip(unpacker, depth_limit - 1)
+            return
         if type == ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET:
-            return cls(type=type)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractExecutable:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = ContractExecutableType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
+            if "wasm_hash" in fields:
+                _result["wasm_hash"] = Hash.unpack_fields(
+                    unpacker, fields["wasm_hash"], depth_limit - 1
+                )
+            else:
+                Hash.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET:
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractExecutable:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractExecutable:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -84,11 +149,11 @@ class ContractExecutable:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractExecutable:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
@@ -118,6 +183,34 @@ class ContractExecutable:
             return cls(type=type, wasm_hash=wasm_hash)
         raise ValueError(f"Unknown key '{key}' for ContractExecutable")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == ContractExecutableType.CONTRACT_EXECUTABLE_WASM:
+            assert self.wasm_hash is not None
+            write('{"wasm": ')
+            self.wasm_hash._write_json(write)
+            write("}")
+            return
+        if self.type == ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET:
+            write('"stellar_asset"')
+            return
+        raise ValueError(f"Unknown type in ContractExecutable: {self.type}")
+
+    def clone(self, deep: bool = True) -> ContractExecutable:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.wasm_hash = (
+            self.wasm_hash.clone() if self.wasm_hash is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractExecutable:
+        return self.clone()
+
+    def freeze(self) -> ContractExecutable:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -137,3 +230,20 @@ class ContractExecutable:
         if self.wasm_hash is not None:
             out.append(f"wasm_hash={self.wasm_hash}")
         return f"<ContractExecutable [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> ContractExecutable:
+    return cls(type=type)
+
+
+def _unpack_wasm_hash(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ContractExecutable:
+    wasm_hash = Hash.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, wasm_hash=wasm_hash)
+
+
+_UNPACK_ARMS = {
+    ContractExecutableType.CONTRACT_EXECUTABLE_WASM: _unpack_wasm_hash,
+    ContractExecutableType.CONTRACT_EXECUTABLE_STELLAR_ASSET: _unpack_void,
+}
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 
 __all__ = ["ContractID"]
@@ -20,12 +30,17 @@ class ContractID:
         typedef Hash ContractID;
     """
 
+    __slots__ = ("contract_id",)
+
     def __init__(self, contract_id: Hash) -> None:
         self.contract_id = contract_id
 
     def pack(self, packer: Packer) -> None:
         self.contract_id.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -35,16 +50,49 @@ class ContractID:
         contract_id = Hash.unpack(unpacker, depth_limit - 1)
         return cls(contract_id)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractID:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "contract_id" in fields:
+            _result["contract_id"] = Hash.unpack_fields(
+                unpacker, fields["contract_id"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractID:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ContractID:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -59,11 +107,11 @@ class ContractID:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractID:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return self.contract_id.to_json_dict()
@@ -72,6 +120,22 @@ class ContractID:
     def from_json_dict(cls, json_value: str) -> ContractID:
         return cls(Hash.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        self.contract_id._write_json(write)
+
+    def clone(self, deep: bool = True) -> ContractID:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.contract_id = self.contract_id.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractID:
+        return self.clone()
+
+    def freeze(self) -> ContractID:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.contract_id,))
 
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .contract_id_preimage_from_address import ContractIDPreimageFromAddress
 from .contract_id_preimage_type import ContractIDPreimageType
 
@@ -32,6 +42,8 @@ class ContractIDPreimage:
         };
     """
 
+    __slots__ = ("from_address", "from_asset", "type")
+
     def __init__(
         self,
         type: ContractIDPreimageType,
@@ -56,33 +68,92 @@ class ContractIDPreimage:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ADDRESS:
+            assert self.from_address is not None
+            return 4 + self.from_address.xdr_size()
+        if self.type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ASSET:
+            assert self.from_asset is not None
+            return 4 + self.from_asset.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ContractIDPreimage:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = ContractIDPreimageType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = ContractIDPreimageType.unpack(unpacker)
         if type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ADDRESS:
-            from_address = ContractIDPreimageFromAddress.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(type=type, from_address=from_address)
+            ContractIDPreimageFromAddress.skip(unpacker, depth_limit - 1)
+            return
         if type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ASSET:
-            from_asset = Asset.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, from_asset=from_asset)
+            Asset.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ContractIDPreimage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = ContractIDPreimageType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ADDRESS:
+            if "from_address" in fields:
+                _result["from_address"] = ContractIDPreimageFromAddress.unpack_fields(
+                    unpacker, fields["from_address"], depth_limit - 1
+                )
+            else:
+                ContractIDPreimageFromAddress.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ASSET:
+            if "from_asset" in fields:
+                _result["from_asset"] = Asset.unpack_fields(
+                    unpacker, fields["from_asset"], depth_limit - 1
+                )
+            else:
+                Asset.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ContractIDPreimage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ContractIDPreimage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +168,11 @@ class ContractIDPreimage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ContractIDPreimage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ADDRESS:
@@ -130,6 +201,40 @@ class ContractIDPreimage:
             return cls(type=type, from_asset=from_asset)
         raise ValueError(f"Unknown key '{key}' for ContractIDPreimage")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ADDRESS:
+            assert self.from_address is not None
+            write('{"address": ')
+            self.from_address._write_json(write)
+            write("}")
+            return
+        if self.type == ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ASSET:
+            assert self.from_asset is not None
+            write('{"asset": ')
+            self.from_asset._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in ContractIDPreimage: {self.type}")
+
+    def clone(self, deep: bool = True) -> ContractIDPreimage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.from_address = (
+            self.from_address.clone() if self.from_address is not None else None
+        )
+        result.from_asset = (
+            self.from_asset.clone() if self.from_asset is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ContractIDPreimage:
+        return self.clone()
+
+    def freeze(self) -> ContractIDPreimage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -156,3 +261,23 @@ class ContractIDPreimage:
         if self.from_asset is not None:
             out.append(f"from_asset={self.from_asset}")
         return f"<ContractIDPreimage [{', '.join(out)}]>"
+
+
+def _unpack_from_address(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ContractIDPreimage:
+    from_address = ContractIDPreimageFromAddress.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, from_address=from_address)
+
+
+def _unpack_from_asset(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> ContractIDPreimage:
+    from_asset = Asset.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, from_asset=from_asset)
+
+
+_UNPACK_ARMS = {
+    ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ADDRESS: _unpack_from_address,
+    ContractIDPreimageType.CONTRACT_ID_PREIMAGE_FROM_ASSET: _unpack_from_asset,
+}
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .create_account_result_code import CreateAccountResultCode
 
 __all__ = ["CreateAccountResult"]
@@ -29,6 +39,8 @@ class CreateAccountResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: CreateAccountResultCode,
@@ -49,6 +61,19 @@ class CreateAccountResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_SUCCESS:
+            return 4
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_MALFORMED:
+            return 4
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_UNDERFUNDED:
+            return 4
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_LOW_RESERVE:
+            return 4
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_ALREADY_EXIST:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,28 +81,74 @@ class CreateAccountResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = CreateAccountResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = CreateAccountResultCode.unpack(unpacker)
+        if code == CreateAccountResultCode.CREATE_ACCOUNT_SUCCESS:
+            return
+        if code == CreateAccountResultCode.CREATE_ACCOUNT_MALFORMED:
+            return
+        if code == CreateAccountResultCode.CREATE_ACCOUNT_UNDERFUNDED:
+            return
+        if code == CreateAccountResultCode.CREATE_ACCOUNT_LOW_RESERVE:
+            return
+        if code == CreateAccountResultCode.CREATE_ACCOUNT_ALREADY_EXIST:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | CreateAccountResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = CreateAccountResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == CreateAccountResultCode.CREATE_ACCOUNT_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == CreateAccountResultCode.CREATE_ACCOUNT_MALFORMED:
-            return cls(code=code)
+            return _result
         if code == CreateAccountResultCode.CREATE_ACCOUNT_UNDERFUNDED:
-            return cls(code=code)
+            return _result
         if code == CreateAccountResultCode.CREATE_ACCOUNT_LOW_RESERVE:
-            return cls(code=code)
+            return _result
         if code == CreateAccountResultCode.CREATE_ACCOUNT_ALREADY_EXIST:
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> CreateAccountResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> CreateAccountResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +163,11 @@ class CreateAccountResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> CreateAccountResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == CreateAccountResultCode.CREATE_ACCOUNT_SUCCESS:
@@ -126,6 +197,37 @@ class CreateAccountResult:
         code = CreateAccountResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_SUCCESS:
+            write('"success"')
+            return
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_UNDERFUNDED:
+            write('"underfunded"')
+            return
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        if self.code == CreateAccountResultCode.CREATE_ACCOUNT_ALREADY_EXIST:
+            write('"already_exist"')
+            return
+        raise ValueError(f"Unknown code in CreateAccountResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> CreateAccountResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> CreateAccountResult:
+        return self.clone()
+
+    def freeze(self) -> CreateAccountResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -138,3 +240,18 @@ class CreateAccountResult:
         out = []
         out.append(f"code={self.code}")
         return f"<CreateAccountResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> CreateAccountResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    CreateAccountResultCode.CREATE_ACCOUNT_SUCCESS: _unpack_void,
+    CreateAccountResultCode.CREATE_ACCOUNT_MALFORMED: _unpack_void,
+    CreateAccountResultCode.CREATE_ACCOUNT_UNDERFUNDED: _unpack_void,
+    CreateAccountResultCode.CREATE_ACCOUNT_LOW_RESERVE: _unpack_void,
+    CreateAccountResultCode.CREATE_ACCOUNT_ALREADY_EXIST: _unpack_void,
+}
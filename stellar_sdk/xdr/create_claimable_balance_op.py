@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .claimant import Claimant
 from .int64 import Int64
 
@@ -27,6 +41,8 @@ class CreateClaimableBalanceOp:
         };
     """
 
+    __slots__ = ("amount", "asset", "claimants")
+
     def __init__(
         self,
         asset: Asset,
@@ -49,6 +65,14 @@ class CreateClaimableBalanceOp:
         for claimants_item in self.claimants:
             claimants_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            8
+            + self.asset.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.claimants)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -72,16 +96,110 @@ class CreateClaimableBalanceOp:
             claimants=claimants,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"claimants length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Claimant.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | CreateClaimableBalanceOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "asset" in fields:
+            _result["asset"] = Asset.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount" in fields:
+            _result["amount"] = Int64.unpack_fields(
+                unpacker, fields["amount"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "claimants" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"claimants length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["claimants"] = []
+            for _ in range(length):
+                _result["claimants"].append(
+                    Claimant.unpack_fields(
+                        unpacker, fields["claimants"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"claimants length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Claimant.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "asset", Asset.unpack(unpacker, depth_limit - 1)
+        yield "amount", Int64.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"claimants length {length} exceeds remaining input length {_remaining}"
+            )
+        claimants = []
+        for _ in range(length):
+            claimants.append(unpack_view(Claimant, unpacker, depth_limit - 1))
+        yield "claimants", claimants
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> CreateClaimableBalanceOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> CreateClaimableBalanceOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -96,11 +214,11 @@ class CreateClaimableBalanceOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> CreateClaimableBalanceOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -120,6 +238,30 @@ class CreateClaimableBalanceOp:
             claimants=claimants,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"asset": ')
+        self.asset._write_json(write)
+        write(', "amount": ')
+        self.amount._write_json(write)
+        write(', "claimants": ')
+        write_json_array(write, self.claimants)
+        write("}")
+
+    def clone(self, deep: bool = True) -> CreateClaimableBalanceOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.asset = self.asset.clone()
+        result.amount = self.amount.clone()
+        result.claimants = [item.clone() for item in self.claimants]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> CreateClaimableBalanceOp:
+        return self.clone()
+
+    def freeze(self) -> CreateClaimableBalanceOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .claimable_balance_id import ClaimableBalanceID
 from .create_claimable_balance_result_code import CreateClaimableBalanceResultCode
 
@@ -32,6 +42,8 @@ class CreateClaimableBalanceResult:
         };
     """
 
+    __slots__ = ("balance_id", "code")
+
     def __init__(
         self,
         code: CreateClaimableBalanceResultCode,
@@ -77,47 +89,144 @@ class CreateClaimableBalanceResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_SUCCESS
+        ):
+            assert self.balance_id is not None
+            return 4 + self.balance_id.xdr_size()
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_MALFORMED
+        ):
+            return 4
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_LOW_RESERVE
+        ):
+            return 4
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NO_TRUST
+        ):
+            return 4
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NOT_AUTHORIZED
+        ):
+            return 4
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_UNDERFUNDED
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> CreateClaimableBalanceResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = CreateClaimableBalanceResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = CreateClaimableBalanceResultCode.unpack(unpacker)
         if code == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_SUCCESS:
-            balance_id = ClaimableBalanceID.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, balance_id=balance_id)
+            ClaimableBalanceID.skip(unpacker, depth_limit - 1)
+            return
         if code == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_MALFORMED:
-            return cls(code=code)
+            return
         if (
             code
             == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_LOW_RESERVE
         ):
-            return cls(code=code)
+            return
         if code == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NO_TRUST:
-            return cls(code=code)
+            return
         if (
             code
             == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NOT_AUTHORIZED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_UNDERFUNDED
         ):
-            return cls(code=code)
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | CreateClaimableBalanceResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = CreateClaimableBalanceResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_SUCCESS:
+            if "balance_id" in fields:
+                _result["balance_id"] = ClaimableBalanceID.unpack_fields(
+                    unpacker, fields["balance_id"], depth_limit - 1
+                )
+            else:
+                ClaimableBalanceID.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_MALFORMED:
+            return _result
+        if (
+            code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_LOW_RESERVE
+        ):
+            return _result
+        if code == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NO_TRUST:
+            return _result
+        if (
+            code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NOT_AUTHORIZED
+        ):
+            return _result
+        if (
+            code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_UNDERFUNDED
+        ):
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> CreateClaimableBalanceResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> CreateClaimableBalanceResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -132,11 +241,11 @@ class CreateClaimableBalanceResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> CreateClaimableBalanceResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -198,6 +307,64 @@ class CreateClaimableBalanceResult:
             return cls(code=code, balance_id=balance_id)
         raise ValueError(f"Unknown key '{key}' for CreateClaimableBalanceResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_SUCCESS
+        ):
+            assert self.balance_id is not None
+            write('{"success": ')
+            self.balance_id._write_json(write)
+            write("}")
+            return
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_MALFORMED
+        ):
+            write('"malformed"')
+            return
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_LOW_RESERVE
+        ):
+            write('"low_reserve"')
+            return
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NO_TRUST
+        ):
+            write('"no_trust"')
+            return
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NOT_AUTHORIZED
+        ):
+            write('"not_authorized"')
+            return
+        if (
+            self.code
+            == CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_UNDERFUNDED
+        ):
+            write('"underfunded"')
+            return
+        raise ValueError(f"Unknown code in CreateClaimableBalanceResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> CreateClaimableBalanceResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.balance_id = (
+            self.balance_id.clone() if self.balance_id is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> CreateClaimableBalanceResult:
+        return self.clone()
+
+    def freeze(self) -> CreateClaimableBalanceResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -217,3 +384,26 @@ class CreateClaimableBalanceResult:
         if self.balance_id is not None:
             out.append(f"balance_id={self.balance_id}")
         return f"<CreateClaimableBalanceResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> CreateClaimableBalanceResult:
+    return cls(code=code)
+
+
+def _unpack_balance_id(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> CreateClaimableBalanceResult:
+    balance_id = ClaimableBalanceID.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, balance_id=balance_id)
+
+
+_UNPACK_ARMS = {
+    CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_SUCCESS: _unpack_balance_id,
+    CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_MALFORMED: _unpack_void,
+    CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_LOW_RESERVE: _unpack_void,
+    CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NO_TRUST: _unpack_void,
+    CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_NOT_AUTHORIZED: _unpack_void,
+    CreateClaimableBalanceResultCode.CREATE_CLAIMABLE_BALANCE_UNDERFUNDED: _unpack_void,
+}
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .contract_executable import ContractExecutable
 from .contract_id_preimage import ContractIDPreimage
 from .sc_val import SCVal
@@ -28,6 +42,8 @@ class CreateContractArgsV2:
         };
     """
 
+    __slots__ = ("constructor_args", "contract_id_preimage", "executable")
+
     def __init__(
         self,
         contract_id_preimage: ContractIDPreimage,
@@ -50,6 +66,14 @@ class CreateContractArgsV2:
         for constructor_args_item in self.constructor_args:
             constructor_args_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.contract_id_preimage.xdr_size()
+            + self.executable.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.constructor_args)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -73,16 +97,113 @@ class CreateContractArgsV2:
             constructor_args=constructor_args,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ContractIDPreimage.skip(unpacker, depth_limit - 1)
+        ContractExecutable.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"constructor_args length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCVal.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | CreateContractArgsV2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "contract_id_preimage" in fields:
+            _result["contract_id_preimage"] = ContractIDPreimage.unpack_fields(
+                unpacker, fields["contract_id_preimage"], depth_limit - 1
+            )
+        else:
+            ContractIDPreimage.skip(unpacker, depth_limit - 1)
+        if "executable" in fields:
+            _result["executable"] = ContractExecutable.unpack_fields(
+                unpacker, fields["executable"], depth_limit - 1
+            )
+        else:
+            ContractExecutable.skip(unpacker, depth_limit - 1)
+        if "constructor_args" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"constructor_args length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["constructor_args"] = []
+            for _ in range(length):
+                _result["constructor_args"].append(
+                    SCVal.unpack_fields(
+                        unpacker, fields["constructor_args"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"constructor_args length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCVal.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield (
+            "contract_id_preimage",
+            ContractIDPreimage.unpack(unpacker, depth_limit - 1),
+        )
+        yield "executable", ContractExecutable.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"constructor_args length {length} exceeds remaining input length {_remaining}"
+            )
+        constructor_args = []
+        for _ in range(length):
+            constructor_args.append(unpack_view(SCVal, unpacker, depth_limit - 1))
+        yield "constructor_args", constructor_args
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> CreateContractArgsV2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> CreateContractArgsV2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +218,11 @@ class CreateContractArgsV2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> CreateContractArgsV2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -125,6 +246,30 @@ class CreateContractArgsV2:
             constructor_args=constructor_args,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"contract_id_preimage": ')
+        self.contract_id_preimage._write_json(write)
+        write(', "executable": ')
+        self.executable._write_json(write)
+        write(', "constructor_args": ')
+        write_json_array(write, self.constructor_args)
+        write("}")
+
+    def clone(self, deep: bool = True) -> CreateContractArgsV2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.contract_id_preimage = self.contract_id_preimage.clone()
+        result.executable = self.executable.clone()
+        result.constructor_args = [item.clone() for item in self.constructor_args]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> CreateContractArgsV2:
+        return self.clone()
+
+    def freeze(self) -> CreateContractArgsV2:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["Curve25519Secret"]
 
@@ -22,6 +34,8 @@ class Curve25519Secret:
         };
     """
 
+    __slots__ = ("key",)
+
     def __init__(
         self,
         key: bytes,
@@ -36,6 +50,9 @@ class Curve25519Secret:
     def pack(self, packer: Packer) -> None:
         Opaque(self.key, 32, True).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -47,16 +64,49 @@ class Curve25519Secret:
             key=key,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 32, True)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Curve25519Secret:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "key" in fields:
+            _result["key"] = Opaque.unpack_fields(unpacker, fields["key"], 32, True)
+        else:
+            Opaque.skip(unpacker, 32, True)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Curve25519Secret:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> Curve25519Secret:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -71,11 +121,11 @@ class Curve25519Secret:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Curve25519Secret:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -89,6 +139,24 @@ class Curve25519Secret:
             key=key,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"key": ')
+        write(json_encode(Opaque.to_json_dict(self.key)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> Curve25519Secret:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.key = self.key
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Curve25519Secret:
+        return self.clone()
+
+    def freeze(self) -> Curve25519Secret:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.key,))
 
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .data_entry_ext import DataEntryExt
 from .data_value import DataValue
 from .string64 import String64
@@ -36,6 +46,8 @@ class DataEntry:
         };
     """
 
+    __slots__ = ("account_id", "data_name", "data_value", "ext")
+
     def __init__(
         self,
         account_id: AccountID,
@@ -54,6 +66,14 @@ class DataEntry:
         self.data_value.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.account_id.xdr_size()
+            + self.data_name.xdr_size()
+            + self.data_value.xdr_size()
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,16 +91,70 @@ class DataEntry:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        String64.skip(unpacker, depth_limit - 1)
+        DataValue.skip(unpacker, depth_limit - 1)
+        DataEntryExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | DataEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "account_id" in fields:
+            _result["account_id"] = AccountID.unpack_fields(
+                unpacker, fields["account_id"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "data_name" in fields:
+            _result["data_name"] = String64.unpack_fields(
+                unpacker, fields["data_name"], depth_limit - 1
+            )
+        else:
+            String64.skip(unpacker, depth_limit - 1)
+        if "data_value" in fields:
+            _result["data_value"] = DataValue.unpack_fields(
+                unpacker, fields["data_value"], depth_limit - 1
+            )
+        else:
+            DataValue.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = DataEntryExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            DataEntryExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> DataEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> DataEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +169,11 @@ class DataEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> DataEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -122,6 +196,33 @@ class DataEntry:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"account_id": ')
+        self.account_id._write_json(write)
+        write(', "data_name": ')
+        self.data_name._write_json(write)
+        write(', "data_value": ')
+        self.data_value._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> DataEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.account_id = self.account_id.clone()
+        result.data_name = self.data_name.clone()
+        result.data_value = self.data_value.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> DataEntry:
+        return self.clone()
+
+    def freeze(self) -> DataEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["DataValue"]
 
@@ -19,6 +31,8 @@ class DataValue:
         typedef opaque DataValue<64>;
     """
 
+    __slots__ = ("data_value",)
+
     def __init__(self, data_value: bytes) -> None:
         _expect_max_length = 64
         if data_value and len(data_value) > _expect_max_length:
@@ -30,6 +44,9 @@ class DataValue:
     def pack(self, packer: Packer) -> None:
         Opaque(self.data_value, 64, False).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.data_value) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -39,16 +56,49 @@ class DataValue:
         data_value = Opaque.unpack(unpacker, 64, False)
         return cls(data_value)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 64, False)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | DataValue:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "data_value" in fields:
+            _result["data_value"] = Opaque.unpack_fields(
+                unpacker, fields["data_value"], 64, False
+            )
+        else:
+            Opaque.skip(unpacker, 64, False)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> DataValue:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> DataValue:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +113,11 @@ class DataValue:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> DataValue:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return Opaque.to_json_dict(self.data_value)
@@ -76,6 +126,22 @@ class DataValue:
     def from_json_dict(cls, json_value: str) -> DataValue:
         return cls(Opaque.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(Opaque.to_json_dict(self.data_value)))
+
+    def clone(self, deep: bool = True) -> DataValue:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.data_value = self.data_value
+        return result
+
+    def __deepcopy__(self, memo: dict) -> DataValue:
+        return self.clone()
+
+    def freeze(self) -> DataValue:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.data_value,))
 
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .transaction_envelope import TransactionEnvelope
 
 __all__ = ["DependentTxCluster"]
@@ -20,6 +34,8 @@ class DependentTxCluster:
         typedef TransactionEnvelope DependentTxCluster<>;
     """
 
+    __slots__ = ("dependent_tx_cluster",)
+
     def __init__(self, dependent_tx_cluster: list[TransactionEnvelope]) -> None:
         _expect_max_length = 4294967295
         if dependent_tx_cluster and len(dependent_tx_cluster) > _expect_max_length:
@@ -33,6 +49,9 @@ class DependentTxCluster:
         for dependent_tx_cluster_item in self.dependent_tx_cluster:
             dependent_tx_cluster_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.dependent_tx_cluster)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -52,16 +71,96 @@ class DependentTxCluster:
             )
         return cls(dependent_tx_cluster)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"dependent_tx_cluster length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionEnvelope.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | DependentTxCluster:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "dependent_tx_cluster" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"dependent_tx_cluster length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["dependent_tx_cluster"] = []
+            for _ in range(length):
+                _result["dependent_tx_cluster"].append(
+                    TransactionEnvelope.unpack_fields(
+                        unpacker, fields["dependent_tx_cluster"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"dependent_tx_cluster length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionEnvelope.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"dependent_tx_cluster length {length} exceeds remaining input length {_remaining}"
+            )
+        dependent_tx_cluster = []
+        for _ in range(length):
+            dependent_tx_cluster.append(
+                unpack_view(TransactionEnvelope, unpacker, depth_limit - 1)
+            )
+        yield "dependent_tx_cluster", dependent_tx_cluster
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> DependentTxCluster:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> DependentTxCluster:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -76,11 +175,11 @@ class DependentTxCluster:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> DependentTxCluster:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.dependent_tx_cluster]
@@ -89,6 +188,24 @@ class DependentTxCluster:
     def from_json_dict(cls, json_value: list) -> DependentTxCluster:
         return cls([TransactionEnvelope.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.dependent_tx_cluster)
+
+    def clone(self, deep: bool = True) -> DependentTxCluster:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.dependent_tx_cluster = [
+            item.clone() for item in self.dependent_tx_cluster
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> DependentTxCluster:
+        return self.clone()
+
+    def freeze(self) -> DependentTxCluster:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.dependent_tx_cluster,))
 
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Boolean
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Boolean,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .contract_event import ContractEvent
 
 __all__ = ["DiagnosticEvent"]
@@ -24,6 +39,8 @@ class DiagnosticEvent:
         };
     """
 
+    __slots__ = ("event", "in_successful_contract_call")
+
     def __init__(
         self,
         in_successful_contract_call: bool,
@@ -36,6 +53,9 @@ class DiagnosticEvent:
         Boolean(self.in_successful_contract_call).pack(packer)
         self.event.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.event.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -49,16 +69,67 @@ class DiagnosticEvent:
             event=event,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Boolean.skip(unpacker)
+        ContractEvent.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | DiagnosticEvent:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "in_successful_contract_call" in fields:
+            _result["in_successful_contract_call"] = Boolean.unpack_fields(
+                unpacker, fields["in_successful_contract_call"]
+            )
+        else:
+            Boolean.skip(unpacker)
+        if "event" in fields:
+            _result["event"] = ContractEvent.unpack_fields(
+                unpacker, fields["event"], depth_limit - 1
+            )
+        else:
+            ContractEvent.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "in_successful_contract_call", Boolean.unpack(unpacker)
+        yield "event", view_at(ContractEvent, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> DiagnosticEvent:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> DiagnosticEvent:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +144,11 @@ class DiagnosticEvent:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> DiagnosticEvent:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -98,6 +169,27 @@ class DiagnosticEvent:
             event=event,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"in_successful_contract_call": ')
+        write(json_encode(Boolean.to_json_dict(self.in_successful_contract_call)))
+        write(', "event": ')
+        self.event._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> DiagnosticEvent:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.in_successful_contract_call = self.in_successful_contract_call
+        result.event = self.event.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> DiagnosticEvent:
+        return self.clone()
+
+    def freeze(self) -> DiagnosticEvent:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
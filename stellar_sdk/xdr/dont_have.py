@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .message_type import MessageType
 from .uint256 import Uint256
 
+_LAYOUT = FixedLayout(">i32s")
 __all__ = ["DontHave"]
 
 
@@ -25,6 +37,8 @@ class DontHave:
         };
     """
 
+    __slots__ = ("req_hash", "type")
+
     def __init__(
         self,
         type: MessageType,
@@ -34,8 +48,10 @@ class DontHave:
         self.req_hash = req_hash
 
     def pack(self, packer: Packer) -> None:
-        self.type.pack(packer)
-        self.req_hash.pack(packer)
+        _LAYOUT.write(packer, self.type, self.req_hash.uint256)
+
+    def xdr_size(self) -> int:
+        return 36
 
     @classmethod
     def unpack(
@@ -43,23 +59,59 @@ class DontHave:
     ) -> DontHave:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        type = MessageType.unpack(unpacker)
-        req_hash = Uint256.unpack(unpacker, depth_limit - 1)
+        type, req_hash = _LAYOUT.read(unpacker)
         return cls(
-            type=type,
-            req_hash=req_hash,
+            type=MessageType(type),
+            req_hash=Uint256(req_hash),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | DontHave:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "type" in fields:
+            _result["type"] = MessageType.unpack_fields(unpacker, fields["type"])
+        else:
+            MessageType.skip(unpacker)
+        if "req_hash" in fields:
+            _result["req_hash"] = Uint256.unpack_fields(
+                unpacker, fields["req_hash"], depth_limit - 1
+            )
+        else:
+            Uint256.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> DontHave:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> DontHave:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +126,11 @@ class DontHave:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> DontHave:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +147,27 @@ class DontHave:
             req_hash=req_hash,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"type": ')
+        self.type._write_json(write)
+        write(', "req_hash": ')
+        self.req_hash._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> DontHave:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.req_hash = self.req_hash.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> DontHave:
+        return self.clone()
+
+    def freeze(self) -> DontHave:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
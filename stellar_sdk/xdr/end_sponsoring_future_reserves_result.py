@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .end_sponsoring_future_reserves_result_code import (
     EndSponsoringFutureReservesResultCode,
 )
@@ -29,6 +39,8 @@ class EndSponsoringFutureReservesResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: EndSponsoringFutureReservesResultCode,
@@ -49,6 +61,19 @@ class EndSponsoringFutureReservesResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.code
+            == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_SUCCESS
+        ):
+            return 4
+        if (
+            self.code
+            == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_NOT_SPONSORED
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,28 +81,74 @@ class EndSponsoringFutureReservesResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = EndSponsoringFutureReservesResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = EndSponsoringFutureReservesResultCode.unpack(unpacker)
+        if (
+            code
+            == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_SUCCESS
+        ):
+            return
+        if (
+            code
+            == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_NOT_SPONSORED
+        ):
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | EndSponsoringFutureReservesResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = EndSponsoringFutureReservesResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if (
             code
             == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_SUCCESS
         ):
-            return cls(code=code)
+            return _result
         if (
             code
             == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_NOT_SPONSORED
         ):
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> EndSponsoringFutureReservesResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> EndSponsoringFutureReservesResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +163,11 @@ class EndSponsoringFutureReservesResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> EndSponsoringFutureReservesResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -125,6 +196,36 @@ class EndSponsoringFutureReservesResult:
         code = EndSponsoringFutureReservesResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.code
+            == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_SUCCESS
+        ):
+            write('"success"')
+            return
+        if (
+            self.code
+            == EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_NOT_SPONSORED
+        ):
+            write('"not_sponsored"')
+            return
+        raise ValueError(
+            f"Unknown code in EndSponsoringFutureReservesResult: {self.code}"
+        )
+
+    def clone(self, deep: bool = True) -> EndSponsoringFutureReservesResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> EndSponsoringFutureReservesResult:
+        return self.clone()
+
+    def freeze(self) -> EndSponsoringFutureReservesResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -137,3 +238,15 @@ class EndSponsoringFutureReservesResult:
         out = []
         out.append(f"code={self.code}")
         return f"<EndSponsoringFutureReservesResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> EndSponsoringFutureReservesResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_SUCCESS: _unpack_void,
+    EndSponsoringFutureReservesResultCode.END_SPONSORING_FUTURE_RESERVES_NOT_SPONSORED: _unpack_void,
+}
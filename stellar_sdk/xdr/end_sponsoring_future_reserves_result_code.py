@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _END_SPONSORING_FUTURE_RESERVES_RESULT_CODE_MAP = {0: "success", -1: "not_sponsored"}
 _END_SPONSORING_FUTURE_RESERVES_RESULT_CODE_REVERSE_MAP = {
     "success": 0,
@@ -36,10 +45,29 @@ class EndSponsoringFutureReservesResultCode(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> EndSponsoringFutureReservesResultCode:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(
+                f"{value} is not a valid EndSponsoringFutureReservesResultCode"
+            )
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls, unpacker: Unpacker, fields: dict | None
+    ) -> EndSponsoringFutureReservesResultCode:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -47,10 +75,12 @@ class EndSponsoringFutureReservesResultCode(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> EndSponsoringFutureReservesResultCode:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> EndSponsoringFutureReservesResultCode:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -65,11 +95,11 @@ class EndSponsoringFutureReservesResultCode(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> EndSponsoringFutureReservesResultCode:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _END_SPONSORING_FUTURE_RESERVES_RESULT_CODE_MAP[self.value]
@@ -77,3 +107,15 @@ class EndSponsoringFutureReservesResultCode(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> EndSponsoringFutureReservesResultCode:
         return cls(_END_SPONSORING_FUTURE_RESERVES_RESULT_CODE_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_END_SPONSORING_FUTURE_RESERVES_RESULT_CODE_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> EndSponsoringFutureReservesResultCode:
+        return self
+
+    def freeze(self) -> EndSponsoringFutureReservesResultCode:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in EndSponsoringFutureReservesResultCode}
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .error_code import ErrorCode
 
 __all__ = ["Error"]
@@ -24,6 +36,8 @@ class Error:
         };
     """
 
+    __slots__ = ("code", "msg")
+
     def __init__(
         self,
         code: ErrorCode,
@@ -41,6 +55,9 @@ class Error:
         self.code.pack(packer)
         String(self.msg, 100).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 4 + (len(self.msg) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -54,16 +71,52 @@ class Error:
             msg=msg,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ErrorCode.skip(unpacker)
+        String.skip(unpacker, 100)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Error:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "code" in fields:
+            _result["code"] = ErrorCode.unpack_fields(unpacker, fields["code"])
+        else:
+            ErrorCode.skip(unpacker)
+        if "msg" in fields:
+            _result["msg"] = String.unpack_fields(unpacker, fields["msg"], 100)
+        else:
+            String.skip(unpacker, 100)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Error:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Error:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +131,11 @@ class Error:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Error:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -99,6 +152,27 @@ class Error:
             msg=msg,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"code": ')
+        self.code._write_json(write)
+        write(', "msg": ')
+        write(json_encode(String.to_json_dict(self.msg)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> Error:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.msg = self.msg
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Error:
+        return self.clone()
+
+    def freeze(self) -> Error:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Boolean
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Boolean,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 from .uint64 import Uint64
 
+_LAYOUT = FixedLayout(">IIQ")
 __all__ = ["EvictionIterator"]
 
 
@@ -25,6 +39,8 @@ class EvictionIterator:
         };
     """
 
+    __slots__ = ("bucket_file_offset", "bucket_list_level", "is_curr_bucket")
+
     def __init__(
         self,
         bucket_list_level: Uint32,
@@ -36,9 +52,15 @@ class EvictionIterator:
         self.bucket_file_offset = bucket_file_offset
 
     def pack(self, packer: Packer) -> None:
-        self.bucket_list_level.pack(packer)
-        Boolean(self.is_curr_bucket).pack(packer)
-        self.bucket_file_offset.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.bucket_list_level.uint32,
+            1 if self.is_curr_bucket else 0,
+            self.bucket_file_offset.uint64,
+        )
+
+    def xdr_size(self) -> int:
+        return 16
 
     @classmethod
     def unpack(
@@ -46,25 +68,70 @@ class EvictionIterator:
     ) -> EvictionIterator:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        bucket_list_level = Uint32.unpack(unpacker, depth_limit - 1)
-        is_curr_bucket = Boolean.unpack(unpacker)
-        bucket_file_offset = Uint64.unpack(unpacker, depth_limit - 1)
+        bucket_list_level, is_curr_bucket, bucket_file_offset = _LAYOUT.read(unpacker)
         return cls(
-            bucket_list_level=bucket_list_level,
-            is_curr_bucket=is_curr_bucket,
-            bucket_file_offset=bucket_file_offset,
+            bucket_list_level=Uint32(bucket_list_level),
+            is_curr_bucket=bool(is_curr_bucket),
+            bucket_file_offset=Uint64(bucket_file_offset),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | EvictionIterator:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "bucket_list_level" in fields:
+            _result["bucket_list_level"] = Uint32.unpack_fields(
+                unpacker, fields["bucket_list_level"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "is_curr_bucket" in fields:
+            _result["is_curr_bucket"] = Boolean.unpack_fields(
+                unpacker, fields["is_curr_bucket"]
+            )
+        else:
+            Boolean.skip(unpacker)
+        if "bucket_file_offset" in fields:
+            _result["bucket_file_offset"] = Uint64.unpack_fields(
+                unpacker, fields["bucket_file_offset"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> EvictionIterator:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> EvictionIterator:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -79,11 +146,11 @@ class EvictionIterator:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> EvictionIterator:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -103,6 +170,30 @@ class EvictionIterator:
             bucket_file_offset=bucket_file_offset,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"bucket_list_level": ')
+        self.bucket_list_level._write_json(write)
+        write(', "is_curr_bucket": ')
+        write(json_encode(Boolean.to_json_dict(self.is_curr_bucket)))
+        write(', "bucket_file_offset": ')
+        self.bucket_file_offset._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> EvictionIterator:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.bucket_list_level = self.bucket_list_level.clone()
+        result.is_curr_bucket = self.is_curr_bucket
+        result.bucket_file_offset = self.bucket_file_offset.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> EvictionIterator:
+        return self.clone()
+
+    def freeze(self) -> EvictionIterator:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
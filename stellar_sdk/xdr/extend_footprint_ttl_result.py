@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .extend_footprint_ttl_result_code import ExtendFootprintTTLResultCode
 
 __all__ = ["ExtendFootprintTTLResult"]
@@ -28,6 +38,8 @@ class ExtendFootprintTTLResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: ExtendFootprintTTLResultCode,
@@ -52,39 +64,106 @@ class ExtendFootprintTTLResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_SUCCESS:
+            return 4
+        if self.code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_MALFORMED:
+            return 4
+        if (
+            self.code
+            == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_RESOURCE_LIMIT_EXCEEDED
+        ):
+            return 4
+        if (
+            self.code
+            == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ExtendFootprintTTLResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ExtendFootprintTTLResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ExtendFootprintTTLResultCode.unpack(unpacker)
         if code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_SUCCESS:
-            return cls(code=code)
+            return
         if code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_MALFORMED:
-            return cls(code=code)
+            return
         if (
             code
             == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_RESOURCE_LIMIT_EXCEEDED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_INSUFFICIENT_REFUNDABLE_FEE
         ):
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ExtendFootprintTTLResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ExtendFootprintTTLResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_SUCCESS:
+            return _result
+        if code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_MALFORMED:
+            return _result
+        if (
+            code
+            == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_RESOURCE_LIMIT_EXCEEDED
+        ):
+            return _result
+        if (
+            code
+            == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ExtendFootprintTTLResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ExtendFootprintTTLResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -99,11 +178,11 @@ class ExtendFootprintTTLResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ExtendFootprintTTLResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_SUCCESS:
@@ -136,6 +215,40 @@ class ExtendFootprintTTLResult:
         code = ExtendFootprintTTLResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_SUCCESS:
+            write('"success"')
+            return
+        if self.code == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_MALFORMED:
+            write('"malformed"')
+            return
+        if (
+            self.code
+            == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_RESOURCE_LIMIT_EXCEEDED
+        ):
+            write('"resource_limit_exceeded"')
+            return
+        if (
+            self.code
+            == ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            write('"insufficient_refundable_fee"')
+            return
+        raise ValueError(f"Unknown code in ExtendFootprintTTLResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ExtendFootprintTTLResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ExtendFootprintTTLResult:
+        return self.clone()
+
+    def freeze(self) -> ExtendFootprintTTLResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -148,3 +261,17 @@ class ExtendFootprintTTLResult:
         out = []
         out.append(f"code={self.code}")
         return f"<ExtendFootprintTTLResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> ExtendFootprintTTLResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_SUCCESS: _unpack_void,
+    ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_MALFORMED: _unpack_void,
+    ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_RESOURCE_LIMIT_EXCEEDED: _unpack_void,
+    ExtendFootprintTTLResultCode.EXTEND_FOOTPRINT_TTL_INSUFFICIENT_REFUNDABLE_FEE: _unpack_void,
+}
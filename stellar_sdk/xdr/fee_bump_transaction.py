@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .fee_bump_transaction_ext import FeeBumpTransactionExt
 from .fee_bump_transaction_inner_tx import FeeBumpTransactionInnerTx
 from .int64 import Int64
@@ -39,6 +52,8 @@ class FeeBumpTransaction:
         };
     """
 
+    __slots__ = ("ext", "fee", "fee_source", "inner_tx")
+
     def __init__(
         self,
         fee_source: MuxedAccount,
@@ -57,6 +72,14 @@ class FeeBumpTransaction:
         self.inner_tx.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            8
+            + self.fee_source.xdr_size()
+            + self.inner_tx.xdr_size()
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -74,16 +97,87 @@ class FeeBumpTransaction:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        MuxedAccount.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        FeeBumpTransactionInnerTx.skip(unpacker, depth_limit - 1)
+        FeeBumpTransactionExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FeeBumpTransaction:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "fee_source" in fields:
+            _result["fee_source"] = MuxedAccount.unpack_fields(
+                unpacker, fields["fee_source"], depth_limit - 1
+            )
+        else:
+            MuxedAccount.skip(unpacker, depth_limit - 1)
+        if "fee" in fields:
+            _result["fee"] = Int64.unpack_fields(
+                unpacker, fields["fee"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "inner_tx" in fields:
+            _result["inner_tx"] = FeeBumpTransactionInnerTx.unpack_fields(
+                unpacker, fields["inner_tx"], depth_limit - 1
+            )
+        else:
+            FeeBumpTransactionInnerTx.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = FeeBumpTransactionExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            FeeBumpTransactionExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "fee_source", MuxedAccount.unpack(unpacker, depth_limit - 1)
+        yield "fee", Int64.unpack(unpacker, depth_limit - 1)
+        inner_tx = view_at(FeeBumpTransactionInnerTx, unpacker, depth_limit - 1)
+        yield "inner_tx", inner_tx
+        FeeBumpTransactionInnerTx.skip(unpacker, depth_limit - 1)
+        yield "ext", FeeBumpTransactionExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FeeBumpTransaction:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> FeeBumpTransaction:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -98,11 +192,11 @@ class FeeBumpTransaction:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FeeBumpTransaction:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -125,6 +219,33 @@ class FeeBumpTransaction:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"fee_source": ')
+        self.fee_source._write_json(write)
+        write(', "fee": ')
+        self.fee._write_json(write)
+        write(', "inner_tx": ')
+        self.inner_tx._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> FeeBumpTransaction:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.fee_source = self.fee_source.clone()
+        result.fee = self.fee.clone()
+        result.inner_tx = self.inner_tx.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FeeBumpTransaction:
+        return self.clone()
+
+    def freeze(self) -> FeeBumpTransaction:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
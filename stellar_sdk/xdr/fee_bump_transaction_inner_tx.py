@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .envelope_type import EnvelopeType
 from .transaction_v1_envelope import TransactionV1Envelope
 
@@ -25,6 +38,8 @@ class FeeBumpTransactionInnerTx:
             }
     """
 
+    __slots__ = ("type", "v1")
+
     def __init__(
         self,
         type: EnvelopeType,
@@ -42,16 +57,79 @@ class FeeBumpTransactionInnerTx:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
+            assert self.v1 is not None
+            return 4 + self.v1.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> FeeBumpTransactionInnerTx:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = EnvelopeType.unpack(unpacker)
         if type == EnvelopeType.ENVELOPE_TYPE_TX:
-            v1 = TransactionV1Envelope.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v1=v1)
+            TransactionV1Envelope.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FeeBumpTransactionInnerTx:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = EnvelopeType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == EnvelopeType.ENVELOPE_TYPE_TX:
+            if "v1" in fields:
+                _result["v1"] = TransactionV1Envelope.unpack_fields(
+                    unpacker, fields["v1"], depth_limit - 1
+                )
+            else:
+                TransactionV1Envelope.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        yield "type", type
+        if type == EnvelopeType.ENVELOPE_TYPE_TX:
+            yield "v1", view_at(TransactionV1Envelope, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -60,10 +138,12 @@ class FeeBumpTransactionInnerTx:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FeeBumpTransactionInnerTx:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> FeeBumpTransactionInnerTx:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +158,11 @@ class FeeBumpTransactionInnerTx:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FeeBumpTransactionInnerTx:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
@@ -103,6 +183,29 @@ class FeeBumpTransactionInnerTx:
             return cls(type=type, v1=v1)
         raise ValueError(f"Unknown key '{key}' for FeeBumpTransactionInnerTx")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
+            assert self.v1 is not None
+            write('{"tx": ')
+            self.v1._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in FeeBumpTransactionInnerTx: {self.type}")
+
+    def clone(self, deep: bool = True) -> FeeBumpTransactionInnerTx:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.v1 = self.v1.clone() if self.v1 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FeeBumpTransactionInnerTx:
+        return self.clone()
+
+    def freeze(self) -> FeeBumpTransactionInnerTx:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -122,3 +225,15 @@ class FeeBumpTransactionInnerTx:
         if self.v1 is not None:
             out.append(f"v1={self.v1}")
         return f"<FeeBumpTransactionInnerTx [{', '.join(out)}]>"
+
+
+def _unpack_v1(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> FeeBumpTransactionInnerTx:
+    v1 = TransactionV1Envelope.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v1=v1)
+
+
+_UNPACK_ARMS = {
+    EnvelopeType.ENVELOPE_TYPE_TX: _unpack_v1,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .tx_advert_vector import TxAdvertVector
 
 __all__ = ["FloodAdvert"]
@@ -23,6 +36,8 @@ class FloodAdvert:
         };
     """
 
+    __slots__ = ("tx_hashes",)
+
     def __init__(
         self,
         tx_hashes: TxAdvertVector,
@@ -32,6 +47,9 @@ class FloodAdvert:
     def pack(self, packer: Packer) -> None:
         self.tx_hashes.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.tx_hashes.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -43,16 +61,59 @@ class FloodAdvert:
             tx_hashes=tx_hashes,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        TxAdvertVector.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FloodAdvert:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_hashes" in fields:
+            _result["tx_hashes"] = TxAdvertVector.unpack_fields(
+                unpacker, fields["tx_hashes"], depth_limit - 1
+            )
+        else:
+            TxAdvertVector.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "tx_hashes", view_at(TxAdvertVector, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FloodAdvert:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> FloodAdvert:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +128,11 @@ class FloodAdvert:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FloodAdvert:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +146,24 @@ class FloodAdvert:
             tx_hashes=tx_hashes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx_hashes": ')
+        self.tx_hashes._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> FloodAdvert:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_hashes = self.tx_hashes.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FloodAdvert:
+        return self.clone()
+
+    def freeze(self) -> FloodAdvert:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.tx_hashes,))
 
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 
 __all__ = ["FreezeBypassTxs"]
@@ -22,6 +35,8 @@ class FreezeBypassTxs:
         };
     """
 
+    __slots__ = ("tx_hashes",)
+
     def __init__(
         self,
         tx_hashes: list[Hash],
@@ -38,6 +53,9 @@ class FreezeBypassTxs:
         for tx_hashes_item in self.tx_hashes:
             tx_hashes_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 32 * len(self.tx_hashes)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +75,90 @@ class FreezeBypassTxs:
             tx_hashes=tx_hashes,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_hashes length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FreezeBypassTxs:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_hashes" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_hashes length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["tx_hashes"] = []
+            for _ in range(length):
+                _result["tx_hashes"].append(
+                    Hash.unpack_fields(unpacker, fields["tx_hashes"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_hashes length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_hashes length {length} exceeds remaining input length {_remaining}"
+            )
+        tx_hashes = []
+        for _ in range(length):
+            tx_hashes.append(Hash.unpack(unpacker, depth_limit - 1))
+        yield "tx_hashes", tx_hashes
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FreezeBypassTxs:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> FreezeBypassTxs:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +173,11 @@ class FreezeBypassTxs:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FreezeBypassTxs:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -99,6 +191,24 @@ class FreezeBypassTxs:
             tx_hashes=tx_hashes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx_hashes": ')
+        write_json_array(write, self.tx_hashes)
+        write("}")
+
+    def clone(self, deep: bool = True) -> FreezeBypassTxs:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_hashes = [item.clone() for item in self.tx_hashes]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FreezeBypassTxs:
+        return self.clone()
+
+    def freeze(self) -> FreezeBypassTxs:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.tx_hashes,))
 
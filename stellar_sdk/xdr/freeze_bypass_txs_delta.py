@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 
 __all__ = ["FreezeBypassTxsDelta"]
@@ -23,6 +36,8 @@ class FreezeBypassTxsDelta:
         };
     """
 
+    __slots__ = ("add_txs", "remove_txs")
+
     def __init__(
         self,
         add_txs: list[Hash],
@@ -49,6 +64,9 @@ class FreezeBypassTxsDelta:
         for remove_txs_item in self.remove_txs:
             remove_txs_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 32 * len(self.add_txs) + 4 + 32 * len(self.remove_txs)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -78,16 +96,131 @@ class FreezeBypassTxsDelta:
             remove_txs=remove_txs,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"add_txs length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"remove_txs length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FreezeBypassTxsDelta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "add_txs" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"add_txs length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["add_txs"] = []
+            for _ in range(length):
+                _result["add_txs"].append(
+                    Hash.unpack_fields(unpacker, fields["add_txs"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"add_txs length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        if "remove_txs" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"remove_txs length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["remove_txs"] = []
+            for _ in range(length):
+                _result["remove_txs"].append(
+                    Hash.unpack_fields(unpacker, fields["remove_txs"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"remove_txs length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"add_txs length {length} exceeds remaining input length {_remaining}"
+            )
+        add_txs = []
+        for _ in range(length):
+            add_txs.append(Hash.unpack(unpacker, depth_limit - 1))
+        yield "add_txs", add_txs
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"remove_txs length {length} exceeds remaining input length {_remaining}"
+            )
+        remove_txs = []
+        for _ in range(length):
+            remove_txs.append(Hash.unpack(unpacker, depth_limit - 1))
+        yield "remove_txs", remove_txs
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FreezeBypassTxsDelta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> FreezeBypassTxsDelta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -102,11 +235,11 @@ class FreezeBypassTxsDelta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FreezeBypassTxsDelta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -123,6 +256,27 @@ class FreezeBypassTxsDelta:
             remove_txs=remove_txs,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"add_txs": ')
+        write_json_array(write, self.add_txs)
+        write(', "remove_txs": ')
+        write_json_array(write, self.remove_txs)
+        write("}")
+
+    def clone(self, deep: bool = True) -> FreezeBypassTxsDelta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.add_txs = [item.clone() for item in self.add_txs]
+        result.remove_txs = [item.clone() for item in self.remove_txs]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FreezeBypassTxsDelta:
+        return self.clone()
+
+    def freeze(self) -> FreezeBypassTxsDelta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .encoded_ledger_key import EncodedLedgerKey
 
 __all__ = ["FrozenLedgerKeys"]
@@ -22,6 +35,8 @@ class FrozenLedgerKeys:
         };
     """
 
+    __slots__ = ("keys",)
+
     def __init__(
         self,
         keys: list[EncodedLedgerKey],
@@ -38,6 +53,9 @@ class FrozenLedgerKeys:
         for keys_item in self.keys:
             keys_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.keys)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +75,94 @@ class FrozenLedgerKeys:
             keys=keys,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"keys length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            EncodedLedgerKey.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FrozenLedgerKeys:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "keys" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"keys length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["keys"] = []
+            for _ in range(length):
+                _result["keys"].append(
+                    EncodedLedgerKey.unpack_fields(
+                        unpacker, fields["keys"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"keys length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                EncodedLedgerKey.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"keys length {length} exceeds remaining input length {_remaining}"
+            )
+        keys = []
+        for _ in range(length):
+            keys.append(EncodedLedgerKey.unpack(unpacker, depth_limit - 1))
+        yield "keys", keys
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FrozenLedgerKeys:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> FrozenLedgerKeys:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +177,11 @@ class FrozenLedgerKeys:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FrozenLedgerKeys:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -99,6 +195,24 @@ class FrozenLedgerKeys:
             keys=keys,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"keys": ')
+        write_json_array(write, self.keys)
+        write("}")
+
+    def clone(self, deep: bool = True) -> FrozenLedgerKeys:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.keys = [item.clone() for item in self.keys]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FrozenLedgerKeys:
+        return self.clone()
+
+    def freeze(self) -> FrozenLedgerKeys:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.keys,))
 
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .encoded_ledger_key import EncodedLedgerKey
 
 __all__ = ["FrozenLedgerKeysDelta"]
@@ -23,6 +36,8 @@ class FrozenLedgerKeysDelta:
         };
     """
 
+    __slots__ = ("keys_to_freeze", "keys_to_unfreeze")
+
     def __init__(
         self,
         keys_to_freeze: list[EncodedLedgerKey],
@@ -49,6 +64,14 @@ class FrozenLedgerKeysDelta:
         for keys_to_unfreeze_item in self.keys_to_unfreeze:
             keys_to_unfreeze_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + sum(item.xdr_size() for item in self.keys_to_freeze)
+            + 4
+            + sum(item.xdr_size() for item in self.keys_to_unfreeze)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -78,16 +101,135 @@ class FrozenLedgerKeysDelta:
             keys_to_unfreeze=keys_to_unfreeze,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"keys_to_freeze length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            EncodedLedgerKey.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"keys_to_unfreeze length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            EncodedLedgerKey.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | FrozenLedgerKeysDelta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "keys_to_freeze" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"keys_to_freeze length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["keys_to_freeze"] = []
+            for _ in range(length):
+                _result["keys_to_freeze"].append(
+                    EncodedLedgerKey.unpack_fields(
+                        unpacker, fields["keys_to_freeze"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"keys_to_freeze length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                EncodedLedgerKey.skip(unpacker, depth_limit - 1)
+        if "keys_to_unfreeze" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"keys_to_unfreeze length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["keys_to_unfreeze"] = []
+            for _ in range(length):
+                _result["keys_to_unfreeze"].append(
+                    EncodedLedgerKey.unpack_fields(
+                        unpacker, fields["keys_to_unfreeze"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"keys_to_unfreeze length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                EncodedLedgerKey.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"keys_to_freeze length {length} exceeds remaining input length {_remaining}"
+            )
+        keys_to_freeze = []
+        for _ in range(length):
+            keys_to_freeze.append(EncodedLedgerKey.unpack(unpacker, depth_limit - 1))
+        yield "keys_to_freeze", keys_to_freeze
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"keys_to_unfreeze length {length} exceeds remaining input length {_remaining}"
+            )
+        keys_to_unfreeze = []
+        for _ in range(length):
+            keys_to_unfreeze.append(EncodedLedgerKey.unpack(unpacker, depth_limit - 1))
+        yield "keys_to_unfreeze", keys_to_unfreeze
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> FrozenLedgerKeysDelta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> FrozenLedgerKeysDelta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -102,11 +244,11 @@ class FrozenLedgerKeysDelta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> FrozenLedgerKeysDelta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -129,6 +271,27 @@ class FrozenLedgerKeysDelta:
             keys_to_unfreeze=keys_to_unfreeze,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"keys_to_freeze": ')
+        write_json_array(write, self.keys_to_freeze)
+        write(', "keys_to_unfreeze": ')
+        write_json_array(write, self.keys_to_unfreeze)
+        write("}")
+
+    def clone(self, deep: bool = True) -> FrozenLedgerKeysDelta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.keys_to_freeze = [item.clone() for item in self.keys_to_freeze]
+        result.keys_to_unfreeze = [item.clone() for item in self.keys_to_unfreeze]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> FrozenLedgerKeysDelta:
+        return self.clone()
+
+    def freeze(self) -> FrozenLedgerKeysDelta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
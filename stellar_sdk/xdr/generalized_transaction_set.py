@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .transaction_set_v1 import TransactionSetV1
 
 __all__ = ["GeneralizedTransactionSet"]
@@ -25,6 +39,8 @@ class GeneralizedTransactionSet:
         };
     """
 
+    __slots__ = ("v", "v1_tx_set")
+
     def __init__(
         self,
         v: int,
@@ -42,16 +58,79 @@ class GeneralizedTransactionSet:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 1:
+            assert self.v1_tx_set is not None
+            return 4 + self.v1_tx_set.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> GeneralizedTransactionSet:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
         if v == 1:
-            v1_tx_set = TransactionSetV1.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v1_tx_set=v1_tx_set)
+            TransactionSetV1.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | GeneralizedTransactionSet:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 1:
+            if "v1_tx_set" in fields:
+                _result["v1_tx_set"] = TransactionSetV1.unpack_fields(
+                    unpacker, fields["v1_tx_set"], depth_limit - 1
+                )
+            else:
+                TransactionSetV1.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        yield "v", v
+        if v == 1:
+            yield "v1_tx_set", view_at(TransactionSetV1, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -60,10 +139,12 @@ class GeneralizedTransactionSet:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> GeneralizedTransactionSet:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> GeneralizedTransactionSet:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +159,11 @@ class GeneralizedTransactionSet:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> GeneralizedTransactionSet:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 1:
@@ -103,6 +184,31 @@ class GeneralizedTransactionSet:
             return cls(v=v, v1_tx_set=v1_tx_set)
         raise ValueError(f"Unknown key '{key}' for GeneralizedTransactionSet")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 1:
+            assert self.v1_tx_set is not None
+            write('{"v1": ')
+            self.v1_tx_set._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in GeneralizedTransactionSet: {self.v}")
+
+    def clone(self, deep: bool = True) -> GeneralizedTransactionSet:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.v1_tx_set = (
+            self.v1_tx_set.clone() if self.v1_tx_set is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> GeneralizedTransactionSet:
+        return self.clone()
+
+    def freeze(self) -> GeneralizedTransactionSet:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -122,3 +228,15 @@ class GeneralizedTransactionSet:
         if self.v1_tx_set is not None:
             out.append(f"v1_tx_set={self.v1_tx_set}")
         return f"<GeneralizedTransactionSet [{', '.join(out)}]>"
+
+
+def _unpack_v1_tx_set(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> GeneralizedTransactionSet:
+    v1_tx_set = TransactionSetV1.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v1_tx_set=v1_tx_set)
+
+
+_UNPACK_ARMS = {
+    1: _unpack_v1_tx_set,
+}
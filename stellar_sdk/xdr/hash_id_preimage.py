@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .envelope_type import EnvelopeType
 from .hash_id_preimage_contract_id import HashIDPreimageContractID
 from .hash_id_preimage_operation_id import HashIDPreimageOperationID
@@ -68,6 +81,15 @@ class HashIDPreimage:
         };
     """
 
+    __slots__ = (
+        "contract_id",
+        "operation_id",
+        "revoke_id",
+        "soroban_authorization",
+        "soroban_authorization_with_address",
+        "type",
+    )
+
     def __init__(
         self,
         type: EnvelopeType,
@@ -116,37 +138,173 @@ class HashIDPreimage:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_OP_ID:
+            assert self.operation_id is not None
+            return 4 + self.operation_id.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_POOL_REVOKE_OP_ID:
+            assert self.revoke_id is not None
+            return 4 + self.revoke_id.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_CONTRACT_ID:
+            assert self.contract_id is not None
+            return 4 + self.contract_id.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION:
+            assert self.soroban_authorization is not None
+            return 4 + self.soroban_authorization.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION_WITH_ADDRESS:
+            assert self.soroban_authorization_with_address is not None
+            return 4 + self.soroban_authorization_with_address.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> HashIDPreimage:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = EnvelopeType.unpack(unpacker)
         if type == EnvelopeType.ENVELOPE_TYPE_OP_ID:
-            operation_id = HashIDPreimageOperationID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, operation_id=operation_id)
+            HashIDPreimageOperationID.skip(unpacker, depth_limit - 1)
+            return
         if type == EnvelopeType.ENVELOPE_TYPE_POOL_REVOKE_OP_ID:
-            revoke_id = HashIDPreimageRevokeID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, revoke_id=revoke_id)
+            HashIDPreimageRevokeID.skip(unpacker, depth_limit - 1)
+            return
         if type == EnvelopeType.ENVELOPE_TYPE_CONTRACT_ID:
-            contract_id = HashIDPreimageContractID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, contract_id=contract_id)
+            HashIDPreimageContractID.skip(unpacker, depth_limit - 1)
+            return
         if type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION:
-            soroban_authorization = HashIDPreimageSorobanAuthorization.unpack(
+            HashIDPreimageSorobanAuthorization.skip(unpacker, depth_limit - 1)
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION_WITH_ADDRESS:
+            HashIDPreimageSorobanAuthorizationWithAddress.skip(
                 unpacker, depth_limit - 1
             )
-            return cls(type=type, soroban_authorization=soroban_authorization)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HashIDPreimage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = EnvelopeType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == EnvelopeType.ENVELOPE_TYPE_OP_ID:
+            if "operation_id" in fields:
+                _result["operation_id"] = HashIDPreimageOperationID.unpack_fields(
+                    unpacker, fields["operation_id"], depth_limit - 1
+                )
+            else:
+                HashIDPreimageOperationID.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == EnvelopeType.ENVELOPE_TYPE_POOL_REVOKE_OP_ID:
+            if "revoke_id" in fields:
+                _result["revoke_id"] = HashIDPreimageRevokeID.unpack_fields(
+                    unpacker, fields["revoke_id"], depth_limit - 1
+                )
+            else:
+                HashIDPreimageRevokeID.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == EnvelopeType.ENVELOPE_TYPE_CONTRACT_ID:
+            if "contract_id" in fields:
+                _result["contract_id"] = HashIDPreimageContractID.unpack_fields(
+                    unpacker, fields["contract_id"], depth_limit - 1
+                )
+            else:
+                HashIDPreimageContractID.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION:
+            if "soroban_authorization" in fields:
+                _result["soroban_authorization"] = (
+                    HashIDPreimageSorobanAuthorization.unpack_fields(
+                        unpacker, fields["soroban_authorization"], depth_limit - 1
+                    )
+                )
+            else:
+                HashIDPreimageSorobanAuthorization.skip(unpacker, depth_limit - 1)
+            return _result
         if type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION_WITH_ADDRESS:
-            soroban_authorization_with_address = (
-                HashIDPreimageSorobanAuthorizationWithAddress.unpack(
+            if "soroban_authorization_with_address" in fields:
+                _result["soroban_authorization_with_address"] = (
+                    HashIDPreimageSorobanAuthorizationWithAddress.unpack_fields(
+                        unpacker,
+                        fields["soroban_authorization_with_address"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                HashIDPreimageSorobanAuthorizationWithAddress.skip(
                     unpacker, depth_limit - 1
                 )
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        yield "type", type
+        if type == EnvelopeType.ENVELOPE_TYPE_OP_ID:
+            yield (
+                "operation_id",
+                HashIDPreimageOperationID.unpack(unpacker, depth_limit - 1),
             )
-            return cls(
-                type=type,
-                soroban_authorization_with_address=soroban_authorization_with_address,
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_POOL_REVOKE_OP_ID:
+            yield "revoke_id", HashIDPreimageRevokeID.unpack(unpacker, depth_limit - 1)
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_CONTRACT_ID:
+            yield (
+                "contract_id",
+                HashIDPreimageContractID.unpack(unpacker, depth_limit - 1),
             )
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION:
+            yield (
+                "soroban_authorization",
+                view_at(HashIDPreimageSorobanAuthorization, unpacker, depth_limit - 1),
+            )
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION_WITH_ADDRESS:
+            yield (
+                "soroban_authorization_with_address",
+                view_at(
+                    HashIDPreimageSorobanAuthorizationWithAddress,
+                    unpacker,
+                    depth_limit - 1,
+                ),
+            )
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -155,10 +313,10 @@ class HashIDPreimage:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HashIDPreimage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> HashIDPreimage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -173,11 +331,11 @@ class HashIDPreimage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HashIDPreimage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == EnvelopeType.ENVELOPE_TYPE_OP_ID:
@@ -237,6 +395,71 @@ class HashIDPreimage:
             )
         raise ValueError(f"Unknown key '{key}' for HashIDPreimage")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_OP_ID:
+            assert self.operation_id is not None
+            write('{"op_id": ')
+            self.operation_id._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_POOL_REVOKE_OP_ID:
+            assert self.revoke_id is not None
+            write('{"pool_revoke_op_id": ')
+            self.revoke_id._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_CONTRACT_ID:
+            assert self.contract_id is not None
+            write('{"contract_id": ')
+            self.contract_id._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION:
+            assert self.soroban_authorization is not None
+            write('{"soroban_authorization": ')
+            self.soroban_authorization._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION_WITH_ADDRESS:
+            assert self.soroban_authorization_with_address is not None
+            write('{"soroban_authorization_with_address": ')
+            self.soroban_authorization_with_address._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in HashIDPreimage: {self.type}")
+
+    def clone(self, deep: bool = True) -> HashIDPreimage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.operation_id = (
+            self.operation_id.clone() if self.operation_id is not None else None
+        )
+        result.revoke_id = (
+            self.revoke_id.clone() if self.revoke_id is not None else None
+        )
+        result.contract_id = (
+            self.contract_id.clone() if self.contract_id is not None else None
+        )
+        result.soroban_authorization = (
+            self.soroban_authorization.clone()
+            if self.soroban_authorization is not None
+            else None
+        )
+        result.soroban_authorization_with_address = (
+            self.soroban_authorization_with_address.clone()
+            if self.soroban_authorization_with_address is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HashIDPreimage:
+        return self.clone()
+
+    def freeze(self) -> HashIDPreimage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -278,3 +501,54 @@ class HashIDPreimage:
                 f"soroban_authorization_with_address={self.soroban_authorization_with_address}"
             )
         return f"<HashIDPreimage [{', '.join(out)}]>"
+
+
+def _unpack_operation_id(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HashIDPreimage:
+    operation_id = HashIDPreimageOperationID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, operation_id=operation_id)
+
+
+def _unpack_revoke_id(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HashIDPreimage:
+    revoke_id = HashIDPreimageRevokeID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, revoke_id=revoke_id)
+
+
+def _unpack_contract_id(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HashIDPreimage:
+    contract_id = HashIDPreimageContractID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, contract_id=contract_id)
+
+
+def _unpack_soroban_authorization(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HashIDPreimage:
+    soroban_authorization = HashIDPreimageSorobanAuthorization.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, soroban_authorization=soroban_authorization)
+
+
+def _unpack_soroban_authorization_with_address(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HashIDPreimage:
+    soroban_authorization_with_address = (
+        HashIDPreimageSorobanAuthorizationWithAddress.unpack(unpacker, depth_limit - 1)
+    )
+    return cls(
+        type=type,
+        soroban_authorization_with_address=soroban_authorization_with_address,
+    )
+
+
+_UNPACK_ARMS = {
+    EnvelopeType.ENVELOPE_TYPE_OP_ID: _unpack_operation_id,
+    EnvelopeType.ENVELOPE_TYPE_POOL_REVOKE_OP_ID: _unpack_revoke_id,
+    EnvelopeType.ENVELOPE_TYPE_CONTRACT_ID: _unpack_contract_id,
+    EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION: _unpack_soroban_authorization,
+    EnvelopeType.ENVELOPE_TYPE_SOROBAN_AUTHORIZATION_WITH_ADDRESS: _unpack_soroban_authorization_with_address,
+}
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .contract_id_preimage import ContractIDPreimage
 from .hash import Hash
 
@@ -25,6 +35,8 @@ class HashIDPreimageContractID:
             }
     """
 
+    __slots__ = ("contract_id_preimage", "network_id")
+
     def __init__(
         self,
         network_id: Hash,
@@ -37,6 +49,9 @@ class HashIDPreimageContractID:
         self.network_id.pack(packer)
         self.contract_id_preimage.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + self.contract_id_preimage.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class HashIDPreimageContractID:
             contract_id_preimage=contract_id_preimage,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        ContractIDPreimage.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HashIDPreimageContractID:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "network_id" in fields:
+            _result["network_id"] = Hash.unpack_fields(
+                unpacker, fields["network_id"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "contract_id_preimage" in fields:
+            _result["contract_id_preimage"] = ContractIDPreimage.unpack_fields(
+                unpacker, fields["contract_id_preimage"], depth_limit - 1
+            )
+        else:
+            ContractIDPreimage.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HashIDPreimageContractID:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> HashIDPreimageContractID:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class HashIDPreimageContractID:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HashIDPreimageContractID:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -97,6 +154,27 @@ class HashIDPreimageContractID:
             contract_id_preimage=contract_id_preimage,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"network_id": ')
+        self.network_id._write_json(write)
+        write(', "contract_id_preimage": ')
+        self.contract_id_preimage._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> HashIDPreimageContractID:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.network_id = self.network_id.clone()
+        result.contract_id_preimage = self.contract_id_preimage.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HashIDPreimageContractID:
+        return self.clone()
+
+    def freeze(self) -> HashIDPreimageContractID:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .sequence_number import SequenceNumber
 from .uint32 import Uint32
 
@@ -27,6 +37,8 @@ class HashIDPreimageOperationID:
             }
     """
 
+    __slots__ = ("op_num", "seq_num", "source_account")
+
     def __init__(
         self,
         source_account: AccountID,
@@ -42,6 +54,9 @@ class HashIDPreimageOperationID:
         self.seq_num.pack(packer)
         self.op_num.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 12 + self.source_account.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +72,65 @@ class HashIDPreimageOperationID:
             op_num=op_num,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        SequenceNumber.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HashIDPreimageOperationID:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "source_account" in fields:
+            _result["source_account"] = AccountID.unpack_fields(
+                unpacker, fields["source_account"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "seq_num" in fields:
+            _result["seq_num"] = SequenceNumber.unpack_fields(
+                unpacker, fields["seq_num"], depth_limit - 1
+            )
+        else:
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        if "op_num" in fields:
+            _result["op_num"] = Uint32.unpack_fields(
+                unpacker, fields["op_num"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HashIDPreimageOperationID:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> HashIDPreimageOperationID:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +145,11 @@ class HashIDPreimageOperationID:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HashIDPreimageOperationID:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +169,30 @@ class HashIDPreimageOperationID:
             op_num=op_num,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"source_account": ')
+        self.source_account._write_json(write)
+        write(', "seq_num": ')
+        self.seq_num._write_json(write)
+        write(', "op_num": ')
+        self.op_num._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> HashIDPreimageOperationID:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.source_account = self.source_account.clone()
+        result.seq_num = self.seq_num.clone()
+        result.op_num = self.op_num.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HashIDPreimageOperationID:
+        return self.clone()
+
+    def freeze(self) -> HashIDPreimageOperationID:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .pool_id import PoolID
 from .sequence_number import SequenceNumber
 from .uint32 import Uint32
@@ -31,6 +41,8 @@ class HashIDPreimageRevokeID:
             }
     """
 
+    __slots__ = ("asset", "liquidity_pool_id", "op_num", "seq_num", "source_account")
+
     def __init__(
         self,
         source_account: AccountID,
@@ -52,6 +64,9 @@ class HashIDPreimageRevokeID:
         self.liquidity_pool_id.pack(packer)
         self.asset.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 44 + self.source_account.xdr_size() + self.asset.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,16 +86,79 @@ class HashIDPreimageRevokeID:
             asset=asset,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        SequenceNumber.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        PoolID.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HashIDPreimageRevokeID:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "source_account" in fields:
+            _result["source_account"] = AccountID.unpack_fields(
+                unpacker, fields["source_account"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "seq_num" in fields:
+            _result["seq_num"] = SequenceNumber.unpack_fields(
+                unpacker, fields["seq_num"], depth_limit - 1
+            )
+        else:
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        if "op_num" in fields:
+            _result["op_num"] = Uint32.unpack_fields(
+                unpacker, fields["op_num"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "liquidity_pool_id" in fields:
+            _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                unpacker, fields["liquidity_pool_id"], depth_limit - 1
+            )
+        else:
+            PoolID.skip(unpacker, depth_limit - 1)
+        if "asset" in fields:
+            _result["asset"] = Asset.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HashIDPreimageRevokeID:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> HashIDPreimageRevokeID:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +173,11 @@ class HashIDPreimageRevokeID:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HashIDPreimageRevokeID:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -125,6 +203,36 @@ class HashIDPreimageRevokeID:
             asset=asset,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"source_account": ')
+        self.source_account._write_json(write)
+        write(', "seq_num": ')
+        self.seq_num._write_json(write)
+        write(', "op_num": ')
+        self.op_num._write_json(write)
+        write(', "liquidity_pool_id": ')
+        self.liquidity_pool_id._write_json(write)
+        write(', "asset": ')
+        self.asset._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> HashIDPreimageRevokeID:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.source_account = self.source_account.clone()
+        result.seq_num = self.seq_num.clone()
+        result.op_num = self.op_num.clone()
+        result.liquidity_pool_id = self.liquidity_pool_id.clone()
+        result.asset = self.asset.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HashIDPreimageRevokeID:
+        return self.clone()
+
+    def freeze(self) -> HashIDPreimageRevokeID:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
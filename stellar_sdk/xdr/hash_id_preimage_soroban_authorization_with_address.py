@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .hash import Hash
 from .int64 import Int64
 from .sc_address import SCAddress
@@ -31,6 +44,14 @@ class HashIDPreimageSorobanAuthorizationWithAddress:
             }
     """
 
+    __slots__ = (
+        "address",
+        "invocation",
+        "network_id",
+        "nonce",
+        "signature_expiration_ledger",
+    )
+
     def __init__(
         self,
         network_id: Hash,
@@ -52,6 +73,9 @@ class HashIDPreimageSorobanAuthorizationWithAddress:
         self.address.pack(packer)
         self.invocation.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 44 + self.address.xdr_size() + self.invocation.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,6 +95,84 @@ class HashIDPreimageSorobanAuthorizationWithAddress:
             invocation=invocation,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        SCAddress.skip(unpacker, depth_limit - 1)
+        SorobanAuthorizedInvocation.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HashIDPreimageSorobanAuthorizationWithAddress:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "network_id" in fields:
+            _result["network_id"] = Hash.unpack_fields(
+                unpacker, fields["network_id"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "nonce" in fields:
+            _result["nonce"] = Int64.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "signature_expiration_ledger" in fields:
+            _result["signature_expiration_ledger"] = Uint32.unpack_fields(
+                unpacker, fields["signature_expiration_ledger"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "address" in fields:
+            _result["address"] = SCAddress.unpack_fields(
+                unpacker, fields["address"], depth_limit - 1
+            )
+        else:
+            SCAddress.skip(unpacker, depth_limit - 1)
+        if "invocation" in fields:
+            _result["invocation"] = SorobanAuthorizedInvocation.unpack_fields(
+                unpacker, fields["invocation"], depth_limit - 1
+            )
+        else:
+            SorobanAuthorizedInvocation.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "network_id", Hash.unpack(unpacker, depth_limit - 1)
+        yield "nonce", Int64.unpack(unpacker, depth_limit - 1)
+        yield "signature_expiration_ledger", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "address", SCAddress.unpack(unpacker, depth_limit - 1)
+        yield (
+            "invocation",
+            view_at(SorobanAuthorizedInvocation, unpacker, depth_limit - 1),
+        )
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
@@ -78,11 +180,11 @@ class HashIDPreimageSorobanAuthorizationWithAddress:
 
     @classmethod
     def from_xdr_bytes(
-        cls, xdr: bytes
+        cls, xdr: XdrBuffer, zero_copy: bool = False
     ) -> HashIDPreimageSorobanAuthorizationWithAddress:
-        unpacker = Unpacker(xdr)
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +199,11 @@ class HashIDPreimageSorobanAuthorizationWithAddress:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HashIDPreimageSorobanAuthorizationWithAddress:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -131,6 +233,36 @@ class HashIDPreimageSorobanAuthorizationWithAddress:
             invocation=invocation,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"network_id": ')
+        self.network_id._write_json(write)
+        write(', "nonce": ')
+        self.nonce._write_json(write)
+        write(', "signature_expiration_ledger": ')
+        self.signature_expiration_ledger._write_json(write)
+        write(', "address": ')
+        self.address._write_json(write)
+        write(', "invocation": ')
+        self.invocation._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> HashIDPreimageSorobanAuthorizationWithAddress:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.network_id = self.network_id.clone()
+        result.nonce = self.nonce.clone()
+        result.signature_expiration_ledger = self.signature_expiration_ledger.clone()
+        result.address = self.address.clone()
+        result.invocation = self.invocation.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HashIDPreimageSorobanAuthorizationWithAddress:
+        return self.clone()
+
+    def freeze(self) -> HashIDPreimageSorobanAuthorizationWithAddress:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .auth_cert import AuthCert
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .node_id import NodeID
 from .uint32 import Uint32
@@ -35,6 +48,18 @@ class Hello:
         };
     """
 
+    __slots__ = (
+        "cert",
+        "ledger_version",
+        "listening_port",
+        "network_id",
+        "nonce",
+        "overlay_min_version",
+        "overlay_version",
+        "peer_id",
+        "version_str",
+    )
+
     def __init__(
         self,
         ledger_version: Uint32,
@@ -73,6 +98,15 @@ class Hello:
         self.cert.pack(packer)
         self.nonce.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            80
+            + 4
+            + (len(self.version_str) + 3) // 4 * 4
+            + self.peer_id.xdr_size()
+            + self.cert.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -100,16 +134,105 @@ class Hello:
             nonce=nonce,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+        String.skip(unpacker, 100)
+        Integer.skip(unpacker)
+        NodeID.skip(unpacker, depth_limit - 1)
+        AuthCert.skip(unpacker, depth_limit - 1)
+        Uint256.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Hello:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_version" in fields:
+            _result["ledger_version"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_version"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "overlay_version" in fields:
+            _result["overlay_version"] = Uint32.unpack_fields(
+                unpacker, fields["overlay_version"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "overlay_min_version" in fields:
+            _result["overlay_min_version"] = Uint32.unpack_fields(
+                unpacker, fields["overlay_min_version"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "network_id" in fields:
+            _result["network_id"] = Hash.unpack_fields(
+                unpacker, fields["network_id"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "version_str" in fields:
+            _result["version_str"] = String.unpack_fields(
+                unpacker, fields["version_str"], 100
+            )
+        else:
+            String.skip(unpacker, 100)
+        if "listening_port" in fields:
+            _result["listening_port"] = Integer.unpack_fields(
+                unpacker, fields["listening_port"]
+            )
+        else:
+            Integer.skip(unpacker)
+        if "peer_id" in fields:
+            _result["peer_id"] = NodeID.unpack_fields(
+                unpacker, fields["peer_id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "cert" in fields:
+            _result["cert"] = AuthCert.unpack_fields(
+                unpacker, fields["cert"], depth_limit - 1
+            )
+        else:
+            AuthCert.skip(unpacker, depth_limit - 1)
+        if "nonce" in fields:
+            _result["nonce"] = Uint256.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Uint256.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Hello:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Hello:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -124,11 +247,11 @@ class Hello:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Hello:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -166,6 +289,48 @@ class Hello:
             nonce=nonce,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_version": ')
+        self.ledger_version._write_json(write)
+        write(', "overlay_version": ')
+        self.overlay_version._write_json(write)
+        write(', "overlay_min_version": ')
+        self.overlay_min_version._write_json(write)
+        write(', "network_id": ')
+        self.network_id._write_json(write)
+        write(', "version_str": ')
+        write(json_encode(String.to_json_dict(self.version_str)))
+        write(', "listening_port": ')
+        write(json_encode(Integer.to_json_dict(self.listening_port)))
+        write(', "peer_id": ')
+        self.peer_id._write_json(write)
+        write(', "cert": ')
+        self.cert._write_json(write)
+        write(', "nonce": ')
+        self.nonce._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> Hello:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_version = self.ledger_version.clone()
+        result.overlay_version = self.overlay_version.clone()
+        result.overlay_min_version = self.overlay_min_version.clone()
+        result.network_id = self.network_id.clone()
+        result.version_str = self.version_str
+        result.listening_port = self.listening_port
+        result.peer_id = self.peer_id.clone()
+        result.cert = self.cert.clone()
+        result.nonce = self.nonce.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Hello:
+        return self.clone()
+
+    def freeze(self) -> Hello:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
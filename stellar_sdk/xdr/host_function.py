@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .create_contract_args import CreateContractArgs
 from .create_contract_args_v2 import CreateContractArgsV2
 from .host_function_type import HostFunctionType
@@ -33,6 +48,14 @@ class HostFunction:
         };
     """
 
+    __slots__ = (
+        "create_contract",
+        "create_contract_v2",
+        "invoke_contract",
+        "type",
+        "wasm",
+    )
+
     def __init__(
         self,
         type: HostFunctionType,
@@ -76,25 +99,139 @@ class HostFunction:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT:
+            assert self.invoke_contract is not None
+            return 4 + self.invoke_contract.xdr_size()
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT:
+            assert self.create_contract is not None
+            return 4 + self.create_contract.xdr_size()
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_UPLOAD_CONTRACT_WASM:
+            assert self.wasm is not None
+            return 4 + 4 + (len(self.wasm) + 3) // 4 * 4
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT_V2:
+            assert self.create_contract_v2 is not None
+            return 4 + self.create_contract_v2.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> HostFunction:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = HostFunctionType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = HostFunctionType.unpack(unpacker)
         if type == HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT:
-            invoke_contract = InvokeContractArgs.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, invoke_contract=invoke_contract)
+            InvokeContractArgs.skip(unpacker, depth_limit - 1)
+            return
         if type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT:
-            create_contract = CreateContractArgs.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, create_contract=create_contract)
+            CreateContractArgs.skip(unpacker, depth_limit - 1)
+            return
         if type == HostFunctionType.HOST_FUNCTION_TYPE_UPLOAD_CONTRACT_WASM:
-            wasm = Opaque.unpack(unpacker, 4294967295, False)
-            return cls(type=type, wasm=wasm)
+            Opaque.skip(unpacker, 4294967295, False)
+            return
         if type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT_V2:
-            create_contract_v2 = CreateContractArgsV2.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, create_contract_v2=create_contract_v2)
+            CreateContractArgsV2.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HostFunction:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = HostFunctionType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT:
+            if "invoke_contract" in fields:
+                _result["invoke_contract"] = InvokeContractArgs.unpack_fields(
+                    unpacker, fields["invoke_contract"], depth_limit - 1
+                )
+            else:
+                InvokeContractArgs.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT:
+            if "create_contract" in fields:
+                _result["create_contract"] = CreateContractArgs.unpack_fields(
+                    unpacker, fields["create_contract"], depth_limit - 1
+                )
+            else:
+                CreateContractArgs.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_UPLOAD_CONTRACT_WASM:
+            if "wasm" in fields:
+                _result["wasm"] = Opaque.unpack_fields(
+                    unpacker, fields["wasm"], 4294967295, False
+                )
+            else:
+                Opaque.skip(unpacker, 4294967295, False)
+            return _result
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT_V2:
+            if "create_contract_v2" in fields:
+                _result["create_contract_v2"] = CreateContractArgsV2.unpack_fields(
+                    unpacker, fields["create_contract_v2"], depth_limit - 1
+                )
+            else:
+                CreateContractArgsV2.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = HostFunctionType.unpack(unpacker)
+        yield "type", type
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT:
+            yield (
+                "invoke_contract",
+                view_at(InvokeContractArgs, unpacker, depth_limit - 1),
+            )
+            return
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT:
+            yield (
+                "create_contract",
+                CreateContractArgs.unpack(unpacker, depth_limit - 1),
+            )
+            return
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_UPLOAD_CONTRACT_WASM:
+            yield "wasm", Opaque.unpack(unpacker, 4294967295, False)
+            return
+        if type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT_V2:
+            yield (
+                "create_contract_v2",
+                view_at(CreateContractArgsV2, unpacker, depth_limit - 1),
+            )
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -103,10 +240,10 @@ class HostFunction:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HostFunction:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> HostFunction:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -121,11 +258,11 @@ class HostFunction:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HostFunction:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT:
@@ -170,6 +307,58 @@ class HostFunction:
             return cls(type=type, create_contract_v2=create_contract_v2)
         raise ValueError(f"Unknown key '{key}' for HostFunction")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT:
+            assert self.invoke_contract is not None
+            write('{"invoke_contract": ')
+            self.invoke_contract._write_json(write)
+            write("}")
+            return
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT:
+            assert self.create_contract is not None
+            write('{"create_contract": ')
+            self.create_contract._write_json(write)
+            write("}")
+            return
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_UPLOAD_CONTRACT_WASM:
+            assert self.wasm is not None
+            write('{"upload_contract_wasm": ')
+            write(json_encode(Opaque.to_json_dict(self.wasm)))
+            write("}")
+            return
+        if self.type == HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT_V2:
+            assert self.create_contract_v2 is not None
+            write('{"create_contract_v2": ')
+            self.create_contract_v2._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in HostFunction: {self.type}")
+
+    def clone(self, deep: bool = True) -> HostFunction:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.invoke_contract = (
+            self.invoke_contract.clone() if self.invoke_contract is not None else None
+        )
+        result.create_contract = (
+            self.create_contract.clone() if self.create_contract is not None else None
+        )
+        result.wasm = self.wasm
+        result.create_contract_v2 = (
+            self.create_contract_v2.clone()
+            if self.create_contract_v2 is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HostFunction:
+        return self.clone()
+
+    def freeze(self) -> HostFunction:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -204,3 +393,37 @@ class HostFunction:
         if self.create_contract_v2 is not None:
             out.append(f"create_contract_v2={self.create_contract_v2}")
         return f"<HostFunction [{', '.join(out)}]>"
+
+
+def _unpack_invoke_contract(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HostFunction:
+    invoke_contract = InvokeContractArgs.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, invoke_contract=invoke_contract)
+
+
+def _unpack_create_contract(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HostFunction:
+    create_contract = CreateContractArgs.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, create_contract=create_contract)
+
+
+def _unpack_wasm(cls, type, unpacker: Unpacker, depth_limit: int) -> HostFunction:
+    wasm = Opaque.unpack(unpacker, 4294967295, False)
+    return cls(type=type, wasm=wasm)
+
+
+def _unpack_create_contract_v2(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HostFunction:
+    create_contract_v2 = CreateContractArgsV2.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, create_contract_v2=create_contract_v2)
+
+
+_UNPACK_ARMS = {
+    HostFunctionType.HOST_FUNCTION_TYPE_INVOKE_CONTRACT: _unpack_invoke_contract,
+    HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT: _unpack_create_contract,
+    HostFunctionType.HOST_FUNCTION_TYPE_UPLOAD_CONTRACT_WASM: _unpack_wasm,
+    HostFunctionType.HOST_FUNCTION_TYPE_CREATE_CONTRACT_V2: _unpack_create_contract_v2,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .bucket_metadata import BucketMetadata
 from .hot_archive_bucket_entry_type import HotArchiveBucketEntryType
 from .ledger_entry import LedgerEntry
@@ -32,6 +45,8 @@ class HotArchiveBucketEntry:
         };
     """
 
+    __slots__ = ("archived_entry", "key", "meta_entry", "type")
+
     def __init__(
         self,
         type: HotArchiveBucketEntryType,
@@ -63,22 +78,113 @@ class HotArchiveBucketEntry:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED:
+            assert self.archived_entry is not None
+            return 4 + self.archived_entry.xdr_size()
+        if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_LIVE:
+            assert self.key is not None
+            return 4 + self.key.xdr_size()
+        if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_METAENTRY:
+            assert self.meta_entry is not None
+            return 4 + self.meta_entry.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> HotArchiveBucketEntry:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = HotArchiveBucketEntryType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = HotArchiveBucketEntryType.unpack(unpacker)
         if type == HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED:
-            archived_entry = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, archived_entry=archived_entry)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == HotArchiveBucketEntryType.HOT_ARCHIVE_LIVE:
-            key = LedgerKey.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, key=key)
+            LedgerKey.skip(unpacker, depth_limit - 1)
+            return
         if type == HotArchiveBucketEntryType.HOT_ARCHIVE_METAENTRY:
-            meta_entry = BucketMetadata.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, meta_entry=meta_entry)
+            BucketMetadata.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | HotArchiveBucketEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = HotArchiveBucketEntryType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED:
+            if "archived_entry" in fields:
+                _result["archived_entry"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["archived_entry"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == HotArchiveBucketEntryType.HOT_ARCHIVE_LIVE:
+            if "key" in fields:
+                _result["key"] = LedgerKey.unpack_fields(
+                    unpacker, fields["key"], depth_limit - 1
+                )
+            else:
+                LedgerKey.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == HotArchiveBucketEntryType.HOT_ARCHIVE_METAENTRY:
+            if "meta_entry" in fields:
+                _result["meta_entry"] = BucketMetadata.unpack_fields(
+                    unpacker, fields["meta_entry"], depth_limit - 1
+                )
+            else:
+                BucketMetadata.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = HotArchiveBucketEntryType.unpack(unpacker)
+        yield "type", type
+        if type == HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED:
+            yield "archived_entry", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
+        if type == HotArchiveBucketEntryType.HOT_ARCHIVE_LIVE:
+            yield "key", view_at(LedgerKey, unpacker, depth_limit - 1)
+            return
+        if type == HotArchiveBucketEntryType.HOT_ARCHIVE_METAENTRY:
+            yield "meta_entry", BucketMetadata.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -87,10 +193,12 @@ class HotArchiveBucketEntry:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HotArchiveBucketEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> HotArchiveBucketEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -105,11 +213,11 @@ class HotArchiveBucketEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HotArchiveBucketEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED:
@@ -142,6 +250,47 @@ class HotArchiveBucketEntry:
             return cls(type=type, meta_entry=meta_entry)
         raise ValueError(f"Unknown key '{key}' for HotArchiveBucketEntry")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED:
+            assert self.archived_entry is not None
+            write('{"archived": ')
+            self.archived_entry._write_json(write)
+            write("}")
+            return
+        if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_LIVE:
+            assert self.key is not None
+            write('{"live": ')
+            self.key._write_json(write)
+            write("}")
+            return
+        if self.type == HotArchiveBucketEntryType.HOT_ARCHIVE_METAENTRY:
+            assert self.meta_entry is not None
+            write('{"metaentry": ')
+            self.meta_entry._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in HotArchiveBucketEntry: {self.type}")
+
+    def clone(self, deep: bool = True) -> HotArchiveBucketEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.archived_entry = (
+            self.archived_entry.clone() if self.archived_entry is not None else None
+        )
+        result.key = self.key.clone() if self.key is not None else None
+        result.meta_entry = (
+            self.meta_entry.clone() if self.meta_entry is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> HotArchiveBucketEntry:
+        return self.clone()
+
+    def freeze(self) -> HotArchiveBucketEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -172,3 +321,31 @@ class HotArchiveBucketEntry:
         if self.meta_entry is not None:
             out.append(f"meta_entry={self.meta_entry}")
         return f"<HotArchiveBucketEntry [{', '.join(out)}]>"
+
+
+def _unpack_archived_entry(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HotArchiveBucketEntry:
+    archived_entry = LedgerEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, archived_entry=archived_entry)
+
+
+def _unpack_key(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HotArchiveBucketEntry:
+    key = LedgerKey.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, key=key)
+
+
+def _unpack_meta_entry(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> HotArchiveBucketEntry:
+    meta_entry = BucketMetadata.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, meta_entry=meta_entry)
+
+
+_UNPACK_ARMS = {
+    HotArchiveBucketEntryType.HOT_ARCHIVE_ARCHIVED: _unpack_archived_entry,
+    HotArchiveBucketEntryType.HOT_ARCHIVE_LIVE: _unpack_key,
+    HotArchiveBucketEntryType.HOT_ARCHIVE_METAENTRY: _unpack_meta_entry,
+}
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _HOT_ARCHIVE_BUCKET_ENTRY_TYPE_MAP = {-1: "metaentry", 0: "archived", 1: "live"}
 _HOT_ARCHIVE_BUCKET_ENTRY_TYPE_REVERSE_MAP = {"metaentry": -1, "archived": 0, "live": 1}
 __all__ = ["HotArchiveBucketEntryType"]
@@ -34,10 +43,27 @@ class HotArchiveBucketEntryType(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> HotArchiveBucketEntryType:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid HotArchiveBucketEntryType")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls, unpacker: Unpacker, fields: dict | None
+    ) -> HotArchiveBucketEntryType:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -45,10 +71,12 @@ class HotArchiveBucketEntryType(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HotArchiveBucketEntryType:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> HotArchiveBucketEntryType:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +91,11 @@ class HotArchiveBucketEntryType(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HotArchiveBucketEntryType:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _HOT_ARCHIVE_BUCKET_ENTRY_TYPE_MAP[self.value]
@@ -75,3 +103,15 @@ class HotArchiveBucketEntryType(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> HotArchiveBucketEntryType:
         return cls(_HOT_ARCHIVE_BUCKET_ENTRY_TYPE_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_HOT_ARCHIVE_BUCKET_ENTRY_TYPE_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> HotArchiveBucketEntryType:
+        return self
+
+    def freeze(self) -> HotArchiveBucketEntryType:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in HotArchiveBucketEntryType}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .inflation_payout import InflationPayout
 from .inflation_result_code import InflationResultCode
 
@@ -27,6 +40,8 @@ class InflationResult:
         };
     """
 
+    __slots__ = ("code", "payouts")
+
     def __init__(
         self,
         code: InflationResultCode,
@@ -53,13 +68,106 @@ class InflationResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == InflationResultCode.INFLATION_SUCCESS:
+            assert self.payouts is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.payouts)
+        if self.code == InflationResultCode.INFLATION_NOT_TIME:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> InflationResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = InflationResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = InflationResultCode.unpack(unpacker)
+        if code == InflationResultCode.INFLATION_SUCCESS:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"payouts length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                InflationPayout.skip(unpacker, depth_limit - 1)
+            return
+        if code == InflationResultCode.INFLATION_NOT_TIME:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InflationResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = InflationResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == InflationResultCode.INFLATION_SUCCESS:
+            if "payouts" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"payouts length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["payouts"] = []
+                for _ in range(length):
+                    _result["payouts"].append(
+                        InflationPayout.unpack_fields(
+                            unpacker, fields["payouts"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"payouts length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    InflationPayout.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == InflationResultCode.INFLATION_NOT_TIME:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = InflationResultCode.unpack(unpacker)
+        yield "code", code
         if code == InflationResultCode.INFLATION_SUCCESS:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -70,9 +178,10 @@ class InflationResult:
             payouts = []
             for _ in range(length):
                 payouts.append(InflationPayout.unpack(unpacker, depth_limit - 1))
-            return cls(code=code, payouts=payouts)
+            yield "payouts", payouts
+            return
         if code == InflationResultCode.INFLATION_NOT_TIME:
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -81,10 +190,10 @@ class InflationResult:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InflationResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> InflationResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -99,11 +208,11 @@ class InflationResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InflationResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == InflationResultCode.INFLATION_SUCCESS:
@@ -135,6 +244,36 @@ class InflationResult:
             return cls(code=code, payouts=payouts)
         raise ValueError(f"Unknown key '{key}' for InflationResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == InflationResultCode.INFLATION_SUCCESS:
+            assert self.payouts is not None
+            write('{"success": ')
+            write_json_array(write, self.payouts)
+            write("}")
+            return
+        if self.code == InflationResultCode.INFLATION_NOT_TIME:
+            write('"not_time"')
+            return
+        raise ValueError(f"Unknown code in InflationResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> InflationResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.payouts = (
+            [item.clone() for item in self.payouts]
+            if self.payouts is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InflationResult:
+        return self.clone()
+
+    def freeze(self) -> InflationResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -154,3 +293,26 @@ class InflationResult:
         if self.payouts is not None:
             out.append(f"payouts={self.payouts}")
         return f"<InflationResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> InflationResult:
+    return cls(code=code)
+
+
+def _unpack_payouts(cls, code, unpacker: Unpacker, depth_limit: int) -> InflationResult:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"payouts length {length} exceeds remaining input length {_remaining}"
+        )
+    payouts = []
+    for _ in range(length):
+        payouts.append(InflationPayout.unpack(unpacker, depth_limit - 1))
+    return cls(code=code, payouts=payouts)
+
+
+_UNPACK_ARMS = {
+    InflationResultCode.INFLATION_SUCCESS: _unpack_payouts,
+    InflationResultCode.INFLATION_NOT_TIME: _unpack_void,
+}
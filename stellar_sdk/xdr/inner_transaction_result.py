@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .inner_transaction_result_ext import InnerTransactionResultExt
 from .inner_transaction_result_result import InnerTransactionResultResult
 from .int64 import Int64
@@ -61,6 +74,8 @@ class InnerTransactionResult:
         };
     """
 
+    __slots__ = ("ext", "fee_charged", "result")
+
     def __init__(
         self,
         fee_charged: Int64,
@@ -76,6 +91,9 @@ class InnerTransactionResult:
         self.result.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.result.xdr_size() + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -91,16 +109,79 @@ class InnerTransactionResult:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Int64.skip(unpacker, depth_limit - 1)
+        InnerTransactionResultResult.skip(unpacker, depth_limit - 1)
+        InnerTransactionResultExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InnerTransactionResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "fee_charged" in fields:
+            _result["fee_charged"] = Int64.unpack_fields(
+                unpacker, fields["fee_charged"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "result" in fields:
+            _result["result"] = InnerTransactionResultResult.unpack_fields(
+                unpacker, fields["result"], depth_limit - 1
+            )
+        else:
+            InnerTransactionResultResult.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = InnerTransactionResultExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            InnerTransactionResultExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "fee_charged", Int64.unpack(unpacker, depth_limit - 1)
+        result = view_at(InnerTransactionResultResult, unpacker, depth_limit - 1)
+        yield "result", result
+        InnerTransactionResultResult.skip(unpacker, depth_limit - 1)
+        yield "ext", InnerTransactionResultExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InnerTransactionResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InnerTransactionResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -115,11 +196,11 @@ class InnerTransactionResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InnerTransactionResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -139,6 +220,30 @@ class InnerTransactionResult:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"fee_charged": ')
+        self.fee_charged._write_json(write)
+        write(', "result": ')
+        self.result._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> InnerTransactionResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.fee_charged = self.fee_charged.clone()
+        result.result = self.result.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InnerTransactionResult:
+        return self.clone()
+
+    def freeze(self) -> InnerTransactionResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
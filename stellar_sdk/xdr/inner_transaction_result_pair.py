@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .hash import Hash
 from .inner_transaction_result import InnerTransactionResult
 
@@ -25,6 +38,8 @@ class InnerTransactionResultPair:
         };
     """
 
+    __slots__ = ("result", "transaction_hash")
+
     def __init__(
         self,
         transaction_hash: Hash,
@@ -37,6 +52,9 @@ class InnerTransactionResultPair:
         self.transaction_hash.pack(packer)
         self.result.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + self.result.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +68,69 @@ class InnerTransactionResultPair:
             result=result,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        InnerTransactionResult.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InnerTransactionResultPair:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "transaction_hash" in fields:
+            _result["transaction_hash"] = Hash.unpack_fields(
+                unpacker, fields["transaction_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "result" in fields:
+            _result["result"] = InnerTransactionResult.unpack_fields(
+                unpacker, fields["result"], depth_limit - 1
+            )
+        else:
+            InnerTransactionResult.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "transaction_hash", Hash.unpack(unpacker, depth_limit - 1)
+        yield "result", view_at(InnerTransactionResult, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InnerTransactionResultPair:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InnerTransactionResultPair:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +145,11 @@ class InnerTransactionResultPair:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InnerTransactionResultPair:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +166,27 @@ class InnerTransactionResultPair:
             result=result,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"transaction_hash": ')
+        self.transaction_hash._write_json(write)
+        write(', "result": ')
+        self.result._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> InnerTransactionResultPair:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.transaction_hash = self.transaction_hash.clone()
+        result.result = self.result.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InnerTransactionResultPair:
+        return self.clone()
+
+    def freeze(self) -> InnerTransactionResultPair:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
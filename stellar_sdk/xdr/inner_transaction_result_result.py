@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .operation_result import OperationResult
 from .transaction_result_code import TransactionResultCode
 
@@ -45,6 +59,8 @@ class InnerTransactionResultResult:
             }
     """
 
+    __slots__ = ("code", "results")
+
     def __init__(
         self,
         code: TransactionResultCode,
@@ -108,13 +124,234 @@ class InnerTransactionResultResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == TransactionResultCode.txSUCCESS:
+            assert self.results is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.results)
+        if self.code == TransactionResultCode.txFAILED:
+            assert self.results is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.results)
+        if self.code == TransactionResultCode.txTOO_EARLY:
+            return 4
+        if self.code == TransactionResultCode.txTOO_LATE:
+            return 4
+        if self.code == TransactionResultCode.txMISSING_OPERATION:
+            return 4
+        if self.code == TransactionResultCode.txBAD_SEQ:
+            return 4
+        if self.code == TransactionResultCode.txBAD_AUTH:
+            return 4
+        if self.code == TransactionResultCode.txINSUFFICIENT_BALANCE:
+            return 4
+        if self.code == TransactionResultCode.txNO_ACCOUNT:
+            return 4
+        if self.code == TransactionResultCode.txINSUFFICIENT_FEE:
+            return 4
+        if self.code == TransactionResultCode.txBAD_AUTH_EXTRA:
+            return 4
+        if self.code == TransactionResultCode.txINTERNAL_ERROR:
+            return 4
+        if self.code == TransactionResultCode.txNOT_SUPPORTED:
+            return 4
+        if self.code == TransactionResultCode.txBAD_SPONSORSHIP:
+            return 4
+        if self.code == TransactionResultCode.txBAD_MIN_SEQ_AGE_OR_GAP:
+            return 4
+        if self.code == TransactionResultCode.txMALFORMED:
+            return 4
+        if self.code == TransactionResultCode.txSOROBAN_INVALID:
+            return 4
+        if self.code == TransactionResultCode.txFROZEN_KEY_ACCESSED:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> InnerTransactionResultResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = TransactionResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = TransactionResultCode.unpack(unpacker)
+        if code == TransactionResultCode.txSUCCESS:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"results length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                OperationResult.skip(unpacker, depth_limit - 1)
+            return
+        if code == TransactionResultCode.txFAILED:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"results length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                OperationResult.skip(unpacker, depth_limit - 1)
+            return
+        if code == TransactionResultCode.txTOO_EARLY:
+            return
+        if code == TransactionResultCode.txTOO_LATE:
+            return
+        if code == TransactionResultCode.txMISSING_OPERATION:
+            return
+        if code == TransactionResultCode.txBAD_SEQ:
+            return
+        if code == TransactionResultCode.txBAD_AUTH:
+            return
+        if code == TransactionResultCode.txINSUFFICIENT_BALANCE:
+            return
+        if code == TransactionResultCode.txNO_ACCOUNT:
+            return
+        if code == TransactionResultCode.txINSUFFICIENT_FEE:
+            return
+        if code == TransactionResultCode.txBAD_AUTH_EXTRA:
+            return
+        if code == TransactionResultCode.txINTERNAL_ERROR:
+            return
+        if code == TransactionResultCode.txNOT_SUPPORTED:
+            return
+        if code == TransactionResultCode.txBAD_SPONSORSHIP:
+            return
+        if code == TransactionResultCode.txBAD_MIN_SEQ_AGE_OR_GAP:
+            return
+        if code == TransactionResultCode.txMALFORMED:
+            return
+        if code == TransactionResultCode.txSOROBAN_INVALID:
+            return
+        if code == TransactionResultCode.txFROZEN_KEY_ACCESSED:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InnerTransactionResultResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = TransactionResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == TransactionResultCode.txSUCCESS:
+            if "results" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"results length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["results"] = []
+                for _ in range(length):
+                    _result["results"].append(
+                        OperationResult.unpack_fields(
+                            unpacker, fields["results"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"results length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    OperationResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == TransactionResultCode.txFAILED:
+            if "results" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"results length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["results"] = []
+                for _ in range(length):
+                    _result["results"].append(
+                        OperationResult.unpack_fields(
+                            unpacker, fields["results"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"results length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    OperationResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == TransactionResultCode.txTOO_EARLY:
+            return _result
+        if code == TransactionResultCode.txTOO_LATE:
+            return _result
+        if code == TransactionResultCode.txMISSING_OPERATION:
+            return _result
+        if code == TransactionResultCode.txBAD_SEQ:
+            return _result
+        if code == TransactionResultCode.txBAD_AUTH:
+            return _result
+        if code == TransactionResultCode.txINSUFFICIENT_BALANCE:
+            return _result
+        if code == TransactionResultCode.txNO_ACCOUNT:
+            return _result
+        if code == TransactionResultCode.txINSUFFICIENT_FEE:
+            return _result
+        if code == TransactionResultCode.txBAD_AUTH_EXTRA:
+            return _result
+        if code == TransactionResultCode.txINTERNAL_ERROR:
+            return _result
+        if code == TransactionResultCode.txNOT_SUPPORTED:
+            return _result
+        if code == TransactionResultCode.txBAD_SPONSORSHIP:
+            return _result
+        if code == TransactionResultCode.txBAD_MIN_SEQ_AGE_OR_GAP:
+            return _result
+        if code == TransactionResultCode.txMALFORMED:
+            return _result
+        if code == TransactionResultCode.txSOROBAN_INVALID:
+            return _result
+        if code == TransactionResultCode.txFROZEN_KEY_ACCESSED:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = TransactionResultCode.unpack(unpacker)
+        yield "code", code
         if code == TransactionResultCode.txSUCCESS:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -124,8 +361,9 @@ class InnerTransactionResultResult:
                 )
             results = []
             for _ in range(length):
-                results.append(OperationResult.unpack(unpacker, depth_limit - 1))
-            return cls(code=code, results=results)
+                results.append(unpack_view(OperationResult, unpacker, depth_limit - 1))
+            yield "results", results
+            return
         if code == TransactionResultCode.txFAILED:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -135,40 +373,41 @@ class InnerTransactionResultResult:
                 )
             results = []
             for _ in range(length):
-                results.append(OperationResult.unpack(unpacker, depth_limit - 1))
-            return cls(code=code, results=results)
+                results.append(unpack_view(OperationResult, unpacker, depth_limit - 1))
+            yield "results", results
+            return
         if code == TransactionResultCode.txTOO_EARLY:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txTOO_LATE:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txMISSING_OPERATION:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txBAD_SEQ:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txBAD_AUTH:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txINSUFFICIENT_BALANCE:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txNO_ACCOUNT:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txINSUFFICIENT_FEE:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txBAD_AUTH_EXTRA:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txINTERNAL_ERROR:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txNOT_SUPPORTED:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txBAD_SPONSORSHIP:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txBAD_MIN_SEQ_AGE_OR_GAP:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txMALFORMED:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txSOROBAN_INVALID:
-            return cls(code=code)
+            return
         if code == TransactionResultCode.txFROZEN_KEY_ACCESSED:
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -177,10 +416,12 @@ class InnerTransactionResultResult:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InnerTransactionResultResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InnerTransactionResultResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -195,11 +436,11 @@ class InnerTransactionResultResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InnerTransactionResultResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == TransactionResultCode.txSUCCESS:
@@ -286,6 +527,87 @@ class InnerTransactionResultResult:
             return cls(code=code, results=results)
         raise ValueError(f"Unknown key '{key}' for InnerTransactionResultResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == TransactionResultCode.txSUCCESS:
+            assert self.results is not None
+            write('{"txsuccess": ')
+            write_json_array(write, self.results)
+            write("}")
+            return
+        if self.code == TransactionResultCode.txFAILED:
+            assert self.results is not None
+            write('{"txfailed": ')
+            write_json_array(write, self.results)
+            write("}")
+            return
+        if self.code == TransactionResultCode.txTOO_EARLY:
+            write('"txtoo_early"')
+            return
+        if self.code == TransactionResultCode.txTOO_LATE:
+            write('"txtoo_late"')
+            return
+        if self.code == TransactionResultCode.txMISSING_OPERATION:
+            write('"txmissing_operation"')
+            return
+        if self.code == TransactionResultCode.txBAD_SEQ:
+            write('"txbad_seq"')
+            return
+        if self.code == TransactionResultCode.txBAD_AUTH:
+            write('"txbad_auth"')
+            return
+        if self.code == TransactionResultCode.txINSUFFICIENT_BALANCE:
+            write('"txinsufficient_balance"')
+            return
+        if self.code == TransactionResultCode.txNO_ACCOUNT:
+            write('"txno_account"')
+            return
+        if self.code == TransactionResultCode.txINSUFFICIENT_FEE:
+            write('"txinsufficient_fee"')
+            return
+        if self.code == TransactionResultCode.txBAD_AUTH_EXTRA:
+            write('"txbad_auth_extra"')
+            return
+        if self.code == TransactionResultCode.txINTERNAL_ERROR:
+            write('"txinternal_error"')
+            return
+        if self.code == TransactionResultCode.txNOT_SUPPORTED:
+            write('"txnot_supported"')
+            return
+        if self.code == TransactionResultCode.txBAD_SPONSORSHIP:
+            write('"txbad_sponsorship"')
+            return
+        if self.code == TransactionResultCode.txBAD_MIN_SEQ_AGE_OR_GAP:
+            write('"txbad_min_seq_age_or_gap"')
+            return
+        if self.code == TransactionResultCode.txMALFORMED:
+            write('"txmalformed"')
+            return
+        if self.code == TransactionResultCode.txSOROBAN_INVALID:
+            write('"txsoroban_invalid"')
+            return
+        if self.code == TransactionResultCode.txFROZEN_KEY_ACCESSED:
+            write('"txfrozen_key_accessed"')
+            return
+        raise ValueError(f"Unknown code in InnerTransactionResultResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> InnerTransactionResultResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.results = (
+            [item.clone() for item in self.results]
+            if self.results is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InnerTransactionResultResult:
+        return self.clone()
+
+    def freeze(self) -> InnerTransactionResultResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -305,3 +627,46 @@ class InnerTransactionResultResult:
         if self.results is not None:
             out.append(f"results={self.results}")
         return f"<InnerTransactionResultResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> InnerTransactionResultResult:
+    return cls(code=code)
+
+
+def _unpack_results(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> InnerTransactionResultResult:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"results length {length} exceeds remaining input length {_remaining}"
+        )
+    results = []
+    for _ in range(length):
+        results.append(OperationResult.unpack(unpacker, depth_limit - 1))
+    return cls(code=code, results=results)
+
+
+_UNPACK_ARMS = {
+    TransactionResultCode.txSUCCESS: _unpack_results,
+    TransactionResultCode.txFAILED: _unpack_results,
+    TransactionResultCode.txTOO_EARLY: _unpack_void,
+    TransactionResultCode.txTOO_LATE: _unpack_void,
+    TransactionResultCode.txMISSING_OPERATION: _unpack_void,
+    TransactionResultCode.txBAD_SEQ: _unpack_void,
+    TransactionResultCode.txBAD_AUTH: _unpack_void,
+    TransactionResultCode.txINSUFFICIENT_BALANCE: _unpack_void,
+    TransactionResultCode.txNO_ACCOUNT: _unpack_void,
+    TransactionResultCode.txINSUFFICIENT_FEE: _unpack_void,
+    TransactionResultCode.txBAD_AUTH_EXTRA: _unpack_void,
+    TransactionResultCode.txINTERNAL_ERROR: _unpack_void,
+    TransactionResultCode.txNOT_SUPPORTED: _unpack_void,
+    TransactionResultCode.txBAD_SPONSORSHIP: _unpack_void,
+    TransactionResultCode.txBAD_MIN_SEQ_AGE_OR_GAP: _unpack_void,
+    TransactionResultCode.txMALFORMED: _unpack_void,
+    TransactionResultCode.txSOROBAN_INVALID: _unpack_void,
+    TransactionResultCode.txFROZEN_KEY_ACCESSED: _unpack_void,
+}
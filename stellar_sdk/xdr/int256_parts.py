@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .uint64 import Uint64
 
+_LAYOUT = FixedLayout(">qQQQ")
 __all__ = ["Int256Parts"]
 
 
@@ -26,6 +39,8 @@ class Int256Parts:
         };
     """
 
+    __slots__ = ("hi_hi", "hi_lo", "lo_hi", "lo_lo")
+
     def __init__(
         self,
         hi_hi: Int64,
@@ -39,10 +54,16 @@ class Int256Parts:
         self.lo_lo = lo_lo
 
     def pack(self, packer: Packer) -> None:
-        self.hi_hi.pack(packer)
-        self.hi_lo.pack(packer)
-        self.lo_hi.pack(packer)
-        self.lo_lo.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.hi_hi.int64,
+            self.hi_lo.uint64,
+            self.lo_hi.uint64,
+            self.lo_lo.uint64,
+        )
+
+    def xdr_size(self) -> int:
+        return 32
 
     @classmethod
     def unpack(
@@ -50,27 +71,75 @@ class Int256Parts:
     ) -> Int256Parts:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        hi_hi = Int64.unpack(unpacker, depth_limit - 1)
-        hi_lo = Uint64.unpack(unpacker, depth_limit - 1)
-        lo_hi = Uint64.unpack(unpacker, depth_limit - 1)
-        lo_lo = Uint64.unpack(unpacker, depth_limit - 1)
+        hi_hi, hi_lo, lo_hi, lo_lo = _LAYOUT.read(unpacker)
         return cls(
-            hi_hi=hi_hi,
-            hi_lo=hi_lo,
-            lo_hi=lo_hi,
-            lo_lo=lo_lo,
+            hi_hi=Int64(hi_hi),
+            hi_lo=Uint64(hi_lo),
+            lo_hi=Uint64(lo_hi),
+            lo_lo=Uint64(lo_lo),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Int256Parts:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "hi_hi" in fields:
+            _result["hi_hi"] = Int64.unpack_fields(
+                unpacker, fields["hi_hi"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "hi_lo" in fields:
+            _result["hi_lo"] = Uint64.unpack_fields(
+                unpacker, fields["hi_lo"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "lo_hi" in fields:
+            _result["lo_hi"] = Uint64.unpack_fields(
+                unpacker, fields["lo_hi"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "lo_lo" in fields:
+            _result["lo_lo"] = Uint64.unpack_fields(
+                unpacker, fields["lo_lo"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Int256Parts:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Int256Parts:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -85,11 +154,11 @@ class Int256Parts:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Int256Parts:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         value_bytes = (
@@ -113,6 +182,25 @@ class Int256Parts:
             lo_lo=Uint64(int.from_bytes(value_bytes[24:32], "big", signed=False)),
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> Int256Parts:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.hi_hi = self.hi_hi.clone()
+        result.hi_lo = self.hi_lo.clone()
+        result.lo_hi = self.lo_hi.clone()
+        result.lo_lo = self.lo_lo.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Int256Parts:
+        return self.clone()
+
+    def freeze(self) -> Int256Parts:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .sc_address import SCAddress
 from .sc_symbol import SCSymbol
 from .sc_val import SCVal
@@ -26,6 +40,8 @@ class InvokeContractArgs:
         };
     """
 
+    __slots__ = ("args", "contract_address", "function_name")
+
     def __init__(
         self,
         contract_address: SCAddress,
@@ -48,6 +64,14 @@ class InvokeContractArgs:
         for args_item in self.args:
             args_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.contract_address.xdr_size()
+            + self.function_name.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.args)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,16 +95,108 @@ class InvokeContractArgs:
             args=args,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCAddress.skip(unpacker, depth_limit - 1)
+        SCSymbol.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"args length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCVal.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InvokeContractArgs:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "contract_address" in fields:
+            _result["contract_address"] = SCAddress.unpack_fields(
+                unpacker, fields["contract_address"], depth_limit - 1
+            )
+        else:
+            SCAddress.skip(unpacker, depth_limit - 1)
+        if "function_name" in fields:
+            _result["function_name"] = SCSymbol.unpack_fields(
+                unpacker, fields["function_name"], depth_limit - 1
+            )
+        else:
+            SCSymbol.skip(unpacker, depth_limit - 1)
+        if "args" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"args length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["args"] = []
+            for _ in range(length):
+                _result["args"].append(
+                    SCVal.unpack_fields(unpacker, fields["args"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"args length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCVal.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "contract_address", SCAddress.unpack(unpacker, depth_limit - 1)
+        yield "function_name", SCSymbol.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"args length {length} exceeds remaining input length {_remaining}"
+            )
+        args = []
+        for _ in range(length):
+            args.append(unpack_view(SCVal, unpacker, depth_limit - 1))
+        yield "args", args
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InvokeContractArgs:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InvokeContractArgs:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +211,11 @@ class InvokeContractArgs:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InvokeContractArgs:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -119,6 +235,30 @@ class InvokeContractArgs:
             args=args,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"contract_address": ')
+        self.contract_address._write_json(write)
+        write(', "function_name": ')
+        self.function_name._write_json(write)
+        write(', "args": ')
+        write_json_array(write, self.args)
+        write("}")
+
+    def clone(self, deep: bool = True) -> InvokeContractArgs:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.contract_address = self.contract_address.clone()
+        result.function_name = self.function_name.clone()
+        result.args = [item.clone() for item in self.args]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InvokeContractArgs:
+        return self.clone()
+
+    def freeze(self) -> InvokeContractArgs:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .host_function import HostFunction
 from .soroban_authorization_entry import SorobanAuthorizationEntry
 
@@ -27,6 +42,8 @@ class InvokeHostFunctionOp:
         };
     """
 
+    __slots__ = ("auth", "host_function")
+
     def __init__(
         self,
         host_function: HostFunction,
@@ -46,6 +63,13 @@ class InvokeHostFunctionOp:
         for auth_item in self.auth:
             auth_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.host_function.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.auth)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -67,16 +91,106 @@ class InvokeHostFunctionOp:
             auth=auth,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        HostFunction.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"auth length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SorobanAuthorizationEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InvokeHostFunctionOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "host_function" in fields:
+            _result["host_function"] = HostFunction.unpack_fields(
+                unpacker, fields["host_function"], depth_limit - 1
+            )
+        else:
+            HostFunction.skip(unpacker, depth_limit - 1)
+        if "auth" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"auth length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["auth"] = []
+            for _ in range(length):
+                _result["auth"].append(
+                    SorobanAuthorizationEntry.unpack_fields(
+                        unpacker, fields["auth"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"auth length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SorobanAuthorizationEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        host_function = view_at(HostFunction, unpacker, depth_limit - 1)
+        yield "host_function", host_function
+        HostFunction.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"auth length {length} exceeds remaining input length {_remaining}"
+            )
+        auth = []
+        for _ in range(length):
+            auth.append(
+                unpack_view(SorobanAuthorizationEntry, unpacker, depth_limit - 1)
+            )
+        yield "auth", auth
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InvokeHostFunctionOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InvokeHostFunctionOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -91,11 +205,11 @@ class InvokeHostFunctionOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InvokeHostFunctionOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -114,6 +228,27 @@ class InvokeHostFunctionOp:
             auth=auth,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"host_function": ')
+        self.host_function._write_json(write)
+        write(', "auth": ')
+        write_json_array(write, self.auth)
+        write("}")
+
+    def clone(self, deep: bool = True) -> InvokeHostFunctionOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.host_function = self.host_function.clone()
+        result.auth = [item.clone() for item in self.auth]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InvokeHostFunctionOp:
+        return self.clone()
+
+    def freeze(self) -> InvokeHostFunctionOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .invoke_host_function_result_code import InvokeHostFunctionResultCode
 
@@ -31,6 +41,8 @@ class InvokeHostFunctionResult:
         };
     """
 
+    __slots__ = ("code", "success")
+
     def __init__(
         self,
         code: InvokeHostFunctionResultCode,
@@ -67,44 +79,128 @@ class InvokeHostFunctionResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS:
+            return 36
+        if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_MALFORMED:
+            return 4
+        if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_TRAPPED:
+            return 4
+        if (
+            self.code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_RESOURCE_LIMIT_EXCEEDED
+        ):
+            return 4
+        if (
+            self.code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_ENTRY_ARCHIVED
+        ):
+            return 4
+        if (
+            self.code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> InvokeHostFunctionResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = InvokeHostFunctionResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = InvokeHostFunctionResultCode.unpack(unpacker)
         if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS:
-            success = Hash.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, success=success)
+            Hash.skip(unpacker, depth_limit - 1)
+            return
         if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_MALFORMED:
-            return cls(code=code)
+            return
         if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_TRAPPED:
-            return cls(code=code)
+            return
         if (
             code
             == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_RESOURCE_LIMIT_EXCEEDED
         ):
-            return cls(code=code)
+            return
         if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_ENTRY_ARCHIVED:
-            return cls(code=code)
+            return
         if (
             code
             == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_INSUFFICIENT_REFUNDABLE_FEE
         ):
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InvokeHostFunctionResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = InvokeHostFunctionResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS:
+            if "success" in fields:
+                _result["success"] = Hash.unpack_fields(
+                    unpacker, fields["success"], depth_limit - 1
+                )
+            else:
+                Hash.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_MALFORMED:
+            return _result
+        if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_TRAPPED:
+            return _result
+        if (
+            code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_RESOURCE_LIMIT_EXCEEDED
+        ):
+            return _result
+        if code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_ENTRY_ARCHIVED:
+            return _result
+        if (
+            code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InvokeHostFunctionResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InvokeHostFunctionResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -119,11 +215,11 @@ class InvokeHostFunctionResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InvokeHostFunctionResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS:
@@ -176,6 +272,53 @@ class InvokeHostFunctionResult:
             return cls(code=code, success=success)
         raise ValueError(f"Unknown key '{key}' for InvokeHostFunctionResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS:
+            assert self.success is not None
+            write('{"success": ')
+            self.success._write_json(write)
+            write("}")
+            return
+        if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_TRAPPED:
+            write('"trapped"')
+            return
+        if (
+            self.code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_RESOURCE_LIMIT_EXCEEDED
+        ):
+            write('"resource_limit_exceeded"')
+            return
+        if (
+            self.code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_ENTRY_ARCHIVED
+        ):
+            write('"entry_archived"')
+            return
+        if (
+            self.code
+            == InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            write('"insufficient_refundable_fee"')
+            return
+        raise ValueError(f"Unknown code in InvokeHostFunctionResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> InvokeHostFunctionResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.success = self.success.clone() if self.success is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InvokeHostFunctionResult:
+        return self.clone()
+
+    def freeze(self) -> InvokeHostFunctionResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -195,3 +338,26 @@ class InvokeHostFunctionResult:
         if self.success is not None:
             out.append(f"success={self.success}")
         return f"<InvokeHostFunctionResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> InvokeHostFunctionResult:
+    return cls(code=code)
+
+
+def _unpack_success(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> InvokeHostFunctionResult:
+    success = Hash.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, success=success)
+
+
+_UNPACK_ARMS = {
+    InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_SUCCESS: _unpack_success,
+    InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_MALFORMED: _unpack_void,
+    InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_TRAPPED: _unpack_void,
+    InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_RESOURCE_LIMIT_EXCEEDED: _unpack_void,
+    InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_ENTRY_ARCHIVED: _unpack_void,
+    InvokeHostFunctionResultCode.INVOKE_HOST_FUNCTION_INSUFFICIENT_REFUNDABLE_FEE: _unpack_void,
+}
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .contract_event import ContractEvent
 from .sc_val import SCVal
 
@@ -25,6 +40,8 @@ class InvokeHostFunctionSuccessPreImage:
         };
     """
 
+    __slots__ = ("events", "return_value")
+
     def __init__(
         self,
         return_value: SCVal,
@@ -44,6 +61,13 @@ class InvokeHostFunctionSuccessPreImage:
         for events_item in self.events:
             events_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.return_value.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.events)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +89,104 @@ class InvokeHostFunctionSuccessPreImage:
             events=events,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCVal.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ContractEvent.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | InvokeHostFunctionSuccessPreImage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "return_value" in fields:
+            _result["return_value"] = SCVal.unpack_fields(
+                unpacker, fields["return_value"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        if "events" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["events"] = []
+            for _ in range(length):
+                _result["events"].append(
+                    ContractEvent.unpack_fields(
+                        unpacker, fields["events"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ContractEvent.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        return_value = view_at(SCVal, unpacker, depth_limit - 1)
+        yield "return_value", return_value
+        SCVal.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        events = []
+        for _ in range(length):
+            events.append(unpack_view(ContractEvent, unpacker, depth_limit - 1))
+        yield "events", events
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> InvokeHostFunctionSuccessPreImage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> InvokeHostFunctionSuccessPreImage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +201,11 @@ class InvokeHostFunctionSuccessPreImage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> InvokeHostFunctionSuccessPreImage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +222,27 @@ class InvokeHostFunctionSuccessPreImage:
             events=events,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"return_value": ')
+        self.return_value._write_json(write)
+        write(', "events": ')
+        write_json_array(write, self.events)
+        write("}")
+
+    def clone(self, deep: bool = True) -> InvokeHostFunctionSuccessPreImage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.return_value = self.return_value.clone()
+        result.events = [item.clone() for item in self.events]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> InvokeHostFunctionSuccessPreImage:
+        return self.clone()
+
+    def freeze(self) -> InvokeHostFunctionSuccessPreImage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
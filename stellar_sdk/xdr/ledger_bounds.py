@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">II")
 __all__ = ["LedgerBounds"]
 
 
@@ -24,6 +36,8 @@ class LedgerBounds:
         };
     """
 
+    __slots__ = ("max_ledger", "min_ledger")
+
     def __init__(
         self,
         min_ledger: Uint32,
@@ -33,8 +47,10 @@ class LedgerBounds:
         self.max_ledger = max_ledger
 
     def pack(self, packer: Packer) -> None:
-        self.min_ledger.pack(packer)
-        self.max_ledger.pack(packer)
+        _LAYOUT.write(packer, self.min_ledger.uint32, self.max_ledger.uint32)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -42,23 +58,61 @@ class LedgerBounds:
     ) -> LedgerBounds:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        min_ledger = Uint32.unpack(unpacker, depth_limit - 1)
-        max_ledger = Uint32.unpack(unpacker, depth_limit - 1)
+        min_ledger, max_ledger = _LAYOUT.read(unpacker)
         return cls(
-            min_ledger=min_ledger,
-            max_ledger=max_ledger,
+            min_ledger=Uint32(min_ledger),
+            max_ledger=Uint32(max_ledger),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerBounds:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "min_ledger" in fields:
+            _result["min_ledger"] = Uint32.unpack_fields(
+                unpacker, fields["min_ledger"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "max_ledger" in fields:
+            _result["max_ledger"] = Uint32.unpack_fields(
+                unpacker, fields["max_ledger"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerBounds:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerBounds:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +127,11 @@ class LedgerBounds:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerBounds:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +148,27 @@ class LedgerBounds:
             max_ledger=max_ledger,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"min_ledger": ')
+        self.min_ledger._write_json(write)
+        write(', "max_ledger": ')
+        self.max_ledger._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerBounds:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.min_ledger = self.min_ledger.clone()
+        result.max_ledger = self.max_ledger.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerBounds:
+        return self.clone()
+
+    def freeze(self) -> LedgerBounds:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
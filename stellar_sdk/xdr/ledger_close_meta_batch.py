@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .ledger_close_meta import LedgerCloseMeta
 from .uint32 import Uint32
 
@@ -31,6 +45,8 @@ class LedgerCloseMetaBatch:
         };
     """
 
+    __slots__ = ("end_sequence", "ledger_close_metas", "start_sequence")
+
     def __init__(
         self,
         start_sequence: Uint32,
@@ -53,6 +69,9 @@ class LedgerCloseMetaBatch:
         for ledger_close_metas_item in self.ledger_close_metas:
             ledger_close_metas_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + 4 + sum(item.xdr_size() for item in self.ledger_close_metas)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -76,16 +95,112 @@ class LedgerCloseMetaBatch:
             ledger_close_metas=ledger_close_metas,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"ledger_close_metas length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            LedgerCloseMeta.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerCloseMetaBatch:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "start_sequence" in fields:
+            _result["start_sequence"] = Uint32.unpack_fields(
+                unpacker, fields["start_sequence"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "end_sequence" in fields:
+            _result["end_sequence"] = Uint32.unpack_fields(
+                unpacker, fields["end_sequence"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ledger_close_metas" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"ledger_close_metas length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["ledger_close_metas"] = []
+            for _ in range(length):
+                _result["ledger_close_metas"].append(
+                    LedgerCloseMeta.unpack_fields(
+                        unpacker, fields["ledger_close_metas"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"ledger_close_metas length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                LedgerCloseMeta.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "start_sequence", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "end_sequence", Uint32.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"ledger_close_metas length {length} exceeds remaining input length {_remaining}"
+            )
+        ledger_close_metas = []
+        for _ in range(length):
+            ledger_close_metas.append(
+                unpack_view(LedgerCloseMeta, unpacker, depth_limit - 1)
+            )
+        yield "ledger_close_metas", ledger_close_metas
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerCloseMetaBatch:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerCloseMetaBatch:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -100,11 +215,11 @@ class LedgerCloseMetaBatch:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerCloseMetaBatch:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -129,6 +244,30 @@ class LedgerCloseMetaBatch:
             ledger_close_metas=ledger_close_metas,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"start_sequence": ')
+        self.start_sequence._write_json(write)
+        write(', "end_sequence": ')
+        self.end_sequence._write_json(write)
+        write(', "ledger_close_metas": ')
+        write_json_array(write, self.ledger_close_metas)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerCloseMetaBatch:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.start_sequence = self.start_sequence.clone()
+        result.end_sequence = self.end_sequence.clone()
+        result.ledger_close_metas = [item.clone() for item in self.ledger_close_metas]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerCloseMetaBatch:
+        return self.clone()
+
+    def freeze(self) -> LedgerCloseMetaBatch:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
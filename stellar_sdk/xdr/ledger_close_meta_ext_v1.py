@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .extension_point import ExtensionPoint
 from .int64 import Int64
 
@@ -25,6 +35,8 @@ class LedgerCloseMetaExtV1:
         };
     """
 
+    __slots__ = ("ext", "soroban_fee_write1_kb")
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -37,6 +49,9 @@ class LedgerCloseMetaExtV1:
         self.ext.pack(packer)
         self.soroban_fee_write1_kb.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class LedgerCloseMetaExtV1:
             soroban_fee_write1_kb=soroban_fee_write1_kb,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerCloseMetaExtV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "soroban_fee_write1_kb" in fields:
+            _result["soroban_fee_write1_kb"] = Int64.unpack_fields(
+                unpacker, fields["soroban_fee_write1_kb"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerCloseMetaExtV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerCloseMetaExtV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class LedgerCloseMetaExtV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerCloseMetaExtV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class LedgerCloseMetaExtV1:
             soroban_fee_write1_kb=soroban_fee_write1_kb,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "soroban_fee_write1_kb": ')
+        self.soroban_fee_write1_kb._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerCloseMetaExtV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.soroban_fee_write1_kb = self.soroban_fee_write1_kb.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerCloseMetaExtV1:
+        return self.clone()
+
+    def freeze(self) -> LedgerCloseMetaExtV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .ledger_header_history_entry import LedgerHeaderHistoryEntry
 from .scp_history_entry import SCPHistoryEntry
 from .transaction_result_meta import TransactionResultMeta
@@ -40,6 +55,14 @@ class LedgerCloseMetaV0:
         };
     """
 
+    __slots__ = (
+        "ledger_header",
+        "scp_info",
+        "tx_processing",
+        "tx_set",
+        "upgrades_processing",
+    )
+
     def __init__(
         self,
         ledger_header: LedgerHeaderHistoryEntry,
@@ -82,6 +105,18 @@ class LedgerCloseMetaV0:
         for scp_info_item in self.scp_info:
             scp_info_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.ledger_header.xdr_size()
+            + self.tx_set.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.tx_processing)
+            + 4
+            + sum(item.xdr_size() for item in self.upgrades_processing)
+            + 4
+            + sum(item.xdr_size() for item in self.scp_info)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -129,16 +164,200 @@ class LedgerCloseMetaV0:
             scp_info=scp_info,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LedgerHeaderHistoryEntry.skip(unpacker, depth_limit - 1)
+        TransactionSet.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionResultMeta.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            UpgradeEntryMeta.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"scp_info length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPHistoryEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerCloseMetaV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_header" in fields:
+            _result["ledger_header"] = LedgerHeaderHistoryEntry.unpack_fields(
+                unpacker, fields["ledger_header"], depth_limit - 1
+            )
+        else:
+            LedgerHeaderHistoryEntry.skip(unpacker, depth_limit - 1)
+        if "tx_set" in fields:
+            _result["tx_set"] = TransactionSet.unpack_fields(
+                unpacker, fields["tx_set"], depth_limit - 1
+            )
+        else:
+            TransactionSet.skip(unpacker, depth_limit - 1)
+        if "tx_processing" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["tx_processing"] = []
+            for _ in range(length):
+                _result["tx_processing"].append(
+                    TransactionResultMeta.unpack_fields(
+                        unpacker, fields["tx_processing"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionResultMeta.skip(unpacker, depth_limit - 1)
+        if "upgrades_processing" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["upgrades_processing"] = []
+            for _ in range(length):
+                _result["upgrades_processing"].append(
+                    UpgradeEntryMeta.unpack_fields(
+                        unpacker, fields["upgrades_processing"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                UpgradeEntryMeta.skip(unpacker, depth_limit - 1)
+        if "scp_info" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"scp_info length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["scp_info"] = []
+            for _ in range(length):
+                _result["scp_info"].append(
+                    SCPHistoryEntry.unpack_fields(
+                        unpacker, fields["scp_info"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"scp_info length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPHistoryEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ledger_header = view_at(LedgerHeaderHistoryEntry, unpacker, depth_limit - 1)
+        yield "ledger_header", ledger_header
+        LedgerHeaderHistoryEntry.skip(unpacker, depth_limit - 1)
+        tx_set = view_at(TransactionSet, unpacker, depth_limit - 1)
+        yield "tx_set", tx_set
+        TransactionSet.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        tx_processing = []
+        for _ in range(length):
+            tx_processing.append(
+                unpack_view(TransactionResultMeta, unpacker, depth_limit - 1)
+            )
+        yield "tx_processing", tx_processing
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        upgrades_processing = []
+        for _ in range(length):
+            upgrades_processing.append(
+                unpack_view(UpgradeEntryMeta, unpacker, depth_limit - 1)
+            )
+        yield "upgrades_processing", upgrades_processing
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"scp_info length {length} exceeds remaining input length {_remaining}"
+            )
+        scp_info = []
+        for _ in range(length):
+            scp_info.append(unpack_view(SCPHistoryEntry, unpacker, depth_limit - 1))
+        yield "scp_info", scp_info
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerCloseMetaV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerCloseMetaV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -153,11 +372,11 @@ class LedgerCloseMetaV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerCloseMetaV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -195,6 +414,36 @@ class LedgerCloseMetaV0:
             scp_info=scp_info,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_header": ')
+        self.ledger_header._write_json(write)
+        write(', "tx_set": ')
+        self.tx_set._write_json(write)
+        write(', "tx_processing": ')
+        write_json_array(write, self.tx_processing)
+        write(', "upgrades_processing": ')
+        write_json_array(write, self.upgrades_processing)
+        write(', "scp_info": ')
+        write_json_array(write, self.scp_info)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerCloseMetaV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_header = self.ledger_header.clone()
+        result.tx_set = self.tx_set.clone()
+        result.tx_processing = [item.clone() for item in self.tx_processing]
+        result.upgrades_processing = [item.clone() for item in self.upgrades_processing]
+        result.scp_info = [item.clone() for item in self.scp_info]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerCloseMetaV0:
+        return self.clone()
+
+    def freeze(self) -> LedgerCloseMetaV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .generalized_transaction_set import GeneralizedTransactionSet
 from .ledger_close_meta_ext import LedgerCloseMetaExt
 from .ledger_entry import LedgerEntry
@@ -56,6 +71,18 @@ class LedgerCloseMetaV1:
         };
     """
 
+    __slots__ = (
+        "evicted_keys",
+        "ext",
+        "ledger_header",
+        "scp_info",
+        "total_byte_size_of_live_soroban_state",
+        "tx_processing",
+        "tx_set",
+        "unused",
+        "upgrades_processing",
+    )
+
     def __init__(
         self,
         ext: LedgerCloseMetaExt,
@@ -126,6 +153,24 @@ class LedgerCloseMetaV1:
         for unused_item in self.unused:
             unused_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            8
+            + self.ext.xdr_size()
+            + self.ledger_header.xdr_size()
+            + self.tx_set.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.tx_processing)
+            + 4
+            + sum(item.xdr_size() for item in self.upgrades_processing)
+            + 4
+            + sum(item.xdr_size() for item in self.scp_info)
+            + 4
+            + sum(item.xdr_size() for item in self.evicted_keys)
+            + 4
+            + sum(item.xdr_size() for item in self.unused)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -197,16 +242,303 @@ class LedgerCloseMetaV1:
             unused=unused,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LedgerCloseMetaExt.skip(unpacker, depth_limit - 1)
+        LedgerHeaderHistoryEntry.skip(unpacker, depth_limit - 1)
+        GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionResultMeta.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            UpgradeEntryMeta.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"scp_info length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPHistoryEntry.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"evicted_keys length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            LedgerKey.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"unused length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerCloseMetaV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = LedgerCloseMetaExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            LedgerCloseMetaExt.skip(unpacker, depth_limit - 1)
+        if "ledger_header" in fields:
+            _result["ledger_header"] = LedgerHeaderHistoryEntry.unpack_fields(
+                unpacker, fields["ledger_header"], depth_limit - 1
+            )
+        else:
+            LedgerHeaderHistoryEntry.skip(unpacker, depth_limit - 1)
+        if "tx_set" in fields:
+            _result["tx_set"] = GeneralizedTransactionSet.unpack_fields(
+                unpacker, fields["tx_set"], depth_limit - 1
+            )
+        else:
+            GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+        if "tx_processing" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["tx_processing"] = []
+            for _ in range(length):
+                _result["tx_processing"].append(
+                    TransactionResultMeta.unpack_fields(
+                        unpacker, fields["tx_processing"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionResultMeta.skip(unpacker, depth_limit - 1)
+        if "upgrades_processing" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["upgrades_processing"] = []
+            for _ in range(length):
+                _result["upgrades_processing"].append(
+                    UpgradeEntryMeta.unpack_fields(
+                        unpacker, fields["upgrades_processing"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                UpgradeEntryMeta.skip(unpacker, depth_limit - 1)
+        if "scp_info" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"scp_info length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["scp_info"] = []
+            for _ in range(length):
+                _result["scp_info"].append(
+                    SCPHistoryEntry.unpack_fields(
+                        unpacker, fields["scp_info"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"scp_info length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPHistoryEntry.skip(unpacker, depth_limit - 1)
+        if "total_byte_size_of_live_soroban_state" in fields:
+            _result["total_byte_size_of_live_soroban_state"] = Uint64.unpack_fields(
+                unpacker,
+                fields["total_byte_size_of_live_soroban_state"],
+                depth_limit - 1,
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "evicted_keys" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"evicted_keys length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["evicted_keys"] = []
+            for _ in range(length):
+                _result["evicted_keys"].append(
+                    LedgerKey.unpack_fields(
+                        unpacker, fields["evicted_keys"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"evicted_keys length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                LedgerKey.skip(unpacker, depth_limit - 1)
+        if "unused" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"unused length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["unused"] = []
+            for _ in range(length):
+                _result["unused"].append(
+                    LedgerEntry.unpack_fields(
+                        unpacker, fields["unused"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"unused length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", LedgerCloseMetaExt.unpack(unpacker, depth_limit - 1)
+        ledger_header = view_at(LedgerHeaderHistoryEntry, unpacker, depth_limit - 1)
+        yield "ledger_header", ledger_header
+        LedgerHeaderHistoryEntry.skip(unpacker, depth_limit - 1)
+        tx_set = view_at(GeneralizedTransactionSet, unpacker, depth_limit - 1)
+        yield "tx_set", tx_set
+        GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        tx_processing = []
+        for _ in range(length):
+            tx_processing.append(
+                unpack_view(TransactionResultMeta, unpacker, depth_limit - 1)
+            )
+        yield "tx_processing", tx_processing
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"upgrades_processing length {length} exceeds remaining input length {_remaining}"
+            )
+        upgrades_processing = []
+        for _ in range(length):
+            upgrades_processing.append(
+                unpack_view(UpgradeEntryMeta, unpacker, depth_limit - 1)
+            )
+        yield "upgrades_processing", upgrades_processing
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"scp_info length {length} exceeds remaining input length {_remaining}"
+            )
+        scp_info = []
+        for _ in range(length):
+            scp_info.append(unpack_view(SCPHistoryEntry, unpacker, depth_limit - 1))
+        yield "scp_info", scp_info
+        yield (
+            "total_byte_size_of_live_soroban_state",
+            Uint64.unpack(unpacker, depth_limit - 1),
+        )
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"evicted_keys length {length} exceeds remaining input length {_remaining}"
+            )
+        evicted_keys = []
+        for _ in range(length):
+            evicted_keys.append(unpack_view(LedgerKey, unpacker, depth_limit - 1))
+        yield "evicted_keys", evicted_keys
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"unused length {length} exceeds remaining input length {_remaining}"
+            )
+        unused = []
+        for _ in range(length):
+            unused.append(unpack_view(LedgerEntry, unpacker, depth_limit - 1))
+        yield "unused", unused
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerCloseMetaV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerCloseMetaV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -221,11 +553,11 @@ class LedgerCloseMetaV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerCloseMetaV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -279,6 +611,50 @@ class LedgerCloseMetaV1:
             unused=unused,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "ledger_header": ')
+        self.ledger_header._write_json(write)
+        write(', "tx_set": ')
+        self.tx_set._write_json(write)
+        write(', "tx_processing": ')
+        write_json_array(write, self.tx_processing)
+        write(', "upgrades_processing": ')
+        write_json_array(write, self.upgrades_processing)
+        write(', "scp_info": ')
+        write_json_array(write, self.scp_info)
+        write(', "total_byte_size_of_live_soroban_state": ')
+        self.total_byte_size_of_live_soroban_state._write_json(write)
+        write(', "evicted_keys": ')
+        write_json_array(write, self.evicted_keys)
+        write(', "unused": ')
+        write_json_array(write, self.unused)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerCloseMetaV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.ledger_header = self.ledger_header.clone()
+        result.tx_set = self.tx_set.clone()
+        result.tx_processing = [item.clone() for item in self.tx_processing]
+        result.upgrades_processing = [item.clone() for item in self.upgrades_processing]
+        result.scp_info = [item.clone() for item in self.scp_info]
+        result.total_byte_size_of_live_soroban_state = (
+            self.total_byte_size_of_live_soroban_state.clone()
+        )
+        result.evicted_keys = [item.clone() for item in self.evicted_keys]
+        result.unused = [item.clone() for item in self.unused]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerCloseMetaV1:
+        return self.clone()
+
+    def freeze(self) -> LedgerCloseMetaV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
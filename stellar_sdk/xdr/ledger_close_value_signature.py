@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .node_id import NodeID
 from .signature import Signature
 
@@ -25,6 +35,8 @@ class LedgerCloseValueSignature:
         };
     """
 
+    __slots__ = ("node_id", "signature")
+
     def __init__(
         self,
         node_id: NodeID,
@@ -37,6 +49,9 @@ class LedgerCloseValueSignature:
         self.node_id.pack(packer)
         self.signature.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.node_id.xdr_size() + self.signature.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class LedgerCloseValueSignature:
             signature=signature,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        NodeID.skip(unpacker, depth_limit - 1)
+        Signature.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerCloseValueSignature:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "node_id" in fields:
+            _result["node_id"] = NodeID.unpack_fields(
+                unpacker, fields["node_id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "signature" in fields:
+            _result["signature"] = Signature.unpack_fields(
+                unpacker, fields["signature"], depth_limit - 1
+            )
+        else:
+            Signature.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerCloseValueSignature:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerCloseValueSignature:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class LedgerCloseValueSignature:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerCloseValueSignature:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class LedgerCloseValueSignature:
             signature=signature,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"node_id": ')
+        self.node_id._write_json(write)
+        write(', "signature": ')
+        self.signature._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerCloseValueSignature:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.node_id = self.node_id.clone()
+        result.signature = self.signature.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerCloseValueSignature:
+        return self.clone()
+
+    def freeze(self) -> LedgerCloseValueSignature:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_entry_data import LedgerEntryData
 from .ledger_entry_ext import LedgerEntryExt
 from .uint32 import Uint32
@@ -60,6 +73,8 @@ class LedgerEntry:
         };
     """
 
+    __slots__ = ("data", "ext", "last_modified_ledger_seq")
+
     def __init__(
         self,
         last_modified_ledger_seq: Uint32,
@@ -75,6 +90,9 @@ class LedgerEntry:
         self.data.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.data.xdr_size() + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -90,16 +108,77 @@ class LedgerEntry:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        LedgerEntryData.skip(unpacker, depth_limit - 1)
+        LedgerEntryExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "last_modified_ledger_seq" in fields:
+            _result["last_modified_ledger_seq"] = Uint32.unpack_fields(
+                unpacker, fields["last_modified_ledger_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "data" in fields:
+            _result["data"] = LedgerEntryData.unpack_fields(
+                unpacker, fields["data"], depth_limit - 1
+            )
+        else:
+            LedgerEntryData.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = LedgerEntryExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            LedgerEntryExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "last_modified_ledger_seq", Uint32.unpack(unpacker, depth_limit - 1)
+        data = view_at(LedgerEntryData, unpacker, depth_limit - 1)
+        yield "data", data
+        LedgerEntryData.skip(unpacker, depth_limit - 1)
+        yield "ext", LedgerEntryExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -114,11 +193,11 @@ class LedgerEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -140,6 +219,30 @@ class LedgerEntry:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"last_modified_ledger_seq": ')
+        self.last_modified_ledger_seq._write_json(write)
+        write(', "data": ')
+        self.data._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.last_modified_ledger_seq = self.last_modified_ledger_seq.clone()
+        result.data = self.data.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerEntry:
+        return self.clone()
+
+    def freeze(self) -> LedgerEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
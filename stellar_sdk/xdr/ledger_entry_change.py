@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_entry import LedgerEntry
 from .ledger_entry_change_type import LedgerEntryChangeType
 from .ledger_key import LedgerKey
@@ -34,6 +47,8 @@ class LedgerEntryChange:
         };
     """
 
+    __slots__ = ("created", "removed", "restored", "state", "type", "updated")
+
     def __init__(
         self,
         type: LedgerEntryChangeType,
@@ -79,28 +94,147 @@ class LedgerEntryChange:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_CREATED:
+            assert self.created is not None
+            return 4 + self.created.xdr_size()
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_UPDATED:
+            assert self.updated is not None
+            return 4 + self.updated.xdr_size()
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_REMOVED:
+            assert self.removed is not None
+            return 4 + self.removed.xdr_size()
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_STATE:
+            assert self.state is not None
+            return 4 + self.state.xdr_size()
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_RESTORED:
+            assert self.restored is not None
+            return 4 + self.restored.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> LedgerEntryChange:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = LedgerEntryChangeType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = LedgerEntryChangeType.unpack(unpacker)
         if type == LedgerEntryChangeType.LEDGER_ENTRY_CREATED:
-            created = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, created=created)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryChangeType.LEDGER_ENTRY_UPDATED:
-            updated = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, updated=updated)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryChangeType.LEDGER_ENTRY_REMOVED:
-            removed = LedgerKey.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, removed=removed)
+            LedgerKey.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryChangeType.LEDGER_ENTRY_STATE:
-            state = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, state=state)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryChangeType.LEDGER_ENTRY_RESTORED:
-            restored = LedgerEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, restored=restored)
+            LedgerEntry.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerEntryChange:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = LedgerEntryChangeType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_CREATED:
+            if "created" in fields:
+                _result["created"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["created"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_UPDATED:
+            if "updated" in fields:
+                _result["updated"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["updated"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_REMOVED:
+            if "removed" in fields:
+                _result["removed"] = LedgerKey.unpack_fields(
+                    unpacker, fields["removed"], depth_limit - 1
+                )
+            else:
+                LedgerKey.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_STATE:
+            if "state" in fields:
+                _result["state"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["state"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_RESTORED:
+            if "restored" in fields:
+                _result["restored"] = LedgerEntry.unpack_fields(
+                    unpacker, fields["restored"], depth_limit - 1
+                )
+            else:
+                LedgerEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = LedgerEntryChangeType.unpack(unpacker)
+        yield "type", type
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_CREATED:
+            yield "created", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_UPDATED:
+            yield "updated", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_REMOVED:
+            yield "removed", view_at(LedgerKey, unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_STATE:
+            yield "state", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryChangeType.LEDGER_ENTRY_RESTORED:
+            yield "restored", view_at(LedgerEntry, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -109,10 +243,12 @@ class LedgerEntryChange:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerEntryChange:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerEntryChange:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -127,11 +263,11 @@ class LedgerEntryChange:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerEntryChange:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == LedgerEntryChangeType.LEDGER_ENTRY_CREATED:
@@ -176,6 +312,57 @@ class LedgerEntryChange:
             return cls(type=type, restored=restored)
         raise ValueError(f"Unknown key '{key}' for LedgerEntryChange")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_CREATED:
+            assert self.created is not None
+            write('{"created": ')
+            self.created._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_UPDATED:
+            assert self.updated is not None
+            write('{"updated": ')
+            self.updated._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_REMOVED:
+            assert self.removed is not None
+            write('{"removed": ')
+            self.removed._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_STATE:
+            assert self.state is not None
+            write('{"state": ')
+            self.state._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryChangeType.LEDGER_ENTRY_RESTORED:
+            assert self.restored is not None
+            write('{"restored": ')
+            self.restored._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in LedgerEntryChange: {self.type}")
+
+    def clone(self, deep: bool = True) -> LedgerEntryChange:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.created = self.created.clone() if self.created is not None else None
+        result.updated = self.updated.clone() if self.updated is not None else None
+        result.removed = self.removed.clone() if self.removed is not None else None
+        result.state = self.state.clone() if self.state is not None else None
+        result.restored = self.restored.clone() if self.restored is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerEntryChange:
+        return self.clone()
+
+    def freeze(self) -> LedgerEntryChange:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -214,3 +401,45 @@ class LedgerEntryChange:
         if self.restored is not None:
             out.append(f"restored={self.restored}")
         return f"<LedgerEntryChange [{', '.join(out)}]>"
+
+
+def _unpack_created(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryChange:
+    created = LedgerEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, created=created)
+
+
+def _unpack_updated(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryChange:
+    updated = LedgerEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, updated=updated)
+
+
+def _unpack_removed(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryChange:
+    removed = LedgerKey.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, removed=removed)
+
+
+def _unpack_state(cls, type, unpacker: Unpacker, depth_limit: int) -> LedgerEntryChange:
+    state = LedgerEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, state=state)
+
+
+def _unpack_restored(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryChange:
+    restored = LedgerEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, restored=restored)
+
+
+_UNPACK_ARMS = {
+    LedgerEntryChangeType.LEDGER_ENTRY_CREATED: _unpack_created,
+    LedgerEntryChangeType.LEDGER_ENTRY_UPDATED: _unpack_updated,
+    LedgerEntryChangeType.LEDGER_ENTRY_REMOVED: _unpack_removed,
+    LedgerEntryChangeType.LEDGER_ENTRY_STATE: _unpack_state,
+    LedgerEntryChangeType.LEDGER_ENTRY_RESTORED: _unpack_restored,
+}
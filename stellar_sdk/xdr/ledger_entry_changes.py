@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .ledger_entry_change import LedgerEntryChange
 
 __all__ = ["LedgerEntryChanges"]
@@ -20,6 +34,8 @@ class LedgerEntryChanges:
         typedef LedgerEntryChange LedgerEntryChanges<>;
     """
 
+    __slots__ = ("ledger_entry_changes",)
+
     def __init__(self, ledger_entry_changes: list[LedgerEntryChange]) -> None:
         _expect_max_length = 4294967295
         if ledger_entry_changes and len(ledger_entry_changes) > _expect_max_length:
@@ -33,6 +49,9 @@ class LedgerEntryChanges:
         for ledger_entry_changes_item in self.ledger_entry_changes:
             ledger_entry_changes_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.ledger_entry_changes)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -52,16 +71,96 @@ class LedgerEntryChanges:
             )
         return cls(ledger_entry_changes)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"ledger_entry_changes length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            LedgerEntryChange.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerEntryChanges:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_entry_changes" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"ledger_entry_changes length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["ledger_entry_changes"] = []
+            for _ in range(length):
+                _result["ledger_entry_changes"].append(
+                    LedgerEntryChange.unpack_fields(
+                        unpacker, fields["ledger_entry_changes"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"ledger_entry_changes length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                LedgerEntryChange.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"ledger_entry_changes length {length} exceeds remaining input length {_remaining}"
+            )
+        ledger_entry_changes = []
+        for _ in range(length):
+            ledger_entry_changes.append(
+                unpack_view(LedgerEntryChange, unpacker, depth_limit - 1)
+            )
+        yield "ledger_entry_changes", ledger_entry_changes
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerEntryChanges:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerEntryChanges:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -76,11 +175,11 @@ class LedgerEntryChanges:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerEntryChanges:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.ledger_entry_changes]
@@ -89,6 +188,24 @@ class LedgerEntryChanges:
     def from_json_dict(cls, json_value: list) -> LedgerEntryChanges:
         return cls([LedgerEntryChange.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.ledger_entry_changes)
+
+    def clone(self, deep: bool = True) -> LedgerEntryChanges:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_entry_changes = [
+            item.clone() for item in self.ledger_entry_changes
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerEntryChanges:
+        return self.clone()
+
+    def freeze(self) -> LedgerEntryChanges:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.ledger_entry_changes,))
 
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_entry import AccountEntry
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .claimable_balance_entry import ClaimableBalanceEntry
 from .config_setting_entry import ConfigSettingEntry
 from .contract_code_entry import ContractCodeEntry
@@ -52,6 +65,20 @@ class LedgerEntryData:
             }
     """
 
+    __slots__ = (
+        "account",
+        "claimable_balance",
+        "config_setting",
+        "contract_code",
+        "contract_data",
+        "data",
+        "liquidity_pool",
+        "offer",
+        "trust_line",
+        "ttl",
+        "type",
+    )
+
     def __init__(
         self,
         type: LedgerEntryType,
@@ -132,43 +159,237 @@ class LedgerEntryData:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == LedgerEntryType.ACCOUNT:
+            assert self.account is not None
+            return 4 + self.account.xdr_size()
+        if self.type == LedgerEntryType.TRUSTLINE:
+            assert self.trust_line is not None
+            return 4 + self.trust_line.xdr_size()
+        if self.type == LedgerEntryType.OFFER:
+            assert self.offer is not None
+            return 4 + self.offer.xdr_size()
+        if self.type == LedgerEntryType.DATA:
+            assert self.data is not None
+            return 4 + self.data.xdr_size()
+        if self.type == LedgerEntryType.CLAIMABLE_BALANCE:
+            assert self.claimable_balance is not None
+            return 4 + self.claimable_balance.xdr_size()
+        if self.type == LedgerEntryType.LIQUIDITY_POOL:
+            assert self.liquidity_pool is not None
+            return 4 + self.liquidity_pool.xdr_size()
+        if self.type == LedgerEntryType.CONTRACT_DATA:
+            assert self.contract_data is not None
+            return 4 + self.contract_data.xdr_size()
+        if self.type == LedgerEntryType.CONTRACT_CODE:
+            assert self.contract_code is not None
+            return 4 + self.contract_code.xdr_size()
+        if self.type == LedgerEntryType.CONFIG_SETTING:
+            assert self.config_setting is not None
+            return 4 + self.config_setting.xdr_size()
+        if self.type == LedgerEntryType.TTL:
+            return 40
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> LedgerEntryData:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = LedgerEntryType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = LedgerEntryType.unpack(unpacker)
         if type == LedgerEntryType.ACCOUNT:
-            account = AccountEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, account=account)
+            AccountEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.TRUSTLINE:
-            trust_line = TrustLineEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, trust_line=trust_line)
+            TrustLineEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.OFFER:
-            offer = OfferEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, offer=offer)
+            OfferEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.DATA:
-            data = DataEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, data=data)
+            DataEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.CLAIMABLE_BALANCE:
-            claimable_balance = ClaimableBalanceEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, claimable_balance=claimable_balance)
+            ClaimableBalanceEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.LIQUIDITY_POOL:
-            liquidity_pool = LiquidityPoolEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, liquidity_pool=liquidity_pool)
+            LiquidityPoolEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.CONTRACT_DATA:
-            contract_data = ContractDataEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, contract_data=contract_data)
+            ContractDataEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.CONTRACT_CODE:
-            contract_code = ContractCodeEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, contract_code=contract_code)
+            ContractCodeEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.CONFIG_SETTING:
-            config_setting = ConfigSettingEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, config_setting=config_setting)
+            ConfigSettingEntry.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerEntryType.TTL:
-            ttl = TTLEntry.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, ttl=ttl)
+            TTLEntry.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerEntryData:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = LedgerEntryType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == LedgerEntryType.ACCOUNT:
+            if "account" in fields:
+                _result["account"] = AccountEntry.unpack_fields(
+                    unpacker, fields["account"], depth_limit - 1
+                )
+            else:
+                AccountEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.TRUSTLINE:
+            if "trust_line" in fields:
+                _result["trust_line"] = TrustLineEntry.unpack_fields(
+                    unpacker, fields["trust_line"], depth_limit - 1
+                )
+            else:
+                TrustLineEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.OFFER:
+            if "offer" in fields:
+                _result["offer"] = OfferEntry.unpack_fields(
+                    unpacker, fields["offer"], depth_limit - 1
+                )
+            else:
+                OfferEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.DATA:
+            if "data" in fields:
+                _result["data"] = DataEntry.unpack_fields(
+                    unpacker, fields["data"], depth_limit - 1
+                )
+            else:
+                DataEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.CLAIMABLE_BALANCE:
+            if "claimable_balance" in fields:
+                _result["claimable_balance"] = ClaimableBalanceEntry.unpack_fields(
+                    unpacker, fields["claimable_balance"], depth_limit - 1
+                )
+            else:
+                ClaimableBalanceEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.LIQUIDITY_POOL:
+            if "liquidity_pool" in fields:
+                _result["liquidity_pool"] = LiquidityPoolEntry.unpack_fields(
+                    unpacker, fields["liquidity_pool"], depth_limit - 1
+                )
+            else:
+                LiquidityPoolEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.CONTRACT_DATA:
+            if "contract_data" in fields:
+                _result["contract_data"] = ContractDataEntry.unpack_fields(
+                    unpacker, fields["contract_data"], depth_limit - 1
+                )
+            else:
+                ContractDataEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.CONTRACT_CODE:
+            if "contract_code" in fields:
+                _result["contract_code"] = ContractCodeEntry.unpack_fields(
+                    unpacker, fields["contract_code"], depth_limit - 1
+                )
+            else:
+                ContractCodeEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.CONFIG_SETTING:
+            if "config_setting" in fields:
+                _result["config_setting"] = ConfigSettingEntry.unpack_fields(
+                    unpacker, fields["config_setting"], depth_limit - 1
+                )
+            else:
+                ConfigSettingEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerEntryType.TTL:
+            if "ttl" in fields:
+                _result["ttl"] = TTLEntry.unpack_fields(
+                    unpacker, fields["ttl"], depth_limit - 1
+                )
+            else:
+                TTLEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = LedgerEntryType.unpack(unpacker)
+        yield "type", type
+        if type == LedgerEntryType.ACCOUNT:
+            yield "account", view_at(AccountEntry, unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.TRUSTLINE:
+            yield "trust_line", TrustLineEntry.unpack(unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.OFFER:
+            yield "offer", OfferEntry.unpack(unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.DATA:
+            yield "data", DataEntry.unpack(unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.CLAIMABLE_BALANCE:
+            yield (
+                "claimable_balance",
+                view_at(ClaimableBalanceEntry, unpacker, depth_limit - 1),
+            )
+            return
+        if type == LedgerEntryType.LIQUIDITY_POOL:
+            yield "liquidity_pool", LiquidityPoolEntry.unpack(unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.CONTRACT_DATA:
+            yield "contract_data", view_at(ContractDataEntry, unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.CONTRACT_CODE:
+            yield "contract_code", ContractCodeEntry.unpack(unpacker, depth_limit - 1)
+            return
+        if type == LedgerEntryType.CONFIG_SETTING:
+            yield (
+                "config_setting",
+                view_at(ConfigSettingEntry, unpacker, depth_limit - 1),
+            )
+            return
+        if type == LedgerEntryType.TTL:
+            yield "ttl", TTLEntry.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -177,10 +398,10 @@ class LedgerEntryData:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerEntryData:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerEntryData:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -195,11 +416,11 @@ class LedgerEntryData:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerEntryData:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == LedgerEntryType.ACCOUNT:
@@ -284,6 +505,106 @@ class LedgerEntryData:
             return cls(type=type, ttl=ttl)
         raise ValueError(f"Unknown key '{key}' for LedgerEntryData")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == LedgerEntryType.ACCOUNT:
+            assert self.account is not None
+            write('{"account": ')
+            self.account._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.TRUSTLINE:
+            assert self.trust_line is not None
+            write('{"trustline": ')
+            self.trust_line._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.OFFER:
+            assert self.offer is not None
+            write('{"offer": ')
+            self.offer._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.DATA:
+            assert self.data is not None
+            write('{"data": ')
+            self.data._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.CLAIMABLE_BALANCE:
+            assert self.claimable_balance is not None
+            write('{"claimable_balance": ')
+            self.claimable_balance._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.LIQUIDITY_POOL:
+            assert self.liquidity_pool is not None
+            write('{"liquidity_pool": ')
+            self.liquidity_pool._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.CONTRACT_DATA:
+            assert self.contract_data is not None
+            write('{"contract_data": ')
+            self.contract_data._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.CONTRACT_CODE:
+            assert self.contract_code is not None
+            write('{"contract_code": ')
+            self.contract_code._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.CONFIG_SETTING:
+            assert self.config_setting is not None
+            write('{"config_setting": ')
+            self.config_setting._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerEntryType.TTL:
+            assert self.ttl is not None
+            write('{"ttl": ')
+            self.ttl._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in LedgerEntryData: {self.type}")
+
+    def clone(self, deep: bool = True) -> LedgerEntryData:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.account = self.account.clone() if self.account is not None else None
+        result.trust_line = (
+            self.trust_line.clone() if self.trust_line is not None else None
+        )
+        result.offer = self.offer.clone() if self.offer is not None else None
+        result.data = self.data.clone() if self.data is not None else None
+        result.claimable_balance = (
+            self.claimable_balance.clone()
+            if self.claimable_balance is not None
+            else None
+        )
+        result.liquidity_pool = (
+            self.liquidity_pool.clone() if self.liquidity_pool is not None else None
+        )
+        result.contract_data = (
+            self.contract_data.clone() if self.contract_data is not None else None
+        )
+        result.contract_code = (
+            self.contract_code.clone() if self.contract_code is not None else None
+        )
+        result.config_setting = (
+            self.config_setting.clone() if self.config_setting is not None else None
+        )
+        result.ttl = self.ttl.clone() if self.ttl is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerEntryData:
+        return self.clone()
+
+    def freeze(self) -> LedgerEntryData:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -342,3 +663,79 @@ class LedgerEntryData:
         if self.ttl is not None:
             out.append(f"ttl={self.ttl}")
         return f"<LedgerEntryData [{', '.join(out)}]>"
+
+
+def _unpack_account(cls, type, unpacker: Unpacker, depth_limit: int) -> LedgerEntryData:
+    account = AccountEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, account=account)
+
+
+def _unpack_trust_line(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryData:
+    trust_line = TrustLineEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, trust_line=trust_line)
+
+
+def _unpack_offer(cls, type, unpacker: Unpacker, depth_limit: int) -> LedgerEntryData:
+    offer = OfferEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, offer=offer)
+
+
+def _unpack_data(cls, type, unpacker: Unpacker, depth_limit: int) -> LedgerEntryData:
+    data = DataEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, data=data)
+
+
+def _unpack_claimable_balance(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryData:
+    claimable_balance = ClaimableBalanceEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, claimable_balance=claimable_balance)
+
+
+def _unpack_liquidity_pool(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryData:
+    liquidity_pool = LiquidityPoolEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, liquidity_pool=liquidity_pool)
+
+
+def _unpack_contract_data(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryData:
+    contract_data = ContractDataEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, contract_data=contract_data)
+
+
+def _unpack_contract_code(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryData:
+    contract_code = ContractCodeEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, contract_code=contract_code)
+
+
+def _unpack_config_setting(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerEntryData:
+    config_setting = ConfigSettingEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, config_setting=config_setting)
+
+
+def _unpack_ttl(cls, type, unpacker: Unpacker, depth_limit: int) -> LedgerEntryData:
+    ttl = TTLEntry.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, ttl=ttl)
+
+
+_UNPACK_ARMS = {
+    LedgerEntryType.ACCOUNT: _unpack_account,
+    LedgerEntryType.TRUSTLINE: _unpack_trust_line,
+    LedgerEntryType.OFFER: _unpack_offer,
+    LedgerEntryType.DATA: _unpack_data,
+    LedgerEntryType.CLAIMABLE_BALANCE: _unpack_claimable_balance,
+    LedgerEntryType.LIQUIDITY_POOL: _unpack_liquidity_pool,
+    LedgerEntryType.CONTRACT_DATA: _unpack_contract_data,
+    LedgerEntryType.CONTRACT_CODE: _unpack_contract_code,
+    LedgerEntryType.CONFIG_SETTING: _unpack_config_setting,
+    LedgerEntryType.TTL: _unpack_ttl,
+}
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .ledger_entry_extension_v1_ext import LedgerEntryExtensionV1Ext
 from .sponsorship_descriptor import SponsorshipDescriptor
 
@@ -31,6 +41,8 @@ class LedgerEntryExtensionV1:
         };
     """
 
+    __slots__ = ("ext", "sponsoring_id")
+
     def __init__(
         self,
         sponsoring_id: SponsorshipDescriptor,
@@ -43,6 +55,9 @@ class LedgerEntryExtensionV1:
         self.sponsoring_id.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.sponsoring_id.xdr_size() + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,16 +71,58 @@ class LedgerEntryExtensionV1:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SponsorshipDescriptor.skip(unpacker, depth_limit - 1)
+        LedgerEntryExtensionV1Ext.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerEntryExtensionV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sponsoring_id" in fields:
+            _result["sponsoring_id"] = SponsorshipDescriptor.unpack_fields(
+                unpacker, fields["sponsoring_id"], depth_limit - 1
+            )
+        else:
+            SponsorshipDescriptor.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = LedgerEntryExtensionV1Ext.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            LedgerEntryExtensionV1Ext.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerEntryExtensionV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerEntryExtensionV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -80,11 +137,11 @@ class LedgerEntryExtensionV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerEntryExtensionV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -101,6 +158,27 @@ class LedgerEntryExtensionV1:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"sponsoring_id": ')
+        self.sponsoring_id._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerEntryExtensionV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sponsoring_id = self.sponsoring_id.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerEntryExtensionV1:
+        return self.clone()
+
+    def freeze(self) -> LedgerEntryExtensionV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .ledger_key import LedgerKey
 
 __all__ = ["LedgerFootprint"]
@@ -24,6 +38,8 @@ class LedgerFootprint:
         };
     """
 
+    __slots__ = ("read_only", "read_write")
+
     def __init__(
         self,
         read_only: list[LedgerKey],
@@ -50,6 +66,14 @@ class LedgerFootprint:
         for read_write_item in self.read_write:
             read_write_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + sum(item.xdr_size() for item in self.read_only)
+            + 4
+            + sum(item.xdr_size() for item in self.read_write)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -79,16 +103,133 @@ class LedgerFootprint:
             read_write=read_write,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"read_only length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            LedgerKey.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"read_write length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            LedgerKey.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerFootprint:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "read_only" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"read_only length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["read_only"] = []
+            for _ in range(length):
+                _result["read_only"].append(
+                    LedgerKey.unpack_fields(
+                        unpacker, fields["read_only"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"read_only length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                LedgerKey.skip(unpacker, depth_limit - 1)
+        if "read_write" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"read_write length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["read_write"] = []
+            for _ in range(length):
+                _result["read_write"].append(
+                    LedgerKey.unpack_fields(
+                        unpacker, fields["read_write"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"read_write length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                LedgerKey.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"read_only length {length} exceeds remaining input length {_remaining}"
+            )
+        read_only = []
+        for _ in range(length):
+            read_only.append(unpack_view(LedgerKey, unpacker, depth_limit - 1))
+        yield "read_only", read_only
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"read_write length {length} exceeds remaining input length {_remaining}"
+            )
+        read_write = []
+        for _ in range(length):
+            read_write.append(unpack_view(LedgerKey, unpacker, depth_limit - 1))
+        yield "read_write", read_write
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerFootprint:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerFootprint:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -103,11 +244,11 @@ class LedgerFootprint:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerFootprint:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -126,6 +267,27 @@ class LedgerFootprint:
             read_write=read_write,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"read_only": ')
+        write_json_array(write, self.read_only)
+        write(', "read_write": ')
+        write_json_array(write, self.read_write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerFootprint:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.read_only = [item.clone() for item in self.read_only]
+        result.read_write = [item.clone() for item in self.read_write]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerFootprint:
+        return self.clone()
+
+    def freeze(self) -> LedgerFootprint:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
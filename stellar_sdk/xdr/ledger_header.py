@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 from .int64 import Int64
 from .ledger_header_ext import LedgerHeaderExt
@@ -63,6 +77,24 @@ class LedgerHeader:
         };
     """
 
+    __slots__ = (
+        "base_fee",
+        "base_reserve",
+        "bucket_list_hash",
+        "ext",
+        "fee_pool",
+        "id_pool",
+        "inflation_seq",
+        "ledger_seq",
+        "ledger_version",
+        "max_tx_set_size",
+        "previous_ledger_hash",
+        "scp_value",
+        "skip_list",
+        "total_coins",
+        "tx_set_result_hash",
+    )
+
     def __init__(
         self,
         ledger_version: Uint32,
@@ -120,6 +152,9 @@ class LedgerHeader:
             skip_list_item.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 272 + self.scp_value.xdr_size() + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -162,16 +197,184 @@ class LedgerHeader:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+        StellarValue.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        length = 4
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+        LedgerHeaderExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerHeader:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_version" in fields:
+            _result["ledger_version"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_version"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "previous_ledger_hash" in fields:
+            _result["previous_ledger_hash"] = Hash.unpack_fields(
+                unpacker, fields["previous_ledger_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "scp_value" in fields:
+            _result["scp_value"] = StellarValue.unpack_fields(
+                unpacker, fields["scp_value"], depth_limit - 1
+            )
+        else:
+            StellarValue.skip(unpacker, depth_limit - 1)
+        if "tx_set_result_hash" in fields:
+            _result["tx_set_result_hash"] = Hash.unpack_fields(
+                unpacker, fields["tx_set_result_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "bucket_list_hash" in fields:
+            _result["bucket_list_hash"] = Hash.unpack_fields(
+                unpacker, fields["bucket_list_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "ledger_seq" in fields:
+            _result["ledger_seq"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "total_coins" in fields:
+            _result["total_coins"] = Int64.unpack_fields(
+                unpacker, fields["total_coins"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "fee_pool" in fields:
+            _result["fee_pool"] = Int64.unpack_fields(
+                unpacker, fields["fee_pool"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "inflation_seq" in fields:
+            _result["inflation_seq"] = Uint32.unpack_fields(
+                unpacker, fields["inflation_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "id_pool" in fields:
+            _result["id_pool"] = Uint64.unpack_fields(
+                unpacker, fields["id_pool"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "base_fee" in fields:
+            _result["base_fee"] = Uint32.unpack_fields(
+                unpacker, fields["base_fee"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "base_reserve" in fields:
+            _result["base_reserve"] = Uint32.unpack_fields(
+                unpacker, fields["base_reserve"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "max_tx_set_size" in fields:
+            _result["max_tx_set_size"] = Uint32.unpack_fields(
+                unpacker, fields["max_tx_set_size"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "skip_list" in fields:
+            length = 4
+            _result["skip_list"] = []
+            for _ in range(length):
+                _result["skip_list"].append(
+                    Hash.unpack_fields(unpacker, fields["skip_list"], depth_limit - 1)
+                )
+        else:
+            length = 4
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = LedgerHeaderExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            LedgerHeaderExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ledger_version", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "previous_ledger_hash", Hash.unpack(unpacker, depth_limit - 1)
+        scp_value = view_at(StellarValue, unpacker, depth_limit - 1)
+        yield "scp_value", scp_value
+        StellarValue.skip(unpacker, depth_limit - 1)
+        yield "tx_set_result_hash", Hash.unpack(unpacker, depth_limit - 1)
+        yield "bucket_list_hash", Hash.unpack(unpacker, depth_limit - 1)
+        yield "ledger_seq", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "total_coins", Int64.unpack(unpacker, depth_limit - 1)
+        yield "fee_pool", Int64.unpack(unpacker, depth_limit - 1)
+        yield "inflation_seq", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "id_pool", Uint64.unpack(unpacker, depth_limit - 1)
+        yield "base_fee", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "base_reserve", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "max_tx_set_size", Uint32.unpack(unpacker, depth_limit - 1)
+        length = 4
+        skip_list = []
+        for _ in range(length):
+            skip_list.append(Hash.unpack(unpacker, depth_limit - 1))
+        yield "skip_list", skip_list
+        yield "ext", LedgerHeaderExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerHeader:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerHeader:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -186,11 +389,11 @@ class LedgerHeader:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerHeader:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -246,6 +449,66 @@ class LedgerHeader:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_version": ')
+        self.ledger_version._write_json(write)
+        write(', "previous_ledger_hash": ')
+        self.previous_ledger_hash._write_json(write)
+        write(', "scp_value": ')
+        self.scp_value._write_json(write)
+        write(', "tx_set_result_hash": ')
+        self.tx_set_result_hash._write_json(write)
+        write(', "bucket_list_hash": ')
+        self.bucket_list_hash._write_json(write)
+        write(', "ledger_seq": ')
+        self.ledger_seq._write_json(write)
+        write(', "total_coins": ')
+        self.total_coins._write_json(write)
+        write(', "fee_pool": ')
+        self.fee_pool._write_json(write)
+        write(', "inflation_seq": ')
+        self.inflation_seq._write_json(write)
+        write(', "id_pool": ')
+        self.id_pool._write_json(write)
+        write(', "base_fee": ')
+        self.base_fee._write_json(write)
+        write(', "base_reserve": ')
+        self.base_reserve._write_json(write)
+        write(', "max_tx_set_size": ')
+        self.max_tx_set_size._write_json(write)
+        write(', "skip_list": ')
+        write_json_array(write, self.skip_list)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerHeader:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_version = self.ledger_version.clone()
+        result.previous_ledger_hash = self.previous_ledger_hash.clone()
+        result.scp_value = self.scp_value.clone()
+        result.tx_set_result_hash = self.tx_set_result_hash.clone()
+        result.bucket_list_hash = self.bucket_list_hash.clone()
+        result.ledger_seq = self.ledger_seq.clone()
+        result.total_coins = self.total_coins.clone()
+        result.fee_pool = self.fee_pool.clone()
+        result.inflation_seq = self.inflation_seq.clone()
+        result.id_pool = self.id_pool.clone()
+        result.base_fee = self.base_fee.clone()
+        result.base_reserve = self.base_reserve.clone()
+        result.max_tx_set_size = self.max_tx_set_size.clone()
+        result.skip_list = [item.clone() for item in self.skip_list]
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerHeader:
+        return self.clone()
+
+    def freeze(self) -> LedgerHeader:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
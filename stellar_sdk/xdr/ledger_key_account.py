@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["LedgerKeyAccount"]
 
@@ -23,6 +33,8 @@ class LedgerKeyAccount:
             }
     """
 
+    __slots__ = ("account_id",)
+
     def __init__(
         self,
         account_id: AccountID,
@@ -32,6 +44,9 @@ class LedgerKeyAccount:
     def pack(self, packer: Packer) -> None:
         self.account_id.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.account_id.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -43,16 +58,51 @@ class LedgerKeyAccount:
             account_id=account_id,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyAccount:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "account_id" in fields:
+            _result["account_id"] = AccountID.unpack_fields(
+                unpacker, fields["account_id"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyAccount:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerKeyAccount:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +117,11 @@ class LedgerKeyAccount:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyAccount:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +135,24 @@ class LedgerKeyAccount:
             account_id=account_id,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"account_id": ')
+        self.account_id._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyAccount:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.account_id = self.account_id.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyAccount:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyAccount:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.account_id,))
 
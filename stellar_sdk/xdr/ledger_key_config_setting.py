@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .config_setting_id import ConfigSettingID
 
+_LAYOUT = FixedLayout(">i")
 __all__ = ["LedgerKeyConfigSetting"]
 
 
@@ -23,6 +35,8 @@ class LedgerKeyConfigSetting:
             }
     """
 
+    __slots__ = ("config_setting_id",)
+
     def __init__(
         self,
         config_setting_id: ConfigSettingID,
@@ -30,7 +44,10 @@ class LedgerKeyConfigSetting:
         self.config_setting_id = config_setting_id
 
     def pack(self, packer: Packer) -> None:
-        self.config_setting_id.pack(packer)
+        _LAYOUT.write(packer, self.config_setting_id)
+
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(
@@ -38,21 +55,56 @@ class LedgerKeyConfigSetting:
     ) -> LedgerKeyConfigSetting:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        config_setting_id = ConfigSettingID.unpack(unpacker)
+        (config_setting_id,) = _LAYOUT.read(unpacker)
         return cls(
-            config_setting_id=config_setting_id,
+            config_setting_id=ConfigSettingID(config_setting_id),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyConfigSetting:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "config_setting_id" in fields:
+            _result["config_setting_id"] = ConfigSettingID.unpack_fields(
+                unpacker, fields["config_setting_id"]
+            )
+        else:
+            ConfigSettingID.skip(unpacker)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyConfigSetting:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerKeyConfigSetting:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +119,11 @@ class LedgerKeyConfigSetting:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyConfigSetting:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -87,6 +139,24 @@ class LedgerKeyConfigSetting:
             config_setting_id=config_setting_id,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"config_setting_id": ')
+        self.config_setting_id._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyConfigSetting:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.config_setting_id = self.config_setting_id
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyConfigSetting:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyConfigSetting:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.config_setting_id,))
 
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .contract_data_durability import ContractDataDurability
 from .sc_address import SCAddress
 from .sc_val import SCVal
@@ -27,6 +40,8 @@ class LedgerKeyContractData:
             }
     """
 
+    __slots__ = ("contract", "durability", "key")
+
     def __init__(
         self,
         contract: SCAddress,
@@ -42,6 +57,9 @@ class LedgerKeyContractData:
         self.key.pack(packer)
         self.durability.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.contract.xdr_size() + self.key.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +75,79 @@ class LedgerKeyContractData:
             durability=durability,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCAddress.skip(unpacker, depth_limit - 1)
+        SCVal.skip(unpacker, depth_limit - 1)
+        ContractDataDurability.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyContractData:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "contract" in fields:
+            _result["contract"] = SCAddress.unpack_fields(
+                unpacker, fields["contract"], depth_limit - 1
+            )
+        else:
+            SCAddress.skip(unpacker, depth_limit - 1)
+        if "key" in fields:
+            _result["key"] = SCVal.unpack_fields(
+                unpacker, fields["key"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        if "durability" in fields:
+            _result["durability"] = ContractDataDurability.unpack_fields(
+                unpacker, fields["durability"]
+            )
+        else:
+            ContractDataDurability.skip(unpacker)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "contract", SCAddress.unpack(unpacker, depth_limit - 1)
+        key = view_at(SCVal, unpacker, depth_limit - 1)
+        yield "key", key
+        SCVal.skip(unpacker, depth_limit - 1)
+        yield "durability", ContractDataDurability.unpack(unpacker)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyContractData:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerKeyContractData:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +162,11 @@ class LedgerKeyContractData:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyContractData:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +186,30 @@ class LedgerKeyContractData:
             durability=durability,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"contract": ')
+        self.contract._write_json(write)
+        write(', "key": ')
+        self.key._write_json(write)
+        write(', "durability": ')
+        self.durability._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyContractData:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.contract = self.contract.clone()
+        result.key = self.key.clone()
+        result.durability = self.durability
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyContractData:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyContractData:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
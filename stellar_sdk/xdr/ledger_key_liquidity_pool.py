@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .pool_id import PoolID
 
 __all__ = ["LedgerKeyLiquidityPool"]
@@ -23,6 +33,8 @@ class LedgerKeyLiquidityPool:
             }
     """
 
+    __slots__ = ("liquidity_pool_id",)
+
     def __init__(
         self,
         liquidity_pool_id: PoolID,
@@ -32,6 +44,9 @@ class LedgerKeyLiquidityPool:
     def pack(self, packer: Packer) -> None:
         self.liquidity_pool_id.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -43,16 +58,51 @@ class LedgerKeyLiquidityPool:
             liquidity_pool_id=liquidity_pool_id,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        PoolID.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyLiquidityPool:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "liquidity_pool_id" in fields:
+            _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                unpacker, fields["liquidity_pool_id"], depth_limit - 1
+            )
+        else:
+            PoolID.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyLiquidityPool:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerKeyLiquidityPool:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +117,11 @@ class LedgerKeyLiquidityPool:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyLiquidityPool:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +135,24 @@ class LedgerKeyLiquidityPool:
             liquidity_pool_id=liquidity_pool_id,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"liquidity_pool_id": ')
+        self.liquidity_pool_id._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyLiquidityPool:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.liquidity_pool_id = self.liquidity_pool_id.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyLiquidityPool:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyLiquidityPool:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.liquidity_pool_id,))
 
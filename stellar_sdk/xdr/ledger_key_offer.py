@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
 __all__ = ["LedgerKeyOffer"]
@@ -25,6 +35,8 @@ class LedgerKeyOffer:
             }
     """
 
+    __slots__ = ("offer_id", "seller_id")
+
     def __init__(
         self,
         seller_id: AccountID,
@@ -37,6 +49,9 @@ class LedgerKeyOffer:
         self.seller_id.pack(packer)
         self.offer_id.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.seller_id.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,56 @@ class LedgerKeyOffer:
             offer_id=offer_id,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyOffer:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "seller_id" in fields:
+            _result["seller_id"] = AccountID.unpack_fields(
+                unpacker, fields["seller_id"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "offer_id" in fields:
+            _result["offer_id"] = Int64.unpack_fields(
+                unpacker, fields["offer_id"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyOffer:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerKeyOffer:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +129,11 @@ class LedgerKeyOffer:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyOffer:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +150,27 @@ class LedgerKeyOffer:
             offer_id=offer_id,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"seller_id": ')
+        self.seller_id._write_json(write)
+        write(', "offer_id": ')
+        self.offer_id._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyOffer:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.seller_id = self.seller_id.clone()
+        result.offer_id = self.offer_id.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyOffer:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyOffer:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
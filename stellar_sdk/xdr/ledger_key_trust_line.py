@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .trust_line_asset import TrustLineAsset
 
 __all__ = ["LedgerKeyTrustLine"]
@@ -25,6 +35,8 @@ class LedgerKeyTrustLine:
             }
     """
 
+    __slots__ = ("account_id", "asset")
+
     def __init__(
         self,
         account_id: AccountID,
@@ -37,6 +49,9 @@ class LedgerKeyTrustLine:
         self.account_id.pack(packer)
         self.asset.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.account_id.xdr_size() + self.asset.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class LedgerKeyTrustLine:
             asset=asset,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        TrustLineAsset.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyTrustLine:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "account_id" in fields:
+            _result["account_id"] = AccountID.unpack_fields(
+                unpacker, fields["account_id"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "asset" in fields:
+            _result["asset"] = TrustLineAsset.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            TrustLineAsset.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyTrustLine:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerKeyTrustLine:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class LedgerKeyTrustLine:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyTrustLine:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class LedgerKeyTrustLine:
             asset=asset,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"account_id": ')
+        self.account_id._write_json(write)
+        write(', "asset": ')
+        self.asset._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyTrustLine:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.account_id = self.account_id.clone()
+        result.asset = self.asset.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyTrustLine:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyTrustLine:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
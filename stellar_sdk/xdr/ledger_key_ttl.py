@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 
 __all__ = ["LedgerKeyTtl"]
@@ -24,6 +34,8 @@ class LedgerKeyTtl:
             }
     """
 
+    __slots__ = ("key_hash",)
+
     def __init__(
         self,
         key_hash: Hash,
@@ -33,6 +45,9 @@ class LedgerKeyTtl:
     def pack(self, packer: Packer) -> None:
         self.key_hash.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -44,16 +59,49 @@ class LedgerKeyTtl:
             key_hash=key_hash,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerKeyTtl:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "key_hash" in fields:
+            _result["key_hash"] = Hash.unpack_fields(
+                unpacker, fields["key_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerKeyTtl:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerKeyTtl:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -68,11 +116,11 @@ class LedgerKeyTtl:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerKeyTtl:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -86,6 +134,24 @@ class LedgerKeyTtl:
             key_hash=key_hash,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"key_hash": ')
+        self.key_hash._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerKeyTtl:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.key_hash = self.key_hash.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerKeyTtl:
+        return self.clone()
+
+    def freeze(self) -> LedgerKeyTtl:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.key_hash,))
 
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .scp_envelope import SCPEnvelope
 from .uint32 import Uint32
 
@@ -25,6 +39,8 @@ class LedgerSCPMessages:
         };
     """
 
+    __slots__ = ("ledger_seq", "messages")
+
     def __init__(
         self,
         ledger_seq: Uint32,
@@ -44,6 +60,9 @@ class LedgerSCPMessages:
         for messages_item in self.messages:
             messages_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 4 + sum(item.xdr_size() for item in self.messages)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +84,102 @@ class LedgerSCPMessages:
             messages=messages,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"messages length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPEnvelope.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerSCPMessages:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_seq" in fields:
+            _result["ledger_seq"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "messages" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"messages length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["messages"] = []
+            for _ in range(length):
+                _result["messages"].append(
+                    SCPEnvelope.unpack_fields(
+                        unpacker, fields["messages"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"messages length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPEnvelope.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ledger_seq", Uint32.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"messages length {length} exceeds remaining input length {_remaining}"
+            )
+        messages = []
+        for _ in range(length):
+            messages.append(unpack_view(SCPEnvelope, unpacker, depth_limit - 1))
+        yield "messages", messages
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerSCPMessages:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LedgerSCPMessages:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +194,11 @@ class LedgerSCPMessages:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerSCPMessages:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +215,27 @@ class LedgerSCPMessages:
             messages=messages,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_seq": ')
+        self.ledger_seq._write_json(write)
+        write(', "messages": ')
+        write_json_array(write, self.messages)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LedgerSCPMessages:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_seq = self.ledger_seq.clone()
+        result.messages = [item.clone() for item in self.messages]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerSCPMessages:
+        return self.clone()
+
+    def freeze(self) -> LedgerSCPMessages:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .config_upgrade_set_key import ConfigUpgradeSetKey
 from .ledger_upgrade_type import LedgerUpgradeType
 from .uint32 import Uint32
@@ -41,6 +51,17 @@ class LedgerUpgrade:
         };
     """
 
+    __slots__ = (
+        "new_base_fee",
+        "new_base_reserve",
+        "new_config",
+        "new_flags",
+        "new_ledger_version",
+        "new_max_soroban_tx_set_size",
+        "new_max_tx_set_size",
+        "type",
+    )
+
     def __init__(
         self,
         type: LedgerUpgradeType,
@@ -100,48 +121,153 @@ class LedgerUpgrade:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_VERSION:
+            return 8
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_FEE:
+            return 8
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+            return 8
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_RESERVE:
+            return 8
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_FLAGS:
+            return 8
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_CONFIG:
+            return 68
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_SOROBAN_TX_SET_SIZE:
+            return 8
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> LedgerUpgrade:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = LedgerUpgradeType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = LedgerUpgradeType.unpack(unpacker)
         if type == LedgerUpgradeType.LEDGER_UPGRADE_VERSION:
-            new_ledger_version = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, new_ledger_version=new_ledger_version)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_FEE:
-            new_base_fee = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, new_base_fee=new_base_fee)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
-            new_max_tx_set_size = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, new_max_tx_set_size=new_max_tx_set_size)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_RESERVE:
-            new_base_reserve = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, new_base_reserve=new_base_reserve)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerUpgradeType.LEDGER_UPGRADE_FLAGS:
-            new_flags = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, new_flags=new_flags)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerUpgradeType.LEDGER_UPGRADE_CONFIG:
-            new_config = ConfigUpgradeSetKey.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, new_config=new_config)
+            ConfigUpgradeSetKey.skip(unpacker, depth_limit - 1)
+            return
         if type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_SOROBAN_TX_SET_SIZE:
-            new_max_soroban_tx_set_size = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(
-                type=type, new_max_soroban_tx_set_size=new_max_soroban_tx_set_size
-            )
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LedgerUpgrade:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = LedgerUpgradeType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_VERSION:
+            if "new_ledger_version" in fields:
+                _result["new_ledger_version"] = Uint32.unpack_fields(
+                    unpacker, fields["new_ledger_version"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_FEE:
+            if "new_base_fee" in fields:
+                _result["new_base_fee"] = Uint32.unpack_fields(
+                    unpacker, fields["new_base_fee"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+            if "new_max_tx_set_size" in fields:
+                _result["new_max_tx_set_size"] = Uint32.unpack_fields(
+                    unpacker, fields["new_max_tx_set_size"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_RESERVE:
+            if "new_base_reserve" in fields:
+                _result["new_base_reserve"] = Uint32.unpack_fields(
+                    unpacker, fields["new_base_reserve"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_FLAGS:
+            if "new_flags" in fields:
+                _result["new_flags"] = Uint32.unpack_fields(
+                    unpacker, fields["new_flags"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_CONFIG:
+            if "new_config" in fields:
+                _result["new_config"] = ConfigUpgradeSetKey.unpack_fields(
+                    unpacker, fields["new_config"], depth_limit - 1
+                )
+            else:
+                ConfigUpgradeSetKey.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_SOROBAN_TX_SET_SIZE:
+            if "new_max_soroban_tx_set_size" in fields:
+                _result["new_max_soroban_tx_set_size"] = Uint32.unpack_fields(
+                    unpacker, fields["new_max_soroban_tx_set_size"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LedgerUpgrade:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LedgerUpgrade:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -156,11 +282,11 @@ class LedgerUpgrade:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LedgerUpgrade:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == LedgerUpgradeType.LEDGER_UPGRADE_VERSION:
@@ -223,6 +349,91 @@ class LedgerUpgrade:
             )
         raise ValueError(f"Unknown key '{key}' for LedgerUpgrade")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_VERSION:
+            assert self.new_ledger_version is not None
+            write('{"version": ')
+            self.new_ledger_version._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_FEE:
+            assert self.new_base_fee is not None
+            write('{"base_fee": ')
+            self.new_base_fee._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+            assert self.new_max_tx_set_size is not None
+            write('{"max_tx_set_size": ')
+            self.new_max_tx_set_size._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_BASE_RESERVE:
+            assert self.new_base_reserve is not None
+            write('{"base_reserve": ')
+            self.new_base_reserve._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_FLAGS:
+            assert self.new_flags is not None
+            write('{"flags": ')
+            self.new_flags._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_CONFIG:
+            assert self.new_config is not None
+            write('{"config": ')
+            self.new_config._write_json(write)
+            write("}")
+            return
+        if self.type == LedgerUpgradeType.LEDGER_UPGRADE_MAX_SOROBAN_TX_SET_SIZE:
+            assert self.new_max_soroban_tx_set_size is not None
+            write('{"max_soroban_tx_set_size": ')
+            self.new_max_soroban_tx_set_size._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in LedgerUpgrade: {self.type}")
+
+    def clone(self, deep: bool = True) -> LedgerUpgrade:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.new_ledger_version = (
+            self.new_ledger_version.clone()
+            if self.new_ledger_version is not None
+            else None
+        )
+        result.new_base_fee = (
+            self.new_base_fee.clone() if self.new_base_fee is not None else None
+        )
+        result.new_max_tx_set_size = (
+            self.new_max_tx_set_size.clone()
+            if self.new_max_tx_set_size is not None
+            else None
+        )
+        result.new_base_reserve = (
+            self.new_base_reserve.clone() if self.new_base_reserve is not None else None
+        )
+        result.new_flags = (
+            self.new_flags.clone() if self.new_flags is not None else None
+        )
+        result.new_config = (
+            self.new_config.clone() if self.new_config is not None else None
+        )
+        result.new_max_soroban_tx_set_size = (
+            self.new_max_soroban_tx_set_size.clone()
+            if self.new_max_soroban_tx_set_size is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LedgerUpgrade:
+        return self.clone()
+
+    def freeze(self) -> LedgerUpgrade:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -271,3 +482,61 @@ class LedgerUpgrade:
                 f"new_max_soroban_tx_set_size={self.new_max_soroban_tx_set_size}"
             )
         return f"<LedgerUpgrade [{', '.join(out)}]>"
+
+
+def _unpack_new_ledger_version(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerUpgrade:
+    new_ledger_version = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_ledger_version=new_ledger_version)
+
+
+def _unpack_new_base_fee(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerUpgrade:
+    new_base_fee = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_base_fee=new_base_fee)
+
+
+def _unpack_new_max_tx_set_size(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerUpgrade:
+    new_max_tx_set_size = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_max_tx_set_size=new_max_tx_set_size)
+
+
+def _unpack_new_base_reserve(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerUpgrade:
+    new_base_reserve = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_base_reserve=new_base_reserve)
+
+
+def _unpack_new_flags(cls, type, unpacker: Unpacker, depth_limit: int) -> LedgerUpgrade:
+    new_flags = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_flags=new_flags)
+
+
+def _unpack_new_config(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerUpgrade:
+    new_config = ConfigUpgradeSetKey.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_config=new_config)
+
+
+def _unpack_new_max_soroban_tx_set_size(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LedgerUpgrade:
+    new_max_soroban_tx_set_size = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, new_max_soroban_tx_set_size=new_max_soroban_tx_set_size)
+
+
+_UNPACK_ARMS = {
+    LedgerUpgradeType.LEDGER_UPGRADE_VERSION: _unpack_new_ledger_version,
+    LedgerUpgradeType.LEDGER_UPGRADE_BASE_FEE: _unpack_new_base_fee,
+    LedgerUpgradeType.LEDGER_UPGRADE_MAX_TX_SET_SIZE: _unpack_new_max_tx_set_size,
+    LedgerUpgradeType.LEDGER_UPGRADE_BASE_RESERVE: _unpack_new_base_reserve,
+    LedgerUpgradeType.LEDGER_UPGRADE_FLAGS: _unpack_new_flags,
+    LedgerUpgradeType.LEDGER_UPGRADE_CONFIG: _unpack_new_config,
+    LedgerUpgradeType.LEDGER_UPGRADE_MAX_SOROBAN_TX_SET_SIZE: _unpack_new_max_soroban_tx_set_size,
+}
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
+_LAYOUT = FixedLayout(">qq")
 __all__ = ["Liabilities"]
 
 
@@ -24,6 +36,8 @@ class Liabilities:
         };
     """
 
+    __slots__ = ("buying", "selling")
+
     def __init__(
         self,
         buying: Int64,
@@ -33,8 +47,10 @@ class Liabilities:
         self.selling = selling
 
     def pack(self, packer: Packer) -> None:
-        self.buying.pack(packer)
-        self.selling.pack(packer)
+        _LAYOUT.write(packer, self.buying.int64, self.selling.int64)
+
+    def xdr_size(self) -> int:
+        return 16
 
     @classmethod
     def unpack(
@@ -42,23 +58,61 @@ class Liabilities:
     ) -> Liabilities:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        buying = Int64.unpack(unpacker, depth_limit - 1)
-        selling = Int64.unpack(unpacker, depth_limit - 1)
+        buying, selling = _LAYOUT.read(unpacker)
         return cls(
-            buying=buying,
-            selling=selling,
+            buying=Int64(buying),
+            selling=Int64(selling),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Liabilities:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "buying" in fields:
+            _result["buying"] = Int64.unpack_fields(
+                unpacker, fields["buying"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "selling" in fields:
+            _result["selling"] = Int64.unpack_fields(
+                unpacker, fields["selling"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Liabilities:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Liabilities:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +127,11 @@ class Liabilities:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Liabilities:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +148,27 @@ class Liabilities:
             selling=selling,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"buying": ')
+        self.buying._write_json(write)
+        write(', "selling": ')
+        self.selling._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> Liabilities:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.buying = self.buying.clone()
+        result.selling = self.selling.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Liabilities:
+        return self.clone()
+
+    def freeze(self) -> Liabilities:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
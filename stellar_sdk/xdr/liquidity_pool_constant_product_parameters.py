@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int32 import Int32
 
 __all__ = ["LiquidityPoolConstantProductParameters"]
@@ -26,6 +36,8 @@ class LiquidityPoolConstantProductParameters:
         };
     """
 
+    __slots__ = ("asset_a", "asset_b", "fee")
+
     def __init__(
         self,
         asset_a: Asset,
@@ -41,6 +53,9 @@ class LiquidityPoolConstantProductParameters:
         self.asset_b.pack(packer)
         self.fee.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.asset_a.xdr_size() + self.asset_b.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,16 +71,65 @@ class LiquidityPoolConstantProductParameters:
             fee=fee,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Asset.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LiquidityPoolConstantProductParameters:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "asset_a" in fields:
+            _result["asset_a"] = Asset.unpack_fields(
+                unpacker, fields["asset_a"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "asset_b" in fields:
+            _result["asset_b"] = Asset.unpack_fields(
+                unpacker, fields["asset_b"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "fee" in fields:
+            _result["fee"] = Int32.unpack_fields(
+                unpacker, fields["fee"], depth_limit - 1
+            )
+        else:
+            Int32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LiquidityPoolConstantProductParameters:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LiquidityPoolConstantProductParameters:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -80,11 +144,11 @@ class LiquidityPoolConstantProductParameters:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LiquidityPoolConstantProductParameters:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -104,6 +168,30 @@ class LiquidityPoolConstantProductParameters:
             fee=fee,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"asset_a": ')
+        self.asset_a._write_json(write)
+        write(', "asset_b": ')
+        self.asset_b._write_json(write)
+        write(', "fee": ')
+        self.fee._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LiquidityPoolConstantProductParameters:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.asset_a = self.asset_a.clone()
+        result.asset_b = self.asset_b.clone()
+        result.fee = self.fee.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LiquidityPoolConstantProductParameters:
+        return self.clone()
+
+    def freeze(self) -> LiquidityPoolConstantProductParameters:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
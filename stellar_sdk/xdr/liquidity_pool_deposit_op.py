@@ -3,15 +3,29 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
+from .hash import Hash
+from .int32 import Int32
 from .int64 import Int64
 from .pool_id import PoolID
 from .price import Price
 
+_LAYOUT = FixedLayout(">32sqqiiii")
 __all__ = ["LiquidityPoolDepositOp"]
 
 
@@ -29,6 +43,14 @@ class LiquidityPoolDepositOp:
         };
     """
 
+    __slots__ = (
+        "liquidity_pool_id",
+        "max_amount_a",
+        "max_amount_b",
+        "max_price",
+        "min_price",
+    )
+
     def __init__(
         self,
         liquidity_pool_id: PoolID,
@@ -44,11 +66,19 @@ class LiquidityPoolDepositOp:
         self.max_price = max_price
 
     def pack(self, packer: Packer) -> None:
-        self.liquidity_pool_id.pack(packer)
-        self.max_amount_a.pack(packer)
-        self.max_amount_b.pack(packer)
-        self.min_price.pack(packer)
-        self.max_price.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.liquidity_pool_id.pool_id.hash,
+            self.max_amount_a.int64,
+            self.max_amount_b.int64,
+            self.min_price.n.int32,
+            self.min_price.d.int32,
+            self.max_price.n.int32,
+            self.max_price.d.int32,
+        )
+
+    def xdr_size(self) -> int:
+        return 64
 
     @classmethod
     def unpack(
@@ -56,29 +86,92 @@ class LiquidityPoolDepositOp:
     ) -> LiquidityPoolDepositOp:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        liquidity_pool_id = PoolID.unpack(unpacker, depth_limit - 1)
-        max_amount_a = Int64.unpack(unpacker, depth_limit - 1)
-        max_amount_b = Int64.unpack(unpacker, depth_limit - 1)
-        min_price = Price.unpack(unpacker, depth_limit - 1)
-        max_price = Price.unpack(unpacker, depth_limit - 1)
+        (
+            liquidity_pool_id,
+            max_amount_a,
+            max_amount_b,
+            min_price_n,
+            min_price_d,
+            max_price_n,
+            max_price_d,
+        ) = _LAYOUT.read(unpacker)
         return cls(
-            liquidity_pool_id=liquidity_pool_id,
-            max_amount_a=max_amount_a,
-            max_amount_b=max_amount_b,
-            min_price=min_price,
-            max_price=max_price,
+            liquidity_pool_id=PoolID(Hash(liquidity_pool_id)),
+            max_amount_a=Int64(max_amount_a),
+            max_amount_b=Int64(max_amount_b),
+            min_price=Price(n=Int32(min_price_n), d=Int32(min_price_d)),
+            max_price=Price(n=Int32(max_price_n), d=Int32(max_price_d)),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LiquidityPoolDepositOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "liquidity_pool_id" in fields:
+            _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                unpacker, fields["liquidity_pool_id"], depth_limit - 1
+            )
+        else:
+            PoolID.skip(unpacker, depth_limit - 1)
+        if "max_amount_a" in fields:
+            _result["max_amount_a"] = Int64.unpack_fields(
+                unpacker, fields["max_amount_a"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "max_amount_b" in fields:
+            _result["max_amount_b"] = Int64.unpack_fields(
+                unpacker, fields["max_amount_b"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "min_price" in fields:
+            _result["min_price"] = Price.unpack_fields(
+                unpacker, fields["min_price"], depth_limit - 1
+            )
+        else:
+            Price.skip(unpacker, depth_limit - 1)
+        if "max_price" in fields:
+            _result["max_price"] = Price.unpack_fields(
+                unpacker, fields["max_price"], depth_limit - 1
+            )
+        else:
+            Price.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LiquidityPoolDepositOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LiquidityPoolDepositOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -93,11 +186,11 @@ class LiquidityPoolDepositOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LiquidityPoolDepositOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -123,6 +216,36 @@ class LiquidityPoolDepositOp:
             max_price=max_price,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"liquidity_pool_id": ')
+        self.liquidity_pool_id._write_json(write)
+        write(', "max_amount_a": ')
+        self.max_amount_a._write_json(write)
+        write(', "max_amount_b": ')
+        self.max_amount_b._write_json(write)
+        write(', "min_price": ')
+        self.min_price._write_json(write)
+        write(', "max_price": ')
+        self.max_price._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LiquidityPoolDepositOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.liquidity_pool_id = self.liquidity_pool_id.clone()
+        result.max_amount_a = self.max_amount_a.clone()
+        result.max_amount_b = self.max_amount_b.clone()
+        result.min_price = self.min_price.clone()
+        result.max_price = self.max_price.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LiquidityPoolDepositOp:
+        return self.clone()
+
+    def freeze(self) -> LiquidityPoolDepositOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
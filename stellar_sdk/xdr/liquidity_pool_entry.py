@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .liquidity_pool_entry_body import LiquidityPoolEntryBody
 from .pool_id import PoolID
 
@@ -40,6 +50,8 @@ class LiquidityPoolEntry:
         };
     """
 
+    __slots__ = ("body", "liquidity_pool_id")
+
     def __init__(
         self,
         liquidity_pool_id: PoolID,
@@ -52,6 +64,9 @@ class LiquidityPoolEntry:
         self.liquidity_pool_id.pack(packer)
         self.body.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + self.body.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +80,58 @@ class LiquidityPoolEntry:
             body=body,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        PoolID.skip(unpacker, depth_limit - 1)
+        LiquidityPoolEntryBody.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LiquidityPoolEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "liquidity_pool_id" in fields:
+            _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                unpacker, fields["liquidity_pool_id"], depth_limit - 1
+            )
+        else:
+            PoolID.skip(unpacker, depth_limit - 1)
+        if "body" in fields:
+            _result["body"] = LiquidityPoolEntryBody.unpack_fields(
+                unpacker, fields["body"], depth_limit - 1
+            )
+        else:
+            LiquidityPoolEntryBody.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LiquidityPoolEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LiquidityPoolEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +146,11 @@ class LiquidityPoolEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LiquidityPoolEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +167,27 @@ class LiquidityPoolEntry:
             body=body,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"liquidity_pool_id": ')
+        self.liquidity_pool_id._write_json(write)
+        write(', "body": ')
+        self.body._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LiquidityPoolEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.liquidity_pool_id = self.liquidity_pool_id.clone()
+        result.body = self.body.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LiquidityPoolEntry:
+        return self.clone()
+
+    def freeze(self) -> LiquidityPoolEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .liquidity_pool_constant_product_parameters import (
     LiquidityPoolConstantProductParameters,
@@ -32,6 +42,14 @@ class LiquidityPoolEntryConstantProduct:
                 }
     """
 
+    __slots__ = (
+        "params",
+        "pool_shares_trust_line_count",
+        "reserve_a",
+        "reserve_b",
+        "total_pool_shares",
+    )
+
     def __init__(
         self,
         params: LiquidityPoolConstantProductParameters,
@@ -53,6 +71,9 @@ class LiquidityPoolEntryConstantProduct:
         self.total_pool_shares.pack(packer)
         self.pool_shares_trust_line_count.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + self.params.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -74,16 +95,79 @@ class LiquidityPoolEntryConstantProduct:
             pool_shares_trust_line_count=pool_shares_trust_line_count,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LiquidityPoolConstantProductParameters.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LiquidityPoolEntryConstantProduct:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "params" in fields:
+            _result["params"] = LiquidityPoolConstantProductParameters.unpack_fields(
+                unpacker, fields["params"], depth_limit - 1
+            )
+        else:
+            LiquidityPoolConstantProductParameters.skip(unpacker, depth_limit - 1)
+        if "reserve_a" in fields:
+            _result["reserve_a"] = Int64.unpack_fields(
+                unpacker, fields["reserve_a"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "reserve_b" in fields:
+            _result["reserve_b"] = Int64.unpack_fields(
+                unpacker, fields["reserve_b"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "total_pool_shares" in fields:
+            _result["total_pool_shares"] = Int64.unpack_fields(
+                unpacker, fields["total_pool_shares"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "pool_shares_trust_line_count" in fields:
+            _result["pool_shares_trust_line_count"] = Int64.unpack_fields(
+                unpacker, fields["pool_shares_trust_line_count"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LiquidityPoolEntryConstantProduct:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LiquidityPoolEntryConstantProduct:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -98,11 +182,11 @@ class LiquidityPoolEntryConstantProduct:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LiquidityPoolEntryConstantProduct:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -132,6 +216,36 @@ class LiquidityPoolEntryConstantProduct:
             pool_shares_trust_line_count=pool_shares_trust_line_count,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"params": ')
+        self.params._write_json(write)
+        write(', "reserve_a": ')
+        self.reserve_a._write_json(write)
+        write(', "reserve_b": ')
+        self.reserve_b._write_json(write)
+        write(', "total_pool_shares": ')
+        self.total_pool_shares._write_json(write)
+        write(', "pool_shares_trust_line_count": ')
+        self.pool_shares_trust_line_count._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LiquidityPoolEntryConstantProduct:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.params = self.params.clone()
+        result.reserve_a = self.reserve_a.clone()
+        result.reserve_b = self.reserve_b.clone()
+        result.total_pool_shares = self.total_pool_shares.clone()
+        result.pool_shares_trust_line_count = self.pool_shares_trust_line_count.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LiquidityPoolEntryConstantProduct:
+        return self.clone()
+
+    def freeze(self) -> LiquidityPoolEntryConstantProduct:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
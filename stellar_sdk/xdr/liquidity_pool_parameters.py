@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .liquidity_pool_constant_product_parameters import (
     LiquidityPoolConstantProductParameters,
 )
@@ -27,6 +37,8 @@ class LiquidityPoolParameters:
         };
     """
 
+    __slots__ = ("constant_product", "type")
+
     def __init__(
         self,
         type: LiquidityPoolType,
@@ -44,30 +56,80 @@ class LiquidityPoolParameters:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == LiquidityPoolType.LIQUIDITY_POOL_CONSTANT_PRODUCT:
+            assert self.constant_product is not None
+            return 4 + self.constant_product.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> LiquidityPoolParameters:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = LiquidityPoolType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = LiquidityPoolType.unpack(unpacker)
         if type == LiquidityPoolType.LIQUIDITY_POOL_CONSTANT_PRODUCT:
-            constant_product = LiquidityPoolConstantProductParameters.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(type=type, constant_product=constant_product)
+            LiquidityPoolConstantProductParameters.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LiquidityPoolParameters:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = LiquidityPoolType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == LiquidityPoolType.LIQUIDITY_POOL_CONSTANT_PRODUCT:
+            if "constant_product" in fields:
+                _result["constant_product"] = (
+                    LiquidityPoolConstantProductParameters.unpack_fields(
+                        unpacker, fields["constant_product"], depth_limit - 1
+                    )
+                )
+            else:
+                LiquidityPoolConstantProductParameters.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LiquidityPoolParameters:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LiquidityPoolParameters:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +144,11 @@ class LiquidityPoolParameters:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LiquidityPoolParameters:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == LiquidityPoolType.LIQUIDITY_POOL_CONSTANT_PRODUCT:
@@ -111,6 +173,31 @@ class LiquidityPoolParameters:
             return cls(type=type, constant_product=constant_product)
         raise ValueError(f"Unknown key '{key}' for LiquidityPoolParameters")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == LiquidityPoolType.LIQUIDITY_POOL_CONSTANT_PRODUCT:
+            assert self.constant_product is not None
+            write('{"liquidity_pool_constant_product": ')
+            self.constant_product._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in LiquidityPoolParameters: {self.type}")
+
+    def clone(self, deep: bool = True) -> LiquidityPoolParameters:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.constant_product = (
+            self.constant_product.clone() if self.constant_product is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LiquidityPoolParameters:
+        return self.clone()
+
+    def freeze(self) -> LiquidityPoolParameters:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -132,3 +219,17 @@ class LiquidityPoolParameters:
         if self.constant_product is not None:
             out.append(f"constant_product={self.constant_product}")
         return f"<LiquidityPoolParameters [{', '.join(out)}]>"
+
+
+def _unpack_constant_product(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> LiquidityPoolParameters:
+    constant_product = LiquidityPoolConstantProductParameters.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, constant_product=constant_product)
+
+
+_UNPACK_ARMS = {
+    LiquidityPoolType.LIQUIDITY_POOL_CONSTANT_PRODUCT: _unpack_constant_product,
+}
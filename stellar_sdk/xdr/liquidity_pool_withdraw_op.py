@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
+from .hash import Hash
 from .int64 import Int64
 from .pool_id import PoolID
 
+_LAYOUT = FixedLayout(">32sqqq")
 __all__ = ["LiquidityPoolWithdrawOp"]
 
 
@@ -27,6 +40,8 @@ class LiquidityPoolWithdrawOp:
         };
     """
 
+    __slots__ = ("amount", "liquidity_pool_id", "min_amount_a", "min_amount_b")
+
     def __init__(
         self,
         liquidity_pool_id: PoolID,
@@ -40,10 +55,16 @@ class LiquidityPoolWithdrawOp:
         self.min_amount_b = min_amount_b
 
     def pack(self, packer: Packer) -> None:
-        self.liquidity_pool_id.pack(packer)
-        self.amount.pack(packer)
-        self.min_amount_a.pack(packer)
-        self.min_amount_b.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.liquidity_pool_id.pool_id.hash,
+            self.amount.int64,
+            self.min_amount_a.int64,
+            self.min_amount_b.int64,
+        )
+
+    def xdr_size(self) -> int:
+        return 56
 
     @classmethod
     def unpack(
@@ -51,27 +72,77 @@ class LiquidityPoolWithdrawOp:
     ) -> LiquidityPoolWithdrawOp:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        liquidity_pool_id = PoolID.unpack(unpacker, depth_limit - 1)
-        amount = Int64.unpack(unpacker, depth_limit - 1)
-        min_amount_a = Int64.unpack(unpacker, depth_limit - 1)
-        min_amount_b = Int64.unpack(unpacker, depth_limit - 1)
+        liquidity_pool_id, amount, min_amount_a, min_amount_b = _LAYOUT.read(unpacker)
         return cls(
-            liquidity_pool_id=liquidity_pool_id,
-            amount=amount,
-            min_amount_a=min_amount_a,
-            min_amount_b=min_amount_b,
+            liquidity_pool_id=PoolID(Hash(liquidity_pool_id)),
+            amount=Int64(amount),
+            min_amount_a=Int64(min_amount_a),
+            min_amount_b=Int64(min_amount_b),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | LiquidityPoolWithdrawOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "liquidity_pool_id" in fields:
+            _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                unpacker, fields["liquidity_pool_id"], depth_limit - 1
+            )
+        else:
+            PoolID.skip(unpacker, depth_limit - 1)
+        if "amount" in fields:
+            _result["amount"] = Int64.unpack_fields(
+                unpacker, fields["amount"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "min_amount_a" in fields:
+            _result["min_amount_a"] = Int64.unpack_fields(
+                unpacker, fields["min_amount_a"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "min_amount_b" in fields:
+            _result["min_amount_b"] = Int64.unpack_fields(
+                unpacker, fields["min_amount_b"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LiquidityPoolWithdrawOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> LiquidityPoolWithdrawOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -86,11 +157,11 @@ class LiquidityPoolWithdrawOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LiquidityPoolWithdrawOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -113,6 +184,33 @@ class LiquidityPoolWithdrawOp:
             min_amount_b=min_amount_b,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"liquidity_pool_id": ')
+        self.liquidity_pool_id._write_json(write)
+        write(', "amount": ')
+        self.amount._write_json(write)
+        write(', "min_amount_a": ')
+        self.min_amount_a._write_json(write)
+        write(', "min_amount_b": ')
+        self.min_amount_b._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> LiquidityPoolWithdrawOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.liquidity_pool_id = self.liquidity_pool_id.clone()
+        result.amount = self.amount.clone()
+        result.min_amount_a = self.min_amount_a.clone()
+        result.min_amount_b = self.min_amount_b.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> LiquidityPoolWithdrawOp:
+        return self.clone()
+
+    def freeze(self) -> LiquidityPoolWithdrawOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
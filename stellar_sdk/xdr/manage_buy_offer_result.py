@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .manage_buy_offer_result_code import ManageBuyOfferResultCode
 from .manage_offer_success_result import ManageOfferSuccessResult
 
@@ -38,6 +51,8 @@ class ManageBuyOfferResult:
         };
     """
 
+    __slots__ = ("code", "success")
+
     def __init__(
         self,
         code: ManageBuyOfferResultCode,
@@ -79,40 +94,178 @@ class ManageBuyOfferResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS:
+            assert self.success is not None
+            return 4 + self.success.xdr_size()
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_MALFORMED:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_TRUST:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_TRUST:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LINE_FULL:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_UNDERFUNDED:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_CROSS_SELF:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_ISSUER:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_ISSUER:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_NOT_FOUND:
+            return 4
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LOW_RESERVE:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ManageBuyOfferResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ManageBuyOfferResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ManageBuyOfferResultCode.unpack(unpacker)
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS:
-            success = ManageOfferSuccessResult.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, success=success)
+            ManageOfferSuccessResult.skip(unpacker, depth_limit - 1)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_MALFORMED:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_TRUST:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_TRUST:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LINE_FULL:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_UNDERFUNDED:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_CROSS_SELF:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_ISSUER:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_ISSUER:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_NOT_FOUND:
-            return cls(code=code)
+            return
         if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LOW_RESERVE:
-            return cls(code=code)
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ManageBuyOfferResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ManageBuyOfferResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS:
+            if "success" in fields:
+                _result["success"] = ManageOfferSuccessResult.unpack_fields(
+                    unpacker, fields["success"], depth_limit - 1
+                )
+            else:
+                ManageOfferSuccessResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_MALFORMED:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_TRUST:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_TRUST:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LINE_FULL:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_UNDERFUNDED:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_CROSS_SELF:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_ISSUER:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_ISSUER:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_NOT_FOUND:
+            return _result
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LOW_RESERVE:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ManageBuyOfferResultCode.unpack(unpacker)
+        yield "code", code
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS:
+            yield (
+                "success",
+                view_at(ManageOfferSuccessResult, unpacker, depth_limit - 1),
+            )
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_MALFORMED:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_TRUST:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_TRUST:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LINE_FULL:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_UNDERFUNDED:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_CROSS_SELF:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_ISSUER:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_ISSUER:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_NOT_FOUND:
+            return
+        if code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LOW_RESERVE:
+            return
         raise ValueError("Invalid code.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -121,10 +274,12 @@ class ManageBuyOfferResult:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ManageBuyOfferResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ManageBuyOfferResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -139,11 +294,11 @@ class ManageBuyOfferResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ManageBuyOfferResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS:
@@ -208,6 +363,65 @@ class ManageBuyOfferResult:
             return cls(code=code, success=success)
         raise ValueError(f"Unknown key '{key}' for ManageBuyOfferResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS:
+            assert self.success is not None
+            write('{"success": ')
+            self.success._write_json(write)
+            write("}")
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_TRUST:
+            write('"sell_no_trust"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_TRUST:
+            write('"buy_no_trust"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED:
+            write('"sell_not_authorized"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED:
+            write('"buy_not_authorized"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LINE_FULL:
+            write('"line_full"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_UNDERFUNDED:
+            write('"underfunded"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_CROSS_SELF:
+            write('"cross_self"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_ISSUER:
+            write('"sell_no_issuer"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_ISSUER:
+            write('"buy_no_issuer"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_NOT_FOUND:
+            write('"not_found"')
+            return
+        if self.code == ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        raise ValueError(f"Unknown code in ManageBuyOfferResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ManageBuyOfferResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.success = self.success.clone() if self.success is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ManageBuyOfferResult:
+        return self.clone()
+
+    def freeze(self) -> ManageBuyOfferResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -227,3 +441,33 @@ class ManageBuyOfferResult:
         if self.success is not None:
             out.append(f"success={self.success}")
         return f"<ManageBuyOfferResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> ManageBuyOfferResult:
+    return cls(code=code)
+
+
+def _unpack_success(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> ManageBuyOfferResult:
+    success = ManageOfferSuccessResult.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, success=success)
+
+
+_UNPACK_ARMS = {
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SUCCESS: _unpack_success,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_MALFORMED: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_TRUST: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_TRUST: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LINE_FULL: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_UNDERFUNDED: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_CROSS_SELF: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_SELL_NO_ISSUER: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_BUY_NO_ISSUER: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_NOT_FOUND: _unpack_void,
+    ManageBuyOfferResultCode.MANAGE_BUY_OFFER_LOW_RESERVE: _unpack_void,
+}
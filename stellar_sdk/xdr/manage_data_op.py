@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .data_value import DataValue
 from .string64 import String64
 
@@ -25,6 +35,8 @@ class ManageDataOp:
         };
     """
 
+    __slots__ = ("data_name", "data_value")
+
     def __init__(
         self,
         data_name: String64,
@@ -41,6 +53,13 @@ class ManageDataOp:
             packer.pack_uint(1)
             self.data_value.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.data_name.xdr_size()
+            + 4
+            + (self.data_value.xdr_size() if self.data_value is not None else 0)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -58,16 +77,60 @@ class ManageDataOp:
             data_value=data_value,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String64.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            DataValue.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ManageDataOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "data_name" in fields:
+            _result["data_name"] = String64.unpack_fields(
+                unpacker, fields["data_name"], depth_limit - 1
+            )
+        else:
+            String64.skip(unpacker, depth_limit - 1)
+        if "data_value" in fields:
+            _result["data_value"] = (
+                DataValue.unpack_fields(unpacker, fields["data_value"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                DataValue.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ManageDataOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ManageDataOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +145,11 @@ class ManageDataOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ManageDataOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -109,6 +172,32 @@ class ManageDataOp:
             data_value=data_value,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"data_name": ')
+        self.data_name._write_json(write)
+        write(', "data_value": ')
+        if self.data_value is None:
+            write("null")
+        else:
+            self.data_value._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ManageDataOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.data_name = self.data_name.clone()
+        result.data_value = (
+            self.data_value.clone() if self.data_value is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ManageDataOp:
+        return self.clone()
+
+    def freeze(self) -> ManageDataOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .manage_data_result_code import ManageDataResultCode
 
 __all__ = ["ManageDataResult"]
@@ -29,6 +39,8 @@ class ManageDataResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: ManageDataResultCode,
@@ -49,6 +61,19 @@ class ManageDataResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == ManageDataResultCode.MANAGE_DATA_SUCCESS:
+            return 4
+        if self.code == ManageDataResultCode.MANAGE_DATA_NOT_SUPPORTED_YET:
+            return 4
+        if self.code == ManageDataResultCode.MANAGE_DATA_NAME_NOT_FOUND:
+            return 4
+        if self.code == ManageDataResultCode.MANAGE_DATA_LOW_RESERVE:
+            return 4
+        if self.code == ManageDataResultCode.MANAGE_DATA_INVALID_NAME:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,28 +81,74 @@ class ManageDataResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = ManageDataResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = ManageDataResultCode.unpack(unpacker)
+        if code == ManageDataResultCode.MANAGE_DATA_SUCCESS:
+            return
+        if code == ManageDataResultCode.MANAGE_DATA_NOT_SUPPORTED_YET:
+            return
+        if code == ManageDataResultCode.MANAGE_DATA_NAME_NOT_FOUND:
+            return
+        if code == ManageDataResultCode.MANAGE_DATA_LOW_RESERVE:
+            return
+        if code == ManageDataResultCode.MANAGE_DATA_INVALID_NAME:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ManageDataResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = ManageDataResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == ManageDataResultCode.MANAGE_DATA_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == ManageDataResultCode.MANAGE_DATA_NOT_SUPPORTED_YET:
-            return cls(code=code)
+            return _result
         if code == ManageDataResultCode.MANAGE_DATA_NAME_NOT_FOUND:
-            return cls(code=code)
+            return _result
         if code == ManageDataResultCode.MANAGE_DATA_LOW_RESERVE:
-            return cls(code=code)
+            return _result
         if code == ManageDataResultCode.MANAGE_DATA_INVALID_NAME:
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ManageDataResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ManageDataResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +163,11 @@ class ManageDataResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ManageDataResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == ManageDataResultCode.MANAGE_DATA_SUCCESS:
@@ -126,6 +197,37 @@ class ManageDataResult:
         code = ManageDataResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == ManageDataResultCode.MANAGE_DATA_SUCCESS:
+            write('"success"')
+            return
+        if self.code == ManageDataResultCode.MANAGE_DATA_NOT_SUPPORTED_YET:
+            write('"not_supported_yet"')
+            return
+        if self.code == ManageDataResultCode.MANAGE_DATA_NAME_NOT_FOUND:
+            write('"name_not_found"')
+            return
+        if self.code == ManageDataResultCode.MANAGE_DATA_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        if self.code == ManageDataResultCode.MANAGE_DATA_INVALID_NAME:
+            write('"invalid_name"')
+            return
+        raise ValueError(f"Unknown code in ManageDataResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> ManageDataResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ManageDataResult:
+        return self.clone()
+
+    def freeze(self) -> ManageDataResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -138,3 +240,16 @@ class ManageDataResult:
         out = []
         out.append(f"code={self.code}")
         return f"<ManageDataResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> ManageDataResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    ManageDataResultCode.MANAGE_DATA_SUCCESS: _unpack_void,
+    ManageDataResultCode.MANAGE_DATA_NOT_SUPPORTED_YET: _unpack_void,
+    ManageDataResultCode.MANAGE_DATA_NAME_NOT_FOUND: _unpack_void,
+    ManageDataResultCode.MANAGE_DATA_LOW_RESERVE: _unpack_void,
+    ManageDataResultCode.MANAGE_DATA_INVALID_NAME: _unpack_void,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .claim_atom import ClaimAtom
 from .manage_offer_success_result_offer import ManageOfferSuccessResultOffer
 
@@ -35,6 +48,8 @@ class ManageOfferSuccessResult:
         };
     """
 
+    __slots__ = ("offer", "offers_claimed")
+
     def __init__(
         self,
         offers_claimed: list[ClaimAtom],
@@ -54,6 +69,13 @@ class ManageOfferSuccessResult:
             offers_claimed_item.pack(packer)
         self.offer.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + sum(item.xdr_size() for item in self.offers_claimed)
+            + self.offer.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -75,16 +97,102 @@ class ManageOfferSuccessResult:
             offer=offer,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"offers_claimed length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ClaimAtom.skip(unpacker, depth_limit - 1)
+        ManageOfferSuccessResultOffer.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ManageOfferSuccessResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "offers_claimed" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"offers_claimed length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["offers_claimed"] = []
+            for _ in range(length):
+                _result["offers_claimed"].append(
+                    ClaimAtom.unpack_fields(
+                        unpacker, fields["offers_claimed"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"offers_claimed length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ClaimAtom.skip(unpacker, depth_limit - 1)
+        if "offer" in fields:
+            _result["offer"] = ManageOfferSuccessResultOffer.unpack_fields(
+                unpacker, fields["offer"], depth_limit - 1
+            )
+        else:
+            ManageOfferSuccessResultOffer.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"offers_claimed length {length} exceeds remaining input length {_remaining}"
+            )
+        offers_claimed = []
+        for _ in range(length):
+            offers_claimed.append(ClaimAtom.unpack(unpacker, depth_limit - 1))
+        yield "offers_claimed", offers_claimed
+        yield "offer", ManageOfferSuccessResultOffer.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ManageOfferSuccessResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ManageOfferSuccessResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -99,11 +207,11 @@ class ManageOfferSuccessResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ManageOfferSuccessResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -122,6 +230,27 @@ class ManageOfferSuccessResult:
             offer=offer,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"offers_claimed": ')
+        write_json_array(write, self.offers_claimed)
+        write(', "offer": ')
+        self.offer._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ManageOfferSuccessResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.offers_claimed = [item.clone() for item in self.offers_claimed]
+        result.offer = self.offer.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ManageOfferSuccessResult:
+        return self.clone()
+
+    def freeze(self) -> ManageOfferSuccessResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .manage_offer_effect import ManageOfferEffect
 from .offer_entry import OfferEntry
 
@@ -28,6 +38,8 @@ class ManageOfferSuccessResultOffer:
             }
     """
 
+    __slots__ = ("effect", "offer")
+
     def __init__(
         self,
         effect: ManageOfferEffect,
@@ -52,33 +64,98 @@ class ManageOfferSuccessResultOffer:
             return
         raise ValueError("Invalid effect.")
 
+    def xdr_size(self) -> int:
+        if self.effect == ManageOfferEffect.MANAGE_OFFER_CREATED:
+            assert self.offer is not None
+            return 4 + self.offer.xdr_size()
+        if self.effect == ManageOfferEffect.MANAGE_OFFER_UPDATED:
+            assert self.offer is not None
+            return 4 + self.offer.xdr_size()
+        if self.effect == ManageOfferEffect.MANAGE_OFFER_DELETED:
+            return 4
+        raise ValueError("Invalid effect.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> ManageOfferSuccessResultOffer:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        effect = ManageOfferEffect.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(effect)
+        if unpack_arm is None:
+            raise ValueError("Invalid effect.")
+        return unpack_arm(cls, effect, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         effect = ManageOfferEffect.unpack(unpacker)
         if effect == ManageOfferEffect.MANAGE_OFFER_CREATED:
-            offer = OfferEntry.unpack(unpacker, depth_limit - 1)
-            return cls(effect=effect, offer=offer)
+            OfferEntry.skip(unpacker, depth_limit - 1)
+            return
         if effect == ManageOfferEffect.MANAGE_OFFER_UPDATED:
-            offer = OfferEntry.unpack(unpacker, depth_limit - 1)
-            return cls(effect=effect, offer=offer)
+            OfferEntry.skip(unpacker, depth_limit - 1)
+            return
         if effect == ManageOfferEffect.MANAGE_OFFER_DELETED:
-            return cls(effect=effect)
+            return
         raise ValueError("Invalid effect.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ManageOfferSuccessResultOffer:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        effect = ManageOfferEffect.unpack(unpacker)
+        if "effect" in fields:
+            _result["effect"] = effect
+        if effect == ManageOfferEffect.MANAGE_OFFER_CREATED:
+            if "offer" in fields:
+                _result["offer"] = OfferEntry.unpack_fields(
+                    unpacker, fields["offer"], depth_limit - 1
+                )
+            else:
+                OfferEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if effect == ManageOfferEffect.MANAGE_OFFER_UPDATED:
+            if "offer" in fields:
+                _result["offer"] = OfferEntry.unpack_fields(
+                    unpacker, fields["offer"], depth_limit - 1
+                )
+            else:
+                OfferEntry.skip(unpacker, depth_limit - 1)
+            return _result
+        if effect == ManageOfferEffect.MANAGE_OFFER_DELETED:
+            return _result
+        raise ValueError("Invalid effect.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ManageOfferSuccessResultOffer:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ManageOfferSuccessResultOffer:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -93,11 +170,11 @@ class ManageOfferSuccessResultOffer:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ManageOfferSuccessResultOffer:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.effect == ManageOfferEffect.MANAGE_OFFER_CREATED:
@@ -135,6 +212,40 @@ class ManageOfferSuccessResultOffer:
             return cls(effect=effect, offer=offer)
         raise ValueError(f"Unknown key '{key}' for ManageOfferSuccessResultOffer")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.effect == ManageOfferEffect.MANAGE_OFFER_CREATED:
+            assert self.offer is not None
+            write('{"created": ')
+            self.offer._write_json(write)
+            write("}")
+            return
+        if self.effect == ManageOfferEffect.MANAGE_OFFER_UPDATED:
+            assert self.offer is not None
+            write('{"updated": ')
+            self.offer._write_json(write)
+            write("}")
+            return
+        if self.effect == ManageOfferEffect.MANAGE_OFFER_DELETED:
+            write('"deleted"')
+            return
+        raise ValueError(
+            f"Unknown effect in ManageOfferSuccessResultOffer: {self.effect}"
+        )
+
+    def clone(self, deep: bool = True) -> ManageOfferSuccessResultOffer:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.effect = self.effect
+        result.offer = self.offer.clone() if self.offer is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ManageOfferSuccessResultOffer:
+        return self.clone()
+
+    def freeze(self) -> ManageOfferSuccessResultOffer:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -154,3 +265,23 @@ class ManageOfferSuccessResultOffer:
         if self.offer is not None:
             out.append(f"offer={self.offer}")
         return f"<ManageOfferSuccessResultOffer [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, effect, unpacker: Unpacker, depth_limit: int
+) -> ManageOfferSuccessResultOffer:
+    return cls(effect=effect)
+
+
+def _unpack_offer(
+    cls, effect, unpacker: Unpacker, depth_limit: int
+) -> ManageOfferSuccessResultOffer:
+    offer = OfferEntry.unpack(unpacker, depth_limit - 1)
+    return cls(effect=effect, offer=offer)
+
+
+_UNPACK_ARMS = {
+    ManageOfferEffect.MANAGE_OFFER_CREATED: _unpack_offer,
+    ManageOfferEffect.MANAGE_OFFER_UPDATED: _unpack_offer,
+    ManageOfferEffect.MANAGE_OFFER_DELETED: _unpack_void,
+}
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .price import Price
 
@@ -31,6 +41,8 @@ class ManageSellOfferOp:
         };
     """
 
+    __slots__ = ("amount", "buying", "offer_id", "price", "selling")
+
     def __init__(
         self,
         selling: Asset,
@@ -52,6 +64,9 @@ class ManageSellOfferOp:
         self.price.pack(packer)
         self.offer_id.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 24 + self.selling.xdr_size() + self.buying.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,16 +86,79 @@ class ManageSellOfferOp:
             offer_id=offer_id,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Asset.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Price.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ManageSellOfferOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "selling" in fields:
+            _result["selling"] = Asset.unpack_fields(
+                unpacker, fields["selling"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "buying" in fields:
+            _result["buying"] = Asset.unpack_fields(
+                unpacker, fields["buying"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "amount" in fields:
+            _result["amount"] = Int64.unpack_fields(
+                unpacker, fields["amount"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "price" in fields:
+            _result["price"] = Price.unpack_fields(
+                unpacker, fields["price"], depth_limit - 1
+            )
+        else:
+            Price.skip(unpacker, depth_limit - 1)
+        if "offer_id" in fields:
+            _result["offer_id"] = Int64.unpack_fields(
+                unpacker, fields["offer_id"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ManageSellOfferOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ManageSellOfferOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +173,11 @@ class ManageSellOfferOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ManageSellOfferOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -125,6 +203,36 @@ class ManageSellOfferOp:
             offer_id=offer_id,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"selling": ')
+        self.selling._write_json(write)
+        write(', "buying": ')
+        self.buying._write_json(write)
+        write(', "amount": ')
+        self.amount._write_json(write)
+        write(', "price": ')
+        self.price._write_json(write)
+        write(', "offer_id": ')
+        self.offer_id._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ManageSellOfferOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.selling = self.selling.clone()
+        result.buying = self.buying.clone()
+        result.amount = self.amount.clone()
+        result.price = self.price.clone()
+        result.offer_id = self.offer_id.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ManageSellOfferOp:
+        return self.clone()
+
+    def freeze(self) -> ManageSellOfferOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .memo_type import MemoType
 from .uint64 import Uint64
@@ -34,6 +46,8 @@ class Memo:
         };
     """
 
+    __slots__ = ("hash", "id", "ret_hash", "text", "type")
+
     def __init__(
         self,
         type: MemoType,
@@ -79,39 +93,119 @@ class Memo:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == MemoType.MEMO_NONE:
+            return 4
+        if self.type == MemoType.MEMO_TEXT:
+            assert self.text is not None
+            return 4 + 4 + (len(self.text) + 3) // 4 * 4
+        if self.type == MemoType.MEMO_ID:
+            return 12
+        if self.type == MemoType.MEMO_HASH:
+            return 36
+        if self.type == MemoType.MEMO_RETURN:
+            return 36
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> Memo:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = MemoType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = MemoType.unpack(unpacker)
         if type == MemoType.MEMO_NONE:
-            return cls(type=type)
+            return
         if type == MemoType.MEMO_TEXT:
-            text = String.unpack(unpacker, 28)
-            return cls(type=type, text=text)
+            String.skip(unpacker, 28)
+            return
         if type == MemoType.MEMO_ID:
-            id = Uint64.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, id=id)
+            Uint64.skip(unpacker, depth_limit - 1)
+            return
         if type == MemoType.MEMO_HASH:
-            hash = Hash.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, hash=hash)
+            Hash.skip(unpacker, depth_limit - 1)
+            return
         if type == MemoType.MEMO_RETURN:
-            ret_hash = Hash.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, ret_hash=ret_hash)
+            Hash.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Memo:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = MemoType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == MemoType.MEMO_NONE:
+            return _result
+        if type == MemoType.MEMO_TEXT:
+            if "text" in fields:
+                _result["text"] = String.unpack_fields(unpacker, fields["text"], 28)
+            else:
+                String.skip(unpacker, 28)
+            return _result
+        if type == MemoType.MEMO_ID:
+            if "id" in fields:
+                _result["id"] = Uint64.unpack_fields(
+                    unpacker, fields["id"], depth_limit - 1
+                )
+            else:
+                Uint64.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MemoType.MEMO_HASH:
+            if "hash" in fields:
+                _result["hash"] = Hash.unpack_fields(
+                    unpacker, fields["hash"], depth_limit - 1
+                )
+            else:
+                Hash.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MemoType.MEMO_RETURN:
+            if "ret_hash" in fields:
+                _result["ret_hash"] = Hash.unpack_fields(
+                    unpacker, fields["ret_hash"], depth_limit - 1
+                )
+            else:
+                Hash.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Memo:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Memo:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -126,11 +220,11 @@ class Memo:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Memo:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == MemoType.MEMO_NONE:
@@ -178,6 +272,53 @@ class Memo:
             return cls(type=type, ret_hash=ret_hash)
         raise ValueError(f"Unknown key '{key}' for Memo")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == MemoType.MEMO_NONE:
+            write('"none"')
+            return
+        if self.type == MemoType.MEMO_TEXT:
+            assert self.text is not None
+            write('{"text": ')
+            write(json_encode(String.to_json_dict(self.text)))
+            write("}")
+            return
+        if self.type == MemoType.MEMO_ID:
+            assert self.id is not None
+            write('{"id": ')
+            self.id._write_json(write)
+            write("}")
+            return
+        if self.type == MemoType.MEMO_HASH:
+            assert self.hash is not None
+            write('{"hash": ')
+            self.hash._write_json(write)
+            write("}")
+            return
+        if self.type == MemoType.MEMO_RETURN:
+            assert self.ret_hash is not None
+            write('{"return": ')
+            self.ret_hash._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in Memo: {self.type}")
+
+    def clone(self, deep: bool = True) -> Memo:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.text = self.text
+        result.id = self.id.clone() if self.id is not None else None
+        result.hash = self.hash.clone() if self.hash is not None else None
+        result.ret_hash = self.ret_hash.clone() if self.ret_hash is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Memo:
+        return self.clone()
+
+    def freeze(self) -> Memo:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -212,3 +353,36 @@ class Memo:
         if self.ret_hash is not None:
             out.append(f"ret_hash={self.ret_hash}")
         return f"<Memo [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> Memo:
+    return cls(type=type)
+
+
+def _unpack_text(cls, type, unpacker: Unpacker, depth_limit: int) -> Memo:
+    text = String.unpack(unpacker, 28)
+    return cls(type=type, text=text)
+
+
+def _unpack_id(cls, type, unpacker: Unpacker, depth_limit: int) -> Memo:
+    id = Uint64.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, id=id)
+
+
+def _unpack_hash(cls, type, unpacker: Unpacker, depth_limit: int) -> Memo:
+    hash = Hash.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, hash=hash)
+
+
+def _unpack_ret_hash(cls, type, unpacker: Unpacker, depth_limit: int) -> Memo:
+    ret_hash = Hash.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, ret_hash=ret_hash)
+
+
+_UNPACK_ARMS = {
+    MemoType.MEMO_NONE: _unpack_void,
+    MemoType.MEMO_TEXT: _unpack_text,
+    MemoType.MEMO_ID: _unpack_id,
+    MemoType.MEMO_HASH: _unpack_hash,
+    MemoType.MEMO_RETURN: _unpack_ret_hash,
+}
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .crypto_key_type import CryptoKeyType
 from .muxed_account_med25519 import MuxedAccountMed25519
 from .uint256 import Uint256
@@ -32,6 +43,8 @@ class MuxedAccount:
         };
     """
 
+    __slots__ = ("ed25519", "med25519", "type")
+
     def __init__(
         self,
         type: CryptoKeyType,
@@ -56,31 +69,88 @@ class MuxedAccount:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == CryptoKeyType.KEY_TYPE_ED25519:
+            return 36
+        if self.type == CryptoKeyType.KEY_TYPE_MUXED_ED25519:
+            return 44
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> MuxedAccount:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = CryptoKeyType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = CryptoKeyType.unpack(unpacker)
         if type == CryptoKeyType.KEY_TYPE_ED25519:
-            ed25519 = Uint256.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, ed25519=ed25519)
+            Uint256.skip(unpacker, depth_limit - 1)
+            return
         if type == CryptoKeyType.KEY_TYPE_MUXED_ED25519:
-            med25519 = MuxedAccountMed25519.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, med25519=med25519)
+            MuxedAccountMed25519.skip(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | MuxedAccount:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = CryptoKeyType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == CryptoKeyType.KEY_TYPE_ED25519:
+            if "ed25519" in fields:
+                _result["ed25519"] = Uint256.unpack_fields(
+                    unpacker, fields["ed25519"], depth_limit - 1
+                )
+            else:
+                Uint256.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == CryptoKeyType.KEY_TYPE_MUXED_ED25519:
+            if "med25519" in fields:
+                _result["med25519"] = MuxedAccountMed25519.unpack_fields(
+                    unpacker, fields["med25519"], depth_limit - 1
+                )
+            else:
+                MuxedAccountMed25519.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MuxedAccount:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> MuxedAccount:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +165,11 @@ class MuxedAccount:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MuxedAccount:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         from ..strkey import StrKey
@@ -137,6 +207,24 @@ class MuxedAccount:
         med25519 = MuxedAccountMed25519(id=id, ed25519=ed25519)
         return cls(type=CryptoKeyType.KEY_TYPE_MUXED_ED25519, med25519=med25519)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> MuxedAccount:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.ed25519 = self.ed25519.clone() if self.ed25519 is not None else None
+        result.med25519 = self.med25519.clone() if self.med25519 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> MuxedAccount:
+        return self.clone()
+
+    def freeze(self) -> MuxedAccount:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -163,3 +251,19 @@ class MuxedAccount:
         if self.med25519 is not None:
             out.append(f"med25519={self.med25519}")
         return f"<MuxedAccount [{', '.join(out)}]>"
+
+
+def _unpack_ed25519(cls, type, unpacker: Unpacker, depth_limit: int) -> MuxedAccount:
+    ed25519 = Uint256.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, ed25519=ed25519)
+
+
+def _unpack_med25519(cls, type, unpacker: Unpacker, depth_limit: int) -> MuxedAccount:
+    med25519 = MuxedAccountMed25519.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, med25519=med25519)
+
+
+_UNPACK_ARMS = {
+    CryptoKeyType.KEY_TYPE_ED25519: _unpack_ed25519,
+    CryptoKeyType.KEY_TYPE_MUXED_ED25519: _unpack_med25519,
+}
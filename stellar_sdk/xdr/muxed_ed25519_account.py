@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint64 import Uint64
 from .uint256 import Uint256
 
+_LAYOUT = FixedLayout(">Q32s")
 __all__ = ["MuxedEd25519Account"]
 
 
@@ -25,6 +37,8 @@ class MuxedEd25519Account:
         };
     """
 
+    __slots__ = ("ed25519", "id")
+
     def __init__(
         self,
         id: Uint64,
@@ -34,8 +48,10 @@ class MuxedEd25519Account:
         self.ed25519 = ed25519
 
     def pack(self, packer: Packer) -> None:
-        self.id.pack(packer)
-        self.ed25519.pack(packer)
+        _LAYOUT.write(packer, self.id.uint64, self.ed25519.uint256)
+
+    def xdr_size(self) -> int:
+        return 40
 
     @classmethod
     def unpack(
@@ -43,23 +59,63 @@ class MuxedEd25519Account:
     ) -> MuxedEd25519Account:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        id = Uint64.unpack(unpacker, depth_limit - 1)
-        ed25519 = Uint256.unpack(unpacker, depth_limit - 1)
+        id, ed25519 = _LAYOUT.read(unpacker)
         return cls(
-            id=id,
-            ed25519=ed25519,
+            id=Uint64(id),
+            ed25519=Uint256(ed25519),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | MuxedEd25519Account:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "id" in fields:
+            _result["id"] = Uint64.unpack_fields(
+                unpacker, fields["id"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "ed25519" in fields:
+            _result["ed25519"] = Uint256.unpack_fields(
+                unpacker, fields["ed25519"], depth_limit - 1
+            )
+        else:
+            Uint256.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MuxedEd25519Account:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> MuxedEd25519Account:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +130,11 @@ class MuxedEd25519Account:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MuxedEd25519Account:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +151,27 @@ class MuxedEd25519Account:
             ed25519=ed25519,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"id": ')
+        self.id._write_json(write)
+        write(', "ed25519": ')
+        self.ed25519._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> MuxedEd25519Account:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.id = self.id.clone()
+        result.ed25519 = self.ed25519.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> MuxedEd25519Account:
+        return self.clone()
+
+    def freeze(self) -> MuxedEd25519Account:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .muxed_account import MuxedAccount
 from .operation_body import OperationBody
 
@@ -86,6 +99,8 @@ class Operation:
         };
     """
 
+    __slots__ = ("body", "source_account")
+
     def __init__(
         self,
         source_account: MuxedAccount | None,
@@ -102,6 +117,13 @@ class Operation:
             self.source_account.pack(packer)
         self.body.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (self.source_account.xdr_size() if self.source_account is not None else 0)
+            + self.body.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -119,16 +141,78 @@ class Operation:
             body=body,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            MuxedAccount.skip(unpacker, depth_limit - 1)
+        OperationBody.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Operation:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "source_account" in fields:
+            _result["source_account"] = (
+                MuxedAccount.unpack_fields(
+                    unpacker, fields["source_account"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                MuxedAccount.skip(unpacker, depth_limit - 1)
+        if "body" in fields:
+            _result["body"] = OperationBody.unpack_fields(
+                unpacker, fields["body"], depth_limit - 1
+            )
+        else:
+            OperationBody.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield (
+            "source_account",
+            MuxedAccount.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield "body", view_at(OperationBody, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Operation:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Operation:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -143,11 +227,11 @@ class Operation:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Operation:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -170,6 +254,32 @@ class Operation:
             body=body,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"source_account": ')
+        if self.source_account is None:
+            write("null")
+        else:
+            self.source_account._write_json(write)
+        write(', "body": ')
+        self.body._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> Operation:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.source_account = (
+            self.source_account.clone() if self.source_account is not None else None
+        )
+        result.body = self.body.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Operation:
+        return self.clone()
+
+    def freeze(self) -> Operation:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .allow_trust_op import AllowTrustOp
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .begin_sponsoring_future_reserves_op import BeginSponsoringFutureReservesOp
 from .bump_sequence_op import BumpSequenceOp
 from .change_trust_op import ChangeTrustOp
@@ -101,6 +114,35 @@ class OperationBody:
             }
     """
 
+    __slots__ = (
+        "allow_trust_op",
+        "begin_sponsoring_future_reserves_op",
+        "bump_sequence_op",
+        "change_trust_op",
+        "claim_claimable_balance_op",
+        "clawback_claimable_balance_op",
+        "clawback_op",
+        "create_account_op",
+        "create_claimable_balance_op",
+        "create_passive_sell_offer_op",
+        "destination",
+        "extend_footprint_ttl_op",
+        "invoke_host_function_op",
+        "liquidity_pool_deposit_op",
+        "liquidity_pool_withdraw_op",
+        "manage_buy_offer_op",
+        "manage_data_op",
+        "manage_sell_offer_op",
+        "path_payment_strict_receive_op",
+        "path_payment_strict_send_op",
+        "payment_op",
+        "restore_footprint_op",
+        "revoke_sponsorship_op",
+        "set_options_op",
+        "set_trust_line_flags_op",
+        "type",
+    )
+
     def __init__(
         self,
         type: OperationType,
@@ -293,131 +335,574 @@ class OperationBody:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == OperationType.CREATE_ACCOUNT:
+            assert self.create_account_op is not None
+            return 4 + self.create_account_op.xdr_size()
+        if self.type == OperationType.PAYMENT:
+            assert self.payment_op is not None
+            return 4 + self.payment_op.xdr_size()
+        if self.type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            assert self.path_payment_strict_receive_op is not None
+            return 4 + self.path_payment_strict_receive_op.xdr_size()
+        if self.type == OperationType.MANAGE_SELL_OFFER:
+            assert self.manage_sell_offer_op is not None
+            return 4 + self.manage_sell_offer_op.xdr_size()
+        if self.type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            assert self.create_passive_sell_offer_op is not None
+            return 4 + self.create_passive_sell_offer_op.xdr_size()
+        if self.type == OperationType.SET_OPTIONS:
+            assert self.set_options_op is not None
+            return 4 + self.set_options_op.xdr_size()
+        if self.type == OperationType.CHANGE_TRUST:
+            assert self.change_trust_op is not None
+            return 4 + self.change_trust_op.xdr_size()
+        if self.type == OperationType.ALLOW_TRUST:
+            assert self.allow_trust_op is not None
+            return 4 + self.allow_trust_op.xdr_size()
+        if self.type == OperationType.ACCOUNT_MERGE:
+            assert self.destination is not None
+            return 4 + self.destination.xdr_size()
+        if self.type == OperationType.INFLATION:
+            return 4
+        if self.type == OperationType.MANAGE_DATA:
+            assert self.manage_data_op is not None
+            return 4 + self.manage_data_op.xdr_size()
+        if self.type == OperationType.BUMP_SEQUENCE:
+            return 12
+        if self.type == OperationType.MANAGE_BUY_OFFER:
+            assert self.manage_buy_offer_op is not None
+            return 4 + self.manage_buy_offer_op.xdr_size()
+        if self.type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            assert self.path_payment_strict_send_op is not None
+            return 4 + self.path_payment_strict_send_op.xdr_size()
+        if self.type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            assert self.create_claimable_balance_op is not None
+            return 4 + self.create_claimable_balance_op.xdr_size()
+        if self.type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            assert self.claim_claimable_balance_op is not None
+            return 4 + self.claim_claimable_balance_op.xdr_size()
+        if self.type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            assert self.begin_sponsoring_future_reserves_op is not None
+            return 4 + self.begin_sponsoring_future_reserves_op.xdr_size()
+        if self.type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            return 4
+        if self.type == OperationType.REVOKE_SPONSORSHIP:
+            assert self.revoke_sponsorship_op is not None
+            return 4 + self.revoke_sponsorship_op.xdr_size()
+        if self.type == OperationType.CLAWBACK:
+            assert self.clawback_op is not None
+            return 4 + self.clawback_op.xdr_size()
+        if self.type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            assert self.clawback_claimable_balance_op is not None
+            return 4 + self.clawback_claimable_balance_op.xdr_size()
+        if self.type == OperationType.SET_TRUST_LINE_FLAGS:
+            assert self.set_trust_line_flags_op is not None
+            return 4 + self.set_trust_line_flags_op.xdr_size()
+        if self.type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            return 68
+        if self.type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            return 60
+        if self.type == OperationType.INVOKE_HOST_FUNCTION:
+            assert self.invoke_host_function_op is not None
+            return 4 + self.invoke_host_function_op.xdr_size()
+        if self.type == OperationType.EXTEND_FOOTPRINT_TTL:
+            assert self.extend_footprint_ttl_op is not None
+            return 4 + self.extend_footprint_ttl_op.xdr_size()
+        if self.type == OperationType.RESTORE_FOOTPRINT:
+            assert self.restore_footprint_op is not None
+            return 4 + self.restore_footprint_op.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> OperationBody:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = OperationType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = OperationType.unpack(unpacker)
         if type == OperationType.CREATE_ACCOUNT:
-            create_account_op = CreateAccountOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, create_account_op=create_account_op)
+            CreateAccountOp.skip(unpacker, depth_limit - 1)
+            return
         if type == OperationType.PAYMENT:
-            payment_op = PaymentOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, payment_op=payment_op)
+            PaymentOp.skip(unpacker, depth_limit - 1)
+            return
         if type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
-            path_payment_strict_receive_op = PathPaymentStrictReceiveOp.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, path_payment_strict_receive_op=path_payment_strict_receive_op
-            )
+            PathPaymentStrictReceiveOp.skip(unpacker, depth_limit - 1)
+            return
         if type == OperationType.MANAGE_SELL_OFFER:
-            manage_sell_offer_op = ManageSellOfferOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, manage_sell_offer_op=manage_sell_offer_op)
+            ManageSellOfferOp.skip(unpacker, depth_limit - 1)
+            return
         if type == OperationType.CREATE_PASSIVE_SELL_OFFER:
-            create_passive_sell_offer_op = CreatePassiveSellOfferOp.unpack(
-                unpacker, depth_limit - 1
+            CreatePassiveSellOfferOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.SET_OPTIONS:
+            SetOptionsOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CHANGE_TRUST:
+            ChangeTrustOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.ALLOW_TRUST:
+            AllowTrustOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.ACCOUNT_MERGE:
+            MuxedAccount.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.INFLATION:
+            return
+        if type == OperationType.MANAGE_DATA:
+            ManageDataOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.BUMP_SEQUENCE:
+            BumpSequenceOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.MANAGE_BUY_OFFER:
+            ManageBuyOfferOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            PathPaymentStrictSendOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            CreateClaimableBalanceOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            ClaimClaimableBalanceOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            BeginSponsoringFutureReservesOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            return
+        if type == OperationType.REVOKE_SPONSORSHIP:
+            RevokeSponsorshipOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CLAWBACK:
+            ClawbackOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            ClawbackClaimableBalanceOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.SET_TRUST_LINE_FLAGS:
+            SetTrustLineFlagsOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            LiquidityPoolDepositOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            LiquidityPoolWithdrawOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.INVOKE_HOST_FUNCTION:
+            InvokeHostFunctionOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.EXTEND_FOOTPRINT_TTL:
+            ExtendFootprintTTLOp.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.RESTORE_FOOTPRINT:
+            RestoreFootprintOp.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | OperationBody:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = OperationType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == OperationType.CREATE_ACCOUNT:
+            if "create_account_op" in fields:
+                _result["create_account_op"] = CreateAccountOp.unpack_fields(
+                    unpacker, fields["create_account_op"], depth_limit - 1
+                )
+            else:
+                CreateAccountOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.PAYMENT:
+            if "payment_op" in fields:
+                _result["payment_op"] = PaymentOp.unpack_fields(
+                    unpacker, fields["payment_op"], depth_limit - 1
+                )
+            else:
+                PaymentOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            if "path_payment_strict_receive_op" in fields:
+                _result["path_payment_strict_receive_op"] = (
+                    PathPaymentStrictReceiveOp.unpack_fields(
+                        unpacker,
+                        fields["path_payment_strict_receive_op"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                PathPaymentStrictReceiveOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.MANAGE_SELL_OFFER:
+            if "manage_sell_offer_op" in fields:
+                _result["manage_sell_offer_op"] = ManageSellOfferOp.unpack_fields(
+                    unpacker, fields["manage_sell_offer_op"], depth_limit - 1
+                )
+            else:
+                ManageSellOfferOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            if "create_passive_sell_offer_op" in fields:
+                _result["create_passive_sell_offer_op"] = (
+                    CreatePassiveSellOfferOp.unpack_fields(
+                        unpacker,
+                        fields["create_passive_sell_offer_op"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                CreatePassiveSellOfferOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.SET_OPTIONS:
+            if "set_options_op" in fields:
+                _result["set_options_op"] = SetOptionsOp.unpack_fields(
+                    unpacker, fields["set_options_op"], depth_limit - 1
+                )
+            else:
+                SetOptionsOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CHANGE_TRUST:
+            if "change_trust_op" in fields:
+                _result["change_trust_op"] = ChangeTrustOp.unpack_fields(
+                    unpacker, fields["change_trust_op"], depth_limit - 1
+                )
+            else:
+                ChangeTrustOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.ALLOW_TRUST:
+            if "allow_trust_op" in fields:
+                _result["allow_trust_op"] = AllowTrustOp.unpack_fields(
+                    unpacker, fields["allow_trust_op"], depth_limit - 1
+                )
+            else:
+                AllowTrustOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.ACCOUNT_MERGE:
+            if "destination" in fields:
+                _result["destination"] = MuxedAccount.unpack_fields(
+                    unpacker, fields["destination"], depth_limit - 1
+                )
+            else:
+                MuxedAccount.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.INFLATION:
+            return _result
+        if type == OperationType.MANAGE_DATA:
+            if "manage_data_op" in fields:
+                _result["manage_data_op"] = ManageDataOp.unpack_fields(
+                    unpacker, fields["manage_data_op"], depth_limit - 1
+                )
+            else:
+                ManageDataOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.BUMP_SEQUENCE:
+            if "bump_sequence_op" in fields:
+                _result["bump_sequence_op"] = BumpSequenceOp.unpack_fields(
+                    unpacker, fields["bump_sequence_op"], depth_limit - 1
+                )
+            else:
+                BumpSequenceOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.MANAGE_BUY_OFFER:
+            if "manage_buy_offer_op" in fields:
+                _result["manage_buy_offer_op"] = ManageBuyOfferOp.unpack_fields(
+                    unpacker, fields["manage_buy_offer_op"], depth_limit - 1
+                )
+            else:
+                ManageBuyOfferOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            if "path_payment_strict_send_op" in fields:
+                _result["path_payment_strict_send_op"] = (
+                    PathPaymentStrictSendOp.unpack_fields(
+                        unpacker, fields["path_payment_strict_send_op"], depth_limit - 1
+                    )
+                )
+            else:
+                PathPaymentStrictSendOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            if "create_claimable_balance_op" in fields:
+                _result["create_claimable_balance_op"] = (
+                    CreateClaimableBalanceOp.unpack_fields(
+                        unpacker, fields["create_claimable_balance_op"], depth_limit - 1
+                    )
+                )
+            else:
+                CreateClaimableBalanceOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            if "claim_claimable_balance_op" in fields:
+                _result["claim_claimable_balance_op"] = (
+                    ClaimClaimableBalanceOp.unpack_fields(
+                        unpacker, fields["claim_claimable_balance_op"], depth_limit - 1
+                    )
+                )
+            else:
+                ClaimClaimableBalanceOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            if "begin_sponsoring_future_reserves_op" in fields:
+                _result["begin_sponsoring_future_reserves_op"] = (
+                    BeginSponsoringFutureReservesOp.unpack_fields(
+                        unpacker,
+                        fields["begin_sponsoring_future_reserves_op"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                BeginSponsoringFutureReservesOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            return _result
+        if type == OperationType.REVOKE_SPONSORSHIP:
+            if "revoke_sponsorship_op" in fields:
+                _result["revoke_sponsorship_op"] = RevokeSponsorshipOp.unpack_fields(
+                    unpacker, fields["revoke_sponsorship_op"], depth_limit - 1
+                )
+            else:
+                RevokeSponsorshipOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CLAWBACK:
+            if "clawback_op" in fields:
+                _result["clawback_op"] = ClawbackOp.unpack_fields(
+                    unpacker, fields["clawback_op"], depth_limit - 1
+                )
+            else:
+                ClawbackOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            if "clawback_claimable_balance_op" in fields:
+                _result["clawback_claimable_balance_op"] = (
+                    ClawbackClaimableBalanceOp.unpack_fields(
+                        unpacker,
+                        fields["clawback_claimable_balance_op"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                ClawbackClaimableBalanceOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.SET_TRUST_LINE_FLAGS:
+            if "set_trust_line_flags_op" in fields:
+                _result["set_trust_line_flags_op"] = SetTrustLineFlagsOp.unpack_fields(
+                    unpacker, fields["set_trust_line_flags_op"], depth_limit - 1
+                )
+            else:
+                SetTrustLineFlagsOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            if "liquidity_pool_deposit_op" in fields:
+                _result["liquidity_pool_deposit_op"] = (
+                    LiquidityPoolDepositOp.unpack_fields(
+                        unpacker, fields["liquidity_pool_deposit_op"], depth_limit - 1
+                    )
+                )
+            else:
+                LiquidityPoolDepositOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            if "liquidity_pool_withdraw_op" in fields:
+                _result["liquidity_pool_withdraw_op"] = (
+                    LiquidityPoolWithdrawOp.unpack_fields(
+                        unpacker, fields["liquidity_pool_withdraw_op"], depth_limit - 1
+                    )
+                )
+            else:
+                LiquidityPoolWithdrawOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.INVOKE_HOST_FUNCTION:
+            if "invoke_host_function_op" in fields:
+                _result["invoke_host_function_op"] = InvokeHostFunctionOp.unpack_fields(
+                    unpacker, fields["invoke_host_function_op"], depth_limit - 1
+                )
+            else:
+                InvokeHostFunctionOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.EXTEND_FOOTPRINT_TTL:
+            if "extend_footprint_ttl_op" in fields:
+                _result["extend_footprint_ttl_op"] = ExtendFootprintTTLOp.unpack_fields(
+                    unpacker, fields["extend_footprint_ttl_op"], depth_limit - 1
+                )
+            else:
+                ExtendFootprintTTLOp.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.RESTORE_FOOTPRINT:
+            if "restore_footprint_op" in fields:
+                _result["restore_footprint_op"] = RestoreFootprintOp.unpack_fields(
+                    unpacker, fields["restore_footprint_op"], depth_limit - 1
+                )
+            else:
+                RestoreFootprintOp.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = OperationType.unpack(unpacker)
+        yield "type", type
+        if type == OperationType.CREATE_ACCOUNT:
+            yield "create_account_op", CreateAccountOp.unpack(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.PAYMENT:
+            yield "payment_op", PaymentOp.unpack(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            yield (
+                "path_payment_strict_receive_op",
+                view_at(PathPaymentStrictReceiveOp, unpacker, depth_limit - 1),
             )
-            return cls(
-                type=type, create_passive_sell_offer_op=create_passive_sell_offer_op
+            return
+        if type == OperationType.MANAGE_SELL_OFFER:
+            yield (
+                "manage_sell_offer_op",
+                ManageSellOfferOp.unpack(unpacker, depth_limit - 1),
+            )
+            return
+        if type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            yield (
+                "create_passive_sell_offer_op",
+                CreatePassiveSellOfferOp.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.SET_OPTIONS:
-            set_options_op = SetOptionsOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, set_options_op=set_options_op)
+            yield "set_options_op", SetOptionsOp.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.CHANGE_TRUST:
-            change_trust_op = ChangeTrustOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, change_trust_op=change_trust_op)
+            yield "change_trust_op", ChangeTrustOp.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.ALLOW_TRUST:
-            allow_trust_op = AllowTrustOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, allow_trust_op=allow_trust_op)
+            yield "allow_trust_op", AllowTrustOp.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.ACCOUNT_MERGE:
-            destination = MuxedAccount.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, destination=destination)
+            yield "destination", MuxedAccount.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.INFLATION:
-            return cls(type=type)
+            return
         if type == OperationType.MANAGE_DATA:
-            manage_data_op = ManageDataOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, manage_data_op=manage_data_op)
+            yield "manage_data_op", ManageDataOp.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.BUMP_SEQUENCE:
-            bump_sequence_op = BumpSequenceOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, bump_sequence_op=bump_sequence_op)
+            yield "bump_sequence_op", BumpSequenceOp.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.MANAGE_BUY_OFFER:
-            manage_buy_offer_op = ManageBuyOfferOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, manage_buy_offer_op=manage_buy_offer_op)
-        if type == OperationType.PATH_PAYMENT_STRICT_SEND:
-            path_payment_strict_send_op = PathPaymentStrictSendOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "manage_buy_offer_op",
+                ManageBuyOfferOp.unpack(unpacker, depth_limit - 1),
             )
-            return cls(
-                type=type, path_payment_strict_send_op=path_payment_strict_send_op
+            return
+        if type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            yield (
+                "path_payment_strict_send_op",
+                view_at(PathPaymentStrictSendOp, unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.CREATE_CLAIMABLE_BALANCE:
-            create_claimable_balance_op = CreateClaimableBalanceOp.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, create_claimable_balance_op=create_claimable_balance_op
+            yield (
+                "create_claimable_balance_op",
+                view_at(CreateClaimableBalanceOp, unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.CLAIM_CLAIMABLE_BALANCE:
-            claim_claimable_balance_op = ClaimClaimableBalanceOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "claim_claimable_balance_op",
+                ClaimClaimableBalanceOp.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, claim_claimable_balance_op=claim_claimable_balance_op)
+            return
         if type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
-            begin_sponsoring_future_reserves_op = (
-                BeginSponsoringFutureReservesOp.unpack(unpacker, depth_limit - 1)
-            )
-            return cls(
-                type=type,
-                begin_sponsoring_future_reserves_op=begin_sponsoring_future_reserves_op,
+            yield (
+                "begin_sponsoring_future_reserves_op",
+                BeginSponsoringFutureReservesOp.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.END_SPONSORING_FUTURE_RESERVES:
-            return cls(type=type)
+            return
         if type == OperationType.REVOKE_SPONSORSHIP:
-            revoke_sponsorship_op = RevokeSponsorshipOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "revoke_sponsorship_op",
+                view_at(RevokeSponsorshipOp, unpacker, depth_limit - 1),
             )
-            return cls(type=type, revoke_sponsorship_op=revoke_sponsorship_op)
+            return
         if type == OperationType.CLAWBACK:
-            clawback_op = ClawbackOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, clawback_op=clawback_op)
+            yield "clawback_op", ClawbackOp.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
-            clawback_claimable_balance_op = ClawbackClaimableBalanceOp.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, clawback_claimable_balance_op=clawback_claimable_balance_op
+            yield (
+                "clawback_claimable_balance_op",
+                ClawbackClaimableBalanceOp.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.SET_TRUST_LINE_FLAGS:
-            set_trust_line_flags_op = SetTrustLineFlagsOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "set_trust_line_flags_op",
+                SetTrustLineFlagsOp.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, set_trust_line_flags_op=set_trust_line_flags_op)
+            return
         if type == OperationType.LIQUIDITY_POOL_DEPOSIT:
-            liquidity_pool_deposit_op = LiquidityPoolDepositOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "liquidity_pool_deposit_op",
+                LiquidityPoolDepositOp.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, liquidity_pool_deposit_op=liquidity_pool_deposit_op)
+            return
         if type == OperationType.LIQUIDITY_POOL_WITHDRAW:
-            liquidity_pool_withdraw_op = LiquidityPoolWithdrawOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "liquidity_pool_withdraw_op",
+                LiquidityPoolWithdrawOp.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, liquidity_pool_withdraw_op=liquidity_pool_withdraw_op)
+            return
         if type == OperationType.INVOKE_HOST_FUNCTION:
-            invoke_host_function_op = InvokeHostFunctionOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "invoke_host_function_op",
+                view_at(InvokeHostFunctionOp, unpacker, depth_limit - 1),
             )
-            return cls(type=type, invoke_host_function_op=invoke_host_function_op)
+            return
         if type == OperationType.EXTEND_FOOTPRINT_TTL:
-            extend_footprint_ttl_op = ExtendFootprintTTLOp.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "extend_footprint_ttl_op",
+                ExtendFootprintTTLOp.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, extend_footprint_ttl_op=extend_footprint_ttl_op)
+            return
         if type == OperationType.RESTORE_FOOTPRINT:
-            restore_footprint_op = RestoreFootprintOp.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, restore_footprint_op=restore_footprint_op)
+            yield (
+                "restore_footprint_op",
+                RestoreFootprintOp.unpack(unpacker, depth_limit - 1),
+            )
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -426,10 +911,10 @@ class OperationBody:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> OperationBody:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> OperationBody:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -444,11 +929,11 @@ class OperationBody:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> OperationBody:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == OperationType.CREATE_ACCOUNT:
@@ -696,6 +1181,287 @@ class OperationBody:
             return cls(type=type, restore_footprint_op=restore_footprint_op)
         raise ValueError(f"Unknown key '{key}' for OperationBody")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == OperationType.CREATE_ACCOUNT:
+            assert self.create_account_op is not None
+            write('{"create_account": ')
+            self.create_account_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.PAYMENT:
+            assert self.payment_op is not None
+            write('{"payment": ')
+            self.payment_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            assert self.path_payment_strict_receive_op is not None
+            write('{"path_payment_strict_receive": ')
+            self.path_payment_strict_receive_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.MANAGE_SELL_OFFER:
+            assert self.manage_sell_offer_op is not None
+            write('{"manage_sell_offer": ')
+            self.manage_sell_offer_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            assert self.create_passive_sell_offer_op is not None
+            write('{"create_passive_sell_offer": ')
+            self.create_passive_sell_offer_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.SET_OPTIONS:
+            assert self.set_options_op is not None
+            write('{"set_options": ')
+            self.set_options_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CHANGE_TRUST:
+            assert self.change_trust_op is not None
+            write('{"change_trust": ')
+            self.change_trust_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.ALLOW_TRUST:
+            assert self.allow_trust_op is not None
+            write('{"allow_trust": ')
+            self.allow_trust_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.ACCOUNT_MERGE:
+            assert self.destination is not None
+            write('{"account_merge": ')
+            self.destination._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.INFLATION:
+            write('"inflation"')
+            return
+        if self.type == OperationType.MANAGE_DATA:
+            assert self.manage_data_op is not None
+            write('{"manage_data": ')
+            self.manage_data_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.BUMP_SEQUENCE:
+            assert self.bump_sequence_op is not None
+            write('{"bump_sequence": ')
+            self.bump_sequence_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.MANAGE_BUY_OFFER:
+            assert self.manage_buy_offer_op is not None
+            write('{"manage_buy_offer": ')
+            self.manage_buy_offer_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            assert self.path_payment_strict_send_op is not None
+            write('{"path_payment_strict_send": ')
+            self.path_payment_strict_send_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            assert self.create_claimable_balance_op is not None
+            write('{"create_claimable_balance": ')
+            self.create_claimable_balance_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            assert self.claim_claimable_balance_op is not None
+            write('{"claim_claimable_balance": ')
+            self.claim_claimable_balance_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            assert self.begin_sponsoring_future_reserves_op is not None
+            write('{"begin_sponsoring_future_reserves": ')
+            self.begin_sponsoring_future_reserves_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            write('"end_sponsoring_future_reserves"')
+            return
+        if self.type == OperationType.REVOKE_SPONSORSHIP:
+            assert self.revoke_sponsorship_op is not None
+            write('{"revoke_sponsorship": ')
+            self.revoke_sponsorship_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CLAWBACK:
+            assert self.clawback_op is not None
+            write('{"clawback": ')
+            self.clawback_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            assert self.clawback_claimable_balance_op is not None
+            write('{"clawback_claimable_balance": ')
+            self.clawback_claimable_balance_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.SET_TRUST_LINE_FLAGS:
+            assert self.set_trust_line_flags_op is not None
+            write('{"set_trust_line_flags": ')
+            self.set_trust_line_flags_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            assert self.liquidity_pool_deposit_op is not None
+            write('{"liquidity_pool_deposit": ')
+            self.liquidity_pool_deposit_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            assert self.liquidity_pool_withdraw_op is not None
+            write('{"liquidity_pool_withdraw": ')
+            self.liquidity_pool_withdraw_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.INVOKE_HOST_FUNCTION:
+            assert self.invoke_host_function_op is not None
+            write('{"invoke_host_function": ')
+            self.invoke_host_function_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.EXTEND_FOOTPRINT_TTL:
+            assert self.extend_footprint_ttl_op is not None
+            write('{"extend_footprint_ttl": ')
+            self.extend_footprint_ttl_op._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.RESTORE_FOOTPRINT:
+            assert self.restore_footprint_op is not None
+            write('{"restore_footprint": ')
+            self.restore_footprint_op._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in OperationBody: {self.type}")
+
+    def clone(self, deep: bool = True) -> OperationBody:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.create_account_op = (
+            self.create_account_op.clone()
+            if self.create_account_op is not None
+            else None
+        )
+        result.payment_op = (
+            self.payment_op.clone() if self.payment_op is not None else None
+        )
+        result.path_payment_strict_receive_op = (
+            self.path_payment_strict_receive_op.clone()
+            if self.path_payment_strict_receive_op is not None
+            else None
+        )
+        result.manage_sell_offer_op = (
+            self.manage_sell_offer_op.clone()
+            if self.manage_sell_offer_op is not None
+            else None
+        )
+        result.create_passive_sell_offer_op = (
+            self.create_passive_sell_offer_op.clone()
+            if self.create_passive_sell_offer_op is not None
+            else None
+        )
+        result.set_options_op = (
+            self.set_options_op.clone() if self.set_options_op is not None else None
+        )
+        result.change_trust_op = (
+            self.change_trust_op.clone() if self.change_trust_op is not None else None
+        )
+        result.allow_trust_op = (
+            self.allow_trust_op.clone() if self.allow_trust_op is not None else None
+        )
+        result.destination = (
+            self.destination.clone() if self.destination is not None else None
+        )
+        result.manage_data_op = (
+            self.manage_data_op.clone() if self.manage_data_op is not None else None
+        )
+        result.bump_sequence_op = (
+            self.bump_sequence_op.clone() if self.bump_sequence_op is not None else None
+        )
+        result.manage_buy_offer_op = (
+            self.manage_buy_offer_op.clone()
+            if self.manage_buy_offer_op is not None
+            else None
+        )
+        result.path_payment_strict_send_op = (
+            self.path_payment_strict_send_op.clone()
+            if self.path_payment_strict_send_op is not None
+            else None
+        )
+        result.create_claimable_balance_op = (
+            self.create_claimable_balance_op.clone()
+            if self.create_claimable_balance_op is not None
+            else None
+        )
+        result.claim_claimable_balance_op = (
+            self.claim_claimable_balance_op.clone()
+            if self.claim_claimable_balance_op is not None
+            else None
+        )
+        result.begin_sponsoring_future_reserves_op = (
+            self.begin_sponsoring_future_reserves_op.clone()
+            if self.begin_sponsoring_future_reserves_op is not None
+            else None
+        )
+        result.revoke_sponsorship_op = (
+            self.revoke_sponsorship_op.clone()
+            if self.revoke_sponsorship_op is not None
+            else None
+        )
+        result.clawback_op = (
+            self.clawback_op.clone() if self.clawback_op is not None else None
+        )
+        result.clawback_claimable_balance_op = (
+            self.clawback_claimable_balance_op.clone()
+            if self.clawback_claimable_balance_op is not None
+            else None
+        )
+        result.set_trust_line_flags_op = (
+            self.set_trust_line_flags_op.clone()
+            if self.set_trust_line_flags_op is not None
+            else None
+        )
+        result.liquidity_pool_deposit_op = (
+            self.liquidity_pool_deposit_op.clone()
+            if self.liquidity_pool_deposit_op is not None
+            else None
+        )
+        result.liquidity_pool_withdraw_op = (
+            self.liquidity_pool_withdraw_op.clone()
+            if self.liquidity_pool_withdraw_op is not None
+            else None
+        )
+        result.invoke_host_function_op = (
+            self.invoke_host_function_op.clone()
+            if self.invoke_host_function_op is not None
+            else None
+        )
+        result.extend_footprint_ttl_op = (
+            self.extend_footprint_ttl_op.clone()
+            if self.extend_footprint_ttl_op is not None
+            else None
+        )
+        result.restore_footprint_op = (
+            self.restore_footprint_op.clone()
+            if self.restore_footprint_op is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> OperationBody:
+        return self.clone()
+
+    def freeze(self) -> OperationBody:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -829,3 +1595,232 @@ class OperationBody:
         if self.restore_footprint_op is not None:
             out.append(f"restore_footprint_op={self.restore_footprint_op}")
         return f"<OperationBody [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> OperationBody:
+    return cls(type=type)
+
+
+def _unpack_create_account_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    create_account_op = CreateAccountOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, create_account_op=create_account_op)
+
+
+def _unpack_payment_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    payment_op = PaymentOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, payment_op=payment_op)
+
+
+def _unpack_path_payment_strict_receive_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    path_payment_strict_receive_op = PathPaymentStrictReceiveOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, path_payment_strict_receive_op=path_payment_strict_receive_op)
+
+
+def _unpack_manage_sell_offer_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    manage_sell_offer_op = ManageSellOfferOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, manage_sell_offer_op=manage_sell_offer_op)
+
+
+def _unpack_create_passive_sell_offer_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    create_passive_sell_offer_op = CreatePassiveSellOfferOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, create_passive_sell_offer_op=create_passive_sell_offer_op)
+
+
+def _unpack_set_options_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    set_options_op = SetOptionsOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, set_options_op=set_options_op)
+
+
+def _unpack_change_trust_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    change_trust_op = ChangeTrustOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, change_trust_op=change_trust_op)
+
+
+def _unpack_allow_trust_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    allow_trust_op = AllowTrustOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, allow_trust_op=allow_trust_op)
+
+
+def _unpack_destination(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    destination = MuxedAccount.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, destination=destination)
+
+
+def _unpack_manage_data_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    manage_data_op = ManageDataOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, manage_data_op=manage_data_op)
+
+
+def _unpack_bump_sequence_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    bump_sequence_op = BumpSequenceOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, bump_sequence_op=bump_sequence_op)
+
+
+def _unpack_manage_buy_offer_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    manage_buy_offer_op = ManageBuyOfferOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, manage_buy_offer_op=manage_buy_offer_op)
+
+
+def _unpack_path_payment_strict_send_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    path_payment_strict_send_op = PathPaymentStrictSendOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, path_payment_strict_send_op=path_payment_strict_send_op)
+
+
+def _unpack_create_claimable_balance_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    create_claimable_balance_op = CreateClaimableBalanceOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, create_claimable_balance_op=create_claimable_balance_op)
+
+
+def _unpack_claim_claimable_balance_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    claim_claimable_balance_op = ClaimClaimableBalanceOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, claim_claimable_balance_op=claim_claimable_balance_op)
+
+
+def _unpack_begin_sponsoring_future_reserves_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    begin_sponsoring_future_reserves_op = BeginSponsoringFutureReservesOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        begin_sponsoring_future_reserves_op=begin_sponsoring_future_reserves_op,
+    )
+
+
+def _unpack_revoke_sponsorship_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    revoke_sponsorship_op = RevokeSponsorshipOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, revoke_sponsorship_op=revoke_sponsorship_op)
+
+
+def _unpack_clawback_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    clawback_op = ClawbackOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, clawback_op=clawback_op)
+
+
+def _unpack_clawback_claimable_balance_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    clawback_claimable_balance_op = ClawbackClaimableBalanceOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, clawback_claimable_balance_op=clawback_claimable_balance_op)
+
+
+def _unpack_set_trust_line_flags_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    set_trust_line_flags_op = SetTrustLineFlagsOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, set_trust_line_flags_op=set_trust_line_flags_op)
+
+
+def _unpack_liquidity_pool_deposit_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    liquidity_pool_deposit_op = LiquidityPoolDepositOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, liquidity_pool_deposit_op=liquidity_pool_deposit_op)
+
+
+def _unpack_liquidity_pool_withdraw_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    liquidity_pool_withdraw_op = LiquidityPoolWithdrawOp.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, liquidity_pool_withdraw_op=liquidity_pool_withdraw_op)
+
+
+def _unpack_invoke_host_function_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    invoke_host_function_op = InvokeHostFunctionOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, invoke_host_function_op=invoke_host_function_op)
+
+
+def _unpack_extend_footprint_ttl_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    extend_footprint_ttl_op = ExtendFootprintTTLOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, extend_footprint_ttl_op=extend_footprint_ttl_op)
+
+
+def _unpack_restore_footprint_op(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationBody:
+    restore_footprint_op = RestoreFootprintOp.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, restore_footprint_op=restore_footprint_op)
+
+
+_UNPACK_ARMS = {
+    OperationType.CREATE_ACCOUNT: _unpack_create_account_op,
+    OperationType.PAYMENT: _unpack_payment_op,
+    OperationType.PATH_PAYMENT_STRICT_RECEIVE: _unpack_path_payment_strict_receive_op,
+    OperationType.MANAGE_SELL_OFFER: _unpack_manage_sell_offer_op,
+    OperationType.CREATE_PASSIVE_SELL_OFFER: _unpack_create_passive_sell_offer_op,
+    OperationType.SET_OPTIONS: _unpack_set_options_op,
+    OperationType.CHANGE_TRUST: _unpack_change_trust_op,
+    OperationType.ALLOW_TRUST: _unpack_allow_trust_op,
+    OperationType.ACCOUNT_MERGE: _unpack_destination,
+    OperationType.INFLATION: _unpack_void,
+    OperationType.MANAGE_DATA: _unpack_manage_data_op,
+    OperationType.BUMP_SEQUENCE: _unpack_bump_sequence_op,
+    OperationType.MANAGE_BUY_OFFER: _unpack_manage_buy_offer_op,
+    OperationType.PATH_PAYMENT_STRICT_SEND: _unpack_path_payment_strict_send_op,
+    OperationType.CREATE_CLAIMABLE_BALANCE: _unpack_create_claimable_balance_op,
+    OperationType.CLAIM_CLAIMABLE_BALANCE: _unpack_claim_claimable_balance_op,
+    OperationType.BEGIN_SPONSORING_FUTURE_RESERVES: _unpack_begin_sponsoring_future_reserves_op,
+    OperationType.END_SPONSORING_FUTURE_RESERVES: _unpack_void,
+    OperationType.REVOKE_SPONSORSHIP: _unpack_revoke_sponsorship_op,
+    OperationType.CLAWBACK: _unpack_clawback_op,
+    OperationType.CLAWBACK_CLAIMABLE_BALANCE: _unpack_clawback_claimable_balance_op,
+    OperationType.SET_TRUST_LINE_FLAGS: _unpack_set_trust_line_flags_op,
+    OperationType.LIQUIDITY_POOL_DEPOSIT: _unpack_liquidity_pool_deposit_op,
+    OperationType.LIQUIDITY_POOL_WITHDRAW: _unpack_liquidity_pool_withdraw_op,
+    OperationType.INVOKE_HOST_FUNCTION: _unpack_invoke_host_function_op,
+    OperationType.EXTEND_FOOTPRINT_TTL: _unpack_extend_footprint_ttl_op,
+    OperationType.RESTORE_FOOTPRINT: _unpack_restore_footprint_op,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_entry_changes import LedgerEntryChanges
 
 __all__ = ["OperationMeta"]
@@ -23,6 +36,8 @@ class OperationMeta:
         };
     """
 
+    __slots__ = ("changes",)
+
     def __init__(
         self,
         changes: LedgerEntryChanges,
@@ -32,6 +47,9 @@ class OperationMeta:
     def pack(self, packer: Packer) -> None:
         self.changes.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.changes.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -43,16 +61,59 @@ class OperationMeta:
             changes=changes,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | OperationMeta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "changes" in fields:
+            _result["changes"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["changes"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "changes", view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> OperationMeta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> OperationMeta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +128,11 @@ class OperationMeta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> OperationMeta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +146,24 @@ class OperationMeta:
             changes=changes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"changes": ')
+        self.changes._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> OperationMeta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.changes = self.changes.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> OperationMeta:
+        return self.clone()
+
+    def freeze(self) -> OperationMeta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.changes,))
 
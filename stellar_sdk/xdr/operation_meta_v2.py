@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .contract_event import ContractEvent
 from .extension_point import ExtensionPoint
 from .ledger_entry_changes import LedgerEntryChanges
@@ -29,6 +44,8 @@ class OperationMetaV2:
         };
     """
 
+    __slots__ = ("changes", "events", "ext")
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -51,6 +68,14 @@ class OperationMetaV2:
         for events_item in self.events:
             events_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.ext.xdr_size()
+            + self.changes.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.events)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -74,16 +99,110 @@ class OperationMetaV2:
             events=events,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ContractEvent.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | OperationMetaV2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "changes" in fields:
+            _result["changes"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["changes"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if "events" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["events"] = []
+            for _ in range(length):
+                _result["events"].append(
+                    ContractEvent.unpack_fields(
+                        unpacker, fields["events"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ContractEvent.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", ExtensionPoint.unpack(unpacker, depth_limit - 1)
+        changes = view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+        yield "changes", changes
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        events = []
+        for _ in range(length):
+            events.append(unpack_view(ContractEvent, unpacker, depth_limit - 1))
+        yield "events", events
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> OperationMetaV2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> OperationMetaV2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -98,11 +217,11 @@ class OperationMetaV2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> OperationMetaV2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -122,6 +241,30 @@ class OperationMetaV2:
             events=events,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "changes": ')
+        self.changes._write_json(write)
+        write(', "events": ')
+        write_json_array(write, self.events)
+        write("}")
+
+    def clone(self, deep: bool = True) -> OperationMetaV2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.changes = self.changes.clone()
+        result.events = [item.clone() for item in self.events]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> OperationMetaV2:
+        return self.clone()
+
+    def freeze(self) -> OperationMetaV2:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
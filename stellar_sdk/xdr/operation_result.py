@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .operation_result_code import OperationResultCode
 from .operation_result_tr import OperationResultTr
 
@@ -89,6 +102,8 @@ class OperationResult:
         };
     """
 
+    __slots__ = ("code", "tr")
+
     def __init__(
         self,
         code: OperationResultCode,
@@ -118,28 +133,127 @@ class OperationResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == OperationResultCode.opINNER:
+            assert self.tr is not None
+            return 4 + self.tr.xdr_size()
+        if self.code == OperationResultCode.opBAD_AUTH:
+            return 4
+        if self.code == OperationResultCode.opNO_ACCOUNT:
+            return 4
+        if self.code == OperationResultCode.opNOT_SUPPORTED:
+            return 4
+        if self.code == OperationResultCode.opTOO_MANY_SUBENTRIES:
+            return 4
+        if self.code == OperationResultCode.opEXCEEDED_WORK_LIMIT:
+            return 4
+        if self.code == OperationResultCode.opTOO_MANY_SPONSORING:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> OperationResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = OperationResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = OperationResultCode.unpack(unpacker)
         if code == OperationResultCode.opINNER:
-            tr = OperationResultTr.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, tr=tr)
+            OperationResultTr.skip(unpacker, depth_limit - 1)
+            return
         if code == OperationResultCode.opBAD_AUTH:
-            return cls(code=code)
+            return
         if code == OperationResultCode.opNO_ACCOUNT:
-            return cls(code=code)
+            return
         if code == OperationResultCode.opNOT_SUPPORTED:
-            return cls(code=code)
+            return
         if code == OperationResultCode.opTOO_MANY_SUBENTRIES:
-            return cls(code=code)
+            return
         if code == OperationResultCode.opEXCEEDED_WORK_LIMIT:
-            return cls(code=code)
+            return
         if code == OperationResultCode.opTOO_MANY_SPONSORING:
-            return cls(code=code)
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | OperationResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = OperationResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == OperationResultCode.opINNER:
+            if "tr" in fields:
+                _result["tr"] = OperationResultTr.unpack_fields(
+                    unpacker, fields["tr"], depth_limit - 1
+                )
+            else:
+                OperationResultTr.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == OperationResultCode.opBAD_AUTH:
+            return _result
+        if code == OperationResultCode.opNO_ACCOUNT:
+            return _result
+        if code == OperationResultCode.opNOT_SUPPORTED:
+            return _result
+        if code == OperationResultCode.opTOO_MANY_SUBENTRIES:
+            return _result
+        if code == OperationResultCode.opEXCEEDED_WORK_LIMIT:
+            return _result
+        if code == OperationResultCode.opTOO_MANY_SPONSORING:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = OperationResultCode.unpack(unpacker)
+        yield "code", code
+        if code == OperationResultCode.opINNER:
+            yield "tr", view_at(OperationResultTr, unpacker, depth_limit - 1)
+            return
+        if code == OperationResultCode.opBAD_AUTH:
+            return
+        if code == OperationResultCode.opNO_ACCOUNT:
+            return
+        if code == OperationResultCode.opNOT_SUPPORTED:
+            return
+        if code == OperationResultCode.opTOO_MANY_SUBENTRIES:
+            return
+        if code == OperationResultCode.opEXCEEDED_WORK_LIMIT:
+            return
+        if code == OperationResultCode.opTOO_MANY_SPONSORING:
+            return
         raise ValueError("Invalid code.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -148,10 +262,10 @@ class OperationResult:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> OperationResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> OperationResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -166,11 +280,11 @@ class OperationResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> OperationResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == OperationResultCode.opINNER:
@@ -217,6 +331,47 @@ class OperationResult:
             return cls(code=code, tr=tr)
         raise ValueError(f"Unknown key '{key}' for OperationResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == OperationResultCode.opINNER:
+            assert self.tr is not None
+            write('{"opinner": ')
+            self.tr._write_json(write)
+            write("}")
+            return
+        if self.code == OperationResultCode.opBAD_AUTH:
+            write('"opbad_auth"')
+            return
+        if self.code == OperationResultCode.opNO_ACCOUNT:
+            write('"opno_account"')
+            return
+        if self.code == OperationResultCode.opNOT_SUPPORTED:
+            write('"opnot_supported"')
+            return
+        if self.code == OperationResultCode.opTOO_MANY_SUBENTRIES:
+            write('"optoo_many_subentries"')
+            return
+        if self.code == OperationResultCode.opEXCEEDED_WORK_LIMIT:
+            write('"opexceeded_work_limit"')
+            return
+        if self.code == OperationResultCode.opTOO_MANY_SPONSORING:
+            write('"optoo_many_sponsoring"')
+            return
+        raise ValueError(f"Unknown code in OperationResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> OperationResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.tr = self.tr.clone() if self.tr is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> OperationResult:
+        return self.clone()
+
+    def freeze(self) -> OperationResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -236,3 +391,23 @@ class OperationResult:
         if self.tr is not None:
             out.append(f"tr={self.tr}")
         return f"<OperationResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> OperationResult:
+    return cls(code=code)
+
+
+def _unpack_tr(cls, code, unpacker: Unpacker, depth_limit: int) -> OperationResult:
+    tr = OperationResultTr.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, tr=tr)
+
+
+_UNPACK_ARMS = {
+    OperationResultCode.opINNER: _unpack_tr,
+    OperationResultCode.opBAD_AUTH: _unpack_void,
+    OperationResultCode.opNO_ACCOUNT: _unpack_void,
+    OperationResultCode.opNOT_SUPPORTED: _unpack_void,
+    OperationResultCode.opTOO_MANY_SUBENTRIES: _unpack_void,
+    OperationResultCode.opEXCEEDED_WORK_LIMIT: _unpack_void,
+    OperationResultCode.opTOO_MANY_SPONSORING: _unpack_void,
+}
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_merge_result import AccountMergeResult
 from .allow_trust_result import AllowTrustResult
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .begin_sponsoring_future_reserves_result import BeginSponsoringFutureReservesResult
 from .bump_sequence_result import BumpSequenceResult
 from .change_trust_result import ChangeTrustResult
@@ -102,6 +115,37 @@ class OperationResultTr:
             }
     """
 
+    __slots__ = (
+        "account_merge_result",
+        "allow_trust_result",
+        "begin_sponsoring_future_reserves_result",
+        "bump_seq_result",
+        "change_trust_result",
+        "claim_claimable_balance_result",
+        "clawback_claimable_balance_result",
+        "clawback_result",
+        "create_account_result",
+        "create_claimable_balance_result",
+        "create_passive_sell_offer_result",
+        "end_sponsoring_future_reserves_result",
+        "extend_footprint_ttl_result",
+        "inflation_result",
+        "invoke_host_function_result",
+        "liquidity_pool_deposit_result",
+        "liquidity_pool_withdraw_result",
+        "manage_buy_offer_result",
+        "manage_data_result",
+        "manage_sell_offer_result",
+        "path_payment_strict_receive_result",
+        "path_payment_strict_send_result",
+        "payment_result",
+        "restore_footprint_result",
+        "revoke_sponsorship_result",
+        "set_options_result",
+        "set_trust_line_flags_result",
+        "type",
+    )
+
     def __init__(
         self,
         type: OperationType,
@@ -316,163 +360,648 @@ class OperationResultTr:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == OperationType.CREATE_ACCOUNT:
+            assert self.create_account_result is not None
+            return 4 + self.create_account_result.xdr_size()
+        if self.type == OperationType.PAYMENT:
+            assert self.payment_result is not None
+            return 4 + self.payment_result.xdr_size()
+        if self.type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            assert self.path_payment_strict_receive_result is not None
+            return 4 + self.path_payment_strict_receive_result.xdr_size()
+        if self.type == OperationType.MANAGE_SELL_OFFER:
+            assert self.manage_sell_offer_result is not None
+            return 4 + self.manage_sell_offer_result.xdr_size()
+        if self.type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            assert self.create_passive_sell_offer_result is not None
+            return 4 + self.create_passive_sell_offer_result.xdr_size()
+        if self.type == OperationType.SET_OPTIONS:
+            assert self.set_options_result is not None
+            return 4 + self.set_options_result.xdr_size()
+        if self.type == OperationType.CHANGE_TRUST:
+            assert self.change_trust_result is not None
+            return 4 + self.change_trust_result.xdr_size()
+        if self.type == OperationType.ALLOW_TRUST:
+            assert self.allow_trust_result is not None
+            return 4 + self.allow_trust_result.xdr_size()
+        if self.type == OperationType.ACCOUNT_MERGE:
+            assert self.account_merge_result is not None
+            return 4 + self.account_merge_result.xdr_size()
+        if self.type == OperationType.INFLATION:
+            assert self.inflation_result is not None
+            return 4 + self.inflation_result.xdr_size()
+        if self.type == OperationType.MANAGE_DATA:
+            assert self.manage_data_result is not None
+            return 4 + self.manage_data_result.xdr_size()
+        if self.type == OperationType.BUMP_SEQUENCE:
+            assert self.bump_seq_result is not None
+            return 4 + self.bump_seq_result.xdr_size()
+        if self.type == OperationType.MANAGE_BUY_OFFER:
+            assert self.manage_buy_offer_result is not None
+            return 4 + self.manage_buy_offer_result.xdr_size()
+        if self.type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            assert self.path_payment_strict_send_result is not None
+            return 4 + self.path_payment_strict_send_result.xdr_size()
+        if self.type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            assert self.create_claimable_balance_result is not None
+            return 4 + self.create_claimable_balance_result.xdr_size()
+        if self.type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            assert self.claim_claimable_balance_result is not None
+            return 4 + self.claim_claimable_balance_result.xdr_size()
+        if self.type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            assert self.begin_sponsoring_future_reserves_result is not None
+            return 4 + self.begin_sponsoring_future_reserves_result.xdr_size()
+        if self.type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            assert self.end_sponsoring_future_reserves_result is not None
+            return 4 + self.end_sponsoring_future_reserves_result.xdr_size()
+        if self.type == OperationType.REVOKE_SPONSORSHIP:
+            assert self.revoke_sponsorship_result is not None
+            return 4 + self.revoke_sponsorship_result.xdr_size()
+        if self.type == OperationType.CLAWBACK:
+            assert self.clawback_result is not None
+            return 4 + self.clawback_result.xdr_size()
+        if self.type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            assert self.clawback_claimable_balance_result is not None
+            return 4 + self.clawback_claimable_balance_result.xdr_size()
+        if self.type == OperationType.SET_TRUST_LINE_FLAGS:
+            assert self.set_trust_line_flags_result is not None
+            return 4 + self.set_trust_line_flags_result.xdr_size()
+        if self.type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            assert self.liquidity_pool_deposit_result is not None
+            return 4 + self.liquidity_pool_deposit_result.xdr_size()
+        if self.type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            assert self.liquidity_pool_withdraw_result is not None
+            return 4 + self.liquidity_pool_withdraw_result.xdr_size()
+        if self.type == OperationType.INVOKE_HOST_FUNCTION:
+            assert self.invoke_host_function_result is not None
+            return 4 + self.invoke_host_function_result.xdr_size()
+        if self.type == OperationType.EXTEND_FOOTPRINT_TTL:
+            assert self.extend_footprint_ttl_result is not None
+            return 4 + self.extend_footprint_ttl_result.xdr_size()
+        if self.type == OperationType.RESTORE_FOOTPRINT:
+            assert self.restore_footprint_result is not None
+            return 4 + self.restore_footprint_result.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> OperationResultTr:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = OperationType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = OperationType.unpack(unpacker)
         if type == OperationType.CREATE_ACCOUNT:
-            create_account_result = CreateAccountResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(type=type, create_account_result=create_account_result)
+            CreateAccountResult.skip(unpacker, depth_limit - 1)
+            return
         if type == OperationType.PAYMENT:
-            payment_result = PaymentResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, payment_result=payment_result)
+            PaymentResult.skip(unpacker, depth_limit - 1)
+            return
         if type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
-            path_payment_strict_receive_result = PathPaymentStrictReceiveResult.unpack(
-                unpacker, depth_limit - 1
+            PathPaymentStrictReceiveResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.MANAGE_SELL_OFFER:
+            ManageSellOfferResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            ManageSellOfferResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.SET_OPTIONS:
+            SetOptionsResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CHANGE_TRUST:
+            ChangeTrustResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.ALLOW_TRUST:
+            AllowTrustResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.ACCOUNT_MERGE:
+            AccountMergeResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.INFLATION:
+            InflationResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.MANAGE_DATA:
+            ManageDataResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.BUMP_SEQUENCE:
+            BumpSequenceResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.MANAGE_BUY_OFFER:
+            ManageBuyOfferResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            PathPaymentStrictSendResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            CreateClaimableBalanceResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            ClaimClaimableBalanceResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            BeginSponsoringFutureReservesResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            EndSponsoringFutureReservesResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.REVOKE_SPONSORSHIP:
+            RevokeSponsorshipResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CLAWBACK:
+            ClawbackResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            ClawbackClaimableBalanceResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.SET_TRUST_LINE_FLAGS:
+            SetTrustLineFlagsResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            LiquidityPoolDepositResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            LiquidityPoolWithdrawResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.INVOKE_HOST_FUNCTION:
+            InvokeHostFunctionResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.EXTEND_FOOTPRINT_TTL:
+            ExtendFootprintTTLResult.skip(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.RESTORE_FOOTPRINT:
+            RestoreFootprintResult.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | OperationResultTr:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = OperationType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == OperationType.CREATE_ACCOUNT:
+            if "create_account_result" in fields:
+                _result["create_account_result"] = CreateAccountResult.unpack_fields(
+                    unpacker, fields["create_account_result"], depth_limit - 1
+                )
+            else:
+                CreateAccountResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.PAYMENT:
+            if "payment_result" in fields:
+                _result["payment_result"] = PaymentResult.unpack_fields(
+                    unpacker, fields["payment_result"], depth_limit - 1
+                )
+            else:
+                PaymentResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            if "path_payment_strict_receive_result" in fields:
+                _result["path_payment_strict_receive_result"] = (
+                    PathPaymentStrictReceiveResult.unpack_fields(
+                        unpacker,
+                        fields["path_payment_strict_receive_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                PathPaymentStrictReceiveResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.MANAGE_SELL_OFFER:
+            if "manage_sell_offer_result" in fields:
+                _result["manage_sell_offer_result"] = (
+                    ManageSellOfferResult.unpack_fields(
+                        unpacker, fields["manage_sell_offer_result"], depth_limit - 1
+                    )
+                )
+            else:
+                ManageSellOfferResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            if "create_passive_sell_offer_result" in fields:
+                _result["create_passive_sell_offer_result"] = (
+                    ManageSellOfferResult.unpack_fields(
+                        unpacker,
+                        fields["create_passive_sell_offer_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                ManageSellOfferResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.SET_OPTIONS:
+            if "set_options_result" in fields:
+                _result["set_options_result"] = SetOptionsResult.unpack_fields(
+                    unpacker, fields["set_options_result"], depth_limit - 1
+                )
+            else:
+                SetOptionsResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CHANGE_TRUST:
+            if "change_trust_result" in fields:
+                _result["change_trust_result"] = ChangeTrustResult.unpack_fields(
+                    unpacker, fields["change_trust_result"], depth_limit - 1
+                )
+            else:
+                ChangeTrustResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.ALLOW_TRUST:
+            if "allow_trust_result" in fields:
+                _result["allow_trust_result"] = AllowTrustResult.unpack_fields(
+                    unpacker, fields["allow_trust_result"], depth_limit - 1
+                )
+            else:
+                AllowTrustResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.ACCOUNT_MERGE:
+            if "account_merge_result" in fields:
+                _result["account_merge_result"] = AccountMergeResult.unpack_fields(
+                    unpacker, fields["account_merge_result"], depth_limit - 1
+                )
+            else:
+                AccountMergeResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.INFLATION:
+            if "inflation_result" in fields:
+                _result["inflation_result"] = InflationResult.unpack_fields(
+                    unpacker, fields["inflation_result"], depth_limit - 1
+                )
+            else:
+                InflationResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.MANAGE_DATA:
+            if "manage_data_result" in fields:
+                _result["manage_data_result"] = ManageDataResult.unpack_fields(
+                    unpacker, fields["manage_data_result"], depth_limit - 1
+                )
+            else:
+                ManageDataResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.BUMP_SEQUENCE:
+            if "bump_seq_result" in fields:
+                _result["bump_seq_result"] = BumpSequenceResult.unpack_fields(
+                    unpacker, fields["bump_seq_result"], depth_limit - 1
+                )
+            else:
+                BumpSequenceResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.MANAGE_BUY_OFFER:
+            if "manage_buy_offer_result" in fields:
+                _result["manage_buy_offer_result"] = ManageBuyOfferResult.unpack_fields(
+                    unpacker, fields["manage_buy_offer_result"], depth_limit - 1
+                )
+            else:
+                ManageBuyOfferResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            if "path_payment_strict_send_result" in fields:
+                _result["path_payment_strict_send_result"] = (
+                    PathPaymentStrictSendResult.unpack_fields(
+                        unpacker,
+                        fields["path_payment_strict_send_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                PathPaymentStrictSendResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            if "create_claimable_balance_result" in fields:
+                _result["create_claimable_balance_result"] = (
+                    CreateClaimableBalanceResult.unpack_fields(
+                        unpacker,
+                        fields["create_claimable_balance_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                CreateClaimableBalanceResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            if "claim_claimable_balance_result" in fields:
+                _result["claim_claimable_balance_result"] = (
+                    ClaimClaimableBalanceResult.unpack_fields(
+                        unpacker,
+                        fields["claim_claimable_balance_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                ClaimClaimableBalanceResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            if "begin_sponsoring_future_reserves_result" in fields:
+                _result["begin_sponsoring_future_reserves_result"] = (
+                    BeginSponsoringFutureReservesResult.unpack_fields(
+                        unpacker,
+                        fields["begin_sponsoring_future_reserves_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                BeginSponsoringFutureReservesResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            if "end_sponsoring_future_reserves_result" in fields:
+                _result["end_sponsoring_future_reserves_result"] = (
+                    EndSponsoringFutureReservesResult.unpack_fields(
+                        unpacker,
+                        fields["end_sponsoring_future_reserves_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                EndSponsoringFutureReservesResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.REVOKE_SPONSORSHIP:
+            if "revoke_sponsorship_result" in fields:
+                _result["revoke_sponsorship_result"] = (
+                    RevokeSponsorshipResult.unpack_fields(
+                        unpacker, fields["revoke_sponsorship_result"], depth_limit - 1
+                    )
+                )
+            else:
+                RevokeSponsorshipResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CLAWBACK:
+            if "clawback_result" in fields:
+                _result["clawback_result"] = ClawbackResult.unpack_fields(
+                    unpacker, fields["clawback_result"], depth_limit - 1
+                )
+            else:
+                ClawbackResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            if "clawback_claimable_balance_result" in fields:
+                _result["clawback_claimable_balance_result"] = (
+                    ClawbackClaimableBalanceResult.unpack_fields(
+                        unpacker,
+                        fields["clawback_claimable_balance_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                ClawbackClaimableBalanceResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.SET_TRUST_LINE_FLAGS:
+            if "set_trust_line_flags_result" in fields:
+                _result["set_trust_line_flags_result"] = (
+                    SetTrustLineFlagsResult.unpack_fields(
+                        unpacker, fields["set_trust_line_flags_result"], depth_limit - 1
+                    )
+                )
+            else:
+                SetTrustLineFlagsResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            if "liquidity_pool_deposit_result" in fields:
+                _result["liquidity_pool_deposit_result"] = (
+                    LiquidityPoolDepositResult.unpack_fields(
+                        unpacker,
+                        fields["liquidity_pool_deposit_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                LiquidityPoolDepositResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            if "liquidity_pool_withdraw_result" in fields:
+                _result["liquidity_pool_withdraw_result"] = (
+                    LiquidityPoolWithdrawResult.unpack_fields(
+                        unpacker,
+                        fields["liquidity_pool_withdraw_result"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                LiquidityPoolWithdrawResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.INVOKE_HOST_FUNCTION:
+            if "invoke_host_function_result" in fields:
+                _result["invoke_host_function_result"] = (
+                    InvokeHostFunctionResult.unpack_fields(
+                        unpacker, fields["invoke_host_function_result"], depth_limit - 1
+                    )
+                )
+            else:
+                InvokeHostFunctionResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.EXTEND_FOOTPRINT_TTL:
+            if "extend_footprint_ttl_result" in fields:
+                _result["extend_footprint_ttl_result"] = (
+                    ExtendFootprintTTLResult.unpack_fields(
+                        unpacker, fields["extend_footprint_ttl_result"], depth_limit - 1
+                    )
+                )
+            else:
+                ExtendFootprintTTLResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == OperationType.RESTORE_FOOTPRINT:
+            if "restore_footprint_result" in fields:
+                _result["restore_footprint_result"] = (
+                    RestoreFootprintResult.unpack_fields(
+                        unpacker, fields["restore_footprint_result"], depth_limit - 1
+                    )
+                )
+            else:
+                RestoreFootprintResult.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = OperationType.unpack(unpacker)
+        yield "type", type
+        if type == OperationType.CREATE_ACCOUNT:
+            yield (
+                "create_account_result",
+                CreateAccountResult.unpack(unpacker, depth_limit - 1),
             )
-            return cls(
-                type=type,
-                path_payment_strict_receive_result=path_payment_strict_receive_result,
+            return
+        if type == OperationType.PAYMENT:
+            yield "payment_result", PaymentResult.unpack(unpacker, depth_limit - 1)
+            return
+        if type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            yield (
+                "path_payment_strict_receive_result",
+                view_at(PathPaymentStrictReceiveResult, unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.MANAGE_SELL_OFFER:
-            manage_sell_offer_result = ManageSellOfferResult.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "manage_sell_offer_result",
+                view_at(ManageSellOfferResult, unpacker, depth_limit - 1),
             )
-            return cls(type=type, manage_sell_offer_result=manage_sell_offer_result)
+            return
         if type == OperationType.CREATE_PASSIVE_SELL_OFFER:
-            create_passive_sell_offer_result = ManageSellOfferResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type,
-                create_passive_sell_offer_result=create_passive_sell_offer_result,
+            yield (
+                "create_passive_sell_offer_result",
+                view_at(ManageSellOfferResult, unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.SET_OPTIONS:
-            set_options_result = SetOptionsResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, set_options_result=set_options_result)
+            yield (
+                "set_options_result",
+                SetOptionsResult.unpack(unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.CHANGE_TRUST:
-            change_trust_result = ChangeTrustResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, change_trust_result=change_trust_result)
+            yield (
+                "change_trust_result",
+                ChangeTrustResult.unpack(unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.ALLOW_TRUST:
-            allow_trust_result = AllowTrustResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, allow_trust_result=allow_trust_result)
+            yield (
+                "allow_trust_result",
+                AllowTrustResult.unpack(unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.ACCOUNT_MERGE:
-            account_merge_result = AccountMergeResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, account_merge_result=account_merge_result)
+            yield (
+                "account_merge_result",
+                AccountMergeResult.unpack(unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.INFLATION:
-            inflation_result = InflationResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, inflation_result=inflation_result)
+            yield (
+                "inflation_result",
+                view_at(InflationResult, unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.MANAGE_DATA:
-            manage_data_result = ManageDataResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, manage_data_result=manage_data_result)
+            yield (
+                "manage_data_result",
+                ManageDataResult.unpack(unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.BUMP_SEQUENCE:
-            bump_seq_result = BumpSequenceResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, bump_seq_result=bump_seq_result)
+            yield (
+                "bump_seq_result",
+                BumpSequenceResult.unpack(unpacker, depth_limit - 1),
+            )
+            return
         if type == OperationType.MANAGE_BUY_OFFER:
-            manage_buy_offer_result = ManageBuyOfferResult.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "manage_buy_offer_result",
+                view_at(ManageBuyOfferResult, unpacker, depth_limit - 1),
             )
-            return cls(type=type, manage_buy_offer_result=manage_buy_offer_result)
+            return
         if type == OperationType.PATH_PAYMENT_STRICT_SEND:
-            path_payment_strict_send_result = PathPaymentStrictSendResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type,
-                path_payment_strict_send_result=path_payment_strict_send_result,
+            yield (
+                "path_payment_strict_send_result",
+                view_at(PathPaymentStrictSendResult, unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.CREATE_CLAIMABLE_BALANCE:
-            create_claimable_balance_result = CreateClaimableBalanceResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type,
-                create_claimable_balance_result=create_claimable_balance_result,
+            yield (
+                "create_claimable_balance_result",
+                CreateClaimableBalanceResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.CLAIM_CLAIMABLE_BALANCE:
-            claim_claimable_balance_result = ClaimClaimableBalanceResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, claim_claimable_balance_result=claim_claimable_balance_result
+            yield (
+                "claim_claimable_balance_result",
+                ClaimClaimableBalanceResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
-            begin_sponsoring_future_reserves_result = (
-                BeginSponsoringFutureReservesResult.unpack(unpacker, depth_limit - 1)
-            )
-            return cls(
-                type=type,
-                begin_sponsoring_future_reserves_result=begin_sponsoring_future_reserves_result,
+            yield (
+                "begin_sponsoring_future_reserves_result",
+                BeginSponsoringFutureReservesResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.END_SPONSORING_FUTURE_RESERVES:
-            end_sponsoring_future_reserves_result = (
-                EndSponsoringFutureReservesResult.unpack(unpacker, depth_limit - 1)
-            )
-            return cls(
-                type=type,
-                end_sponsoring_future_reserves_result=end_sponsoring_future_reserves_result,
+            yield (
+                "end_sponsoring_future_reserves_result",
+                EndSponsoringFutureReservesResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.REVOKE_SPONSORSHIP:
-            revoke_sponsorship_result = RevokeSponsorshipResult.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "revoke_sponsorship_result",
+                RevokeSponsorshipResult.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, revoke_sponsorship_result=revoke_sponsorship_result)
+            return
         if type == OperationType.CLAWBACK:
-            clawback_result = ClawbackResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, clawback_result=clawback_result)
+            yield "clawback_result", ClawbackResult.unpack(unpacker, depth_limit - 1)
+            return
         if type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
-            clawback_claimable_balance_result = ClawbackClaimableBalanceResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type,
-                clawback_claimable_balance_result=clawback_claimable_balance_result,
+            yield (
+                "clawback_claimable_balance_result",
+                ClawbackClaimableBalanceResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.SET_TRUST_LINE_FLAGS:
-            set_trust_line_flags_result = SetTrustLineFlagsResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, set_trust_line_flags_result=set_trust_line_flags_result
+            yield (
+                "set_trust_line_flags_result",
+                SetTrustLineFlagsResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.LIQUIDITY_POOL_DEPOSIT:
-            liquidity_pool_deposit_result = LiquidityPoolDepositResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, liquidity_pool_deposit_result=liquidity_pool_deposit_result
+            yield (
+                "liquidity_pool_deposit_result",
+                LiquidityPoolDepositResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.LIQUIDITY_POOL_WITHDRAW:
-            liquidity_pool_withdraw_result = LiquidityPoolWithdrawResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, liquidity_pool_withdraw_result=liquidity_pool_withdraw_result
+            yield (
+                "liquidity_pool_withdraw_result",
+                LiquidityPoolWithdrawResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.INVOKE_HOST_FUNCTION:
-            invoke_host_function_result = InvokeHostFunctionResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, invoke_host_function_result=invoke_host_function_result
+            yield (
+                "invoke_host_function_result",
+                InvokeHostFunctionResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.EXTEND_FOOTPRINT_TTL:
-            extend_footprint_ttl_result = ExtendFootprintTTLResult.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(
-                type=type, extend_footprint_ttl_result=extend_footprint_ttl_result
+            yield (
+                "extend_footprint_ttl_result",
+                ExtendFootprintTTLResult.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == OperationType.RESTORE_FOOTPRINT:
-            restore_footprint_result = RestoreFootprintResult.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "restore_footprint_result",
+                RestoreFootprintResult.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, restore_footprint_result=restore_footprint_result)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -481,10 +1010,12 @@ class OperationResultTr:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> OperationResultTr:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> OperationResultTr:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -499,11 +1030,11 @@ class OperationResultTr:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> OperationResultTr:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == OperationType.CREATE_ACCOUNT:
@@ -799,6 +1330,311 @@ class OperationResultTr:
             return cls(type=type, restore_footprint_result=restore_footprint_result)
         raise ValueError(f"Unknown key '{key}' for OperationResultTr")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == OperationType.CREATE_ACCOUNT:
+            assert self.create_account_result is not None
+            write('{"create_account": ')
+            self.create_account_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.PAYMENT:
+            assert self.payment_result is not None
+            write('{"payment": ')
+            self.payment_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.PATH_PAYMENT_STRICT_RECEIVE:
+            assert self.path_payment_strict_receive_result is not None
+            write('{"path_payment_strict_receive": ')
+            self.path_payment_strict_receive_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.MANAGE_SELL_OFFER:
+            assert self.manage_sell_offer_result is not None
+            write('{"manage_sell_offer": ')
+            self.manage_sell_offer_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CREATE_PASSIVE_SELL_OFFER:
+            assert self.create_passive_sell_offer_result is not None
+            write('{"create_passive_sell_offer": ')
+            self.create_passive_sell_offer_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.SET_OPTIONS:
+            assert self.set_options_result is not None
+            write('{"set_options": ')
+            self.set_options_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CHANGE_TRUST:
+            assert self.change_trust_result is not None
+            write('{"change_trust": ')
+            self.change_trust_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.ALLOW_TRUST:
+            assert self.allow_trust_result is not None
+            write('{"allow_trust": ')
+            self.allow_trust_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.ACCOUNT_MERGE:
+            assert self.account_merge_result is not None
+            write('{"account_merge": ')
+            self.account_merge_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.INFLATION:
+            assert self.inflation_result is not None
+            write('{"inflation": ')
+            self.inflation_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.MANAGE_DATA:
+            assert self.manage_data_result is not None
+            write('{"manage_data": ')
+            self.manage_data_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.BUMP_SEQUENCE:
+            assert self.bump_seq_result is not None
+            write('{"bump_sequence": ')
+            self.bump_seq_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.MANAGE_BUY_OFFER:
+            assert self.manage_buy_offer_result is not None
+            write('{"manage_buy_offer": ')
+            self.manage_buy_offer_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.PATH_PAYMENT_STRICT_SEND:
+            assert self.path_payment_strict_send_result is not None
+            write('{"path_payment_strict_send": ')
+            self.path_payment_strict_send_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CREATE_CLAIMABLE_BALANCE:
+            assert self.create_claimable_balance_result is not None
+            write('{"create_claimable_balance": ')
+            self.create_claimable_balance_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CLAIM_CLAIMABLE_BALANCE:
+            assert self.claim_claimable_balance_result is not None
+            write('{"claim_claimable_balance": ')
+            self.claim_claimable_balance_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.BEGIN_SPONSORING_FUTURE_RESERVES:
+            assert self.begin_sponsoring_future_reserves_result is not None
+            write('{"begin_sponsoring_future_reserves": ')
+            self.begin_sponsoring_future_reserves_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.END_SPONSORING_FUTURE_RESERVES:
+            assert self.end_sponsoring_future_reserves_result is not None
+            write('{"end_sponsoring_future_reserves": ')
+            self.end_sponsoring_future_reserves_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.REVOKE_SPONSORSHIP:
+            assert self.revoke_sponsorship_result is not None
+            write('{"revoke_sponsorship": ')
+            self.revoke_sponsorship_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CLAWBACK:
+            assert self.clawback_result is not None
+            write('{"clawback": ')
+            self.clawback_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.CLAWBACK_CLAIMABLE_BALANCE:
+            assert self.clawback_claimable_balance_result is not None
+            write('{"clawback_claimable_balance": ')
+            self.clawback_claimable_balance_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.SET_TRUST_LINE_FLAGS:
+            assert self.set_trust_line_flags_result is not None
+            write('{"set_trust_line_flags": ')
+            self.set_trust_line_flags_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.LIQUIDITY_POOL_DEPOSIT:
+            assert self.liquidity_pool_deposit_result is not None
+            write('{"liquidity_pool_deposit": ')
+            self.liquidity_pool_deposit_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.LIQUIDITY_POOL_WITHDRAW:
+            assert self.liquidity_pool_withdraw_result is not None
+            write('{"liquidity_pool_withdraw": ')
+            self.liquidity_pool_withdraw_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.INVOKE_HOST_FUNCTION:
+            assert self.invoke_host_function_result is not None
+            write('{"invoke_host_function": ')
+            self.invoke_host_function_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.EXTEND_FOOTPRINT_TTL:
+            assert self.extend_footprint_ttl_result is not None
+            write('{"extend_footprint_ttl": ')
+            self.extend_footprint_ttl_result._write_json(write)
+            write("}")
+            return
+        if self.type == OperationType.RESTORE_FOOTPRINT:
+            assert self.restore_footprint_result is not None
+            write('{"restore_footprint": ')
+            self.restore_footprint_result._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in OperationResultTr: {self.type}")
+
+    def clone(self, deep: bool = True) -> OperationResultTr:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.create_account_result = (
+            self.create_account_result.clone()
+            if self.create_account_result is not None
+            else None
+        )
+        result.payment_result = (
+            self.payment_result.clone() if self.payment_result is not None else None
+        )
+        result.path_payment_strict_receive_result = (
+            self.path_payment_strict_receive_result.clone()
+            if self.path_payment_strict_receive_result is not None
+            else None
+        )
+        result.manage_sell_offer_result = (
+            self.manage_sell_offer_result.clone()
+            if self.manage_sell_offer_result is not None
+            else None
+        )
+        result.create_passive_sell_offer_result = (
+            self.create_passive_sell_offer_result.clone()
+            if self.create_passive_sell_offer_result is not None
+            else None
+        )
+        result.set_options_result = (
+            self.set_options_result.clone()
+            if self.set_options_result is not None
+            else None
+        )
+        result.change_trust_result = (
+            self.change_trust_result.clone()
+            if self.change_trust_result is not None
+            else None
+        )
+        result.allow_trust_result = (
+            self.allow_trust_result.clone()
+            if self.allow_trust_result is not None
+            else None
+        )
+        result.account_merge_result = (
+            self.account_merge_result.clone()
+            if self.account_merge_result is not None
+            else None
+        )
+        result.inflation_result = (
+            self.inflation_result.clone() if self.inflation_result is not None else None
+        )
+        result.manage_data_result = (
+            self.manage_data_result.clone()
+            if self.manage_data_result is not None
+            else None
+        )
+        result.bump_seq_result = (
+            self.bump_seq_result.clone() if self.bump_seq_result is not None else None
+        )
+        result.manage_buy_offer_result = (
+            self.manage_buy_offer_result.clone()
+            if self.manage_buy_offer_result is not None
+            else None
+        )
+        result.path_payment_strict_send_result = (
+            self.path_payment_strict_send_result.clone()
+            if self.path_payment_strict_send_result is not None
+            else None
+        )
+        result.create_claimable_balance_result = (
+            self.create_claimable_balance_result.clone()
+            if self.create_claimable_balance_result is not None
+            else None
+        )
+        result.claim_claimable_balance_result = (
+            self.claim_claimable_balance_result.clone()
+            if self.claim_claimable_balance_result is not None
+            else None
+        )
+        result.begin_sponsoring_future_reserves_result = (
+            self.begin_sponsoring_future_reserves_result.clone()
+            if self.begin_sponsoring_future_reserves_result is not None
+            else None
+        )
+        result.end_sponsoring_future_reserves_result = (
+            self.end_sponsoring_future_reserves_result.clone()
+            if self.end_sponsoring_future_reserves_result is not None
+            else None
+        )
+        result.revoke_sponsorship_result = (
+            self.revoke_sponsorship_result.clone()
+            if self.revoke_sponsorship_result is not None
+            else None
+        )
+        result.clawback_result = (
+            self.clawback_result.clone() if self.clawback_result is not None else None
+        )
+        result.clawback_claimable_balance_result = (
+            self.clawback_claimable_balance_result.clone()
+            if self.clawback_claimable_balance_result is not None
+            else None
+        )
+        result.set_trust_line_flags_result = (
+            self.set_trust_line_flags_result.clone()
+            if self.set_trust_line_flags_result is not None
+            else None
+        )
+        result.liquidity_pool_deposit_result = (
+            self.liquidity_pool_deposit_result.clone()
+            if self.liquidity_pool_deposit_result is not None
+            else None
+        )
+        result.liquidity_pool_withdraw_result = (
+            self.liquidity_pool_withdraw_result.clone()
+            if self.liquidity_pool_withdraw_result is not None
+            else None
+        )
+        result.invoke_host_function_result = (
+            self.invoke_host_function_result.clone()
+            if self.invoke_host_function_result is not None
+            else None
+        )
+        result.extend_footprint_ttl_result = (
+            self.extend_footprint_ttl_result.clone()
+            if self.extend_footprint_ttl_result is not None
+            else None
+        )
+        result.restore_footprint_result = (
+            self.restore_footprint_result.clone()
+            if self.restore_footprint_result is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> OperationResultTr:
+        return self.clone()
+
+    def freeze(self) -> OperationResultTr:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -961,3 +1797,272 @@ class OperationResultTr:
         if self.restore_footprint_result is not None:
             out.append(f"restore_footprint_result={self.restore_footprint_result}")
         return f"<OperationResultTr [{', '.join(out)}]>"
+
+
+def _unpack_create_account_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    create_account_result = CreateAccountResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, create_account_result=create_account_result)
+
+
+def _unpack_payment_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    payment_result = PaymentResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, payment_result=payment_result)
+
+
+def _unpack_path_payment_strict_receive_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    path_payment_strict_receive_result = PathPaymentStrictReceiveResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        path_payment_strict_receive_result=path_payment_strict_receive_result,
+    )
+
+
+def _unpack_manage_sell_offer_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    manage_sell_offer_result = ManageSellOfferResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, manage_sell_offer_result=manage_sell_offer_result)
+
+
+def _unpack_create_passive_sell_offer_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    create_passive_sell_offer_result = ManageSellOfferResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        create_passive_sell_offer_result=create_passive_sell_offer_result,
+    )
+
+
+def _unpack_set_options_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    set_options_result = SetOptionsResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, set_options_result=set_options_result)
+
+
+def _unpack_change_trust_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    change_trust_result = ChangeTrustResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, change_trust_result=change_trust_result)
+
+
+def _unpack_allow_trust_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    allow_trust_result = AllowTrustResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, allow_trust_result=allow_trust_result)
+
+
+def _unpack_account_merge_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    account_merge_result = AccountMergeResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, account_merge_result=account_merge_result)
+
+
+def _unpack_inflation_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    inflation_result = InflationResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, inflation_result=inflation_result)
+
+
+def _unpack_manage_data_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    manage_data_result = ManageDataResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, manage_data_result=manage_data_result)
+
+
+def _unpack_bump_seq_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    bump_seq_result = BumpSequenceResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, bump_seq_result=bump_seq_result)
+
+
+def _unpack_manage_buy_offer_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    manage_buy_offer_result = ManageBuyOfferResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, manage_buy_offer_result=manage_buy_offer_result)
+
+
+def _unpack_path_payment_strict_send_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    path_payment_strict_send_result = PathPaymentStrictSendResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        path_payment_strict_send_result=path_payment_strict_send_result,
+    )
+
+
+def _unpack_create_claimable_balance_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    create_claimable_balance_result = CreateClaimableBalanceResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        create_claimable_balance_result=create_claimable_balance_result,
+    )
+
+
+def _unpack_claim_claimable_balance_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    claim_claimable_balance_result = ClaimClaimableBalanceResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, claim_claimable_balance_result=claim_claimable_balance_result)
+
+
+def _unpack_begin_sponsoring_future_reserves_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    begin_sponsoring_future_reserves_result = (
+        BeginSponsoringFutureReservesResult.unpack(unpacker, depth_limit - 1)
+    )
+    return cls(
+        type=type,
+        begin_sponsoring_future_reserves_result=begin_sponsoring_future_reserves_result,
+    )
+
+
+def _unpack_end_sponsoring_future_reserves_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    end_sponsoring_future_reserves_result = EndSponsoringFutureReservesResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        end_sponsoring_future_reserves_result=end_sponsoring_future_reserves_result,
+    )
+
+
+def _unpack_revoke_sponsorship_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    revoke_sponsorship_result = RevokeSponsorshipResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, revoke_sponsorship_result=revoke_sponsorship_result)
+
+
+def _unpack_clawback_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    clawback_result = ClawbackResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, clawback_result=clawback_result)
+
+
+def _unpack_clawback_claimable_balance_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    clawback_claimable_balance_result = ClawbackClaimableBalanceResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(
+        type=type,
+        clawback_claimable_balance_result=clawback_claimable_balance_result,
+    )
+
+
+def _unpack_set_trust_line_flags_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    set_trust_line_flags_result = SetTrustLineFlagsResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, set_trust_line_flags_result=set_trust_line_flags_result)
+
+
+def _unpack_liquidity_pool_deposit_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    liquidity_pool_deposit_result = LiquidityPoolDepositResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, liquidity_pool_deposit_result=liquidity_pool_deposit_result)
+
+
+def _unpack_liquidity_pool_withdraw_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    liquidity_pool_withdraw_result = LiquidityPoolWithdrawResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, liquidity_pool_withdraw_result=liquidity_pool_withdraw_result)
+
+
+def _unpack_invoke_host_function_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    invoke_host_function_result = InvokeHostFunctionResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, invoke_host_function_result=invoke_host_function_result)
+
+
+def _unpack_extend_footprint_ttl_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    extend_footprint_ttl_result = ExtendFootprintTTLResult.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, extend_footprint_ttl_result=extend_footprint_ttl_result)
+
+
+def _unpack_restore_footprint_result(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> OperationResultTr:
+    restore_footprint_result = RestoreFootprintResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, restore_footprint_result=restore_footprint_result)
+
+
+_UNPACK_ARMS = {
+    OperationType.CREATE_ACCOUNT: _unpack_create_account_result,
+    OperationType.PAYMENT: _unpack_payment_result,
+    OperationType.PATH_PAYMENT_STRICT_RECEIVE: _unpack_path_payment_strict_receive_result,
+    OperationType.MANAGE_SELL_OFFER: _unpack_manage_sell_offer_result,
+    OperationType.CREATE_PASSIVE_SELL_OFFER: _unpack_create_passive_sell_offer_result,
+    OperationType.SET_OPTIONS: _unpack_set_options_result,
+    OperationType.CHANGE_TRUST: _unpack_change_trust_result,
+    OperationType.ALLOW_TRUST: _unpack_allow_trust_result,
+    OperationType.ACCOUNT_MERGE: _unpack_account_merge_result,
+    OperationType.INFLATION: _unpack_inflation_result,
+    OperationType.MANAGE_DATA: _unpack_manage_data_result,
+    OperationType.BUMP_SEQUENCE: _unpack_bump_seq_result,
+    OperationType.MANAGE_BUY_OFFER: _unpack_manage_buy_offer_result,
+    OperationType.PATH_PAYMENT_STRICT_SEND: _unpack_path_payment_strict_send_result,
+    OperationType.CREATE_CLAIMABLE_BALANCE: _unpack_create_claimable_balance_result,
+    OperationType.CLAIM_CLAIMABLE_BALANCE: _unpack_claim_claimable_balance_result,
+    OperationType.BEGIN_SPONSORING_FUTURE_RESERVES: _unpack_begin_sponsoring_future_reserves_result,
+    OperationType.END_SPONSORING_FUTURE_RESERVES: _unpack_end_sponsoring_future_reserves_result,
+    OperationType.REVOKE_SPONSORSHIP: _unpack_revoke_sponsorship_result,
+    OperationType.CLAWBACK: _unpack_clawback_result,
+    OperationType.CLAWBACK_CLAIMABLE_BALANCE: _unpack_clawback_claimable_balance_result,
+    OperationType.SET_TRUST_LINE_FLAGS: _unpack_set_trust_line_flags_result,
+    OperationType.LIQUIDITY_POOL_DEPOSIT: _unpack_liquidity_pool_deposit_result,
+    OperationType.LIQUIDITY_POOL_WITHDRAW: _unpack_liquidity_pool_withdraw_result,
+    OperationType.INVOKE_HOST_FUNCTION: _unpack_invoke_host_function_result,
+    OperationType.EXTEND_FOOTPRINT_TTL: _unpack_extend_footprint_ttl_result,
+    OperationType.RESTORE_FOOTPRINT: _unpack_restore_footprint_result,
+}
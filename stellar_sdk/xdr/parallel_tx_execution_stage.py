@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .dependent_tx_cluster import DependentTxCluster
 
 __all__ = ["ParallelTxExecutionStage"]
@@ -20,6 +34,8 @@ class ParallelTxExecutionStage:
         typedef DependentTxCluster ParallelTxExecutionStage<>;
     """
 
+    __slots__ = ("parallel_tx_execution_stage",)
+
     def __init__(self, parallel_tx_execution_stage: list[DependentTxCluster]) -> None:
         _expect_max_length = 4294967295
         if (
@@ -36,6 +52,9 @@ class ParallelTxExecutionStage:
         for parallel_tx_execution_stage_item in self.parallel_tx_execution_stage:
             parallel_tx_execution_stage_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.parallel_tx_execution_stage)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -55,16 +74,96 @@ class ParallelTxExecutionStage:
             )
         return cls(parallel_tx_execution_stage)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"parallel_tx_execution_stage length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            DependentTxCluster.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ParallelTxExecutionStage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "parallel_tx_execution_stage" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"parallel_tx_execution_stage length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["parallel_tx_execution_stage"] = []
+            for _ in range(length):
+                _result["parallel_tx_execution_stage"].append(
+                    DependentTxCluster.unpack_fields(
+                        unpacker, fields["parallel_tx_execution_stage"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"parallel_tx_execution_stage length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                DependentTxCluster.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"parallel_tx_execution_stage length {length} exceeds remaining input length {_remaining}"
+            )
+        parallel_tx_execution_stage = []
+        for _ in range(length):
+            parallel_tx_execution_stage.append(
+                unpack_view(DependentTxCluster, unpacker, depth_limit - 1)
+            )
+        yield "parallel_tx_execution_stage", parallel_tx_execution_stage
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ParallelTxExecutionStage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ParallelTxExecutionStage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -79,11 +178,11 @@ class ParallelTxExecutionStage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ParallelTxExecutionStage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.parallel_tx_execution_stage]
@@ -92,6 +191,24 @@ class ParallelTxExecutionStage:
     def from_json_dict(cls, json_value: list) -> ParallelTxExecutionStage:
         return cls([DependentTxCluster.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.parallel_tx_execution_stage)
+
+    def clone(self, deep: bool = True) -> ParallelTxExecutionStage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.parallel_tx_execution_stage = [
+            item.clone() for item in self.parallel_tx_execution_stage
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ParallelTxExecutionStage:
+        return self.clone()
+
+    def freeze(self) -> ParallelTxExecutionStage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.parallel_tx_execution_stage,))
 
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .parallel_tx_execution_stage import ParallelTxExecutionStage
 
@@ -28,6 +42,8 @@ class ParallelTxsComponent:
         };
     """
 
+    __slots__ = ("base_fee", "execution_stages")
+
     def __init__(
         self,
         base_fee: Int64 | None,
@@ -51,6 +67,14 @@ class ParallelTxsComponent:
         for execution_stages_item in self.execution_stages:
             execution_stages_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (8 if self.base_fee is not None else 0)
+            + 4
+            + sum(item.xdr_size() for item in self.execution_stages)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -76,16 +100,111 @@ class ParallelTxsComponent:
             execution_stages=execution_stages,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            Int64.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"execution_stages length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ParallelTxExecutionStage.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ParallelTxsComponent:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "base_fee" in fields:
+            _result["base_fee"] = (
+                Int64.unpack_fields(unpacker, fields["base_fee"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Int64.skip(unpacker, depth_limit - 1)
+        if "execution_stages" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"execution_stages length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["execution_stages"] = []
+            for _ in range(length):
+                _result["execution_stages"].append(
+                    ParallelTxExecutionStage.unpack_fields(
+                        unpacker, fields["execution_stages"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"execution_stages length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ParallelTxExecutionStage.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield (
+            "base_fee",
+            Int64.unpack(unpacker, depth_limit - 1) if unpacker.unpack_uint() else None,
+        )
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"execution_stages length {length} exceeds remaining input length {_remaining}"
+            )
+        execution_stages = []
+        for _ in range(length):
+            execution_stages.append(
+                unpack_view(ParallelTxExecutionStage, unpacker, depth_limit - 1)
+            )
+        yield "execution_stages", execution_stages
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ParallelTxsComponent:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> ParallelTxsComponent:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -100,11 +219,11 @@ class ParallelTxsComponent:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ParallelTxsComponent:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -130,6 +249,30 @@ class ParallelTxsComponent:
             execution_stages=execution_stages,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"base_fee": ')
+        if self.base_fee is None:
+            write("null")
+        else:
+            self.base_fee._write_json(write)
+        write(', "execution_stages": ')
+        write_json_array(write, self.execution_stages)
+        write("}")
+
+    def clone(self, deep: bool = True) -> ParallelTxsComponent:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.base_fee = self.base_fee.clone() if self.base_fee is not None else None
+        result.execution_stages = [item.clone() for item in self.execution_stages]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ParallelTxsComponent:
+        return self.clone()
+
+    def freeze(self) -> ParallelTxsComponent:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
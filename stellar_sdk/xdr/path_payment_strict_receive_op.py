@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .muxed_account import MuxedAccount
 
@@ -34,6 +47,15 @@ class PathPaymentStrictReceiveOp:
         };
     """
 
+    __slots__ = (
+        "dest_amount",
+        "dest_asset",
+        "destination",
+        "path",
+        "send_asset",
+        "send_max",
+    )
+
     def __init__(
         self,
         send_asset: Asset,
@@ -65,6 +87,16 @@ class PathPaymentStrictReceiveOp:
         for path_item in self.path:
             path_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            16
+            + self.send_asset.xdr_size()
+            + self.destination.xdr_size()
+            + self.dest_asset.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.path)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -94,16 +126,132 @@ class PathPaymentStrictReceiveOp:
             path=path,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        MuxedAccount.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"path length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Asset.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PathPaymentStrictReceiveOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "send_asset" in fields:
+            _result["send_asset"] = Asset.unpack_fields(
+                unpacker, fields["send_asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "send_max" in fields:
+            _result["send_max"] = Int64.unpack_fields(
+                unpacker, fields["send_max"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "destination" in fields:
+            _result["destination"] = MuxedAccount.unpack_fields(
+                unpacker, fields["destination"], depth_limit - 1
+            )
+        else:
+            MuxedAccount.skip(unpacker, depth_limit - 1)
+        if "dest_asset" in fields:
+            _result["dest_asset"] = Asset.unpack_fields(
+                unpacker, fields["dest_asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "dest_amount" in fields:
+            _result["dest_amount"] = Int64.unpack_fields(
+                unpacker, fields["dest_amount"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "path" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"path length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["path"] = []
+            for _ in range(length):
+                _result["path"].append(
+                    Asset.unpack_fields(unpacker, fields["path"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"path length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Asset.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "send_asset", Asset.unpack(unpacker, depth_limit - 1)
+        yield "send_max", Int64.unpack(unpacker, depth_limit - 1)
+        yield "destination", MuxedAccount.unpack(unpacker, depth_limit - 1)
+        yield "dest_asset", Asset.unpack(unpacker, depth_limit - 1)
+        yield "dest_amount", Int64.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"path length {length} exceeds remaining input length {_remaining}"
+            )
+        path = []
+        for _ in range(length):
+            path.append(Asset.unpack(unpacker, depth_limit - 1))
+        yield "path", path
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PathPaymentStrictReceiveOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> PathPaymentStrictReceiveOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -118,11 +266,11 @@ class PathPaymentStrictReceiveOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PathPaymentStrictReceiveOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -151,6 +299,39 @@ class PathPaymentStrictReceiveOp:
             path=path,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"send_asset": ')
+        self.send_asset._write_json(write)
+        write(', "send_max": ')
+        self.send_max._write_json(write)
+        write(', "destination": ')
+        self.destination._write_json(write)
+        write(', "dest_asset": ')
+        self.dest_asset._write_json(write)
+        write(', "dest_amount": ')
+        self.dest_amount._write_json(write)
+        write(', "path": ')
+        write_json_array(write, self.path)
+        write("}")
+
+    def clone(self, deep: bool = True) -> PathPaymentStrictReceiveOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.send_asset = self.send_asset.clone()
+        result.send_max = self.send_max.clone()
+        result.destination = self.destination.clone()
+        result.dest_asset = self.dest_asset.clone()
+        result.dest_amount = self.dest_amount.clone()
+        result.path = [item.clone() for item in self.path]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PathPaymentStrictReceiveOp:
+        return self.clone()
+
+    def freeze(self) -> PathPaymentStrictReceiveOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .path_payment_strict_receive_result_code import PathPaymentStrictReceiveResultCode
 from .path_payment_strict_receive_result_success import (
     PathPaymentStrictReceiveResultSuccess,
@@ -48,6 +61,8 @@ class PathPaymentStrictReceiveResult:
         };
     """
 
+    __slots__ = ("code", "no_issuer", "success")
+
     def __init__(
         self,
         code: PathPaymentStrictReceiveResultCode,
@@ -133,6 +148,76 @@ class PathPaymentStrictReceiveResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS
+        ):
+            assert self.success is not None
+            return 4 + self.success.xdr_size()
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER
+        ):
+            assert self.no_issuer is not None
+            return 4 + self.no_issuer.xdr_size()
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -140,75 +225,270 @@ class PathPaymentStrictReceiveResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = PathPaymentStrictReceiveResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = PathPaymentStrictReceiveResultCode.unpack(unpacker)
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS
+        ):
+            PathPaymentStrictReceiveResultSuccess.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER
+        ):
+            Asset.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX
+        ):
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PathPaymentStrictReceiveResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = PathPaymentStrictReceiveResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS
         ):
-            success = PathPaymentStrictReceiveResultSuccess.unpack(
-                unpacker, depth_limit - 1
+            if "success" in fields:
+                _result["success"] = (
+                    PathPaymentStrictReceiveResultSuccess.unpack_fields(
+                        unpacker, fields["success"], depth_limit - 1
+                    )
+                )
+            else:
+                PathPaymentStrictReceiveResultSuccess.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER
+        ):
+            if "no_issuer" in fields:
+                _result["no_issuer"] = Asset.unpack_fields(
+                    unpacker, fields["no_issuer"], depth_limit - 1
+                )
+            else:
+                Asset.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX
+        ):
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = PathPaymentStrictReceiveResultCode.unpack(unpacker)
+        yield "code", code
+        if (
+            code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS
+        ):
+            yield (
+                "success",
+                view_at(
+                    PathPaymentStrictReceiveResultSuccess, unpacker, depth_limit - 1
+                ),
             )
-            return cls(code=code, success=success)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER
         ):
-            no_issuer = Asset.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, no_issuer=no_issuer)
+            yield "no_issuer", Asset.unpack(unpacker, depth_limit - 1)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX
         ):
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -217,10 +497,12 @@ class PathPaymentStrictReceiveResult:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PathPaymentStrictReceiveResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> PathPaymentStrictReceiveResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -235,11 +517,11 @@ class PathPaymentStrictReceiveResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PathPaymentStrictReceiveResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -348,6 +630,110 @@ class PathPaymentStrictReceiveResult:
             return cls(code=code, no_issuer=no_issuer)
         raise ValueError(f"Unknown key '{key}' for PathPaymentStrictReceiveResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS
+        ):
+            assert self.success is not None
+            write('{"success": ')
+            self.success._write_json(write)
+            write("}")
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED
+        ):
+            write('"malformed"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED
+        ):
+            write('"underfunded"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST
+        ):
+            write('"src_no_trust"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED
+        ):
+            write('"src_not_authorized"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION
+        ):
+            write('"no_destination"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST
+        ):
+            write('"no_trust"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED
+        ):
+            write('"not_authorized"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL
+        ):
+            write('"line_full"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER
+        ):
+            assert self.no_issuer is not None
+            write('{"no_issuer": ')
+            self.no_issuer._write_json(write)
+            write("}")
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS
+        ):
+            write('"too_few_offers"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF
+        ):
+            write('"offer_cross_self"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX
+        ):
+            write('"over_sendmax"')
+            return
+        raise ValueError(f"Unknown code in PathPaymentStrictReceiveResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> PathPaymentStrictReceiveResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.success = self.success.clone() if self.success is not None else None
+        result.no_issuer = (
+            self.no_issuer.clone() if self.no_issuer is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PathPaymentStrictReceiveResult:
+        return self.clone()
+
+    def freeze(self) -> PathPaymentStrictReceiveResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -374,3 +760,40 @@ class PathPaymentStrictReceiveResult:
         if self.no_issuer is not None:
             out.append(f"no_issuer={self.no_issuer}")
         return f"<PathPaymentStrictReceiveResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> PathPaymentStrictReceiveResult:
+    return cls(code=code)
+
+
+def _unpack_success(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> PathPaymentStrictReceiveResult:
+    success = PathPaymentStrictReceiveResultSuccess.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, success=success)
+
+
+def _unpack_no_issuer(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> PathPaymentStrictReceiveResult:
+    no_issuer = Asset.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, no_issuer=no_issuer)
+
+
+_UNPACK_ARMS = {
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS: _unpack_success,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER: _unpack_no_issuer,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF: _unpack_void,
+    PathPaymentStrictReceiveResultCode.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX: _unpack_void,
+}
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .path_payment_strict_send_result_code import PathPaymentStrictSendResultCode
 from .path_payment_strict_send_result_success import PathPaymentStrictSendResultSuccess
 
@@ -45,6 +58,8 @@ class PathPaymentStrictSendResult:
         };
     """
 
+    __slots__ = ("code", "no_issuer", "success")
+
     def __init__(
         self,
         code: PathPaymentStrictSendResultCode,
@@ -130,6 +145,76 @@ class PathPaymentStrictSendResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SUCCESS
+        ):
+            assert self.success is not None
+            return 4 + self.success.xdr_size()
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_MALFORMED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_TRUST
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_LINE_FULL
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_ISSUER
+        ):
+            assert self.no_issuer is not None
+            return 4 + self.no_issuer.xdr_size()
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF
+        ):
+            return 4
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -137,57 +222,212 @@ class PathPaymentStrictSendResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = PathPaymentStrictSendResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = PathPaymentStrictSendResultCode.unpack(unpacker)
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SUCCESS:
+            PathPaymentStrictSendResultSuccess.skip(unpacker, depth_limit - 1)
+            return
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_MALFORMED:
+            return
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED:
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION
+        ):
+            return
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_TRUST:
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED
+        ):
+            return
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_LINE_FULL:
+            return
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_ISSUER:
+            Asset.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF
+        ):
+            return
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN
+        ):
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PathPaymentStrictSendResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = PathPaymentStrictSendResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SUCCESS:
+            if "success" in fields:
+                _result["success"] = PathPaymentStrictSendResultSuccess.unpack_fields(
+                    unpacker, fields["success"], depth_limit - 1
+                )
+            else:
+                PathPaymentStrictSendResultSuccess.skip(unpacker, depth_limit - 1)
+            return _result
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_MALFORMED:
+            return _result
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED:
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION
+        ):
+            return _result
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_TRUST:
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED
+        ):
+            return _result
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_LINE_FULL:
+            return _result
+        if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_ISSUER:
+            if "no_issuer" in fields:
+                _result["no_issuer"] = Asset.unpack_fields(
+                    unpacker, fields["no_issuer"], depth_limit - 1
+                )
+            else:
+                Asset.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF
+        ):
+            return _result
+        if (
+            code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN
+        ):
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = PathPaymentStrictSendResultCode.unpack(unpacker)
+        yield "code", code
         if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SUCCESS:
-            success = PathPaymentStrictSendResultSuccess.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "success",
+                view_at(PathPaymentStrictSendResultSuccess, unpacker, depth_limit - 1),
             )
-            return cls(code=code, success=success)
+            return
         if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_MALFORMED:
-            return cls(code=code)
+            return
         if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED:
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION
         ):
-            return cls(code=code)
+            return
         if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_TRUST:
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED
         ):
-            return cls(code=code)
+            return
         if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_LINE_FULL:
-            return cls(code=code)
+            return
         if code == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_ISSUER:
-            no_issuer = Asset.unpack(unpacker, depth_limit - 1)
-            return cls(code=code, no_issuer=no_issuer)
+            yield "no_issuer", Asset.unpack(unpacker, depth_limit - 1)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF
         ):
-            return cls(code=code)
+            return
         if (
             code
             == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN
         ):
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -196,10 +436,12 @@ class PathPaymentStrictSendResult:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PathPaymentStrictSendResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> PathPaymentStrictSendResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -214,11 +456,11 @@ class PathPaymentStrictSendResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PathPaymentStrictSendResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -327,6 +569,110 @@ class PathPaymentStrictSendResult:
             return cls(code=code, no_issuer=no_issuer)
         raise ValueError(f"Unknown key '{key}' for PathPaymentStrictSendResult")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SUCCESS
+        ):
+            assert self.success is not None
+            write('{"success": ')
+            self.success._write_json(write)
+            write("}")
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_MALFORMED
+        ):
+            write('"malformed"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED
+        ):
+            write('"underfunded"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST
+        ):
+            write('"src_no_trust"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED
+        ):
+            write('"src_not_authorized"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION
+        ):
+            write('"no_destination"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_TRUST
+        ):
+            write('"no_trust"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED
+        ):
+            write('"not_authorized"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_LINE_FULL
+        ):
+            write('"line_full"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_ISSUER
+        ):
+            assert self.no_issuer is not None
+            write('{"no_issuer": ')
+            self.no_issuer._write_json(write)
+            write("}")
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS
+        ):
+            write('"too_few_offers"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF
+        ):
+            write('"offer_cross_self"')
+            return
+        if (
+            self.code
+            == PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN
+        ):
+            write('"under_destmin"')
+            return
+        raise ValueError(f"Unknown code in PathPaymentStrictSendResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> PathPaymentStrictSendResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        result.success = self.success.clone() if self.success is not None else None
+        result.no_issuer = (
+            self.no_issuer.clone() if self.no_issuer is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PathPaymentStrictSendResult:
+        return self.clone()
+
+    def freeze(self) -> PathPaymentStrictSendResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -353,3 +699,40 @@ class PathPaymentStrictSendResult:
         if self.no_issuer is not None:
             out.append(f"no_issuer={self.no_issuer}")
         return f"<PathPaymentStrictSendResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> PathPaymentStrictSendResult:
+    return cls(code=code)
+
+
+def _unpack_success(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> PathPaymentStrictSendResult:
+    success = PathPaymentStrictSendResultSuccess.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, success=success)
+
+
+def _unpack_no_issuer(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> PathPaymentStrictSendResult:
+    no_issuer = Asset.unpack(unpacker, depth_limit - 1)
+    return cls(code=code, no_issuer=no_issuer)
+
+
+_UNPACK_ARMS = {
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SUCCESS: _unpack_success,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_MALFORMED: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_TRUST: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_LINE_FULL: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_NO_ISSUER: _unpack_no_issuer,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF: _unpack_void,
+    PathPaymentStrictSendResultCode.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN: _unpack_void,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .claim_atom import ClaimAtom
 from .simple_payment_result import SimplePaymentResult
 
@@ -25,6 +38,8 @@ class PathPaymentStrictSendResultSuccess:
             }
     """
 
+    __slots__ = ("last", "offers")
+
     def __init__(
         self,
         offers: list[ClaimAtom],
@@ -44,6 +59,9 @@ class PathPaymentStrictSendResultSuccess:
             offers_item.pack(packer)
         self.last.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.offers) + self.last.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +83,100 @@ class PathPaymentStrictSendResultSuccess:
             last=last,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"offers length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ClaimAtom.skip(unpacker, depth_limit - 1)
+        SimplePaymentResult.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PathPaymentStrictSendResultSuccess:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "offers" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"offers length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["offers"] = []
+            for _ in range(length):
+                _result["offers"].append(
+                    ClaimAtom.unpack_fields(unpacker, fields["offers"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"offers length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ClaimAtom.skip(unpacker, depth_limit - 1)
+        if "last" in fields:
+            _result["last"] = SimplePaymentResult.unpack_fields(
+                unpacker, fields["last"], depth_limit - 1
+            )
+        else:
+            SimplePaymentResult.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"offers length {length} exceeds remaining input length {_remaining}"
+            )
+        offers = []
+        for _ in range(length):
+            offers.append(ClaimAtom.unpack(unpacker, depth_limit - 1))
+        yield "offers", offers
+        yield "last", SimplePaymentResult.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PathPaymentStrictSendResultSuccess:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> PathPaymentStrictSendResultSuccess:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +191,11 @@ class PathPaymentStrictSendResultSuccess:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PathPaymentStrictSendResultSuccess:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +212,27 @@ class PathPaymentStrictSendResultSuccess:
             last=last,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"offers": ')
+        write_json_array(write, self.offers)
+        write(', "last": ')
+        self.last._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> PathPaymentStrictSendResultSuccess:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.offers = [item.clone() for item in self.offers]
+        result.last = self.last.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PathPaymentStrictSendResultSuccess:
+        return self.clone()
+
+    def freeze(self) -> PathPaymentStrictSendResultSuccess:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
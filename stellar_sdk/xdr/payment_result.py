@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .payment_result_code import PaymentResultCode
 
 __all__ = ["PaymentResult"]
@@ -34,6 +44,8 @@ class PaymentResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: PaymentResultCode,
@@ -64,6 +76,29 @@ class PaymentResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == PaymentResultCode.PAYMENT_SUCCESS:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_MALFORMED:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_UNDERFUNDED:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_SRC_NO_TRUST:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_SRC_NOT_AUTHORIZED:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_NO_DESTINATION:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_NO_TRUST:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_NOT_AUTHORIZED:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_LINE_FULL:
+            return 4
+        if self.code == PaymentResultCode.PAYMENT_NO_ISSUER:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,38 +106,92 @@ class PaymentResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = PaymentResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = PaymentResultCode.unpack(unpacker)
+        if code == PaymentResultCode.PAYMENT_SUCCESS:
+            return
+        if code == PaymentResultCode.PAYMENT_MALFORMED:
+            return
+        if code == PaymentResultCode.PAYMENT_UNDERFUNDED:
+            return
+        if code == PaymentResultCode.PAYMENT_SRC_NO_TRUST:
+            return
+        if code == PaymentResultCode.PAYMENT_SRC_NOT_AUTHORIZED:
+            return
+        if code == PaymentResultCode.PAYMENT_NO_DESTINATION:
+            return
+        if code == PaymentResultCode.PAYMENT_NO_TRUST:
+            return
+        if code == PaymentResultCode.PAYMENT_NOT_AUTHORIZED:
+            return
+        if code == PaymentResultCode.PAYMENT_LINE_FULL:
+            return
+        if code == PaymentResultCode.PAYMENT_NO_ISSUER:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PaymentResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = PaymentResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == PaymentResultCode.PAYMENT_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_MALFORMED:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_UNDERFUNDED:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_SRC_NO_TRUST:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_SRC_NOT_AUTHORIZED:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_NO_DESTINATION:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_NO_TRUST:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_NOT_AUTHORIZED:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_LINE_FULL:
-            return cls(code=code)
+            return _result
         if code == PaymentResultCode.PAYMENT_NO_ISSUER:
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PaymentResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> PaymentResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -117,11 +206,11 @@ class PaymentResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PaymentResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == PaymentResultCode.PAYMENT_SUCCESS:
@@ -166,6 +255,52 @@ class PaymentResult:
         code = PaymentResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == PaymentResultCode.PAYMENT_SUCCESS:
+            write('"success"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_MALFORMED:
+            write('"malformed"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_UNDERFUNDED:
+            write('"underfunded"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_SRC_NO_TRUST:
+            write('"src_no_trust"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_SRC_NOT_AUTHORIZED:
+            write('"src_not_authorized"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_NO_DESTINATION:
+            write('"no_destination"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_NO_TRUST:
+            write('"no_trust"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_NOT_AUTHORIZED:
+            write('"not_authorized"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_LINE_FULL:
+            write('"line_full"')
+            return
+        if self.code == PaymentResultCode.PAYMENT_NO_ISSUER:
+            write('"no_issuer"')
+            return
+        raise ValueError(f"Unknown code in PaymentResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> PaymentResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PaymentResult:
+        return self.clone()
+
+    def freeze(self) -> PaymentResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -178,3 +313,21 @@ class PaymentResult:
         out = []
         out.append(f"code={self.code}")
         return f"<PaymentResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> PaymentResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    PaymentResultCode.PAYMENT_SUCCESS: _unpack_void,
+    PaymentResultCode.PAYMENT_MALFORMED: _unpack_void,
+    PaymentResultCode.PAYMENT_UNDERFUNDED: _unpack_void,
+    PaymentResultCode.PAYMENT_SRC_NO_TRUST: _unpack_void,
+    PaymentResultCode.PAYMENT_SRC_NOT_AUTHORIZED: _unpack_void,
+    PaymentResultCode.PAYMENT_NO_DESTINATION: _unpack_void,
+    PaymentResultCode.PAYMENT_NO_TRUST: _unpack_void,
+    PaymentResultCode.PAYMENT_NOT_AUTHORIZED: _unpack_void,
+    PaymentResultCode.PAYMENT_LINE_FULL: _unpack_void,
+    PaymentResultCode.PAYMENT_NO_ISSUER: _unpack_void,
+}
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .peer_address_ip import PeerAddressIp
 from .uint32 import Uint32
 
@@ -33,6 +43,8 @@ class PeerAddress:
         };
     """
 
+    __slots__ = ("ip", "num_failures", "port")
+
     def __init__(
         self,
         ip: PeerAddressIp,
@@ -48,6 +60,9 @@ class PeerAddress:
         self.port.pack(packer)
         self.num_failures.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.ip.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -63,16 +78,63 @@ class PeerAddress:
             num_failures=num_failures,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        PeerAddressIp.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PeerAddress:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ip" in fields:
+            _result["ip"] = PeerAddressIp.unpack_fields(
+                unpacker, fields["ip"], depth_limit - 1
+            )
+        else:
+            PeerAddressIp.skip(unpacker, depth_limit - 1)
+        if "port" in fields:
+            _result["port"] = Uint32.unpack_fields(
+                unpacker, fields["port"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "num_failures" in fields:
+            _result["num_failures"] = Uint32.unpack_fields(
+                unpacker, fields["num_failures"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PeerAddress:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> PeerAddress:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -87,11 +149,11 @@ class PeerAddress:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PeerAddress:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -111,6 +173,30 @@ class PeerAddress:
             num_failures=num_failures,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ip": ')
+        self.ip._write_json(write)
+        write(', "port": ')
+        self.port._write_json(write)
+        write(', "num_failures": ')
+        self.num_failures._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> PeerAddress:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ip = self.ip.clone()
+        result.port = self.port.clone()
+        result.num_failures = self.num_failures.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PeerAddress:
+        return self.clone()
+
+    def freeze(self) -> PeerAddress:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .ip_addr_type import IPAddrType
 
 __all__ = ["PeerAddressIp"]
@@ -26,6 +38,8 @@ class PeerAddressIp:
             }
     """
 
+    __slots__ = ("ipv4", "ipv6", "type")
+
     def __init__(
         self,
         type: IPAddrType,
@@ -60,31 +74,88 @@ class PeerAddressIp:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == IPAddrType.IPv4:
+            return 8
+        if self.type == IPAddrType.IPv6:
+            return 20
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> PeerAddressIp:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = IPAddrType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = IPAddrType.unpack(unpacker)
         if type == IPAddrType.IPv4:
-            ipv4 = Opaque.unpack(unpacker, 4, True)
-            return cls(type=type, ipv4=ipv4)
+            Opaque.skip(unpacker, 4, True)
+            return
         if type == IPAddrType.IPv6:
-            ipv6 = Opaque.unpack(unpacker, 16, True)
-            return cls(type=type, ipv6=ipv6)
+            Opaque.skip(unpacker, 16, True)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PeerAddressIp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = IPAddrType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == IPAddrType.IPv4:
+            if "ipv4" in fields:
+                _result["ipv4"] = Opaque.unpack_fields(
+                    unpacker, fields["ipv4"], 4, True
+                )
+            else:
+                Opaque.skip(unpacker, 4, True)
+            return _result
+        if type == IPAddrType.IPv6:
+            if "ipv6" in fields:
+                _result["ipv6"] = Opaque.unpack_fields(
+                    unpacker, fields["ipv6"], 16, True
+                )
+            else:
+                Opaque.skip(unpacker, 16, True)
+            return _result
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PeerAddressIp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> PeerAddressIp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -99,11 +170,11 @@ class PeerAddressIp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PeerAddressIp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == IPAddrType.IPv4:
@@ -130,6 +201,36 @@ class PeerAddressIp:
             return cls(type=type, ipv6=ipv6)
         raise ValueError(f"Unknown key '{key}' for PeerAddressIp")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == IPAddrType.IPv4:
+            assert self.ipv4 is not None
+            write('{"ipv4": ')
+            write(json_encode(Opaque.to_json_dict(self.ipv4)))
+            write("}")
+            return
+        if self.type == IPAddrType.IPv6:
+            assert self.ipv6 is not None
+            write('{"ipv6": ')
+            write(json_encode(Opaque.to_json_dict(self.ipv6)))
+            write("}")
+            return
+        raise ValueError(f"Unknown type in PeerAddressIp: {self.type}")
+
+    def clone(self, deep: bool = True) -> PeerAddressIp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.ipv4 = self.ipv4
+        result.ipv6 = self.ipv6
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PeerAddressIp:
+        return self.clone()
+
+    def freeze(self) -> PeerAddressIp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -156,3 +257,19 @@ class PeerAddressIp:
         if self.ipv6 is not None:
             out.append(f"ipv6={self.ipv6}")
         return f"<PeerAddressIp [{', '.join(out)}]>"
+
+
+def _unpack_ipv4(cls, type, unpacker: Unpacker, depth_limit: int) -> PeerAddressIp:
+    ipv4 = Opaque.unpack(unpacker, 4, True)
+    return cls(type=type, ipv4=ipv4)
+
+
+def _unpack_ipv6(cls, type, unpacker: Unpacker, depth_limit: int) -> PeerAddressIp:
+    ipv6 = Opaque.unpack(unpacker, 16, True)
+    return cls(type=type, ipv6=ipv6)
+
+
+_UNPACK_ARMS = {
+    IPAddrType.IPv4: _unpack_ipv4,
+    IPAddrType.IPv6: _unpack_ipv6,
+}
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .node_id import NodeID
 from .uint64 import Uint64
 
@@ -40,6 +52,24 @@ class PeerStats:
         };
     """
 
+    __slots__ = (
+        "bytes_read",
+        "bytes_written",
+        "duplicate_fetch_bytes_recv",
+        "duplicate_fetch_message_recv",
+        "duplicate_flood_bytes_recv",
+        "duplicate_flood_message_recv",
+        "id",
+        "messages_read",
+        "messages_written",
+        "seconds_connected",
+        "unique_fetch_bytes_recv",
+        "unique_fetch_message_recv",
+        "unique_flood_bytes_recv",
+        "unique_flood_message_recv",
+        "version_str",
+    )
+
     def __init__(
         self,
         id: NodeID,
@@ -96,6 +126,9 @@ class PeerStats:
         self.unique_fetch_message_recv.pack(packer)
         self.duplicate_fetch_message_recv.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 104 + self.id.xdr_size() + 4 + (len(self.version_str) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -135,16 +168,147 @@ class PeerStats:
             duplicate_fetch_message_recv=duplicate_fetch_message_recv,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        NodeID.skip(unpacker, depth_limit - 1)
+        String.skip(unpacker, 100)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PeerStats:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "id" in fields:
+            _result["id"] = NodeID.unpack_fields(
+                unpacker, fields["id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "version_str" in fields:
+            _result["version_str"] = String.unpack_fields(
+                unpacker, fields["version_str"], 100
+            )
+        else:
+            String.skip(unpacker, 100)
+        if "messages_read" in fields:
+            _result["messages_read"] = Uint64.unpack_fields(
+                unpacker, fields["messages_read"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "messages_written" in fields:
+            _result["messages_written"] = Uint64.unpack_fields(
+                unpacker, fields["messages_written"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "bytes_read" in fields:
+            _result["bytes_read"] = Uint64.unpack_fields(
+                unpacker, fields["bytes_read"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "bytes_written" in fields:
+            _result["bytes_written"] = Uint64.unpack_fields(
+                unpacker, fields["bytes_written"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "seconds_connected" in fields:
+            _result["seconds_connected"] = Uint64.unpack_fields(
+                unpacker, fields["seconds_connected"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "unique_flood_bytes_recv" in fields:
+            _result["unique_flood_bytes_recv"] = Uint64.unpack_fields(
+                unpacker, fields["unique_flood_bytes_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "duplicate_flood_bytes_recv" in fields:
+            _result["duplicate_flood_bytes_recv"] = Uint64.unpack_fields(
+                unpacker, fields["duplicate_flood_bytes_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "unique_fetch_bytes_recv" in fields:
+            _result["unique_fetch_bytes_recv"] = Uint64.unpack_fields(
+                unpacker, fields["unique_fetch_bytes_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "duplicate_fetch_bytes_recv" in fields:
+            _result["duplicate_fetch_bytes_recv"] = Uint64.unpack_fields(
+                unpacker, fields["duplicate_fetch_bytes_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "unique_flood_message_recv" in fields:
+            _result["unique_flood_message_recv"] = Uint64.unpack_fields(
+                unpacker, fields["unique_flood_message_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "duplicate_flood_message_recv" in fields:
+            _result["duplicate_flood_message_recv"] = Uint64.unpack_fields(
+                unpacker, fields["duplicate_flood_message_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "unique_fetch_message_recv" in fields:
+            _result["unique_fetch_message_recv"] = Uint64.unpack_fields(
+                unpacker, fields["unique_fetch_message_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "duplicate_fetch_message_recv" in fields:
+            _result["duplicate_fetch_message_recv"] = Uint64.unpack_fields(
+                unpacker, fields["duplicate_fetch_message_recv"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PeerStats:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> PeerStats:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -159,11 +323,11 @@ class PeerStats:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PeerStats:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -235,6 +399,66 @@ class PeerStats:
             duplicate_fetch_message_recv=duplicate_fetch_message_recv,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"id": ')
+        self.id._write_json(write)
+        write(', "version_str": ')
+        write(json_encode(String.to_json_dict(self.version_str)))
+        write(', "messages_read": ')
+        self.messages_read._write_json(write)
+        write(', "messages_written": ')
+        self.messages_written._write_json(write)
+        write(', "bytes_read": ')
+        self.bytes_read._write_json(write)
+        write(', "bytes_written": ')
+        self.bytes_written._write_json(write)
+        write(', "seconds_connected": ')
+        self.seconds_connected._write_json(write)
+        write(', "unique_flood_bytes_recv": ')
+        self.unique_flood_bytes_recv._write_json(write)
+        write(', "duplicate_flood_bytes_recv": ')
+        self.duplicate_flood_bytes_recv._write_json(write)
+        write(', "unique_fetch_bytes_recv": ')
+        self.unique_fetch_bytes_recv._write_json(write)
+        write(', "duplicate_fetch_bytes_recv": ')
+        self.duplicate_fetch_bytes_recv._write_json(write)
+        write(', "unique_flood_message_recv": ')
+        self.unique_flood_message_recv._write_json(write)
+        write(', "duplicate_flood_message_recv": ')
+        self.duplicate_flood_message_recv._write_json(write)
+        write(', "unique_fetch_message_recv": ')
+        self.unique_fetch_message_recv._write_json(write)
+        write(', "duplicate_fetch_message_recv": ')
+        self.duplicate_fetch_message_recv._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> PeerStats:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.id = self.id.clone()
+        result.version_str = self.version_str
+        result.messages_read = self.messages_read.clone()
+        result.messages_written = self.messages_written.clone()
+        result.bytes_read = self.bytes_read.clone()
+        result.bytes_written = self.bytes_written.clone()
+        result.seconds_connected = self.seconds_connected.clone()
+        result.unique_flood_bytes_recv = self.unique_flood_bytes_recv.clone()
+        result.duplicate_flood_bytes_recv = self.duplicate_flood_bytes_recv.clone()
+        result.unique_fetch_bytes_recv = self.unique_fetch_bytes_recv.clone()
+        result.duplicate_fetch_bytes_recv = self.duplicate_fetch_bytes_recv.clone()
+        result.unique_flood_message_recv = self.unique_flood_message_recv.clone()
+        result.duplicate_flood_message_recv = self.duplicate_flood_message_recv.clone()
+        result.unique_fetch_message_recv = self.unique_fetch_message_recv.clone()
+        result.duplicate_fetch_message_recv = self.duplicate_fetch_message_recv.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PeerStats:
+        return self.clone()
+
+    def freeze(self) -> PeerStats:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
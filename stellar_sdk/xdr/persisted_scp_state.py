@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .persisted_scp_state_v0 import PersistedSCPStateV0
 from .persisted_scp_state_v1 import PersistedSCPStateV1
 
@@ -27,6 +41,8 @@ class PersistedSCPState:
                                                                 };
     """
 
+    __slots__ = ("v", "v0", "v1")
+
     def __init__(
         self,
         v: int,
@@ -51,19 +67,96 @@ class PersistedSCPState:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            assert self.v0 is not None
+            return 4 + self.v0.xdr_size()
+        if self.v == 1:
+            assert self.v1 is not None
+            return 4 + self.v1.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> PersistedSCPState:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
         if v == 0:
-            v0 = PersistedSCPStateV0.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v0=v0)
+            PersistedSCPStateV0.skip(unpacker, depth_limit - 1)
+            return
         if v == 1:
-            v1 = PersistedSCPStateV1.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v1=v1)
+            PersistedSCPStateV1.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PersistedSCPState:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            if "v0" in fields:
+                _result["v0"] = PersistedSCPStateV0.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                PersistedSCPStateV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if v == 1:
+            if "v1" in fields:
+                _result["v1"] = PersistedSCPStateV1.unpack_fields(
+                    unpacker, fields["v1"], depth_limit - 1
+                )
+            else:
+                PersistedSCPStateV1.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        yield "v", v
+        if v == 0:
+            yield "v0", view_at(PersistedSCPStateV0, unpacker, depth_limit - 1)
+            return
+        if v == 1:
+            yield "v1", view_at(PersistedSCPStateV1, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -72,10 +165,12 @@ class PersistedSCPState:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PersistedSCPState:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> PersistedSCPState:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -90,11 +185,11 @@ class PersistedSCPState:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PersistedSCPState:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -121,6 +216,36 @@ class PersistedSCPState:
             return cls(v=v, v1=v1)
         raise ValueError(f"Unknown key '{key}' for PersistedSCPState")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            assert self.v0 is not None
+            write('{"v0": ')
+            self.v0._write_json(write)
+            write("}")
+            return
+        if self.v == 1:
+            assert self.v1 is not None
+            write('{"v1": ')
+            self.v1._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in PersistedSCPState: {self.v}")
+
+    def clone(self, deep: bool = True) -> PersistedSCPState:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        result.v1 = self.v1.clone() if self.v1 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PersistedSCPState:
+        return self.clone()
+
+    def freeze(self) -> PersistedSCPState:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -143,3 +268,19 @@ class PersistedSCPState:
         if self.v1 is not None:
             out.append(f"v1={self.v1}")
         return f"<PersistedSCPState [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, v, unpacker: Unpacker, depth_limit: int) -> PersistedSCPState:
+    v0 = PersistedSCPStateV0.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v0=v0)
+
+
+def _unpack_v1(cls, v, unpacker: Unpacker, depth_limit: int) -> PersistedSCPState:
+    v1 = PersistedSCPStateV1.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v1=v1)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_v0,
+    1: _unpack_v1,
+}
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .scp_envelope import SCPEnvelope
 from .scp_quorum_set import SCPQuorumSet
 from .stored_transaction_set import StoredTransactionSet
@@ -27,6 +41,8 @@ class PersistedSCPStateV0:
                                                                 };
     """
 
+    __slots__ = ("quorum_sets", "scp_envelopes", "tx_sets")
+
     def __init__(
         self,
         scp_envelopes: list[SCPEnvelope],
@@ -63,6 +79,16 @@ class PersistedSCPStateV0:
         for tx_sets_item in self.tx_sets:
             tx_sets_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + sum(item.xdr_size() for item in self.scp_envelopes)
+            + 4
+            + sum(item.xdr_size() for item in self.quorum_sets)
+            + 4
+            + sum(item.xdr_size() for item in self.tx_sets)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -102,16 +128,176 @@ class PersistedSCPStateV0:
             tx_sets=tx_sets,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"scp_envelopes length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPEnvelope.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPQuorumSet.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            StoredTransactionSet.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PersistedSCPStateV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "scp_envelopes" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"scp_envelopes length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["scp_envelopes"] = []
+            for _ in range(length):
+                _result["scp_envelopes"].append(
+                    SCPEnvelope.unpack_fields(
+                        unpacker, fields["scp_envelopes"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"scp_envelopes length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPEnvelope.skip(unpacker, depth_limit - 1)
+        if "quorum_sets" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["quorum_sets"] = []
+            for _ in range(length):
+                _result["quorum_sets"].append(
+                    SCPQuorumSet.unpack_fields(
+                        unpacker, fields["quorum_sets"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPQuorumSet.skip(unpacker, depth_limit - 1)
+        if "tx_sets" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["tx_sets"] = []
+            for _ in range(length):
+                _result["tx_sets"].append(
+                    StoredTransactionSet.unpack_fields(
+                        unpacker, fields["tx_sets"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                StoredTransactionSet.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"scp_envelopes length {length} exceeds remaining input length {_remaining}"
+            )
+        scp_envelopes = []
+        for _ in range(length):
+            scp_envelopes.append(unpack_view(SCPEnvelope, unpacker, depth_limit - 1))
+        yield "scp_envelopes", scp_envelopes
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        quorum_sets = []
+        for _ in range(length):
+            quorum_sets.append(unpack_view(SCPQuorumSet, unpacker, depth_limit - 1))
+        yield "quorum_sets", quorum_sets
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        tx_sets = []
+        for _ in range(length):
+            tx_sets.append(unpack_view(StoredTransactionSet, unpacker, depth_limit - 1))
+        yield "tx_sets", tx_sets
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PersistedSCPStateV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> PersistedSCPStateV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -126,11 +312,11 @@ class PersistedSCPStateV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PersistedSCPStateV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -156,6 +342,30 @@ class PersistedSCPStateV0:
             tx_sets=tx_sets,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"scp_envelopes": ')
+        write_json_array(write, self.scp_envelopes)
+        write(', "quorum_sets": ')
+        write_json_array(write, self.quorum_sets)
+        write(', "tx_sets": ')
+        write_json_array(write, self.tx_sets)
+        write("}")
+
+    def clone(self, deep: bool = True) -> PersistedSCPStateV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.scp_envelopes = [item.clone() for item in self.scp_envelopes]
+        result.quorum_sets = [item.clone() for item in self.quorum_sets]
+        result.tx_sets = [item.clone() for item in self.tx_sets]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PersistedSCPStateV0:
+        return self.clone()
+
+    def freeze(self) -> PersistedSCPStateV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .precondition_type import PreconditionType
 from .preconditions_v2 import PreconditionsV2
 from .time_bounds import TimeBounds
@@ -30,6 +43,8 @@ class Preconditions:
         };
     """
 
+    __slots__ = ("time_bounds", "type", "v2")
+
     def __init__(
         self,
         type: PreconditionType,
@@ -56,21 +71,103 @@ class Preconditions:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == PreconditionType.PRECOND_NONE:
+            return 4
+        if self.type == PreconditionType.PRECOND_TIME:
+            return 20
+        if self.type == PreconditionType.PRECOND_V2:
+            assert self.v2 is not None
+            return 4 + self.v2.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> Preconditions:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = PreconditionType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = PreconditionType.unpack(unpacker)
         if type == PreconditionType.PRECOND_NONE:
-            return cls(type=type)
+            return
         if type == PreconditionType.PRECOND_TIME:
-            time_bounds = TimeBounds.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, time_bounds=time_bounds)
+            TimeBounds.skip(unpacker, depth_limit - 1)
+            return
         if type == PreconditionType.PRECOND_V2:
-            v2 = PreconditionsV2.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v2=v2)
+            PreconditionsV2.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Preconditions:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = PreconditionType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == PreconditionType.PRECOND_NONE:
+            return _result
+        if type == PreconditionType.PRECOND_TIME:
+            if "time_bounds" in fields:
+                _result["time_bounds"] = TimeBounds.unpack_fields(
+                    unpacker, fields["time_bounds"], depth_limit - 1
+                )
+            else:
+                TimeBounds.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == PreconditionType.PRECOND_V2:
+            if "v2" in fields:
+                _result["v2"] = PreconditionsV2.unpack_fields(
+                    unpacker, fields["v2"], depth_limit - 1
+                )
+            else:
+                PreconditionsV2.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = PreconditionType.unpack(unpacker)
+        yield "type", type
+        if type == PreconditionType.PRECOND_NONE:
+            return
+        if type == PreconditionType.PRECOND_TIME:
+            yield "time_bounds", TimeBounds.unpack(unpacker, depth_limit - 1)
+            return
+        if type == PreconditionType.PRECOND_V2:
+            yield "v2", view_at(PreconditionsV2, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -79,10 +176,10 @@ class Preconditions:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Preconditions:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Preconditions:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +194,11 @@ class Preconditions:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Preconditions:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == PreconditionType.PRECOND_NONE:
@@ -137,6 +234,41 @@ class Preconditions:
             return cls(type=type, v2=v2)
         raise ValueError(f"Unknown key '{key}' for Preconditions")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == PreconditionType.PRECOND_NONE:
+            write('"none"')
+            return
+        if self.type == PreconditionType.PRECOND_TIME:
+            assert self.time_bounds is not None
+            write('{"time": ')
+            self.time_bounds._write_json(write)
+            write("}")
+            return
+        if self.type == PreconditionType.PRECOND_V2:
+            assert self.v2 is not None
+            write('{"v2": ')
+            self.v2._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in Preconditions: {self.type}")
+
+    def clone(self, deep: bool = True) -> Preconditions:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.time_bounds = (
+            self.time_bounds.clone() if self.time_bounds is not None else None
+        )
+        result.v2 = self.v2.clone() if self.v2 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Preconditions:
+        return self.clone()
+
+    def freeze(self) -> Preconditions:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -163,3 +295,26 @@ class Preconditions:
         if self.v2 is not None:
             out.append(f"v2={self.v2}")
         return f"<Preconditions [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> Preconditions:
+    return cls(type=type)
+
+
+def _unpack_time_bounds(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> Preconditions:
+    time_bounds = TimeBounds.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, time_bounds=time_bounds)
+
+
+def _unpack_v2(cls, type, unpacker: Unpacker, depth_limit: int) -> Preconditions:
+    v2 = PreconditionsV2.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v2=v2)
+
+
+_UNPACK_ARMS = {
+    PreconditionType.PRECOND_NONE: _unpack_void,
+    PreconditionType.PRECOND_TIME: _unpack_time_bounds,
+    PreconditionType.PRECOND_V2: _unpack_v2,
+}
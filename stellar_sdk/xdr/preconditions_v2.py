@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .duration import Duration
 from .ledger_bounds import LedgerBounds
 from .sequence_number import SequenceNumber
@@ -56,6 +69,15 @@ class PreconditionsV2:
         };
     """
 
+    __slots__ = (
+        "extra_signers",
+        "ledger_bounds",
+        "min_seq_age",
+        "min_seq_ledger_gap",
+        "min_seq_num",
+        "time_bounds",
+    )
+
     def __init__(
         self,
         time_bounds: TimeBounds | None,
@@ -99,6 +121,19 @@ class PreconditionsV2:
         for extra_signers_item in self.extra_signers:
             extra_signers_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            12
+            + 4
+            + (16 if self.time_bounds is not None else 0)
+            + 4
+            + (8 if self.ledger_bounds is not None else 0)
+            + 4
+            + (8 if self.min_seq_num is not None else 0)
+            + 4
+            + sum(item.xdr_size() for item in self.extra_signers)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -140,16 +175,165 @@ class PreconditionsV2:
             extra_signers=extra_signers,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            TimeBounds.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            LedgerBounds.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        Duration.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"extra_signers length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SignerKey.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | PreconditionsV2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "time_bounds" in fields:
+            _result["time_bounds"] = (
+                TimeBounds.unpack_fields(
+                    unpacker, fields["time_bounds"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                TimeBounds.skip(unpacker, depth_limit - 1)
+        if "ledger_bounds" in fields:
+            _result["ledger_bounds"] = (
+                LedgerBounds.unpack_fields(
+                    unpacker, fields["ledger_bounds"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                LedgerBounds.skip(unpacker, depth_limit - 1)
+        if "min_seq_num" in fields:
+            _result["min_seq_num"] = (
+                SequenceNumber.unpack_fields(
+                    unpacker, fields["min_seq_num"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                SequenceNumber.skip(unpacker, depth_limit - 1)
+        if "min_seq_age" in fields:
+            _result["min_seq_age"] = Duration.unpack_fields(
+                unpacker, fields["min_seq_age"], depth_limit - 1
+            )
+        else:
+            Duration.skip(unpacker, depth_limit - 1)
+        if "min_seq_ledger_gap" in fields:
+            _result["min_seq_ledger_gap"] = Uint32.unpack_fields(
+                unpacker, fields["min_seq_ledger_gap"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "extra_signers" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"extra_signers length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["extra_signers"] = []
+            for _ in range(length):
+                _result["extra_signers"].append(
+                    SignerKey.unpack_fields(
+                        unpacker, fields["extra_signers"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"extra_signers length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SignerKey.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield (
+            "time_bounds",
+            TimeBounds.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield (
+            "ledger_bounds",
+            LedgerBounds.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield (
+            "min_seq_num",
+            SequenceNumber.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield "min_seq_age", Duration.unpack(unpacker, depth_limit - 1)
+        yield "min_seq_ledger_gap", Uint32.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"extra_signers length {length} exceeds remaining input length {_remaining}"
+            )
+        extra_signers = []
+        for _ in range(length):
+            extra_signers.append(SignerKey.unpack(unpacker, depth_limit - 1))
+        yield "extra_signers", extra_signers
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> PreconditionsV2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> PreconditionsV2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -164,11 +348,11 @@ class PreconditionsV2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> PreconditionsV2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -217,6 +401,54 @@ class PreconditionsV2:
             extra_signers=extra_signers,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"time_bounds": ')
+        if self.time_bounds is None:
+            write("null")
+        else:
+            self.time_bounds._write_json(write)
+        write(', "ledger_bounds": ')
+        if self.ledger_bounds is None:
+            write("null")
+        else:
+            self.ledger_bounds._write_json(write)
+        write(', "min_seq_num": ')
+        if self.min_seq_num is None:
+            write("null")
+        else:
+            self.min_seq_num._write_json(write)
+        write(', "min_seq_age": ')
+        self.min_seq_age._write_json(write)
+        write(', "min_seq_ledger_gap": ')
+        self.min_seq_ledger_gap._write_json(write)
+        write(', "extra_signers": ')
+        write_json_array(write, self.extra_signers)
+        write("}")
+
+    def clone(self, deep: bool = True) -> PreconditionsV2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.time_bounds = (
+            self.time_bounds.clone() if self.time_bounds is not None else None
+        )
+        result.ledger_bounds = (
+            self.ledger_bounds.clone() if self.ledger_bounds is not None else None
+        )
+        result.min_seq_num = (
+            self.min_seq_num.clone() if self.min_seq_num is not None else None
+        )
+        result.min_seq_age = self.min_seq_age.clone()
+        result.min_seq_ledger_gap = self.min_seq_ledger_gap.clone()
+        result.extra_signers = [item.clone() for item in self.extra_signers]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> PreconditionsV2:
+        return self.clone()
+
+    def freeze(self) -> PreconditionsV2:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
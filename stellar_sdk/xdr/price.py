@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int32 import Int32
 
+_LAYOUT = FixedLayout(">ii")
 __all__ = ["Price"]
 
 
@@ -24,6 +36,8 @@ class Price:
         };
     """
 
+    __slots__ = ("d", "n")
+
     def __init__(
         self,
         n: Int32,
@@ -33,8 +47,10 @@ class Price:
         self.d = d
 
     def pack(self, packer: Packer) -> None:
-        self.n.pack(packer)
-        self.d.pack(packer)
+        _LAYOUT.write(packer, self.n.int32, self.d.int32)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -42,23 +58,57 @@ class Price:
     ) -> Price:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        n = Int32.unpack(unpacker, depth_limit - 1)
-        d = Int32.unpack(unpacker, depth_limit - 1)
+        n, d = _LAYOUT.read(unpacker)
         return cls(
-            n=n,
-            d=d,
+            n=Int32(n),
+            d=Int32(d),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Price:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "n" in fields:
+            _result["n"] = Int32.unpack_fields(unpacker, fields["n"], depth_limit - 1)
+        else:
+            Int32.skip(unpacker, depth_limit - 1)
+        if "d" in fields:
+            _result["d"] = Int32.unpack_fields(unpacker, fields["d"], depth_limit - 1)
+        else:
+            Int32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Price:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Price:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +123,11 @@ class Price:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Price:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +144,27 @@ class Price:
             d=d,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"n": ')
+        self.n._write_json(write)
+        write(', "d": ')
+        self.d._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> Price:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.n = self.n.clone()
+        result.d = self.d.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Price:
+        return self.clone()
+
+    def freeze(self) -> Price:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
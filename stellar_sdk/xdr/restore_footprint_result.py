@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .restore_footprint_result_code import RestoreFootprintResultCode
 
 __all__ = ["RestoreFootprintResult"]
@@ -28,6 +38,8 @@ class RestoreFootprintResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: RestoreFootprintResultCode,
@@ -52,6 +64,23 @@ class RestoreFootprintResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_SUCCESS:
+            return 4
+        if self.code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_MALFORMED:
+            return 4
+        if (
+            self.code
+            == RestoreFootprintResultCode.RESTORE_FOOTPRINT_RESOURCE_LIMIT_EXCEEDED
+        ):
+            return 4
+        if (
+            self.code
+            == RestoreFootprintResultCode.RESTORE_FOOTPRINT_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -59,29 +88,76 @@ class RestoreFootprintResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = RestoreFootprintResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = RestoreFootprintResultCode.unpack(unpacker)
+        if code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_SUCCESS:
+            return
+        if code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_MALFORMED:
+            return
+        if code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_RESOURCE_LIMIT_EXCEEDED:
+            return
+        if (
+            code
+            == RestoreFootprintResultCode.RESTORE_FOOTPRINT_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | RestoreFootprintResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = RestoreFootprintResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_MALFORMED:
-            return cls(code=code)
+            return _result
         if code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_RESOURCE_LIMIT_EXCEEDED:
-            return cls(code=code)
+            return _result
         if (
             code
             == RestoreFootprintResultCode.RESTORE_FOOTPRINT_INSUFFICIENT_REFUNDABLE_FEE
         ):
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> RestoreFootprintResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> RestoreFootprintResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -96,11 +172,11 @@ class RestoreFootprintResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> RestoreFootprintResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_SUCCESS:
@@ -133,6 +209,40 @@ class RestoreFootprintResult:
         code = RestoreFootprintResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_SUCCESS:
+            write('"success"')
+            return
+        if self.code == RestoreFootprintResultCode.RESTORE_FOOTPRINT_MALFORMED:
+            write('"malformed"')
+            return
+        if (
+            self.code
+            == RestoreFootprintResultCode.RESTORE_FOOTPRINT_RESOURCE_LIMIT_EXCEEDED
+        ):
+            write('"resource_limit_exceeded"')
+            return
+        if (
+            self.code
+            == RestoreFootprintResultCode.RESTORE_FOOTPRINT_INSUFFICIENT_REFUNDABLE_FEE
+        ):
+            write('"insufficient_refundable_fee"')
+            return
+        raise ValueError(f"Unknown code in RestoreFootprintResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> RestoreFootprintResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> RestoreFootprintResult:
+        return self.clone()
+
+    def freeze(self) -> RestoreFootprintResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -145,3 +255,17 @@ class RestoreFootprintResult:
         out = []
         out.append(f"code={self.code}")
         return f"<RestoreFootprintResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> RestoreFootprintResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    RestoreFootprintResultCode.RESTORE_FOOTPRINT_SUCCESS: _unpack_void,
+    RestoreFootprintResultCode.RESTORE_FOOTPRINT_MALFORMED: _unpack_void,
+    RestoreFootprintResultCode.RESTORE_FOOTPRINT_RESOURCE_LIMIT_EXCEEDED: _unpack_void,
+    RestoreFootprintResultCode.RESTORE_FOOTPRINT_INSUFFICIENT_REFUNDABLE_FEE: _unpack_void,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_key import LedgerKey
 from .revoke_sponsorship_op_signer import RevokeSponsorshipOpSigner
 from .revoke_sponsorship_type import RevokeSponsorshipType
@@ -32,6 +45,8 @@ class RevokeSponsorshipOp:
         };
     """
 
+    __slots__ = ("ledger_key", "signer", "type")
+
     def __init__(
         self,
         type: RevokeSponsorshipType,
@@ -56,19 +71,96 @@ class RevokeSponsorshipOp:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY:
+            assert self.ledger_key is not None
+            return 4 + self.ledger_key.xdr_size()
+        if self.type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_SIGNER:
+            assert self.signer is not None
+            return 4 + self.signer.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> RevokeSponsorshipOp:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = RevokeSponsorshipType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = RevokeSponsorshipType.unpack(unpacker)
         if type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY:
-            ledger_key = LedgerKey.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, ledger_key=ledger_key)
+            LedgerKey.skip(unpacker, depth_limit - 1)
+            return
         if type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_SIGNER:
-            signer = RevokeSponsorshipOpSigner.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, signer=signer)
+            RevokeSponsorshipOpSigner.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | RevokeSponsorshipOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = RevokeSponsorshipType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY:
+            if "ledger_key" in fields:
+                _result["ledger_key"] = LedgerKey.unpack_fields(
+                    unpacker, fields["ledger_key"], depth_limit - 1
+                )
+            else:
+                LedgerKey.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_SIGNER:
+            if "signer" in fields:
+                _result["signer"] = RevokeSponsorshipOpSigner.unpack_fields(
+                    unpacker, fields["signer"], depth_limit - 1
+                )
+            else:
+                RevokeSponsorshipOpSigner.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = RevokeSponsorshipType.unpack(unpacker)
+        yield "type", type
+        if type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY:
+            yield "ledger_key", view_at(LedgerKey, unpacker, depth_limit - 1)
+            return
+        if type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_SIGNER:
+            yield "signer", RevokeSponsorshipOpSigner.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -77,10 +169,12 @@ class RevokeSponsorshipOp:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> RevokeSponsorshipOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> RevokeSponsorshipOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +189,11 @@ class RevokeSponsorshipOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> RevokeSponsorshipOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY:
@@ -126,6 +220,38 @@ class RevokeSponsorshipOp:
             return cls(type=type, signer=signer)
         raise ValueError(f"Unknown key '{key}' for RevokeSponsorshipOp")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY:
+            assert self.ledger_key is not None
+            write('{"ledger_entry": ')
+            self.ledger_key._write_json(write)
+            write("}")
+            return
+        if self.type == RevokeSponsorshipType.REVOKE_SPONSORSHIP_SIGNER:
+            assert self.signer is not None
+            write('{"signer": ')
+            self.signer._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in RevokeSponsorshipOp: {self.type}")
+
+    def clone(self, deep: bool = True) -> RevokeSponsorshipOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.ledger_key = (
+            self.ledger_key.clone() if self.ledger_key is not None else None
+        )
+        result.signer = self.signer.clone() if self.signer is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> RevokeSponsorshipOp:
+        return self.clone()
+
+    def freeze(self) -> RevokeSponsorshipOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -152,3 +278,23 @@ class RevokeSponsorshipOp:
         if self.signer is not None:
             out.append(f"signer={self.signer}")
         return f"<RevokeSponsorshipOp [{', '.join(out)}]>"
+
+
+def _unpack_ledger_key(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> RevokeSponsorshipOp:
+    ledger_key = LedgerKey.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, ledger_key=ledger_key)
+
+
+def _unpack_signer(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> RevokeSponsorshipOp:
+    signer = RevokeSponsorshipOpSigner.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, signer=signer)
+
+
+_UNPACK_ARMS = {
+    RevokeSponsorshipType.REVOKE_SPONSORSHIP_LEDGER_ENTRY: _unpack_ledger_key,
+    RevokeSponsorshipType.REVOKE_SPONSORSHIP_SIGNER: _unpack_signer,
+}
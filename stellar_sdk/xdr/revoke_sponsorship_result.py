@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .revoke_sponsorship_result_code import RevokeSponsorshipResultCode
 
 __all__ = ["RevokeSponsorshipResult"]
@@ -30,6 +40,8 @@ class RevokeSponsorshipResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: RevokeSponsorshipResultCode,
@@ -55,37 +67,103 @@ class RevokeSponsorshipResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_SUCCESS:
+            return 4
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_DOES_NOT_EXIST:
+            return 4
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_NOT_SPONSOR:
+            return 4
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_LOW_RESERVE:
+            return 4
+        if (
+            self.code
+            == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_ONLY_TRANSFERABLE
+        ):
+            return 4
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_MALFORMED:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> RevokeSponsorshipResult:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = RevokeSponsorshipResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = RevokeSponsorshipResultCode.unpack(unpacker)
         if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_SUCCESS:
-            return cls(code=code)
+            return
         if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_DOES_NOT_EXIST:
-            return cls(code=code)
+            return
         if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_NOT_SPONSOR:
-            return cls(code=code)
+            return
         if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_LOW_RESERVE:
-            return cls(code=code)
+            return
         if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_ONLY_TRANSFERABLE:
-            return cls(code=code)
+            return
         if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_MALFORMED:
-            return cls(code=code)
+            return
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | RevokeSponsorshipResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = RevokeSponsorshipResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
+        if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_SUCCESS:
+            return _result
+        if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_DOES_NOT_EXIST:
+            return _result
+        if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_NOT_SPONSOR:
+            return _result
+        if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_LOW_RESERVE:
+            return _result
+        if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_ONLY_TRANSFERABLE:
+            return _result
+        if code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_MALFORMED:
+            return _result
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> RevokeSponsorshipResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> RevokeSponsorshipResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -100,11 +178,11 @@ class RevokeSponsorshipResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> RevokeSponsorshipResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_SUCCESS:
@@ -140,6 +218,43 @@ class RevokeSponsorshipResult:
         code = RevokeSponsorshipResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_SUCCESS:
+            write('"success"')
+            return
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_DOES_NOT_EXIST:
+            write('"does_not_exist"')
+            return
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_NOT_SPONSOR:
+            write('"not_sponsor"')
+            return
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        if (
+            self.code
+            == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_ONLY_TRANSFERABLE
+        ):
+            write('"only_transferable"')
+            return
+        if self.code == RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_MALFORMED:
+            write('"malformed"')
+            return
+        raise ValueError(f"Unknown code in RevokeSponsorshipResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> RevokeSponsorshipResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> RevokeSponsorshipResult:
+        return self.clone()
+
+    def freeze(self) -> RevokeSponsorshipResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -152,3 +267,19 @@ class RevokeSponsorshipResult:
         out = []
         out.append(f"code={self.code}")
         return f"<RevokeSponsorshipResult [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, code, unpacker: Unpacker, depth_limit: int
+) -> RevokeSponsorshipResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_SUCCESS: _unpack_void,
+    RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_DOES_NOT_EXIST: _unpack_void,
+    RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_NOT_SPONSOR: _unpack_void,
+    RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_LOW_RESERVE: _unpack_void,
+    RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_ONLY_TRANSFERABLE: _unpack_void,
+    RevokeSponsorshipResultCode.REVOKE_SPONSORSHIP_MALFORMED: _unpack_void,
+}
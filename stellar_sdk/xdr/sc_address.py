@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .claimable_balance_id import ClaimableBalanceID
 from .contract_id import ContractID
 from .muxed_ed25519_account import MuxedEd25519Account
@@ -37,6 +48,15 @@ class SCAddress:
         };
     """
 
+    __slots__ = (
+        "account_id",
+        "claimable_balance_id",
+        "contract_id",
+        "liquidity_pool_id",
+        "muxed_account",
+        "type",
+    )
+
     def __init__(
         self,
         type: SCAddressType,
@@ -82,40 +102,129 @@ class SCAddress:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SCAddressType.SC_ADDRESS_TYPE_ACCOUNT:
+            assert self.account_id is not None
+            return 4 + self.account_id.xdr_size()
+        if self.type == SCAddressType.SC_ADDRESS_TYPE_CONTRACT:
+            return 36
+        if self.type == SCAddressType.SC_ADDRESS_TYPE_MUXED_ACCOUNT:
+            return 44
+        if self.type == SCAddressType.SC_ADDRESS_TYPE_CLAIMABLE_BALANCE:
+            assert self.claimable_balance_id is not None
+            return 4 + self.claimable_balance_id.xdr_size()
+        if self.type == SCAddressType.SC_ADDRESS_TYPE_LIQUIDITY_POOL:
+            return 36
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCAddress:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SCAddressType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SCAddressType.unpack(unpacker)
         if type == SCAddressType.SC_ADDRESS_TYPE_ACCOUNT:
-            account_id = AccountID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, account_id=account_id)
+            AccountID.skip(unpacker, depth_limit - 1)
+            return
         if type == SCAddressType.SC_ADDRESS_TYPE_CONTRACT:
-            contract_id = ContractID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, contract_id=contract_id)
+            ContractID.skip(unpacker, depth_limit - 1)
+            return
         if type == SCAddressType.SC_ADDRESS_TYPE_MUXED_ACCOUNT:
-            muxed_account = MuxedEd25519Account.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, muxed_account=muxed_account)
+            MuxedEd25519Account.skip(unpacker, depth_limit - 1)
+            return
         if type == SCAddressType.SC_ADDRESS_TYPE_CLAIMABLE_BALANCE:
-            claimable_balance_id = ClaimableBalanceID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, claimable_balance_id=claimable_balance_id)
+            ClaimableBalanceID.skip(unpacker, depth_limit - 1)
+            return
         if type == SCAddressType.SC_ADDRESS_TYPE_LIQUIDITY_POOL:
-            liquidity_pool_id = PoolID.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, liquidity_pool_id=liquidity_pool_id)
+            PoolID.skip(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCAddress:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SCAddressType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SCAddressType.SC_ADDRESS_TYPE_ACCOUNT:
+            if "account_id" in fields:
+                _result["account_id"] = AccountID.unpack_fields(
+                    unpacker, fields["account_id"], depth_limit - 1
+                )
+            else:
+                AccountID.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCAddressType.SC_ADDRESS_TYPE_CONTRACT:
+            if "contract_id" in fields:
+                _result["contract_id"] = ContractID.unpack_fields(
+                    unpacker, fields["contract_id"], depth_limit - 1
+                )
+            else:
+                ContractID.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCAddressType.SC_ADDRESS_TYPE_MUXED_ACCOUNT:
+            if "muxed_account" in fields:
+                _result["muxed_account"] = MuxedEd25519Account.unpack_fields(
+                    unpacker, fields["muxed_account"], depth_limit - 1
+                )
+            else:
+                MuxedEd25519Account.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCAddressType.SC_ADDRESS_TYPE_CLAIMABLE_BALANCE:
+            if "claimable_balance_id" in fields:
+                _result["claimable_balance_id"] = ClaimableBalanceID.unpack_fields(
+                    unpacker, fields["claimable_balance_id"], depth_limit - 1
+                )
+            else:
+                ClaimableBalanceID.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCAddressType.SC_ADDRESS_TYPE_LIQUIDITY_POOL:
+            if "liquidity_pool_id" in fields:
+                _result["liquidity_pool_id"] = PoolID.unpack_fields(
+                    unpacker, fields["liquidity_pool_id"], depth_limit - 1
+                )
+            else:
+                PoolID.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCAddress:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCAddress:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -130,11 +239,11 @@ class SCAddress:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCAddress:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         from ..strkey import StrKey
@@ -214,6 +323,41 @@ class SCAddress:
             )
         raise ValueError(f"Invalid SCAddress strkey: {json_value}")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> SCAddress:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.account_id = (
+            self.account_id.clone() if self.account_id is not None else None
+        )
+        result.contract_id = (
+            self.contract_id.clone() if self.contract_id is not None else None
+        )
+        result.muxed_account = (
+            self.muxed_account.clone() if self.muxed_account is not None else None
+        )
+        result.claimable_balance_id = (
+            self.claimable_balance_id.clone()
+            if self.claimable_balance_id is not None
+            else None
+        )
+        result.liquidity_pool_id = (
+            self.liquidity_pool_id.clone()
+            if self.liquidity_pool_id is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCAddress:
+        return self.clone()
+
+    def freeze(self) -> SCAddress:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -252,3 +396,41 @@ class SCAddress:
         if self.liquidity_pool_id is not None:
             out.append(f"liquidity_pool_id={self.liquidity_pool_id}")
         return f"<SCAddress [{', '.join(out)}]>"
+
+
+def _unpack_account_id(cls, type, unpacker: Unpacker, depth_limit: int) -> SCAddress:
+    account_id = AccountID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, account_id=account_id)
+
+
+def _unpack_contract_id(cls, type, unpacker: Unpacker, depth_limit: int) -> SCAddress:
+    contract_id = ContractID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, contract_id=contract_id)
+
+
+def _unpack_muxed_account(cls, type, unpacker: Unpacker, depth_limit: int) -> SCAddress:
+    muxed_account = MuxedEd25519Account.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, muxed_account=muxed_account)
+
+
+def _unpack_claimable_balance_id(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SCAddress:
+    claimable_balance_id = ClaimableBalanceID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, claimable_balance_id=claimable_balance_id)
+
+
+def _unpack_liquidity_pool_id(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SCAddress:
+    liquidity_pool_id = PoolID.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, liquidity_pool_id=liquidity_pool_id)
+
+
+_UNPACK_ARMS = {
+    SCAddressType.SC_ADDRESS_TYPE_ACCOUNT: _unpack_account_id,
+    SCAddressType.SC_ADDRESS_TYPE_CONTRACT: _unpack_contract_id,
+    SCAddressType.SC_ADDRESS_TYPE_MUXED_ACCOUNT: _unpack_muxed_account,
+    SCAddressType.SC_ADDRESS_TYPE_CLAIMABLE_BALANCE: _unpack_claimable_balance_id,
+    SCAddressType.SC_ADDRESS_TYPE_LIQUIDITY_POOL: _unpack_liquidity_pool_id,
+}
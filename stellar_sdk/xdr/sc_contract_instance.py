@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .contract_executable import ContractExecutable
 from .sc_map import SCMap
 
@@ -24,6 +37,8 @@ class SCContractInstance:
         };
     """
 
+    __slots__ = ("executable", "storage")
+
     def __init__(
         self,
         executable: ContractExecutable,
@@ -40,6 +55,13 @@ class SCContractInstance:
             packer.pack_uint(1)
             self.storage.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.executable.xdr_size()
+            + 4
+            + (self.storage.xdr_size() if self.storage is not None else 0)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -55,16 +77,78 @@ class SCContractInstance:
             storage=storage,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ContractExecutable.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            SCMap.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCContractInstance:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "executable" in fields:
+            _result["executable"] = ContractExecutable.unpack_fields(
+                unpacker, fields["executable"], depth_limit - 1
+            )
+        else:
+            ContractExecutable.skip(unpacker, depth_limit - 1)
+        if "storage" in fields:
+            _result["storage"] = (
+                SCMap.unpack_fields(unpacker, fields["storage"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                SCMap.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "executable", ContractExecutable.unpack(unpacker, depth_limit - 1)
+        yield (
+            "storage",
+            view_at(SCMap, unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCContractInstance:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCContractInstance:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -79,11 +163,11 @@ class SCContractInstance:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCContractInstance:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -106,6 +190,30 @@ class SCContractInstance:
             storage=storage,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"executable": ')
+        self.executable._write_json(write)
+        write(', "storage": ')
+        if self.storage is None:
+            write("null")
+        else:
+            self.storage._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCContractInstance:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.executable = self.executable.clone()
+        result.storage = self.storage.clone() if self.storage is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCContractInstance:
+        return self.clone()
+
+    def freeze(self) -> SCContractInstance:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .sc_env_meta_entry_interface_version import SCEnvMetaEntryInterfaceVersion
 from .sc_env_meta_kind import SCEnvMetaKind
 
@@ -28,6 +38,8 @@ class SCEnvMetaEntry:
         };
     """
 
+    __slots__ = ("interface_version", "kind")
+
     def __init__(
         self,
         kind: SCEnvMetaKind,
@@ -45,30 +57,77 @@ class SCEnvMetaEntry:
             return
         raise ValueError("Invalid kind.")
 
+    def xdr_size(self) -> int:
+        if self.kind == SCEnvMetaKind.SC_ENV_META_KIND_INTERFACE_VERSION:
+            return 12
+        raise ValueError("Invalid kind.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCEnvMetaEntry:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        kind = SCEnvMetaKind.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(kind)
+        if unpack_arm is None:
+            raise ValueError("Invalid kind.")
+        return unpack_arm(cls, kind, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         kind = SCEnvMetaKind.unpack(unpacker)
         if kind == SCEnvMetaKind.SC_ENV_META_KIND_INTERFACE_VERSION:
-            interface_version = SCEnvMetaEntryInterfaceVersion.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(kind=kind, interface_version=interface_version)
+            SCEnvMetaEntryInterfaceVersion.skip(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid kind.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCEnvMetaEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        kind = SCEnvMetaKind.unpack(unpacker)
+        if "kind" in fields:
+            _result["kind"] = kind
+        if kind == SCEnvMetaKind.SC_ENV_META_KIND_INTERFACE_VERSION:
+            if "interface_version" in fields:
+                _result["interface_version"] = (
+                    SCEnvMetaEntryInterfaceVersion.unpack_fields(
+                        unpacker, fields["interface_version"], depth_limit - 1
+                    )
+                )
+            else:
+                SCEnvMetaEntryInterfaceVersion.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid kind.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCEnvMetaEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCEnvMetaEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +142,11 @@ class SCEnvMetaEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCEnvMetaEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.kind == SCEnvMetaKind.SC_ENV_META_KIND_INTERFACE_VERSION:
@@ -112,6 +171,33 @@ class SCEnvMetaEntry:
             return cls(kind=kind, interface_version=interface_version)
         raise ValueError(f"Unknown key '{key}' for SCEnvMetaEntry")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.kind == SCEnvMetaKind.SC_ENV_META_KIND_INTERFACE_VERSION:
+            assert self.interface_version is not None
+            write('{"sc_env_meta_kind_interface_version": ')
+            self.interface_version._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown kind in SCEnvMetaEntry: {self.kind}")
+
+    def clone(self, deep: bool = True) -> SCEnvMetaEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.kind = self.kind
+        result.interface_version = (
+            self.interface_version.clone()
+            if self.interface_version is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCEnvMetaEntry:
+        return self.clone()
+
+    def freeze(self) -> SCEnvMetaEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -134,3 +220,15 @@ class SCEnvMetaEntry:
         if self.interface_version is not None:
             out.append(f"interface_version={self.interface_version}")
         return f"<SCEnvMetaEntry [{', '.join(out)}]>"
+
+
+def _unpack_interface_version(
+    cls, kind, unpacker: Unpacker, depth_limit: int
+) -> SCEnvMetaEntry:
+    interface_version = SCEnvMetaEntryInterfaceVersion.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, interface_version=interface_version)
+
+
+_UNPACK_ARMS = {
+    SCEnvMetaKind.SC_ENV_META_KIND_INTERFACE_VERSION: _unpack_interface_version,
+}
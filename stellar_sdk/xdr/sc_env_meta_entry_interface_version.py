@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">II")
 __all__ = ["SCEnvMetaEntryInterfaceVersion"]
 
 
@@ -23,6 +35,8 @@ class SCEnvMetaEntryInterfaceVersion:
             }
     """
 
+    __slots__ = ("pre_release", "protocol")
+
     def __init__(
         self,
         protocol: Uint32,
@@ -32,8 +46,10 @@ class SCEnvMetaEntryInterfaceVersion:
         self.pre_release = pre_release
 
     def pack(self, packer: Packer) -> None:
-        self.protocol.pack(packer)
-        self.pre_release.pack(packer)
+        _LAYOUT.write(packer, self.protocol.uint32, self.pre_release.uint32)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -41,23 +57,63 @@ class SCEnvMetaEntryInterfaceVersion:
     ) -> SCEnvMetaEntryInterfaceVersion:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        protocol = Uint32.unpack(unpacker, depth_limit - 1)
-        pre_release = Uint32.unpack(unpacker, depth_limit - 1)
+        protocol, pre_release = _LAYOUT.read(unpacker)
         return cls(
-            protocol=protocol,
-            pre_release=pre_release,
+            protocol=Uint32(protocol),
+            pre_release=Uint32(pre_release),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCEnvMetaEntryInterfaceVersion:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "protocol" in fields:
+            _result["protocol"] = Uint32.unpack_fields(
+                unpacker, fields["protocol"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "pre_release" in fields:
+            _result["pre_release"] = Uint32.unpack_fields(
+                unpacker, fields["pre_release"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCEnvMetaEntryInterfaceVersion:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCEnvMetaEntryInterfaceVersion:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -72,11 +128,11 @@ class SCEnvMetaEntryInterfaceVersion:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCEnvMetaEntryInterfaceVersion:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -93,6 +149,27 @@ class SCEnvMetaEntryInterfaceVersion:
             pre_release=pre_release,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"protocol": ')
+        self.protocol._write_json(write)
+        write(', "pre_release": ')
+        self.pre_release._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCEnvMetaEntryInterfaceVersion:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.protocol = self.protocol.clone()
+        result.pre_release = self.pre_release.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCEnvMetaEntryInterfaceVersion:
+        return self.clone()
+
+    def freeze(self) -> SCEnvMetaEntryInterfaceVersion:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .sc_error_code import SCErrorCode
 from .sc_error_type import SCErrorType
 from .uint32 import Uint32
@@ -36,6 +46,8 @@ class SCError:
         };
     """
 
+    __slots__ = ("code", "contract_code", "type")
+
     def __init__(
         self,
         type: SCErrorType,
@@ -100,55 +112,174 @@ class SCError:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SCErrorType.SCE_CONTRACT:
+            return 8
+        if self.type == SCErrorType.SCE_WASM_VM:
+            return 8
+        if self.type == SCErrorType.SCE_CONTEXT:
+            return 8
+        if self.type == SCErrorType.SCE_STORAGE:
+            return 8
+        if self.type == SCErrorType.SCE_OBJECT:
+            return 8
+        if self.type == SCErrorType.SCE_CRYPTO:
+            return 8
+        if self.type == SCErrorType.SCE_EVENTS:
+            return 8
+        if self.type == SCErrorType.SCE_BUDGET:
+            return 8
+        if self.type == SCErrorType.SCE_VALUE:
+            return 8
+        if self.type == SCErrorType.SCE_AUTH:
+            return 8
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCError:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SCErrorType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SCErrorType.unpack(unpacker)
         if type == SCErrorType.SCE_CONTRACT:
-            contract_code = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, contract_code=contract_code)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == SCErrorType.SCE_WASM_VM:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_CONTEXT:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_STORAGE:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_OBJECT:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_CRYPTO:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_EVENTS:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_BUDGET:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_VALUE:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         if type == SCErrorType.SCE_AUTH:
-            code = SCErrorCode.unpack(unpacker)
-            return cls(type=type, code=code)
+            SCErrorCode.skip(unpacker)
+            return
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCError:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SCErrorType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SCErrorType.SCE_CONTRACT:
+            if "contract_code" in fields:
+                _result["contract_code"] = Uint32.unpack_fields(
+                    unpacker, fields["contract_code"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCErrorType.SCE_WASM_VM:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_CONTEXT:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_STORAGE:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_OBJECT:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_CRYPTO:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_EVENTS:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_BUDGET:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_VALUE:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        if type == SCErrorType.SCE_AUTH:
+            if "code" in fields:
+                _result["code"] = SCErrorCode.unpack_fields(unpacker, fields["code"])
+            else:
+                SCErrorCode.skip(unpacker)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCError:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCError:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -163,11 +294,11 @@ class SCError:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCError:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == SCErrorType.SCE_CONTRACT:
@@ -242,6 +373,86 @@ class SCError:
             return cls(type=type, code=code)
         raise ValueError(f"Unknown key '{key}' for SCError")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == SCErrorType.SCE_CONTRACT:
+            assert self.contract_code is not None
+            write('{"contract": ')
+            self.contract_code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_WASM_VM:
+            assert self.code is not None
+            write('{"wasm_vm": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_CONTEXT:
+            assert self.code is not None
+            write('{"context": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_STORAGE:
+            assert self.code is not None
+            write('{"storage": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_OBJECT:
+            assert self.code is not None
+            write('{"object": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_CRYPTO:
+            assert self.code is not None
+            write('{"crypto": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_EVENTS:
+            assert self.code is not None
+            write('{"events": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_BUDGET:
+            assert self.code is not None
+            write('{"budget": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_VALUE:
+            assert self.code is not None
+            write('{"value": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        if self.type == SCErrorType.SCE_AUTH:
+            assert self.code is not None
+            write('{"auth": ')
+            self.code._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SCError: {self.type}")
+
+    def clone(self, deep: bool = True) -> SCError:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.contract_code = (
+            self.contract_code.clone() if self.contract_code is not None else None
+        )
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCError:
+        return self.clone()
+
+    def freeze(self) -> SCError:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -268,3 +479,27 @@ class SCError:
         if self.code is not None:
             out.append(f"code={self.code}")
         return f"<SCError [{', '.join(out)}]>"
+
+
+def _unpack_contract_code(cls, type, unpacker: Unpacker, depth_limit: int) -> SCError:
+    contract_code = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, contract_code=contract_code)
+
+
+def _unpack_code(cls, type, unpacker: Unpacker, depth_limit: int) -> SCError:
+    code = SCErrorCode.unpack(unpacker)
+    return cls(type=type, code=code)
+
+
+_UNPACK_ARMS = {
+    SCErrorType.SCE_CONTRACT: _unpack_contract_code,
+    SCErrorType.SCE_WASM_VM: _unpack_code,
+    SCErrorType.SCE_CONTEXT: _unpack_code,
+    SCErrorType.SCE_STORAGE: _unpack_code,
+    SCErrorType.SCE_OBJECT: _unpack_code,
+    SCErrorType.SCE_CRYPTO: _unpack_code,
+    SCErrorType.SCE_EVENTS: _unpack_code,
+    SCErrorType.SCE_BUDGET: _unpack_code,
+    SCErrorType.SCE_VALUE: _unpack_code,
+    SCErrorType.SCE_AUTH: _unpack_code,
+}
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .sc_map_entry import SCMapEntry
 
 __all__ = ["SCMap"]
@@ -20,6 +34,8 @@ class SCMap:
         typedef SCMapEntry SCMap<>;
     """
 
+    __slots__ = ("sc_map",)
+
     def __init__(self, sc_map: list[SCMapEntry]) -> None:
         _expect_max_length = 4294967295
         if sc_map and len(sc_map) > _expect_max_length:
@@ -33,6 +49,9 @@ class SCMap:
         for sc_map_item in self.sc_map:
             sc_map_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.sc_map)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +69,92 @@ class SCMap:
             sc_map.append(SCMapEntry.unpack(unpacker, depth_limit - 1))
         return cls(sc_map)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"sc_map length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCMapEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCMap:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sc_map" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"sc_map length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["sc_map"] = []
+            for _ in range(length):
+                _result["sc_map"].append(
+                    SCMapEntry.unpack_fields(
+                        unpacker, fields["sc_map"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"sc_map length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCMapEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"sc_map length {length} exceeds remaining input length {_remaining}"
+            )
+        sc_map = []
+        for _ in range(length):
+            sc_map.append(unpack_view(SCMapEntry, unpacker, depth_limit - 1))
+        yield "sc_map", sc_map
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCMap:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCMap:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +169,11 @@ class SCMap:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCMap:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.sc_map]
@@ -87,6 +182,22 @@ class SCMap:
     def from_json_dict(cls, json_value: list) -> SCMap:
         return cls([SCMapEntry.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.sc_map)
+
+    def clone(self, deep: bool = True) -> SCMap:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sc_map = [item.clone() for item in self.sc_map]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCMap:
+        return self.clone()
+
+    def freeze(self) -> SCMap:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.sc_map,))
 
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_val import SCVal
 
 __all__ = ["SCMapEntry"]
@@ -24,6 +37,8 @@ class SCMapEntry:
         };
     """
 
+    __slots__ = ("key", "val")
+
     def __init__(
         self,
         key: SCVal,
@@ -36,6 +51,9 @@ class SCMapEntry:
         self.key.pack(packer)
         self.val.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.key.xdr_size() + self.val.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -49,16 +67,69 @@ class SCMapEntry:
             val=val,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCVal.skip(unpacker, depth_limit - 1)
+        SCVal.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCMapEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "key" in fields:
+            _result["key"] = SCVal.unpack_fields(
+                unpacker, fields["key"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        if "val" in fields:
+            _result["val"] = SCVal.unpack_fields(
+                unpacker, fields["val"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        key = view_at(SCVal, unpacker, depth_limit - 1)
+        yield "key", key
+        SCVal.skip(unpacker, depth_limit - 1)
+        yield "val", view_at(SCVal, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCMapEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCMapEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +144,11 @@ class SCMapEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCMapEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +165,27 @@ class SCMapEntry:
             val=val,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"key": ')
+        self.key._write_json(write)
+        write(', "val": ')
+        self.val._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCMapEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.key = self.key.clone()
+        result.val = self.val.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCMapEntry:
+        return self.clone()
+
+    def freeze(self) -> SCMapEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .sc_meta_kind import SCMetaKind
 from .sc_meta_v0 import SCMetaV0
 
@@ -25,6 +35,8 @@ class SCMetaEntry:
         };
     """
 
+    __slots__ = ("kind", "v0")
+
     def __init__(
         self,
         kind: SCMetaKind,
@@ -42,28 +54,76 @@ class SCMetaEntry:
             return
         raise ValueError("Invalid kind.")
 
+    def xdr_size(self) -> int:
+        if self.kind == SCMetaKind.SC_META_V0:
+            assert self.v0 is not None
+            return 4 + self.v0.xdr_size()
+        raise ValueError("Invalid kind.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCMetaEntry:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        kind = SCMetaKind.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(kind)
+        if unpack_arm is None:
+            raise ValueError("Invalid kind.")
+        return unpack_arm(cls, kind, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         kind = SCMetaKind.unpack(unpacker)
         if kind == SCMetaKind.SC_META_V0:
-            v0 = SCMetaV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, v0=v0)
+            SCMetaV0.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid kind.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCMetaEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        kind = SCMetaKind.unpack(unpacker)
+        if "kind" in fields:
+            _result["kind"] = kind
+        if kind == SCMetaKind.SC_META_V0:
+            if "v0" in fields:
+                _result["v0"] = SCMetaV0.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                SCMetaV0.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid kind.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCMetaEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCMetaEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +138,11 @@ class SCMetaEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCMetaEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.kind == SCMetaKind.SC_META_V0:
@@ -103,6 +163,29 @@ class SCMetaEntry:
             return cls(kind=kind, v0=v0)
         raise ValueError(f"Unknown key '{key}' for SCMetaEntry")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.kind == SCMetaKind.SC_META_V0:
+            assert self.v0 is not None
+            write('{"sc_meta_v0": ')
+            self.v0._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown kind in SCMetaEntry: {self.kind}")
+
+    def clone(self, deep: bool = True) -> SCMetaEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.kind = self.kind
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCMetaEntry:
+        return self.clone()
+
+    def freeze(self) -> SCMetaEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -122,3 +205,13 @@ class SCMetaEntry:
         if self.v0 is not None:
             out.append(f"v0={self.v0}")
         return f"<SCMetaEntry [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, kind, unpacker: Unpacker, depth_limit: int) -> SCMetaEntry:
+    v0 = SCMetaV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, v0=v0)
+
+
+_UNPACK_ARMS = {
+    SCMetaKind.SC_META_V0: _unpack_v0,
+}
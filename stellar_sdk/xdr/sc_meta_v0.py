@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["SCMetaV0"]
 
@@ -23,6 +35,8 @@ class SCMetaV0:
         };
     """
 
+    __slots__ = ("key", "val")
+
     def __init__(
         self,
         key: bytes,
@@ -45,6 +59,9 @@ class SCMetaV0:
         String(self.key, 4294967295).pack(packer)
         String(self.val, 4294967295).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.key) + 3) // 4 * 4 + 4 + (len(self.val) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -58,16 +75,52 @@ class SCMetaV0:
             val=val,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, 4294967295)
+        String.skip(unpacker, 4294967295)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCMetaV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "key" in fields:
+            _result["key"] = String.unpack_fields(unpacker, fields["key"], 4294967295)
+        else:
+            String.skip(unpacker, 4294967295)
+        if "val" in fields:
+            _result["val"] = String.unpack_fields(unpacker, fields["val"], 4294967295)
+        else:
+            String.skip(unpacker, 4294967295)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCMetaV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCMetaV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +135,11 @@ class SCMetaV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCMetaV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -103,6 +156,27 @@ class SCMetaV0:
             val=val,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"key": ')
+        write(json_encode(String.to_json_dict(self.key)))
+        write(', "val": ')
+        write(json_encode(String.to_json_dict(self.val)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCMetaV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.key = self.key
+        result.val = self.val
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCMetaV0:
+        return self.clone()
+
+    def freeze(self) -> SCMetaV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
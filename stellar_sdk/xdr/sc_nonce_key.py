@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
+_LAYOUT = FixedLayout(">q")
 __all__ = ["SCNonceKey"]
 
 
@@ -22,6 +34,8 @@ class SCNonceKey:
         };
     """
 
+    __slots__ = ("nonce",)
+
     def __init__(
         self,
         nonce: Int64,
@@ -29,7 +43,10 @@ class SCNonceKey:
         self.nonce = nonce
 
     def pack(self, packer: Packer) -> None:
-        self.nonce.pack(packer)
+        _LAYOUT.write(packer, self.nonce.int64)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -37,21 +54,54 @@ class SCNonceKey:
     ) -> SCNonceKey:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        nonce = Int64.unpack(unpacker, depth_limit - 1)
+        (nonce,) = _LAYOUT.read(unpacker)
         return cls(
-            nonce=nonce,
+            nonce=Int64(nonce),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCNonceKey:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "nonce" in fields:
+            _result["nonce"] = Int64.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCNonceKey:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCNonceKey:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -66,11 +116,11 @@ class SCNonceKey:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCNonceKey:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -84,6 +134,24 @@ class SCNonceKey:
             nonce=nonce,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"nonce": ')
+        self.nonce._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCNonceKey:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.nonce = self.nonce.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCNonceKey:
+        return self.clone()
+
+    def freeze(self) -> SCNonceKey:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.nonce,))
 
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_spec_entry_kind import SCSpecEntryKind
 from .sc_spec_event_v0 import SCSpecEventV0
 from .sc_spec_function_v0 import SCSpecFunctionV0
@@ -40,6 +53,16 @@ class SCSpecEntry:
         };
     """
 
+    __slots__ = (
+        "event_v0",
+        "function_v0",
+        "kind",
+        "udt_enum_v0",
+        "udt_error_enum_v0",
+        "udt_struct_v0",
+        "udt_union_v0",
+    )
+
     def __init__(
         self,
         kind: SCSpecEntryKind,
@@ -92,31 +115,167 @@ class SCSpecEntry:
             return
         raise ValueError("Invalid kind.")
 
+    def xdr_size(self) -> int:
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0:
+            assert self.function_v0 is not None
+            return 4 + self.function_v0.xdr_size()
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+            assert self.udt_struct_v0 is not None
+            return 4 + self.udt_struct_v0.xdr_size()
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+            assert self.udt_union_v0 is not None
+            return 4 + self.udt_union_v0.xdr_size()
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+            assert self.udt_enum_v0 is not None
+            return 4 + self.udt_enum_v0.xdr_size()
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
+            assert self.udt_error_enum_v0 is not None
+            return 4 + self.udt_error_enum_v0.xdr_size()
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0:
+            assert self.event_v0 is not None
+            return 4 + self.event_v0.xdr_size()
+        raise ValueError("Invalid kind.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCSpecEntry:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        kind = SCSpecEntryKind.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(kind)
+        if unpack_arm is None:
+            raise ValueError("Invalid kind.")
+        return unpack_arm(cls, kind, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         kind = SCSpecEntryKind.unpack(unpacker)
         if kind == SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0:
-            function_v0 = SCSpecFunctionV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, function_v0=function_v0)
+            SCSpecFunctionV0.skip(unpacker, depth_limit - 1)
+            return
         if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
-            udt_struct_v0 = SCSpecUDTStructV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, udt_struct_v0=udt_struct_v0)
+            SCSpecUDTStructV0.skip(unpacker, depth_limit - 1)
+            return
         if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
-            udt_union_v0 = SCSpecUDTUnionV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, udt_union_v0=udt_union_v0)
+            SCSpecUDTUnionV0.skip(unpacker, depth_limit - 1)
+            return
         if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
-            udt_enum_v0 = SCSpecUDTEnumV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, udt_enum_v0=udt_enum_v0)
+            SCSpecUDTEnumV0.skip(unpacker, depth_limit - 1)
+            return
         if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
-            udt_error_enum_v0 = SCSpecUDTErrorEnumV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, udt_error_enum_v0=udt_error_enum_v0)
+            SCSpecUDTErrorEnumV0.skip(unpacker, depth_limit - 1)
+            return
         if kind == SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0:
-            event_v0 = SCSpecEventV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, event_v0=event_v0)
+            SCSpecEventV0.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid kind.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        kind = SCSpecEntryKind.unpack(unpacker)
+        if "kind" in fields:
+            _result["kind"] = kind
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0:
+            if "function_v0" in fields:
+                _result["function_v0"] = SCSpecFunctionV0.unpack_fields(
+                    unpacker, fields["function_v0"], depth_limit - 1
+                )
+            else:
+                SCSpecFunctionV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+            if "udt_struct_v0" in fields:
+                _result["udt_struct_v0"] = SCSpecUDTStructV0.unpack_fields(
+                    unpacker, fields["udt_struct_v0"], depth_limit - 1
+                )
+            else:
+                SCSpecUDTStructV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+            if "udt_union_v0" in fields:
+                _result["udt_union_v0"] = SCSpecUDTUnionV0.unpack_fields(
+                    unpacker, fields["udt_union_v0"], depth_limit - 1
+                )
+            else:
+                SCSpecUDTUnionV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+            if "udt_enum_v0" in fields:
+                _result["udt_enum_v0"] = SCSpecUDTEnumV0.unpack_fields(
+                    unpacker, fields["udt_enum_v0"], depth_limit - 1
+                )
+            else:
+                SCSpecUDTEnumV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
+            if "udt_error_enum_v0" in fields:
+                _result["udt_error_enum_v0"] = SCSpecUDTErrorEnumV0.unpack_fields(
+                    unpacker, fields["udt_error_enum_v0"], depth_limit - 1
+                )
+            else:
+                SCSpecUDTErrorEnumV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0:
+            if "event_v0" in fields:
+                _result["event_v0"] = SCSpecEventV0.unpack_fields(
+                    unpacker, fields["event_v0"], depth_limit - 1
+                )
+            else:
+                SCSpecEventV0.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid kind.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        kind = SCSpecEntryKind.unpack(unpacker)
+        yield "kind", kind
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0:
+            yield "function_v0", view_at(SCSpecFunctionV0, unpacker, depth_limit - 1)
+            return
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+            yield "udt_struct_v0", view_at(SCSpecUDTStructV0, unpacker, depth_limit - 1)
+            return
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+            yield "udt_union_v0", view_at(SCSpecUDTUnionV0, unpacker, depth_limit - 1)
+            return
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+            yield "udt_enum_v0", view_at(SCSpecUDTEnumV0, unpacker, depth_limit - 1)
+            return
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
+            yield (
+                "udt_error_enum_v0",
+                view_at(SCSpecUDTErrorEnumV0, unpacker, depth_limit - 1),
+            )
+            return
+        if kind == SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0:
+            yield "event_v0", view_at(SCSpecEventV0, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid kind.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -125,10 +284,10 @@ class SCSpecEntry:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSpecEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -143,11 +302,11 @@ class SCSpecEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0:
@@ -202,6 +361,76 @@ class SCSpecEntry:
             return cls(kind=kind, event_v0=event_v0)
         raise ValueError(f"Unknown key '{key}' for SCSpecEntry")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0:
+            assert self.function_v0 is not None
+            write('{"function_v0": ')
+            self.function_v0._write_json(write)
+            write("}")
+            return
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0:
+            assert self.udt_struct_v0 is not None
+            write('{"udt_struct_v0": ')
+            self.udt_struct_v0._write_json(write)
+            write("}")
+            return
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0:
+            assert self.udt_union_v0 is not None
+            write('{"udt_union_v0": ')
+            self.udt_union_v0._write_json(write)
+            write("}")
+            return
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0:
+            assert self.udt_enum_v0 is not None
+            write('{"udt_enum_v0": ')
+            self.udt_enum_v0._write_json(write)
+            write("}")
+            return
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0:
+            assert self.udt_error_enum_v0 is not None
+            write('{"udt_error_enum_v0": ')
+            self.udt_error_enum_v0._write_json(write)
+            write("}")
+            return
+        if self.kind == SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0:
+            assert self.event_v0 is not None
+            write('{"event_v0": ')
+            self.event_v0._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown kind in SCSpecEntry: {self.kind}")
+
+    def clone(self, deep: bool = True) -> SCSpecEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.kind = self.kind
+        result.function_v0 = (
+            self.function_v0.clone() if self.function_v0 is not None else None
+        )
+        result.udt_struct_v0 = (
+            self.udt_struct_v0.clone() if self.udt_struct_v0 is not None else None
+        )
+        result.udt_union_v0 = (
+            self.udt_union_v0.clone() if self.udt_union_v0 is not None else None
+        )
+        result.udt_enum_v0 = (
+            self.udt_enum_v0.clone() if self.udt_enum_v0 is not None else None
+        )
+        result.udt_error_enum_v0 = (
+            self.udt_error_enum_v0.clone()
+            if self.udt_error_enum_v0 is not None
+            else None
+        )
+        result.event_v0 = self.event_v0.clone() if self.event_v0 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecEntry:
+        return self.clone()
+
+    def freeze(self) -> SCSpecEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -244,3 +473,49 @@ class SCSpecEntry:
         if self.event_v0 is not None:
             out.append(f"event_v0={self.event_v0}")
         return f"<SCSpecEntry [{', '.join(out)}]>"
+
+
+def _unpack_function_v0(cls, kind, unpacker: Unpacker, depth_limit: int) -> SCSpecEntry:
+    function_v0 = SCSpecFunctionV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, function_v0=function_v0)
+
+
+def _unpack_udt_struct_v0(
+    cls, kind, unpacker: Unpacker, depth_limit: int
+) -> SCSpecEntry:
+    udt_struct_v0 = SCSpecUDTStructV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, udt_struct_v0=udt_struct_v0)
+
+
+def _unpack_udt_union_v0(
+    cls, kind, unpacker: Unpacker, depth_limit: int
+) -> SCSpecEntry:
+    udt_union_v0 = SCSpecUDTUnionV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, udt_union_v0=udt_union_v0)
+
+
+def _unpack_udt_enum_v0(cls, kind, unpacker: Unpacker, depth_limit: int) -> SCSpecEntry:
+    udt_enum_v0 = SCSpecUDTEnumV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, udt_enum_v0=udt_enum_v0)
+
+
+def _unpack_udt_error_enum_v0(
+    cls, kind, unpacker: Unpacker, depth_limit: int
+) -> SCSpecEntry:
+    udt_error_enum_v0 = SCSpecUDTErrorEnumV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, udt_error_enum_v0=udt_error_enum_v0)
+
+
+def _unpack_event_v0(cls, kind, unpacker: Unpacker, depth_limit: int) -> SCSpecEntry:
+    event_v0 = SCSpecEventV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, event_v0=event_v0)
+
+
+_UNPACK_ARMS = {
+    SCSpecEntryKind.SC_SPEC_ENTRY_FUNCTION_V0: _unpack_function_v0,
+    SCSpecEntryKind.SC_SPEC_ENTRY_UDT_STRUCT_V0: _unpack_udt_struct_v0,
+    SCSpecEntryKind.SC_SPEC_ENTRY_UDT_UNION_V0: _unpack_udt_union_v0,
+    SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ENUM_V0: _unpack_udt_enum_v0,
+    SCSpecEntryKind.SC_SPEC_ENTRY_UDT_ERROR_ENUM_V0: _unpack_udt_error_enum_v0,
+    SCSpecEntryKind.SC_SPEC_ENTRY_EVENT_V0: _unpack_event_v0,
+}
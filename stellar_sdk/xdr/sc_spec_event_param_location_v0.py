@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _SC_SPEC_EVENT_PARAM_LOCATION_V0_MAP = {0: "data", 1: "topic_list"}
 _SC_SPEC_EVENT_PARAM_LOCATION_V0_REVERSE_MAP = {"data": 0, "topic_list": 1}
 __all__ = ["SCSpecEventParamLocationV0"]
@@ -30,10 +39,27 @@ class SCSpecEventParamLocationV0(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> SCSpecEventParamLocationV0:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid SCSpecEventParamLocationV0")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls, unpacker: Unpacker, fields: dict | None
+    ) -> SCSpecEventParamLocationV0:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -41,10 +67,12 @@ class SCSpecEventParamLocationV0(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecEventParamLocationV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecEventParamLocationV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -59,11 +87,11 @@ class SCSpecEventParamLocationV0(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecEventParamLocationV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _SC_SPEC_EVENT_PARAM_LOCATION_V0_MAP[self.value]
@@ -71,3 +99,15 @@ class SCSpecEventParamLocationV0(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> SCSpecEventParamLocationV0:
         return cls(_SC_SPEC_EVENT_PARAM_LOCATION_V0_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_SC_SPEC_EVENT_PARAM_LOCATION_V0_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> SCSpecEventParamLocationV0:
+        return self
+
+    def freeze(self) -> SCSpecEventParamLocationV0:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in SCSpecEventParamLocationV0}
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .constants import SC_SPEC_DOC_LIMIT
 from .sc_spec_event_param_location_v0 import SCSpecEventParamLocationV0
 from .sc_spec_type_def import SCSpecTypeDef
@@ -28,6 +43,8 @@ class SCSpecEventParamV0:
         };
     """
 
+    __slots__ = ("doc", "location", "name", "type")
+
     def __init__(
         self,
         doc: bytes,
@@ -56,6 +73,16 @@ class SCSpecEventParamV0:
         self.type.pack(packer)
         self.location.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + 4
+            + (len(self.doc) + 3) // 4 * 4
+            + 4
+            + (len(self.name) + 3) // 4 * 4
+            + self.type.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -73,16 +100,85 @@ class SCSpecEventParamV0:
             location=location,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        String.skip(unpacker, 30)
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        SCSpecEventParamLocationV0.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecEventParamV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "doc" in fields:
+            _result["doc"] = String.unpack_fields(
+                unpacker, fields["doc"], SC_SPEC_DOC_LIMIT
+            )
+        else:
+            String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        if "name" in fields:
+            _result["name"] = String.unpack_fields(unpacker, fields["name"], 30)
+        else:
+            String.skip(unpacker, 30)
+        if "type" in fields:
+            _result["type"] = SCSpecTypeDef.unpack_fields(
+                unpacker, fields["type"], depth_limit - 1
+            )
+        else:
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        if "location" in fields:
+            _result["location"] = SCSpecEventParamLocationV0.unpack_fields(
+                unpacker, fields["location"]
+            )
+        else:
+            SCSpecEventParamLocationV0.skip(unpacker)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "doc", String.unpack(unpacker, SC_SPEC_DOC_LIMIT)
+        yield "name", String.unpack(unpacker, 30)
+        type = view_at(SCSpecTypeDef, unpacker, depth_limit - 1)
+        yield "type", type
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        yield "location", SCSpecEventParamLocationV0.unpack(unpacker)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecEventParamV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecEventParamV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +193,11 @@ class SCSpecEventParamV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecEventParamV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -124,6 +220,33 @@ class SCSpecEventParamV0:
             location=location,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"doc": ')
+        write(json_encode(String.to_json_dict(self.doc)))
+        write(', "name": ')
+        write(json_encode(String.to_json_dict(self.name)))
+        write(', "type": ')
+        self.type._write_json(write)
+        write(', "location": ')
+        self.location._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecEventParamV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.doc = self.doc
+        result.name = self.name
+        result.type = self.type.clone()
+        result.location = self.location
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecEventParamV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecEventParamV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
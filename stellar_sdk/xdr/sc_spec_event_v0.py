@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import SC_SPEC_DOC_LIMIT
 from .sc_spec_event_data_format import SCSpecEventDataFormat
 from .sc_spec_event_param_v0 import SCSpecEventParamV0
@@ -31,6 +47,8 @@ class SCSpecEventV0:
         };
     """
 
+    __slots__ = ("data_format", "doc", "lib", "name", "params", "prefix_topics")
+
     def __init__(
         self,
         doc: bytes,
@@ -79,6 +97,20 @@ class SCSpecEventV0:
             params_item.pack(packer)
         self.data_format.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + 4
+            + (len(self.doc) + 3) // 4 * 4
+            + 4
+            + (len(self.lib) + 3) // 4 * 4
+            + self.name.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.prefix_topics)
+            + 4
+            + sum(item.xdr_size() for item in self.params)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -116,16 +148,163 @@ class SCSpecEventV0:
             data_format=data_format,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        String.skip(unpacker, 80)
+        SCSymbol.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"prefix_topics length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCSymbol.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"params length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCSpecEventParamV0.skip(unpacker, depth_limit - 1)
+        SCSpecEventDataFormat.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecEventV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "doc" in fields:
+            _result["doc"] = String.unpack_fields(
+                unpacker, fields["doc"], SC_SPEC_DOC_LIMIT
+            )
+        else:
+            String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        if "lib" in fields:
+            _result["lib"] = String.unpack_fields(unpacker, fields["lib"], 80)
+        else:
+            String.skip(unpacker, 80)
+        if "name" in fields:
+            _result["name"] = SCSymbol.unpack_fields(
+                unpacker, fields["name"], depth_limit - 1
+            )
+        else:
+            SCSymbol.skip(unpacker, depth_limit - 1)
+        if "prefix_topics" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"prefix_topics length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["prefix_topics"] = []
+            for _ in range(length):
+                _result["prefix_topics"].append(
+                    SCSymbol.unpack_fields(
+                        unpacker, fields["prefix_topics"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"prefix_topics length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCSymbol.skip(unpacker, depth_limit - 1)
+        if "params" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"params length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["params"] = []
+            for _ in range(length):
+                _result["params"].append(
+                    SCSpecEventParamV0.unpack_fields(
+                        unpacker, fields["params"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"params length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCSpecEventParamV0.skip(unpacker, depth_limit - 1)
+        if "data_format" in fields:
+            _result["data_format"] = SCSpecEventDataFormat.unpack_fields(
+                unpacker, fields["data_format"]
+            )
+        else:
+            SCSpecEventDataFormat.skip(unpacker)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "doc", String.unpack(unpacker, SC_SPEC_DOC_LIMIT)
+        yield "lib", String.unpack(unpacker, 80)
+        yield "name", SCSymbol.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"prefix_topics length {length} exceeds remaining input length {_remaining}"
+            )
+        prefix_topics = []
+        for _ in range(length):
+            prefix_topics.append(SCSymbol.unpack(unpacker, depth_limit - 1))
+        yield "prefix_topics", prefix_topics
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"params length {length} exceeds remaining input length {_remaining}"
+            )
+        params = []
+        for _ in range(length):
+            params.append(unpack_view(SCSpecEventParamV0, unpacker, depth_limit - 1))
+        yield "params", params
+        yield "data_format", SCSpecEventDataFormat.unpack(unpacker)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecEventV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSpecEventV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -140,11 +319,11 @@ class SCSpecEventV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecEventV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -177,6 +356,39 @@ class SCSpecEventV0:
             data_format=data_format,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"doc": ')
+        write(json_encode(String.to_json_dict(self.doc)))
+        write(', "lib": ')
+        write(json_encode(String.to_json_dict(self.lib)))
+        write(', "name": ')
+        self.name._write_json(write)
+        write(', "prefix_topics": ')
+        write_json_array(write, self.prefix_topics)
+        write(', "params": ')
+        write_json_array(write, self.params)
+        write(', "data_format": ')
+        self.data_format._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecEventV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.doc = self.doc
+        result.lib = self.lib
+        result.name = self.name.clone()
+        result.prefix_topics = [item.clone() for item in self.prefix_topics]
+        result.params = [item.clone() for item in self.params]
+        result.data_format = self.data_format
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecEventV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecEventV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .constants import SC_SPEC_DOC_LIMIT
 from .sc_spec_type_def import SCSpecTypeDef
 
@@ -26,6 +41,8 @@ class SCSpecFunctionInputV0:
         };
     """
 
+    __slots__ = ("doc", "name", "type")
+
     def __init__(
         self,
         doc: bytes,
@@ -51,6 +68,15 @@ class SCSpecFunctionInputV0:
         String(self.name, 30).pack(packer)
         self.type.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (len(self.doc) + 3) // 4 * 4
+            + 4
+            + (len(self.name) + 3) // 4 * 4
+            + self.type.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -66,16 +92,75 @@ class SCSpecFunctionInputV0:
             type=type,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        String.skip(unpacker, 30)
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecFunctionInputV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "doc" in fields:
+            _result["doc"] = String.unpack_fields(
+                unpacker, fields["doc"], SC_SPEC_DOC_LIMIT
+            )
+        else:
+            String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        if "name" in fields:
+            _result["name"] = String.unpack_fields(unpacker, fields["name"], 30)
+        else:
+            String.skip(unpacker, 30)
+        if "type" in fields:
+            _result["type"] = SCSpecTypeDef.unpack_fields(
+                unpacker, fields["type"], depth_limit - 1
+            )
+        else:
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "doc", String.unpack(unpacker, SC_SPEC_DOC_LIMIT)
+        yield "name", String.unpack(unpacker, 30)
+        yield "type", view_at(SCSpecTypeDef, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecFunctionInputV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecFunctionInputV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -90,11 +175,11 @@ class SCSpecFunctionInputV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecFunctionInputV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -114,6 +199,30 @@ class SCSpecFunctionInputV0:
             type=type,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"doc": ')
+        write(json_encode(String.to_json_dict(self.doc)))
+        write(', "name": ')
+        write(json_encode(String.to_json_dict(self.name)))
+        write(', "type": ')
+        self.type._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecFunctionInputV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.doc = self.doc
+        result.name = self.name
+        result.type = self.type.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecFunctionInputV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecFunctionInputV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import SC_SPEC_DOC_LIMIT
 from .sc_spec_function_input_v0 import SCSpecFunctionInputV0
 from .sc_spec_type_def import SCSpecTypeDef
@@ -29,6 +45,8 @@ class SCSpecFunctionV0:
         };
     """
 
+    __slots__ = ("doc", "inputs", "name", "outputs")
+
     def __init__(
         self,
         doc: bytes,
@@ -66,6 +84,17 @@ class SCSpecFunctionV0:
         for outputs_item in self.outputs:
             outputs_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (len(self.doc) + 3) // 4 * 4
+            + self.name.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.inputs)
+            + 4
+            + sum(item.xdr_size() for item in self.outputs)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -99,16 +128,151 @@ class SCSpecFunctionV0:
             outputs=outputs,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        SCSymbol.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"inputs length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCSpecFunctionInputV0.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"outputs length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecFunctionV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "doc" in fields:
+            _result["doc"] = String.unpack_fields(
+                unpacker, fields["doc"], SC_SPEC_DOC_LIMIT
+            )
+        else:
+            String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        if "name" in fields:
+            _result["name"] = SCSymbol.unpack_fields(
+                unpacker, fields["name"], depth_limit - 1
+            )
+        else:
+            SCSymbol.skip(unpacker, depth_limit - 1)
+        if "inputs" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"inputs length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["inputs"] = []
+            for _ in range(length):
+                _result["inputs"].append(
+                    SCSpecFunctionInputV0.unpack_fields(
+                        unpacker, fields["inputs"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"inputs length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCSpecFunctionInputV0.skip(unpacker, depth_limit - 1)
+        if "outputs" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"outputs length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["outputs"] = []
+            for _ in range(length):
+                _result["outputs"].append(
+                    SCSpecTypeDef.unpack_fields(
+                        unpacker, fields["outputs"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"outputs length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "doc", String.unpack(unpacker, SC_SPEC_DOC_LIMIT)
+        yield "name", SCSymbol.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"inputs length {length} exceeds remaining input length {_remaining}"
+            )
+        inputs = []
+        for _ in range(length):
+            inputs.append(unpack_view(SCSpecFunctionInputV0, unpacker, depth_limit - 1))
+        yield "inputs", inputs
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"outputs length {length} exceeds remaining input length {_remaining}"
+            )
+        outputs = []
+        for _ in range(length):
+            outputs.append(unpack_view(SCSpecTypeDef, unpacker, depth_limit - 1))
+        yield "outputs", outputs
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecFunctionV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecFunctionV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -123,11 +287,11 @@ class SCSpecFunctionV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecFunctionV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -152,6 +316,33 @@ class SCSpecFunctionV0:
             outputs=outputs,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"doc": ')
+        write(json_encode(String.to_json_dict(self.doc)))
+        write(', "name": ')
+        self.name._write_json(write)
+        write(', "inputs": ')
+        write_json_array(write, self.inputs)
+        write(', "outputs": ')
+        write_json_array(write, self.outputs)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecFunctionV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.doc = self.doc
+        result.name = self.name.clone()
+        result.inputs = [item.clone() for item in self.inputs]
+        result.outputs = [item.clone() for item in self.outputs]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecFunctionV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecFunctionV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">I")
 __all__ = ["SCSpecTypeBytesN"]
 
 
@@ -23,6 +35,8 @@ class SCSpecTypeBytesN:
         };
     """
 
+    __slots__ = ("n",)
+
     def __init__(
         self,
         n: Uint32,
@@ -30,7 +44,10 @@ class SCSpecTypeBytesN:
         self.n = n
 
     def pack(self, packer: Packer) -> None:
-        self.n.pack(packer)
+        _LAYOUT.write(packer, self.n.uint32)
+
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(
@@ -38,21 +55,54 @@ class SCSpecTypeBytesN:
     ) -> SCSpecTypeBytesN:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        n = Uint32.unpack(unpacker, depth_limit - 1)
+        (n,) = _LAYOUT.read(unpacker)
         return cls(
-            n=n,
+            n=Uint32(n),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecTypeBytesN:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "n" in fields:
+            _result["n"] = Uint32.unpack_fields(unpacker, fields["n"], depth_limit - 1)
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecTypeBytesN:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecTypeBytesN:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +117,11 @@ class SCSpecTypeBytesN:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecTypeBytesN:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -85,6 +135,24 @@ class SCSpecTypeBytesN:
             n=n,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"n": ')
+        self.n._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecTypeBytesN:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.n = self.n.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecTypeBytesN:
+        return self.clone()
+
+    def freeze(self) -> SCSpecTypeBytesN:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.n,))
 
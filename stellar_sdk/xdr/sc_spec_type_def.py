@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_spec_type import SCSpecType
 
 if TYPE_CHECKING:
@@ -65,6 +78,8 @@ class SCSpecTypeDef:
         };
     """
 
+    __slots__ = ("bytes_n", "map", "option", "result", "tuple", "type", "udt", "vec")
+
     def __init__(
         self,
         type: SCSpecType,
@@ -162,86 +177,376 @@ class SCSpecTypeDef:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SCSpecType.SC_SPEC_TYPE_VAL:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_BOOL:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_VOID:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_ERROR:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_U32:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_I32:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_U64:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_I64:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_TIMEPOINT:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_DURATION:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_U128:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_I128:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_U256:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_I256:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_BYTES:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_STRING:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_SYMBOL:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_ADDRESS:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_MUXED_ADDRESS:
+            return 4
+        if self.type == SCSpecType.SC_SPEC_TYPE_OPTION:
+            assert self.option is not None
+            return 4 + self.option.xdr_size()
+        if self.type == SCSpecType.SC_SPEC_TYPE_RESULT:
+            assert self.result is not None
+            return 4 + self.result.xdr_size()
+        if self.type == SCSpecType.SC_SPEC_TYPE_VEC:
+            assert self.vec is not None
+            return 4 + self.vec.xdr_size()
+        if self.type == SCSpecType.SC_SPEC_TYPE_MAP:
+            assert self.map is not None
+            return 4 + self.map.xdr_size()
+        if self.type == SCSpecType.SC_SPEC_TYPE_TUPLE:
+            assert self.tuple is not None
+            return 4 + self.tuple.xdr_size()
+        if self.type == SCSpecType.SC_SPEC_TYPE_BYTES_N:
+            return 8
+        if self.type == SCSpecType.SC_SPEC_TYPE_UDT:
+            assert self.udt is not None
+            return 4 + self.udt.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCSpecTypeDef:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if not _arm_types_imported:
+            _import_arm_types()
+        type = SCSpecType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SCSpecType.unpack(unpacker)
         if type == SCSpecType.SC_SPEC_TYPE_VAL:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_BOOL:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_VOID:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_ERROR:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_U32:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_I32:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_U64:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_I64:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_TIMEPOINT:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_DURATION:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_U128:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_I128:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_U256:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_I256:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_BYTES:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_STRING:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_SYMBOL:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_ADDRESS:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_MUXED_ADDRESS:
-            return cls(type=type)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_OPTION:
             from .sc_spec_type_option import SCSpecTypeOption
 
-            option = SCSpecTypeOption.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, option=option)
+            SCSpecTypeOption.skip(unpacker, depth_limit - 1)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_RESULT:
             from .sc_spec_type_result import SCSpecTypeResult
 
-            result = SCSpecTypeResult.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, result=result)
+            SCSpecTypeResult.skip(unpacker, depth_limit - 1)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_VEC:
             from .sc_spec_type_vec import SCSpecTypeVec
 
-            vec = SCSpecTypeVec.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, vec=vec)
+            SCSpecTypeVec.skip(unpacker, depth_limit - 1)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_MAP:
             from .sc_spec_type_map import SCSpecTypeMap
 
-            map = SCSpecTypeMap.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, map=map)
+            SCSpecTypeMap.skip(unpacker, depth_limit - 1)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_TUPLE:
             from .sc_spec_type_tuple import SCSpecTypeTuple
 
-            tuple = SCSpecTypeTuple.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, tuple=tuple)
+            SCSpecTypeTuple.skip(unpacker, depth_limit - 1)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_BYTES_N:
             from .sc_spec_type_bytes_n import SCSpecTypeBytesN
 
-            bytes_n = SCSpecTypeBytesN.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, bytes_n=bytes_n)
+            SCSpecTypeBytesN.skip(unpacker, depth_limit - 1)
+            return
         if type == SCSpecType.SC_SPEC_TYPE_UDT:
             from .sc_spec_type_udt import SCSpecTypeUDT
 
-            udt = SCSpecTypeUDT.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, udt=udt)
+            SCSpecTypeUDT.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecTypeDef:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SCSpecType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SCSpecType.SC_SPEC_TYPE_VAL:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_BOOL:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_VOID:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_ERROR:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_U32:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_I32:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_U64:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_I64:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_TIMEPOINT:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_DURATION:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_U128:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_I128:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_U256:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_I256:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_BYTES:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_STRING:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_SYMBOL:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_ADDRESS:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_MUXED_ADDRESS:
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_OPTION:
+            from .sc_spec_type_option import SCSpecTypeOption
+
+            if "option" in fields:
+                _result["option"] = SCSpecTypeOption.unpack_fields(
+                    unpacker, fields["option"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeOption.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_RESULT:
+            from .sc_spec_type_result import SCSpecTypeResult
+
+            if "result" in fields:
+                _result["result"] = SCSpecTypeResult.unpack_fields(
+                    unpacker, fields["result"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeResult.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_VEC:
+            from .sc_spec_type_vec import SCSpecTypeVec
+
+            if "vec" in fields:
+                _result["vec"] = SCSpecTypeVec.unpack_fields(
+                    unpacker, fields["vec"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeVec.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_MAP:
+            from .sc_spec_type_map import SCSpecTypeMap
+
+            if "map" in fields:
+                _result["map"] = SCSpecTypeMap.unpack_fields(
+                    unpacker, fields["map"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeMap.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_TUPLE:
+            from .sc_spec_type_tuple import SCSpecTypeTuple
+
+            if "tuple" in fields:
+                _result["tuple"] = SCSpecTypeTuple.unpack_fields(
+                    unpacker, fields["tuple"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeTuple.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_BYTES_N:
+            from .sc_spec_type_bytes_n import SCSpecTypeBytesN
+
+            if "bytes_n" in fields:
+                _result["bytes_n"] = SCSpecTypeBytesN.unpack_fields(
+                    unpacker, fields["bytes_n"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeBytesN.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCSpecType.SC_SPEC_TYPE_UDT:
+            from .sc_spec_type_udt import SCSpecTypeUDT
+
+            if "udt" in fields:
+                _result["udt"] = SCSpecTypeUDT.unpack_fields(
+                    unpacker, fields["udt"], depth_limit - 1
+                )
+            else:
+                SCSpecTypeUDT.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SCSpecType.unpack(unpacker)
+        yield "type", type
+        if type == SCSpecType.SC_SPEC_TYPE_VAL:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_BOOL:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_VOID:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_ERROR:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_U32:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_I32:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_U64:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_I64:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_TIMEPOINT:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_DURATION:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_U128:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_I128:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_U256:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_I256:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_BYTES:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_STRING:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_SYMBOL:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_ADDRESS:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_MUXED_ADDRESS:
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_OPTION:
+            from .sc_spec_type_option import SCSpecTypeOption
+
+            yield "option", view_at(SCSpecTypeOption, unpacker, depth_limit - 1)
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_RESULT:
+            from .sc_spec_type_result import SCSpecTypeResult
+
+            yield "result", view_at(SCSpecTypeResult, unpacker, depth_limit - 1)
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_VEC:
+            from .sc_spec_type_vec import SCSpecTypeVec
+
+            yield "vec", view_at(SCSpecTypeVec, unpacker, depth_limit - 1)
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_MAP:
+            from .sc_spec_type_map import SCSpecTypeMap
+
+            yield "map", view_at(SCSpecTypeMap, unpacker, depth_limit - 1)
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_TUPLE:
+            from .sc_spec_type_tuple import SCSpecTypeTuple
+
+            yield "tuple", view_at(SCSpecTypeTuple, unpacker, depth_limit - 1)
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_BYTES_N:
+            from .sc_spec_type_bytes_n import SCSpecTypeBytesN
+
+            yield "bytes_n", SCSpecTypeBytesN.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCSpecType.SC_SPEC_TYPE_UDT:
+            from .sc_spec_type_udt import SCSpecTypeUDT
+
+            yield "udt", SCSpecTypeUDT.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -250,10 +555,10 @@ class SCSpecTypeDef:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecTypeDef:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSpecTypeDef:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -268,11 +573,11 @@ class SCSpecTypeDef:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecTypeDef:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == SCSpecType.SC_SPEC_TYPE_VAL:
@@ -408,6 +713,128 @@ class SCSpecTypeDef:
             return cls(type=type, udt=udt)
         raise ValueError(f"Unknown key '{key}' for SCSpecTypeDef")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == SCSpecType.SC_SPEC_TYPE_VAL:
+            write('"val"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_BOOL:
+            write('"bool"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_VOID:
+            write('"void"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_ERROR:
+            write('"error"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_U32:
+            write('"u32"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_I32:
+            write('"i32"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_U64:
+            write('"u64"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_I64:
+            write('"i64"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_TIMEPOINT:
+            write('"timepoint"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_DURATION:
+            write('"duration"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_U128:
+            write('"u128"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_I128:
+            write('"i128"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_U256:
+            write('"u256"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_I256:
+            write('"i256"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_BYTES:
+            write('"bytes"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_STRING:
+            write('"string"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_SYMBOL:
+            write('"symbol"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_ADDRESS:
+            write('"address"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_MUXED_ADDRESS:
+            write('"muxed_address"')
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_OPTION:
+            assert self.option is not None
+            write('{"option": ')
+            self.option._write_json(write)
+            write("}")
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_RESULT:
+            assert self.result is not None
+            write('{"result": ')
+            self.result._write_json(write)
+            write("}")
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_VEC:
+            assert self.vec is not None
+            write('{"vec": ')
+            self.vec._write_json(write)
+            write("}")
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_MAP:
+            assert self.map is not None
+            write('{"map": ')
+            self.map._write_json(write)
+            write("}")
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_TUPLE:
+            assert self.tuple is not None
+            write('{"tuple": ')
+            self.tuple._write_json(write)
+            write("}")
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_BYTES_N:
+            assert self.bytes_n is not None
+            write('{"bytes_n": ')
+            self.bytes_n._write_json(write)
+            write("}")
+            return
+        if self.type == SCSpecType.SC_SPEC_TYPE_UDT:
+            assert self.udt is not None
+            write('{"udt": ')
+            self.udt._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SCSpecTypeDef: {self.type}")
+
+    def clone(self, deep: bool = True) -> SCSpecTypeDef:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.option = self.option.clone() if self.option is not None else None
+        result.result = self.result.clone() if self.result is not None else None
+        result.vec = self.vec.clone() if self.vec is not None else None
+        result.map = self.map.clone() if self.map is not None else None
+        result.tuple = self.tuple.clone() if self.tuple is not None else None
+        result.bytes_n = self.bytes_n.clone() if self.bytes_n is not None else None
+        result.udt = self.udt.clone() if self.udt is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecTypeDef:
+        return self.clone()
+
+    def freeze(self) -> SCSpecTypeDef:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -454,3 +881,99 @@ class SCSpecTypeDef:
         if self.udt is not None:
             out.append(f"udt={self.udt}")
         return f"<SCSpecTypeDef [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    return cls(type=type)
+
+
+def _unpack_option(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    option = SCSpecTypeOption.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, option=option)
+
+
+def _unpack_result(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    result = SCSpecTypeResult.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, result=result)
+
+
+def _unpack_vec(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    vec = SCSpecTypeVec.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, vec=vec)
+
+
+def _unpack_map(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    map = SCSpecTypeMap.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, map=map)
+
+
+def _unpack_tuple(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    tuple = SCSpecTypeTuple.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, tuple=tuple)
+
+
+def _unpack_bytes_n(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    bytes_n = SCSpecTypeBytesN.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, bytes_n=bytes_n)
+
+
+def _unpack_udt(cls, type, unpacker: Unpacker, depth_limit: int) -> SCSpecTypeDef:
+    udt = SCSpecTypeUDT.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, udt=udt)
+
+
+_UNPACK_ARMS = {
+    SCSpecType.SC_SPEC_TYPE_VAL: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_BOOL: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_VOID: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_ERROR: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_U32: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_I32: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_U64: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_I64: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_TIMEPOINT: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_DURATION: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_U128: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_I128: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_U256: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_I256: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_BYTES: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_STRING: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_SYMBOL: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_ADDRESS: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_MUXED_ADDRESS: _unpack_void,
+    SCSpecType.SC_SPEC_TYPE_OPTION: _unpack_option,
+    SCSpecType.SC_SPEC_TYPE_RESULT: _unpack_result,
+    SCSpecType.SC_SPEC_TYPE_VEC: _unpack_vec,
+    SCSpecType.SC_SPEC_TYPE_MAP: _unpack_map,
+    SCSpecType.SC_SPEC_TYPE_TUPLE: _unpack_tuple,
+    SCSpecType.SC_SPEC_TYPE_BYTES_N: _unpack_bytes_n,
+    SCSpecType.SC_SPEC_TYPE_UDT: _unpack_udt,
+}
+_arm_types_imported = False
+
+
+def _import_arm_types() -> None:
+    global _arm_types_imported
+    global SCSpecTypeOption
+    from .sc_spec_type_option import SCSpecTypeOption
+
+    global SCSpecTypeResult
+    from .sc_spec_type_result import SCSpecTypeResult
+
+    global SCSpecTypeVec
+    from .sc_spec_type_vec import SCSpecTypeVec
+
+    global SCSpecTypeMap
+    from .sc_spec_type_map import SCSpecTypeMap
+
+    global SCSpecTypeTuple
+    from .sc_spec_type_tuple import SCSpecTypeTuple
+
+    global SCSpecTypeBytesN
+    from .sc_spec_type_bytes_n import SCSpecTypeBytesN
+
+    global SCSpecTypeUDT
+    from .sc_spec_type_udt import SCSpecTypeUDT
+
+    _arm_types_imported = True
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_spec_type_def import SCSpecTypeDef
 
 __all__ = ["SCSpecTypeMap"]
@@ -24,6 +37,8 @@ class SCSpecTypeMap:
         };
     """
 
+    __slots__ = ("key_type", "value_type")
+
     def __init__(
         self,
         key_type: SCSpecTypeDef,
@@ -36,6 +51,9 @@ class SCSpecTypeMap:
         self.key_type.pack(packer)
         self.value_type.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.key_type.xdr_size() + self.value_type.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -49,16 +67,69 @@ class SCSpecTypeMap:
             value_type=value_type,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecTypeMap:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "key_type" in fields:
+            _result["key_type"] = SCSpecTypeDef.unpack_fields(
+                unpacker, fields["key_type"], depth_limit - 1
+            )
+        else:
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        if "value_type" in fields:
+            _result["value_type"] = SCSpecTypeDef.unpack_fields(
+                unpacker, fields["value_type"], depth_limit - 1
+            )
+        else:
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        key_type = view_at(SCSpecTypeDef, unpacker, depth_limit - 1)
+        yield "key_type", key_type
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        yield "value_type", view_at(SCSpecTypeDef, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecTypeMap:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSpecTypeMap:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +144,11 @@ class SCSpecTypeMap:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecTypeMap:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +165,27 @@ class SCSpecTypeMap:
             value_type=value_type,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"key_type": ')
+        self.key_type._write_json(write)
+        write(', "value_type": ')
+        self.value_type._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecTypeMap:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.key_type = self.key_type.clone()
+        result.value_type = self.value_type.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecTypeMap:
+        return self.clone()
+
+    def freeze(self) -> SCSpecTypeMap:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
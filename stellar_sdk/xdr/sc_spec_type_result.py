@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_spec_type_def import SCSpecTypeDef
 
 __all__ = ["SCSpecTypeResult"]
@@ -24,6 +37,8 @@ class SCSpecTypeResult:
         };
     """
 
+    __slots__ = ("error_type", "ok_type")
+
     def __init__(
         self,
         ok_type: SCSpecTypeDef,
@@ -36,6 +51,9 @@ class SCSpecTypeResult:
         self.ok_type.pack(packer)
         self.error_type.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.ok_type.xdr_size() + self.error_type.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -49,16 +67,71 @@ class SCSpecTypeResult:
             error_type=error_type,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecTypeResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ok_type" in fields:
+            _result["ok_type"] = SCSpecTypeDef.unpack_fields(
+                unpacker, fields["ok_type"], depth_limit - 1
+            )
+        else:
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        if "error_type" in fields:
+            _result["error_type"] = SCSpecTypeDef.unpack_fields(
+                unpacker, fields["error_type"], depth_limit - 1
+            )
+        else:
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ok_type = view_at(SCSpecTypeDef, unpacker, depth_limit - 1)
+        yield "ok_type", ok_type
+        SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        yield "error_type", view_at(SCSpecTypeDef, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecTypeResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecTypeResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +146,11 @@ class SCSpecTypeResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecTypeResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +167,27 @@ class SCSpecTypeResult:
             error_type=error_type,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ok_type": ')
+        self.ok_type._write_json(write)
+        write(', "error_type": ')
+        self.error_type._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecTypeResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ok_type = self.ok_type.clone()
+        result.error_type = self.error_type.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecTypeResult:
+        return self.clone()
+
+    def freeze(self) -> SCSpecTypeResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
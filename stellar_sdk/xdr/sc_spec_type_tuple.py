@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .sc_spec_type_def import SCSpecTypeDef
 
 __all__ = ["SCSpecTypeTuple"]
@@ -23,6 +37,8 @@ class SCSpecTypeTuple:
         };
     """
 
+    __slots__ = ("value_types",)
+
     def __init__(
         self,
         value_types: list[SCSpecTypeDef],
@@ -39,6 +55,9 @@ class SCSpecTypeTuple:
         for value_types_item in self.value_types:
             value_types_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.value_types)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -58,16 +77,92 @@ class SCSpecTypeTuple:
             value_types=value_types,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"value_types length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecTypeTuple:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "value_types" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"value_types length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["value_types"] = []
+            for _ in range(length):
+                _result["value_types"].append(
+                    SCSpecTypeDef.unpack_fields(
+                        unpacker, fields["value_types"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"value_types length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCSpecTypeDef.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"value_types length {length} exceeds remaining input length {_remaining}"
+            )
+        value_types = []
+        for _ in range(length):
+            value_types.append(unpack_view(SCSpecTypeDef, unpacker, depth_limit - 1))
+        yield "value_types", value_types
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecTypeTuple:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSpecTypeTuple:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -82,11 +177,11 @@ class SCSpecTypeTuple:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecTypeTuple:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -102,6 +197,24 @@ class SCSpecTypeTuple:
             value_types=value_types,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"value_types": ')
+        write_json_array(write, self.value_types)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecTypeTuple:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.value_types = [item.clone() for item in self.value_types]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecTypeTuple:
+        return self.clone()
+
+    def freeze(self) -> SCSpecTypeTuple:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.value_types,))
 
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["SCSpecTypeUDT"]
 
@@ -22,6 +34,8 @@ class SCSpecTypeUDT:
         };
     """
 
+    __slots__ = ("name",)
+
     def __init__(
         self,
         name: bytes,
@@ -36,6 +50,9 @@ class SCSpecTypeUDT:
     def pack(self, packer: Packer) -> None:
         String(self.name, 60).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.name) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -47,16 +64,47 @@ class SCSpecTypeUDT:
             name=name,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, 60)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecTypeUDT:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "name" in fields:
+            _result["name"] = String.unpack_fields(unpacker, fields["name"], 60)
+        else:
+            String.skip(unpacker, 60)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecTypeUDT:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSpecTypeUDT:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -71,11 +119,11 @@ class SCSpecTypeUDT:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecTypeUDT:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -89,6 +137,24 @@ class SCSpecTypeUDT:
             name=name,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"name": ')
+        write(json_encode(String.to_json_dict(self.name)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecTypeUDT:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.name = self.name
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecTypeUDT:
+        return self.clone()
+
+    def freeze(self) -> SCSpecTypeUDT:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.name,))
 
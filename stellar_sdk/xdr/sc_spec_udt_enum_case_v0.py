@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .constants import SC_SPEC_DOC_LIMIT
 from .uint32 import Uint32
 
@@ -26,6 +38,8 @@ class SCSpecUDTEnumCaseV0:
         };
     """
 
+    __slots__ = ("doc", "name", "value")
+
     def __init__(
         self,
         doc: bytes,
@@ -51,6 +65,9 @@ class SCSpecUDTEnumCaseV0:
         String(self.name, 60).pack(packer)
         self.value.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 4 + (len(self.doc) + 3) // 4 * 4 + 4 + (len(self.name) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -66,16 +83,63 @@ class SCSpecUDTEnumCaseV0:
             value=value,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        String.skip(unpacker, 60)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecUDTEnumCaseV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "doc" in fields:
+            _result["doc"] = String.unpack_fields(
+                unpacker, fields["doc"], SC_SPEC_DOC_LIMIT
+            )
+        else:
+            String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        if "name" in fields:
+            _result["name"] = String.unpack_fields(unpacker, fields["name"], 60)
+        else:
+            String.skip(unpacker, 60)
+        if "value" in fields:
+            _result["value"] = Uint32.unpack_fields(
+                unpacker, fields["value"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecUDTEnumCaseV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecUDTEnumCaseV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -90,11 +154,11 @@ class SCSpecUDTEnumCaseV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecUDTEnumCaseV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -114,6 +178,30 @@ class SCSpecUDTEnumCaseV0:
             value=value,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"doc": ')
+        write(json_encode(String.to_json_dict(self.doc)))
+        write(', "name": ')
+        write(json_encode(String.to_json_dict(self.name)))
+        write(', "value": ')
+        self.value._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecUDTEnumCaseV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.doc = self.doc
+        result.name = self.name
+        result.value = self.value.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecUDTEnumCaseV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecUDTEnumCaseV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
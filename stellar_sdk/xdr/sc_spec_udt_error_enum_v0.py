@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import SC_SPEC_DOC_LIMIT
 from .sc_spec_udt_error_enum_case_v0 import SCSpecUDTErrorEnumCaseV0
 
@@ -27,6 +42,8 @@ class SCSpecUDTErrorEnumV0:
         };
     """
 
+    __slots__ = ("cases", "doc", "lib", "name")
+
     def __init__(
         self,
         doc: bytes,
@@ -67,6 +84,18 @@ class SCSpecUDTErrorEnumV0:
         for cases_item in self.cases:
             cases_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (len(self.doc) + 3) // 4 * 4
+            + 4
+            + (len(self.lib) + 3) // 4 * 4
+            + 4
+            + (len(self.name) + 3) // 4 * 4
+            + 4
+            + sum(item.xdr_size() for item in self.cases)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -92,16 +121,114 @@ class SCSpecUDTErrorEnumV0:
             cases=cases,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        String.skip(unpacker, 80)
+        String.skip(unpacker, 60)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"cases length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCSpecUDTErrorEnumCaseV0.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecUDTErrorEnumV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "doc" in fields:
+            _result["doc"] = String.unpack_fields(
+                unpacker, fields["doc"], SC_SPEC_DOC_LIMIT
+            )
+        else:
+            String.skip(unpacker, SC_SPEC_DOC_LIMIT)
+        if "lib" in fields:
+            _result["lib"] = String.unpack_fields(unpacker, fields["lib"], 80)
+        else:
+            String.skip(unpacker, 80)
+        if "name" in fields:
+            _result["name"] = String.unpack_fields(unpacker, fields["name"], 60)
+        else:
+            String.skip(unpacker, 60)
+        if "cases" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"cases length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["cases"] = []
+            for _ in range(length):
+                _result["cases"].append(
+                    SCSpecUDTErrorEnumCaseV0.unpack_fields(
+                        unpacker, fields["cases"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"cases length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCSpecUDTErrorEnumCaseV0.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "doc", String.unpack(unpacker, SC_SPEC_DOC_LIMIT)
+        yield "lib", String.unpack(unpacker, 80)
+        yield "name", String.unpack(unpacker, 60)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"cases length {length} exceeds remaining input length {_remaining}"
+            )
+        cases = []
+        for _ in range(length):
+            cases.append(SCSpecUDTErrorEnumCaseV0.unpack(unpacker, depth_limit - 1))
+        yield "cases", cases
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecUDTErrorEnumV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecUDTErrorEnumV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -116,11 +243,11 @@ class SCSpecUDTErrorEnumV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecUDTErrorEnumV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -145,6 +272,33 @@ class SCSpecUDTErrorEnumV0:
             cases=cases,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"doc": ')
+        write(json_encode(String.to_json_dict(self.doc)))
+        write(', "lib": ')
+        write(json_encode(String.to_json_dict(self.lib)))
+        write(', "name": ')
+        write(json_encode(String.to_json_dict(self.name)))
+        write(', "cases": ')
+        write_json_array(write, self.cases)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCSpecUDTErrorEnumV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.doc = self.doc
+        result.lib = self.lib
+        result.name = self.name
+        result.cases = [item.clone() for item in self.cases]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecUDTErrorEnumV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecUDTErrorEnumV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_spec_udt_union_case_tuple_v0 import SCSpecUDTUnionCaseTupleV0
 from .sc_spec_udt_union_case_v0_kind import SCSpecUDTUnionCaseV0Kind
 from .sc_spec_udt_union_case_void_v0 import SCSpecUDTUnionCaseVoidV0
@@ -28,6 +41,8 @@ class SCSpecUDTUnionCaseV0:
         };
     """
 
+    __slots__ = ("kind", "tuple_case", "void_case")
+
     def __init__(
         self,
         kind: SCSpecUDTUnionCaseV0Kind,
@@ -52,19 +67,102 @@ class SCSpecUDTUnionCaseV0:
             return
         raise ValueError("Invalid kind.")
 
+    def xdr_size(self) -> int:
+        if self.kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
+            assert self.void_case is not None
+            return 4 + self.void_case.xdr_size()
+        if self.kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0:
+            assert self.tuple_case is not None
+            return 4 + self.tuple_case.xdr_size()
+        raise ValueError("Invalid kind.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCSpecUDTUnionCaseV0:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        kind = SCSpecUDTUnionCaseV0Kind.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(kind)
+        if unpack_arm is None:
+            raise ValueError("Invalid kind.")
+        return unpack_arm(cls, kind, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         kind = SCSpecUDTUnionCaseV0Kind.unpack(unpacker)
         if kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
-            void_case = SCSpecUDTUnionCaseVoidV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, void_case=void_case)
+            SCSpecUDTUnionCaseVoidV0.skip(unpacker, depth_limit - 1)
+            return
         if kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0:
-            tuple_case = SCSpecUDTUnionCaseTupleV0.unpack(unpacker, depth_limit - 1)
-            return cls(kind=kind, tuple_case=tuple_case)
+            SCSpecUDTUnionCaseTupleV0.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid kind.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSpecUDTUnionCaseV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        kind = SCSpecUDTUnionCaseV0Kind.unpack(unpacker)
+        if "kind" in fields:
+            _result["kind"] = kind
+        if kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
+            if "void_case" in fields:
+                _result["void_case"] = SCSpecUDTUnionCaseVoidV0.unpack_fields(
+                    unpacker, fields["void_case"], depth_limit - 1
+                )
+            else:
+                SCSpecUDTUnionCaseVoidV0.skip(unpacker, depth_limit - 1)
+            return _result
+        if kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0:
+            if "tuple_case" in fields:
+                _result["tuple_case"] = SCSpecUDTUnionCaseTupleV0.unpack_fields(
+                    unpacker, fields["tuple_case"], depth_limit - 1
+                )
+            else:
+                SCSpecUDTUnionCaseTupleV0.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid kind.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        kind = SCSpecUDTUnionCaseV0Kind.unpack(unpacker)
+        yield "kind", kind
+        if kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
+            yield (
+                "void_case",
+                SCSpecUDTUnionCaseVoidV0.unpack(unpacker, depth_limit - 1),
+            )
+            return
+        if kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0:
+            yield (
+                "tuple_case",
+                view_at(SCSpecUDTUnionCaseTupleV0, unpacker, depth_limit - 1),
+            )
+            return
         raise ValueError("Invalid kind.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -73,10 +171,12 @@ class SCSpecUDTUnionCaseV0:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSpecUDTUnionCaseV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCSpecUDTUnionCaseV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -91,11 +191,11 @@ class SCSpecUDTUnionCaseV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSpecUDTUnionCaseV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
@@ -124,6 +224,40 @@ class SCSpecUDTUnionCaseV0:
             return cls(kind=kind, tuple_case=tuple_case)
         raise ValueError(f"Unknown key '{key}' for SCSpecUDTUnionCaseV0")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0:
+            assert self.void_case is not None
+            write('{"void_v0": ')
+            self.void_case._write_json(write)
+            write("}")
+            return
+        if self.kind == SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0:
+            assert self.tuple_case is not None
+            write('{"tuple_v0": ')
+            self.tuple_case._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown kind in SCSpecUDTUnionCaseV0: {self.kind}")
+
+    def clone(self, deep: bool = True) -> SCSpecUDTUnionCaseV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.kind = self.kind
+        result.void_case = (
+            self.void_case.clone() if self.void_case is not None else None
+        )
+        result.tuple_case = (
+            self.tuple_case.clone() if self.tuple_case is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSpecUDTUnionCaseV0:
+        return self.clone()
+
+    def freeze(self) -> SCSpecUDTUnionCaseV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -150,3 +284,23 @@ class SCSpecUDTUnionCaseV0:
         if self.tuple_case is not None:
             out.append(f"tuple_case={self.tuple_case}")
         return f"<SCSpecUDTUnionCaseV0 [{', '.join(out)}]>"
+
+
+def _unpack_void_case(
+    cls, kind, unpacker: Unpacker, depth_limit: int
+) -> SCSpecUDTUnionCaseV0:
+    void_case = SCSpecUDTUnionCaseVoidV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, void_case=void_case)
+
+
+def _unpack_tuple_case(
+    cls, kind, unpacker: Unpacker, depth_limit: int
+) -> SCSpecUDTUnionCaseV0:
+    tuple_case = SCSpecUDTUnionCaseTupleV0.unpack(unpacker, depth_limit - 1)
+    return cls(kind=kind, tuple_case=tuple_case)
+
+
+_UNPACK_ARMS = {
+    SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_VOID_V0: _unpack_void_case,
+    SCSpecUDTUnionCaseV0Kind.SC_SPEC_UDT_UNION_CASE_TUPLE_V0: _unpack_tuple_case,
+}
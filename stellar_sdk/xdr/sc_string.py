@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["SCString"]
 
@@ -19,6 +31,8 @@ class SCString:
         typedef string SCString<>;
     """
 
+    __slots__ = ("sc_string",)
+
     def __init__(self, sc_string: bytes) -> None:
         _expect_max_length = 4294967295
         if sc_string and len(sc_string) > _expect_max_length:
@@ -30,6 +44,9 @@ class SCString:
     def pack(self, packer: Packer) -> None:
         String(self.sc_string, 4294967295).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.sc_string) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -39,16 +56,49 @@ class SCString:
         sc_string = String.unpack(unpacker, 4294967295)
         return cls(sc_string)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, 4294967295)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCString:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sc_string" in fields:
+            _result["sc_string"] = String.unpack_fields(
+                unpacker, fields["sc_string"], 4294967295
+            )
+        else:
+            String.skip(unpacker, 4294967295)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCString:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCString:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +113,11 @@ class SCString:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCString:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return String.to_json_dict(self.sc_string)
@@ -76,6 +126,22 @@ class SCString:
     def from_json_dict(cls, json_value: str) -> SCString:
         return cls(String.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(String.to_json_dict(self.sc_string)))
+
+    def clone(self, deep: bool = True) -> SCString:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sc_string = self.sc_string
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCString:
+        return self.clone()
+
+    def freeze(self) -> SCString:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.sc_string,))
 
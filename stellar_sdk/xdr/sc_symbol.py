@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .constants import SCSYMBOL_LIMIT
 
 __all__ = ["SCSymbol"]
@@ -20,6 +32,8 @@ class SCSymbol:
         typedef string SCSymbol<SCSYMBOL_LIMIT>;
     """
 
+    __slots__ = ("sc_symbol",)
+
     def __init__(self, sc_symbol: bytes) -> None:
         _expect_max_length = SCSYMBOL_LIMIT
         if sc_symbol and len(sc_symbol) > _expect_max_length:
@@ -31,6 +45,9 @@ class SCSymbol:
     def pack(self, packer: Packer) -> None:
         String(self.sc_symbol, SCSYMBOL_LIMIT).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.sc_symbol) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -40,16 +57,49 @@ class SCSymbol:
         sc_symbol = String.unpack(unpacker, SCSYMBOL_LIMIT)
         return cls(sc_symbol)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, SCSYMBOL_LIMIT)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCSymbol:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sc_symbol" in fields:
+            _result["sc_symbol"] = String.unpack_fields(
+                unpacker, fields["sc_symbol"], SCSYMBOL_LIMIT
+            )
+        else:
+            String.skip(unpacker, SCSYMBOL_LIMIT)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCSymbol:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCSymbol:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -64,11 +114,11 @@ class SCSymbol:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCSymbol:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return String.to_json_dict(self.sc_symbol)
@@ -77,6 +127,22 @@ class SCSymbol:
     def from_json_dict(cls, json_value: str) -> SCSymbol:
         return cls(String.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(String.to_json_dict(self.sc_symbol)))
+
+    def clone(self, deep: bool = True) -> SCSymbol:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sc_symbol = self.sc_symbol
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCSymbol:
+        return self.clone()
+
+    def freeze(self) -> SCSymbol:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.sc_symbol,))
 
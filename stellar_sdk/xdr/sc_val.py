@@ -3,12 +3,28 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Boolean
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Boolean,
+    FrozenXdr,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_val_type import SCValType
 
 if TYPE_CHECKING:
@@ -22,6 +38,7 @@ if TYPE_CHECKING:
     from .sc_contract_instance import SCContractInstance
     from .sc_error import SCError
     from .sc_map import SCMap
+    from .sc_map_entry import SCMapEntry
     from .sc_nonce_key import SCNonceKey
     from .sc_string import SCString
     from .sc_symbol import SCSymbol
@@ -100,6 +117,30 @@ class SCVal:
         };
     """
 
+    __slots__ = (
+        "address",
+        "b",
+        "bytes",
+        "duration",
+        "error",
+        "i32",
+        "i64",
+        "i128",
+        "i256",
+        "instance",
+        "map",
+        "nonce_key",
+        "str",
+        "sym",
+        "timepoint",
+        "type",
+        "u32",
+        "u64",
+        "u128",
+        "u256",
+        "vec",
+    )
+
     def __init__(
         self,
         type: SCValType,
@@ -147,6 +188,9 @@ class SCVal:
         self.nonce_key = nonce_key
 
     def pack(self, packer: Packer) -> None:
+        if self.type in _NESTED_TYPES:
+            _pack_nested(self, packer)
+            return
         self.type.pack(packer)
         if self.type == SCValType.SCV_BOOL:
             if self.b is None:
@@ -225,24 +269,6 @@ class SCVal:
                 raise ValueError("sym should not be None.")
             self.sym.pack(packer)
             return
-        if self.type == SCValType.SCV_VEC:
-            if self.vec is None:
-                packer.pack_uint(0)
-            else:
-                packer.pack_uint(1)
-                if self.vec is None:
-                    raise ValueError("vec should not be None.")
-                self.vec.pack(packer)
-            return
-        if self.type == SCValType.SCV_MAP:
-            if self.map is None:
-                packer.pack_uint(0)
-            else:
-                packer.pack_uint(1)
-                if self.map is None:
-                    raise ValueError("map should not be None.")
-                self.map.pack(packer)
-            return
         if self.type == SCValType.SCV_ADDRESS:
             if self.address is None:
                 raise ValueError("address should not be None.")
@@ -262,123 +288,540 @@ class SCVal:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type in _NESTED_TYPES:
+            return _xdr_size_nested(self)
+        if self.type == SCValType.SCV_BOOL:
+            return 8
+        if self.type == SCValType.SCV_VOID:
+            return 4
+        if self.type == SCValType.SCV_ERROR:
+            assert self.error is not None
+            return 4 + self.error.xdr_size()
+        if self.type == SCValType.SCV_U32:
+            return 8
+        if self.type == SCValType.SCV_I32:
+            return 8
+        if self.type == SCValType.SCV_U64:
+            return 12
+        if self.type == SCValType.SCV_I64:
+            return 12
+        if self.type == SCValType.SCV_TIMEPOINT:
+            return 12
+        if self.type == SCValType.SCV_DURATION:
+            return 12
+        if self.type == SCValType.SCV_U128:
+            return 20
+        if self.type == SCValType.SCV_I128:
+            return 20
+        if self.type == SCValType.SCV_U256:
+            return 36
+        if self.type == SCValType.SCV_I256:
+            return 36
+        if self.type == SCValType.SCV_BYTES:
+            assert self.bytes is not None
+            return 4 + self.bytes.xdr_size()
+        if self.type == SCValType.SCV_STRING:
+            assert self.str is not None
+            return 4 + self.str.xdr_size()
+        if self.type == SCValType.SCV_SYMBOL:
+            assert self.sym is not None
+            return 4 + self.sym.xdr_size()
+        if self.type == SCValType.SCV_VEC:
+            assert self.vec is not None
+            return 4 + 4 + (self.vec.xdr_size() if self.vec is not None else 0)
+        if self.type == SCValType.SCV_MAP:
+            assert self.map is not None
+            return 4 + 4 + (self.map.xdr_size() if self.map is not None else 0)
+        if self.type == SCValType.SCV_ADDRESS:
+            assert self.address is not None
+            return 4 + self.address.xdr_size()
+        if self.type == SCValType.SCV_CONTRACT_INSTANCE:
+            assert self.instance is not None
+            return 4 + self.instance.xdr_size()
+        if self.type == SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE:
+            return 4
+        if self.type == SCValType.SCV_LEDGER_KEY_NONCE:
+            return 12
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCVal:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if not _arm_types_imported:
+            _import_arm_types()
+        type = SCValType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SCValType.unpack(unpacker)
         if type == SCValType.SCV_BOOL:
-            b = Boolean.unpack(unpacker)
-            return cls(type=type, b=b)
+            Boolean.skip(unpacker)
+            return
         if type == SCValType.SCV_VOID:
-            return cls(type=type)
+            return
         if type == SCValType.SCV_ERROR:
             from .sc_error import SCError
 
-            error = SCError.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, error=error)
+            SCError.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_U32:
             from .uint32 import Uint32
 
-            u32 = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, u32=u32)
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_I32:
             from .int32 import Int32
 
-            i32 = Int32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, i32=i32)
+            Int32.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_U64:
             from .uint64 import Uint64
 
-            u64 = Uint64.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, u64=u64)
+            Uint64.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_I64:
             from .int64 import Int64
 
-            i64 = Int64.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, i64=i64)
+            Int64.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_TIMEPOINT:
             from .time_point import TimePoint
 
-            timepoint = TimePoint.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, timepoint=timepoint)
+            TimePoint.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_DURATION:
             from .duration import Duration
 
-            duration = Duration.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, duration=duration)
+            Duration.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_U128:
             from .u_int128_parts import UInt128Parts
 
-            u128 = UInt128Parts.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, u128=u128)
+            UInt128Parts.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_I128:
             from .int128_parts import Int128Parts
 
-            i128 = Int128Parts.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, i128=i128)
+            Int128Parts.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_U256:
             from .u_int256_parts import UInt256Parts
 
-            u256 = UInt256Parts.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, u256=u256)
+            UInt256Parts.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_I256:
             from .int256_parts import Int256Parts
 
-            i256 = Int256Parts.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, i256=i256)
+            Int256Parts.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_BYTES:
             from .sc_bytes import SCBytes
 
-            bytes = SCBytes.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, bytes=bytes)
+            SCBytes.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_STRING:
             from .sc_string import SCString
 
-            str = SCString.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, str=str)
+            SCString.skip(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_SYMBOL:
             from .sc_symbol import SCSymbol
 
-            sym = SCSymbol.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, sym=sym)
+            SCSymbol.skip(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_VEC:
+            from .sc_vec import SCVec
+
+            if unpacker.unpack_uint():
+                SCVec.skip(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_MAP:
+            from .sc_map import SCMap
+
+            if unpacker.unpack_uint():
+                SCMap.skip(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_ADDRESS:
+            from .sc_address import SCAddress
+
+            SCAddress.skip(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_CONTRACT_INSTANCE:
+            from .sc_contract_instance import SCContractInstance
+
+            SCContractInstance.skip(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE:
+            return
+        if type == SCValType.SCV_LEDGER_KEY_NONCE:
+            from .sc_nonce_key import SCNonceKey
+
+            SCNonceKey.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCVal:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SCValType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SCValType.SCV_BOOL:
+            if "b" in fields:
+                _result["b"] = Boolean.unpack_fields(unpacker, fields["b"])
+            else:
+                Boolean.skip(unpacker)
+            return _result
+        if type == SCValType.SCV_VOID:
+            return _result
+        if type == SCValType.SCV_ERROR:
+            from .sc_error import SCError
+
+            if "error" in fields:
+                _result["error"] = SCError.unpack_fields(
+                    unpacker, fields["error"], depth_limit - 1
+                )
+            else:
+                SCError.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_U32:
+            from .uint32 import Uint32
+
+            if "u32" in fields:
+                _result["u32"] = Uint32.unpack_fields(
+                    unpacker, fields["u32"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_I32:
+            from .int32 import Int32
+
+            if "i32" in fields:
+                _result["i32"] = Int32.unpack_fields(
+                    unpacker, fields["i32"], depth_limit - 1
+                )
+            else:
+                Int32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_U64:
+            from .uint64 import Uint64
+
+            if "u64" in fields:
+                _result["u64"] = Uint64.unpack_fields(
+                    unpacker, fields["u64"], depth_limit - 1
+                )
+            else:
+                Uint64.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_I64:
+            from .int64 import Int64
+
+            if "i64" in fields:
+                _result["i64"] = Int64.unpack_fields(
+                    unpacker, fields["i64"], depth_limit - 1
+                )
+            else:
+                Int64.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_TIMEPOINT:
+            from .time_point import TimePoint
+
+            if "timepoint" in fields:
+                _result["timepoint"] = TimePoint.unpack_fields(
+                    unpacker, fields["timepoint"], depth_limit - 1
+                )
+            else:
+                TimePoint.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_DURATION:
+            from .duration import Duration
+
+            if "duration" in fields:
+                _result["duration"] = Duration.unpack_fields(
+                    unpacker, fields["duration"], depth_limit - 1
+                )
+            else:
+                Duration.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_U128:
+            from .u_int128_parts import UInt128Parts
+
+            if "u128" in fields:
+                _result["u128"] = UInt128Parts.unpack_fields(
+                    unpacker, fields["u128"], depth_limit - 1
+                )
+            else:
+                UInt128Parts.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_I128:
+            from .int128_parts import Int128Parts
+
+            if "i128" in fields:
+                _result["i128"] = Int128Parts.unpack_fields(
+                    unpacker, fields["i128"], depth_limit - 1
+                )
+            else:
+                Int128Parts.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_U256:
+            from .u_int256_parts import UInt256Parts
+
+            if "u256" in fields:
+                _result["u256"] = UInt256Parts.unpack_fields(
+                    unpacker, fields["u256"], depth_limit - 1
+                )
+            else:
+                UInt256Parts.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_I256:
+            from .int256_parts import Int256Parts
+
+            if "i256" in fields:
+                _result["i256"] = Int256Parts.unpack_fields(
+                    unpacker, fields["i256"], depth_limit - 1
+                )
+            else:
+                Int256Parts.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_BYTES:
+            from .sc_bytes import SCBytes
+
+            if "bytes" in fields:
+                _result["bytes"] = SCBytes.unpack_fields(
+                    unpacker, fields["bytes"], depth_limit - 1
+                )
+            else:
+                SCBytes.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_STRING:
+            from .sc_string import SCString
+
+            if "str" in fields:
+                _result["str"] = SCString.unpack_fields(
+                    unpacker, fields["str"], depth_limit - 1
+                )
+            else:
+                SCString.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_SYMBOL:
+            from .sc_symbol import SCSymbol
+
+            if "sym" in fields:
+                _result["sym"] = SCSymbol.unpack_fields(
+                    unpacker, fields["sym"], depth_limit - 1
+                )
+            else:
+                SCSymbol.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_VEC:
+            from .sc_vec import SCVec
+
+            if "vec" in fields:
+                _result["vec"] = (
+                    SCVec.unpack_fields(unpacker, fields["vec"], depth_limit - 1)
+                    if unpacker.unpack_uint()
+                    else None
+                )
+            else:
+                if unpacker.unpack_uint():
+                    SCVec.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_MAP:
+            from .sc_map import SCMap
+
+            if "map" in fields:
+                _result["map"] = (
+                    SCMap.unpack_fields(unpacker, fields["map"], depth_limit - 1)
+                    if unpacker.unpack_uint()
+                    else None
+                )
+            else:
+                if unpacker.unpack_uint():
+                    SCMap.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_ADDRESS:
+            from .sc_address import SCAddress
+
+            if "address" in fields:
+                _result["address"] = SCAddress.unpack_fields(
+                    unpacker, fields["address"], depth_limit - 1
+                )
+            else:
+                SCAddress.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_CONTRACT_INSTANCE:
+            from .sc_contract_instance import SCContractInstance
+
+            if "instance" in fields:
+                _result["instance"] = SCContractInstance.unpack_fields(
+                    unpacker, fields["instance"], depth_limit - 1
+                )
+            else:
+                SCContractInstance.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE:
+            return _result
+        if type == SCValType.SCV_LEDGER_KEY_NONCE:
+            from .sc_nonce_key import SCNonceKey
+
+            if "nonce_key" in fields:
+                _result["nonce_key"] = SCNonceKey.unpack_fields(
+                    unpacker, fields["nonce_key"], depth_limit - 1
+                )
+            else:
+                SCNonceKey.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SCValType.unpack(unpacker)
+        yield "type", type
+        if type == SCValType.SCV_BOOL:
+            yield "b", Boolean.unpack(unpacker)
+            return
+        if type == SCValType.SCV_VOID:
+            return
+        if type == SCValType.SCV_ERROR:
+            from .sc_error import SCError
+
+            yield "error", SCError.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_U32:
+            from .uint32 import Uint32
+
+            yield "u32", Uint32.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_I32:
+            from .int32 import Int32
+
+            yield "i32", Int32.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_U64:
+            from .uint64 import Uint64
+
+            yield "u64", Uint64.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_I64:
+            from .int64 import Int64
+
+            yield "i64", Int64.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_TIMEPOINT:
+            from .time_point import TimePoint
+
+            yield "timepoint", TimePoint.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_DURATION:
+            from .duration import Duration
+
+            yield "duration", Duration.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_U128:
+            from .u_int128_parts import UInt128Parts
+
+            yield "u128", UInt128Parts.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_I128:
+            from .int128_parts import Int128Parts
+
+            yield "i128", Int128Parts.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_U256:
+            from .u_int256_parts import UInt256Parts
+
+            yield "u256", UInt256Parts.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_I256:
+            from .int256_parts import Int256Parts
+
+            yield "i256", Int256Parts.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_BYTES:
+            from .sc_bytes import SCBytes
+
+            yield "bytes", SCBytes.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_STRING:
+            from .sc_string import SCString
+
+            yield "str", SCString.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCValType.SCV_SYMBOL:
+            from .sc_symbol import SCSymbol
+
+            yield "sym", SCSymbol.unpack(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_VEC:
             from .sc_vec import SCVec
 
-            vec = (
-                SCVec.unpack(unpacker, depth_limit - 1)
+            yield (
+                "vec",
+                view_at(SCVec, unpacker, depth_limit - 1)
                 if unpacker.unpack_uint()
-                else None
+                else None,
             )
-            return cls(type=type, vec=vec)
+            return
         if type == SCValType.SCV_MAP:
             from .sc_map import SCMap
 
-            map = (
-                SCMap.unpack(unpacker, depth_limit - 1)
+            yield (
+                "map",
+                view_at(SCMap, unpacker, depth_limit - 1)
                 if unpacker.unpack_uint()
-                else None
+                else None,
             )
-            return cls(type=type, map=map)
+            return
         if type == SCValType.SCV_ADDRESS:
             from .sc_address import SCAddress
 
-            address = SCAddress.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, address=address)
+            yield "address", SCAddress.unpack(unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_CONTRACT_INSTANCE:
             from .sc_contract_instance import SCContractInstance
 
-            instance = SCContractInstance.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, instance=instance)
+            yield "instance", view_at(SCContractInstance, unpacker, depth_limit - 1)
+            return
         if type == SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE:
-            return cls(type=type)
+            return
         if type == SCValType.SCV_LEDGER_KEY_NONCE:
             from .sc_nonce_key import SCNonceKey
 
-            nonce_key = SCNonceKey.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, nonce_key=nonce_key)
+            yield "nonce_key", SCNonceKey.unpack(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -387,10 +830,10 @@ class SCVal:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCVal:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCVal:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -405,11 +848,11 @@ class SCVal:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCVal:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == SCValType.SCV_BOOL:
@@ -598,6 +1041,177 @@ class SCVal:
             return cls(type=type, nonce_key=nonce_key)
         raise ValueError(f"Unknown key '{key}' for SCVal")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type in _NESTED_TYPES:
+            _write_json_nested(self, write)
+            return
+        if self.type == SCValType.SCV_BOOL:
+            assert self.b is not None
+            write('{"bool": ')
+            write(json_encode(Boolean.to_json_dict(self.b)))
+            write("}")
+            return
+        if self.type == SCValType.SCV_VOID:
+            write('"void"')
+            return
+        if self.type == SCValType.SCV_ERROR:
+            assert self.error is not None
+            write('{"error": ')
+            self.error._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_U32:
+            assert self.u32 is not None
+            write('{"u32": ')
+            self.u32._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_I32:
+            assert self.i32 is not None
+            write('{"i32": ')
+            self.i32._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_U64:
+            assert self.u64 is not None
+            write('{"u64": ')
+            self.u64._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_I64:
+            assert self.i64 is not None
+            write('{"i64": ')
+            self.i64._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_TIMEPOINT:
+            assert self.timepoint is not None
+            write('{"timepoint": ')
+            self.timepoint._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_DURATION:
+            assert self.duration is not None
+            write('{"duration": ')
+            self.duration._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_U128:
+            assert self.u128 is not None
+            write('{"u128": ')
+            self.u128._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_I128:
+            assert self.i128 is not None
+            write('{"i128": ')
+            self.i128._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_U256:
+            assert self.u256 is not None
+            write('{"u256": ')
+            self.u256._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_I256:
+            assert self.i256 is not None
+            write('{"i256": ')
+            self.i256._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_BYTES:
+            assert self.bytes is not None
+            write('{"bytes": ')
+            self.bytes._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_STRING:
+            assert self.str is not None
+            write('{"string": ')
+            self.str._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_SYMBOL:
+            assert self.sym is not None
+            write('{"symbol": ')
+            self.sym._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_VEC:
+            assert self.vec is not None
+            write('{"vec": ')
+            self.vec._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_MAP:
+            assert self.map is not None
+            write('{"map": ')
+            self.map._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_ADDRESS:
+            assert self.address is not None
+            write('{"address": ')
+            self.address._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_CONTRACT_INSTANCE:
+            assert self.instance is not None
+            write('{"contract_instance": ')
+            self.instance._write_json(write)
+            write("}")
+            return
+        if self.type == SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE:
+            write('"ledger_key_contract_instance"')
+            return
+        if self.type == SCValType.SCV_LEDGER_KEY_NONCE:
+            assert self.nonce_key is not None
+            write('{"ledger_key_nonce": ')
+            self.nonce_key._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SCVal: {self.type}")
+
+    def clone(self, deep: bool = True) -> SCVal:
+        if not deep:
+            return shallow_clone(self)
+        if self.type in _NESTED_TYPES:
+            return _clone_nested(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.b = self.b
+        result.error = self.error.clone() if self.error is not None else None
+        result.u32 = self.u32.clone() if self.u32 is not None else None
+        result.i32 = self.i32.clone() if self.i32 is not None else None
+        result.u64 = self.u64.clone() if self.u64 is not None else None
+        result.i64 = self.i64.clone() if self.i64 is not None else None
+        result.timepoint = (
+            self.timepoint.clone() if self.timepoint is not None else None
+        )
+        result.duration = self.duration.clone() if self.duration is not None else None
+        result.u128 = self.u128.clone() if self.u128 is not None else None
+        result.i128 = self.i128.clone() if self.i128 is not None else None
+        result.u256 = self.u256.clone() if self.u256 is not None else None
+        result.i256 = self.i256.clone() if self.i256 is not None else None
+        result.bytes = self.bytes.clone() if self.bytes is not None else None
+        result.str = self.str.clone() if self.str is not None else None
+        result.sym = self.sym.clone() if self.sym is not None else None
+        result.vec = self.vec.clone() if self.vec is not None else None
+        result.map = self.map.clone() if self.map is not None else None
+        result.address = self.address.clone() if self.address is not None else None
+        result.instance = self.instance.clone() if self.instance is not None else None
+        result.nonce_key = (
+            self.nonce_key.clone() if self.nonce_key is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCVal:
+        return self.clone()
+
+    def freeze(self) -> SCVal:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -628,6 +1242,8 @@ class SCVal:
     def __eq__(self, other: object):
         if not isinstance(other, self.__class__):
             return NotImplemented
+        if self.type in _NESTED_TYPES:
+            return _eq_nested(self, other)
         return (
             self.type == other.type
             and self.b == other.b
@@ -696,3 +1312,456 @@ class SCVal:
         if self.nonce_key is not None:
             out.append(f"nonce_key={self.nonce_key}")
         return f"<SCVal [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    return cls(type=type)
+
+
+def _unpack_b(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    b = Boolean.unpack(unpacker)
+    return cls(type=type, b=b)
+
+
+def _unpack_error(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    error = SCError.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, error=error)
+
+
+def _unpack_u32(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    u32 = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, u32=u32)
+
+
+def _unpack_i32(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    i32 = Int32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, i32=i32)
+
+
+def _unpack_u64(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    u64 = Uint64.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, u64=u64)
+
+
+def _unpack_i64(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    i64 = Int64.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, i64=i64)
+
+
+def _unpack_timepoint(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    timepoint = TimePoint.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, timepoint=timepoint)
+
+
+def _unpack_duration(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    duration = Duration.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, duration=duration)
+
+
+def _unpack_u128(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    u128 = UInt128Parts.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, u128=u128)
+
+
+def _unpack_i128(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    i128 = Int128Parts.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, i128=i128)
+
+
+def _unpack_u256(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    u256 = UInt256Parts.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, u256=u256)
+
+
+def _unpack_i256(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    i256 = Int256Parts.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, i256=i256)
+
+
+def _unpack_bytes(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    bytes = SCBytes.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, bytes=bytes)
+
+
+def _unpack_str(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    str = SCString.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, str=str)
+
+
+def _unpack_sym(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    sym = SCSymbol.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, sym=sym)
+
+
+def _unpack_address(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    address = SCAddress.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, address=address)
+
+
+def _unpack_instance(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    instance = SCContractInstance.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, instance=instance)
+
+
+def _unpack_nonce_key(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    nonce_key = SCNonceKey.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, nonce_key=nonce_key)
+
+
+# SCV_VEC and SCV_MAP values can nest as deep as the depth limit allows, so
+# they are decoded, encoded, sized, written as JSON, cloned and compared with
+# an explicit stack instead of recursing through SCVec, SCMap and SCMapEntry.
+# The depth limit is applied as if the recursive codec was used.
+_NESTED_TYPES = frozenset((SCValType.SCV_VEC, SCValType.SCV_MAP))
+
+
+def _unpack_nested(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+    # A frame is (is_vec, children, child_count, child_depth_limit) of a vec
+    # or map being decoded, the children of a map are its keys and values.
+    stack: list[tuple[bool, list[SCVal], int, int]] = []
+    while True:
+        if type in _NESTED_TYPES:
+            is_vec = type == SCValType.SCV_VEC
+            value_cls = SCVal if stack else cls
+            if not unpacker.unpack_uint():
+                value = (
+                    value_cls(type=type, vec=None)
+                    if is_vec
+                    else value_cls(type=type, map=None)
+                )
+            else:
+                if depth_limit <= 1:
+                    raise ValueError("Maximum decoding depth reached")
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"{'sc_vec' if is_vec else 'sc_map'} length {length} exceeds remaining input length {_remaining}"
+                    )
+                if length:
+                    # SCVal -> SCVec -> SCVal and SCVal -> SCMap -> SCMapEntry -> SCVal
+                    depth_limit -= 2 if is_vec else 3
+                    if depth_limit <= 0:
+                        raise ValueError("Maximum decoding depth reached")
+                    stack.append(
+                        (is_vec, [], length if is_vec else 2 * length, depth_limit)
+                    )
+                    type = SCValType.unpack(unpacker)
+                    continue
+                value = (
+                    value_cls(type=type, vec=SCVec([]))
+                    if is_vec
+                    else value_cls(type=type, map=SCMap([]))
+                )
+        else:
+            value = _UNPACK_ARMS[type](SCVal, type, unpacker, depth_limit)
+        while stack:
+            is_vec, children, count, depth_limit = stack[-1]
+            children.append(value)
+            if len(children) < count:
+                break
+            stack.pop()
+            value_cls = SCVal if stack else cls
+            if is_vec:
+                value = value_cls(type=SCValType.SCV_VEC, vec=SCVec(children))
+            else:
+                entries = [
+                    SCMapEntry(key=key, val=val)
+                    for key, val in zip(children[::2], children[1::2], strict=True)
+                ]
+                value = value_cls(type=SCValType.SCV_MAP, map=SCMap(entries))
+        else:
+            return value
+        type = SCValType.unpack(unpacker)
+
+
+def _pack_nested(sc_val: SCVal, packer: Packer) -> None:
+    # A frame is (is_map, items) of a vec or map being encoded, with the vec
+    # items or the map entries still to encode. Map keys, which are rarely
+    # vecs or maps themselves, are encoded by SCVal.pack.
+    stack: list[tuple[bool, Iterator]] = [(False, iter((sc_val,)))]
+    while stack:
+        is_map, items = stack[-1]
+        for value in items:
+            if is_map:
+                value.key.pack(packer)
+                value = value.val
+            if value.type not in _NESTED_TYPES:
+                value.pack(packer)
+                continue
+            value.type.pack(packer)
+            if value.type == SCValType.SCV_VEC:
+                if value.vec is None:
+                    packer.pack_uint(0)
+                    continue
+                packer.pack_uint(1)
+                packer.pack_uint(len(value.vec.sc_vec))
+                stack.append((False, iter(value.vec.sc_vec)))
+            else:
+                if value.map is None:
+                    packer.pack_uint(0)
+                    continue
+                packer.pack_uint(1)
+                packer.pack_uint(len(value.map.sc_map))
+                stack.append((True, iter(value.map.sc_map)))
+            break
+        else:
+            stack.pop()
+
+
+def _xdr_size_nested(sc_val: SCVal) -> int:
+    # Walks the vecs and maps like _pack_nested.
+    size = 0
+    stack: list[tuple[bool, Iterator]] = [(False, iter((sc_val,)))]
+    while stack:
+        is_map, items = stack[-1]
+        for value in items:
+            if is_map:
+                size += value.key.xdr_size()
+                value = value.val
+            if value.type not in _NESTED_TYPES:
+                size += value.xdr_size()
+                continue
+            # the type, the optional flag and the length
+            if value.type == SCValType.SCV_VEC:
+                if value.vec is None:
+                    size += 8
+                    continue
+                size += 12
+                stack.append((False, iter(value.vec.sc_vec)))
+            else:
+                if value.map is None:
+                    size += 8
+                    continue
+                size += 12
+                stack.append((True, iter(value.map.sc_map)))
+            break
+        else:
+            stack.pop()
+    return size
+
+
+def _write_json_nested(sc_val: SCVal, write: Callable[[str], object]) -> None:
+    # A frame is (is_map, items, closing) of a vec or map being written, with
+    # its (index, item) pairs still to write and the text that closes it.
+    stack: list[tuple[bool, Iterator, str]] = [(False, enumerate((sc_val,)), "")]
+    while stack:
+        is_map, items, _ = stack[-1]
+        for index, value in items:
+            if index:
+                write(", ")
+            if is_map:
+                write('{"key": ')
+                value.key._write_json(write)
+                write(', "val": ')
+                value = value.val
+            if value.type not in _NESTED_TYPES:
+                value._write_json(write)
+                if is_map:
+                    write("}")
+                continue
+            if value.type == SCValType.SCV_VEC:
+                assert value.vec is not None
+                write('{"vec": [')
+                stack.append((False, enumerate(value.vec.sc_vec), "]}"))
+            else:
+                assert value.map is not None
+                write('{"map": [')
+                stack.append((True, enumerate(value.map.sc_map), "]}"))
+            break
+        else:
+            write(stack.pop()[2])
+            # closes the map entry whose value this was
+            if stack and stack[-1][0]:
+                write("}")
+
+
+def _clone_nested(sc_val: SCVal) -> SCVal:
+    # A frame is (value, items, copies) of a vec or map being copied, with
+    # the vec items or map entries still to copy and the copies made so far,
+    # a key and a value for each map entry. Frozen values are thawed by their
+    # own clone.
+    if not _arm_types_imported:
+        _import_arm_types()
+    stack: list[tuple[SCVal, Iterator, list]] = []
+    value = sc_val
+    while True:
+        copy = None
+        if value.type not in _NESTED_TYPES or isinstance(value, FrozenXdr):
+            copy = value.clone()
+        elif value.type == SCValType.SCV_VEC and value.vec is not None:
+            stack.append((value, iter(value.vec.sc_vec), []))
+        elif value.type == SCValType.SCV_MAP and value.map is not None:
+            stack.append((value, iter(value.map.sc_map), []))
+        else:
+            copy = shallow_clone(value)
+        while True:
+            if copy is not None:
+                if not stack:
+                    return copy
+                stack[-1][2].append(copy)
+                copy = None
+            source, items, copies = stack[-1]
+            item = next(items, None)
+            if item is not None:
+                break
+            stack.pop()
+            copy = shallow_clone(source)
+            if source.type == SCValType.SCV_VEC:
+                copy.vec = SCVec(copies)
+            else:
+                copy.map = SCMap(
+                    [
+                        SCMapEntry(key=key, val=val)
+                        for key, val in zip(copies[::2], copies[1::2], strict=True)
+                    ]
+                )
+        if source.type == SCValType.SCV_MAP:
+            copies.append(item.key.clone())
+            item = item.val
+        value = item
+
+
+def _eq_nested(sc_val: SCVal, other: SCVal) -> bool:
+    # Compares the vec items and the map values pair by pair, and everything
+    # else, map keys included, with ==.
+    pairs = [(sc_val, other)]
+    while pairs:
+        value, other_value = pairs.pop()
+        if value is other_value:
+            continue
+        if (
+            value.type not in _NESTED_TYPES
+            or isinstance(value, FrozenXdr)
+            or isinstance(other_value, FrozenXdr)
+            or not isinstance(other_value, value.__class__)
+        ):
+            if value != other_value:
+                return False
+            continue
+        if value.type != other_value.type or any(
+            getattr(value, name) != getattr(other_value, name) for name in _SCALAR_SLOTS
+        ):
+            return False
+        if value.type == SCValType.SCV_VEC:
+            items, other_items = value.vec, other_value.vec
+            if items is None or other_items is None:
+                if items is not other_items:
+                    return False
+                continue
+            if len(items.sc_vec) != len(other_items.sc_vec):
+                return False
+            pairs.extend(zip(items.sc_vec, other_items.sc_vec, strict=True))
+        else:
+            entries, other_entries = value.map, other_value.map
+            if entries is None or other_entries is None:
+                if entries is not other_entries:
+                    return False
+                continue
+            if len(entries.sc_map) != len(other_entries.sc_map):
+                return False
+            for entry, other_entry in zip(
+                entries.sc_map, other_entries.sc_map, strict=True
+            ):
+                if entry.key != other_entry.key:
+                    return False
+                pairs.append((entry.val, other_entry.val))
+    return True
+
+
+# The members other than the type and the nested vec and map arms.
+_SCALAR_SLOTS = tuple(
+    name for name in SCVal.__slots__ if name not in ("type", "vec", "map")
+)
+
+
+_UNPACK_ARMS = {
+    SCValType.SCV_BOOL: _unpack_b,
+    SCValType.SCV_VOID: _unpack_void,
+    SCValType.SCV_ERROR: _unpack_error,
+    SCValType.SCV_U32: _unpack_u32,
+    SCValType.SCV_I32: _unpack_i32,
+    SCValType.SCV_U64: _unpack_u64,
+    SCValType.SCV_I64: _unpack_i64,
+    SCValType.SCV_TIMEPOINT: _unpack_timepoint,
+    SCValType.SCV_DURATION: _unpack_duration,
+    SCValType.SCV_U128: _unpack_u128,
+    SCValType.SCV_I128: _unpack_i128,
+    SCValType.SCV_U256: _unpack_u256,
+    SCValType.SCV_I256: _unpack_i256,
+    SCValType.SCV_BYTES: _unpack_bytes,
+    SCValType.SCV_STRING: _unpack_str,
+    SCValType.SCV_SYMBOL: _unpack_sym,
+    SCValType.SCV_VEC: _unpack_nested,
+    SCValType.SCV_MAP: _unpack_nested,
+    SCValType.SCV_ADDRESS: _unpack_address,
+    SCValType.SCV_CONTRACT_INSTANCE: _unpack_instance,
+    SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE: _unpack_void,
+    SCValType.SCV_LEDGER_KEY_NONCE: _unpack_nonce_key,
+}
+_arm_types_imported = False
+
+
+def _import_arm_types() -> None:
+    global _arm_types_imported
+    global SCError
+    from .sc_error import SCError
+
+    global Uint32
+    from .uint32 import Uint32
+
+    global Int32
+    from .int32 import Int32
+
+    global Uint64
+    from .uint64 import Uint64
+
+    global Int64
+    from .int64 import Int64
+
+    global TimePoint
+    from .time_point import TimePoint
+
+    global Duration
+    from .duration import Duration
+
+    global UInt128Parts
+    from .u_int128_parts import UInt128Parts
+
+    global Int128Parts
+    from .int128_parts import Int128Parts
+
+    global UInt256Parts
+    from .u_int256_parts import UInt256Parts
+
+    global Int256Parts
+    from .int256_parts import Int256Parts
+
+    global SCBytes
+    from .sc_bytes import SCBytes
+
+    global SCString
+    from .sc_string import SCString
+
+    global SCSymbol
+    from .sc_symbol import SCSymbol
+
+    global SCVec
+    from .sc_vec import SCVec
+
+    global SCMap
+    from .sc_map import SCMap
+
+    global SCMapEntry
+    from .sc_map_entry import SCMapEntry
+
+    global SCAddress
+    from .sc_address import SCAddress
+
+    global SCContractInstance
+    from .sc_contract_instance import SCContractInstance
+
+    global SCNonceKey
+    from .sc_nonce_key import SCNonceKey
+
+    _arm_types_imported = True
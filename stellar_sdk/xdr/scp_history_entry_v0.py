@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .ledger_scp_messages import LedgerSCPMessages
 from .scp_quorum_set import SCPQuorumSet
 
@@ -25,6 +40,8 @@ class SCPHistoryEntryV0:
         };
     """
 
+    __slots__ = ("ledger_messages", "quorum_sets")
+
     def __init__(
         self,
         quorum_sets: list[SCPQuorumSet],
@@ -44,6 +61,13 @@ class SCPHistoryEntryV0:
             quorum_sets_item.pack(packer)
         self.ledger_messages.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + sum(item.xdr_size() for item in self.quorum_sets)
+            + self.ledger_messages.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +89,102 @@ class SCPHistoryEntryV0:
             ledger_messages=ledger_messages,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPQuorumSet.skip(unpacker, depth_limit - 1)
+        LedgerSCPMessages.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPHistoryEntryV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "quorum_sets" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["quorum_sets"] = []
+            for _ in range(length):
+                _result["quorum_sets"].append(
+                    SCPQuorumSet.unpack_fields(
+                        unpacker, fields["quorum_sets"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPQuorumSet.skip(unpacker, depth_limit - 1)
+        if "ledger_messages" in fields:
+            _result["ledger_messages"] = LedgerSCPMessages.unpack_fields(
+                unpacker, fields["ledger_messages"], depth_limit - 1
+            )
+        else:
+            LedgerSCPMessages.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"quorum_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        quorum_sets = []
+        for _ in range(length):
+            quorum_sets.append(unpack_view(SCPQuorumSet, unpacker, depth_limit - 1))
+        yield "quorum_sets", quorum_sets
+        yield "ledger_messages", view_at(LedgerSCPMessages, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPHistoryEntryV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCPHistoryEntryV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +199,11 @@ class SCPHistoryEntryV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPHistoryEntryV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -112,6 +222,27 @@ class SCPHistoryEntryV0:
             ledger_messages=ledger_messages,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"quorum_sets": ')
+        write_json_array(write, self.quorum_sets)
+        write(', "ledger_messages": ')
+        self.ledger_messages._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPHistoryEntryV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.quorum_sets = [item.clone() for item in self.quorum_sets]
+        result.ledger_messages = self.ledger_messages.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPHistoryEntryV0:
+        return self.clone()
+
+    def freeze(self) -> SCPHistoryEntryV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
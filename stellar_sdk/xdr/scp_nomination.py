@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 from .value import Value
 
@@ -26,6 +39,8 @@ class SCPNomination:
         };
     """
 
+    __slots__ = ("accepted", "quorum_set_hash", "votes")
+
     def __init__(
         self,
         quorum_set_hash: Hash,
@@ -55,6 +70,15 @@ class SCPNomination:
         for accepted_item in self.accepted:
             accepted_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            32
+            + 4
+            + sum(item.xdr_size() for item in self.votes)
+            + 4
+            + sum(item.xdr_size() for item in self.accepted)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -86,16 +110,137 @@ class SCPNomination:
             accepted=accepted,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"votes length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Value.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"accepted length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Value.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPNomination:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "quorum_set_hash" in fields:
+            _result["quorum_set_hash"] = Hash.unpack_fields(
+                unpacker, fields["quorum_set_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "votes" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"votes length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["votes"] = []
+            for _ in range(length):
+                _result["votes"].append(
+                    Value.unpack_fields(unpacker, fields["votes"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"votes length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Value.skip(unpacker, depth_limit - 1)
+        if "accepted" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"accepted length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["accepted"] = []
+            for _ in range(length):
+                _result["accepted"].append(
+                    Value.unpack_fields(unpacker, fields["accepted"], depth_limit - 1)
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"accepted length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Value.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "quorum_set_hash", Hash.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"votes length {length} exceeds remaining input length {_remaining}"
+            )
+        votes = []
+        for _ in range(length):
+            votes.append(Value.unpack(unpacker, depth_limit - 1))
+        yield "votes", votes
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"accepted length {length} exceeds remaining input length {_remaining}"
+            )
+        accepted = []
+        for _ in range(length):
+            accepted.append(Value.unpack(unpacker, depth_limit - 1))
+        yield "accepted", accepted
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPNomination:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCPNomination:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -110,11 +255,11 @@ class SCPNomination:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPNomination:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -134,6 +279,30 @@ class SCPNomination:
             accepted=accepted,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"quorum_set_hash": ')
+        self.quorum_set_hash._write_json(write)
+        write(', "votes": ')
+        write_json_array(write, self.votes)
+        write(', "accepted": ')
+        write_json_array(write, self.accepted)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPNomination:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.quorum_set_hash = self.quorum_set_hash.clone()
+        result.votes = [item.clone() for item in self.votes]
+        result.accepted = [item.clone() for item in self.accepted]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPNomination:
+        return self.clone()
+
+    def freeze(self) -> SCPNomination:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .node_id import NodeID
 from .uint32 import Uint32
 
@@ -26,6 +40,8 @@ class SCPQuorumSet:
         };
     """
 
+    __slots__ = ("inner_sets", "threshold", "validators")
+
     def __init__(
         self,
         threshold: Uint32,
@@ -55,6 +71,15 @@ class SCPQuorumSet:
         for inner_sets_item in self.inner_sets:
             inner_sets_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + 4
+            + sum(item.xdr_size() for item in self.validators)
+            + 4
+            + sum(item.xdr_size() for item in self.inner_sets)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -86,16 +111,141 @@ class SCPQuorumSet:
             inner_sets=inner_sets,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"validators length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            NodeID.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"inner_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SCPQuorumSet.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPQuorumSet:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "threshold" in fields:
+            _result["threshold"] = Uint32.unpack_fields(
+                unpacker, fields["threshold"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "validators" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"validators length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["validators"] = []
+            for _ in range(length):
+                _result["validators"].append(
+                    NodeID.unpack_fields(
+                        unpacker, fields["validators"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"validators length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                NodeID.skip(unpacker, depth_limit - 1)
+        if "inner_sets" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"inner_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["inner_sets"] = []
+            for _ in range(length):
+                _result["inner_sets"].append(
+                    SCPQuorumSet.unpack_fields(
+                        unpacker, fields["inner_sets"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"inner_sets length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SCPQuorumSet.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "threshold", Uint32.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"validators length {length} exceeds remaining input length {_remaining}"
+            )
+        validators = []
+        for _ in range(length):
+            validators.append(NodeID.unpack(unpacker, depth_limit - 1))
+        yield "validators", validators
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"inner_sets length {length} exceeds remaining input length {_remaining}"
+            )
+        inner_sets = []
+        for _ in range(length):
+            inner_sets.append(unpack_view(SCPQuorumSet, unpacker, depth_limit - 1))
+        yield "inner_sets", inner_sets
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPQuorumSet:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCPQuorumSet:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -110,11 +260,11 @@ class SCPQuorumSet:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPQuorumSet:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -136,6 +286,30 @@ class SCPQuorumSet:
             inner_sets=inner_sets,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"threshold": ')
+        self.threshold._write_json(write)
+        write(', "validators": ')
+        write_json_array(write, self.validators)
+        write(', "inner_sets": ')
+        write_json_array(write, self.inner_sets)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPQuorumSet:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.threshold = self.threshold.clone()
+        result.validators = [item.clone() for item in self.validators]
+        result.inner_sets = [item.clone() for item in self.inner_sets]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPQuorumSet:
+        return self.clone()
+
+    def freeze(self) -> SCPQuorumSet:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .node_id import NodeID
 from .scp_statement_pledges import SCPStatementPledges
 from .uint64 import Uint64
@@ -59,6 +72,8 @@ class SCPStatement:
         };
     """
 
+    __slots__ = ("node_id", "pledges", "slot_index")
+
     def __init__(
         self,
         node_id: NodeID,
@@ -74,6 +89,9 @@ class SCPStatement:
         self.slot_index.pack(packer)
         self.pledges.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.node_id.xdr_size() + self.pledges.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -89,16 +107,75 @@ class SCPStatement:
             pledges=pledges,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        NodeID.skip(unpacker, depth_limit - 1)
+        Uint64.skip(unpacker, depth_limit - 1)
+        SCPStatementPledges.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPStatement:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "node_id" in fields:
+            _result["node_id"] = NodeID.unpack_fields(
+                unpacker, fields["node_id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "slot_index" in fields:
+            _result["slot_index"] = Uint64.unpack_fields(
+                unpacker, fields["slot_index"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "pledges" in fields:
+            _result["pledges"] = SCPStatementPledges.unpack_fields(
+                unpacker, fields["pledges"], depth_limit - 1
+            )
+        else:
+            SCPStatementPledges.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "node_id", NodeID.unpack(unpacker, depth_limit - 1)
+        yield "slot_index", Uint64.unpack(unpacker, depth_limit - 1)
+        yield "pledges", view_at(SCPStatementPledges, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPStatement:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SCPStatement:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -113,11 +190,11 @@ class SCPStatement:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPStatement:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -137,6 +214,30 @@ class SCPStatement:
             pledges=pledges,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"node_id": ')
+        self.node_id._write_json(write)
+        write(', "slot_index": ')
+        self.slot_index._write_json(write)
+        write(', "pledges": ')
+        self.pledges._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPStatement:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.node_id = self.node_id.clone()
+        result.slot_index = self.slot_index.clone()
+        result.pledges = self.pledges.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPStatement:
+        return self.clone()
+
+    def freeze(self) -> SCPStatement:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
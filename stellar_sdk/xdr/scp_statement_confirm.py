@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .scp_ballot import SCPBallot
 from .uint32 import Uint32
@@ -29,6 +39,8 @@ class SCPStatementConfirm:
                 }
     """
 
+    __slots__ = ("ballot", "n_commit", "n_h", "n_prepared", "quorum_set_hash")
+
     def __init__(
         self,
         ballot: SCPBallot,
@@ -50,6 +62,9 @@ class SCPStatementConfirm:
         self.n_h.pack(packer)
         self.quorum_set_hash.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 44 + self.ballot.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -69,16 +84,79 @@ class SCPStatementConfirm:
             quorum_set_hash=quorum_set_hash,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCPBallot.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPStatementConfirm:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ballot" in fields:
+            _result["ballot"] = SCPBallot.unpack_fields(
+                unpacker, fields["ballot"], depth_limit - 1
+            )
+        else:
+            SCPBallot.skip(unpacker, depth_limit - 1)
+        if "n_prepared" in fields:
+            _result["n_prepared"] = Uint32.unpack_fields(
+                unpacker, fields["n_prepared"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_commit" in fields:
+            _result["n_commit"] = Uint32.unpack_fields(
+                unpacker, fields["n_commit"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_h" in fields:
+            _result["n_h"] = Uint32.unpack_fields(
+                unpacker, fields["n_h"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "quorum_set_hash" in fields:
+            _result["quorum_set_hash"] = Hash.unpack_fields(
+                unpacker, fields["quorum_set_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPStatementConfirm:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCPStatementConfirm:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -93,11 +171,11 @@ class SCPStatementConfirm:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPStatementConfirm:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -123,6 +201,36 @@ class SCPStatementConfirm:
             quorum_set_hash=quorum_set_hash,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ballot": ')
+        self.ballot._write_json(write)
+        write(', "n_prepared": ')
+        self.n_prepared._write_json(write)
+        write(', "n_commit": ')
+        self.n_commit._write_json(write)
+        write(', "n_h": ')
+        self.n_h._write_json(write)
+        write(', "quorum_set_hash": ')
+        self.quorum_set_hash._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPStatementConfirm:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ballot = self.ballot.clone()
+        result.n_prepared = self.n_prepared.clone()
+        result.n_commit = self.n_commit.clone()
+        result.n_h = self.n_h.clone()
+        result.quorum_set_hash = self.quorum_set_hash.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPStatementConfirm:
+        return self.clone()
+
+    def freeze(self) -> SCPStatementConfirm:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
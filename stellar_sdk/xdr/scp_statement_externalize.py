@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .scp_ballot import SCPBallot
 from .uint32 import Uint32
@@ -27,6 +37,8 @@ class SCPStatementExternalize:
                 }
     """
 
+    __slots__ = ("commit", "commit_quorum_set_hash", "n_h")
+
     def __init__(
         self,
         commit: SCPBallot,
@@ -42,6 +54,9 @@ class SCPStatementExternalize:
         self.n_h.pack(packer)
         self.commit_quorum_set_hash.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 36 + self.commit.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +72,65 @@ class SCPStatementExternalize:
             commit_quorum_set_hash=commit_quorum_set_hash,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCPBallot.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPStatementExternalize:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "commit" in fields:
+            _result["commit"] = SCPBallot.unpack_fields(
+                unpacker, fields["commit"], depth_limit - 1
+            )
+        else:
+            SCPBallot.skip(unpacker, depth_limit - 1)
+        if "n_h" in fields:
+            _result["n_h"] = Uint32.unpack_fields(
+                unpacker, fields["n_h"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "commit_quorum_set_hash" in fields:
+            _result["commit_quorum_set_hash"] = Hash.unpack_fields(
+                unpacker, fields["commit_quorum_set_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPStatementExternalize:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCPStatementExternalize:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +145,11 @@ class SCPStatementExternalize:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPStatementExternalize:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -107,6 +171,30 @@ class SCPStatementExternalize:
             commit_quorum_set_hash=commit_quorum_set_hash,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"commit": ')
+        self.commit._write_json(write)
+        write(', "n_h": ')
+        self.n_h._write_json(write)
+        write(', "commit_quorum_set_hash": ')
+        self.commit_quorum_set_hash._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPStatementExternalize:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.commit = self.commit.clone()
+        result.n_h = self.n_h.clone()
+        result.commit_quorum_set_hash = self.commit_quorum_set_hash.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPStatementExternalize:
+        return self.clone()
+
+    def freeze(self) -> SCPStatementExternalize:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
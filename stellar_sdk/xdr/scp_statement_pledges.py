@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .scp_nomination import SCPNomination
 from .scp_statement_confirm import SCPStatementConfirm
 from .scp_statement_externalize import SCPStatementExternalize
@@ -54,6 +67,8 @@ class SCPStatementPledges:
             }
     """
 
+    __slots__ = ("confirm", "externalize", "nominate", "prepare", "type")
+
     def __init__(
         self,
         type: SCPStatementType,
@@ -92,25 +107,133 @@ class SCPStatementPledges:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SCPStatementType.SCP_ST_PREPARE:
+            assert self.prepare is not None
+            return 4 + self.prepare.xdr_size()
+        if self.type == SCPStatementType.SCP_ST_CONFIRM:
+            assert self.confirm is not None
+            return 4 + self.confirm.xdr_size()
+        if self.type == SCPStatementType.SCP_ST_EXTERNALIZE:
+            assert self.externalize is not None
+            return 4 + self.externalize.xdr_size()
+        if self.type == SCPStatementType.SCP_ST_NOMINATE:
+            assert self.nominate is not None
+            return 4 + self.nominate.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SCPStatementPledges:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SCPStatementType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SCPStatementType.unpack(unpacker)
         if type == SCPStatementType.SCP_ST_PREPARE:
-            prepare = SCPStatementPrepare.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, prepare=prepare)
+            SCPStatementPrepare.skip(unpacker, depth_limit - 1)
+            return
         if type == SCPStatementType.SCP_ST_CONFIRM:
-            confirm = SCPStatementConfirm.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, confirm=confirm)
+            SCPStatementConfirm.skip(unpacker, depth_limit - 1)
+            return
         if type == SCPStatementType.SCP_ST_EXTERNALIZE:
-            externalize = SCPStatementExternalize.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, externalize=externalize)
+            SCPStatementExternalize.skip(unpacker, depth_limit - 1)
+            return
         if type == SCPStatementType.SCP_ST_NOMINATE:
-            nominate = SCPNomination.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, nominate=nominate)
+            SCPNomination.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPStatementPledges:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SCPStatementType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SCPStatementType.SCP_ST_PREPARE:
+            if "prepare" in fields:
+                _result["prepare"] = SCPStatementPrepare.unpack_fields(
+                    unpacker, fields["prepare"], depth_limit - 1
+                )
+            else:
+                SCPStatementPrepare.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCPStatementType.SCP_ST_CONFIRM:
+            if "confirm" in fields:
+                _result["confirm"] = SCPStatementConfirm.unpack_fields(
+                    unpacker, fields["confirm"], depth_limit - 1
+                )
+            else:
+                SCPStatementConfirm.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCPStatementType.SCP_ST_EXTERNALIZE:
+            if "externalize" in fields:
+                _result["externalize"] = SCPStatementExternalize.unpack_fields(
+                    unpacker, fields["externalize"], depth_limit - 1
+                )
+            else:
+                SCPStatementExternalize.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SCPStatementType.SCP_ST_NOMINATE:
+            if "nominate" in fields:
+                _result["nominate"] = SCPNomination.unpack_fields(
+                    unpacker, fields["nominate"], depth_limit - 1
+                )
+            else:
+                SCPNomination.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SCPStatementType.unpack(unpacker)
+        yield "type", type
+        if type == SCPStatementType.SCP_ST_PREPARE:
+            yield "prepare", SCPStatementPrepare.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCPStatementType.SCP_ST_CONFIRM:
+            yield "confirm", SCPStatementConfirm.unpack(unpacker, depth_limit - 1)
+            return
+        if type == SCPStatementType.SCP_ST_EXTERNALIZE:
+            yield (
+                "externalize",
+                SCPStatementExternalize.unpack(unpacker, depth_limit - 1),
+            )
+            return
+        if type == SCPStatementType.SCP_ST_NOMINATE:
+            yield "nominate", view_at(SCPNomination, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -119,10 +242,12 @@ class SCPStatementPledges:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPStatementPledges:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCPStatementPledges:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -137,11 +262,11 @@ class SCPStatementPledges:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPStatementPledges:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == SCPStatementType.SCP_ST_PREPARE:
@@ -182,6 +307,52 @@ class SCPStatementPledges:
             return cls(type=type, nominate=nominate)
         raise ValueError(f"Unknown key '{key}' for SCPStatementPledges")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == SCPStatementType.SCP_ST_PREPARE:
+            assert self.prepare is not None
+            write('{"prepare": ')
+            self.prepare._write_json(write)
+            write("}")
+            return
+        if self.type == SCPStatementType.SCP_ST_CONFIRM:
+            assert self.confirm is not None
+            write('{"confirm": ')
+            self.confirm._write_json(write)
+            write("}")
+            return
+        if self.type == SCPStatementType.SCP_ST_EXTERNALIZE:
+            assert self.externalize is not None
+            write('{"externalize": ')
+            self.externalize._write_json(write)
+            write("}")
+            return
+        if self.type == SCPStatementType.SCP_ST_NOMINATE:
+            assert self.nominate is not None
+            write('{"nominate": ')
+            self.nominate._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SCPStatementPledges: {self.type}")
+
+    def clone(self, deep: bool = True) -> SCPStatementPledges:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.prepare = self.prepare.clone() if self.prepare is not None else None
+        result.confirm = self.confirm.clone() if self.confirm is not None else None
+        result.externalize = (
+            self.externalize.clone() if self.externalize is not None else None
+        )
+        result.nominate = self.nominate.clone() if self.nominate is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPStatementPledges:
+        return self.clone()
+
+    def freeze(self) -> SCPStatementPledges:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -216,3 +387,39 @@ class SCPStatementPledges:
         if self.nominate is not None:
             out.append(f"nominate={self.nominate}")
         return f"<SCPStatementPledges [{', '.join(out)}]>"
+
+
+def _unpack_prepare(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SCPStatementPledges:
+    prepare = SCPStatementPrepare.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, prepare=prepare)
+
+
+def _unpack_confirm(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SCPStatementPledges:
+    confirm = SCPStatementConfirm.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, confirm=confirm)
+
+
+def _unpack_externalize(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SCPStatementPledges:
+    externalize = SCPStatementExternalize.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, externalize=externalize)
+
+
+def _unpack_nominate(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SCPStatementPledges:
+    nominate = SCPNomination.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, nominate=nominate)
+
+
+_UNPACK_ARMS = {
+    SCPStatementType.SCP_ST_PREPARE: _unpack_prepare,
+    SCPStatementType.SCP_ST_CONFIRM: _unpack_confirm,
+    SCPStatementType.SCP_ST_EXTERNALIZE: _unpack_externalize,
+    SCPStatementType.SCP_ST_NOMINATE: _unpack_nominate,
+}
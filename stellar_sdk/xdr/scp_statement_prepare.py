@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .scp_ballot import SCPBallot
 from .uint32 import Uint32
@@ -30,6 +40,15 @@ class SCPStatementPrepare:
                 }
     """
 
+    __slots__ = (
+        "ballot",
+        "n_c",
+        "n_h",
+        "prepared",
+        "prepared_prime",
+        "quorum_set_hash",
+    )
+
     def __init__(
         self,
         quorum_set_hash: Hash,
@@ -62,6 +81,16 @@ class SCPStatementPrepare:
         self.n_c.pack(packer)
         self.n_h.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            40
+            + self.ballot.xdr_size()
+            + 4
+            + (self.prepared.xdr_size() if self.prepared is not None else 0)
+            + 4
+            + (self.prepared_prime.xdr_size() if self.prepared_prime is not None else 0)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -91,16 +120,96 @@ class SCPStatementPrepare:
             n_h=n_h,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        SCPBallot.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            SCPBallot.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            SCPBallot.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SCPStatementPrepare:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "quorum_set_hash" in fields:
+            _result["quorum_set_hash"] = Hash.unpack_fields(
+                unpacker, fields["quorum_set_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "ballot" in fields:
+            _result["ballot"] = SCPBallot.unpack_fields(
+                unpacker, fields["ballot"], depth_limit - 1
+            )
+        else:
+            SCPBallot.skip(unpacker, depth_limit - 1)
+        if "prepared" in fields:
+            _result["prepared"] = (
+                SCPBallot.unpack_fields(unpacker, fields["prepared"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                SCPBallot.skip(unpacker, depth_limit - 1)
+        if "prepared_prime" in fields:
+            _result["prepared_prime"] = (
+                SCPBallot.unpack_fields(
+                    unpacker, fields["prepared_prime"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                SCPBallot.skip(unpacker, depth_limit - 1)
+        if "n_c" in fields:
+            _result["n_c"] = Uint32.unpack_fields(
+                unpacker, fields["n_c"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "n_h" in fields:
+            _result["n_h"] = Uint32.unpack_fields(
+                unpacker, fields["n_h"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SCPStatementPrepare:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SCPStatementPrepare:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -115,11 +224,11 @@ class SCPStatementPrepare:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SCPStatementPrepare:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -160,6 +269,47 @@ class SCPStatementPrepare:
             n_h=n_h,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"quorum_set_hash": ')
+        self.quorum_set_hash._write_json(write)
+        write(', "ballot": ')
+        self.ballot._write_json(write)
+        write(', "prepared": ')
+        if self.prepared is None:
+            write("null")
+        else:
+            self.prepared._write_json(write)
+        write(', "prepared_prime": ')
+        if self.prepared_prime is None:
+            write("null")
+        else:
+            self.prepared_prime._write_json(write)
+        write(', "n_c": ')
+        self.n_c._write_json(write)
+        write(', "n_h": ')
+        self.n_h._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SCPStatementPrepare:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.quorum_set_hash = self.quorum_set_hash.clone()
+        result.ballot = self.ballot.clone()
+        result.prepared = self.prepared.clone() if self.prepared is not None else None
+        result.prepared_prime = (
+            self.prepared_prime.clone() if self.prepared_prime is not None else None
+        )
+        result.n_c = self.n_c.clone()
+        result.n_h = self.n_h.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SCPStatementPrepare:
+        return self.clone()
+
+    def freeze(self) -> SCPStatementPrepare:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">II")
 __all__ = ["SendMoreExtended"]
 
 
@@ -24,6 +36,8 @@ class SendMoreExtended:
         };
     """
 
+    __slots__ = ("num_bytes", "num_messages")
+
     def __init__(
         self,
         num_messages: Uint32,
@@ -33,8 +47,10 @@ class SendMoreExtended:
         self.num_bytes = num_bytes
 
     def pack(self, packer: Packer) -> None:
-        self.num_messages.pack(packer)
-        self.num_bytes.pack(packer)
+        _LAYOUT.write(packer, self.num_messages.uint32, self.num_bytes.uint32)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -42,23 +58,63 @@ class SendMoreExtended:
     ) -> SendMoreExtended:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        num_messages = Uint32.unpack(unpacker, depth_limit - 1)
-        num_bytes = Uint32.unpack(unpacker, depth_limit - 1)
+        num_messages, num_bytes = _LAYOUT.read(unpacker)
         return cls(
-            num_messages=num_messages,
-            num_bytes=num_bytes,
+            num_messages=Uint32(num_messages),
+            num_bytes=Uint32(num_bytes),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SendMoreExtended:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "num_messages" in fields:
+            _result["num_messages"] = Uint32.unpack_fields(
+                unpacker, fields["num_messages"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "num_bytes" in fields:
+            _result["num_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["num_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SendMoreExtended:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SendMoreExtended:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +129,11 @@ class SendMoreExtended:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SendMoreExtended:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +150,27 @@ class SendMoreExtended:
             num_bytes=num_bytes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"num_messages": ')
+        self.num_messages._write_json(write)
+        write(', "num_bytes": ')
+        self.num_bytes._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SendMoreExtended:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.num_messages = self.num_messages.clone()
+        result.num_bytes = self.num_bytes.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SendMoreExtended:
+        return self.clone()
+
+    def freeze(self) -> SendMoreExtended:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 
+_LAYOUT = FixedLayout(">q")
 __all__ = ["SequenceNumber"]
 
 
@@ -20,11 +32,16 @@ class SequenceNumber:
         typedef int64 SequenceNumber;
     """
 
+    __slots__ = ("sequence_number",)
+
     def __init__(self, sequence_number: Int64) -> None:
         self.sequence_number = sequence_number
 
     def pack(self, packer: Packer) -> None:
-        self.sequence_number.pack(packer)
+        _LAYOUT.write(packer, self.sequence_number.int64)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -32,8 +49,41 @@ class SequenceNumber:
     ) -> SequenceNumber:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        sequence_number = Int64.unpack(unpacker, depth_limit - 1)
-        return cls(sequence_number)
+        (sequence_number,) = _LAYOUT.read(unpacker)
+        return cls(Int64(sequence_number))
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SequenceNumber:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sequence_number" in fields:
+            _result["sequence_number"] = Int64.unpack_fields(
+                unpacker, fields["sequence_number"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -41,10 +91,10 @@ class SequenceNumber:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SequenceNumber:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SequenceNumber:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -59,11 +109,11 @@ class SequenceNumber:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SequenceNumber:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return self.sequence_number.to_json_dict()
@@ -72,6 +122,22 @@ class SequenceNumber:
     def from_json_dict(cls, json_value: str) -> SequenceNumber:
         return cls(Int64.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        self.sequence_number._write_json(write)
+
+    def clone(self, deep: bool = True) -> SequenceNumber:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sequence_number = self.sequence_number.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SequenceNumber:
+        return self.clone()
+
+    def freeze(self) -> SequenceNumber:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.sequence_number,))
 
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .binary_fuse_filter_type import BinaryFuseFilterType
 from .short_hash_seed import ShortHashSeed
 from .uint32 import Uint32
@@ -39,6 +51,18 @@ class SerializedBinaryFuseFilter:
         };
     """
 
+    __slots__ = (
+        "filter_seed",
+        "fingerprint_length",
+        "fingerprints",
+        "input_hash_seed",
+        "segement_length_mask",
+        "segment_count",
+        "segment_count_length",
+        "segment_length",
+        "type",
+    )
+
     def __init__(
         self,
         type: BinaryFuseFilterType,
@@ -77,6 +101,9 @@ class SerializedBinaryFuseFilter:
         self.fingerprint_length.pack(packer)
         Opaque(self.fingerprints, 4294967295, False).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 56 + 4 + (len(self.fingerprints) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -104,16 +131,107 @@ class SerializedBinaryFuseFilter:
             fingerprints=fingerprints,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        BinaryFuseFilterType.skip(unpacker)
+        ShortHashSeed.skip(unpacker, depth_limit - 1)
+        ShortHashSeed.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Opaque.skip(unpacker, 4294967295, False)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SerializedBinaryFuseFilter:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "type" in fields:
+            _result["type"] = BinaryFuseFilterType.unpack_fields(
+                unpacker, fields["type"]
+            )
+        else:
+            BinaryFuseFilterType.skip(unpacker)
+        if "input_hash_seed" in fields:
+            _result["input_hash_seed"] = ShortHashSeed.unpack_fields(
+                unpacker, fields["input_hash_seed"], depth_limit - 1
+            )
+        else:
+            ShortHashSeed.skip(unpacker, depth_limit - 1)
+        if "filter_seed" in fields:
+            _result["filter_seed"] = ShortHashSeed.unpack_fields(
+                unpacker, fields["filter_seed"], depth_limit - 1
+            )
+        else:
+            ShortHashSeed.skip(unpacker, depth_limit - 1)
+        if "segment_length" in fields:
+            _result["segment_length"] = Uint32.unpack_fields(
+                unpacker, fields["segment_length"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "segement_length_mask" in fields:
+            _result["segement_length_mask"] = Uint32.unpack_fields(
+                unpacker, fields["segement_length_mask"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "segment_count" in fields:
+            _result["segment_count"] = Uint32.unpack_fields(
+                unpacker, fields["segment_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "segment_count_length" in fields:
+            _result["segment_count_length"] = Uint32.unpack_fields(
+                unpacker, fields["segment_count_length"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "fingerprint_length" in fields:
+            _result["fingerprint_length"] = Uint32.unpack_fields(
+                unpacker, fields["fingerprint_length"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "fingerprints" in fields:
+            _result["fingerprints"] = Opaque.unpack_fields(
+                unpacker, fields["fingerprints"], 4294967295, False
+            )
+        else:
+            Opaque.skip(unpacker, 4294967295, False)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SerializedBinaryFuseFilter:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SerializedBinaryFuseFilter:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -128,11 +246,11 @@ class SerializedBinaryFuseFilter:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SerializedBinaryFuseFilter:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -170,6 +288,48 @@ class SerializedBinaryFuseFilter:
             fingerprints=fingerprints,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"type": ')
+        self.type._write_json(write)
+        write(', "input_hash_seed": ')
+        self.input_hash_seed._write_json(write)
+        write(', "filter_seed": ')
+        self.filter_seed._write_json(write)
+        write(', "segment_length": ')
+        self.segment_length._write_json(write)
+        write(', "segement_length_mask": ')
+        self.segement_length_mask._write_json(write)
+        write(', "segment_count": ')
+        self.segment_count._write_json(write)
+        write(', "segment_count_length": ')
+        self.segment_count_length._write_json(write)
+        write(', "fingerprint_length": ')
+        self.fingerprint_length._write_json(write)
+        write(', "fingerprints": ')
+        write(json_encode(Opaque.to_json_dict(self.fingerprints)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> SerializedBinaryFuseFilter:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.input_hash_seed = self.input_hash_seed.clone()
+        result.filter_seed = self.filter_seed.clone()
+        result.segment_length = self.segment_length.clone()
+        result.segement_length_mask = self.segement_length_mask.clone()
+        result.segment_count = self.segment_count.clone()
+        result.segment_count_length = self.segment_count_length.clone()
+        result.fingerprint_length = self.fingerprint_length.clone()
+        result.fingerprints = self.fingerprints
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SerializedBinaryFuseFilter:
+        return self.clone()
+
+    def freeze(self) -> SerializedBinaryFuseFilter:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .signer import Signer
 from .string32 import String32
 from .uint32 import Uint32
@@ -41,6 +51,18 @@ class SetOptionsOp:
         };
     """
 
+    __slots__ = (
+        "clear_flags",
+        "high_threshold",
+        "home_domain",
+        "inflation_dest",
+        "low_threshold",
+        "master_weight",
+        "med_threshold",
+        "set_flags",
+        "signer",
+    )
+
     def __init__(
         self,
         inflation_dest: AccountID | None,
@@ -110,6 +132,28 @@ class SetOptionsOp:
             packer.pack_uint(1)
             self.signer.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (self.inflation_dest.xdr_size() if self.inflation_dest is not None else 0)
+            + 4
+            + (4 if self.clear_flags is not None else 0)
+            + 4
+            + (4 if self.set_flags is not None else 0)
+            + 4
+            + (4 if self.master_weight is not None else 0)
+            + 4
+            + (4 if self.low_threshold is not None else 0)
+            + 4
+            + (4 if self.med_threshold is not None else 0)
+            + 4
+            + (4 if self.high_threshold is not None else 0)
+            + 4
+            + (self.home_domain.xdr_size() if self.home_domain is not None else 0)
+            + 4
+            + (self.signer.xdr_size() if self.signer is not None else 0)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -159,16 +203,145 @@ class SetOptionsOp:
             signer=signer,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            AccountID.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Uint32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            String32.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            Signer.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SetOptionsOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "inflation_dest" in fields:
+            _result["inflation_dest"] = (
+                AccountID.unpack_fields(
+                    unpacker, fields["inflation_dest"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                AccountID.skip(unpacker, depth_limit - 1)
+        if "clear_flags" in fields:
+            _result["clear_flags"] = (
+                Uint32.unpack_fields(unpacker, fields["clear_flags"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Uint32.skip(unpacker, depth_limit - 1)
+        if "set_flags" in fields:
+            _result["set_flags"] = (
+                Uint32.unpack_fields(unpacker, fields["set_flags"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Uint32.skip(unpacker, depth_limit - 1)
+        if "master_weight" in fields:
+            _result["master_weight"] = (
+                Uint32.unpack_fields(unpacker, fields["master_weight"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Uint32.skip(unpacker, depth_limit - 1)
+        if "low_threshold" in fields:
+            _result["low_threshold"] = (
+                Uint32.unpack_fields(unpacker, fields["low_threshold"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Uint32.skip(unpacker, depth_limit - 1)
+        if "med_threshold" in fields:
+            _result["med_threshold"] = (
+                Uint32.unpack_fields(unpacker, fields["med_threshold"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Uint32.skip(unpacker, depth_limit - 1)
+        if "high_threshold" in fields:
+            _result["high_threshold"] = (
+                Uint32.unpack_fields(
+                    unpacker, fields["high_threshold"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Uint32.skip(unpacker, depth_limit - 1)
+        if "home_domain" in fields:
+            _result["home_domain"] = (
+                String32.unpack_fields(unpacker, fields["home_domain"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                String32.skip(unpacker, depth_limit - 1)
+        if "signer" in fields:
+            _result["signer"] = (
+                Signer.unpack_fields(unpacker, fields["signer"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Signer.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SetOptionsOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SetOptionsOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -183,11 +356,11 @@ class SetOptionsOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SetOptionsOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -277,6 +450,91 @@ class SetOptionsOp:
             signer=signer,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"inflation_dest": ')
+        if self.inflation_dest is None:
+            write("null")
+        else:
+            self.inflation_dest._write_json(write)
+        write(', "clear_flags": ')
+        if self.clear_flags is None:
+            write("null")
+        else:
+            self.clear_flags._write_json(write)
+        write(', "set_flags": ')
+        if self.set_flags is None:
+            write("null")
+        else:
+            self.set_flags._write_json(write)
+        write(', "master_weight": ')
+        if self.master_weight is None:
+            write("null")
+        else:
+            self.master_weight._write_json(write)
+        write(', "low_threshold": ')
+        if self.low_threshold is None:
+            write("null")
+        else:
+            self.low_threshold._write_json(write)
+        write(', "med_threshold": ')
+        if self.med_threshold is None:
+            write("null")
+        else:
+            self.med_threshold._write_json(write)
+        write(', "high_threshold": ')
+        if self.high_threshold is None:
+            write("null")
+        else:
+            self.high_threshold._write_json(write)
+        write(', "home_domain": ')
+        if self.home_domain is None:
+            write("null")
+        else:
+            self.home_domain._write_json(write)
+        write(', "signer": ')
+        if self.signer is None:
+            write("null")
+        else:
+            self.signer._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SetOptionsOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.inflation_dest = (
+            self.inflation_dest.clone() if self.inflation_dest is not None else None
+        )
+        result.clear_flags = (
+            self.clear_flags.clone() if self.clear_flags is not None else None
+        )
+        result.set_flags = (
+            self.set_flags.clone() if self.set_flags is not None else None
+        )
+        result.master_weight = (
+            self.master_weight.clone() if self.master_weight is not None else None
+        )
+        result.low_threshold = (
+            self.low_threshold.clone() if self.low_threshold is not None else None
+        )
+        result.med_threshold = (
+            self.med_threshold.clone() if self.med_threshold is not None else None
+        )
+        result.high_threshold = (
+            self.high_threshold.clone() if self.high_threshold is not None else None
+        )
+        result.home_domain = (
+            self.home_domain.clone() if self.home_domain is not None else None
+        )
+        result.signer = self.signer.clone() if self.signer is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SetOptionsOp:
+        return self.clone()
+
+    def freeze(self) -> SetOptionsOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .set_options_result_code import SetOptionsResultCode
 
 __all__ = ["SetOptionsResult"]
@@ -35,6 +45,8 @@ class SetOptionsResult:
         };
     """
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: SetOptionsResultCode,
@@ -67,6 +79,31 @@ class SetOptionsResult:
             return
         raise ValueError("Invalid code.")
 
+    def xdr_size(self) -> int:
+        if self.code == SetOptionsResultCode.SET_OPTIONS_SUCCESS:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_LOW_RESERVE:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_TOO_MANY_SIGNERS:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_BAD_FLAGS:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_INVALID_INFLATION:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_CANT_CHANGE:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_UNKNOWN_FLAG:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_BAD_SIGNER:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_INVALID_HOME_DOMAIN:
+            return 4
+        if self.code == SetOptionsResultCode.SET_OPTIONS_AUTH_REVOCABLE_REQUIRED:
+            return 4
+        raise ValueError("Invalid code.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -74,40 +111,98 @@ class SetOptionsResult:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         code = SetOptionsResultCode.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(code)
+        if unpack_arm is None:
+            raise ValueError("Invalid code.")
+        return unpack_arm(cls, code, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        code = SetOptionsResultCode.unpack(unpacker)
+        if code == SetOptionsResultCode.SET_OPTIONS_SUCCESS:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_LOW_RESERVE:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_TOO_MANY_SIGNERS:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_BAD_FLAGS:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_INVALID_INFLATION:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_CANT_CHANGE:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_UNKNOWN_FLAG:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_BAD_SIGNER:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_INVALID_HOME_DOMAIN:
+            return
+        if code == SetOptionsResultCode.SET_OPTIONS_AUTH_REVOCABLE_REQUIRED:
+            return
+        raise ValueError("Invalid code.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SetOptionsResult:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        code = SetOptionsResultCode.unpack(unpacker)
+        if "code" in fields:
+            _result["code"] = code
         if code == SetOptionsResultCode.SET_OPTIONS_SUCCESS:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_LOW_RESERVE:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_TOO_MANY_SIGNERS:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_BAD_FLAGS:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_INVALID_INFLATION:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_CANT_CHANGE:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_UNKNOWN_FLAG:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_BAD_SIGNER:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_INVALID_HOME_DOMAIN:
-            return cls(code=code)
+            return _result
         if code == SetOptionsResultCode.SET_OPTIONS_AUTH_REVOCABLE_REQUIRED:
-            return cls(code=code)
+            return _result
         raise ValueError("Invalid code.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SetOptionsResult:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SetOptionsResult:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -122,11 +217,11 @@ class SetOptionsResult:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SetOptionsResult:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.code == SetOptionsResultCode.SET_OPTIONS_SUCCESS:
@@ -174,6 +269,55 @@ class SetOptionsResult:
         code = SetOptionsResultCode.from_json_dict(json_value)
         return cls(code=code)
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.code == SetOptionsResultCode.SET_OPTIONS_SUCCESS:
+            write('"success"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_LOW_RESERVE:
+            write('"low_reserve"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_TOO_MANY_SIGNERS:
+            write('"too_many_signers"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_BAD_FLAGS:
+            write('"bad_flags"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_INVALID_INFLATION:
+            write('"invalid_inflation"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_CANT_CHANGE:
+            write('"cant_change"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_UNKNOWN_FLAG:
+            write('"unknown_flag"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE:
+            write('"threshold_out_of_range"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_BAD_SIGNER:
+            write('"bad_signer"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_INVALID_HOME_DOMAIN:
+            write('"invalid_home_domain"')
+            return
+        if self.code == SetOptionsResultCode.SET_OPTIONS_AUTH_REVOCABLE_REQUIRED:
+            write('"auth_revocable_required"')
+            return
+        raise ValueError(f"Unknown code in SetOptionsResult: {self.code}")
+
+    def clone(self, deep: bool = True) -> SetOptionsResult:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.code = self.code
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SetOptionsResult:
+        return self.clone()
+
+    def freeze(self) -> SetOptionsResult:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.code,))
 
@@ -186,3 +330,22 @@ class SetOptionsResult:
         out = []
         out.append(f"code={self.code}")
         return f"<SetOptionsResult [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, code, unpacker: Unpacker, depth_limit: int) -> SetOptionsResult:
+    return cls(code=code)
+
+
+_UNPACK_ARMS = {
+    SetOptionsResultCode.SET_OPTIONS_SUCCESS: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_LOW_RESERVE: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_TOO_MANY_SIGNERS: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_BAD_FLAGS: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_INVALID_INFLATION: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_CANT_CHANGE: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_UNKNOWN_FLAG: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_BAD_SIGNER: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_INVALID_HOME_DOMAIN: _unpack_void,
+    SetOptionsResultCode.SET_OPTIONS_AUTH_REVOCABLE_REQUIRED: _unpack_void,
+}
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
 from .asset import Asset
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
 __all__ = ["SetTrustLineFlagsOp"]
@@ -29,6 +39,8 @@ class SetTrustLineFlagsOp:
         };
     """
 
+    __slots__ = ("asset", "clear_flags", "set_flags", "trustor")
+
     def __init__(
         self,
         trustor: AccountID,
@@ -47,6 +59,9 @@ class SetTrustLineFlagsOp:
         self.clear_flags.pack(packer)
         self.set_flags.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.trustor.xdr_size() + self.asset.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -64,16 +79,72 @@ class SetTrustLineFlagsOp:
             set_flags=set_flags,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        AccountID.skip(unpacker, depth_limit - 1)
+        Asset.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SetTrustLineFlagsOp:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "trustor" in fields:
+            _result["trustor"] = AccountID.unpack_fields(
+                unpacker, fields["trustor"], depth_limit - 1
+            )
+        else:
+            AccountID.skip(unpacker, depth_limit - 1)
+        if "asset" in fields:
+            _result["asset"] = Asset.unpack_fields(
+                unpacker, fields["asset"], depth_limit - 1
+            )
+        else:
+            Asset.skip(unpacker, depth_limit - 1)
+        if "clear_flags" in fields:
+            _result["clear_flags"] = Uint32.unpack_fields(
+                unpacker, fields["clear_flags"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "set_flags" in fields:
+            _result["set_flags"] = Uint32.unpack_fields(
+                unpacker, fields["set_flags"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SetTrustLineFlagsOp:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SetTrustLineFlagsOp:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -88,11 +159,11 @@ class SetTrustLineFlagsOp:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SetTrustLineFlagsOp:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -115,6 +186,33 @@ class SetTrustLineFlagsOp:
             set_flags=set_flags,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"trustor": ')
+        self.trustor._write_json(write)
+        write(', "asset": ')
+        self.asset._write_json(write)
+        write(', "clear_flags": ')
+        self.clear_flags._write_json(write)
+        write(', "set_flags": ')
+        self.set_flags._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SetTrustLineFlagsOp:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.trustor = self.trustor.clone()
+        result.asset = self.asset.clone()
+        result.clear_flags = self.clear_flags.clone()
+        result.set_flags = self.set_flags.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SetTrustLineFlagsOp:
+        return self.clone()
+
+    def freeze(self) -> SetTrustLineFlagsOp:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["ShortHashSeed"]
 
@@ -22,6 +34,8 @@ class ShortHashSeed:
         };
     """
 
+    __slots__ = ("seed",)
+
     def __init__(
         self,
         seed: bytes,
@@ -36,6 +50,9 @@ class ShortHashSeed:
     def pack(self, packer: Packer) -> None:
         Opaque(self.seed, 16, True).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 16
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -47,16 +64,47 @@ class ShortHashSeed:
             seed=seed,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 16, True)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | ShortHashSeed:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "seed" in fields:
+            _result["seed"] = Opaque.unpack_fields(unpacker, fields["seed"], 16, True)
+        else:
+            Opaque.skip(unpacker, 16, True)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> ShortHashSeed:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> ShortHashSeed:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -71,11 +119,11 @@ class ShortHashSeed:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> ShortHashSeed:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -89,6 +137,24 @@ class ShortHashSeed:
             seed=seed,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"seed": ')
+        write(json_encode(Opaque.to_json_dict(self.seed)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> ShortHashSeed:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.seed = self.seed
+        return result
+
+    def __deepcopy__(self, memo: dict) -> ShortHashSeed:
+        return self.clone()
+
+    def freeze(self) -> ShortHashSeed:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.seed,))
 
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .signature import Signature
 from .time_sliced_survey_request_message import TimeSlicedSurveyRequestMessage
 
@@ -25,6 +35,8 @@ class SignedTimeSlicedSurveyRequestMessage:
         };
     """
 
+    __slots__ = ("request", "request_signature")
+
     def __init__(
         self,
         request_signature: Signature,
@@ -37,6 +49,9 @@ class SignedTimeSlicedSurveyRequestMessage:
         self.request_signature.pack(packer)
         self.request.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.request_signature.xdr_size() + self.request.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class SignedTimeSlicedSurveyRequestMessage:
             request=request,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Signature.skip(unpacker, depth_limit - 1)
+        TimeSlicedSurveyRequestMessage.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SignedTimeSlicedSurveyRequestMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "request_signature" in fields:
+            _result["request_signature"] = Signature.unpack_fields(
+                unpacker, fields["request_signature"], depth_limit - 1
+            )
+        else:
+            Signature.skip(unpacker, depth_limit - 1)
+        if "request" in fields:
+            _result["request"] = TimeSlicedSurveyRequestMessage.unpack_fields(
+                unpacker, fields["request"], depth_limit - 1
+            )
+        else:
+            TimeSlicedSurveyRequestMessage.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SignedTimeSlicedSurveyRequestMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SignedTimeSlicedSurveyRequestMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class SignedTimeSlicedSurveyRequestMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SignedTimeSlicedSurveyRequestMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class SignedTimeSlicedSurveyRequestMessage:
             request=request,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"request_signature": ')
+        self.request_signature._write_json(write)
+        write(', "request": ')
+        self.request._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SignedTimeSlicedSurveyRequestMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.request_signature = self.request_signature.clone()
+        result.request = self.request.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SignedTimeSlicedSurveyRequestMessage:
+        return self.clone()
+
+    def freeze(self) -> SignedTimeSlicedSurveyRequestMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
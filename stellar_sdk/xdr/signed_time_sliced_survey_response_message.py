@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .signature import Signature
 from .time_sliced_survey_response_message import TimeSlicedSurveyResponseMessage
 
@@ -25,6 +35,8 @@ class SignedTimeSlicedSurveyResponseMessage:
         };
     """
 
+    __slots__ = ("response", "response_signature")
+
     def __init__(
         self,
         response_signature: Signature,
@@ -37,6 +49,9 @@ class SignedTimeSlicedSurveyResponseMessage:
         self.response_signature.pack(packer)
         self.response.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.response_signature.xdr_size() + self.response.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class SignedTimeSlicedSurveyResponseMessage:
             response=response,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Signature.skip(unpacker, depth_limit - 1)
+        TimeSlicedSurveyResponseMessage.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SignedTimeSlicedSurveyResponseMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "response_signature" in fields:
+            _result["response_signature"] = Signature.unpack_fields(
+                unpacker, fields["response_signature"], depth_limit - 1
+            )
+        else:
+            Signature.skip(unpacker, depth_limit - 1)
+        if "response" in fields:
+            _result["response"] = TimeSlicedSurveyResponseMessage.unpack_fields(
+                unpacker, fields["response"], depth_limit - 1
+            )
+        else:
+            TimeSlicedSurveyResponseMessage.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SignedTimeSlicedSurveyResponseMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SignedTimeSlicedSurveyResponseMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class SignedTimeSlicedSurveyResponseMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SignedTimeSlicedSurveyResponseMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class SignedTimeSlicedSurveyResponseMessage:
             response=response,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"response_signature": ')
+        self.response_signature._write_json(write)
+        write(', "response": ')
+        self.response._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SignedTimeSlicedSurveyResponseMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.response_signature = self.response_signature.clone()
+        result.response = self.response.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SignedTimeSlicedSurveyResponseMessage:
+        return self.clone()
+
+    def freeze(self) -> SignedTimeSlicedSurveyResponseMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
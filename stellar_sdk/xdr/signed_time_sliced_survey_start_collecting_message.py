@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .signature import Signature
 from .time_sliced_survey_start_collecting_message import (
     TimeSlicedSurveyStartCollectingMessage,
@@ -27,6 +37,8 @@ class SignedTimeSlicedSurveyStartCollectingMessage:
         };
     """
 
+    __slots__ = ("signature", "start_collecting")
+
     def __init__(
         self,
         signature: Signature,
@@ -39,6 +51,9 @@ class SignedTimeSlicedSurveyStartCollectingMessage:
         self.signature.pack(packer)
         self.start_collecting.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.signature.xdr_size() + self.start_collecting.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -54,16 +69,60 @@ class SignedTimeSlicedSurveyStartCollectingMessage:
             start_collecting=start_collecting,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Signature.skip(unpacker, depth_limit - 1)
+        TimeSlicedSurveyStartCollectingMessage.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SignedTimeSlicedSurveyStartCollectingMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "signature" in fields:
+            _result["signature"] = Signature.unpack_fields(
+                unpacker, fields["signature"], depth_limit - 1
+            )
+        else:
+            Signature.skip(unpacker, depth_limit - 1)
+        if "start_collecting" in fields:
+            _result["start_collecting"] = (
+                TimeSlicedSurveyStartCollectingMessage.unpack_fields(
+                    unpacker, fields["start_collecting"], depth_limit - 1
+                )
+            )
+        else:
+            TimeSlicedSurveyStartCollectingMessage.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SignedTimeSlicedSurveyStartCollectingMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SignedTimeSlicedSurveyStartCollectingMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -78,11 +137,11 @@ class SignedTimeSlicedSurveyStartCollectingMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SignedTimeSlicedSurveyStartCollectingMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -103,6 +162,27 @@ class SignedTimeSlicedSurveyStartCollectingMessage:
             start_collecting=start_collecting,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"signature": ')
+        self.signature._write_json(write)
+        write(', "start_collecting": ')
+        self.start_collecting._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SignedTimeSlicedSurveyStartCollectingMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.signature = self.signature.clone()
+        result.start_collecting = self.start_collecting.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SignedTimeSlicedSurveyStartCollectingMessage:
+        return self.clone()
+
+    def freeze(self) -> SignedTimeSlicedSurveyStartCollectingMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .signer_key_ed25519_signed_payload import SignerKeyEd25519SignedPayload
 from .signer_key_type import SignerKeyType
 from .uint256 import Uint256
@@ -40,6 +51,8 @@ class SignerKey:
         };
     """
 
+    __slots__ = ("ed25519", "ed25519_signed_payload", "hash_x", "pre_auth_tx", "type")
+
     def __init__(
         self,
         type: SignerKeyType,
@@ -78,39 +91,117 @@ class SignerKey:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SignerKeyType.SIGNER_KEY_TYPE_ED25519:
+            return 36
+        if self.type == SignerKeyType.SIGNER_KEY_TYPE_PRE_AUTH_TX:
+            return 36
+        if self.type == SignerKeyType.SIGNER_KEY_TYPE_HASH_X:
+            return 36
+        if self.type == SignerKeyType.SIGNER_KEY_TYPE_ED25519_SIGNED_PAYLOAD:
+            assert self.ed25519_signed_payload is not None
+            return 4 + self.ed25519_signed_payload.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SignerKey:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SignerKeyType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SignerKeyType.unpack(unpacker)
         if type == SignerKeyType.SIGNER_KEY_TYPE_ED25519:
-            ed25519 = Uint256.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, ed25519=ed25519)
+            Uint256.skip(unpacker, depth_limit - 1)
+            return
         if type == SignerKeyType.SIGNER_KEY_TYPE_PRE_AUTH_TX:
-            pre_auth_tx = Uint256.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, pre_auth_tx=pre_auth_tx)
+            Uint256.skip(unpacker, depth_limit - 1)
+            return
         if type == SignerKeyType.SIGNER_KEY_TYPE_HASH_X:
-            hash_x = Uint256.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, hash_x=hash_x)
+            Uint256.skip(unpacker, depth_limit - 1)
+            return
         if type == SignerKeyType.SIGNER_KEY_TYPE_ED25519_SIGNED_PAYLOAD:
-            ed25519_signed_payload = SignerKeyEd25519SignedPayload.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(type=type, ed25519_signed_payload=ed25519_signed_payload)
+            SignerKeyEd25519SignedPayload.skip(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SignerKey:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SignerKeyType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SignerKeyType.SIGNER_KEY_TYPE_ED25519:
+            if "ed25519" in fields:
+                _result["ed25519"] = Uint256.unpack_fields(
+                    unpacker, fields["ed25519"], depth_limit - 1
+                )
+            else:
+                Uint256.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SignerKeyType.SIGNER_KEY_TYPE_PRE_AUTH_TX:
+            if "pre_auth_tx" in fields:
+                _result["pre_auth_tx"] = Uint256.unpack_fields(
+                    unpacker, fields["pre_auth_tx"], depth_limit - 1
+                )
+            else:
+                Uint256.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SignerKeyType.SIGNER_KEY_TYPE_HASH_X:
+            if "hash_x" in fields:
+                _result["hash_x"] = Uint256.unpack_fields(
+                    unpacker, fields["hash_x"], depth_limit - 1
+                )
+            else:
+                Uint256.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SignerKeyType.SIGNER_KEY_TYPE_ED25519_SIGNED_PAYLOAD:
+            if "ed25519_signed_payload" in fields:
+                _result["ed25519_signed_payload"] = (
+                    SignerKeyEd25519SignedPayload.unpack_fields(
+                        unpacker, fields["ed25519_signed_payload"], depth_limit - 1
+                    )
+                )
+            else:
+                SignerKeyEd25519SignedPayload.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SignerKey:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> SignerKey:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -125,11 +216,11 @@ class SignerKey:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SignerKey:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         from ..strkey import StrKey
@@ -184,6 +275,32 @@ class SignerKey:
             )
         raise ValueError(f"Invalid SignerKey strkey: {json_value}")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> SignerKey:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.ed25519 = self.ed25519.clone() if self.ed25519 is not None else None
+        result.pre_auth_tx = (
+            self.pre_auth_tx.clone() if self.pre_auth_tx is not None else None
+        )
+        result.hash_x = self.hash_x.clone() if self.hash_x is not None else None
+        result.ed25519_signed_payload = (
+            self.ed25519_signed_payload.clone()
+            if self.ed25519_signed_payload is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SignerKey:
+        return self.clone()
+
+    def freeze(self) -> SignerKey:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -218,3 +335,35 @@ class SignerKey:
         if self.ed25519_signed_payload is not None:
             out.append(f"ed25519_signed_payload={self.ed25519_signed_payload}")
         return f"<SignerKey [{', '.join(out)}]>"
+
+
+def _unpack_ed25519(cls, type, unpacker: Unpacker, depth_limit: int) -> SignerKey:
+    ed25519 = Uint256.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, ed25519=ed25519)
+
+
+def _unpack_pre_auth_tx(cls, type, unpacker: Unpacker, depth_limit: int) -> SignerKey:
+    pre_auth_tx = Uint256.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, pre_auth_tx=pre_auth_tx)
+
+
+def _unpack_hash_x(cls, type, unpacker: Unpacker, depth_limit: int) -> SignerKey:
+    hash_x = Uint256.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, hash_x=hash_x)
+
+
+def _unpack_ed25519_signed_payload(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SignerKey:
+    ed25519_signed_payload = SignerKeyEd25519SignedPayload.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, ed25519_signed_payload=ed25519_signed_payload)
+
+
+_UNPACK_ARMS = {
+    SignerKeyType.SIGNER_KEY_TYPE_ED25519: _unpack_ed25519,
+    SignerKeyType.SIGNER_KEY_TYPE_PRE_AUTH_TX: _unpack_pre_auth_tx,
+    SignerKeyType.SIGNER_KEY_TYPE_HASH_X: _unpack_hash_x,
+    SignerKeyType.SIGNER_KEY_TYPE_ED25519_SIGNED_PAYLOAD: _unpack_ed25519_signed_payload,
+}
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint256 import Uint256
 
 __all__ = ["SignerKeyEd25519SignedPayload"]
@@ -26,6 +38,8 @@ class SignerKeyEd25519SignedPayload:
             }
     """
 
+    __slots__ = ("ed25519", "payload")
+
     def __init__(
         self,
         ed25519: Uint256,
@@ -43,6 +57,9 @@ class SignerKeyEd25519SignedPayload:
         self.ed25519.pack(packer)
         Opaque(self.payload, 64, False).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + 4 + (len(self.payload) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,16 +73,58 @@ class SignerKeyEd25519SignedPayload:
             payload=payload,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint256.skip(unpacker, depth_limit - 1)
+        Opaque.skip(unpacker, 64, False)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SignerKeyEd25519SignedPayload:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ed25519" in fields:
+            _result["ed25519"] = Uint256.unpack_fields(
+                unpacker, fields["ed25519"], depth_limit - 1
+            )
+        else:
+            Uint256.skip(unpacker, depth_limit - 1)
+        if "payload" in fields:
+            _result["payload"] = Opaque.unpack_fields(
+                unpacker, fields["payload"], 64, False
+            )
+        else:
+            Opaque.skip(unpacker, 64, False)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SignerKeyEd25519SignedPayload:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SignerKeyEd25519SignedPayload:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -80,11 +139,11 @@ class SignerKeyEd25519SignedPayload:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SignerKeyEd25519SignedPayload:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -101,6 +160,27 @@ class SignerKeyEd25519SignedPayload:
             payload=payload,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ed25519": ')
+        self.ed25519._write_json(write)
+        write(', "payload": ')
+        write(json_encode(Opaque.to_json_dict(self.payload)))
+        write("}")
+
+    def clone(self, deep: bool = True) -> SignerKeyEd25519SignedPayload:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ed25519 = self.ed25519.clone()
+        result.payload = self.payload
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SignerKeyEd25519SignedPayload:
+        return self.clone()
+
+    def freeze(self) -> SignerKeyEd25519SignedPayload:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
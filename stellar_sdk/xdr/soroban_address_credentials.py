@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .sc_address import SCAddress
 from .sc_val import SCVal
@@ -29,6 +42,8 @@ class SorobanAddressCredentials:
         };
     """
 
+    __slots__ = ("address", "nonce", "signature", "signature_expiration_ledger")
+
     def __init__(
         self,
         address: SCAddress,
@@ -47,6 +62,9 @@ class SorobanAddressCredentials:
         self.signature_expiration_ledger.pack(packer)
         self.signature.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 12 + self.address.xdr_size() + self.signature.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -64,16 +82,85 @@ class SorobanAddressCredentials:
             signature=signature,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCAddress.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        SCVal.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanAddressCredentials:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "address" in fields:
+            _result["address"] = SCAddress.unpack_fields(
+                unpacker, fields["address"], depth_limit - 1
+            )
+        else:
+            SCAddress.skip(unpacker, depth_limit - 1)
+        if "nonce" in fields:
+            _result["nonce"] = Int64.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "signature_expiration_ledger" in fields:
+            _result["signature_expiration_ledger"] = Uint32.unpack_fields(
+                unpacker, fields["signature_expiration_ledger"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "signature" in fields:
+            _result["signature"] = SCVal.unpack_fields(
+                unpacker, fields["signature"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "address", SCAddress.unpack(unpacker, depth_limit - 1)
+        yield "nonce", Int64.unpack(unpacker, depth_limit - 1)
+        yield "signature_expiration_ledger", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "signature", view_at(SCVal, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAddressCredentials:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAddressCredentials:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -88,11 +175,11 @@ class SorobanAddressCredentials:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAddressCredentials:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -117,6 +204,33 @@ class SorobanAddressCredentials:
             signature=signature,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"address": ')
+        self.address._write_json(write)
+        write(', "nonce": ')
+        self.nonce._write_json(write)
+        write(', "signature_expiration_ledger": ')
+        self.signature_expiration_ledger._write_json(write)
+        write(', "signature": ')
+        self.signature._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanAddressCredentials:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.address = self.address.clone()
+        result.nonce = self.nonce.clone()
+        result.signature_expiration_ledger = self.signature_expiration_ledger.clone()
+        result.signature = self.signature.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanAddressCredentials:
+        return self.clone()
+
+    def freeze(self) -> SorobanAddressCredentials:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
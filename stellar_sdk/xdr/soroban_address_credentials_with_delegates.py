@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .soroban_address_credentials import SorobanAddressCredentials
 from .soroban_delegate_signature import SorobanDelegateSignature
 
@@ -25,6 +40,8 @@ class SorobanAddressCredentialsWithDelegates:
         };
     """
 
+    __slots__ = ("address_credentials", "delegates")
+
     def __init__(
         self,
         address_credentials: SorobanAddressCredentials,
@@ -44,6 +61,13 @@ class SorobanAddressCredentialsWithDelegates:
         for delegates_item in self.delegates:
             delegates_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.address_credentials.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.delegates)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -67,16 +91,108 @@ class SorobanAddressCredentialsWithDelegates:
             delegates=delegates,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"delegates length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SorobanDelegateSignature.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanAddressCredentialsWithDelegates:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "address_credentials" in fields:
+            _result["address_credentials"] = SorobanAddressCredentials.unpack_fields(
+                unpacker, fields["address_credentials"], depth_limit - 1
+            )
+        else:
+            SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+        if "delegates" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"delegates length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["delegates"] = []
+            for _ in range(length):
+                _result["delegates"].append(
+                    SorobanDelegateSignature.unpack_fields(
+                        unpacker, fields["delegates"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"delegates length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SorobanDelegateSignature.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        address_credentials = view_at(
+            SorobanAddressCredentials, unpacker, depth_limit - 1
+        )
+        yield "address_credentials", address_credentials
+        SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"delegates length {length} exceeds remaining input length {_remaining}"
+            )
+        delegates = []
+        for _ in range(length):
+            delegates.append(
+                unpack_view(SorobanDelegateSignature, unpacker, depth_limit - 1)
+            )
+        yield "delegates", delegates
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAddressCredentialsWithDelegates:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAddressCredentialsWithDelegates:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -91,11 +207,11 @@ class SorobanAddressCredentialsWithDelegates:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAddressCredentialsWithDelegates:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -117,6 +233,27 @@ class SorobanAddressCredentialsWithDelegates:
             delegates=delegates,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"address_credentials": ')
+        self.address_credentials._write_json(write)
+        write(', "delegates": ')
+        write_json_array(write, self.delegates)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanAddressCredentialsWithDelegates:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.address_credentials = self.address_credentials.clone()
+        result.delegates = [item.clone() for item in self.delegates]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanAddressCredentialsWithDelegates:
+        return self.clone()
+
+    def freeze(self) -> SorobanAddressCredentialsWithDelegates:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
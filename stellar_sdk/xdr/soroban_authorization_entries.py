@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .soroban_authorization_entry import SorobanAuthorizationEntry
 
 __all__ = ["SorobanAuthorizationEntries"]
@@ -20,6 +34,8 @@ class SorobanAuthorizationEntries:
         typedef SorobanAuthorizationEntry SorobanAuthorizationEntries<>;
     """
 
+    __slots__ = ("soroban_authorization_entries",)
+
     def __init__(
         self, soroban_authorization_entries: list[SorobanAuthorizationEntry]
     ) -> None:
@@ -38,6 +54,9 @@ class SorobanAuthorizationEntries:
         for soroban_authorization_entries_item in self.soroban_authorization_entries:
             soroban_authorization_entries_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.soroban_authorization_entries)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +76,98 @@ class SorobanAuthorizationEntries:
             )
         return cls(soroban_authorization_entries)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"soroban_authorization_entries length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SorobanAuthorizationEntry.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanAuthorizationEntries:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "soroban_authorization_entries" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"soroban_authorization_entries length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["soroban_authorization_entries"] = []
+            for _ in range(length):
+                _result["soroban_authorization_entries"].append(
+                    SorobanAuthorizationEntry.unpack_fields(
+                        unpacker,
+                        fields["soroban_authorization_entries"],
+                        depth_limit - 1,
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"soroban_authorization_entries length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SorobanAuthorizationEntry.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"soroban_authorization_entries length {length} exceeds remaining input length {_remaining}"
+            )
+        soroban_authorization_entries = []
+        for _ in range(length):
+            soroban_authorization_entries.append(
+                unpack_view(SorobanAuthorizationEntry, unpacker, depth_limit - 1)
+            )
+        yield "soroban_authorization_entries", soroban_authorization_entries
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAuthorizationEntries:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAuthorizationEntries:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +182,11 @@ class SorobanAuthorizationEntries:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAuthorizationEntries:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.soroban_authorization_entries]
@@ -96,6 +197,24 @@ class SorobanAuthorizationEntries:
             [SorobanAuthorizationEntry.from_json_dict(item) for item in json_value]
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.soroban_authorization_entries)
+
+    def clone(self, deep: bool = True) -> SorobanAuthorizationEntries:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.soroban_authorization_entries = [
+            item.clone() for item in self.soroban_authorization_entries
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanAuthorizationEntries:
+        return self.clone()
+
+    def freeze(self) -> SorobanAuthorizationEntries:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.soroban_authorization_entries,))
 
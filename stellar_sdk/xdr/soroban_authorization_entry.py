@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .soroban_authorized_invocation import SorobanAuthorizedInvocation
 from .soroban_credentials import SorobanCredentials
 
@@ -25,6 +38,8 @@ class SorobanAuthorizationEntry:
         };
     """
 
+    __slots__ = ("credentials", "root_invocation")
+
     def __init__(
         self,
         credentials: SorobanCredentials,
@@ -37,6 +52,9 @@ class SorobanAuthorizationEntry:
         self.credentials.pack(packer)
         self.root_invocation.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.credentials.xdr_size() + self.root_invocation.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +68,74 @@ class SorobanAuthorizationEntry:
             root_invocation=root_invocation,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SorobanCredentials.skip(unpacker, depth_limit - 1)
+        SorobanAuthorizedInvocation.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanAuthorizationEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "credentials" in fields:
+            _result["credentials"] = SorobanCredentials.unpack_fields(
+                unpacker, fields["credentials"], depth_limit - 1
+            )
+        else:
+            SorobanCredentials.skip(unpacker, depth_limit - 1)
+        if "root_invocation" in fields:
+            _result["root_invocation"] = SorobanAuthorizedInvocation.unpack_fields(
+                unpacker, fields["root_invocation"], depth_limit - 1
+            )
+        else:
+            SorobanAuthorizedInvocation.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        credentials = view_at(SorobanCredentials, unpacker, depth_limit - 1)
+        yield "credentials", credentials
+        SorobanCredentials.skip(unpacker, depth_limit - 1)
+        yield (
+            "root_invocation",
+            view_at(SorobanAuthorizedInvocation, unpacker, depth_limit - 1),
+        )
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAuthorizationEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAuthorizationEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +150,11 @@ class SorobanAuthorizationEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAuthorizationEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -97,6 +173,27 @@ class SorobanAuthorizationEntry:
             root_invocation=root_invocation,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"credentials": ')
+        self.credentials._write_json(write)
+        write(', "root_invocation": ')
+        self.root_invocation._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanAuthorizationEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.credentials = self.credentials.clone()
+        result.root_invocation = self.root_invocation.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanAuthorizationEntry:
+        return self.clone()
+
+    def freeze(self) -> SorobanAuthorizationEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .create_contract_args import CreateContractArgs
 from .create_contract_args_v2 import CreateContractArgsV2
 from .invoke_contract_args import InvokeContractArgs
@@ -39,6 +52,13 @@ class SorobanAuthorizedFunction:
         };
     """
 
+    __slots__ = (
+        "contract_fn",
+        "create_contract_host_fn",
+        "create_contract_v2_host_fn",
+        "type",
+    )
+
     def __init__(
         self,
         type: SorobanAuthorizedFunctionType,
@@ -79,10 +99,41 @@ class SorobanAuthorizedFunction:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if (
+            self.type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CONTRACT_FN
+        ):
+            assert self.contract_fn is not None
+            return 4 + self.contract_fn.xdr_size()
+        if (
+            self.type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_HOST_FN
+        ):
+            assert self.create_contract_host_fn is not None
+            return 4 + self.create_contract_host_fn.xdr_size()
+        if (
+            self.type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_V2_HOST_FN
+        ):
+            assert self.create_contract_v2_host_fn is not None
+            return 4 + self.create_contract_v2_host_fn.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SorobanAuthorizedFunction:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SorobanAuthorizedFunctionType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SorobanAuthorizedFunctionType.unpack(unpacker)
@@ -90,24 +141,115 @@ class SorobanAuthorizedFunction:
             type
             == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CONTRACT_FN
         ):
-            contract_fn = InvokeContractArgs.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, contract_fn=contract_fn)
+            InvokeContractArgs.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_HOST_FN
+        ):
+            CreateContractArgs.skip(unpacker, depth_limit - 1)
+            return
+        if (
+            type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_V2_HOST_FN
+        ):
+            CreateContractArgsV2.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanAuthorizedFunction:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SorobanAuthorizedFunctionType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if (
+            type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CONTRACT_FN
+        ):
+            if "contract_fn" in fields:
+                _result["contract_fn"] = InvokeContractArgs.unpack_fields(
+                    unpacker, fields["contract_fn"], depth_limit - 1
+                )
+            else:
+                InvokeContractArgs.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_HOST_FN
+        ):
+            if "create_contract_host_fn" in fields:
+                _result["create_contract_host_fn"] = CreateContractArgs.unpack_fields(
+                    unpacker, fields["create_contract_host_fn"], depth_limit - 1
+                )
+            else:
+                CreateContractArgs.skip(unpacker, depth_limit - 1)
+            return _result
+        if (
+            type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_V2_HOST_FN
+        ):
+            if "create_contract_v2_host_fn" in fields:
+                _result["create_contract_v2_host_fn"] = (
+                    CreateContractArgsV2.unpack_fields(
+                        unpacker, fields["create_contract_v2_host_fn"], depth_limit - 1
+                    )
+                )
+            else:
+                CreateContractArgsV2.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SorobanAuthorizedFunctionType.unpack(unpacker)
+        yield "type", type
+        if (
+            type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CONTRACT_FN
+        ):
+            yield "contract_fn", view_at(InvokeContractArgs, unpacker, depth_limit - 1)
+            return
         if (
             type
             == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_HOST_FN
         ):
-            create_contract_host_fn = CreateContractArgs.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "create_contract_host_fn",
+                CreateContractArgs.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, create_contract_host_fn=create_contract_host_fn)
+            return
         if (
             type
             == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_V2_HOST_FN
         ):
-            create_contract_v2_host_fn = CreateContractArgsV2.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "create_contract_v2_host_fn",
+                view_at(CreateContractArgsV2, unpacker, depth_limit - 1),
             )
-            return cls(type=type, create_contract_v2_host_fn=create_contract_v2_host_fn)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -116,10 +258,12 @@ class SorobanAuthorizedFunction:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAuthorizedFunction:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAuthorizedFunction:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -134,11 +278,11 @@ class SorobanAuthorizedFunction:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAuthorizedFunction:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if (
@@ -188,6 +332,62 @@ class SorobanAuthorizedFunction:
             return cls(type=type, create_contract_v2_host_fn=create_contract_v2_host_fn)
         raise ValueError(f"Unknown key '{key}' for SorobanAuthorizedFunction")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if (
+            self.type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CONTRACT_FN
+        ):
+            assert self.contract_fn is not None
+            write('{"contract_fn": ')
+            self.contract_fn._write_json(write)
+            write("}")
+            return
+        if (
+            self.type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_HOST_FN
+        ):
+            assert self.create_contract_host_fn is not None
+            write('{"create_contract_host_fn": ')
+            self.create_contract_host_fn._write_json(write)
+            write("}")
+            return
+        if (
+            self.type
+            == SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_V2_HOST_FN
+        ):
+            assert self.create_contract_v2_host_fn is not None
+            write('{"create_contract_v2_host_fn": ')
+            self.create_contract_v2_host_fn._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SorobanAuthorizedFunction: {self.type}")
+
+    def clone(self, deep: bool = True) -> SorobanAuthorizedFunction:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.contract_fn = (
+            self.contract_fn.clone() if self.contract_fn is not None else None
+        )
+        result.create_contract_host_fn = (
+            self.create_contract_host_fn.clone()
+            if self.create_contract_host_fn is not None
+            else None
+        )
+        result.create_contract_v2_host_fn = (
+            self.create_contract_v2_host_fn.clone()
+            if self.create_contract_v2_host_fn is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanAuthorizedFunction:
+        return self.clone()
+
+    def freeze(self) -> SorobanAuthorizedFunction:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -218,3 +418,31 @@ class SorobanAuthorizedFunction:
         if self.create_contract_v2_host_fn is not None:
             out.append(f"create_contract_v2_host_fn={self.create_contract_v2_host_fn}")
         return f"<SorobanAuthorizedFunction [{', '.join(out)}]>"
+
+
+def _unpack_contract_fn(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SorobanAuthorizedFunction:
+    contract_fn = InvokeContractArgs.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, contract_fn=contract_fn)
+
+
+def _unpack_create_contract_host_fn(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SorobanAuthorizedFunction:
+    create_contract_host_fn = CreateContractArgs.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, create_contract_host_fn=create_contract_host_fn)
+
+
+def _unpack_create_contract_v2_host_fn(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SorobanAuthorizedFunction:
+    create_contract_v2_host_fn = CreateContractArgsV2.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, create_contract_v2_host_fn=create_contract_v2_host_fn)
+
+
+_UNPACK_ARMS = {
+    SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CONTRACT_FN: _unpack_contract_fn,
+    SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_HOST_FN: _unpack_create_contract_host_fn,
+    SorobanAuthorizedFunctionType.SOROBAN_AUTHORIZED_FUNCTION_TYPE_CREATE_CONTRACT_V2_HOST_FN: _unpack_create_contract_v2_host_fn,
+}
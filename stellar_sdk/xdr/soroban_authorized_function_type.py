@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _SOROBAN_AUTHORIZED_FUNCTION_TYPE_MAP = {
     0: "contract_fn",
     1: "create_contract_host_fn",
@@ -40,10 +49,27 @@ class SorobanAuthorizedFunctionType(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> SorobanAuthorizedFunctionType:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid SorobanAuthorizedFunctionType")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls, unpacker: Unpacker, fields: dict | None
+    ) -> SorobanAuthorizedFunctionType:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -51,10 +77,12 @@ class SorobanAuthorizedFunctionType(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAuthorizedFunctionType:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAuthorizedFunctionType:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -69,11 +97,11 @@ class SorobanAuthorizedFunctionType(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAuthorizedFunctionType:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _SOROBAN_AUTHORIZED_FUNCTION_TYPE_MAP[self.value]
@@ -81,3 +109,15 @@ class SorobanAuthorizedFunctionType(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> SorobanAuthorizedFunctionType:
         return cls(_SOROBAN_AUTHORIZED_FUNCTION_TYPE_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_SOROBAN_AUTHORIZED_FUNCTION_TYPE_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> SorobanAuthorizedFunctionType:
+        return self
+
+    def freeze(self) -> SorobanAuthorizedFunctionType:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in SorobanAuthorizedFunctionType}
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .soroban_authorized_function import SorobanAuthorizedFunction
 
 __all__ = ["SorobanAuthorizedInvocation"]
@@ -24,6 +39,8 @@ class SorobanAuthorizedInvocation:
         };
     """
 
+    __slots__ = ("function", "sub_invocations")
+
     def __init__(
         self,
         function: SorobanAuthorizedFunction,
@@ -43,6 +60,13 @@ class SorobanAuthorizedInvocation:
         for sub_invocations_item in self.sub_invocations:
             sub_invocations_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.function.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.sub_invocations)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -66,16 +90,106 @@ class SorobanAuthorizedInvocation:
             sub_invocations=sub_invocations,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SorobanAuthorizedFunction.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"sub_invocations length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SorobanAuthorizedInvocation.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanAuthorizedInvocation:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "function" in fields:
+            _result["function"] = SorobanAuthorizedFunction.unpack_fields(
+                unpacker, fields["function"], depth_limit - 1
+            )
+        else:
+            SorobanAuthorizedFunction.skip(unpacker, depth_limit - 1)
+        if "sub_invocations" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"sub_invocations length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["sub_invocations"] = []
+            for _ in range(length):
+                _result["sub_invocations"].append(
+                    SorobanAuthorizedInvocation.unpack_fields(
+                        unpacker, fields["sub_invocations"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"sub_invocations length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SorobanAuthorizedInvocation.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        function = view_at(SorobanAuthorizedFunction, unpacker, depth_limit - 1)
+        yield "function", function
+        SorobanAuthorizedFunction.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"sub_invocations length {length} exceeds remaining input length {_remaining}"
+            )
+        sub_invocations = []
+        for _ in range(length):
+            sub_invocations.append(
+                unpack_view(SorobanAuthorizedInvocation, unpacker, depth_limit - 1)
+            )
+        yield "sub_invocations", sub_invocations
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanAuthorizedInvocation:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanAuthorizedInvocation:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -90,11 +204,11 @@ class SorobanAuthorizedInvocation:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanAuthorizedInvocation:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -114,6 +228,27 @@ class SorobanAuthorizedInvocation:
             sub_invocations=sub_invocations,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"function": ')
+        self.function._write_json(write)
+        write(', "sub_invocations": ')
+        write_json_array(write, self.sub_invocations)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanAuthorizedInvocation:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.function = self.function.clone()
+        result.sub_invocations = [item.clone() for item in self.sub_invocations]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanAuthorizedInvocation:
+        return self.clone()
+
+    def freeze(self) -> SorobanAuthorizedInvocation:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .soroban_address_credentials import SorobanAddressCredentials
 from .soroban_address_credentials_with_delegates import (
     SorobanAddressCredentialsWithDelegates,
@@ -34,6 +47,8 @@ class SorobanCredentials:
         };
     """
 
+    __slots__ = ("address", "address_v2", "address_with_delegates", "type")
+
     def __init__(
         self,
         type: SorobanCredentialsType,
@@ -70,26 +85,137 @@ class SorobanCredentials:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT:
+            return 4
+        if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS:
+            assert self.address is not None
+            return 4 + self.address.xdr_size()
+        if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_V2:
+            assert self.address_v2 is not None
+            return 4 + self.address_v2.xdr_size()
+        if (
+            self.type
+            == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_WITH_DELEGATES
+        ):
+            assert self.address_with_delegates is not None
+            return 4 + self.address_with_delegates.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> SorobanCredentials:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SorobanCredentialsType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SorobanCredentialsType.unpack(unpacker)
         if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT:
-            return cls(type=type)
+            return
         if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS:
-            address = SorobanAddressCredentials.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, address=address)
+            SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+            return
         if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_V2:
-            address_v2 = SorobanAddressCredentials.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, address_v2=address_v2)
+            SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+            return
         if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_WITH_DELEGATES:
-            address_with_delegates = SorobanAddressCredentialsWithDelegates.unpack(
-                unpacker, depth_limit - 1
+            SorobanAddressCredentialsWithDelegates.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanCredentials:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SorobanCredentialsType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT:
+            return _result
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS:
+            if "address" in fields:
+                _result["address"] = SorobanAddressCredentials.unpack_fields(
+                    unpacker, fields["address"], depth_limit - 1
+                )
+            else:
+                SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_V2:
+            if "address_v2" in fields:
+                _result["address_v2"] = SorobanAddressCredentials.unpack_fields(
+                    unpacker, fields["address_v2"], depth_limit - 1
+                )
+            else:
+                SorobanAddressCredentials.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_WITH_DELEGATES:
+            if "address_with_delegates" in fields:
+                _result["address_with_delegates"] = (
+                    SorobanAddressCredentialsWithDelegates.unpack_fields(
+                        unpacker, fields["address_with_delegates"], depth_limit - 1
+                    )
+                )
+            else:
+                SorobanAddressCredentialsWithDelegates.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SorobanCredentialsType.unpack(unpacker)
+        yield "type", type
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT:
+            return
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS:
+            yield (
+                "address",
+                view_at(SorobanAddressCredentials, unpacker, depth_limit - 1),
             )
-            return cls(type=type, address_with_delegates=address_with_delegates)
+            return
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_V2:
+            yield (
+                "address_v2",
+                view_at(SorobanAddressCredentials, unpacker, depth_limit - 1),
+            )
+            return
+        if type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_WITH_DELEGATES:
+            yield (
+                "address_with_delegates",
+                view_at(
+                    SorobanAddressCredentialsWithDelegates, unpacker, depth_limit - 1
+                ),
+            )
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -98,10 +224,12 @@ class SorobanCredentials:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanCredentials:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanCredentials:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -116,11 +244,11 @@ class SorobanCredentials:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanCredentials:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT:
@@ -173,6 +301,55 @@ class SorobanCredentials:
             return cls(type=type, address_with_delegates=address_with_delegates)
         raise ValueError(f"Unknown key '{key}' for SorobanCredentials")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT:
+            write('"source_account"')
+            return
+        if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS:
+            assert self.address is not None
+            write('{"address": ')
+            self.address._write_json(write)
+            write("}")
+            return
+        if self.type == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_V2:
+            assert self.address_v2 is not None
+            write('{"address_v2": ')
+            self.address_v2._write_json(write)
+            write("}")
+            return
+        if (
+            self.type
+            == SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_WITH_DELEGATES
+        ):
+            assert self.address_with_delegates is not None
+            write('{"address_with_delegates": ')
+            self.address_with_delegates._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SorobanCredentials: {self.type}")
+
+    def clone(self, deep: bool = True) -> SorobanCredentials:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.address = self.address.clone() if self.address is not None else None
+        result.address_v2 = (
+            self.address_v2.clone() if self.address_v2 is not None else None
+        )
+        result.address_with_delegates = (
+            self.address_with_delegates.clone()
+            if self.address_with_delegates is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanCredentials:
+        return self.clone()
+
+    def freeze(self) -> SorobanCredentials:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -203,3 +380,38 @@ class SorobanCredentials:
         if self.address_with_delegates is not None:
             out.append(f"address_with_delegates={self.address_with_delegates}")
         return f"<SorobanCredentials [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> SorobanCredentials:
+    return cls(type=type)
+
+
+def _unpack_address(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SorobanCredentials:
+    address = SorobanAddressCredentials.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, address=address)
+
+
+def _unpack_address_v2(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SorobanCredentials:
+    address_v2 = SorobanAddressCredentials.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, address_v2=address_v2)
+
+
+def _unpack_address_with_delegates(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SorobanCredentials:
+    address_with_delegates = SorobanAddressCredentialsWithDelegates.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, address_with_delegates=address_with_delegates)
+
+
+_UNPACK_ARMS = {
+    SorobanCredentialsType.SOROBAN_CREDENTIALS_SOURCE_ACCOUNT: _unpack_void,
+    SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS: _unpack_address,
+    SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_V2: _unpack_address_v2,
+    SorobanCredentialsType.SOROBAN_CREDENTIALS_ADDRESS_WITH_DELEGATES: _unpack_address_with_delegates,
+}
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .sc_address import SCAddress
 from .sc_val import SCVal
 
@@ -26,6 +41,8 @@ class SorobanDelegateSignature:
         };
     """
 
+    __slots__ = ("address", "nested_delegates", "signature")
+
     def __init__(
         self,
         address: SCAddress,
@@ -48,6 +65,14 @@ class SorobanDelegateSignature:
         for nested_delegates_item in self.nested_delegates:
             nested_delegates_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.address.xdr_size()
+            + self.signature.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.nested_delegates)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -73,16 +98,114 @@ class SorobanDelegateSignature:
             nested_delegates=nested_delegates,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SCAddress.skip(unpacker, depth_limit - 1)
+        SCVal.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"nested_delegates length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            SorobanDelegateSignature.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanDelegateSignature:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "address" in fields:
+            _result["address"] = SCAddress.unpack_fields(
+                unpacker, fields["address"], depth_limit - 1
+            )
+        else:
+            SCAddress.skip(unpacker, depth_limit - 1)
+        if "signature" in fields:
+            _result["signature"] = SCVal.unpack_fields(
+                unpacker, fields["signature"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        if "nested_delegates" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"nested_delegates length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["nested_delegates"] = []
+            for _ in range(length):
+                _result["nested_delegates"].append(
+                    SorobanDelegateSignature.unpack_fields(
+                        unpacker, fields["nested_delegates"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"nested_delegates length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                SorobanDelegateSignature.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "address", SCAddress.unpack(unpacker, depth_limit - 1)
+        signature = view_at(SCVal, unpacker, depth_limit - 1)
+        yield "signature", signature
+        SCVal.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"nested_delegates length {length} exceeds remaining input length {_remaining}"
+            )
+        nested_delegates = []
+        for _ in range(length):
+            nested_delegates.append(
+                unpack_view(SorobanDelegateSignature, unpacker, depth_limit - 1)
+            )
+        yield "nested_delegates", nested_delegates
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanDelegateSignature:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanDelegateSignature:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +220,11 @@ class SorobanDelegateSignature:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanDelegateSignature:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -124,6 +247,30 @@ class SorobanDelegateSignature:
             nested_delegates=nested_delegates,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"address": ')
+        self.address._write_json(write)
+        write(', "signature": ')
+        self.signature._write_json(write)
+        write(', "nested_delegates": ')
+        write_json_array(write, self.nested_delegates)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanDelegateSignature:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.address = self.address.clone()
+        result.signature = self.signature.clone()
+        result.nested_delegates = [item.clone() for item in self.nested_delegates]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanDelegateSignature:
+        return self.clone()
+
+    def freeze(self) -> SorobanDelegateSignature:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_footprint import LedgerFootprint
 from .uint32 import Uint32
 
@@ -32,6 +45,8 @@ class SorobanResources:
         };
     """
 
+    __slots__ = ("disk_read_bytes", "footprint", "instructions", "write_bytes")
+
     def __init__(
         self,
         footprint: LedgerFootprint,
@@ -50,6 +65,9 @@ class SorobanResources:
         self.disk_read_bytes.pack(packer)
         self.write_bytes.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 12 + self.footprint.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -67,16 +85,87 @@ class SorobanResources:
             write_bytes=write_bytes,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LedgerFootprint.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanResources:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "footprint" in fields:
+            _result["footprint"] = LedgerFootprint.unpack_fields(
+                unpacker, fields["footprint"], depth_limit - 1
+            )
+        else:
+            LedgerFootprint.skip(unpacker, depth_limit - 1)
+        if "instructions" in fields:
+            _result["instructions"] = Uint32.unpack_fields(
+                unpacker, fields["instructions"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "disk_read_bytes" in fields:
+            _result["disk_read_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["disk_read_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "write_bytes" in fields:
+            _result["write_bytes"] = Uint32.unpack_fields(
+                unpacker, fields["write_bytes"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        footprint = view_at(LedgerFootprint, unpacker, depth_limit - 1)
+        yield "footprint", footprint
+        LedgerFootprint.skip(unpacker, depth_limit - 1)
+        yield "instructions", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "disk_read_bytes", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "write_bytes", Uint32.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanResources:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanResources:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -91,11 +180,11 @@ class SorobanResources:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanResources:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -118,6 +207,33 @@ class SorobanResources:
             write_bytes=write_bytes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"footprint": ')
+        self.footprint._write_json(write)
+        write(', "instructions": ')
+        self.instructions._write_json(write)
+        write(', "disk_read_bytes": ')
+        self.disk_read_bytes._write_json(write)
+        write(', "write_bytes": ')
+        self.write_bytes._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanResources:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.footprint = self.footprint.clone()
+        result.instructions = self.instructions.clone()
+        result.disk_read_bytes = self.disk_read_bytes.clone()
+        result.write_bytes = self.write_bytes.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanResources:
+        return self.clone()
+
+    def freeze(self) -> SorobanResources:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
 __all__ = ["SorobanResourcesExtV0"]
@@ -26,6 +39,8 @@ class SorobanResourcesExtV0:
         };
     """
 
+    __slots__ = ("archived_soroban_entries",)
+
     def __init__(
         self,
         archived_soroban_entries: list[Uint32],
@@ -45,6 +60,9 @@ class SorobanResourcesExtV0:
         for archived_soroban_entries_item in self.archived_soroban_entries:
             archived_soroban_entries_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 4 * len(self.archived_soroban_entries)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -64,16 +82,94 @@ class SorobanResourcesExtV0:
             archived_soroban_entries=archived_soroban_entries,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"archived_soroban_entries length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanResourcesExtV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "archived_soroban_entries" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"archived_soroban_entries length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["archived_soroban_entries"] = []
+            for _ in range(length):
+                _result["archived_soroban_entries"].append(
+                    Uint32.unpack_fields(
+                        unpacker, fields["archived_soroban_entries"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"archived_soroban_entries length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"archived_soroban_entries length {length} exceeds remaining input length {_remaining}"
+            )
+        archived_soroban_entries = []
+        for _ in range(length):
+            archived_soroban_entries.append(Uint32.unpack(unpacker, depth_limit - 1))
+        yield "archived_soroban_entries", archived_soroban_entries
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanResourcesExtV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanResourcesExtV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -88,11 +184,11 @@ class SorobanResourcesExtV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanResourcesExtV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -111,6 +207,26 @@ class SorobanResourcesExtV0:
             archived_soroban_entries=archived_soroban_entries,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"archived_soroban_entries": ')
+        write_json_array(write, self.archived_soroban_entries)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanResourcesExtV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.archived_soroban_entries = [
+            item.clone() for item in self.archived_soroban_entries
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanResourcesExtV0:
+        return self.clone()
+
+    def freeze(self) -> SorobanResourcesExtV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.archived_soroban_entries,))
 
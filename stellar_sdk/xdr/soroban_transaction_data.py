@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .soroban_resources import SorobanResources
 from .soroban_transaction_data_ext import SorobanTransactionDataExt
@@ -42,6 +55,8 @@ class SorobanTransactionData:
         };
     """
 
+    __slots__ = ("ext", "resource_fee", "resources")
+
     def __init__(
         self,
         ext: SorobanTransactionDataExt,
@@ -57,6 +72,9 @@ class SorobanTransactionData:
         self.resources.pack(packer)
         self.resource_fee.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.ext.xdr_size() + self.resources.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -72,16 +90,81 @@ class SorobanTransactionData:
             resource_fee=resource_fee,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SorobanTransactionDataExt.skip(unpacker, depth_limit - 1)
+        SorobanResources.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanTransactionData:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = SorobanTransactionDataExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            SorobanTransactionDataExt.skip(unpacker, depth_limit - 1)
+        if "resources" in fields:
+            _result["resources"] = SorobanResources.unpack_fields(
+                unpacker, fields["resources"], depth_limit - 1
+            )
+        else:
+            SorobanResources.skip(unpacker, depth_limit - 1)
+        if "resource_fee" in fields:
+            _result["resource_fee"] = Int64.unpack_fields(
+                unpacker, fields["resource_fee"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ext = view_at(SorobanTransactionDataExt, unpacker, depth_limit - 1)
+        yield "ext", ext
+        SorobanTransactionDataExt.skip(unpacker, depth_limit - 1)
+        resources = view_at(SorobanResources, unpacker, depth_limit - 1)
+        yield "resources", resources
+        SorobanResources.skip(unpacker, depth_limit - 1)
+        yield "resource_fee", Int64.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanTransactionData:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanTransactionData:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -96,11 +179,11 @@ class SorobanTransactionData:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanTransactionData:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -120,6 +203,30 @@ class SorobanTransactionData:
             resource_fee=resource_fee,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "resources": ')
+        self.resources._write_json(write)
+        write(', "resource_fee": ')
+        self.resource_fee._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanTransactionData:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.resources = self.resources.clone()
+        result.resource_fee = self.resource_fee.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanTransactionData:
+        return self.clone()
+
+    def freeze(self) -> SorobanTransactionData:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
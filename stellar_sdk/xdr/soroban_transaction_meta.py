@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .contract_event import ContractEvent
 from .diagnostic_event import DiagnosticEvent
 from .sc_val import SCVal
@@ -35,6 +50,8 @@ class SorobanTransactionMeta:
         };
     """
 
+    __slots__ = ("diagnostic_events", "events", "ext", "return_value")
+
     def __init__(
         self,
         ext: SorobanTransactionMetaExt,
@@ -67,6 +84,16 @@ class SorobanTransactionMeta:
         for diagnostic_events_item in self.diagnostic_events:
             diagnostic_events_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.ext.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.events)
+            + self.return_value.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.diagnostic_events)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -100,16 +127,155 @@ class SorobanTransactionMeta:
             diagnostic_events=diagnostic_events,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SorobanTransactionMetaExt.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            ContractEvent.skip(unpacker, depth_limit - 1)
+        SCVal.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            DiagnosticEvent.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanTransactionMeta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = SorobanTransactionMetaExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            SorobanTransactionMetaExt.skip(unpacker, depth_limit - 1)
+        if "events" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["events"] = []
+            for _ in range(length):
+                _result["events"].append(
+                    ContractEvent.unpack_fields(
+                        unpacker, fields["events"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                ContractEvent.skip(unpacker, depth_limit - 1)
+        if "return_value" in fields:
+            _result["return_value"] = SCVal.unpack_fields(
+                unpacker, fields["return_value"], depth_limit - 1
+            )
+        else:
+            SCVal.skip(unpacker, depth_limit - 1)
+        if "diagnostic_events" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["diagnostic_events"] = []
+            for _ in range(length):
+                _result["diagnostic_events"].append(
+                    DiagnosticEvent.unpack_fields(
+                        unpacker, fields["diagnostic_events"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                DiagnosticEvent.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", SorobanTransactionMetaExt.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        events = []
+        for _ in range(length):
+            events.append(unpack_view(ContractEvent, unpacker, depth_limit - 1))
+        yield "events", events
+        return_value = view_at(SCVal, unpacker, depth_limit - 1)
+        yield "return_value", return_value
+        SCVal.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+            )
+        diagnostic_events = []
+        for _ in range(length):
+            diagnostic_events.append(
+                unpack_view(DiagnosticEvent, unpacker, depth_limit - 1)
+            )
+        yield "diagnostic_events", diagnostic_events
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanTransactionMeta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanTransactionMeta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -124,11 +290,11 @@ class SorobanTransactionMeta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanTransactionMeta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -156,6 +322,33 @@ class SorobanTransactionMeta:
             diagnostic_events=diagnostic_events,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "events": ')
+        write_json_array(write, self.events)
+        write(', "return_value": ')
+        self.return_value._write_json(write)
+        write(', "diagnostic_events": ')
+        write_json_array(write, self.diagnostic_events)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanTransactionMeta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.events = [item.clone() for item in self.events]
+        result.return_value = self.return_value.clone()
+        result.diagnostic_events = [item.clone() for item in self.diagnostic_events]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanTransactionMeta:
+        return self.clone()
+
+    def freeze(self) -> SorobanTransactionMeta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
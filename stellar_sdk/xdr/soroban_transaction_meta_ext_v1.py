@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .extension_point import ExtensionPoint
 from .int64 import Int64
 
@@ -53,6 +63,13 @@ class SorobanTransactionMetaExtV1:
         };
     """
 
+    __slots__ = (
+        "ext",
+        "rent_fee_charged",
+        "total_non_refundable_resource_fee_charged",
+        "total_refundable_resource_fee_charged",
+    )
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -75,6 +92,9 @@ class SorobanTransactionMetaExtV1:
         self.total_refundable_resource_fee_charged.pack(packer)
         self.rent_fee_charged.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 24 + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -94,16 +114,76 @@ class SorobanTransactionMetaExtV1:
             rent_fee_charged=rent_fee_charged,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+        Int64.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanTransactionMetaExtV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "total_non_refundable_resource_fee_charged" in fields:
+            _result["total_non_refundable_resource_fee_charged"] = Int64.unpack_fields(
+                unpacker,
+                fields["total_non_refundable_resource_fee_charged"],
+                depth_limit - 1,
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "total_refundable_resource_fee_charged" in fields:
+            _result["total_refundable_resource_fee_charged"] = Int64.unpack_fields(
+                unpacker,
+                fields["total_refundable_resource_fee_charged"],
+                depth_limit - 1,
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "rent_fee_charged" in fields:
+            _result["rent_fee_charged"] = Int64.unpack_fields(
+                unpacker, fields["rent_fee_charged"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanTransactionMetaExtV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanTransactionMetaExtV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -118,11 +198,11 @@ class SorobanTransactionMetaExtV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanTransactionMetaExtV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -149,6 +229,37 @@ class SorobanTransactionMetaExtV1:
             rent_fee_charged=rent_fee_charged,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "total_non_refundable_resource_fee_charged": ')
+        self.total_non_refundable_resource_fee_charged._write_json(write)
+        write(', "total_refundable_resource_fee_charged": ')
+        self.total_refundable_resource_fee_charged._write_json(write)
+        write(', "rent_fee_charged": ')
+        self.rent_fee_charged._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanTransactionMetaExtV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.total_non_refundable_resource_fee_charged = (
+            self.total_non_refundable_resource_fee_charged.clone()
+        )
+        result.total_refundable_resource_fee_charged = (
+            self.total_refundable_resource_fee_charged.clone()
+        )
+        result.rent_fee_charged = self.rent_fee_charged.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanTransactionMetaExtV1:
+        return self.clone()
+
+    def freeze(self) -> SorobanTransactionMetaExtV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .sc_val import SCVal
 from .soroban_transaction_meta_ext import SorobanTransactionMetaExt
 
@@ -26,6 +39,8 @@ class SorobanTransactionMetaV2:
         };
     """
 
+    __slots__ = ("ext", "return_value")
+
     def __init__(
         self,
         ext: SorobanTransactionMetaExt,
@@ -42,6 +57,13 @@ class SorobanTransactionMetaV2:
             packer.pack_uint(1)
             self.return_value.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.ext.xdr_size()
+            + 4
+            + (self.return_value.xdr_size() if self.return_value is not None else 0)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +79,78 @@ class SorobanTransactionMetaV2:
             return_value=return_value,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SorobanTransactionMetaExt.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            SCVal.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SorobanTransactionMetaV2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = SorobanTransactionMetaExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            SorobanTransactionMetaExt.skip(unpacker, depth_limit - 1)
+        if "return_value" in fields:
+            _result["return_value"] = (
+                SCVal.unpack_fields(unpacker, fields["return_value"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                SCVal.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", SorobanTransactionMetaExt.unpack(unpacker, depth_limit - 1)
+        yield (
+            "return_value",
+            view_at(SCVal, unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SorobanTransactionMetaV2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SorobanTransactionMetaV2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +165,11 @@ class SorobanTransactionMetaV2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SorobanTransactionMetaV2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -108,6 +192,32 @@ class SorobanTransactionMetaV2:
             return_value=return_value,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "return_value": ')
+        if self.return_value is None:
+            write("null")
+        else:
+            self.return_value._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SorobanTransactionMetaV2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.return_value = (
+            self.return_value.clone() if self.return_value is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SorobanTransactionMetaV2:
+        return self.clone()
+
+    def freeze(self) -> SorobanTransactionMetaV2:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
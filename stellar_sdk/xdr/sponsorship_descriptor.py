@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
 from .account_id import AccountID
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["SponsorshipDescriptor"]
 
@@ -20,6 +30,8 @@ class SponsorshipDescriptor:
         typedef AccountID* SponsorshipDescriptor;
     """
 
+    __slots__ = ("sponsorship_descriptor",)
+
     def __init__(self, sponsorship_descriptor: AccountID | None) -> None:
         self.sponsorship_descriptor = sponsorship_descriptor
 
@@ -30,6 +42,13 @@ class SponsorshipDescriptor:
             packer.pack_uint(1)
             self.sponsorship_descriptor.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (
+            self.sponsorship_descriptor.xdr_size()
+            if self.sponsorship_descriptor is not None
+            else 0
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -43,16 +62,57 @@ class SponsorshipDescriptor:
         )
         return cls(sponsorship_descriptor)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            AccountID.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SponsorshipDescriptor:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "sponsorship_descriptor" in fields:
+            _result["sponsorship_descriptor"] = (
+                AccountID.unpack_fields(
+                    unpacker, fields["sponsorship_descriptor"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                AccountID.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SponsorshipDescriptor:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SponsorshipDescriptor:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -67,11 +127,11 @@ class SponsorshipDescriptor:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SponsorshipDescriptor:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return (
@@ -86,6 +146,29 @@ class SponsorshipDescriptor:
             AccountID.from_json_dict(json_value) if json_value is not None else None
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.sponsorship_descriptor is None:
+            write("null")
+        else:
+            self.sponsorship_descriptor._write_json(write)
+
+    def clone(self, deep: bool = True) -> SponsorshipDescriptor:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.sponsorship_descriptor = (
+            self.sponsorship_descriptor.clone()
+            if self.sponsorship_descriptor is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SponsorshipDescriptor:
+        return self.clone()
+
+    def freeze(self) -> SponsorshipDescriptor:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.sponsorship_descriptor,))
 
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">IIIqqIIIII")
 __all__ = ["StateArchivalSettings"]
 
 
@@ -44,6 +56,19 @@ class StateArchivalSettings:
         };
     """
 
+    __slots__ = (
+        "eviction_scan_size",
+        "live_soroban_state_size_window_sample_period",
+        "live_soroban_state_size_window_sample_size",
+        "max_entries_to_archive",
+        "max_entry_ttl",
+        "min_persistent_ttl",
+        "min_temporary_ttl",
+        "persistent_rent_rate_denominator",
+        "starting_eviction_scan_level",
+        "temp_rent_rate_denominator",
+    )
+
     def __init__(
         self,
         max_entry_ttl: Uint32,
@@ -73,16 +98,22 @@ class StateArchivalSettings:
         self.starting_eviction_scan_level = starting_eviction_scan_level
 
     def pack(self, packer: Packer) -> None:
-        self.max_entry_ttl.pack(packer)
-        self.min_temporary_ttl.pack(packer)
-        self.min_persistent_ttl.pack(packer)
-        self.persistent_rent_rate_denominator.pack(packer)
-        self.temp_rent_rate_denominator.pack(packer)
-        self.max_entries_to_archive.pack(packer)
-        self.live_soroban_state_size_window_sample_size.pack(packer)
-        self.live_soroban_state_size_window_sample_period.pack(packer)
-        self.eviction_scan_size.pack(packer)
-        self.starting_eviction_scan_level.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.max_entry_ttl.uint32,
+            self.min_temporary_ttl.uint32,
+            self.min_persistent_ttl.uint32,
+            self.persistent_rent_rate_denominator.int64,
+            self.temp_rent_rate_denominator.int64,
+            self.max_entries_to_archive.uint32,
+            self.live_soroban_state_size_window_sample_size.uint32,
+            self.live_soroban_state_size_window_sample_period.uint32,
+            self.eviction_scan_size.uint32,
+            self.starting_eviction_scan_level.uint32,
+        )
+
+    def xdr_size(self) -> int:
+        return 48
 
     @classmethod
     def unpack(
@@ -90,43 +121,142 @@ class StateArchivalSettings:
     ) -> StateArchivalSettings:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        max_entry_ttl = Uint32.unpack(unpacker, depth_limit - 1)
-        min_temporary_ttl = Uint32.unpack(unpacker, depth_limit - 1)
-        min_persistent_ttl = Uint32.unpack(unpacker, depth_limit - 1)
-        persistent_rent_rate_denominator = Int64.unpack(unpacker, depth_limit - 1)
-        temp_rent_rate_denominator = Int64.unpack(unpacker, depth_limit - 1)
-        max_entries_to_archive = Uint32.unpack(unpacker, depth_limit - 1)
-        live_soroban_state_size_window_sample_size = Uint32.unpack(
-            unpacker, depth_limit - 1
-        )
-        live_soroban_state_size_window_sample_period = Uint32.unpack(
-            unpacker, depth_limit - 1
-        )
-        eviction_scan_size = Uint32.unpack(unpacker, depth_limit - 1)
-        starting_eviction_scan_level = Uint32.unpack(unpacker, depth_limit - 1)
+        (
+            max_entry_ttl,
+            min_temporary_ttl,
+            min_persistent_ttl,
+            persistent_rent_rate_denominator,
+            temp_rent_rate_denominator,
+            max_entries_to_archive,
+            live_soroban_state_size_window_sample_size,
+            live_soroban_state_size_window_sample_period,
+            eviction_scan_size,
+            starting_eviction_scan_level,
+        ) = _LAYOUT.read(unpacker)
         return cls(
-            max_entry_ttl=max_entry_ttl,
-            min_temporary_ttl=min_temporary_ttl,
-            min_persistent_ttl=min_persistent_ttl,
-            persistent_rent_rate_denominator=persistent_rent_rate_denominator,
-            temp_rent_rate_denominator=temp_rent_rate_denominator,
-            max_entries_to_archive=max_entries_to_archive,
-            live_soroban_state_size_window_sample_size=live_soroban_state_size_window_sample_size,
-            live_soroban_state_size_window_sample_period=live_soroban_state_size_window_sample_period,
-            eviction_scan_size=eviction_scan_size,
-            starting_eviction_scan_level=starting_eviction_scan_level,
+            max_entry_ttl=Uint32(max_entry_ttl),
+            min_temporary_ttl=Uint32(min_temporary_ttl),
+            min_persistent_ttl=Uint32(min_persistent_ttl),
+            persistent_rent_rate_denominator=Int64(persistent_rent_rate_denominator),
+            temp_rent_rate_denominator=Int64(temp_rent_rate_denominator),
+            max_entries_to_archive=Uint32(max_entries_to_archive),
+            live_soroban_state_size_window_sample_size=Uint32(
+                live_soroban_state_size_window_sample_size
+            ),
+            live_soroban_state_size_window_sample_period=Uint32(
+                live_soroban_state_size_window_sample_period
+            ),
+            eviction_scan_size=Uint32(eviction_scan_size),
+            starting_eviction_scan_level=Uint32(starting_eviction_scan_level),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | StateArchivalSettings:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "max_entry_ttl" in fields:
+            _result["max_entry_ttl"] = Uint32.unpack_fields(
+                unpacker, fields["max_entry_ttl"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "min_temporary_ttl" in fields:
+            _result["min_temporary_ttl"] = Uint32.unpack_fields(
+                unpacker, fields["min_temporary_ttl"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "min_persistent_ttl" in fields:
+            _result["min_persistent_ttl"] = Uint32.unpack_fields(
+                unpacker, fields["min_persistent_ttl"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "persistent_rent_rate_denominator" in fields:
+            _result["persistent_rent_rate_denominator"] = Int64.unpack_fields(
+                unpacker, fields["persistent_rent_rate_denominator"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "temp_rent_rate_denominator" in fields:
+            _result["temp_rent_rate_denominator"] = Int64.unpack_fields(
+                unpacker, fields["temp_rent_rate_denominator"], depth_limit - 1
+            )
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "max_entries_to_archive" in fields:
+            _result["max_entries_to_archive"] = Uint32.unpack_fields(
+                unpacker, fields["max_entries_to_archive"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "live_soroban_state_size_window_sample_size" in fields:
+            _result["live_soroban_state_size_window_sample_size"] = (
+                Uint32.unpack_fields(
+                    unpacker,
+                    fields["live_soroban_state_size_window_sample_size"],
+                    depth_limit - 1,
+                )
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "live_soroban_state_size_window_sample_period" in fields:
+            _result["live_soroban_state_size_window_sample_period"] = (
+                Uint32.unpack_fields(
+                    unpacker,
+                    fields["live_soroban_state_size_window_sample_period"],
+                    depth_limit - 1,
+                )
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "eviction_scan_size" in fields:
+            _result["eviction_scan_size"] = Uint32.unpack_fields(
+                unpacker, fields["eviction_scan_size"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "starting_eviction_scan_level" in fields:
+            _result["starting_eviction_scan_level"] = Uint32.unpack_fields(
+                unpacker, fields["starting_eviction_scan_level"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> StateArchivalSettings:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> StateArchivalSettings:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -141,11 +271,11 @@ class StateArchivalSettings:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> StateArchivalSettings:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -198,6 +328,57 @@ class StateArchivalSettings:
             starting_eviction_scan_level=starting_eviction_scan_level,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"max_entry_ttl": ')
+        self.max_entry_ttl._write_json(write)
+        write(', "min_temporary_ttl": ')
+        self.min_temporary_ttl._write_json(write)
+        write(', "min_persistent_ttl": ')
+        self.min_persistent_ttl._write_json(write)
+        write(', "persistent_rent_rate_denominator": ')
+        self.persistent_rent_rate_denominator._write_json(write)
+        write(', "temp_rent_rate_denominator": ')
+        self.temp_rent_rate_denominator._write_json(write)
+        write(', "max_entries_to_archive": ')
+        self.max_entries_to_archive._write_json(write)
+        write(', "live_soroban_state_size_window_sample_size": ')
+        self.live_soroban_state_size_window_sample_size._write_json(write)
+        write(', "live_soroban_state_size_window_sample_period": ')
+        self.live_soroban_state_size_window_sample_period._write_json(write)
+        write(', "eviction_scan_size": ')
+        self.eviction_scan_size._write_json(write)
+        write(', "starting_eviction_scan_level": ')
+        self.starting_eviction_scan_level._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> StateArchivalSettings:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.max_entry_ttl = self.max_entry_ttl.clone()
+        result.min_temporary_ttl = self.min_temporary_ttl.clone()
+        result.min_persistent_ttl = self.min_persistent_ttl.clone()
+        result.persistent_rent_rate_denominator = (
+            self.persistent_rent_rate_denominator.clone()
+        )
+        result.temp_rent_rate_denominator = self.temp_rent_rate_denominator.clone()
+        result.max_entries_to_archive = self.max_entries_to_archive.clone()
+        result.live_soroban_state_size_window_sample_size = (
+            self.live_soroban_state_size_window_sample_size.clone()
+        )
+        result.live_soroban_state_size_window_sample_period = (
+            self.live_soroban_state_size_window_sample_period.clone()
+        )
+        result.eviction_scan_size = self.eviction_scan_size.clone()
+        result.starting_eviction_scan_level = self.starting_eviction_scan_level.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> StateArchivalSettings:
+        return self.clone()
+
+    def freeze(self) -> StateArchivalSettings:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
 from .auth import Auth
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .dont_have import DontHave
 from .error import Error
 from .flood_advert import FloodAdvert
@@ -103,6 +117,31 @@ class StellarMessage:
         };
     """
 
+    __slots__ = (
+        "auth",
+        "dont_have",
+        "envelope",
+        "error",
+        "flood_advert",
+        "flood_demand",
+        "generalized_tx_set",
+        "get_scp_ledger_seq",
+        "hello",
+        "peers",
+        "q_set",
+        "q_set_hash",
+        "send_more_extended_message",
+        "send_more_message",
+        "signed_time_sliced_survey_request_message",
+        "signed_time_sliced_survey_response_message",
+        "signed_time_sliced_survey_start_collecting_message",
+        "signed_time_sliced_survey_stop_collecting_message",
+        "transaction",
+        "tx_set",
+        "tx_set_hash",
+        "type",
+    )
+
     def __init__(
         self,
         type: MessageType,
@@ -287,25 +326,407 @@ class StellarMessage:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == MessageType.ERROR_MSG:
+            assert self.error is not None
+            return 4 + self.error.xdr_size()
+        if self.type == MessageType.HELLO:
+            assert self.hello is not None
+            return 4 + self.hello.xdr_size()
+        if self.type == MessageType.AUTH:
+            return 8
+        if self.type == MessageType.DONT_HAVE:
+            return 40
+        if self.type == MessageType.PEERS:
+            assert self.peers is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.peers)
+        if self.type == MessageType.GET_TX_SET:
+            return 36
+        if self.type == MessageType.TX_SET:
+            assert self.tx_set is not None
+            return 4 + self.tx_set.xdr_size()
+        if self.type == MessageType.GENERALIZED_TX_SET:
+            assert self.generalized_tx_set is not None
+            return 4 + self.generalized_tx_set.xdr_size()
+        if self.type == MessageType.TRANSACTION:
+            assert self.transaction is not None
+            return 4 + self.transaction.xdr_size()
+        if self.type == MessageType.TIME_SLICED_SURVEY_REQUEST:
+            assert self.signed_time_sliced_survey_request_message is not None
+            return 4 + self.signed_time_sliced_survey_request_message.xdr_size()
+        if self.type == MessageType.TIME_SLICED_SURVEY_RESPONSE:
+            assert self.signed_time_sliced_survey_response_message is not None
+            return 4 + self.signed_time_sliced_survey_response_message.xdr_size()
+        if self.type == MessageType.TIME_SLICED_SURVEY_START_COLLECTING:
+            assert self.signed_time_sliced_survey_start_collecting_message is not None
+            return (
+                4 + self.signed_time_sliced_survey_start_collecting_message.xdr_size()
+            )
+        if self.type == MessageType.TIME_SLICED_SURVEY_STOP_COLLECTING:
+            assert self.signed_time_sliced_survey_stop_collecting_message is not None
+            return 4 + self.signed_time_sliced_survey_stop_collecting_message.xdr_size()
+        if self.type == MessageType.GET_SCP_QUORUMSET:
+            return 36
+        if self.type == MessageType.SCP_QUORUMSET:
+            assert self.q_set is not None
+            return 4 + self.q_set.xdr_size()
+        if self.type == MessageType.SCP_MESSAGE:
+            assert self.envelope is not None
+            return 4 + self.envelope.xdr_size()
+        if self.type == MessageType.GET_SCP_STATE:
+            return 8
+        if self.type == MessageType.SEND_MORE:
+            return 8
+        if self.type == MessageType.SEND_MORE_EXTENDED:
+            return 12
+        if self.type == MessageType.FLOOD_ADVERT:
+            assert self.flood_advert is not None
+            return 4 + self.flood_advert.xdr_size()
+        if self.type == MessageType.FLOOD_DEMAND:
+            assert self.flood_demand is not None
+            return 4 + self.flood_demand.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> StellarMessage:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = MessageType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = MessageType.unpack(unpacker)
         if type == MessageType.ERROR_MSG:
-            error = Error.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, error=error)
+            Error.skip(unpacker, depth_limit - 1)
+            return
         if type == MessageType.HELLO:
-            hello = Hello.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, hello=hello)
+            Hello.skip(unpacker, depth_limit - 1)
+            return
         if type == MessageType.AUTH:
-            auth = Auth.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, auth=auth)
+            Auth.skip(unpacker, depth_limit - 1)
+            return
         if type == MessageType.DONT_HAVE:
-            dont_have = DontHave.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, dont_have=dont_have)
+            DontHave.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.PEERS:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"peers length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                PeerAddress.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.GET_TX_SET:
+            Uint256.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.TX_SET:
+            TransactionSet.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.GENERALIZED_TX_SET:
+            GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.TRANSACTION:
+            TransactionEnvelope.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.TIME_SLICED_SURVEY_REQUEST:
+            SignedTimeSlicedSurveyRequestMessage.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.TIME_SLICED_SURVEY_RESPONSE:
+            SignedTimeSlicedSurveyResponseMessage.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.TIME_SLICED_SURVEY_START_COLLECTING:
+            SignedTimeSlicedSurveyStartCollectingMessage.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.TIME_SLICED_SURVEY_STOP_COLLECTING:
+            SignedTimeSlicedSurveyStopCollectingMessage.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.GET_SCP_QUORUMSET:
+            Uint256.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.SCP_QUORUMSET:
+            SCPQuorumSet.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.SCP_MESSAGE:
+            SCPEnvelope.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.GET_SCP_STATE:
+            Uint32.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.SEND_MORE:
+            SendMore.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.SEND_MORE_EXTENDED:
+            SendMoreExtended.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.FLOOD_ADVERT:
+            FloodAdvert.skip(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.FLOOD_DEMAND:
+            FloodDemand.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | StellarMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = MessageType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == MessageType.ERROR_MSG:
+            if "error" in fields:
+                _result["error"] = Error.unpack_fields(
+                    unpacker, fields["error"], depth_limit - 1
+                )
+            else:
+                Error.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.HELLO:
+            if "hello" in fields:
+                _result["hello"] = Hello.unpack_fields(
+                    unpacker, fields["hello"], depth_limit - 1
+                )
+            else:
+                Hello.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.AUTH:
+            if "auth" in fields:
+                _result["auth"] = Auth.unpack_fields(
+                    unpacker, fields["auth"], depth_limit - 1
+                )
+            else:
+                Auth.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.DONT_HAVE:
+            if "dont_have" in fields:
+                _result["dont_have"] = DontHave.unpack_fields(
+                    unpacker, fields["dont_have"], depth_limit - 1
+                )
+            else:
+                DontHave.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.PEERS:
+            if "peers" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"peers length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["peers"] = []
+                for _ in range(length):
+                    _result["peers"].append(
+                        PeerAddress.unpack_fields(
+                            unpacker, fields["peers"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"peers length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    PeerAddress.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.GET_TX_SET:
+            if "tx_set_hash" in fields:
+                _result["tx_set_hash"] = Uint256.unpack_fields(
+                    unpacker, fields["tx_set_hash"], depth_limit - 1
+                )
+            else:
+                Uint256.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.TX_SET:
+            if "tx_set" in fields:
+                _result["tx_set"] = TransactionSet.unpack_fields(
+                    unpacker, fields["tx_set"], depth_limit - 1
+                )
+            else:
+                TransactionSet.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.GENERALIZED_TX_SET:
+            if "generalized_tx_set" in fields:
+                _result["generalized_tx_set"] = GeneralizedTransactionSet.unpack_fields(
+                    unpacker, fields["generalized_tx_set"], depth_limit - 1
+                )
+            else:
+                GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.TRANSACTION:
+            if "transaction" in fields:
+                _result["transaction"] = TransactionEnvelope.unpack_fields(
+                    unpacker, fields["transaction"], depth_limit - 1
+                )
+            else:
+                TransactionEnvelope.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.TIME_SLICED_SURVEY_REQUEST:
+            if "signed_time_sliced_survey_request_message" in fields:
+                _result["signed_time_sliced_survey_request_message"] = (
+                    SignedTimeSlicedSurveyRequestMessage.unpack_fields(
+                        unpacker,
+                        fields["signed_time_sliced_survey_request_message"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                SignedTimeSlicedSurveyRequestMessage.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.TIME_SLICED_SURVEY_RESPONSE:
+            if "signed_time_sliced_survey_response_message" in fields:
+                _result["signed_time_sliced_survey_response_message"] = (
+                    SignedTimeSlicedSurveyResponseMessage.unpack_fields(
+                        unpacker,
+                        fields["signed_time_sliced_survey_response_message"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                SignedTimeSlicedSurveyResponseMessage.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.TIME_SLICED_SURVEY_START_COLLECTING:
+            if "signed_time_sliced_survey_start_collecting_message" in fields:
+                _result["signed_time_sliced_survey_start_collecting_message"] = (
+                    SignedTimeSlicedSurveyStartCollectingMessage.unpack_fields(
+                        unpacker,
+                        fields["signed_time_sliced_survey_start_collecting_message"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                SignedTimeSlicedSurveyStartCollectingMessage.skip(
+                    unpacker, depth_limit - 1
+                )
+            return _result
+        if type == MessageType.TIME_SLICED_SURVEY_STOP_COLLECTING:
+            if "signed_time_sliced_survey_stop_collecting_message" in fields:
+                _result["signed_time_sliced_survey_stop_collecting_message"] = (
+                    SignedTimeSlicedSurveyStopCollectingMessage.unpack_fields(
+                        unpacker,
+                        fields["signed_time_sliced_survey_stop_collecting_message"],
+                        depth_limit - 1,
+                    )
+                )
+            else:
+                SignedTimeSlicedSurveyStopCollectingMessage.skip(
+                    unpacker, depth_limit - 1
+                )
+            return _result
+        if type == MessageType.GET_SCP_QUORUMSET:
+            if "q_set_hash" in fields:
+                _result["q_set_hash"] = Uint256.unpack_fields(
+                    unpacker, fields["q_set_hash"], depth_limit - 1
+                )
+            else:
+                Uint256.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.SCP_QUORUMSET:
+            if "q_set" in fields:
+                _result["q_set"] = SCPQuorumSet.unpack_fields(
+                    unpacker, fields["q_set"], depth_limit - 1
+                )
+            else:
+                SCPQuorumSet.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.SCP_MESSAGE:
+            if "envelope" in fields:
+                _result["envelope"] = SCPEnvelope.unpack_fields(
+                    unpacker, fields["envelope"], depth_limit - 1
+                )
+            else:
+                SCPEnvelope.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.GET_SCP_STATE:
+            if "get_scp_ledger_seq" in fields:
+                _result["get_scp_ledger_seq"] = Uint32.unpack_fields(
+                    unpacker, fields["get_scp_ledger_seq"], depth_limit - 1
+                )
+            else:
+                Uint32.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.SEND_MORE:
+            if "send_more_message" in fields:
+                _result["send_more_message"] = SendMore.unpack_fields(
+                    unpacker, fields["send_more_message"], depth_limit - 1
+                )
+            else:
+                SendMore.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.SEND_MORE_EXTENDED:
+            if "send_more_extended_message" in fields:
+                _result["send_more_extended_message"] = SendMoreExtended.unpack_fields(
+                    unpacker, fields["send_more_extended_message"], depth_limit - 1
+                )
+            else:
+                SendMoreExtended.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.FLOOD_ADVERT:
+            if "flood_advert" in fields:
+                _result["flood_advert"] = FloodAdvert.unpack_fields(
+                    unpacker, fields["flood_advert"], depth_limit - 1
+                )
+            else:
+                FloodAdvert.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == MessageType.FLOOD_DEMAND:
+            if "flood_demand" in fields:
+                _result["flood_demand"] = FloodDemand.unpack_fields(
+                    unpacker, fields["flood_demand"], depth_limit - 1
+                )
+            else:
+                FloodDemand.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = MessageType.unpack(unpacker)
+        yield "type", type
+        if type == MessageType.ERROR_MSG:
+            yield "error", Error.unpack(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.HELLO:
+            yield "hello", Hello.unpack(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.AUTH:
+            yield "auth", Auth.unpack(unpacker, depth_limit - 1)
+            return
+        if type == MessageType.DONT_HAVE:
+            yield "dont_have", DontHave.unpack(unpacker, depth_limit - 1)
+            return
         if type == MessageType.PEERS:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -316,83 +737,78 @@ class StellarMessage:
             peers = []
             for _ in range(length):
                 peers.append(PeerAddress.unpack(unpacker, depth_limit - 1))
-            return cls(type=type, peers=peers)
+            yield "peers", peers
+            return
         if type == MessageType.GET_TX_SET:
-            tx_set_hash = Uint256.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, tx_set_hash=tx_set_hash)
+            yield "tx_set_hash", Uint256.unpack(unpacker, depth_limit - 1)
+            return
         if type == MessageType.TX_SET:
-            tx_set = TransactionSet.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, tx_set=tx_set)
+            yield "tx_set", view_at(TransactionSet, unpacker, depth_limit - 1)
+            return
         if type == MessageType.GENERALIZED_TX_SET:
-            generalized_tx_set = GeneralizedTransactionSet.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "generalized_tx_set",
+                view_at(GeneralizedTransactionSet, unpacker, depth_limit - 1),
             )
-            return cls(type=type, generalized_tx_set=generalized_tx_set)
+            return
         if type == MessageType.TRANSACTION:
-            transaction = TransactionEnvelope.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, transaction=transaction)
+            yield "transaction", view_at(TransactionEnvelope, unpacker, depth_limit - 1)
+            return
         if type == MessageType.TIME_SLICED_SURVEY_REQUEST:
-            signed_time_sliced_survey_request_message = (
-                SignedTimeSlicedSurveyRequestMessage.unpack(unpacker, depth_limit - 1)
-            )
-            return cls(
-                type=type,
-                signed_time_sliced_survey_request_message=signed_time_sliced_survey_request_message,
+            yield (
+                "signed_time_sliced_survey_request_message",
+                SignedTimeSlicedSurveyRequestMessage.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == MessageType.TIME_SLICED_SURVEY_RESPONSE:
-            signed_time_sliced_survey_response_message = (
-                SignedTimeSlicedSurveyResponseMessage.unpack(unpacker, depth_limit - 1)
-            )
-            return cls(
-                type=type,
-                signed_time_sliced_survey_response_message=signed_time_sliced_survey_response_message,
+            yield (
+                "signed_time_sliced_survey_response_message",
+                SignedTimeSlicedSurveyResponseMessage.unpack(unpacker, depth_limit - 1),
             )
+            return
         if type == MessageType.TIME_SLICED_SURVEY_START_COLLECTING:
-            signed_time_sliced_survey_start_collecting_message = (
+            yield (
+                "signed_time_sliced_survey_start_collecting_message",
                 SignedTimeSlicedSurveyStartCollectingMessage.unpack(
                     unpacker, depth_limit - 1
-                )
-            )
-            return cls(
-                type=type,
-                signed_time_sliced_survey_start_collecting_message=signed_time_sliced_survey_start_collecting_message,
+                ),
             )
+            return
         if type == MessageType.TIME_SLICED_SURVEY_STOP_COLLECTING:
-            signed_time_sliced_survey_stop_collecting_message = (
+            yield (
+                "signed_time_sliced_survey_stop_collecting_message",
                 SignedTimeSlicedSurveyStopCollectingMessage.unpack(
                     unpacker, depth_limit - 1
-                )
-            )
-            return cls(
-                type=type,
-                signed_time_sliced_survey_stop_collecting_message=signed_time_sliced_survey_stop_collecting_message,
+                ),
             )
+            return
         if type == MessageType.GET_SCP_QUORUMSET:
-            q_set_hash = Uint256.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, q_set_hash=q_set_hash)
+            yield "q_set_hash", Uint256.unpack(unpacker, depth_limit - 1)
+            return
         if type == MessageType.SCP_QUORUMSET:
-            q_set = SCPQuorumSet.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, q_set=q_set)
+            yield "q_set", view_at(SCPQuorumSet, unpacker, depth_limit - 1)
+            return
         if type == MessageType.SCP_MESSAGE:
-            envelope = SCPEnvelope.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, envelope=envelope)
+            yield "envelope", view_at(SCPEnvelope, unpacker, depth_limit - 1)
+            return
         if type == MessageType.GET_SCP_STATE:
-            get_scp_ledger_seq = Uint32.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, get_scp_ledger_seq=get_scp_ledger_seq)
+            yield "get_scp_ledger_seq", Uint32.unpack(unpacker, depth_limit - 1)
+            return
         if type == MessageType.SEND_MORE:
-            send_more_message = SendMore.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, send_more_message=send_more_message)
+            yield "send_more_message", SendMore.unpack(unpacker, depth_limit - 1)
+            return
         if type == MessageType.SEND_MORE_EXTENDED:
-            send_more_extended_message = SendMoreExtended.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "send_more_extended_message",
+                SendMoreExtended.unpack(unpacker, depth_limit - 1),
             )
-            return cls(type=type, send_more_extended_message=send_more_extended_message)
+            return
         if type == MessageType.FLOOD_ADVERT:
-            flood_advert = FloodAdvert.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, flood_advert=flood_advert)
+            yield "flood_advert", view_at(FloodAdvert, unpacker, depth_limit - 1)
+            return
         if type == MessageType.FLOOD_DEMAND:
-            flood_demand = FloodDemand.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, flood_demand=flood_demand)
+            yield "flood_demand", view_at(FloodDemand, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -401,10 +817,10 @@ class StellarMessage:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> StellarMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> StellarMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -419,11 +835,11 @@ class StellarMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> StellarMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == MessageType.ERROR_MSG:
@@ -606,6 +1022,215 @@ class StellarMessage:
             return cls(type=type, flood_demand=flood_demand)
         raise ValueError(f"Unknown key '{key}' for StellarMessage")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == MessageType.ERROR_MSG:
+            assert self.error is not None
+            write('{"error_msg": ')
+            self.error._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.HELLO:
+            assert self.hello is not None
+            write('{"hello": ')
+            self.hello._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.AUTH:
+            assert self.auth is not None
+            write('{"auth": ')
+            self.auth._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.DONT_HAVE:
+            assert self.dont_have is not None
+            write('{"dont_have": ')
+            self.dont_have._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.PEERS:
+            assert self.peers is not None
+            write('{"peers": ')
+            write_json_array(write, self.peers)
+            write("}")
+            return
+        if self.type == MessageType.GET_TX_SET:
+            assert self.tx_set_hash is not None
+            write('{"get_tx_set": ')
+            self.tx_set_hash._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.TX_SET:
+            assert self.tx_set is not None
+            write('{"tx_set": ')
+            self.tx_set._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.GENERALIZED_TX_SET:
+            assert self.generalized_tx_set is not None
+            write('{"generalized_tx_set": ')
+            self.generalized_tx_set._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.TRANSACTION:
+            assert self.transaction is not None
+            write('{"transaction": ')
+            self.transaction._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.TIME_SLICED_SURVEY_REQUEST:
+            assert self.signed_time_sliced_survey_request_message is not None
+            write('{"time_sliced_survey_request": ')
+            self.signed_time_sliced_survey_request_message._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.TIME_SLICED_SURVEY_RESPONSE:
+            assert self.signed_time_sliced_survey_response_message is not None
+            write('{"time_sliced_survey_response": ')
+            self.signed_time_sliced_survey_response_message._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.TIME_SLICED_SURVEY_START_COLLECTING:
+            assert self.signed_time_sliced_survey_start_collecting_message is not None
+            write('{"time_sliced_survey_start_collecting": ')
+            self.signed_time_sliced_survey_start_collecting_message._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.TIME_SLICED_SURVEY_STOP_COLLECTING:
+            assert self.signed_time_sliced_survey_stop_collecting_message is not None
+            write('{"time_sliced_survey_stop_collecting": ')
+            self.signed_time_sliced_survey_stop_collecting_message._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.GET_SCP_QUORUMSET:
+            assert self.q_set_hash is not None
+            write('{"get_scp_quorumset": ')
+            self.q_set_hash._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.SCP_QUORUMSET:
+            assert self.q_set is not None
+            write('{"scp_quorumset": ')
+            self.q_set._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.SCP_MESSAGE:
+            assert self.envelope is not None
+            write('{"scp_message": ')
+            self.envelope._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.GET_SCP_STATE:
+            assert self.get_scp_ledger_seq is not None
+            write('{"get_scp_state": ')
+            self.get_scp_ledger_seq._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.SEND_MORE:
+            assert self.send_more_message is not None
+            write('{"send_more": ')
+            self.send_more_message._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.SEND_MORE_EXTENDED:
+            assert self.send_more_extended_message is not None
+            write('{"send_more_extended": ')
+            self.send_more_extended_message._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.FLOOD_ADVERT:
+            assert self.flood_advert is not None
+            write('{"flood_advert": ')
+            self.flood_advert._write_json(write)
+            write("}")
+            return
+        if self.type == MessageType.FLOOD_DEMAND:
+            assert self.flood_demand is not None
+            write('{"flood_demand": ')
+            self.flood_demand._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in StellarMessage: {self.type}")
+
+    def clone(self, deep: bool = True) -> StellarMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.error = self.error.clone() if self.error is not None else None
+        result.hello = self.hello.clone() if self.hello is not None else None
+        result.auth = self.auth.clone() if self.auth is not None else None
+        result.dont_have = (
+            self.dont_have.clone() if self.dont_have is not None else None
+        )
+        result.peers = (
+            [item.clone() for item in self.peers] if self.peers is not None else None
+        )
+        result.tx_set_hash = (
+            self.tx_set_hash.clone() if self.tx_set_hash is not None else None
+        )
+        result.tx_set = self.tx_set.clone() if self.tx_set is not None else None
+        result.generalized_tx_set = (
+            self.generalized_tx_set.clone()
+            if self.generalized_tx_set is not None
+            else None
+        )
+        result.transaction = (
+            self.transaction.clone() if self.transaction is not None else None
+        )
+        result.signed_time_sliced_survey_request_message = (
+            self.signed_time_sliced_survey_request_message.clone()
+            if self.signed_time_sliced_survey_request_message is not None
+            else None
+        )
+        result.signed_time_sliced_survey_response_message = (
+            self.signed_time_sliced_survey_response_message.clone()
+            if self.signed_time_sliced_survey_response_message is not None
+            else None
+        )
+        result.signed_time_sliced_survey_start_collecting_message = (
+            self.signed_time_sliced_survey_start_collecting_message.clone()
+            if self.signed_time_sliced_survey_start_collecting_message is not None
+            else None
+        )
+        result.signed_time_sliced_survey_stop_collecting_message = (
+            self.signed_time_sliced_survey_stop_collecting_message.clone()
+            if self.signed_time_sliced_survey_stop_collecting_message is not None
+            else None
+        )
+        result.q_set_hash = (
+            self.q_set_hash.clone() if self.q_set_hash is not None else None
+        )
+        result.q_set = self.q_set.clone() if self.q_set is not None else None
+        result.envelope = self.envelope.clone() if self.envelope is not None else None
+        result.get_scp_ledger_seq = (
+            self.get_scp_ledger_seq.clone()
+            if self.get_scp_ledger_seq is not None
+            else None
+        )
+        result.send_more_message = (
+            self.send_more_message.clone()
+            if self.send_more_message is not None
+            else None
+        )
+        result.send_more_extended_message = (
+            self.send_more_extended_message.clone()
+            if self.send_more_extended_message is not None
+            else None
+        )
+        result.flood_advert = (
+            self.flood_advert.clone() if self.flood_advert is not None else None
+        )
+        result.flood_demand = (
+            self.flood_demand.clone() if self.flood_demand is not None else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> StellarMessage:
+        return self.clone()
+
+    def freeze(self) -> StellarMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -720,3 +1345,189 @@ class StellarMessage:
         if self.flood_demand is not None:
             out.append(f"flood_demand={self.flood_demand}")
         return f"<StellarMessage [{', '.join(out)}]>"
+
+
+def _unpack_error(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    error = Error.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, error=error)
+
+
+def _unpack_hello(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    hello = Hello.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, hello=hello)
+
+
+def _unpack_auth(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    auth = Auth.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, auth=auth)
+
+
+def _unpack_dont_have(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    dont_have = DontHave.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, dont_have=dont_have)
+
+
+def _unpack_peers(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"peers length {length} exceeds remaining input length {_remaining}"
+        )
+    peers = []
+    for _ in range(length):
+        peers.append(PeerAddress.unpack(unpacker, depth_limit - 1))
+    return cls(type=type, peers=peers)
+
+
+def _unpack_tx_set_hash(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    tx_set_hash = Uint256.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, tx_set_hash=tx_set_hash)
+
+
+def _unpack_tx_set(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    tx_set = TransactionSet.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, tx_set=tx_set)
+
+
+def _unpack_generalized_tx_set(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    generalized_tx_set = GeneralizedTransactionSet.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, generalized_tx_set=generalized_tx_set)
+
+
+def _unpack_transaction(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    transaction = TransactionEnvelope.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, transaction=transaction)
+
+
+def _unpack_signed_time_sliced_survey_request_message(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    signed_time_sliced_survey_request_message = (
+        SignedTimeSlicedSurveyRequestMessage.unpack(unpacker, depth_limit - 1)
+    )
+    return cls(
+        type=type,
+        signed_time_sliced_survey_request_message=signed_time_sliced_survey_request_message,
+    )
+
+
+def _unpack_signed_time_sliced_survey_response_message(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    signed_time_sliced_survey_response_message = (
+        SignedTimeSlicedSurveyResponseMessage.unpack(unpacker, depth_limit - 1)
+    )
+    return cls(
+        type=type,
+        signed_time_sliced_survey_response_message=signed_time_sliced_survey_response_message,
+    )
+
+
+def _unpack_signed_time_sliced_survey_start_collecting_message(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    signed_time_sliced_survey_start_collecting_message = (
+        SignedTimeSlicedSurveyStartCollectingMessage.unpack(unpacker, depth_limit - 1)
+    )
+    return cls(
+        type=type,
+        signed_time_sliced_survey_start_collecting_message=signed_time_sliced_survey_start_collecting_message,
+    )
+
+
+def _unpack_signed_time_sliced_survey_stop_collecting_message(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    signed_time_sliced_survey_stop_collecting_message = (
+        SignedTimeSlicedSurveyStopCollectingMessage.unpack(unpacker, depth_limit - 1)
+    )
+    return cls(
+        type=type,
+        signed_time_sliced_survey_stop_collecting_message=signed_time_sliced_survey_stop_collecting_message,
+    )
+
+
+def _unpack_q_set_hash(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    q_set_hash = Uint256.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, q_set_hash=q_set_hash)
+
+
+def _unpack_q_set(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    q_set = SCPQuorumSet.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, q_set=q_set)
+
+
+def _unpack_envelope(cls, type, unpacker: Unpacker, depth_limit: int) -> StellarMessage:
+    envelope = SCPEnvelope.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, envelope=envelope)
+
+
+def _unpack_get_scp_ledger_seq(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    get_scp_ledger_seq = Uint32.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, get_scp_ledger_seq=get_scp_ledger_seq)
+
+
+def _unpack_send_more_message(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    send_more_message = SendMore.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, send_more_message=send_more_message)
+
+
+def _unpack_send_more_extended_message(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    send_more_extended_message = SendMoreExtended.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, send_more_extended_message=send_more_extended_message)
+
+
+def _unpack_flood_advert(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    flood_advert = FloodAdvert.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, flood_advert=flood_advert)
+
+
+def _unpack_flood_demand(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> StellarMessage:
+    flood_demand = FloodDemand.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, flood_demand=flood_demand)
+
+
+_UNPACK_ARMS = {
+    MessageType.ERROR_MSG: _unpack_error,
+    MessageType.HELLO: _unpack_hello,
+    MessageType.AUTH: _unpack_auth,
+    MessageType.DONT_HAVE: _unpack_dont_have,
+    MessageType.PEERS: _unpack_peers,
+    MessageType.GET_TX_SET: _unpack_tx_set_hash,
+    MessageType.TX_SET: _unpack_tx_set,
+    MessageType.GENERALIZED_TX_SET: _unpack_generalized_tx_set,
+    MessageType.TRANSACTION: _unpack_transaction,
+    MessageType.TIME_SLICED_SURVEY_REQUEST: _unpack_signed_time_sliced_survey_request_message,
+    MessageType.TIME_SLICED_SURVEY_RESPONSE: _unpack_signed_time_sliced_survey_response_message,
+    MessageType.TIME_SLICED_SURVEY_START_COLLECTING: _unpack_signed_time_sliced_survey_start_collecting_message,
+    MessageType.TIME_SLICED_SURVEY_STOP_COLLECTING: _unpack_signed_time_sliced_survey_stop_collecting_message,
+    MessageType.GET_SCP_QUORUMSET: _unpack_q_set_hash,
+    MessageType.SCP_QUORUMSET: _unpack_q_set,
+    MessageType.SCP_MESSAGE: _unpack_envelope,
+    MessageType.GET_SCP_STATE: _unpack_get_scp_ledger_seq,
+    MessageType.SEND_MORE: _unpack_send_more_message,
+    MessageType.SEND_MORE_EXTENDED: _unpack_send_more_extended_message,
+    MessageType.FLOOD_ADVERT: _unpack_flood_advert,
+    MessageType.FLOOD_DEMAND: _unpack_flood_demand,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 from .stellar_value_ext import StellarValueExt
 from .time_point import TimePoint
@@ -44,6 +57,8 @@ class StellarValue:
         };
     """
 
+    __slots__ = ("close_time", "ext", "tx_set_hash", "upgrades")
+
     def __init__(
         self,
         tx_set_hash: Hash,
@@ -69,6 +84,14 @@ class StellarValue:
             upgrades_item.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            40
+            + 4
+            + sum(item.xdr_size() for item in self.upgrades)
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -94,16 +117,116 @@ class StellarValue:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        TimePoint.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"upgrades length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            UpgradeType.skip(unpacker, depth_limit - 1)
+        StellarValueExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | StellarValue:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_set_hash" in fields:
+            _result["tx_set_hash"] = Hash.unpack_fields(
+                unpacker, fields["tx_set_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "close_time" in fields:
+            _result["close_time"] = TimePoint.unpack_fields(
+                unpacker, fields["close_time"], depth_limit - 1
+            )
+        else:
+            TimePoint.skip(unpacker, depth_limit - 1)
+        if "upgrades" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"upgrades length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["upgrades"] = []
+            for _ in range(length):
+                _result["upgrades"].append(
+                    UpgradeType.unpack_fields(
+                        unpacker, fields["upgrades"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"upgrades length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                UpgradeType.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = StellarValueExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            StellarValueExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "tx_set_hash", Hash.unpack(unpacker, depth_limit - 1)
+        yield "close_time", TimePoint.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"upgrades length {length} exceeds remaining input length {_remaining}"
+            )
+        upgrades = []
+        for _ in range(length):
+            upgrades.append(UpgradeType.unpack(unpacker, depth_limit - 1))
+        yield "upgrades", upgrades
+        yield "ext", StellarValueExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> StellarValue:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> StellarValue:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -118,11 +241,11 @@ class StellarValue:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> StellarValue:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -145,6 +268,33 @@ class StellarValue:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx_set_hash": ')
+        self.tx_set_hash._write_json(write)
+        write(', "close_time": ')
+        self.close_time._write_json(write)
+        write(', "upgrades": ')
+        write_json_array(write, self.upgrades)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> StellarValue:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_set_hash = self.tx_set_hash.clone()
+        result.close_time = self.close_time.clone()
+        result.upgrades = [item.clone() for item in self.upgrades]
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> StellarValue:
+        return self.clone()
+
+    def freeze(self) -> StellarValue:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
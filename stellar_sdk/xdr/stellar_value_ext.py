@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .ledger_close_value_signature import LedgerCloseValueSignature
 from .stellar_value_type import StellarValueType
 
@@ -27,6 +37,8 @@ class StellarValueExt:
             }
     """
 
+    __slots__ = ("lc_value_signature", "v")
+
     def __init__(
         self,
         v: StellarValueType,
@@ -46,32 +58,82 @@ class StellarValueExt:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == StellarValueType.STELLAR_VALUE_BASIC:
+            return 4
+        if self.v == StellarValueType.STELLAR_VALUE_SIGNED:
+            assert self.lc_value_signature is not None
+            return 4 + self.lc_value_signature.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> StellarValueExt:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = StellarValueType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = StellarValueType.unpack(unpacker)
         if v == StellarValueType.STELLAR_VALUE_BASIC:
-            return cls(v=v)
+            return
         if v == StellarValueType.STELLAR_VALUE_SIGNED:
-            lc_value_signature = LedgerCloseValueSignature.unpack(
-                unpacker, depth_limit - 1
-            )
-            return cls(v=v, lc_value_signature=lc_value_signature)
+            LedgerCloseValueSignature.skip(unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid v.")
 
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | StellarValueExt:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = StellarValueType.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == StellarValueType.STELLAR_VALUE_BASIC:
+            return _result
+        if v == StellarValueType.STELLAR_VALUE_SIGNED:
+            if "lc_value_signature" in fields:
+                _result["lc_value_signature"] = LedgerCloseValueSignature.unpack_fields(
+                    unpacker, fields["lc_value_signature"], depth_limit - 1
+                )
+            else:
+                LedgerCloseValueSignature.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> StellarValueExt:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> StellarValueExt:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -86,11 +148,11 @@ class StellarValueExt:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> StellarValueExt:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == StellarValueType.STELLAR_VALUE_BASIC:
@@ -122,6 +184,36 @@ class StellarValueExt:
             return cls(v=v, lc_value_signature=lc_value_signature)
         raise ValueError(f"Unknown key '{key}' for StellarValueExt")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == StellarValueType.STELLAR_VALUE_BASIC:
+            write('"basic"')
+            return
+        if self.v == StellarValueType.STELLAR_VALUE_SIGNED:
+            assert self.lc_value_signature is not None
+            write('{"signed": ')
+            self.lc_value_signature._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in StellarValueExt: {self.v}")
+
+    def clone(self, deep: bool = True) -> StellarValueExt:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.lc_value_signature = (
+            self.lc_value_signature.clone()
+            if self.lc_value_signature is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> StellarValueExt:
+        return self.clone()
+
+    def freeze(self) -> StellarValueExt:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -141,3 +233,20 @@ class StellarValueExt:
         if self.lc_value_signature is not None:
             out.append(f"lc_value_signature={self.lc_value_signature}")
         return f"<StellarValueExt [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, v, unpacker: Unpacker, depth_limit: int) -> StellarValueExt:
+    return cls(v=v)
+
+
+def _unpack_lc_value_signature(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> StellarValueExt:
+    lc_value_signature = LedgerCloseValueSignature.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, lc_value_signature=lc_value_signature)
+
+
+_UNPACK_ARMS = {
+    StellarValueType.STELLAR_VALUE_BASIC: _unpack_void,
+    StellarValueType.STELLAR_VALUE_SIGNED: _unpack_lc_value_signature,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .stellar_value import StellarValue
 from .stored_transaction_set import StoredTransactionSet
 from .uint32 import Uint32
@@ -27,6 +40,8 @@ class StoredDebugTransactionSet:
                                                                 };
     """
 
+    __slots__ = ("ledger_seq", "scp_value", "tx_set")
+
     def __init__(
         self,
         tx_set: StoredTransactionSet,
@@ -42,6 +57,9 @@ class StoredDebugTransactionSet:
         self.ledger_seq.pack(packer)
         self.scp_value.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.tx_set.xdr_size() + self.scp_value.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +75,79 @@ class StoredDebugTransactionSet:
             scp_value=scp_value,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        StoredTransactionSet.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        StellarValue.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | StoredDebugTransactionSet:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_set" in fields:
+            _result["tx_set"] = StoredTransactionSet.unpack_fields(
+                unpacker, fields["tx_set"], depth_limit - 1
+            )
+        else:
+            StoredTransactionSet.skip(unpacker, depth_limit - 1)
+        if "ledger_seq" in fields:
+            _result["ledger_seq"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "scp_value" in fields:
+            _result["scp_value"] = StellarValue.unpack_fields(
+                unpacker, fields["scp_value"], depth_limit - 1
+            )
+        else:
+            StellarValue.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        tx_set = view_at(StoredTransactionSet, unpacker, depth_limit - 1)
+        yield "tx_set", tx_set
+        StoredTransactionSet.skip(unpacker, depth_limit - 1)
+        yield "ledger_seq", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "scp_value", view_at(StellarValue, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> StoredDebugTransactionSet:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> StoredDebugTransactionSet:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +162,11 @@ class StoredDebugTransactionSet:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> StoredDebugTransactionSet:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -105,6 +186,30 @@ class StoredDebugTransactionSet:
             scp_value=scp_value,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx_set": ')
+        self.tx_set._write_json(write)
+        write(', "ledger_seq": ')
+        self.ledger_seq._write_json(write)
+        write(', "scp_value": ')
+        self.scp_value._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> StoredDebugTransactionSet:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_set = self.tx_set.clone()
+        result.ledger_seq = self.ledger_seq.clone()
+        result.scp_value = self.scp_value.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> StoredDebugTransactionSet:
+        return self.clone()
+
+    def freeze(self) -> StoredDebugTransactionSet:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["String32"]
 
@@ -19,6 +31,8 @@ class String32:
         typedef string string32<32>;
     """
 
+    __slots__ = ("string32",)
+
     def __init__(self, string32: bytes) -> None:
         _expect_max_length = 32
         if string32 and len(string32) > _expect_max_length:
@@ -30,6 +44,9 @@ class String32:
     def pack(self, packer: Packer) -> None:
         String(self.string32, 32).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.string32) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -39,16 +56,47 @@ class String32:
         string32 = String.unpack(unpacker, 32)
         return cls(string32)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, 32)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | String32:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "string32" in fields:
+            _result["string32"] = String.unpack_fields(unpacker, fields["string32"], 32)
+        else:
+            String.skip(unpacker, 32)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> String32:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> String32:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +111,11 @@ class String32:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> String32:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return String.to_json_dict(self.string32)
@@ -76,6 +124,22 @@ class String32:
     def from_json_dict(cls, json_value: str) -> String32:
         return cls(String.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(String.to_json_dict(self.string32)))
+
+    def clone(self, deep: bool = True) -> String32:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.string32 = self.string32
+        return result
+
+    def __deepcopy__(self, memo: dict) -> String32:
+        return self.clone()
+
+    def freeze(self) -> String32:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.string32,))
 
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    String,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["String64"]
 
@@ -19,6 +31,8 @@ class String64:
         typedef string string64<64>;
     """
 
+    __slots__ = ("string64",)
+
     def __init__(self, string64: bytes) -> None:
         _expect_max_length = 64
         if string64 and len(string64) > _expect_max_length:
@@ -30,6 +44,9 @@ class String64:
     def pack(self, packer: Packer) -> None:
         String(self.string64, 64).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.string64) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -39,16 +56,47 @@ class String64:
         string64 = String.unpack(unpacker, 64)
         return cls(string64)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, 64)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | String64:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "string64" in fields:
+            _result["string64"] = String.unpack_fields(unpacker, fields["string64"], 64)
+        else:
+            String.skip(unpacker, 64)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> String64:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> String64:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +111,11 @@ class String64:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> String64:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return String.to_json_dict(self.string64)
@@ -76,6 +124,22 @@ class String64:
     def from_json_dict(cls, json_value: str) -> String64:
         return cls(String.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(String.to_json_dict(self.string64)))
+
+    def clone(self, deep: bool = True) -> String64:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.string64 = self.string64
+        return result
+
+    def __deepcopy__(self, memo: dict) -> String64:
+        return self.clone()
+
+    def freeze(self) -> String64:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.string64,))
 
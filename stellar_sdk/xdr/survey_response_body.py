@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .survey_message_response_type import SurveyMessageResponseType
 from .topology_response_body_v2 import TopologyResponseBodyV2
 
@@ -25,6 +38,8 @@ class SurveyResponseBody:
         };
     """
 
+    __slots__ = ("topology_response_body_v2", "type")
+
     def __init__(
         self,
         type: SurveyMessageResponseType,
@@ -42,6 +57,12 @@ class SurveyResponseBody:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2:
+            assert self.topology_response_body_v2 is not None
+            return 4 + self.topology_response_body_v2.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -49,11 +70,71 @@ class SurveyResponseBody:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = SurveyMessageResponseType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SurveyMessageResponseType.unpack(unpacker)
+        if type == SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2:
+            TopologyResponseBodyV2.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SurveyResponseBody:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = SurveyMessageResponseType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2:
+            if "topology_response_body_v2" in fields:
+                _result["topology_response_body_v2"] = (
+                    TopologyResponseBodyV2.unpack_fields(
+                        unpacker, fields["topology_response_body_v2"], depth_limit - 1
+                    )
+                )
+            else:
+                TopologyResponseBodyV2.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = SurveyMessageResponseType.unpack(unpacker)
+        yield "type", type
         if type == SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2:
-            topology_response_body_v2 = TopologyResponseBodyV2.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "topology_response_body_v2",
+                view_at(TopologyResponseBodyV2, unpacker, depth_limit - 1),
             )
-            return cls(type=type, topology_response_body_v2=topology_response_body_v2)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -62,10 +143,12 @@ class SurveyResponseBody:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SurveyResponseBody:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SurveyResponseBody:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -80,11 +163,11 @@ class SurveyResponseBody:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SurveyResponseBody:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2:
@@ -109,6 +192,33 @@ class SurveyResponseBody:
             return cls(type=type, topology_response_body_v2=topology_response_body_v2)
         raise ValueError(f"Unknown key '{key}' for SurveyResponseBody")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2:
+            assert self.topology_response_body_v2 is not None
+            write('{"survey_topology_response_v2": ')
+            self.topology_response_body_v2._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in SurveyResponseBody: {self.type}")
+
+    def clone(self, deep: bool = True) -> SurveyResponseBody:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.topology_response_body_v2 = (
+            self.topology_response_body_v2.clone()
+            if self.topology_response_body_v2 is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SurveyResponseBody:
+        return self.clone()
+
+    def freeze(self) -> SurveyResponseBody:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -131,3 +241,15 @@ class SurveyResponseBody:
         if self.topology_response_body_v2 is not None:
             out.append(f"topology_response_body_v2={self.topology_response_body_v2}")
         return f"<SurveyResponseBody [{', '.join(out)}]>"
+
+
+def _unpack_topology_response_body_v2(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> SurveyResponseBody:
+    topology_response_body_v2 = TopologyResponseBodyV2.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, topology_response_body_v2=topology_response_body_v2)
+
+
+_UNPACK_ARMS = {
+    SurveyMessageResponseType.SURVEY_TOPOLOGY_RESPONSE_V2: _unpack_topology_response_body_v2,
+}
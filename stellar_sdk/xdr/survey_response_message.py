@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .encrypted_body import EncryptedBody
 from .node_id import NodeID
 from .survey_message_command_type import SurveyMessageCommandType
@@ -30,6 +40,14 @@ class SurveyResponseMessage:
         };
     """
 
+    __slots__ = (
+        "command_type",
+        "encrypted_body",
+        "ledger_num",
+        "surveyed_peer_id",
+        "surveyor_peer_id",
+    )
+
     def __init__(
         self,
         surveyor_peer_id: NodeID,
@@ -51,6 +69,14 @@ class SurveyResponseMessage:
         self.command_type.pack(packer)
         self.encrypted_body.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            8
+            + self.surveyor_peer_id.xdr_size()
+            + self.surveyed_peer_id.xdr_size()
+            + self.encrypted_body.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -70,16 +96,79 @@ class SurveyResponseMessage:
             encrypted_body=encrypted_body,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        NodeID.skip(unpacker, depth_limit - 1)
+        NodeID.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        SurveyMessageCommandType.skip(unpacker)
+        EncryptedBody.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | SurveyResponseMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "surveyor_peer_id" in fields:
+            _result["surveyor_peer_id"] = NodeID.unpack_fields(
+                unpacker, fields["surveyor_peer_id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "surveyed_peer_id" in fields:
+            _result["surveyed_peer_id"] = NodeID.unpack_fields(
+                unpacker, fields["surveyed_peer_id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "ledger_num" in fields:
+            _result["ledger_num"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_num"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "command_type" in fields:
+            _result["command_type"] = SurveyMessageCommandType.unpack_fields(
+                unpacker, fields["command_type"]
+            )
+        else:
+            SurveyMessageCommandType.skip(unpacker)
+        if "encrypted_body" in fields:
+            _result["encrypted_body"] = EncryptedBody.unpack_fields(
+                unpacker, fields["encrypted_body"], depth_limit - 1
+            )
+        else:
+            EncryptedBody.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> SurveyResponseMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> SurveyResponseMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -94,11 +183,11 @@ class SurveyResponseMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> SurveyResponseMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -126,6 +215,36 @@ class SurveyResponseMessage:
             encrypted_body=encrypted_body,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"surveyor_peer_id": ')
+        self.surveyor_peer_id._write_json(write)
+        write(', "surveyed_peer_id": ')
+        self.surveyed_peer_id._write_json(write)
+        write(', "ledger_num": ')
+        self.ledger_num._write_json(write)
+        write(', "command_type": ')
+        self.command_type._write_json(write)
+        write(', "encrypted_body": ')
+        self.encrypted_body._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> SurveyResponseMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.surveyor_peer_id = self.surveyor_peer_id.clone()
+        result.surveyed_peer_id = self.surveyed_peer_id.clone()
+        result.ledger_num = self.ledger_num.clone()
+        result.command_type = self.command_type
+        result.encrypted_body = self.encrypted_body.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> SurveyResponseMessage:
+        return self.clone()
+
+    def freeze(self) -> SurveyResponseMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .time_point import TimePoint
+from .uint64 import Uint64
 
+_LAYOUT = FixedLayout(">QQ")
 __all__ = ["TimeBounds"]
 
 
@@ -24,6 +37,8 @@ class TimeBounds:
         };
     """
 
+    __slots__ = ("max_time", "min_time")
+
     def __init__(
         self,
         min_time: TimePoint,
@@ -33,8 +48,12 @@ class TimeBounds:
         self.max_time = max_time
 
     def pack(self, packer: Packer) -> None:
-        self.min_time.pack(packer)
-        self.max_time.pack(packer)
+        _LAYOUT.write(
+            packer, self.min_time.time_point.uint64, self.max_time.time_point.uint64
+        )
+
+    def xdr_size(self) -> int:
+        return 16
 
     @classmethod
     def unpack(
@@ -42,23 +61,61 @@ class TimeBounds:
     ) -> TimeBounds:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        min_time = TimePoint.unpack(unpacker, depth_limit - 1)
-        max_time = TimePoint.unpack(unpacker, depth_limit - 1)
+        min_time, max_time = _LAYOUT.read(unpacker)
         return cls(
-            min_time=min_time,
-            max_time=max_time,
+            min_time=TimePoint(Uint64(min_time)),
+            max_time=TimePoint(Uint64(max_time)),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeBounds:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "min_time" in fields:
+            _result["min_time"] = TimePoint.unpack_fields(
+                unpacker, fields["min_time"], depth_limit - 1
+            )
+        else:
+            TimePoint.skip(unpacker, depth_limit - 1)
+        if "max_time" in fields:
+            _result["max_time"] = TimePoint.unpack_fields(
+                unpacker, fields["max_time"], depth_limit - 1
+            )
+        else:
+            TimePoint.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeBounds:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TimeBounds:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +130,11 @@ class TimeBounds:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeBounds:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +151,27 @@ class TimeBounds:
             max_time=max_time,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"min_time": ')
+        self.min_time._write_json(write)
+        write(', "max_time": ')
+        self.max_time._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TimeBounds:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.min_time = self.min_time.clone()
+        result.max_time = self.max_time.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeBounds:
+        return self.clone()
+
+    def freeze(self) -> TimeBounds:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint64 import Uint64
 
+_LAYOUT = FixedLayout(">Q")
 __all__ = ["TimePoint"]
 
 
@@ -20,11 +32,16 @@ class TimePoint:
         typedef uint64 TimePoint;
     """
 
+    __slots__ = ("time_point",)
+
     def __init__(self, time_point: Uint64) -> None:
         self.time_point = time_point
 
     def pack(self, packer: Packer) -> None:
-        self.time_point.pack(packer)
+        _LAYOUT.write(packer, self.time_point.uint64)
+
+    def xdr_size(self) -> int:
+        return 8
 
     @classmethod
     def unpack(
@@ -32,8 +49,41 @@ class TimePoint:
     ) -> TimePoint:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        time_point = Uint64.unpack(unpacker, depth_limit - 1)
-        return cls(time_point)
+        (time_point,) = _LAYOUT.read(unpacker)
+        return cls(Uint64(time_point))
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimePoint:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "time_point" in fields:
+            _result["time_point"] = Uint64.unpack_fields(
+                unpacker, fields["time_point"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -41,10 +91,10 @@ class TimePoint:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimePoint:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TimePoint:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -59,11 +109,11 @@ class TimePoint:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimePoint:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return self.time_point.to_json_dict()
@@ -72,6 +122,22 @@ class TimePoint:
     def from_json_dict(cls, json_value: str) -> TimePoint:
         return cls(Uint64.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        self.time_point._write_json(write)
+
+    def clone(self, deep: bool = True) -> TimePoint:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.time_point = self.time_point.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimePoint:
+        return self.clone()
+
+    def freeze(self) -> TimePoint:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.time_point,))
 
@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Boolean
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Boolean,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">IIIIIIIIII")
 __all__ = ["TimeSlicedNodeData"]
 
 
@@ -38,6 +52,19 @@ class TimeSlicedNodeData:
         };
     """
 
+    __slots__ = (
+        "added_authenticated_peers",
+        "dropped_authenticated_peers",
+        "is_validator",
+        "lost_sync_count",
+        "max_inbound_peer_count",
+        "max_outbound_peer_count",
+        "p75_scp_first_to_self_latency_ms",
+        "p75_scp_self_to_other_latency_ms",
+        "total_inbound_peer_count",
+        "total_outbound_peer_count",
+    )
+
     def __init__(
         self,
         added_authenticated_peers: Uint32,
@@ -63,16 +90,22 @@ class TimeSlicedNodeData:
         self.max_outbound_peer_count = max_outbound_peer_count
 
     def pack(self, packer: Packer) -> None:
-        self.added_authenticated_peers.pack(packer)
-        self.dropped_authenticated_peers.pack(packer)
-        self.total_inbound_peer_count.pack(packer)
-        self.total_outbound_peer_count.pack(packer)
-        self.p75_scp_first_to_self_latency_ms.pack(packer)
-        self.p75_scp_self_to_other_latency_ms.pack(packer)
-        self.lost_sync_count.pack(packer)
-        Boolean(self.is_validator).pack(packer)
-        self.max_inbound_peer_count.pack(packer)
-        self.max_outbound_peer_count.pack(packer)
+        _LAYOUT.write(
+            packer,
+            self.added_authenticated_peers.uint32,
+            self.dropped_authenticated_peers.uint32,
+            self.total_inbound_peer_count.uint32,
+            self.total_outbound_peer_count.uint32,
+            self.p75_scp_first_to_self_latency_ms.uint32,
+            self.p75_scp_self_to_other_latency_ms.uint32,
+            self.lost_sync_count.uint32,
+            1 if self.is_validator else 0,
+            self.max_inbound_peer_count.uint32,
+            self.max_outbound_peer_count.uint32,
+        )
+
+    def xdr_size(self) -> int:
+        return 40
 
     @classmethod
     def unpack(
@@ -80,39 +113,130 @@ class TimeSlicedNodeData:
     ) -> TimeSlicedNodeData:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        added_authenticated_peers = Uint32.unpack(unpacker, depth_limit - 1)
-        dropped_authenticated_peers = Uint32.unpack(unpacker, depth_limit - 1)
-        total_inbound_peer_count = Uint32.unpack(unpacker, depth_limit - 1)
-        total_outbound_peer_count = Uint32.unpack(unpacker, depth_limit - 1)
-        p75_scp_first_to_self_latency_ms = Uint32.unpack(unpacker, depth_limit - 1)
-        p75_scp_self_to_other_latency_ms = Uint32.unpack(unpacker, depth_limit - 1)
-        lost_sync_count = Uint32.unpack(unpacker, depth_limit - 1)
-        is_validator = Boolean.unpack(unpacker)
-        max_inbound_peer_count = Uint32.unpack(unpacker, depth_limit - 1)
-        max_outbound_peer_count = Uint32.unpack(unpacker, depth_limit - 1)
+        (
+            added_authenticated_peers,
+            dropped_authenticated_peers,
+            total_inbound_peer_count,
+            total_outbound_peer_count,
+            p75_scp_first_to_self_latency_ms,
+            p75_scp_self_to_other_latency_ms,
+            lost_sync_count,
+            is_validator,
+            max_inbound_peer_count,
+            max_outbound_peer_count,
+        ) = _LAYOUT.read(unpacker)
         return cls(
-            added_authenticated_peers=added_authenticated_peers,
-            dropped_authenticated_peers=dropped_authenticated_peers,
-            total_inbound_peer_count=total_inbound_peer_count,
-            total_outbound_peer_count=total_outbound_peer_count,
-            p75_scp_first_to_self_latency_ms=p75_scp_first_to_self_latency_ms,
-            p75_scp_self_to_other_latency_ms=p75_scp_self_to_other_latency_ms,
-            lost_sync_count=lost_sync_count,
-            is_validator=is_validator,
-            max_inbound_peer_count=max_inbound_peer_count,
-            max_outbound_peer_count=max_outbound_peer_count,
+            added_authenticated_peers=Uint32(added_authenticated_peers),
+            dropped_authenticated_peers=Uint32(dropped_authenticated_peers),
+            total_inbound_peer_count=Uint32(total_inbound_peer_count),
+            total_outbound_peer_count=Uint32(total_outbound_peer_count),
+            p75_scp_first_to_self_latency_ms=Uint32(p75_scp_first_to_self_latency_ms),
+            p75_scp_self_to_other_latency_ms=Uint32(p75_scp_self_to_other_latency_ms),
+            lost_sync_count=Uint32(lost_sync_count),
+            is_validator=bool(is_validator),
+            max_inbound_peer_count=Uint32(max_inbound_peer_count),
+            max_outbound_peer_count=Uint32(max_outbound_peer_count),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeSlicedNodeData:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "added_authenticated_peers" in fields:
+            _result["added_authenticated_peers"] = Uint32.unpack_fields(
+                unpacker, fields["added_authenticated_peers"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "dropped_authenticated_peers" in fields:
+            _result["dropped_authenticated_peers"] = Uint32.unpack_fields(
+                unpacker, fields["dropped_authenticated_peers"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "total_inbound_peer_count" in fields:
+            _result["total_inbound_peer_count"] = Uint32.unpack_fields(
+                unpacker, fields["total_inbound_peer_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "total_outbound_peer_count" in fields:
+            _result["total_outbound_peer_count"] = Uint32.unpack_fields(
+                unpacker, fields["total_outbound_peer_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "p75_scp_first_to_self_latency_ms" in fields:
+            _result["p75_scp_first_to_self_latency_ms"] = Uint32.unpack_fields(
+                unpacker, fields["p75_scp_first_to_self_latency_ms"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "p75_scp_self_to_other_latency_ms" in fields:
+            _result["p75_scp_self_to_other_latency_ms"] = Uint32.unpack_fields(
+                unpacker, fields["p75_scp_self_to_other_latency_ms"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "lost_sync_count" in fields:
+            _result["lost_sync_count"] = Uint32.unpack_fields(
+                unpacker, fields["lost_sync_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "is_validator" in fields:
+            _result["is_validator"] = Boolean.unpack_fields(
+                unpacker, fields["is_validator"]
+            )
+        else:
+            Boolean.skip(unpacker)
+        if "max_inbound_peer_count" in fields:
+            _result["max_inbound_peer_count"] = Uint32.unpack_fields(
+                unpacker, fields["max_inbound_peer_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "max_outbound_peer_count" in fields:
+            _result["max_outbound_peer_count"] = Uint32.unpack_fields(
+                unpacker, fields["max_outbound_peer_count"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeSlicedNodeData:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TimeSlicedNodeData:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -127,11 +251,11 @@ class TimeSlicedNodeData:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeSlicedNodeData:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -188,6 +312,55 @@ class TimeSlicedNodeData:
             max_outbound_peer_count=max_outbound_peer_count,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"added_authenticated_peers": ')
+        self.added_authenticated_peers._write_json(write)
+        write(', "dropped_authenticated_peers": ')
+        self.dropped_authenticated_peers._write_json(write)
+        write(', "total_inbound_peer_count": ')
+        self.total_inbound_peer_count._write_json(write)
+        write(', "total_outbound_peer_count": ')
+        self.total_outbound_peer_count._write_json(write)
+        write(', "p75_scp_first_to_self_latency_ms": ')
+        self.p75_scp_first_to_self_latency_ms._write_json(write)
+        write(', "p75_scp_self_to_other_latency_ms": ')
+        self.p75_scp_self_to_other_latency_ms._write_json(write)
+        write(', "lost_sync_count": ')
+        self.lost_sync_count._write_json(write)
+        write(', "is_validator": ')
+        write(json_encode(Boolean.to_json_dict(self.is_validator)))
+        write(', "max_inbound_peer_count": ')
+        self.max_inbound_peer_count._write_json(write)
+        write(', "max_outbound_peer_count": ')
+        self.max_outbound_peer_count._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TimeSlicedNodeData:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.added_authenticated_peers = self.added_authenticated_peers.clone()
+        result.dropped_authenticated_peers = self.dropped_authenticated_peers.clone()
+        result.total_inbound_peer_count = self.total_inbound_peer_count.clone()
+        result.total_outbound_peer_count = self.total_outbound_peer_count.clone()
+        result.p75_scp_first_to_self_latency_ms = (
+            self.p75_scp_first_to_self_latency_ms.clone()
+        )
+        result.p75_scp_self_to_other_latency_ms = (
+            self.p75_scp_self_to_other_latency_ms.clone()
+        )
+        result.lost_sync_count = self.lost_sync_count.clone()
+        result.is_validator = self.is_validator
+        result.max_inbound_peer_count = self.max_inbound_peer_count.clone()
+        result.max_outbound_peer_count = self.max_outbound_peer_count.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeSlicedNodeData:
+        return self.clone()
+
+    def freeze(self) -> TimeSlicedNodeData:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
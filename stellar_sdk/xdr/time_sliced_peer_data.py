@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .peer_stats import PeerStats
 from .uint32 import Uint32
 
@@ -25,6 +35,8 @@ class TimeSlicedPeerData:
         };
     """
 
+    __slots__ = ("average_latency_ms", "peer_stats")
+
     def __init__(
         self,
         peer_stats: PeerStats,
@@ -37,6 +49,9 @@ class TimeSlicedPeerData:
         self.peer_stats.pack(packer)
         self.average_latency_ms.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.peer_stats.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class TimeSlicedPeerData:
             average_latency_ms=average_latency_ms,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        PeerStats.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeSlicedPeerData:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "peer_stats" in fields:
+            _result["peer_stats"] = PeerStats.unpack_fields(
+                unpacker, fields["peer_stats"], depth_limit - 1
+            )
+        else:
+            PeerStats.skip(unpacker, depth_limit - 1)
+        if "average_latency_ms" in fields:
+            _result["average_latency_ms"] = Uint32.unpack_fields(
+                unpacker, fields["average_latency_ms"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeSlicedPeerData:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TimeSlicedPeerData:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class TimeSlicedPeerData:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeSlicedPeerData:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class TimeSlicedPeerData:
             average_latency_ms=average_latency_ms,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"peer_stats": ')
+        self.peer_stats._write_json(write)
+        write(', "average_latency_ms": ')
+        self.average_latency_ms._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TimeSlicedPeerData:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.peer_stats = self.peer_stats.clone()
+        result.average_latency_ms = self.average_latency_ms.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeSlicedPeerData:
+        return self.clone()
+
+    def freeze(self) -> TimeSlicedPeerData:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
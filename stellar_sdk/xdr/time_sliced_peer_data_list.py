@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .time_sliced_peer_data import TimeSlicedPeerData
 
 __all__ = ["TimeSlicedPeerDataList"]
@@ -20,6 +33,8 @@ class TimeSlicedPeerDataList:
         typedef TimeSlicedPeerData TimeSlicedPeerDataList<25>;
     """
 
+    __slots__ = ("time_sliced_peer_data_list",)
+
     def __init__(self, time_sliced_peer_data_list: list[TimeSlicedPeerData]) -> None:
         _expect_max_length = 25
         if (
@@ -36,6 +51,9 @@ class TimeSlicedPeerDataList:
         for time_sliced_peer_data_list_item in self.time_sliced_peer_data_list:
             time_sliced_peer_data_list_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.time_sliced_peer_data_list)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -55,16 +73,96 @@ class TimeSlicedPeerDataList:
             )
         return cls(time_sliced_peer_data_list)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"time_sliced_peer_data_list length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TimeSlicedPeerData.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeSlicedPeerDataList:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "time_sliced_peer_data_list" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"time_sliced_peer_data_list length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["time_sliced_peer_data_list"] = []
+            for _ in range(length):
+                _result["time_sliced_peer_data_list"].append(
+                    TimeSlicedPeerData.unpack_fields(
+                        unpacker, fields["time_sliced_peer_data_list"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"time_sliced_peer_data_list length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TimeSlicedPeerData.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"time_sliced_peer_data_list length {length} exceeds remaining input length {_remaining}"
+            )
+        time_sliced_peer_data_list = []
+        for _ in range(length):
+            time_sliced_peer_data_list.append(
+                TimeSlicedPeerData.unpack(unpacker, depth_limit - 1)
+            )
+        yield "time_sliced_peer_data_list", time_sliced_peer_data_list
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeSlicedPeerDataList:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TimeSlicedPeerDataList:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -79,11 +177,11 @@ class TimeSlicedPeerDataList:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeSlicedPeerDataList:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.time_sliced_peer_data_list]
@@ -92,6 +190,24 @@ class TimeSlicedPeerDataList:
     def from_json_dict(cls, json_value: list) -> TimeSlicedPeerDataList:
         return cls([TimeSlicedPeerData.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.time_sliced_peer_data_list)
+
+    def clone(self, deep: bool = True) -> TimeSlicedPeerDataList:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.time_sliced_peer_data_list = [
+            item.clone() for item in self.time_sliced_peer_data_list
+        ]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeSlicedPeerDataList:
+        return self.clone()
+
+    def freeze(self) -> TimeSlicedPeerDataList:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.time_sliced_peer_data_list,))
 
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .survey_request_message import SurveyRequestMessage
 from .uint32 import Uint32
 
@@ -27,6 +37,8 @@ class TimeSlicedSurveyRequestMessage:
         };
     """
 
+    __slots__ = ("inbound_peers_index", "nonce", "outbound_peers_index", "request")
+
     def __init__(
         self,
         request: SurveyRequestMessage,
@@ -45,6 +57,9 @@ class TimeSlicedSurveyRequestMessage:
         self.inbound_peers_index.pack(packer)
         self.outbound_peers_index.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 12 + self.request.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -62,16 +77,72 @@ class TimeSlicedSurveyRequestMessage:
             outbound_peers_index=outbound_peers_index,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SurveyRequestMessage.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeSlicedSurveyRequestMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "request" in fields:
+            _result["request"] = SurveyRequestMessage.unpack_fields(
+                unpacker, fields["request"], depth_limit - 1
+            )
+        else:
+            SurveyRequestMessage.skip(unpacker, depth_limit - 1)
+        if "nonce" in fields:
+            _result["nonce"] = Uint32.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "inbound_peers_index" in fields:
+            _result["inbound_peers_index"] = Uint32.unpack_fields(
+                unpacker, fields["inbound_peers_index"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "outbound_peers_index" in fields:
+            _result["outbound_peers_index"] = Uint32.unpack_fields(
+                unpacker, fields["outbound_peers_index"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeSlicedSurveyRequestMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TimeSlicedSurveyRequestMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -86,11 +157,11 @@ class TimeSlicedSurveyRequestMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeSlicedSurveyRequestMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -113,6 +184,33 @@ class TimeSlicedSurveyRequestMessage:
             outbound_peers_index=outbound_peers_index,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"request": ')
+        self.request._write_json(write)
+        write(', "nonce": ')
+        self.nonce._write_json(write)
+        write(', "inbound_peers_index": ')
+        self.inbound_peers_index._write_json(write)
+        write(', "outbound_peers_index": ')
+        self.outbound_peers_index._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TimeSlicedSurveyRequestMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.request = self.request.clone()
+        result.nonce = self.nonce.clone()
+        result.inbound_peers_index = self.inbound_peers_index.clone()
+        result.outbound_peers_index = self.outbound_peers_index.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeSlicedSurveyRequestMessage:
+        return self.clone()
+
+    def freeze(self) -> TimeSlicedSurveyRequestMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
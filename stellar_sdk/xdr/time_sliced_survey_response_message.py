@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .survey_response_message import SurveyResponseMessage
 from .uint32 import Uint32
 
@@ -25,6 +35,8 @@ class TimeSlicedSurveyResponseMessage:
         };
     """
 
+    __slots__ = ("nonce", "response")
+
     def __init__(
         self,
         response: SurveyResponseMessage,
@@ -37,6 +49,9 @@ class TimeSlicedSurveyResponseMessage:
         self.response.pack(packer)
         self.nonce.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.response.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +65,58 @@ class TimeSlicedSurveyResponseMessage:
             nonce=nonce,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        SurveyResponseMessage.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeSlicedSurveyResponseMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "response" in fields:
+            _result["response"] = SurveyResponseMessage.unpack_fields(
+                unpacker, fields["response"], depth_limit - 1
+            )
+        else:
+            SurveyResponseMessage.skip(unpacker, depth_limit - 1)
+        if "nonce" in fields:
+            _result["nonce"] = Uint32.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeSlicedSurveyResponseMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TimeSlicedSurveyResponseMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +131,11 @@ class TimeSlicedSurveyResponseMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeSlicedSurveyResponseMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +152,27 @@ class TimeSlicedSurveyResponseMessage:
             nonce=nonce,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"response": ')
+        self.response._write_json(write)
+        write(', "nonce": ')
+        self.nonce._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TimeSlicedSurveyResponseMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.response = self.response.clone()
+        result.nonce = self.nonce.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeSlicedSurveyResponseMessage:
+        return self.clone()
+
+    def freeze(self) -> TimeSlicedSurveyResponseMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
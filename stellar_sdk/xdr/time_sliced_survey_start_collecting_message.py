@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .node_id import NodeID
 from .uint32 import Uint32
 
@@ -26,6 +36,8 @@ class TimeSlicedSurveyStartCollectingMessage:
         };
     """
 
+    __slots__ = ("ledger_num", "nonce", "surveyor_id")
+
     def __init__(
         self,
         surveyor_id: NodeID,
@@ -41,6 +53,9 @@ class TimeSlicedSurveyStartCollectingMessage:
         self.nonce.pack(packer)
         self.ledger_num.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 8 + self.surveyor_id.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,16 +71,65 @@ class TimeSlicedSurveyStartCollectingMessage:
             ledger_num=ledger_num,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        NodeID.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TimeSlicedSurveyStartCollectingMessage:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "surveyor_id" in fields:
+            _result["surveyor_id"] = NodeID.unpack_fields(
+                unpacker, fields["surveyor_id"], depth_limit - 1
+            )
+        else:
+            NodeID.skip(unpacker, depth_limit - 1)
+        if "nonce" in fields:
+            _result["nonce"] = Uint32.unpack_fields(
+                unpacker, fields["nonce"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "ledger_num" in fields:
+            _result["ledger_num"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_num"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TimeSlicedSurveyStartCollectingMessage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TimeSlicedSurveyStartCollectingMessage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -80,11 +144,11 @@ class TimeSlicedSurveyStartCollectingMessage:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TimeSlicedSurveyStartCollectingMessage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -104,6 +168,30 @@ class TimeSlicedSurveyStartCollectingMessage:
             ledger_num=ledger_num,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"surveyor_id": ')
+        self.surveyor_id._write_json(write)
+        write(', "nonce": ')
+        self.nonce._write_json(write)
+        write(', "ledger_num": ')
+        self.ledger_num._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TimeSlicedSurveyStartCollectingMessage:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.surveyor_id = self.surveyor_id.clone()
+        result.nonce = self.nonce.clone()
+        result.ledger_num = self.ledger_num.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TimeSlicedSurveyStartCollectingMessage:
+        return self.clone()
+
+    def freeze(self) -> TimeSlicedSurveyStartCollectingMessage:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
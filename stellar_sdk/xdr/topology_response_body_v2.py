@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .time_sliced_node_data import TimeSlicedNodeData
 from .time_sliced_peer_data_list import TimeSlicedPeerDataList
 
@@ -26,6 +39,8 @@ class TopologyResponseBodyV2:
         };
     """
 
+    __slots__ = ("inbound_peers", "node_data", "outbound_peers")
+
     def __init__(
         self,
         inbound_peers: TimeSlicedPeerDataList,
@@ -41,6 +56,9 @@ class TopologyResponseBodyV2:
         self.outbound_peers.pack(packer)
         self.node_data.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 40 + self.inbound_peers.xdr_size() + self.outbound_peers.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -56,16 +74,81 @@ class TopologyResponseBodyV2:
             node_data=node_data,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        TimeSlicedPeerDataList.skip(unpacker, depth_limit - 1)
+        TimeSlicedPeerDataList.skip(unpacker, depth_limit - 1)
+        TimeSlicedNodeData.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TopologyResponseBodyV2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "inbound_peers" in fields:
+            _result["inbound_peers"] = TimeSlicedPeerDataList.unpack_fields(
+                unpacker, fields["inbound_peers"], depth_limit - 1
+            )
+        else:
+            TimeSlicedPeerDataList.skip(unpacker, depth_limit - 1)
+        if "outbound_peers" in fields:
+            _result["outbound_peers"] = TimeSlicedPeerDataList.unpack_fields(
+                unpacker, fields["outbound_peers"], depth_limit - 1
+            )
+        else:
+            TimeSlicedPeerDataList.skip(unpacker, depth_limit - 1)
+        if "node_data" in fields:
+            _result["node_data"] = TimeSlicedNodeData.unpack_fields(
+                unpacker, fields["node_data"], depth_limit - 1
+            )
+        else:
+            TimeSlicedNodeData.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        inbound_peers = view_at(TimeSlicedPeerDataList, unpacker, depth_limit - 1)
+        yield "inbound_peers", inbound_peers
+        TimeSlicedPeerDataList.skip(unpacker, depth_limit - 1)
+        outbound_peers = view_at(TimeSlicedPeerDataList, unpacker, depth_limit - 1)
+        yield "outbound_peers", outbound_peers
+        TimeSlicedPeerDataList.skip(unpacker, depth_limit - 1)
+        yield "node_data", TimeSlicedNodeData.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TopologyResponseBodyV2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TopologyResponseBodyV2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -80,11 +163,11 @@ class TopologyResponseBodyV2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TopologyResponseBodyV2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -108,6 +191,30 @@ class TopologyResponseBodyV2:
             node_data=node_data,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"inbound_peers": ')
+        self.inbound_peers._write_json(write)
+        write(', "outbound_peers": ')
+        self.outbound_peers._write_json(write)
+        write(', "node_data": ')
+        self.node_data._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TopologyResponseBodyV2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.inbound_peers = self.inbound_peers.clone()
+        result.outbound_peers = self.outbound_peers.clone()
+        result.node_data = self.node_data.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TopologyResponseBodyV2:
+        return self.clone()
+
+    def freeze(self) -> TopologyResponseBodyV2:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import MAX_OPS_PER_TX
 from .memo import Memo
 from .muxed_account import MuxedAccount
@@ -53,6 +68,16 @@ class Transaction:
         };
     """
 
+    __slots__ = (
+        "cond",
+        "ext",
+        "fee",
+        "memo",
+        "operations",
+        "seq_num",
+        "source_account",
+    )
+
     def __init__(
         self,
         source_account: MuxedAccount,
@@ -87,6 +112,17 @@ class Transaction:
             operations_item.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            12
+            + self.source_account.xdr_size()
+            + self.cond.xdr_size()
+            + self.memo.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.operations)
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -118,16 +154,142 @@ class Transaction:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        MuxedAccount.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        SequenceNumber.skip(unpacker, depth_limit - 1)
+        Preconditions.skip(unpacker, depth_limit - 1)
+        Memo.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Operation.skip(unpacker, depth_limit - 1)
+        TransactionExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Transaction:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "source_account" in fields:
+            _result["source_account"] = MuxedAccount.unpack_fields(
+                unpacker, fields["source_account"], depth_limit - 1
+            )
+        else:
+            MuxedAccount.skip(unpacker, depth_limit - 1)
+        if "fee" in fields:
+            _result["fee"] = Uint32.unpack_fields(
+                unpacker, fields["fee"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "seq_num" in fields:
+            _result["seq_num"] = SequenceNumber.unpack_fields(
+                unpacker, fields["seq_num"], depth_limit - 1
+            )
+        else:
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        if "cond" in fields:
+            _result["cond"] = Preconditions.unpack_fields(
+                unpacker, fields["cond"], depth_limit - 1
+            )
+        else:
+            Preconditions.skip(unpacker, depth_limit - 1)
+        if "memo" in fields:
+            _result["memo"] = Memo.unpack_fields(
+                unpacker, fields["memo"], depth_limit - 1
+            )
+        else:
+            Memo.skip(unpacker, depth_limit - 1)
+        if "operations" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["operations"] = []
+            for _ in range(length):
+                _result["operations"].append(
+                    Operation.unpack_fields(
+                        unpacker, fields["operations"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Operation.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = TransactionExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            TransactionExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "source_account", MuxedAccount.unpack(unpacker, depth_limit - 1)
+        yield "fee", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "seq_num", SequenceNumber.unpack(unpacker, depth_limit - 1)
+        cond = view_at(Preconditions, unpacker, depth_limit - 1)
+        yield "cond", cond
+        Preconditions.skip(unpacker, depth_limit - 1)
+        yield "memo", Memo.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        operations = []
+        for _ in range(length):
+            operations.append(unpack_view(Operation, unpacker, depth_limit - 1))
+        yield "operations", operations
+        yield "ext", view_at(TransactionExt, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Transaction:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Transaction:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -142,11 +304,11 @@ class Transaction:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Transaction:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -180,6 +342,42 @@ class Transaction:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"source_account": ')
+        self.source_account._write_json(write)
+        write(', "fee": ')
+        self.fee._write_json(write)
+        write(', "seq_num": ')
+        self.seq_num._write_json(write)
+        write(', "cond": ')
+        self.cond._write_json(write)
+        write(', "memo": ')
+        self.memo._write_json(write)
+        write(', "operations": ')
+        write_json_array(write, self.operations)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> Transaction:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.source_account = self.source_account.clone()
+        result.fee = self.fee.clone()
+        result.seq_num = self.seq_num.clone()
+        result.cond = self.cond.clone()
+        result.memo = self.memo.clone()
+        result.operations = [item.clone() for item in self.operations]
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Transaction:
+        return self.clone()
+
+    def freeze(self) -> Transaction:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
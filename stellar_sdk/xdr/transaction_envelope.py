@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .envelope_type import EnvelopeType
 from .fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
 from .transaction_v0_envelope import TransactionV0Envelope
@@ -31,6 +44,8 @@ class TransactionEnvelope:
         };
     """
 
+    __slots__ = ("fee_bump", "type", "v0", "v1")
+
     def __init__(
         self,
         type: EnvelopeType,
@@ -62,22 +77,116 @@ class TransactionEnvelope:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX_V0:
+            assert self.v0 is not None
+            return 4 + self.v0.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
+            assert self.v1 is not None
+            return 4 + self.v1.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            assert self.fee_bump is not None
+            return 4 + self.fee_bump.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> TransactionEnvelope:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = EnvelopeType.unpack(unpacker)
         if type == EnvelopeType.ENVELOPE_TYPE_TX_V0:
-            v0 = TransactionV0Envelope.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v0=v0)
+            TransactionV0Envelope.skip(unpacker, depth_limit - 1)
+            return
         if type == EnvelopeType.ENVELOPE_TYPE_TX:
-            v1 = TransactionV1Envelope.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, v1=v1)
+            TransactionV1Envelope.skip(unpacker, depth_limit - 1)
+            return
         if type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
-            fee_bump = FeeBumpTransactionEnvelope.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, fee_bump=fee_bump)
+            FeeBumpTransactionEnvelope.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionEnvelope:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = EnvelopeType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == EnvelopeType.ENVELOPE_TYPE_TX_V0:
+            if "v0" in fields:
+                _result["v0"] = TransactionV0Envelope.unpack_fields(
+                    unpacker, fields["v0"], depth_limit - 1
+                )
+            else:
+                TransactionV0Envelope.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == EnvelopeType.ENVELOPE_TYPE_TX:
+            if "v1" in fields:
+                _result["v1"] = TransactionV1Envelope.unpack_fields(
+                    unpacker, fields["v1"], depth_limit - 1
+                )
+            else:
+                TransactionV1Envelope.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            if "fee_bump" in fields:
+                _result["fee_bump"] = FeeBumpTransactionEnvelope.unpack_fields(
+                    unpacker, fields["fee_bump"], depth_limit - 1
+                )
+            else:
+                FeeBumpTransactionEnvelope.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        yield "type", type
+        if type == EnvelopeType.ENVELOPE_TYPE_TX_V0:
+            yield "v0", view_at(TransactionV0Envelope, unpacker, depth_limit - 1)
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_TX:
+            yield "v1", view_at(TransactionV1Envelope, unpacker, depth_limit - 1)
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            yield (
+                "fee_bump",
+                view_at(FeeBumpTransactionEnvelope, unpacker, depth_limit - 1),
+            )
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -86,10 +195,12 @@ class TransactionEnvelope:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionEnvelope:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionEnvelope:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -104,11 +215,11 @@ class TransactionEnvelope:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionEnvelope:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == EnvelopeType.ENVELOPE_TYPE_TX_V0:
@@ -143,6 +254,43 @@ class TransactionEnvelope:
             return cls(type=type, fee_bump=fee_bump)
         raise ValueError(f"Unknown key '{key}' for TransactionEnvelope")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX_V0:
+            assert self.v0 is not None
+            write('{"tx_v0": ')
+            self.v0._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
+            assert self.v1 is not None
+            write('{"tx": ')
+            self.v1._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            assert self.fee_bump is not None
+            write('{"tx_fee_bump": ')
+            self.fee_bump._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in TransactionEnvelope: {self.type}")
+
+    def clone(self, deep: bool = True) -> TransactionEnvelope:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.v0 = self.v0.clone() if self.v0 is not None else None
+        result.v1 = self.v1.clone() if self.v1 is not None else None
+        result.fee_bump = self.fee_bump.clone() if self.fee_bump is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionEnvelope:
+        return self.clone()
+
+    def freeze(self) -> TransactionEnvelope:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -173,3 +321,27 @@ class TransactionEnvelope:
         if self.fee_bump is not None:
             out.append(f"fee_bump={self.fee_bump}")
         return f"<TransactionEnvelope [{', '.join(out)}]>"
+
+
+def _unpack_v0(cls, type, unpacker: Unpacker, depth_limit: int) -> TransactionEnvelope:
+    v0 = TransactionV0Envelope.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v0=v0)
+
+
+def _unpack_v1(cls, type, unpacker: Unpacker, depth_limit: int) -> TransactionEnvelope:
+    v1 = TransactionV1Envelope.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, v1=v1)
+
+
+def _unpack_fee_bump(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> TransactionEnvelope:
+    fee_bump = FeeBumpTransactionEnvelope.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, fee_bump=fee_bump)
+
+
+_UNPACK_ARMS = {
+    EnvelopeType.ENVELOPE_TYPE_TX_V0: _unpack_v0,
+    EnvelopeType.ENVELOPE_TYPE_TX: _unpack_v1,
+    EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP: _unpack_fee_bump,
+}
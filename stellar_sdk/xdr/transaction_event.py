@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .contract_event import ContractEvent
 from .transaction_event_stage import TransactionEventStage
 
@@ -24,6 +37,8 @@ class TransactionEvent:
         };
     """
 
+    __slots__ = ("event", "stage")
+
     def __init__(
         self,
         stage: TransactionEventStage,
@@ -36,6 +51,9 @@ class TransactionEvent:
         self.stage.pack(packer)
         self.event.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.event.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -49,16 +67,69 @@ class TransactionEvent:
             event=event,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        TransactionEventStage.skip(unpacker)
+        ContractEvent.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionEvent:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "stage" in fields:
+            _result["stage"] = TransactionEventStage.unpack_fields(
+                unpacker, fields["stage"]
+            )
+        else:
+            TransactionEventStage.skip(unpacker)
+        if "event" in fields:
+            _result["event"] = ContractEvent.unpack_fields(
+                unpacker, fields["event"], depth_limit - 1
+            )
+        else:
+            ContractEvent.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "stage", TransactionEventStage.unpack(unpacker)
+        yield "event", view_at(ContractEvent, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionEvent:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionEvent:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -73,11 +144,11 @@ class TransactionEvent:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionEvent:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -94,6 +165,27 @@ class TransactionEvent:
             event=event,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"stage": ')
+        self.stage._write_json(write)
+        write(', "event": ')
+        self.event._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionEvent:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.stage = self.stage
+        result.event = self.event.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionEvent:
+        return self.clone()
+
+    def freeze(self) -> TransactionEvent:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 from enum import IntEnum
 
 from xdrlib3 import Packer, Unpacker
 
+from .base import (
+    Integer,
+    XdrBuffer,
+    check_fields,
+    json_loads,
+    make_unpacker,
+    xdr_to_json,
+)
+
 _TRANSACTION_EVENT_STAGE_MAP = {0: "before_all_txs", 1: "after_tx", 2: "after_all_txs"}
 _TRANSACTION_EVENT_STAGE_REVERSE_MAP = {
     "before_all_txs": 0,
@@ -41,10 +50,27 @@ class TransactionEventStage(IntEnum):
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
 
+    def xdr_size(self) -> int:
+        return 4
+
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> TransactionEventStage:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid TransactionEventStage")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls, unpacker: Unpacker, fields: dict | None
+    ) -> TransactionEventStage:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
 
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -52,10 +78,12 @@ class TransactionEventStage(IntEnum):
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionEventStage:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionEventStage:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -70,11 +98,11 @@ class TransactionEventStage(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionEventStage:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         return _TRANSACTION_EVENT_STAGE_MAP[self.value]
@@ -82,3 +110,15 @@ class TransactionEventStage(IntEnum):
     @classmethod
     def from_json_dict(cls, json_value: str) -> TransactionEventStage:
         return cls(_TRANSACTION_EVENT_STAGE_REVERSE_MAP[json_value])
+
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_TRANSACTION_EVENT_STAGE_MAP[self.value]}"')
+
+    def clone(self, deep: bool = True) -> TransactionEventStage:
+        return self
+
+    def freeze(self) -> TransactionEventStage:
+        return self
+
+
+_BY_VALUE = {member.value: member for member in TransactionEventStage}
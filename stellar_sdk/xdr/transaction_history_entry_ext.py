@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .generalized_transaction_set import GeneralizedTransactionSet
 
 __all__ = ["TransactionHistoryEntryExt"]
@@ -26,6 +40,8 @@ class TransactionHistoryEntryExt:
             }
     """
 
+    __slots__ = ("generalized_tx_set", "v")
+
     def __init__(
         self,
         v: int,
@@ -45,20 +61,90 @@ class TransactionHistoryEntryExt:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            return 4
+        if self.v == 1:
+            assert self.generalized_tx_set is not None
+            return 4 + self.generalized_tx_set.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> TransactionHistoryEntryExt:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
         if v == 0:
-            return cls(v=v)
+            return
         if v == 1:
-            generalized_tx_set = GeneralizedTransactionSet.unpack(
-                unpacker, depth_limit - 1
+            GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionHistoryEntryExt:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            return _result
+        if v == 1:
+            if "generalized_tx_set" in fields:
+                _result["generalized_tx_set"] = GeneralizedTransactionSet.unpack_fields(
+                    unpacker, fields["generalized_tx_set"], depth_limit - 1
+                )
+            else:
+                GeneralizedTransactionSet.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        yield "v", v
+        if v == 0:
+            return
+        if v == 1:
+            yield (
+                "generalized_tx_set",
+                view_at(GeneralizedTransactionSet, unpacker, depth_limit - 1),
             )
-            return cls(v=v, generalized_tx_set=generalized_tx_set)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -67,10 +153,12 @@ class TransactionHistoryEntryExt:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionHistoryEntryExt:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionHistoryEntryExt:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -85,11 +173,11 @@ class TransactionHistoryEntryExt:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionHistoryEntryExt:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -121,6 +209,36 @@ class TransactionHistoryEntryExt:
             return cls(v=v, generalized_tx_set=generalized_tx_set)
         raise ValueError(f"Unknown key '{key}' for TransactionHistoryEntryExt")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            write('"v0"')
+            return
+        if self.v == 1:
+            assert self.generalized_tx_set is not None
+            write('{"v1": ')
+            self.generalized_tx_set._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in TransactionHistoryEntryExt: {self.v}")
+
+    def clone(self, deep: bool = True) -> TransactionHistoryEntryExt:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.generalized_tx_set = (
+            self.generalized_tx_set.clone()
+            if self.generalized_tx_set is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionHistoryEntryExt:
+        return self.clone()
+
+    def freeze(self) -> TransactionHistoryEntryExt:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -140,3 +258,22 @@ class TransactionHistoryEntryExt:
         if self.generalized_tx_set is not None:
             out.append(f"generalized_tx_set={self.generalized_tx_set}")
         return f"<TransactionHistoryEntryExt [{', '.join(out)}]>"
+
+
+def _unpack_void(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> TransactionHistoryEntryExt:
+    return cls(v=v)
+
+
+def _unpack_generalized_tx_set(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> TransactionHistoryEntryExt:
+    generalized_tx_set = GeneralizedTransactionSet.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, generalized_tx_set=generalized_tx_set)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_void,
+    1: _unpack_generalized_tx_set,
+}
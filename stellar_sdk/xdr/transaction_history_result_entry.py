@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .transaction_history_result_entry_ext import TransactionHistoryResultEntryExt
 from .transaction_result_set import TransactionResultSet
 from .uint32 import Uint32
@@ -34,6 +47,8 @@ class TransactionHistoryResultEntry:
         };
     """
 
+    __slots__ = ("ext", "ledger_seq", "tx_result_set")
+
     def __init__(
         self,
         ledger_seq: Uint32,
@@ -49,6 +64,9 @@ class TransactionHistoryResultEntry:
         self.tx_result_set.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + self.tx_result_set.xdr_size() + self.ext.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -64,16 +82,79 @@ class TransactionHistoryResultEntry:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint32.skip(unpacker, depth_limit - 1)
+        TransactionResultSet.skip(unpacker, depth_limit - 1)
+        TransactionHistoryResultEntryExt.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionHistoryResultEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ledger_seq" in fields:
+            _result["ledger_seq"] = Uint32.unpack_fields(
+                unpacker, fields["ledger_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "tx_result_set" in fields:
+            _result["tx_result_set"] = TransactionResultSet.unpack_fields(
+                unpacker, fields["tx_result_set"], depth_limit - 1
+            )
+        else:
+            TransactionResultSet.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = TransactionHistoryResultEntryExt.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            TransactionHistoryResultEntryExt.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ledger_seq", Uint32.unpack(unpacker, depth_limit - 1)
+        tx_result_set = view_at(TransactionResultSet, unpacker, depth_limit - 1)
+        yield "tx_result_set", tx_result_set
+        TransactionResultSet.skip(unpacker, depth_limit - 1)
+        yield "ext", TransactionHistoryResultEntryExt.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionHistoryResultEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionHistoryResultEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -88,11 +169,11 @@ class TransactionHistoryResultEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionHistoryResultEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -112,6 +193,30 @@ class TransactionHistoryResultEntry:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ledger_seq": ')
+        self.ledger_seq._write_json(write)
+        write(', "tx_result_set": ')
+        self.tx_result_set._write_json(write)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionHistoryResultEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ledger_seq = self.ledger_seq.clone()
+        result.tx_result_set = self.tx_result_set.clone()
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionHistoryResultEntry:
+        return self.clone()
+
+    def freeze(self) -> TransactionHistoryResultEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
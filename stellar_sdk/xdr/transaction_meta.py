@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .operation_meta import OperationMeta
 from .transaction_meta_v1 import TransactionMetaV1
 from .transaction_meta_v2 import TransactionMetaV2
@@ -36,6 +52,8 @@ class TransactionMeta:
         };
     """
 
+    __slots__ = ("operations", "v", "v1", "v2", "v3", "v4")
+
     def __init__(
         self,
         v: int,
@@ -88,13 +106,156 @@ class TransactionMeta:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            assert self.operations is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.operations)
+        if self.v == 1:
+            assert self.v1 is not None
+            return 4 + self.v1.xdr_size()
+        if self.v == 2:
+            assert self.v2 is not None
+            return 4 + self.v2.xdr_size()
+        if self.v == 3:
+            assert self.v3 is not None
+            return 4 + self.v3.xdr_size()
+        if self.v == 4:
+            assert self.v4 is not None
+            return 4 + self.v4.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> TransactionMeta:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
+        if v == 0:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                OperationMeta.skip(unpacker, depth_limit - 1)
+            return
+        if v == 1:
+            TransactionMetaV1.skip(unpacker, depth_limit - 1)
+            return
+        if v == 2:
+            TransactionMetaV2.skip(unpacker, depth_limit - 1)
+            return
+        if v == 3:
+            TransactionMetaV3.skip(unpacker, depth_limit - 1)
+            return
+        if v == 4:
+            TransactionMetaV4.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionMeta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            if "operations" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"operations length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["operations"] = []
+                for _ in range(length):
+                    _result["operations"].append(
+                        OperationMeta.unpack_fields(
+                            unpacker, fields["operations"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"operations length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    OperationMeta.skip(unpacker, depth_limit - 1)
+            return _result
+        if v == 1:
+            if "v1" in fields:
+                _result["v1"] = TransactionMetaV1.unpack_fields(
+                    unpacker, fields["v1"], depth_limit - 1
+                )
+            else:
+                TransactionMetaV1.skip(unpacker, depth_limit - 1)
+            return _result
+        if v == 2:
+            if "v2" in fields:
+                _result["v2"] = TransactionMetaV2.unpack_fields(
+                    unpacker, fields["v2"], depth_limit - 1
+                )
+            else:
+                TransactionMetaV2.skip(unpacker, depth_limit - 1)
+            return _result
+        if v == 3:
+            if "v3" in fields:
+                _result["v3"] = TransactionMetaV3.unpack_fields(
+                    unpacker, fields["v3"], depth_limit - 1
+                )
+            else:
+                TransactionMetaV3.skip(unpacker, depth_limit - 1)
+            return _result
+        if v == 4:
+            if "v4" in fields:
+                _result["v4"] = TransactionMetaV4.unpack_fields(
+                    unpacker, fields["v4"], depth_limit - 1
+                )
+            else:
+                TransactionMetaV4.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        yield "v", v
         if v == 0:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -104,20 +265,21 @@ class TransactionMeta:
                 )
             operations = []
             for _ in range(length):
-                operations.append(OperationMeta.unpack(unpacker, depth_limit - 1))
-            return cls(v=v, operations=operations)
+                operations.append(unpack_view(OperationMeta, unpacker, depth_limit - 1))
+            yield "operations", operations
+            return
         if v == 1:
-            v1 = TransactionMetaV1.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v1=v1)
+            yield "v1", view_at(TransactionMetaV1, unpacker, depth_limit - 1)
+            return
         if v == 2:
-            v2 = TransactionMetaV2.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v2=v2)
+            yield "v2", view_at(TransactionMetaV2, unpacker, depth_limit - 1)
+            return
         if v == 3:
-            v3 = TransactionMetaV3.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v3=v3)
+            yield "v3", view_at(TransactionMetaV3, unpacker, depth_limit - 1)
+            return
         if v == 4:
-            v4 = TransactionMetaV4.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v4=v4)
+            yield "v4", view_at(TransactionMetaV4, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -126,10 +288,10 @@ class TransactionMeta:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionMeta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TransactionMeta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -144,11 +306,11 @@ class TransactionMeta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionMeta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -195,6 +357,61 @@ class TransactionMeta:
             return cls(v=v, v4=v4)
         raise ValueError(f"Unknown key '{key}' for TransactionMeta")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            assert self.operations is not None
+            write('{"v0": ')
+            write_json_array(write, self.operations)
+            write("}")
+            return
+        if self.v == 1:
+            assert self.v1 is not None
+            write('{"v1": ')
+            self.v1._write_json(write)
+            write("}")
+            return
+        if self.v == 2:
+            assert self.v2 is not None
+            write('{"v2": ')
+            self.v2._write_json(write)
+            write("}")
+            return
+        if self.v == 3:
+            assert self.v3 is not None
+            write('{"v3": ')
+            self.v3._write_json(write)
+            write("}")
+            return
+        if self.v == 4:
+            assert self.v4 is not None
+            write('{"v4": ')
+            self.v4._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in TransactionMeta: {self.v}")
+
+    def clone(self, deep: bool = True) -> TransactionMeta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.operations = (
+            [item.clone() for item in self.operations]
+            if self.operations is not None
+            else None
+        )
+        result.v1 = self.v1.clone() if self.v1 is not None else None
+        result.v2 = self.v2.clone() if self.v2 is not None else None
+        result.v3 = self.v3.clone() if self.v3 is not None else None
+        result.v4 = self.v4.clone() if self.v4 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionMeta:
+        return self.clone()
+
+    def freeze(self) -> TransactionMeta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -233,3 +450,45 @@ class TransactionMeta:
         if self.v4 is not None:
             out.append(f"v4={self.v4}")
         return f"<TransactionMeta [{', '.join(out)}]>"
+
+
+def _unpack_operations(cls, v, unpacker: Unpacker, depth_limit: int) -> TransactionMeta:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"operations length {length} exceeds remaining input length {_remaining}"
+        )
+    operations = []
+    for _ in range(length):
+        operations.append(OperationMeta.unpack(unpacker, depth_limit - 1))
+    return cls(v=v, operations=operations)
+
+
+def _unpack_v1(cls, v, unpacker: Unpacker, depth_limit: int) -> TransactionMeta:
+    v1 = TransactionMetaV1.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v1=v1)
+
+
+def _unpack_v2(cls, v, unpacker: Unpacker, depth_limit: int) -> TransactionMeta:
+    v2 = TransactionMetaV2.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v2=v2)
+
+
+def _unpack_v3(cls, v, unpacker: Unpacker, depth_limit: int) -> TransactionMeta:
+    v3 = TransactionMetaV3.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v3=v3)
+
+
+def _unpack_v4(cls, v, unpacker: Unpacker, depth_limit: int) -> TransactionMeta:
+    v4 = TransactionMetaV4.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v4=v4)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_operations,
+    1: _unpack_v1,
+    2: _unpack_v2,
+    3: _unpack_v3,
+    4: _unpack_v4,
+}
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .ledger_entry_changes import LedgerEntryChanges
 from .operation_meta import OperationMeta
 
@@ -25,6 +40,8 @@ class TransactionMetaV1:
         };
     """
 
+    __slots__ = ("operations", "tx_changes")
+
     def __init__(
         self,
         tx_changes: LedgerEntryChanges,
@@ -44,6 +61,13 @@ class TransactionMetaV1:
         for operations_item in self.operations:
             operations_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.tx_changes.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.operations)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +89,104 @@ class TransactionMetaV1:
             operations=operations,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            OperationMeta.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionMetaV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_changes" in fields:
+            _result["tx_changes"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["tx_changes"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if "operations" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["operations"] = []
+            for _ in range(length):
+                _result["operations"].append(
+                    OperationMeta.unpack_fields(
+                        unpacker, fields["operations"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                OperationMeta.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        tx_changes = view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+        yield "tx_changes", tx_changes
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        operations = []
+        for _ in range(length):
+            operations.append(unpack_view(OperationMeta, unpacker, depth_limit - 1))
+        yield "operations", operations
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionMetaV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionMetaV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +201,11 @@ class TransactionMetaV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionMetaV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -112,6 +224,27 @@ class TransactionMetaV1:
             operations=operations,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx_changes": ')
+        self.tx_changes._write_json(write)
+        write(', "operations": ')
+        write_json_array(write, self.operations)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionMetaV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_changes = self.tx_changes.clone()
+        result.operations = [item.clone() for item in self.operations]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionMetaV1:
+        return self.clone()
+
+    def freeze(self) -> TransactionMetaV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .diagnostic_event import DiagnosticEvent
 from .extension_point import ExtensionPoint
 from .ledger_entry_changes import LedgerEntryChanges
@@ -39,6 +54,16 @@ class TransactionMetaV4:
         };
     """
 
+    __slots__ = (
+        "diagnostic_events",
+        "events",
+        "ext",
+        "operations",
+        "soroban_meta",
+        "tx_changes_after",
+        "tx_changes_before",
+    )
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -91,6 +116,21 @@ class TransactionMetaV4:
         for diagnostic_events_item in self.diagnostic_events:
             diagnostic_events_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.ext.xdr_size()
+            + self.tx_changes_before.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.operations)
+            + self.tx_changes_after.xdr_size()
+            + 4
+            + (self.soroban_meta.xdr_size() if self.soroban_meta is not None else 0)
+            + 4
+            + sum(item.xdr_size() for item in self.events)
+            + 4
+            + sum(item.xdr_size() for item in self.diagnostic_events)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -142,16 +182,227 @@ class TransactionMetaV4:
             diagnostic_events=diagnostic_events,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            OperationMetaV2.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            SorobanTransactionMetaV2.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionEvent.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            DiagnosticEvent.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionMetaV4:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "tx_changes_before" in fields:
+            _result["tx_changes_before"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["tx_changes_before"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if "operations" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["operations"] = []
+            for _ in range(length):
+                _result["operations"].append(
+                    OperationMetaV2.unpack_fields(
+                        unpacker, fields["operations"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                OperationMetaV2.skip(unpacker, depth_limit - 1)
+        if "tx_changes_after" in fields:
+            _result["tx_changes_after"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["tx_changes_after"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if "soroban_meta" in fields:
+            _result["soroban_meta"] = (
+                SorobanTransactionMetaV2.unpack_fields(
+                    unpacker, fields["soroban_meta"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                SorobanTransactionMetaV2.skip(unpacker, depth_limit - 1)
+        if "events" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["events"] = []
+            for _ in range(length):
+                _result["events"].append(
+                    TransactionEvent.unpack_fields(
+                        unpacker, fields["events"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"events length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionEvent.skip(unpacker, depth_limit - 1)
+        if "diagnostic_events" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["diagnostic_events"] = []
+            for _ in range(length):
+                _result["diagnostic_events"].append(
+                    DiagnosticEvent.unpack_fields(
+                        unpacker, fields["diagnostic_events"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                DiagnosticEvent.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", ExtensionPoint.unpack(unpacker, depth_limit - 1)
+        tx_changes_before = view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+        yield "tx_changes_before", tx_changes_before
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        operations = []
+        for _ in range(length):
+            operations.append(unpack_view(OperationMetaV2, unpacker, depth_limit - 1))
+        yield "operations", operations
+        tx_changes_after = view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+        yield "tx_changes_after", tx_changes_after
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        soroban_meta = (
+            view_at(SorobanTransactionMetaV2, unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None
+        )
+        yield "soroban_meta", soroban_meta
+        if soroban_meta is not None:
+            SorobanTransactionMetaV2.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"events length {length} exceeds remaining input length {_remaining}"
+            )
+        events = []
+        for _ in range(length):
+            events.append(unpack_view(TransactionEvent, unpacker, depth_limit - 1))
+        yield "events", events
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"diagnostic_events length {length} exceeds remaining input length {_remaining}"
+            )
+        diagnostic_events = []
+        for _ in range(length):
+            diagnostic_events.append(
+                unpack_view(DiagnosticEvent, unpacker, depth_limit - 1)
+            )
+        yield "diagnostic_events", diagnostic_events
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionMetaV4:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionMetaV4:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -166,11 +417,11 @@ class TransactionMetaV4:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionMetaV4:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -219,6 +470,47 @@ class TransactionMetaV4:
             diagnostic_events=diagnostic_events,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "tx_changes_before": ')
+        self.tx_changes_before._write_json(write)
+        write(', "operations": ')
+        write_json_array(write, self.operations)
+        write(', "tx_changes_after": ')
+        self.tx_changes_after._write_json(write)
+        write(', "soroban_meta": ')
+        if self.soroban_meta is None:
+            write("null")
+        else:
+            self.soroban_meta._write_json(write)
+        write(', "events": ')
+        write_json_array(write, self.events)
+        write(', "diagnostic_events": ')
+        write_json_array(write, self.diagnostic_events)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionMetaV4:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.tx_changes_before = self.tx_changes_before.clone()
+        result.operations = [item.clone() for item in self.operations]
+        result.tx_changes_after = self.tx_changes_after.clone()
+        result.soroban_meta = (
+            self.soroban_meta.clone() if self.soroban_meta is not None else None
+        )
+        result.events = [item.clone() for item in self.events]
+        result.diagnostic_events = [item.clone() for item in self.diagnostic_events]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionMetaV4:
+        return self.clone()
+
+    def freeze(self) -> TransactionMetaV4:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .parallel_txs_component import ParallelTxsComponent
 from .tx_set_component import TxSetComponent
 
@@ -27,6 +43,8 @@ class TransactionPhase:
         };
     """
 
+    __slots__ = ("parallel_txs_component", "v", "v0_components")
+
     def __init__(
         self,
         v: int,
@@ -58,13 +76,114 @@ class TransactionPhase:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            assert self.v0_components is not None
+            return 4 + 4 + sum(item.xdr_size() for item in self.v0_components)
+        if self.v == 1:
+            assert self.parallel_txs_component is not None
+            return 4 + self.parallel_txs_component.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> TransactionPhase:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
+        if v == 0:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"v0_components length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TxSetComponent.skip(unpacker, depth_limit - 1)
+            return
+        if v == 1:
+            ParallelTxsComponent.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionPhase:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            if "v0_components" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"v0_components length {length} exceeds remaining input length {_remaining}"
+                    )
+                _result["v0_components"] = []
+                for _ in range(length):
+                    _result["v0_components"].append(
+                        TxSetComponent.unpack_fields(
+                            unpacker, fields["v0_components"], depth_limit - 1
+                        )
+                    )
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(
+                        f"v0_components length {length} exceeds remaining input length {_remaining}"
+                    )
+                for _ in range(length):
+                    TxSetComponent.skip(unpacker, depth_limit - 1)
+            return _result
+        if v == 1:
+            if "parallel_txs_component" in fields:
+                _result["parallel_txs_component"] = ParallelTxsComponent.unpack_fields(
+                    unpacker, fields["parallel_txs_component"], depth_limit - 1
+                )
+            else:
+                ParallelTxsComponent.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        yield "v", v
         if v == 0:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -74,13 +193,17 @@ class TransactionPhase:
                 )
             v0_components = []
             for _ in range(length):
-                v0_components.append(TxSetComponent.unpack(unpacker, depth_limit - 1))
-            return cls(v=v, v0_components=v0_components)
+                v0_components.append(
+                    unpack_view(TxSetComponent, unpacker, depth_limit - 1)
+                )
+            yield "v0_components", v0_components
+            return
         if v == 1:
-            parallel_txs_component = ParallelTxsComponent.unpack(
-                unpacker, depth_limit - 1
+            yield (
+                "parallel_txs_component",
+                view_at(ParallelTxsComponent, unpacker, depth_limit - 1),
             )
-            return cls(v=v, parallel_txs_component=parallel_txs_component)
+            return
         raise ValueError("Invalid v.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -89,10 +212,12 @@ class TransactionPhase:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionPhase:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionPhase:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -107,11 +232,11 @@ class TransactionPhase:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionPhase:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -142,6 +267,44 @@ class TransactionPhase:
             return cls(v=v, parallel_txs_component=parallel_txs_component)
         raise ValueError(f"Unknown key '{key}' for TransactionPhase")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            assert self.v0_components is not None
+            write('{"v0": ')
+            write_json_array(write, self.v0_components)
+            write("}")
+            return
+        if self.v == 1:
+            assert self.parallel_txs_component is not None
+            write('{"v1": ')
+            self.parallel_txs_component._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in TransactionPhase: {self.v}")
+
+    def clone(self, deep: bool = True) -> TransactionPhase:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.v0_components = (
+            [item.clone() for item in self.v0_components]
+            if self.v0_components is not None
+            else None
+        )
+        result.parallel_txs_component = (
+            self.parallel_txs_component.clone()
+            if self.parallel_txs_component is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionPhase:
+        return self.clone()
+
+    def freeze(self) -> TransactionPhase:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -168,3 +331,31 @@ class TransactionPhase:
         if self.parallel_txs_component is not None:
             out.append(f"parallel_txs_component={self.parallel_txs_component}")
         return f"<TransactionPhase [{', '.join(out)}]>"
+
+
+def _unpack_v0_components(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> TransactionPhase:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(
+            f"v0_components length {length} exceeds remaining input length {_remaining}"
+        )
+    v0_components = []
+    for _ in range(length):
+        v0_components.append(TxSetComponent.unpack(unpacker, depth_limit - 1))
+    return cls(v=v, v0_components=v0_components)
+
+
+def _unpack_parallel_txs_component(
+    cls, v, unpacker: Unpacker, depth_limit: int
+) -> TransactionPhase:
+    parallel_txs_component = ParallelTxsComponent.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, parallel_txs_component=parallel_txs_component)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_v0_components,
+    1: _unpack_parallel_txs_component,
+}
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_entry_changes import LedgerEntryChanges
 from .transaction_meta import TransactionMeta
 from .transaction_result_pair import TransactionResultPair
@@ -27,6 +40,8 @@ class TransactionResultMeta:
         };
     """
 
+    __slots__ = ("fee_processing", "result", "tx_apply_processing")
+
     def __init__(
         self,
         result: TransactionResultPair,
@@ -42,6 +57,13 @@ class TransactionResultMeta:
         self.fee_processing.pack(packer)
         self.tx_apply_processing.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.result.xdr_size()
+            + self.fee_processing.xdr_size()
+            + self.tx_apply_processing.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -57,16 +79,81 @@ class TransactionResultMeta:
             tx_apply_processing=tx_apply_processing,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        TransactionResultPair.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        TransactionMeta.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionResultMeta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "result" in fields:
+            _result["result"] = TransactionResultPair.unpack_fields(
+                unpacker, fields["result"], depth_limit - 1
+            )
+        else:
+            TransactionResultPair.skip(unpacker, depth_limit - 1)
+        if "fee_processing" in fields:
+            _result["fee_processing"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["fee_processing"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if "tx_apply_processing" in fields:
+            _result["tx_apply_processing"] = TransactionMeta.unpack_fields(
+                unpacker, fields["tx_apply_processing"], depth_limit - 1
+            )
+        else:
+            TransactionMeta.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        result = view_at(TransactionResultPair, unpacker, depth_limit - 1)
+        yield "result", result
+        TransactionResultPair.skip(unpacker, depth_limit - 1)
+        fee_processing = view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+        yield "fee_processing", fee_processing
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        yield "tx_apply_processing", view_at(TransactionMeta, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionResultMeta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionResultMeta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -81,11 +168,11 @@ class TransactionResultMeta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionResultMeta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -107,6 +194,30 @@ class TransactionResultMeta:
             tx_apply_processing=tx_apply_processing,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"result": ')
+        self.result._write_json(write)
+        write(', "fee_processing": ')
+        self.fee_processing._write_json(write)
+        write(', "tx_apply_processing": ')
+        self.tx_apply_processing._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionResultMeta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.result = self.result.clone()
+        result.fee_processing = self.fee_processing.clone()
+        result.tx_apply_processing = self.tx_apply_processing.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionResultMeta:
+        return self.clone()
+
+    def freeze(self) -> TransactionResultMeta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .extension_point import ExtensionPoint
 from .ledger_entry_changes import LedgerEntryChanges
 from .transaction_meta import TransactionMeta
@@ -32,6 +45,14 @@ class TransactionResultMetaV1:
         };
     """
 
+    __slots__ = (
+        "ext",
+        "fee_processing",
+        "post_tx_apply_fee_processing",
+        "result",
+        "tx_apply_processing",
+    )
+
     def __init__(
         self,
         ext: ExtensionPoint,
@@ -53,6 +74,15 @@ class TransactionResultMetaV1:
         self.tx_apply_processing.pack(packer)
         self.post_tx_apply_fee_processing.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            self.ext.xdr_size()
+            + self.result.xdr_size()
+            + self.fee_processing.xdr_size()
+            + self.tx_apply_processing.xdr_size()
+            + self.post_tx_apply_fee_processing.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -74,16 +104,102 @@ class TransactionResultMetaV1:
             post_tx_apply_fee_processing=post_tx_apply_fee_processing,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        ExtensionPoint.skip(unpacker, depth_limit - 1)
+        TransactionResultPair.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        TransactionMeta.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionResultMetaV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "ext" in fields:
+            _result["ext"] = ExtensionPoint.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            ExtensionPoint.skip(unpacker, depth_limit - 1)
+        if "result" in fields:
+            _result["result"] = TransactionResultPair.unpack_fields(
+                unpacker, fields["result"], depth_limit - 1
+            )
+        else:
+            TransactionResultPair.skip(unpacker, depth_limit - 1)
+        if "fee_processing" in fields:
+            _result["fee_processing"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["fee_processing"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        if "tx_apply_processing" in fields:
+            _result["tx_apply_processing"] = TransactionMeta.unpack_fields(
+                unpacker, fields["tx_apply_processing"], depth_limit - 1
+            )
+        else:
+            TransactionMeta.skip(unpacker, depth_limit - 1)
+        if "post_tx_apply_fee_processing" in fields:
+            _result["post_tx_apply_fee_processing"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["post_tx_apply_fee_processing"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "ext", ExtensionPoint.unpack(unpacker, depth_limit - 1)
+        result = view_at(TransactionResultPair, unpacker, depth_limit - 1)
+        yield "result", result
+        TransactionResultPair.skip(unpacker, depth_limit - 1)
+        fee_processing = view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+        yield "fee_processing", fee_processing
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        tx_apply_processing = view_at(TransactionMeta, unpacker, depth_limit - 1)
+        yield "tx_apply_processing", tx_apply_processing
+        TransactionMeta.skip(unpacker, depth_limit - 1)
+        yield (
+            "post_tx_apply_fee_processing",
+            view_at(LedgerEntryChanges, unpacker, depth_limit - 1),
+        )
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionResultMetaV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionResultMetaV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -98,11 +214,11 @@ class TransactionResultMetaV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionResultMetaV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -132,6 +248,36 @@ class TransactionResultMetaV1:
             post_tx_apply_fee_processing=post_tx_apply_fee_processing,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"ext": ')
+        self.ext._write_json(write)
+        write(', "result": ')
+        self.result._write_json(write)
+        write(', "fee_processing": ')
+        self.fee_processing._write_json(write)
+        write(', "tx_apply_processing": ')
+        self.tx_apply_processing._write_json(write)
+        write(', "post_tx_apply_fee_processing": ')
+        self.post_tx_apply_fee_processing._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionResultMetaV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.ext = self.ext.clone()
+        result.result = self.result.clone()
+        result.fee_processing = self.fee_processing.clone()
+        result.tx_apply_processing = self.tx_apply_processing.clone()
+        result.post_tx_apply_fee_processing = self.post_tx_apply_fee_processing.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionResultMetaV1:
+        return self.clone()
+
+    def freeze(self) -> TransactionResultMetaV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 from .transaction_envelope import TransactionEnvelope
 
@@ -25,6 +39,8 @@ class TransactionSet:
         };
     """
 
+    __slots__ = ("previous_ledger_hash", "txs")
+
     def __init__(
         self,
         previous_ledger_hash: Hash,
@@ -44,6 +60,9 @@ class TransactionSet:
         for txs_item in self.txs:
             txs_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + 4 + sum(item.xdr_size() for item in self.txs)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +84,100 @@ class TransactionSet:
             txs=txs,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"txs length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionEnvelope.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionSet:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "previous_ledger_hash" in fields:
+            _result["previous_ledger_hash"] = Hash.unpack_fields(
+                unpacker, fields["previous_ledger_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "txs" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"txs length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["txs"] = []
+            for _ in range(length):
+                _result["txs"].append(
+                    TransactionEnvelope.unpack_fields(
+                        unpacker, fields["txs"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"txs length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionEnvelope.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "previous_ledger_hash", Hash.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"txs length {length} exceeds remaining input length {_remaining}"
+            )
+        txs = []
+        for _ in range(length):
+            txs.append(unpack_view(TransactionEnvelope, unpacker, depth_limit - 1))
+        yield "txs", txs
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionSet:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TransactionSet:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +192,11 @@ class TransactionSet:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionSet:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +213,27 @@ class TransactionSet:
             txs=txs,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"previous_ledger_hash": ')
+        self.previous_ledger_hash._write_json(write)
+        write(', "txs": ')
+        write_json_array(write, self.txs)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionSet:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.previous_ledger_hash = self.previous_ledger_hash.clone()
+        result.txs = [item.clone() for item in self.txs]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionSet:
+        return self.clone()
+
+    def freeze(self) -> TransactionSet:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .hash import Hash
 from .transaction_phase import TransactionPhase
 
@@ -25,6 +39,8 @@ class TransactionSetV1:
         };
     """
 
+    __slots__ = ("phases", "previous_ledger_hash")
+
     def __init__(
         self,
         previous_ledger_hash: Hash,
@@ -44,6 +60,9 @@ class TransactionSetV1:
         for phases_item in self.phases:
             phases_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + 4 + sum(item.xdr_size() for item in self.phases)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -65,16 +84,102 @@ class TransactionSetV1:
             phases=phases,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"phases length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionPhase.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionSetV1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "previous_ledger_hash" in fields:
+            _result["previous_ledger_hash"] = Hash.unpack_fields(
+                unpacker, fields["previous_ledger_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "phases" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"phases length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["phases"] = []
+            for _ in range(length):
+                _result["phases"].append(
+                    TransactionPhase.unpack_fields(
+                        unpacker, fields["phases"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"phases length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionPhase.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "previous_ledger_hash", Hash.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"phases length {length} exceeds remaining input length {_remaining}"
+            )
+        phases = []
+        for _ in range(length):
+            phases.append(unpack_view(TransactionPhase, unpacker, depth_limit - 1))
+        yield "phases", phases
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionSetV1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionSetV1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -89,11 +194,11 @@ class TransactionSetV1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionSetV1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -110,6 +215,27 @@ class TransactionSetV1:
             phases=phases,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"previous_ledger_hash": ')
+        self.previous_ledger_hash._write_json(write)
+        write(', "phases": ')
+        write_json_array(write, self.phases)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionSetV1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.previous_ledger_hash = self.previous_ledger_hash.clone()
+        result.phases = [item.clone() for item in self.phases]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionSetV1:
+        return self.clone()
+
+    def freeze(self) -> TransactionSetV1:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
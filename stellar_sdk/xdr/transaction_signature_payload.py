@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .hash import Hash
 from .transaction_signature_payload_tagged_transaction import (
     TransactionSignaturePayloadTaggedTransaction,
@@ -35,6 +48,8 @@ class TransactionSignaturePayload:
         };
     """
 
+    __slots__ = ("network_id", "tagged_transaction")
+
     def __init__(
         self,
         network_id: Hash,
@@ -47,6 +62,9 @@ class TransactionSignaturePayload:
         self.network_id.pack(packer)
         self.tagged_transaction.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 32 + self.tagged_transaction.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -62,16 +80,76 @@ class TransactionSignaturePayload:
             tagged_transaction=tagged_transaction,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Hash.skip(unpacker, depth_limit - 1)
+        TransactionSignaturePayloadTaggedTransaction.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionSignaturePayload:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "network_id" in fields:
+            _result["network_id"] = Hash.unpack_fields(
+                unpacker, fields["network_id"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "tagged_transaction" in fields:
+            _result["tagged_transaction"] = (
+                TransactionSignaturePayloadTaggedTransaction.unpack_fields(
+                    unpacker, fields["tagged_transaction"], depth_limit - 1
+                )
+            )
+        else:
+            TransactionSignaturePayloadTaggedTransaction.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "network_id", Hash.unpack(unpacker, depth_limit - 1)
+        yield (
+            "tagged_transaction",
+            view_at(
+                TransactionSignaturePayloadTaggedTransaction, unpacker, depth_limit - 1
+            ),
+        )
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionSignaturePayload:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionSignaturePayload:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -86,11 +164,11 @@ class TransactionSignaturePayload:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionSignaturePayload:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -111,6 +189,27 @@ class TransactionSignaturePayload:
             tagged_transaction=tagged_transaction,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"network_id": ')
+        self.network_id._write_json(write)
+        write(', "tagged_transaction": ')
+        self.tagged_transaction._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionSignaturePayload:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.network_id = self.network_id.clone()
+        result.tagged_transaction = self.tagged_transaction.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionSignaturePayload:
+        return self.clone()
+
+    def freeze(self) -> TransactionSignaturePayload:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
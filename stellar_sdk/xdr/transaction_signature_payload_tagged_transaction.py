@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .envelope_type import EnvelopeType
 from .fee_bump_transaction import FeeBumpTransaction
 from .transaction import Transaction
@@ -29,6 +42,8 @@ class TransactionSignaturePayloadTaggedTransaction:
             }
     """
 
+    __slots__ = ("fee_bump", "tx", "type")
+
     def __init__(
         self,
         type: EnvelopeType,
@@ -53,19 +68,96 @@ class TransactionSignaturePayloadTaggedTransaction:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
+            assert self.tx is not None
+            return 4 + self.tx.xdr_size()
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            assert self.fee_bump is not None
+            return 4 + self.fee_bump.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> TransactionSignaturePayloadTaggedTransaction:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = EnvelopeType.unpack(unpacker)
         if type == EnvelopeType.ENVELOPE_TYPE_TX:
-            tx = Transaction.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, tx=tx)
+            Transaction.skip(unpacker, depth_limit - 1)
+            return
         if type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
-            fee_bump = FeeBumpTransaction.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, fee_bump=fee_bump)
+            FeeBumpTransaction.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionSignaturePayloadTaggedTransaction:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = EnvelopeType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == EnvelopeType.ENVELOPE_TYPE_TX:
+            if "tx" in fields:
+                _result["tx"] = Transaction.unpack_fields(
+                    unpacker, fields["tx"], depth_limit - 1
+                )
+            else:
+                Transaction.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            if "fee_bump" in fields:
+                _result["fee_bump"] = FeeBumpTransaction.unpack_fields(
+                    unpacker, fields["fee_bump"], depth_limit - 1
+                )
+            else:
+                FeeBumpTransaction.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = EnvelopeType.unpack(unpacker)
+        yield "type", type
+        if type == EnvelopeType.ENVELOPE_TYPE_TX:
+            yield "tx", view_at(Transaction, unpacker, depth_limit - 1)
+            return
+        if type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            yield "fee_bump", view_at(FeeBumpTransaction, unpacker, depth_limit - 1)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -74,10 +166,12 @@ class TransactionSignaturePayloadTaggedTransaction:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionSignaturePayloadTaggedTransaction:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionSignaturePayloadTaggedTransaction:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +186,11 @@ class TransactionSignaturePayloadTaggedTransaction:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionSignaturePayloadTaggedTransaction:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
@@ -129,6 +223,38 @@ class TransactionSignaturePayloadTaggedTransaction:
             f"Unknown key '{key}' for TransactionSignaturePayloadTaggedTransaction"
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX:
+            assert self.tx is not None
+            write('{"tx": ')
+            self.tx._write_json(write)
+            write("}")
+            return
+        if self.type == EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP:
+            assert self.fee_bump is not None
+            write('{"tx_fee_bump": ')
+            self.fee_bump._write_json(write)
+            write("}")
+            return
+        raise ValueError(
+            f"Unknown type in TransactionSignaturePayloadTaggedTransaction: {self.type}"
+        )
+
+    def clone(self, deep: bool = True) -> TransactionSignaturePayloadTaggedTransaction:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.tx = self.tx.clone() if self.tx is not None else None
+        result.fee_bump = self.fee_bump.clone() if self.fee_bump is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionSignaturePayloadTaggedTransaction:
+        return self.clone()
+
+    def freeze(self) -> TransactionSignaturePayloadTaggedTransaction:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -155,3 +281,23 @@ class TransactionSignaturePayloadTaggedTransaction:
         if self.fee_bump is not None:
             out.append(f"fee_bump={self.fee_bump}")
         return f"<TransactionSignaturePayloadTaggedTransaction [{', '.join(out)}]>"
+
+
+def _unpack_tx(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> TransactionSignaturePayloadTaggedTransaction:
+    tx = Transaction.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, tx=tx)
+
+
+def _unpack_fee_bump(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> TransactionSignaturePayloadTaggedTransaction:
+    fee_bump = FeeBumpTransaction.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, fee_bump=fee_bump)
+
+
+_UNPACK_ARMS = {
+    EnvelopeType.ENVELOPE_TYPE_TX: _unpack_tx,
+    EnvelopeType.ENVELOPE_TYPE_TX_FEE_BUMP: _unpack_fee_bump,
+}
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import MAX_OPS_PER_TX
 from .memo import Memo
 from .operation import Operation
@@ -41,6 +55,16 @@ class TransactionV0:
         };
     """
 
+    __slots__ = (
+        "ext",
+        "fee",
+        "memo",
+        "operations",
+        "seq_num",
+        "source_account_ed25519",
+        "time_bounds",
+    )
+
     def __init__(
         self,
         source_account_ed25519: Uint256,
@@ -79,6 +103,17 @@ class TransactionV0:
             operations_item.pack(packer)
         self.ext.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            44
+            + 4
+            + (16 if self.time_bounds is not None else 0)
+            + self.memo.xdr_size()
+            + 4
+            + sum(item.xdr_size() for item in self.operations)
+            + self.ext.xdr_size()
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -114,16 +149,151 @@ class TransactionV0:
             ext=ext,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint256.skip(unpacker, depth_limit - 1)
+        Uint32.skip(unpacker, depth_limit - 1)
+        SequenceNumber.skip(unpacker, depth_limit - 1)
+        if unpacker.unpack_uint():
+            TimeBounds.skip(unpacker, depth_limit - 1)
+        Memo.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Operation.skip(unpacker, depth_limit - 1)
+        TransactionV0Ext.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionV0:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "source_account_ed25519" in fields:
+            _result["source_account_ed25519"] = Uint256.unpack_fields(
+                unpacker, fields["source_account_ed25519"], depth_limit - 1
+            )
+        else:
+            Uint256.skip(unpacker, depth_limit - 1)
+        if "fee" in fields:
+            _result["fee"] = Uint32.unpack_fields(
+                unpacker, fields["fee"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        if "seq_num" in fields:
+            _result["seq_num"] = SequenceNumber.unpack_fields(
+                unpacker, fields["seq_num"], depth_limit - 1
+            )
+        else:
+            SequenceNumber.skip(unpacker, depth_limit - 1)
+        if "time_bounds" in fields:
+            _result["time_bounds"] = (
+                TimeBounds.unpack_fields(
+                    unpacker, fields["time_bounds"], depth_limit - 1
+                )
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                TimeBounds.skip(unpacker, depth_limit - 1)
+        if "memo" in fields:
+            _result["memo"] = Memo.unpack_fields(
+                unpacker, fields["memo"], depth_limit - 1
+            )
+        else:
+            Memo.skip(unpacker, depth_limit - 1)
+        if "operations" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["operations"] = []
+            for _ in range(length):
+                _result["operations"].append(
+                    Operation.unpack_fields(
+                        unpacker, fields["operations"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"operations length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Operation.skip(unpacker, depth_limit - 1)
+        if "ext" in fields:
+            _result["ext"] = TransactionV0Ext.unpack_fields(
+                unpacker, fields["ext"], depth_limit - 1
+            )
+        else:
+            TransactionV0Ext.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "source_account_ed25519", Uint256.unpack(unpacker, depth_limit - 1)
+        yield "fee", Uint32.unpack(unpacker, depth_limit - 1)
+        yield "seq_num", SequenceNumber.unpack(unpacker, depth_limit - 1)
+        yield (
+            "time_bounds",
+            TimeBounds.unpack(unpacker, depth_limit - 1)
+            if unpacker.unpack_uint()
+            else None,
+        )
+        yield "memo", Memo.unpack(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"operations length {length} exceeds remaining input length {_remaining}"
+            )
+        operations = []
+        for _ in range(length):
+            operations.append(unpack_view(Operation, unpacker, depth_limit - 1))
+        yield "operations", operations
+        yield "ext", TransactionV0Ext.unpack(unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionV0:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TransactionV0:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -138,11 +308,11 @@ class TransactionV0:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionV0:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -184,6 +354,47 @@ class TransactionV0:
             ext=ext,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"source_account_ed25519": ')
+        self.source_account_ed25519._write_json(write)
+        write(', "fee": ')
+        self.fee._write_json(write)
+        write(', "seq_num": ')
+        self.seq_num._write_json(write)
+        write(', "time_bounds": ')
+        if self.time_bounds is None:
+            write("null")
+        else:
+            self.time_bounds._write_json(write)
+        write(', "memo": ')
+        self.memo._write_json(write)
+        write(', "operations": ')
+        write_json_array(write, self.operations)
+        write(', "ext": ')
+        self.ext._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionV0:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.source_account_ed25519 = self.source_account_ed25519.clone()
+        result.fee = self.fee.clone()
+        result.seq_num = self.seq_num.clone()
+        result.time_bounds = (
+            self.time_bounds.clone() if self.time_bounds is not None else None
+        )
+        result.memo = self.memo.clone()
+        result.operations = [item.clone() for item in self.operations]
+        result.ext = self.ext.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionV0:
+        return self.clone()
+
+    def freeze(self) -> TransactionV0:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
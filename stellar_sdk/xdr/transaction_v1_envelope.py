@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    write_json_array,
+    xdr_to_json,
+)
 from .decorated_signature import DecoratedSignature
 from .transaction import Transaction
 
@@ -27,6 +41,8 @@ class TransactionV1Envelope:
         };
     """
 
+    __slots__ = ("signatures", "tx")
+
     def __init__(
         self,
         tx: Transaction,
@@ -46,6 +62,9 @@ class TransactionV1Envelope:
         for signatures_item in self.signatures:
             signatures_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.tx.xdr_size() + 4 + sum(item.xdr_size() for item in self.signatures)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -67,16 +86,104 @@ class TransactionV1Envelope:
             signatures=signatures,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Transaction.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"signatures length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            DecoratedSignature.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TransactionV1Envelope:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx" in fields:
+            _result["tx"] = Transaction.unpack_fields(
+                unpacker, fields["tx"], depth_limit - 1
+            )
+        else:
+            Transaction.skip(unpacker, depth_limit - 1)
+        if "signatures" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"signatures length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["signatures"] = []
+            for _ in range(length):
+                _result["signatures"].append(
+                    DecoratedSignature.unpack_fields(
+                        unpacker, fields["signatures"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"signatures length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                DecoratedSignature.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        tx = view_at(Transaction, unpacker, depth_limit - 1)
+        yield "tx", tx
+        Transaction.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"signatures length {length} exceeds remaining input length {_remaining}"
+            )
+        signatures = []
+        for _ in range(length):
+            signatures.append(DecoratedSignature.unpack(unpacker, depth_limit - 1))
+        yield "signatures", signatures
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TransactionV1Envelope:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TransactionV1Envelope:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -91,11 +198,11 @@ class TransactionV1Envelope:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TransactionV1Envelope:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -114,6 +221,27 @@ class TransactionV1Envelope:
             signatures=signatures,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"tx": ')
+        self.tx._write_json(write)
+        write(', "signatures": ')
+        write_json_array(write, self.signatures)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TransactionV1Envelope:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx = self.tx.clone()
+        result.signatures = [item.clone() for item in self.signatures]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TransactionV1Envelope:
+        return self.clone()
+
+    def freeze(self) -> TransactionV1Envelope:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Integer,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .trust_line_entry_extension_v2 import TrustLineEntryExtensionV2
 
 __all__ = ["TrustLineEntryV1Ext"]
@@ -26,6 +37,8 @@ class TrustLineEntryV1Ext:
                     }
     """
 
+    __slots__ = ("v", "v2")
+
     def __init__(
         self,
         v: int,
@@ -45,30 +58,84 @@ class TrustLineEntryV1Ext:
             return
         raise ValueError("Invalid v.")
 
+    def xdr_size(self) -> int:
+        if self.v == 0:
+            return 4
+        if self.v == 2:
+            assert self.v2 is not None
+            return 4 + self.v2.xdr_size()
+        raise ValueError("Invalid v.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
     ) -> TrustLineEntryV1Ext:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        v = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(v)
+        if unpack_arm is None:
+            raise ValueError("Invalid v.")
+        return unpack_arm(cls, v, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         v = Integer.unpack(unpacker)
         if v == 0:
-            return cls(v=v)
+            return
         if v == 2:
-            v2 = TrustLineEntryExtensionV2.unpack(unpacker, depth_limit - 1)
-            return cls(v=v, v2=v2)
+            TrustLineEntryExtensionV2.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid v.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TrustLineEntryV1Ext:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        v = Integer.unpack(unpacker)
+        if "v" in fields:
+            _result["v"] = v
+        if v == 0:
+            return _result
+        if v == 2:
+            if "v2" in fields:
+                _result["v2"] = TrustLineEntryExtensionV2.unpack_fields(
+                    unpacker, fields["v2"], depth_limit - 1
+                )
+            else:
+                TrustLineEntryExtensionV2.skip(unpacker, depth_limit - 1)
+            return _result
         raise ValueError("Invalid v.")
 
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TrustLineEntryV1Ext:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TrustLineEntryV1Ext:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +150,11 @@ class TrustLineEntryV1Ext:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TrustLineEntryV1Ext:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.v == 0:
@@ -117,6 +184,32 @@ class TrustLineEntryV1Ext:
             return cls(v=v, v2=v2)
         raise ValueError(f"Unknown key '{key}' for TrustLineEntryV1Ext")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.v == 0:
+            write('"v0"')
+            return
+        if self.v == 2:
+            assert self.v2 is not None
+            write('{"v2": ')
+            self.v2._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown v in TrustLineEntryV1Ext: {self.v}")
+
+    def clone(self, deep: bool = True) -> TrustLineEntryV1Ext:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.v = self.v
+        result.v2 = self.v2.clone() if self.v2 is not None else None
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TrustLineEntryV1Ext:
+        return self.clone()
+
+    def freeze(self) -> TrustLineEntryV1Ext:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -136,3 +229,18 @@ class TrustLineEntryV1Ext:
         if self.v2 is not None:
             out.append(f"v2={self.v2}")
         return f"<TrustLineEntryV1Ext [{', '.join(out)}]>"
+
+
+def _unpack_void(cls, v, unpacker: Unpacker, depth_limit: int) -> TrustLineEntryV1Ext:
+    return cls(v=v)
+
+
+def _unpack_v2(cls, v, unpacker: Unpacker, depth_limit: int) -> TrustLineEntryV1Ext:
+    v2 = TrustLineEntryExtensionV2.unpack(unpacker, depth_limit - 1)
+    return cls(v=v, v2=v2)
+
+
+_UNPACK_ARMS = {
+    0: _unpack_void,
+    2: _unpack_v2,
+}
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .hash import Hash
 from .uint32 import Uint32
 
+_LAYOUT = FixedLayout(">32sI")
 __all__ = ["TTLEntry"]
 
 
@@ -25,6 +37,8 @@ class TTLEntry:
         };
     """
 
+    __slots__ = ("key_hash", "live_until_ledger_seq")
+
     def __init__(
         self,
         key_hash: Hash,
@@ -34,8 +48,10 @@ class TTLEntry:
         self.live_until_ledger_seq = live_until_ledger_seq
 
     def pack(self, packer: Packer) -> None:
-        self.key_hash.pack(packer)
-        self.live_until_ledger_seq.pack(packer)
+        _LAYOUT.write(packer, self.key_hash.hash, self.live_until_ledger_seq.uint32)
+
+    def xdr_size(self) -> int:
+        return 36
 
     @classmethod
     def unpack(
@@ -43,23 +59,61 @@ class TTLEntry:
     ) -> TTLEntry:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        key_hash = Hash.unpack(unpacker, depth_limit - 1)
-        live_until_ledger_seq = Uint32.unpack(unpacker, depth_limit - 1)
+        key_hash, live_until_ledger_seq = _LAYOUT.read(unpacker)
         return cls(
-            key_hash=key_hash,
-            live_until_ledger_seq=live_until_ledger_seq,
+            key_hash=Hash(key_hash),
+            live_until_ledger_seq=Uint32(live_until_ledger_seq),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TTLEntry:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "key_hash" in fields:
+            _result["key_hash"] = Hash.unpack_fields(
+                unpacker, fields["key_hash"], depth_limit - 1
+            )
+        else:
+            Hash.skip(unpacker, depth_limit - 1)
+        if "live_until_ledger_seq" in fields:
+            _result["live_until_ledger_seq"] = Uint32.unpack_fields(
+                unpacker, fields["live_until_ledger_seq"], depth_limit - 1
+            )
+        else:
+            Uint32.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TTLEntry:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TTLEntry:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +128,11 @@ class TTLEntry:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TTLEntry:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -97,6 +151,27 @@ class TTLEntry:
             live_until_ledger_seq=live_until_ledger_seq,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"key_hash": ')
+        self.key_hash._write_json(write)
+        write(', "live_until_ledger_seq": ')
+        self.live_until_ledger_seq._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TTLEntry:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.key_hash = self.key_hash.clone()
+        result.live_until_ledger_seq = self.live_until_ledger_seq.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TTLEntry:
+        return self.clone()
+
+    def freeze(self) -> TTLEntry:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
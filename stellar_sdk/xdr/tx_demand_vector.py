@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    write_json_array,
+    xdr_to_json,
+)
 from .constants import TX_DEMAND_VECTOR_MAX_SIZE
 from .hash import Hash
 
@@ -21,6 +34,8 @@ class TxDemandVector:
         typedef Hash TxDemandVector<TX_DEMAND_VECTOR_MAX_SIZE>;
     """
 
+    __slots__ = ("tx_demand_vector",)
+
     def __init__(self, tx_demand_vector: list[Hash]) -> None:
         _expect_max_length = TX_DEMAND_VECTOR_MAX_SIZE
         if tx_demand_vector and len(tx_demand_vector) > _expect_max_length:
@@ -34,6 +49,9 @@ class TxDemandVector:
         for tx_demand_vector_item in self.tx_demand_vector:
             tx_demand_vector_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + 32 * len(self.tx_demand_vector)
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -51,16 +69,92 @@ class TxDemandVector:
             tx_demand_vector.append(Hash.unpack(unpacker, depth_limit - 1))
         return cls(tx_demand_vector)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_demand_vector length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TxDemandVector:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "tx_demand_vector" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_demand_vector length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["tx_demand_vector"] = []
+            for _ in range(length):
+                _result["tx_demand_vector"].append(
+                    Hash.unpack_fields(
+                        unpacker, fields["tx_demand_vector"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"tx_demand_vector length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"tx_demand_vector length {length} exceeds remaining input length {_remaining}"
+            )
+        tx_demand_vector = []
+        for _ in range(length):
+            tx_demand_vector.append(Hash.unpack(unpacker, depth_limit - 1))
+        yield "tx_demand_vector", tx_demand_vector
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TxDemandVector:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TxDemandVector:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -75,11 +169,11 @@ class TxDemandVector:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TxDemandVector:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.tx_demand_vector]
@@ -88,6 +182,22 @@ class TxDemandVector:
     def from_json_dict(cls, json_value: list) -> TxDemandVector:
         return cls([Hash.from_json_dict(item) for item in json_value])
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.tx_demand_vector)
+
+    def clone(self, deep: bool = True) -> TxDemandVector:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.tx_demand_vector = [item.clone() for item in self.tx_demand_vector]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TxDemandVector:
+        return self.clone()
+
+    def freeze(self) -> TxDemandVector:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.tx_demand_vector,))
 
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .tx_set_component_txs_maybe_discounted_fee import (
     TxSetComponentTxsMaybeDiscountedFee,
 )
@@ -31,6 +44,8 @@ class TxSetComponent:
         };
     """
 
+    __slots__ = ("txs_maybe_discounted_fee", "type")
+
     def __init__(
         self,
         type: TxSetComponentType,
@@ -48,6 +63,12 @@ class TxSetComponent:
             return
         raise ValueError("Invalid type.")
 
+    def xdr_size(self) -> int:
+        if self.type == TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE:
+            assert self.txs_maybe_discounted_fee is not None
+            return 4 + self.txs_maybe_discounted_fee.xdr_size()
+        raise ValueError("Invalid type.")
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -55,11 +76,71 @@ class TxSetComponent:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = TxSetComponentType.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = TxSetComponentType.unpack(unpacker)
+        if type == TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE:
+            TxSetComponentTxsMaybeDiscountedFee.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TxSetComponent:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = TxSetComponentType.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
         if type == TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE:
-            txs_maybe_discounted_fee = TxSetComponentTxsMaybeDiscountedFee.unpack(
-                unpacker, depth_limit - 1
+            if "txs_maybe_discounted_fee" in fields:
+                _result["txs_maybe_discounted_fee"] = (
+                    TxSetComponentTxsMaybeDiscountedFee.unpack_fields(
+                        unpacker, fields["txs_maybe_discounted_fee"], depth_limit - 1
+                    )
+                )
+            else:
+                TxSetComponentTxsMaybeDiscountedFee.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = TxSetComponentType.unpack(unpacker)
+        yield "type", type
+        if type == TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE:
+            yield (
+                "txs_maybe_discounted_fee",
+                view_at(TxSetComponentTxsMaybeDiscountedFee, unpacker, depth_limit - 1),
             )
-            return cls(type=type, txs_maybe_discounted_fee=txs_maybe_discounted_fee)
+            return
         raise ValueError("Invalid type.")
 
     def to_xdr_bytes(self) -> bytes:
@@ -68,10 +149,10 @@ class TxSetComponent:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TxSetComponent:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TxSetComponent:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -86,11 +167,11 @@ class TxSetComponent:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TxSetComponent:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         if self.type == TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE:
@@ -117,6 +198,33 @@ class TxSetComponent:
             return cls(type=type, txs_maybe_discounted_fee=txs_maybe_discounted_fee)
         raise ValueError(f"Unknown key '{key}' for TxSetComponent")
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE:
+            assert self.txs_maybe_discounted_fee is not None
+            write('{"txset_comp_txs_maybe_discounted_fee": ')
+            self.txs_maybe_discounted_fee._write_json(write)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in TxSetComponent: {self.type}")
+
+    def clone(self, deep: bool = True) -> TxSetComponent:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.txs_maybe_discounted_fee = (
+            self.txs_maybe_discounted_fee.clone()
+            if self.txs_maybe_discounted_fee is not None
+            else None
+        )
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TxSetComponent:
+        return self.clone()
+
+    def freeze(self) -> TxSetComponent:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -139,3 +247,17 @@ class TxSetComponent:
         if self.txs_maybe_discounted_fee is not None:
             out.append(f"txs_maybe_discounted_fee={self.txs_maybe_discounted_fee}")
         return f"<TxSetComponent [{', '.join(out)}]>"
+
+
+def _unpack_txs_maybe_discounted_fee(
+    cls, type, unpacker: Unpacker, depth_limit: int
+) -> TxSetComponent:
+    txs_maybe_discounted_fee = TxSetComponentTxsMaybeDiscountedFee.unpack(
+        unpacker, depth_limit - 1
+    )
+    return cls(type=type, txs_maybe_discounted_fee=txs_maybe_discounted_fee)
+
+
+_UNPACK_ARMS = {
+    TxSetComponentType.TXSET_COMP_TXS_MAYBE_DISCOUNTED_FEE: _unpack_txs_maybe_discounted_fee,
+}
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    unpack_view,
+    write_json_array,
+    xdr_to_json,
+)
 from .int64 import Int64
 from .transaction_envelope import TransactionEnvelope
 
@@ -25,6 +39,8 @@ class TxSetComponentTxsMaybeDiscountedFee:
           }
     """
 
+    __slots__ = ("base_fee", "txs")
+
     def __init__(
         self,
         base_fee: Int64 | None,
@@ -48,6 +64,14 @@ class TxSetComponentTxsMaybeDiscountedFee:
         for txs_item in self.txs:
             txs_item.pack(packer)
 
+    def xdr_size(self) -> int:
+        return (
+            4
+            + (8 if self.base_fee is not None else 0)
+            + 4
+            + sum(item.xdr_size() for item in self.txs)
+        )
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -71,16 +95,109 @@ class TxSetComponentTxsMaybeDiscountedFee:
             txs=txs,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            Int64.skip(unpacker, depth_limit - 1)
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"txs length {length} exceeds remaining input length {_remaining}"
+            )
+        for _ in range(length):
+            TransactionEnvelope.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | TxSetComponentTxsMaybeDiscountedFee:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "base_fee" in fields:
+            _result["base_fee"] = (
+                Int64.unpack_fields(unpacker, fields["base_fee"], depth_limit - 1)
+                if unpacker.unpack_uint()
+                else None
+            )
+        else:
+            if unpacker.unpack_uint():
+                Int64.skip(unpacker, depth_limit - 1)
+        if "txs" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"txs length {length} exceeds remaining input length {_remaining}"
+                )
+            _result["txs"] = []
+            for _ in range(length):
+                _result["txs"].append(
+                    TransactionEnvelope.unpack_fields(
+                        unpacker, fields["txs"], depth_limit - 1
+                    )
+                )
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(
+                    f"txs length {length} exceeds remaining input length {_remaining}"
+                )
+            for _ in range(length):
+                TransactionEnvelope.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield (
+            "base_fee",
+            Int64.unpack(unpacker, depth_limit - 1) if unpacker.unpack_uint() else None,
+        )
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(
+                f"txs length {length} exceeds remaining input length {_remaining}"
+            )
+        txs = []
+        for _ in range(length):
+            txs.append(unpack_view(TransactionEnvelope, unpacker, depth_limit - 1))
+        yield "txs", txs
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TxSetComponentTxsMaybeDiscountedFee:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> TxSetComponentTxsMaybeDiscountedFee:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -95,11 +212,11 @@ class TxSetComponentTxsMaybeDiscountedFee:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TxSetComponentTxsMaybeDiscountedFee:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -122,6 +239,30 @@ class TxSetComponentTxsMaybeDiscountedFee:
             txs=txs,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"base_fee": ')
+        if self.base_fee is None:
+            write("null")
+        else:
+            self.base_fee._write_json(write)
+        write(', "txs": ')
+        write_json_array(write, self.txs)
+        write("}")
+
+    def clone(self, deep: bool = True) -> TxSetComponentTxsMaybeDiscountedFee:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.base_fee = self.base_fee.clone() if self.base_fee is not None else None
+        result.txs = [item.clone() for item in self.txs]
+        return result
+
+    def __deepcopy__(self, memo: dict) -> TxSetComponentTxsMaybeDiscountedFee:
+        return self.clone()
+
+    def freeze(self) -> TxSetComponentTxsMaybeDiscountedFee:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 from .uint64 import Uint64
 
+_LAYOUT = FixedLayout(">QQ")
 __all__ = ["UInt128Parts"]
 
 
@@ -23,6 +36,8 @@ class UInt128Parts:
         };
     """
 
+    __slots__ = ("hi", "lo")
+
     def __init__(
         self,
         hi: Uint64,
@@ -32,8 +47,10 @@ class UInt128Parts:
         self.lo = lo
 
     def pack(self, packer: Packer) -> None:
-        self.hi.pack(packer)
-        self.lo.pack(packer)
+        _LAYOUT.write(packer, self.hi.uint64, self.lo.uint64)
+
+    def xdr_size(self) -> int:
+        return 16
 
     @classmethod
     def unpack(
@@ -41,23 +58,61 @@ class UInt128Parts:
     ) -> UInt128Parts:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        hi = Uint64.unpack(unpacker, depth_limit - 1)
-        lo = Uint64.unpack(unpacker, depth_limit - 1)
+        hi, lo = _LAYOUT.read(unpacker)
         return cls(
-            hi=hi,
-            lo=lo,
+            hi=Uint64(hi),
+            lo=Uint64(lo),
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | UInt128Parts:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "hi" in fields:
+            _result["hi"] = Uint64.unpack_fields(
+                unpacker, fields["hi"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        if "lo" in fields:
+            _result["lo"] = Uint64.unpack_fields(
+                unpacker, fields["lo"], depth_limit - 1
+            )
+        else:
+            Uint64.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> UInt128Parts:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> UInt128Parts:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -72,11 +127,11 @@ class UInt128Parts:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> UInt128Parts:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> str:
         value_bytes = self.hi.uint64.to_bytes(
@@ -94,6 +149,23 @@ class UInt128Parts:
             lo=Uint64(int.from_bytes(value_bytes[8:16], "big", signed=False)),
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(self.to_json_dict()))
+
+    def clone(self, deep: bool = True) -> UInt128Parts:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.hi = self.hi.clone()
+        result.lo = self.lo.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> UInt128Parts:
+        return self.clone()
+
+    def freeze(self) -> UInt128Parts:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
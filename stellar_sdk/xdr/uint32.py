@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, UnsignedInteger
-
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    FixedLayout,
+    UnsignedInteger,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
+
+_LAYOUT = FixedLayout(">I")
 __all__ = ["Uint32"]
 
 
@@ -19,11 +33,16 @@ class Uint32:
         typedef unsigned int uint32;
     """
 
+    __slots__ = ("uint32",)
+
     def __init__(self, uint32: int) -> None:
         self.uint32 = uint32
 
     def pack(self, packer: Packer) -> None:
-        UnsignedInteger(self.uint32).pack(packer)
+        _LAYOUT.write(packer, self.uint32)
+
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(
@@ -31,19 +50,52 @@ class Uint32:
     ) -> Uint32:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        uint32 = UnsignedInteger.unpack(unpacker)
+        (uint32,) = _LAYOUT.read(unpacker)
         return cls(uint32)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | Uint32:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "uint32" in fields:
+            _result["uint32"] = UnsignedInteger.unpack_fields(
+                unpacker, fields["uint32"]
+            )
+        else:
+            UnsignedInteger.skip(unpacker)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Uint32:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Uint32:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -58,11 +110,11 @@ class Uint32:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Uint32:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return UnsignedInteger.to_json_dict(self.uint32)
@@ -71,6 +123,22 @@ class Uint32:
     def from_json_dict(cls, json_value: int) -> Uint32:
         return cls(UnsignedInteger.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(UnsignedInteger.to_json_dict(self.uint32)))
+
+    def clone(self, deep: bool = True) -> Uint32:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.uint32 = self.uint32
+        return result
+
+    def __deepcopy__(self, memo: dict) -> Uint32:
+        return self.clone()
+
+    def freeze(self) -> Uint32:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.uint32,))
 
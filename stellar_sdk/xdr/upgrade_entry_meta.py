@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    XdrBuffer,
+    XdrView,
+    check_fields,
+    decode_field_paths,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    make_view,
+    shallow_clone,
+    view_at,
+    xdr_to_json,
+)
 from .ledger_entry_changes import LedgerEntryChanges
 from .ledger_upgrade import LedgerUpgrade
 
@@ -25,6 +38,8 @@ class UpgradeEntryMeta:
         };
     """
 
+    __slots__ = ("changes", "upgrade")
+
     def __init__(
         self,
         upgrade: LedgerUpgrade,
@@ -37,6 +52,9 @@ class UpgradeEntryMeta:
         self.upgrade.pack(packer)
         self.changes.pack(packer)
 
+    def xdr_size(self) -> int:
+        return self.upgrade.xdr_size() + self.changes.xdr_size()
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -50,16 +68,69 @@ class UpgradeEntryMeta:
             changes=changes,
         )
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LedgerUpgrade.skip(unpacker, depth_limit - 1)
+        LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | UpgradeEntryMeta:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "upgrade" in fields:
+            _result["upgrade"] = LedgerUpgrade.unpack_fields(
+                unpacker, fields["upgrade"], depth_limit - 1
+            )
+        else:
+            LedgerUpgrade.skip(unpacker, depth_limit - 1)
+        if "changes" in fields:
+            _result["changes"] = LedgerEntryChanges.unpack_fields(
+                unpacker, fields["changes"], depth_limit - 1
+            )
+        else:
+            LedgerEntryChanges.skip(unpacker, depth_limit - 1)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "upgrade", LedgerUpgrade.unpack(unpacker, depth_limit - 1)
+        yield "changes", view_at(LedgerEntryChanges, unpacker, depth_limit - 1)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> UpgradeEntryMeta:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(
+        cls, xdr: XdrBuffer, zero_copy: bool = False
+    ) -> UpgradeEntryMeta:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -74,11 +145,11 @@ class UpgradeEntryMeta:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> UpgradeEntryMeta:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self) -> dict:
         return {
@@ -95,6 +166,27 @@ class UpgradeEntryMeta:
             changes=changes,
         )
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"upgrade": ')
+        self.upgrade._write_json(write)
+        write(', "changes": ')
+        self.changes._write_json(write)
+        write("}")
+
+    def clone(self, deep: bool = True) -> UpgradeEntryMeta:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.upgrade = self.upgrade.clone()
+        result.changes = self.changes.clone()
+        return result
+
+    def __deepcopy__(self, memo: dict) -> UpgradeEntryMeta:
+        return self.clone()
+
+    def freeze(self) -> UpgradeEntryMeta:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash(
             (
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable
 
 from xdrlib3 import Packer, Unpacker
 
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import (
+    DEFAULT_XDR_MAX_DEPTH,
+    Opaque,
+    XdrBuffer,
+    check_fields,
+    decode_field_paths,
+    json_encode,
+    json_loads,
+    make_frozen,
+    make_unpacker,
+    shallow_clone,
+    xdr_to_json,
+)
 
 __all__ = ["UpgradeType"]
 
@@ -19,6 +31,8 @@ class UpgradeType:
         typedef opaque UpgradeType<128>;
     """
 
+    __slots__ = ("upgrade_type",)
+
     def __init__(self, upgrade_type: bytes) -> None:
         _expect_max_length = 128
         if upgrade_type and len(upgrade_type) > _expect_max_length:
@@ -30,6 +44,9 @@ class UpgradeType:
     def pack(self, packer: Packer) -> None:
         Opaque(self.upgrade_type, 128, False).pack(packer)
 
+    def xdr_size(self) -> int:
+        return 4 + (len(self.upgrade_type) + 3) // 4 * 4
+
     @classmethod
     def unpack(
         cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH
@@ -39,16 +56,49 @@ class UpgradeType:
         upgrade_type = Opaque.unpack(unpacker, 128, False)
         return cls(upgrade_type)
 
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 128, False)
+
+    @classmethod
+    def unpack_fields(
+        cls,
+        unpacker: Unpacker,
+        fields: dict | None,
+        depth_limit: int = DEFAULT_XDR_MAX_DEPTH,
+    ) -> dict | UpgradeType:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "upgrade_type" in fields:
+            _result["upgrade_type"] = Opaque.unpack_fields(
+                unpacker, fields["upgrade_type"], 128, False
+            )
+        else:
+            Opaque.skip(unpacker, 128, False)
+        return _result
+
+    @classmethod
+    def decode_fields(
+        cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+    ) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> UpgradeType:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> UpgradeType:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -63,11 +113,11 @@ class UpgradeType:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> UpgradeType:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
 
     def to_json_dict(self):
         return Opaque.to_json_dict(self.upgrade_type)
@@ -76,6 +126,22 @@ class UpgradeType:
     def from_json_dict(cls, json_value: str) -> UpgradeType:
         return cls(Opaque.from_json_dict(json_value))
 
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(Opaque.to_json_dict(self.upgrade_type)))
+
+    def clone(self, deep: bool = True) -> UpgradeType:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.upgrade_type = self.upgrade_type
+        return result
+
+    def __deepcopy__(self, memo: dict) -> UpgradeType:
+        return self.clone()
+
+    def freeze(self) -> UpgradeType:
+        return make_frozen(self)
+
     def __hash__(self):
         return hash((self.upgrade_type,))
 
@@ -47,10 +47,44 @@ def ledger(base_fee: int = 100) -> dict:
     return {"_embedded": {"records": [{"base_fee_in_stroops": str(base_fee)}]}}
 
 
+def record_pages(horizon_mock, path: str, pages: list[list[str]]) -> None:
+    """Serve pages of records with the given paging tokens, in ascending order
+    and two records a page, followed by an empty page."""
+    cursor = None
+    for paging_tokens in [*pages, []]:
+        query_string = "limit=2&order=asc"
+        if cursor is not None:
+            query_string = f"cursor={cursor}&{query_string}"
+        if paging_tokens:
+            cursor = paging_tokens[-1]
+        records = [{"id": token, "paging_token": token} for token in paging_tokens]
+        horizon_mock.expect(
+            path,
+            query_string=query_string,
+            json={
+                "_links": {
+                    "next": {
+                        "href": f"{horizon_mock.url}{path[1:]}?cursor={cursor}&limit=2&order=asc"
+                    }
+                },
+                "_embedded": {"records": records},
+            },
+        )
+
+
 def submit_transaction(xdr: str = TRANSACTION_XDR) -> dict:
     return {"envelope_xdr": xdr}
 
 
+def transaction_failed(**result_codes: str) -> dict:
+    return {
+        "type": "https://stellar.org/horizon-errors/transaction_failed",
+        "title": "Transaction Failed",
+        "status": 400,
+        "extras": {"result_codes": result_codes},
+    }
+
+
 def submit_transaction_async(tx_hash: str) -> dict:
     return {"tx_status": "PENDING", "hash": tx_hash}
 
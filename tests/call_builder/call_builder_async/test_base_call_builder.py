@@ -208,3 +208,88 @@ class TestBaseCallBuilder:
             + "get?version=1.2&auth=myPassw0wd&limit=10&cursor=10086&order=desc"
         )
         await client.close()
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    async def test_iter_records(self, horizon_mock, prefetch):
+        hf.record_pages(horizon_mock, "/payments", [["1", "2"], ["3", "4"], ["5"]])
+        checkpoints = []
+
+        async def checkpoint(cursor):
+            checkpoints.append(cursor)
+
+        async with AiohttpClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = [
+                record
+                async for record in call_builder.iter_records(prefetch, checkpoint)
+            ]
+        assert [record["id"] for record in records] == ["1", "2", "3", "4", "5"]
+        assert checkpoints == ["2", "4", "5"]
+        assert len(horizon_mock.httpserver.log) == 4
+
+    async def test_iter_records_prefetch_is_bounded(self, horizon_mock):
+        hf.record_pages(horizon_mock, "/payments", [["1", "2"], ["3", "4"], ["5"]])
+        checkpoints = []
+        async with AiohttpClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = call_builder.iter_records(checkpoint=checkpoints.append)
+            assert (await anext(records))["id"] == "1"
+            await records.aclose()
+        # The first page and at most the next one have been requested.
+        assert len(horizon_mock.httpserver.log) <= 2
+        assert checkpoints == []
+
+    async def test_iter_records_raise(self, horizon_mock):
+        horizon_mock.expect(
+            "/payments",
+            query_string="limit=2&order=asc",
+            json={
+                "_links": {
+                    "next": {"href": horizon_mock.url + "accounts/BADACCOUNTID"}
+                },
+                "_embedded": {"records": [{"id": "1", "paging_token": "1"}]},
+            },
+        )
+        horizon_mock.expect("/accounts/BADACCOUNTID", json=hf.NOT_FOUND, status=404)
+        checkpoints = []
+        async with AiohttpClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = call_builder.iter_records(checkpoint=checkpoints.append)
+            assert (await anext(records))["id"] == "1"
+            with pytest.raises(NotFoundError):
+                await anext(records)
+        assert checkpoints == ["1"]
+
+    async def test_iter_records_not_pageable_raise(self, httpbin_url):
+        async with AiohttpClient() as client:
+            records = BaseCallBuilder(
+                horizon_url=httpbin_url + "get", client=client
+            ).iter_records()
+            with pytest.raises(NotPageableError, match="not a page of records"):
+                await anext(records)
+
+    async def test_iter_records_invalid_prefetch(self):
+        async with AiohttpClient() as client:
+            call_builder = BaseCallBuilder(
+                horizon_url="https://horizon.stellar.org", client=client
+            )
+            with pytest.raises(ValueError, match="prefetch must not be negative"):
+                call_builder.iter_records(-1)
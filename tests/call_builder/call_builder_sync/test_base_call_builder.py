@@ -1,4 +1,9 @@
+import json
+import threading
+import time
+
 import pytest
+from werkzeug.wrappers import Response
 
 from stellar_sdk.__version__ import __version__
 from stellar_sdk.call_builder.call_builder_sync import BaseCallBuilder
@@ -200,3 +205,127 @@ class TestBaseCallBuilder:
             == httpbin_url
             + "get?version=1.2&auth=myPassw0wd&limit=10&cursor=10086&order=desc"
         )
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_iter_records(self, horizon_mock, prefetch):
+        hf.record_pages(horizon_mock, "/payments", [["1", "2"], ["3", "4"], ["5"]])
+        checkpoints = []
+        with RequestsClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = list(
+                call_builder.iter_records(prefetch, checkpoint=checkpoints.append)
+            )
+        assert [record["id"] for record in records] == ["1", "2", "3", "4", "5"]
+        assert checkpoints == ["2", "4", "5"]
+        assert len(horizon_mock.httpserver.log) == 4
+
+    def test_iter_records_prefetch_is_bounded(self, horizon_mock):
+        hf.record_pages(horizon_mock, "/payments", [["1", "2"], ["3", "4"], ["5"]])
+        checkpoints = []
+        with RequestsClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = call_builder.iter_records(checkpoint=checkpoints.append)
+            assert next(records)["id"] == "1"
+            records.close()
+        # The first page and at most the next one have been requested.
+        assert len(horizon_mock.httpserver.log) <= 2
+        assert checkpoints == []
+
+    def test_iter_records_close_does_not_wait_for_prefetch(self, horizon_mock):
+        horizon_mock.expect(
+            "/payments",
+            query_string="limit=2&order=asc",
+            json={
+                "_links": {
+                    "next": {
+                        "href": horizon_mock.url + "payments?cursor=2&limit=2&order=asc"
+                    }
+                },
+                "_embedded": {"records": [{"id": "1", "paging_token": "2"}]},
+            },
+        )
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def slow_page(request):
+            fetching.set()
+            release.wait(10)
+            return Response(
+                json.dumps({"_embedded": {"records": []}}),
+                content_type="application/json",
+            )
+
+        horizon_mock.httpserver.expect_request(
+            "/payments", query_string="cursor=2&limit=2&order=asc"
+        ).respond_with_handler(slow_page)
+        with RequestsClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = call_builder.iter_records()
+            try:
+                assert next(records)["id"] == "1"
+                assert fetching.wait(10)
+                start = time.monotonic()
+                records.close()
+                assert time.monotonic() - start < 5
+            finally:
+                release.set()
+
+    def test_iter_records_raise(self, horizon_mock):
+        horizon_mock.expect(
+            "/payments",
+            query_string="limit=2&order=asc",
+            json={
+                "_links": {
+                    "next": {"href": horizon_mock.url + "accounts/BADACCOUNTID"}
+                },
+                "_embedded": {"records": [{"id": "1", "paging_token": "1"}]},
+            },
+        )
+        horizon_mock.expect("/accounts/BADACCOUNTID", json=hf.NOT_FOUND, status=404)
+        checkpoints = []
+        with RequestsClient() as client:
+            call_builder = (
+                BaseCallBuilder(
+                    horizon_url=horizon_mock.url + "payments", client=client
+                )
+                .limit(2)
+                .order(desc=False)
+            )
+            records = call_builder.iter_records(checkpoint=checkpoints.append)
+            assert next(records)["id"] == "1"
+            with pytest.raises(NotFoundError):
+                next(records)
+        assert checkpoints == ["1"]
+
+    def test_iter_records_not_pageable_raise(self, httpbin_url):
+        with RequestsClient() as client:
+            records = BaseCallBuilder(
+                horizon_url=httpbin_url + "get", client=client
+            ).iter_records()
+            with pytest.raises(NotPageableError, match="not a page of records"):
+                next(records)
+
+    def test_iter_records_invalid_prefetch(self):
+        call_builder = BaseCallBuilder(
+            horizon_url="https://horizon.stellar.org", client=RequestsClient()
+        )
+        with pytest.raises(ValueError, match="prefetch must not be negative"):
+            call_builder.iter_records(-1)
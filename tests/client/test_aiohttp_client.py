@@ -1,9 +1,12 @@
+import asyncio
+
 import pytest
 from aiointercept import aiointercept
 
 from stellar_sdk.client.aiohttp_client import USER_AGENT, AiohttpClient
 from stellar_sdk.exceptions import ConnectionError, ContentSizeLimitExceededError
 from tests import _horizon_fixtures as hf
+from tests.client.test_requests_client import _slow_accounts
 
 
 class TestAiohttpClient:
@@ -131,3 +134,58 @@ class TestAiohttpClient:
             with pytest.raises(ConnectionError):
                 await client.get(url, max_content_size=1024)
         await client.close()
+
+
+@pytest.mark.asyncio
+class TestAiohttpClientCoalesce:
+    async def test_identical_gets_share_a_request(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock)
+        url = horizon_mock.url + "accounts/GA"
+        async with AiohttpClient(coalesce=True) as client:
+            responses = await asyncio.gather(*(client.get(url) for _ in range(8)))
+            assert all(resp is responses[0] for resp in responses)
+            assert responses[0].json() == hf.account("GA")
+            await client.get(url)
+            await asyncio.gather(
+                client.get(url), client.get(url, {"a": "1"}), client.get(url)
+            )
+        assert requests == {"/accounts/GA?": 3, "/accounts/GA?a=1": 1}
+
+    async def test_exclude(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock, delay=0.05)
+        urls = [horizon_mock.url + "accounts/GA", horizon_mock.url + "accounts/GB"]
+        async with AiohttpClient(coalesce=True, coalesce_exclude=["/GB$"]) as client:
+            await asyncio.gather(*(client.get(url) for url in urls * 3))
+        assert requests == {"/accounts/GA?": 1, "/accounts/GB?": 3}
+
+    async def test_cancel(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock)
+        url = horizon_mock.url + "accounts/GA"
+        async with AiohttpClient(coalesce=True) as client:
+            first = asyncio.ensure_future(client.get(url))
+            second = asyncio.ensure_future(client.get(url))
+            await asyncio.sleep(0.05)
+            # The request goes on while another coroutine waits for it.
+            first.cancel()
+            assert (await second).json() == hf.account("GA")
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            # The request is cancelled with its last waiter.
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.get(url), 0.05)
+            assert client._coalescer._flights == {}
+            # Lets the server answer the cancelled request before the next test.
+            await asyncio.sleep(0.3)
+        assert requests == {"/accounts/GA?": 2}
+
+    async def test_error_is_shared(self):
+        client = AiohttpClient(coalesce=True)
+        url = "https://example.com/data"
+        async with aiointercept(mock_external_urls=True) as m:
+            m.get(url, exception=True)
+            results = await asyncio.gather(
+                *(client.get(url) for _ in range(3)), return_exceptions=True
+            )
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert client._coalescer._flights == {}
+        await client.close()
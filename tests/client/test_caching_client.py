@@ -0,0 +1,297 @@
+import json
+
+import pytest
+
+from stellar_sdk import AiohttpClient, RequestsClient, Server, ServerAsync
+from stellar_sdk.client.base_async_client import BaseAsyncClient
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.client.caching_client import CachingClient
+from stellar_sdk.client.caching_client_async import CachingClientAsync
+from stellar_sdk.client.response import Response
+from stellar_sdk.client.response_cache import (
+    MemoryResponseCache,
+    SQLiteResponseCache,
+)
+from stellar_sdk.exceptions import NotFoundError
+from tests import _horizon_fixtures as hf
+
+HORIZON_URL = "https://horizon.stellar.org/"
+TRANSACTION_URL = HORIZON_URL + "transactions/" + hf.TRANSACTION_HASH
+
+
+class _Client(BaseSyncClient):
+    """Reply to GET requests with the given responses, by url."""
+
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.requests = []
+
+    def get(self, url, params=None, max_content_size=None):
+        self.requests.append((url, params))
+        return self.responses.get(url) or _response(url, {"url": url})
+
+    def post(self, url, data=None, json_data=None):
+        self.requests.append((url, data))
+        return _response(url, {})
+
+    def stream(self, url, params=None):
+        yield {"url": url}
+
+    def close(self):
+        pass
+
+
+class _AsyncClient(BaseAsyncClient):
+    def __init__(self, responses=None):
+        self._client = _Client(responses)
+        self.requests = self._client.requests
+
+    async def get(self, url, params=None, max_content_size=None):
+        return self._client.get(url, params, max_content_size)
+
+    async def post(self, url, data=None, json_data=None):
+        return self._client.post(url, data, json_data)
+
+    async def stream(self, url, params=None):
+        yield {"url": url}
+
+    async def close(self):
+        pass
+
+
+def _response(url, body, status_code=200, headers=None):
+    return Response(status_code, json.dumps(body), headers or {}, url)
+
+
+def _page(records):
+    return {"_embedded": {"records": records}}
+
+
+class TestCachingClient:
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "ledgers/50000000",
+            "transactions/" + hf.TRANSACTION_HASH,
+            "transactions/" + hf.TRANSACTION_HASH + "/operations",
+            "operations/214748368900001793",
+            "operations/214748368900001793/effects",
+        ],
+    )
+    def test_immutable_resources(self, path):
+        inner = _Client()
+        client = CachingClient(inner)
+        first = client.get(HORIZON_URL + path)
+        assert client.get(HORIZON_URL + path) is first
+        assert len(inner.requests) == 1
+
+    @pytest.mark.parametrize(
+        "path",
+        ["ledgers", "transactions", "accounts/GABC", "fee_stats", "ledgers/latest"],
+    )
+    def test_mutable_resources(self, path):
+        inner = _Client()
+        client = CachingClient(inner)
+        client.get(HORIZON_URL + path)
+        client.get(HORIZON_URL + path)
+        assert len(inner.requests) == 2
+
+    def test_params_are_part_of_the_key(self):
+        inner = _Client()
+        client = CachingClient(inner)
+        url = HORIZON_URL + "ledgers/1/operations"
+        inner.responses[url] = _response(url, _page([{"id": "1"}]))
+        client.get(url, {"limit": "10", "include_failed": "true"})
+        client.get(url, {"include_failed": "true", "limit": "10"})
+        client.get(url, {"limit": "20"})
+        assert inner.requests == [
+            (url, {"limit": "10", "include_failed": "true"}),
+            (url, {"limit": "20"}),
+        ]
+
+    def test_empty_ledger_page_is_not_cached(self):
+        url = HORIZON_URL + "ledgers/100/transactions"
+        inner = _Client({url: _response(url, _page([]))})
+        client = CachingClient(inner)
+        client.get(url)
+        client.get(url)
+        assert len(inner.requests) == 2
+
+    @pytest.mark.parametrize(
+        ("url", "status_code", "headers"),
+        [
+            (TRANSACTION_URL, 404, {}),
+            (TRANSACTION_URL, 200, {"Cache-Control": "no-store"}),
+            (TRANSACTION_URL, 200, {"cache-control": "private, no-cache"}),
+            (HORIZON_URL + "ledgers", 200, {"Cache-Control": "max-age=0"}),
+        ],
+    )
+    def test_not_cached(self, url, status_code, headers):
+        inner = _Client({url: _response(url, {}, status_code, headers)})
+        client = CachingClient(inner, default_ttl=60)
+        client.get(url)
+        client.get(url)
+        assert len(inner.requests) == 2
+
+    @pytest.mark.parametrize("directive", ["no-store", "no-cache"])
+    def test_no_store_and_no_cache_bypass_the_cache(self, directive):
+        headers = {"Cache-Control": f"public, max-age=60, {directive}"}
+        inner = _Client({TRANSACTION_URL: _response(TRANSACTION_URL, {}, 200, headers)})
+        cache = MemoryResponseCache()
+        client = CachingClient(inner, cache, default_ttl=60)
+        for _ in range(3):
+            client.get(TRANSACTION_URL)
+        assert len(inner.requests) == 3
+        assert len(cache) == 0
+
+    def test_max_age_and_default_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "stellar_sdk.client.response_cache.time.monotonic", lambda: now[0]
+        )
+        url = HORIZON_URL + "fee_stats"
+        inner = _Client(
+            {url: _response(url, {}, headers={"Cache-Control": "public, max-age=5"})}
+        )
+        client = CachingClient(inner, default_ttl=60)
+        client.get(url)
+        client.get(HORIZON_URL + "ledgers")
+        now[0] += 5
+        client.get(url)
+        client.get(HORIZON_URL + "ledgers")
+        assert [url for url, _ in inner.requests] == [
+            url,
+            HORIZON_URL + "ledgers",
+            url,
+        ]
+
+    def test_max_content_size(self):
+        inner = _Client()
+        client = CachingClient(inner)
+        response = client.get(TRANSACTION_URL)
+        assert client.get(TRANSACTION_URL, max_content_size=len(response.text)) is (
+            response
+        )
+        client.get(TRANSACTION_URL, max_content_size=1)
+        assert len(inner.requests) == 2
+
+    def test_post_and_stream(self):
+        inner = _Client()
+        with CachingClient(inner) as client:
+            client.post(HORIZON_URL + "transactions", {"tx": "AAAA"})
+            client.post(HORIZON_URL + "transactions", {"tx": "AAAA"})
+            assert next(client.stream(TRANSACTION_URL)) == {"url": TRANSACTION_URL}
+        assert len(inner.requests) == 2
+
+    def test_server(self, horizon_mock):
+        path = f"/transactions/{hf.TRANSACTION_HASH}"
+        horizon_mock.expect(path, json={"hash": hf.TRANSACTION_HASH})
+        horizon_mock.expect("/transactions/" + "0" * 64, json=hf.NOT_FOUND, status=404)
+        with Server(horizon_mock.url, CachingClient(RequestsClient())) as server:
+            for _ in range(3):
+                resp = server.transactions().transaction(hf.TRANSACTION_HASH).call()
+                assert resp == {"hash": hf.TRANSACTION_HASH}
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    server.transactions().transaction("0" * 64).call()
+        assert len(horizon_mock.httpserver.log) == 3
+
+
+class TestMemoryResponseCache:
+    def test_lru(self):
+        cache = MemoryResponseCache(max_entries=2)
+        responses = [_response(HORIZON_URL, {"i": i}) for i in range(3)]
+        cache.set("a", responses[0], None)
+        cache.set("b", responses[1], None)
+        assert cache.get("a") is responses[0]
+        cache.set("c", responses[2], None)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is responses[0]
+        assert cache.get("c") is responses[2]
+        cache.clear()
+        assert cache.get("a") is None
+
+    def test_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "stellar_sdk.client.response_cache.time.monotonic", lambda: now[0]
+        )
+        cache = MemoryResponseCache()
+        response = _response(HORIZON_URL, {})
+        cache.set("a", response, 10)
+        now[0] += 9.5
+        assert cache.get("a") is response
+        now[0] += 0.5
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            MemoryResponseCache(0)
+
+
+class TestSQLiteResponseCache:
+    def test_persistence(self, tmp_path):
+        path = tmp_path / "horizon.sqlite3"
+        response = _response(
+            TRANSACTION_URL, {"hash": hf.TRANSACTION_HASH}, headers={"ETag": '"1"'}
+        )
+        cache = SQLiteResponseCache(path)
+        cache.set("a", response, None)
+        cache.set("a", response, None)
+        cache.close()
+        cache = SQLiteResponseCache(path)
+        assert cache.get("a") == response
+        assert cache.get("b") is None
+        cache.clear()
+        assert cache.get("a") is None
+        cache.close()
+
+    def test_ttl(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "stellar_sdk.client.response_cache.time.time", lambda: now[0]
+        )
+        cache = SQLiteResponseCache(tmp_path / "horizon.sqlite3")
+        response = _response(HORIZON_URL, {})
+        cache.set("a", response, 10)
+        now[0] += 9
+        assert cache.get("a") == response
+        now[0] += 1
+        assert cache.get("a") is None
+        cache.close()
+
+    def test_caching_client(self, tmp_path):
+        inner = _Client()
+        path = tmp_path / "horizon.sqlite3"
+        with CachingClient(inner, SQLiteResponseCache(path)) as client:
+            response = client.get(TRANSACTION_URL)
+        with CachingClient(inner, SQLiteResponseCache(path)) as client:
+            assert client.get(TRANSACTION_URL) == response
+        assert len(inner.requests) == 1
+
+
+@pytest.mark.asyncio
+class TestCachingClientAsync:
+    async def test_get(self):
+        inner = _AsyncClient()
+        async with CachingClientAsync(inner) as client:
+            first = await client.get(TRANSACTION_URL)
+            assert await client.get(TRANSACTION_URL) is first
+            await client.get(HORIZON_URL + "ledgers")
+            await client.get(HORIZON_URL + "ledgers")
+            await client.post(HORIZON_URL + "transactions", {"tx": "AAAA"})
+            assert await anext(client.stream(TRANSACTION_URL)) == {
+                "url": TRANSACTION_URL
+            }
+        assert len(inner.requests) == 4
+
+    async def test_server(self, horizon_mock):
+        horizon_mock.expect("/ledgers/100", json={"sequence": 100})
+        client = CachingClientAsync(AiohttpClient())
+        async with ServerAsync(horizon_mock.url, client) as server:
+            for _ in range(3):
+                resp = await server.ledgers().ledger(100).call()
+                assert resp == {"sequence": 100}
+        assert len(horizon_mock.httpserver.log) == 1
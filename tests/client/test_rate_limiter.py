@@ -0,0 +1,281 @@
+import asyncio
+import threading
+
+import pytest
+
+from stellar_sdk import AiohttpClient, RequestsClient, Server, ServerAsync
+from stellar_sdk.client.rate_limiter import RateLimiter, RequestPriority
+from tests import _horizon_fixtures as hf
+
+
+def _rate_limit(limit, remaining, reset):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the clock and sleep of the rate limiter with a fake clock."""
+    now = [1000.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(
+        "stellar_sdk.client.rate_limiter.time.monotonic", lambda: now[0]
+    )
+    monkeypatch.setattr("stellar_sdk.client.rate_limiter.time.sleep", sleep)
+    return sleeps
+
+
+class TestRateLimiter:
+    def test_unlimited_until_known(self, clock):
+        rate_limiter = RateLimiter()
+        for _ in range(100):
+            rate_limiter.acquire()
+        assert clock == []
+        assert rate_limiter.metrics()["requests"] == 100
+
+    def test_max_rate(self, clock):
+        rate_limiter = RateLimiter(rate=10)
+        for _ in range(11):
+            rate_limiter.acquire()
+        assert sum(clock) == pytest.approx(1.0)
+
+    def test_burst(self, clock):
+        rate_limiter = RateLimiter(rate=10, burst=5)
+        for _ in range(5):
+            rate_limiter.acquire()
+        assert clock == []
+        rate_limiter.acquire()
+        assert sum(clock) == pytest.approx(0.1)
+
+    def test_paces_by_headers(self, clock):
+        rate_limiter = RateLimiter()
+        rate_limiter.update(200, _rate_limit(3600, 100, 11))
+        assert rate_limiter.rate == 10
+        for _ in range(21):
+            rate_limiter.acquire()
+        assert sum(clock) == pytest.approx(2.0)
+        assert rate_limiter.metrics() == {
+            "requests": 21,
+            "throttled": 0,
+            "wait_time": pytest.approx(2.0),
+            "rate": 10,
+            "limit": 3600,
+            "remaining": 79,
+            "reset": pytest.approx(9.0),
+            "waiting": {"submit": 0, "read": 0},
+        }
+
+    def test_max_rate_is_lower_than_headers(self, clock):
+        rate_limiter = RateLimiter(rate=2)
+        rate_limiter.update(200, _rate_limit(3600, 100, 10))
+        assert rate_limiter.rate == 2
+
+    def test_counts_requests_until_reset(self, clock):
+        rate_limiter = RateLimiter()
+        rate_limiter.update(200, _rate_limit(10, 3, 1))
+        # The remaining requests are sent at once in the last second.
+        assert rate_limiter.rate is None
+        for _ in range(3):
+            rate_limiter.acquire()
+        assert clock == []
+        # A stale response does not give back the requests sent since.
+        rate_limiter.update(200, _rate_limit(10, 2, 1))
+        assert rate_limiter.remaining == 0
+        rate_limiter.acquire()
+        assert sum(clock) == pytest.approx(1)
+        assert rate_limiter.remaining == 9
+
+    def test_headers_are_case_insensitive(self):
+        rate_limiter = RateLimiter()
+        rate_limiter.update(
+            200,
+            {
+                "x-ratelimit-limit": "10",
+                "x-ratelimit-remaining": "5",
+                "X-RATELIMIT-RESET": "2",
+            },
+        )
+        assert (rate_limiter.limit, rate_limiter.remaining, rate_limiter.rate) == (
+            10,
+            5,
+            5,
+        )
+
+    def test_invalid_headers_are_ignored(self):
+        rate_limiter = RateLimiter()
+        rate_limiter.update(200, _rate_limit("many", "", 10))
+        assert rate_limiter.metrics()["limit"] is None
+        assert rate_limiter.rate is None
+
+    def test_waits_for_reset_when_none_remain(self, clock):
+        rate_limiter = RateLimiter()
+        rate_limiter.update(200, _rate_limit(3600, 0, 30))
+        rate_limiter.acquire()
+        assert sum(clock) == pytest.approx(30)
+
+    @pytest.mark.parametrize(
+        ("headers", "pause"),
+        [
+            ({"Retry-After": "5"}, 5),
+            (_rate_limit(3600, 0, 12), 12),
+            ({}, 1),
+        ],
+    )
+    def test_throttled(self, clock, headers, pause):
+        rate_limiter = RateLimiter()
+        rate_limiter.update(429, headers)
+        rate_limiter.acquire()
+        assert sum(clock) == pytest.approx(pause)
+        assert rate_limiter.metrics()["throttled"] == 1
+
+    def test_submissions_before_reads(self):
+        rate_limiter = RateLimiter(rate=50)
+        rate_limiter.acquire()
+        order = []
+
+        def acquire(priority):
+            rate_limiter.acquire(priority)
+            order.append(priority)
+
+        threads = [
+            threading.Thread(target=acquire, args=(RequestPriority.READ,))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        while rate_limiter.metrics()["waiting"]["read"] < 3:
+            pass
+        threads.append(threading.Thread(target=acquire, args=(RequestPriority.SUBMIT,)))
+        threads[-1].start()
+        for thread in threads:
+            thread.join()
+        assert order[0] == RequestPriority.SUBMIT or order[:2] == [
+            RequestPriority.READ,
+            RequestPriority.SUBMIT,
+        ]
+        assert rate_limiter.metrics()["waiting"] == {"submit": 0, "read": 0}
+
+    @pytest.mark.asyncio
+    async def test_acquire_async(self):
+        rate_limiter = RateLimiter(rate=100)
+        order = []
+
+        async def acquire(priority):
+            await rate_limiter.acquire_async(priority)
+            order.append(priority)
+
+        await rate_limiter.acquire_async()
+        await asyncio.gather(
+            *(acquire(RequestPriority.READ) for _ in range(3)),
+            acquire(RequestPriority.SUBMIT),
+        )
+        assert order == [RequestPriority.SUBMIT] + [RequestPriority.READ] * 3
+        metrics = rate_limiter.metrics()
+        assert metrics["requests"] == 5
+        assert metrics["wait_time"] > 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"rate": 0}, "rate must be positive"),
+            ({"burst": 0}, "burst must be positive"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            RateLimiter(**kwargs)
+
+
+def _expect_rate_limited(horizon_mock, path, remaining, reset):
+    horizon_mock.httpserver.expect_request(path).respond_with_json(
+        hf.account("GA"), headers=_rate_limit(3600, remaining, reset)
+    )
+
+
+class TestRateLimitedClients:
+    def test_requests_client(self, horizon_mock):
+        _expect_rate_limited(horizon_mock, "/accounts/GA", 3599, 3600)
+        rate_limiter = RateLimiter()
+        client = RequestsClient(rate_limiter=rate_limiter)
+        with Server(horizon_mock.url, client) as server:
+            server.accounts().account_id("GA").call()
+            server.accounts().account_id("GA").call()
+        metrics = rate_limiter.metrics()
+        assert (metrics["requests"], metrics["limit"], metrics["remaining"]) == (
+            2,
+            3600,
+            3598,
+        )
+        assert metrics["rate"] == pytest.approx(3598 / 3599)
+
+    def test_requests_client_post(self, horizon_mock):
+        horizon_mock.httpserver.expect_request(
+            "/transactions", method="POST"
+        ).respond_with_json(
+            hf.BAD_REQUEST, status=400, headers=_rate_limit(3600, 10, 60)
+        )
+        rate_limiter = RateLimiter()
+        with RequestsClient(rate_limiter=rate_limiter) as client:
+            resp = client.post(horizon_mock.url + "transactions", {"tx": "AAAA"})
+        assert resp.status_code == 400
+        assert rate_limiter.remaining == 10
+
+    def test_requests_client_retries_throttled(self, horizon_mock):
+        horizon_mock.httpserver.expect_oneshot_request(
+            "/accounts/GA"
+        ).respond_with_json(hf.BAD_REQUEST, status=429, headers={"Retry-After": "0.1"})
+        _expect_rate_limited(horizon_mock, "/accounts/GA", 100, 60)
+        rate_limiter = RateLimiter()
+        client = RequestsClient(rate_limiter=rate_limiter)
+        assert 429 not in client.status_forcelist
+        with Server(horizon_mock.url, client) as server:
+            account = server.accounts().account_id("GA").call()
+        assert account == hf.account("GA")
+        assert len(horizon_mock.httpserver.log) == 2
+        metrics = rate_limiter.metrics()
+        assert (metrics["requests"], metrics["throttled"]) == (2, 1)
+        assert metrics["wait_time"] >= 0.1
+
+    def test_requests_client_gives_up(self, horizon_mock):
+        horizon_mock.httpserver.expect_request(
+            "/transactions", method="POST"
+        ).respond_with_json(hf.BAD_REQUEST, status=429, headers={"Retry-After": "0"})
+        with RequestsClient(num_retries=2, rate_limiter=RateLimiter()) as client:
+            resp = client.post(horizon_mock.url + "transactions", {"tx": "AAAA"})
+        assert resp.status_code == 429
+        assert len(horizon_mock.httpserver.log) == 3
+
+    @pytest.mark.asyncio
+    async def test_aiohttp_client_retries_throttled(self, horizon_mock):
+        horizon_mock.httpserver.expect_oneshot_request(
+            "/accounts/GA"
+        ).respond_with_json(hf.BAD_REQUEST, status=429, headers={"Retry-After": "0.1"})
+        _expect_rate_limited(horizon_mock, "/accounts/GA", 100, 60)
+        rate_limiter = RateLimiter()
+        client = AiohttpClient(rate_limiter=rate_limiter)
+        async with ServerAsync(horizon_mock.url, client) as server:
+            account = await server.accounts().account_id("GA").call()
+        assert account == hf.account("GA")
+        assert len(horizon_mock.httpserver.log) == 2
+        metrics = rate_limiter.metrics()
+        assert (metrics["requests"], metrics["throttled"]) == (2, 1)
+        assert metrics["wait_time"] >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_aiohttp_client_gives_up(self, horizon_mock):
+        horizon_mock.httpserver.expect_request(
+            "/transactions", method="POST"
+        ).respond_with_json(hf.BAD_REQUEST, status=429, headers={"Retry-After": "0"})
+        client = AiohttpClient(rate_limiter=RateLimiter())
+        resp = await client.post(horizon_mock.url + "transactions", {"tx": "AAAA"})
+        await client.close()
+        assert resp.status_code == 429
+        assert len(horizon_mock.httpserver.log) == 4
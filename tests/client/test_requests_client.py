@@ -1,14 +1,40 @@
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests_mock as requests_mock_lib
 from requests import RequestException
+from werkzeug.wrappers import Response
 
 from stellar_sdk.client.requests_client import USER_AGENT, RequestsClient
 from stellar_sdk.exceptions import ConnectionError, ContentSizeLimitExceededError
 from tests import _horizon_fixtures as hf
 
 
+def _slow_accounts(horizon_mock, delay=0.2):
+    """Serve the accounts after a delay, and count the requests by path."""
+    requests = {}
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            requests[request.full_path] = requests.get(request.full_path, 0) + 1
+        time.sleep(delay)
+        return Response(
+            json.dumps(hf.account(request.path.rsplit("/", 1)[1])),
+            content_type="application/json",
+        )
+
+    horizon_mock.httpserver.expect_request(
+        re.compile("/accounts/.*")
+    ).respond_with_handler(handler)
+    return requests
+
+
 class TestRequestsClient:
     def test_get(self, httpbin_url):
         client = RequestsClient()
@@ -121,3 +147,66 @@ class TestRequestsClient:
                 mock_get.return_value = mock_resp
                 with pytest.raises(ConnectionError):
                     client.get(url, max_content_size=1024)
+
+
+class TestRequestsClientCoalesce:
+    def _get_concurrently(self, client, urls):
+        with ThreadPoolExecutor(len(urls)) as executor:
+            return list(executor.map(client.get, urls))
+
+    def test_identical_gets_share_a_request(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock)
+        url = horizon_mock.url + "accounts/GA"
+        with RequestsClient(coalesce=True) as client:
+            responses = self._get_concurrently(client, [url] * 8)
+            assert all(resp is responses[0] for resp in responses)
+            assert responses[0].json() == hf.account("GA")
+            # Once the request has landed, the next one is sent.
+            client.get(url)
+        assert list(requests.values()) == [2]
+
+    def test_params_are_part_of_the_key(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock)
+        url = horizon_mock.url + "accounts/GA"
+        with RequestsClient(coalesce=True) as client, ThreadPoolExecutor(4) as executor:
+            for params in [None, {"a": "1"}, None, {"a": "1"}]:
+                executor.submit(client.get, url, params)
+        assert requests == {"/accounts/GA?": 1, "/accounts/GA?a=1": 1}
+
+    def test_exclude(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock, delay=0.05)
+        urls = [horizon_mock.url + "accounts/GA", horizon_mock.url + "accounts/GB"]
+        with RequestsClient(coalesce=True, coalesce_exclude=["/GB$"]) as client:
+            self._get_concurrently(client, urls * 3)
+        assert requests == {"/accounts/GA?": 1, "/accounts/GB?": 3}
+
+    def test_disabled_by_default(self, horizon_mock):
+        requests = _slow_accounts(horizon_mock, delay=0.05)
+        url = horizon_mock.url + "accounts/GA"
+        with RequestsClient() as client:
+            self._get_concurrently(client, [url] * 3)
+        assert requests == {"/accounts/GA?": 3}
+
+    def test_error_is_shared(self):
+        client = RequestsClient(coalesce=True)
+        started = threading.Event()
+        calls = []
+
+        def get(*args, **kwargs):
+            calls.append(args)
+            started.set()
+            time.sleep(0.2)
+            raise RequestException("connection reset")
+
+        with patch.object(client._session, "get", side_effect=get):
+            with ThreadPoolExecutor(4) as executor:
+                futures = [executor.submit(client.get, "https://example.com/")]
+                started.wait()
+                futures += [
+                    executor.submit(client.get, "https://example.com/")
+                    for _ in range(3)
+                ]
+            for future in futures:
+                assert isinstance(future.exception(), ConnectionError)
+        assert len(calls) == 1
+        assert client._coalescer._flights == {}
@@ -1,6 +1,10 @@
 import pytest
 
 from stellar_sdk import Operation
+from stellar_sdk import xdr as stellar_xdr
+from stellar_sdk.operation import ManageData
+
+SOURCE = "GA7QYNF7SOWQ3GLR2BGMZEHXAVIRZA4KVWLTJJFC7MGXUA74P7UJVSGZ"
 
 
 class TestOperation:
@@ -51,3 +55,19 @@ class TestOperation:
     )
     def test_from_xdr_amount(self, origin_amount, expect_value):
         assert Operation.from_xdr_amount(origin_amount) == expect_value
+
+    def test_from_xdr_object_dispatches_on_type(self):
+        for operation_type in stellar_xdr.OperationType:
+            sub_cls = Operation._OPERATION_CLASSES[operation_type]
+            assert operation_type == sub_cls._XDR_OPERATION_TYPE
+            assert sub_cls in Operation.__subclasses__()
+        op = ManageData("name", b"value", source=SOURCE)
+        restored = Operation.from_xdr_object(op.to_xdr_object())
+        assert isinstance(restored, ManageData)
+        assert restored == op
+
+    def test_from_xdr_object_not_implemented(self):
+        xdr_object = ManageData("name", b"value").to_xdr_object()
+        xdr_object.body.type = 1000
+        with pytest.raises(NotImplementedError, match="type=1000 is not implemented"):
+            Operation.from_xdr_object(xdr_object)
@@ -0,0 +1,334 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from werkzeug.wrappers import Response
+
+from stellar_sdk import (
+    AiohttpClient,
+    Asset,
+    ChannelAccount,
+    ChannelPool,
+    ChannelPoolAsync,
+    FeeBumpTransactionEnvelope,
+    Keypair,
+    Network,
+    Server,
+    ServerAsync,
+    TransactionBuilder,
+    TransactionEnvelope,
+)
+from stellar_sdk.exceptions import BadRequestError
+from tests import _horizon_fixtures as hf
+
+NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
+CHANNELS = [Keypair.from_raw_ed25519_seed(bytes([i]) * 32) for i in (1, 2)]
+FUNDER = Keypair.from_secret("SBFZCHU5645DOKRWYBXVOXY2ELGJKFRX6VGGPRYUWHQ7PMXXJNDZFMKD")
+DESTINATION = "GDV6FVHPY4JH7EEBSJYPQQYZA3OC6TKTM2TAXRHWT4EEL7BJ2BTDQT5D"
+
+
+class _Horizon:
+    """Serve the channel accounts, and reply to the submitted transactions
+    with the given failures before accepting them."""
+
+    def __init__(self, horizon_mock, failures=()):
+        self.loads = {channel.public_key: 0 for channel in CHANNELS}
+        self.submitted: list[str] = []
+        self._failures = list(failures)
+        self._lock = threading.Lock()
+        for channel in CHANNELS:
+            horizon_mock.httpserver.expect_request(
+                f"/accounts/{channel.public_key}"
+            ).respond_with_handler(self._account)
+        horizon_mock.httpserver.expect_request(
+            "/transactions", method="POST"
+        ).respond_with_handler(self._submit)
+
+    def _account(self, request):
+        account_id = request.path.rsplit("/", 1)[1]
+        with self._lock:
+            self.loads[account_id] += 1
+        return Response(
+            json.dumps(hf.account(account_id)), content_type="application/json"
+        )
+
+    def _submit(self, request):
+        xdr = request.form["tx"]
+        with self._lock:
+            self.submitted.append(xdr)
+            failure = self._failures.pop(0) if self._failures else None
+        if failure is not None:
+            return Response(
+                json.dumps(failure), status=400, content_type="application/json"
+            )
+        return Response(
+            json.dumps(hf.submit_transaction(xdr)), content_type="application/json"
+        )
+
+
+def _build(channel):
+    return (
+        TransactionBuilder(channel.account, NETWORK_PASSPHRASE, base_fee=100)
+        .append_payment_op(DESTINATION, Asset.native(), "10", source=FUNDER.public_key)
+        .set_timeout(30)
+        .build()
+    )
+
+
+async def _build_async(channel):
+    return _build(channel)
+
+
+class TestChannelPool:
+    def test_submit_transaction(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            resp = pool.submit_transaction(_build, [FUNDER], True)
+        te = TransactionEnvelope.from_xdr(resp["envelope_xdr"], NETWORK_PASSPHRASE)
+        assert te.transaction.source.account_id == CHANNELS[0].public_key
+        assert te.transaction.sequence == 123456790
+        assert [sig.signature_hint for sig in te.signatures] == [
+            FUNDER.signature_hint(),
+            CHANNELS[0].signature_hint(),
+        ]
+        for kp, sig in zip([FUNDER, CHANNELS[0]], te.signatures, strict=True):
+            kp.verify(te.hash(), sig.signature)
+        assert horizon.submitted == [resp["envelope_xdr"]]
+
+    def test_submit_transaction_with_fee_source(self, horizon_mock):
+        _Horizon(horizon_mock)
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(
+                server,
+                CHANNELS[:1],
+                NETWORK_PASSPHRASE,
+                fee_source=FUNDER,
+                base_fee=200,
+            )
+            resp = pool.submit_transaction(_build, skip_memo_required_check=True)
+        te = FeeBumpTransactionEnvelope.from_xdr(
+            resp["envelope_xdr"], NETWORK_PASSPHRASE
+        )
+        assert te.transaction.fee_source.account_id == FUNDER.public_key
+        assert te.transaction.fee == 400
+        FUNDER.verify(te.hash(), te.signatures[0].signature)
+        inner = te.transaction.inner_transaction_envelope
+        assert inner.transaction.source.account_id == CHANNELS[0].public_key
+        CHANNELS[0].verify(inner.hash(), inner.signatures[0].signature)
+
+    def test_sequence_is_tracked_locally(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            sequences = [
+                TransactionEnvelope.from_xdr(
+                    pool.submit_transaction(_build, [FUNDER], True)["envelope_xdr"],
+                    NETWORK_PASSPHRASE,
+                ).transaction.sequence
+                for _ in range(3)
+            ]
+        assert sequences == [123456790, 123456791, 123456792]
+        assert horizon.loads[CHANNELS[0].public_key] == 1
+
+    def test_bad_sequence_resyncs_and_retries(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock,
+            [
+                hf.transaction_failed(
+                    transaction="tx_fee_bump_inner_failed",
+                    inner_transaction="tx_bad_seq",
+                )
+            ],
+        )
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(
+                server, CHANNELS[:1], NETWORK_PASSPHRASE, fee_source=FUNDER
+            )
+            resp = pool.submit_transaction(_build, [FUNDER], True)
+        assert len(horizon.submitted) == 2
+        assert horizon.submitted[1] == resp["envelope_xdr"]
+        assert horizon.loads[CHANNELS[0].public_key] == 2
+        te = FeeBumpTransactionEnvelope.from_xdr(
+            resp["envelope_xdr"], NETWORK_PASSPHRASE
+        )
+        assert te.transaction.inner_transaction_envelope.transaction.sequence == (
+            123456790
+        )
+
+    def test_bad_sequence_retry_signs_with_generator_signers(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock, [hf.transaction_failed(transaction="tx_bad_seq")]
+        )
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            resp = pool.submit_transaction(
+                _build, (signer for signer in [FUNDER]), True
+            )
+        assert len(horizon.submitted) == 2
+        te = TransactionEnvelope.from_xdr(resp["envelope_xdr"], NETWORK_PASSPHRASE)
+        assert [sig.signature_hint for sig in te.signatures] == [
+            FUNDER.signature_hint(),
+            CHANNELS[0].signature_hint(),
+        ]
+
+    def test_bad_sequence_max_attempts(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock, [hf.transaction_failed(transaction="tx_bad_seq")] * 2
+        )
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            with pytest.raises(BadRequestError):
+                pool.submit_transaction(_build, [FUNDER], True, max_attempts=2)
+        assert len(horizon.submitted) == 2
+        assert pool.available == 1
+
+    def test_other_failure_is_not_retried(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock, [hf.transaction_failed(transaction="tx_failed")]
+        )
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            with pytest.raises(BadRequestError) as exc_info:
+                pool.submit_transaction(_build, [FUNDER], True)
+            assert exc_info.value.extras["result_codes"]["transaction"] == "tx_failed"
+            # The failed lease leaves the sequence number unknown.
+            pool.submit_transaction(_build, [FUNDER], True)
+        assert len(horizon.submitted) == 2
+        assert horizon.loads[CHANNELS[0].public_key] == 2
+
+    def test_lease(self, horizon_mock):
+        _Horizon(horizon_mock)
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS, NETWORK_PASSPHRASE)
+            assert len(pool) == pool.available == 2
+            with pool.lease() as first, pool.lease() as second:
+                assert pool.available == 0
+                assert {first.keypair, second.keypair} == set(CHANNELS)
+                assert first.account.sequence == 123456789
+                with pytest.raises(TimeoutError), pool.lease(timeout=0.01):
+                    pass
+            assert pool.available == 2
+
+    def test_lease_error_resyncs(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        with Server(horizon_mock.url) as server:
+            pool = ChannelPool(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+
+            def fail():
+                with pool.lease() as channel:
+                    channel.account.increment_sequence_number()
+                    raise RuntimeError("submission timed out")
+
+            with pytest.raises(RuntimeError):
+                fail()
+            with pool.lease() as channel:
+                assert channel.account.sequence == 123456789
+        assert horizon.loads[CHANNELS[0].public_key] == 2
+
+    def test_channels_from_secrets(self):
+        pool = ChannelPool(
+            Server(),
+            [kp.secret for kp in CHANNELS],
+            NETWORK_PASSPHRASE,
+            fee_source=FUNDER.secret,
+        )
+        assert [c.keypair for c in pool._channels] == CHANNELS
+        assert pool.fee_source == FUNDER
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="At least one channel account"):
+            ChannelPool(Server(), [], NETWORK_PASSPHRASE)
+        pool = ChannelPool(Server(), CHANNELS, NETWORK_PASSPHRASE)
+        with pytest.raises(ValueError, match="max_attempts must be positive"):
+            pool.submit_transaction(_build, max_attempts=0)
+
+    def test_channel_account_not_leased(self):
+        channel = ChannelAccount(CHANNELS[0])
+        with pytest.raises(ValueError, match="not leased"):
+            channel.account  # noqa: B018
+
+
+@pytest.mark.asyncio
+class TestChannelPoolAsync:
+    async def test_submit_transaction_concurrently(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            pool = ChannelPoolAsync(
+                server, CHANNELS, NETWORK_PASSPHRASE, fee_source=FUNDER
+            )
+            resps = await asyncio.gather(
+                *(
+                    pool.submit_transaction(_build_async, [FUNDER], True)
+                    for _ in range(6)
+                )
+            )
+            assert pool.available == 2
+        inner = [
+            FeeBumpTransactionEnvelope.from_xdr(
+                resp["envelope_xdr"], NETWORK_PASSPHRASE
+            ).transaction.inner_transaction_envelope.transaction
+            for resp in resps
+        ]
+        assert sorted((tx.source.account_id, tx.sequence) for tx in inner) == sorted(
+            (channel.public_key, sequence)
+            for channel in CHANNELS
+            for sequence in (123456790, 123456791, 123456792)
+        )
+        assert horizon.loads == {channel.public_key: 1 for channel in CHANNELS}
+
+    async def test_bad_sequence_resyncs_and_retries(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock, [hf.transaction_failed(transaction="tx_bad_seq")]
+        )
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            pool = ChannelPoolAsync(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            resp = await pool.submit_transaction(_build, [FUNDER], True)
+        assert len(horizon.submitted) == 2
+        assert horizon.submitted[1] == resp["envelope_xdr"]
+        assert horizon.loads[CHANNELS[0].public_key] == 2
+
+    async def test_bad_sequence_retry_signs_with_generator_signers(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock, [hf.transaction_failed(transaction="tx_bad_seq")]
+        )
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            pool = ChannelPoolAsync(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            resp = await pool.submit_transaction(
+                _build, (signer for signer in [FUNDER.secret]), True
+            )
+        assert len(horizon.submitted) == 2
+        te = TransactionEnvelope.from_xdr(resp["envelope_xdr"], NETWORK_PASSPHRASE)
+        assert [sig.signature_hint for sig in te.signatures] == [
+            FUNDER.signature_hint(),
+            CHANNELS[0].signature_hint(),
+        ]
+
+    async def test_other_failure_is_not_retried(self, horizon_mock):
+        horizon = _Horizon(
+            horizon_mock, [hf.transaction_failed(transaction="tx_failed")]
+        )
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            pool = ChannelPoolAsync(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            with pytest.raises(BadRequestError):
+                await pool.submit_transaction(_build, [FUNDER], True)
+        assert len(horizon.submitted) == 1
+
+    async def test_lease(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            pool = ChannelPoolAsync(server, CHANNELS[:1], NETWORK_PASSPHRASE)
+            async with pool.lease() as channel:
+                assert channel.keypair == CHANNELS[0]
+                assert pool.available == 0
+                with pytest.raises(TimeoutError):
+                    async with pool.lease(timeout=0.01):
+                        pass
+            with pytest.raises(RuntimeError):
+                async with pool.lease():
+                    raise RuntimeError("submission timed out")
+            async with pool.lease():
+                pass
+            assert pool.available == 1
+        assert horizon.loads[CHANNELS[0].public_key] == 2
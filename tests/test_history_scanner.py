@@ -0,0 +1,209 @@
+import json
+import threading
+
+import pytest
+from werkzeug.wrappers import Response
+
+from stellar_sdk import (
+    AiohttpClient,
+    HistoryScanner,
+    HistoryScannerAsync,
+    Server,
+    ServerAsync,
+)
+from stellar_sdk.exceptions import BadRequestError
+from stellar_sdk.sep.toid import TOID
+from tests import _horizon_fixtures as hf
+
+OPERATION_IDS = [
+    TOID(ledger, transaction, operation).to_int64()
+    for ledger in range(10, 30)
+    for transaction, operation in [(1, 1), (1, 2), (2, 1)]
+]
+
+
+def _key(paging_token):
+    operation_id, _, index = paging_token.partition("-")
+    return int(operation_id), int(index or 0)
+
+
+class _Horizon:
+    """Serve the operations and the effects of ``OPERATION_IDS``, two effects
+    for each operation, in ascending order."""
+
+    def __init__(self, horizon_mock, fail_after=None):
+        self.url = horizon_mock.url
+        self.requests = 0
+        self._fail_after = fail_after
+        self._lock = threading.Lock()
+        for path in ("/operations", "/effects"):
+            horizon_mock.httpserver.expect_request(path).respond_with_handler(
+                self._page
+            )
+
+    def _page(self, request):
+        with self._lock:
+            self.requests += 1
+        if request.path == "/operations":
+            paging_tokens = [str(operation_id) for operation_id in OPERATION_IDS]
+        else:
+            paging_tokens = [
+                f"{operation_id}-{index}"
+                for operation_id in OPERATION_IDS
+                for index in (1, 2)
+            ]
+        cursor = request.args.get("cursor", "0")
+        limit = int(request.args["limit"])
+        assert request.args["order"] == "asc"
+        if self._fail_after is not None and _key(cursor)[0] >= self._fail_after:
+            return Response(
+                json.dumps(hf.BAD_REQUEST), status=400, content_type="application/json"
+            )
+        page = [token for token in paging_tokens if _key(token) > _key(cursor)]
+        page = page[:limit]
+        next_cursor = page[-1] if page else cursor
+        body = {
+            "_links": {
+                "next": {
+                    "href": f"{self.url}{request.path[1:]}"
+                    f"?cursor={next_cursor}&limit={limit}&order=asc"
+                }
+            },
+            "_embedded": {
+                "records": [{"id": token, "paging_token": token} for token in page]
+            },
+        }
+        return Response(json.dumps(body), content_type="application/json")
+
+
+def _operation_ids(start_ledger, end_ledger):
+    return [
+        str(operation_id)
+        for operation_id in OPERATION_IDS
+        if start_ledger <= TOID.from_int64(operation_id).ledger_sequence <= end_ledger
+    ]
+
+
+class TestHistoryScanner:
+    @pytest.mark.parametrize("shards", [1, 3, 8])
+    def test_scan(self, horizon_mock, shards):
+        _Horizon(horizon_mock)
+        scanner = HistoryScanner(12, 25, shards=shards, limit=4)
+        with Server(horizon_mock.url) as server:
+            records = list(scanner.scan(server.operations()))
+        assert [record["id"] for record in records] == _operation_ids(12, 25)
+
+    def test_scan_unordered(self, horizon_mock):
+        _Horizon(horizon_mock)
+        scanner = HistoryScanner(1, 40, shards=4, workers=2, limit=5, buffer=1)
+        with Server(horizon_mock.url) as server:
+            records = list(scanner.scan(server.operations(), ordered=False))
+        assert sorted((record["id"] for record in records), key=int) == (
+            _operation_ids(1, 40)
+        )
+
+    def test_scan_effects(self, horizon_mock):
+        _Horizon(horizon_mock)
+        scanner = HistoryScanner(15, 16, shards=2, limit=3)
+        with Server(horizon_mock.url) as server:
+            records = list(scanner.scan(server.effects()))
+        assert [record["id"] for record in records] == [
+            f"{operation_id}-{index}"
+            for operation_id in _operation_ids(15, 16)
+            for index in (1, 2)
+        ]
+
+    def test_scan_keeps_call_builder(self, horizon_mock):
+        _Horizon(horizon_mock)
+        scanner = HistoryScanner(10, 11, shards=2)
+        with Server(horizon_mock.url) as server:
+            call_builder = server.operations().include_failed(True).limit(1)
+            list(scanner.scan(call_builder))
+        assert call_builder.params == {"include_failed": "true", "limit": "1"}
+        assert all(
+            request.args["include_failed"] == "true"
+            for request, _ in horizon_mock.httpserver.log
+        )
+
+    def test_scan_raise(self, horizon_mock):
+        _Horizon(horizon_mock, fail_after=TOID(20, 0, 0).to_int64())
+        scanner = HistoryScanner(10, 29, shards=2, limit=4)
+        with Server(horizon_mock.url) as server:
+            records = scanner.scan(server.operations())
+            for _ in _operation_ids(10, 19):
+                next(records)
+            with pytest.raises(BadRequestError):
+                next(records)
+
+    def test_close(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        scanner = HistoryScanner(10, 29, shards=2, limit=1, buffer=1)
+        with Server(horizon_mock.url) as server:
+            records = scanner.scan(server.operations())
+            next(records)
+            records.close()
+        # Each range stops after the pages filling its buffer.
+        assert horizon.requests <= 6
+
+    def test_ranges(self):
+        scanner = HistoryScanner(1, 10, shards=3)
+        assert scanner.ranges == [
+            (0, TOID(4, 0, 0).to_int64()),
+            (TOID(4, 0, 0).to_int64(), TOID(7, 0, 0).to_int64()),
+            (TOID(7, 0, 0).to_int64(), TOID(11, 0, 0).to_int64()),
+        ]
+        assert scanner.workers == 3
+        assert len(HistoryScanner(5, 6, shards=8).ranges) == 2
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="`start` must be less than"):
+            HistoryScanner(10, 9)
+        with pytest.raises(ValueError, match="shards must be positive"):
+            HistoryScanner(1, 10, shards=0)
+        with pytest.raises(ValueError, match="workers must be positive"):
+            HistoryScanner(1, 10, workers=0)
+        with pytest.raises(ValueError, match="buffer must be positive"):
+            HistoryScanner(1, 10, buffer=0)
+
+
+@pytest.mark.asyncio
+class TestHistoryScannerAsync:
+    @pytest.mark.parametrize("shards", [1, 3, 8])
+    async def test_scan(self, horizon_mock, shards):
+        _Horizon(horizon_mock)
+        scanner = HistoryScannerAsync(12, 25, shards=shards, workers=2, limit=4)
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            records = [record async for record in scanner.scan(server.operations())]
+        assert [record["id"] for record in records] == _operation_ids(12, 25)
+
+    async def test_scan_unordered(self, horizon_mock):
+        _Horizon(horizon_mock)
+        scanner = HistoryScannerAsync(1, 40, shards=4, limit=5, buffer=1)
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            records = [
+                record async for record in scanner.scan(server.effects(), ordered=False)
+            ]
+        assert sorted(record["id"] for record in records) == sorted(
+            f"{operation_id}-{index}"
+            for operation_id in _operation_ids(1, 40)
+            for index in (1, 2)
+        )
+
+    async def test_scan_raise(self, horizon_mock):
+        _Horizon(horizon_mock, fail_after=TOID(20, 0, 0).to_int64())
+        scanner = HistoryScannerAsync(10, 29, shards=2, limit=4)
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            records = scanner.scan(server.operations())
+            for _ in _operation_ids(10, 19):
+                await anext(records)
+            with pytest.raises(BadRequestError):
+                await anext(records)
+
+    async def test_close(self, horizon_mock):
+        horizon = _Horizon(horizon_mock)
+        scanner = HistoryScannerAsync(10, 29, shards=2, limit=1, buffer=1)
+        async with ServerAsync(horizon_mock.url, AiohttpClient()) as server:
+            records = scanner.scan(server.operations())
+            await anext(records)
+            await records.aclose()
+        assert horizon.requests <= 6
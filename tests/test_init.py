@@ -0,0 +1,51 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import stellar_sdk
+
+
+class TestLazyImports:
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, stellar_sdk; "
+            "assert 'stellar_sdk.server' not in sys.modules; "
+            "assert 'stellar_sdk.soroban_rpc' not in sys.modules; "
+            "assert 'requests' not in sys.modules; "
+            "assert 'aiohttp' not in sys.modules; "
+            "stellar_sdk.Server; "
+            "assert 'stellar_sdk.server' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize(
+        ("name", "module"),
+        [
+            ("Server", "stellar_sdk.server"),
+            ("SorobanServer", "stellar_sdk.soroban_server"),
+            ("Durability", "stellar_sdk.soroban_server"),
+            ("RequestsClient", "stellar_sdk.client.requests_client"),
+            ("ServerAsync", "stellar_sdk.server_async"),
+            ("SorobanServerAsync", "stellar_sdk.soroban_server_async"),
+            ("AiohttpClient", "stellar_sdk.client.aiohttp_client"),
+        ],
+    )
+    def test_lazy_names(self, name, module):
+        value = getattr(stellar_sdk, name)
+        assert value is getattr(importlib.import_module(module), name)
+        assert name in dir(stellar_sdk)
+        assert name in stellar_sdk.__all__
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="NotAnSdkName"):
+            _ = stellar_sdk.NotAnSdkName
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from stellar_sdk import *", namespace)
+        assert namespace["Server"] is stellar_sdk.Server
+        assert namespace["Keypair"] is stellar_sdk.Keypair
+        assert namespace["scval"] is stellar_sdk.scval
+        assert "TYPE_CHECKING" not in namespace
@@ -77,6 +77,17 @@ def test_sc_val_to_native(sc_val, native):
     assert to_native(sc_val) == native
 
 
+def test_sc_val_to_native_deeply_nested():
+    value = to_uint32(1)
+    for _ in range(2000):
+        value = to_map({to_symbol("k"): to_vec([value, to_void()])})
+    native = to_native(value)
+    for _ in range(2000):
+        assert native["k"][1] is None
+        native = native["k"][0]
+    assert native == 1
+
+
 def test_address():
     addr = Address("GAHJJJKMOKYE4RVPZEWZTKH5FVI4PA3VL7GK2LFNUBSGBV6OJP7TQSLX")
     scval = to_address(addr)
@@ -10,9 +10,11 @@ from stellar_sdk import (
     InvokeHostFunction,
     Keypair,
     MuxedAccount,
+    Network,
     NoneMemo,
     Preconditions,
     SorobanDataBuilder,
+    TransactionEnvelope,
 )
 from stellar_sdk import xdr as stellar_xdr
 from stellar_sdk.operation import ManageData, Payment
@@ -369,3 +371,100 @@ class TestTransaction:
         assert restore_transaction.sequence == sequence
         assert restore_transaction.soroban_data == soroban_data
         assert restore_transaction == tx
+
+
+class TestLazyTransaction:
+    source = "GA7QYNF7SOWQ3GLR2BGMZEHXAVIRZA4KVWLTJJFC7MGXUA74P7UJVSGZ"
+    destination = "GDV6FVHPY4JH7EEBSJYPQQYZA3OC6TKTM2TAXRHWT4EEL7BJ2BTDQT5D"
+
+    def _transaction(self, v1=True):
+        ops = [
+            Payment(self.destination, Asset.native(), str(i + 1)) for i in range(3)
+        ] + [ManageData("a", "b", source=self.destination)]
+        return Transaction(
+            self.source,
+            1235,
+            400,
+            ops,
+            IdMemo(1),
+            Preconditions(time_bounds=TimeBounds(0, 100)),
+            v1=v1,
+        )
+
+    @pytest.mark.parametrize("v1", [True, False])
+    def test_from_xdr(self, v1):
+        tx = self._transaction(v1)
+        xdr = tx.to_xdr_object().to_xdr()
+        lazy_tx = Transaction.from_xdr(xdr, v1=v1, lazy=True)
+        assert lazy_tx._operation_xdr_objects is not None
+        assert lazy_tx.to_xdr_object().to_xdr() == xdr
+        assert lazy_tx._xdr_bytes() == tx._xdr_bytes()
+        assert lazy_tx == tx
+        assert tx == lazy_tx
+        assert lazy_tx.operations == tx.operations
+        assert tx.operations == lazy_tx.operations
+        assert lazy_tx == Transaction.from_xdr(xdr, v1=v1)
+
+    def test_operations_are_created_on_access(self):
+        tx = self._transaction()
+        lazy_tx = Transaction.from_xdr_object(tx.to_xdr_object(), lazy=True)
+        assert lazy_tx._operation_xdr_objects is not None
+        operations = lazy_tx.operations
+        assert lazy_tx._operation_xdr_objects is None
+        assert type(operations) is list
+        assert operations == tx.operations
+        assert lazy_tx.operations is operations
+
+    def test_memoized_xdr_object_is_reused(self):
+        tx = self._transaction()
+        xdr_object = tx.to_xdr_object()
+        lazy_tx = Transaction.from_xdr_object(xdr_object, lazy=True)
+        assert lazy_tx._xdr_object() is xdr_object
+        assert lazy_tx._xdr_object() is xdr_object
+
+    @pytest.mark.parametrize("v1", [True, False])
+    def test_encoding_matches_eager_parsing_once_operations_are_accessed(self, v1):
+        xdr = self._transaction(v1).to_xdr_object().to_xdr()
+        eager_te = TransactionEnvelope(
+            Transaction.from_xdr(xdr, v1=v1), Network.TESTNET_NETWORK_PASSPHRASE
+        )
+        lazy_te = TransactionEnvelope(
+            Transaction.from_xdr(xdr, v1=v1, lazy=True),
+            Network.TESTNET_NETWORK_PASSPHRASE,
+        )
+        assert lazy_te.transaction.operations == eager_te.transaction.operations
+        assert lazy_te.transaction._operation_xdr_objects is None
+        assert lazy_te.hash() == eager_te.hash()
+        assert lazy_te.to_xdr() == eager_te.to_xdr()
+        lazy_te.transaction.operations[0].amount = "10"
+        eager_te.transaction.operations[0].amount = "10"
+        assert lazy_te.hash() == eager_te.hash()
+        assert lazy_te.to_xdr() == eager_te.to_xdr()
+
+    def test_modify_operations(self):
+        tx = self._transaction()
+        lazy_tx = Transaction.from_xdr_object(tx.to_xdr_object(), lazy=True)
+        lazy_tx.operations[0].amount = "10"
+        tx.operations[0].amount = "10"
+        assert lazy_tx._xdr_bytes() == tx._xdr_bytes()
+        op = ManageData("c", "d")
+        lazy_tx.operations.append(op)
+        tx.operations.append(op)
+        assert lazy_tx._xdr_bytes() == tx._xdr_bytes()
+        del lazy_tx.operations[1]
+        del tx.operations[1]
+        lazy_tx.operations[0] = op
+        tx.operations[0] = op
+        assert lazy_tx.operations == tx.operations
+        assert lazy_tx._xdr_bytes() == tx._xdr_bytes()
+        lazy_tx.fee = 1000
+        tx.fee = 1000
+        assert lazy_tx._xdr_bytes() == tx._xdr_bytes()
+
+    def test_operation_not_implemented_on_access(self):
+        xdr_object = self._transaction().to_xdr_object()
+        xdr_object.operations[2].body.type = 1000
+        lazy_tx = Transaction.from_xdr_object(xdr_object, lazy=True)
+        assert lazy_tx._xdr_object() is xdr_object
+        with pytest.raises(NotImplementedError):
+            lazy_tx.is_soroban_transaction()
@@ -1,8 +1,16 @@
 import binascii
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from stellar_sdk import Preconditions, SignedPayloadSigner, SignerKey
+from stellar_sdk import (
+    FeeBumpTransactionEnvelope,
+    Preconditions,
+    SignedPayloadSigner,
+    SignerKey,
+    TransactionBuilder,
+    sign_envelopes,
+)
 from stellar_sdk.asset import Asset
 from stellar_sdk.exceptions import SignatureExistError
 from stellar_sdk.keypair import Keypair
@@ -263,3 +271,174 @@ class TestTransactionEnvelope:
         assert binascii.hexlify(te.hash()).decode() == te.hash_hex()
         te.sign_extra_signers_payload(signer1)
         assert len(te.signatures) == 0
+
+
+class TestMemoizedXdr:
+    @staticmethod
+    def _envelope(v1: bool = True) -> TransactionEnvelope:
+        source = Keypair.from_secret(
+            "SCCS5ZBI7WVIJ4SW36WGOQQIWJYCL3VOAULSXX3FB57USIO25EDOYQHH"
+        )
+        destination = "GDJJRRMBK4IWLEPJGIE6SXD2LP7REGZODU7WDC3I2D6MR37F4XSHBKX2"
+        ops = [
+            Payment(destination, Asset.native(), "1000.0"),
+            ManageData("hello", "world"),
+        ]
+        cond = Preconditions(time_bounds=TimeBounds(12345, 56789))
+        tx = Transaction(source, 1, 200, ops, IdMemo(100), cond, v1=v1)
+        return TransactionEnvelope(tx, Network.PUBLIC_NETWORK_PASSPHRASE)
+
+    @staticmethod
+    def _rebuilt(te: TransactionEnvelope) -> TransactionEnvelope:
+        tx = Transaction.from_xdr_object(
+            te.transaction.to_xdr_object(), te.transaction.v1
+        )
+        return TransactionEnvelope(tx, te.network_passphrase, te.signatures)
+
+    @pytest.mark.parametrize("v1", [True, False])
+    def test_encodes_transaction_once(self, monkeypatch, v1):
+        te = self._envelope(v1)
+        calls = []
+        build_xdr_object = Transaction._build_xdr_object
+
+        def _build(tx, operations):
+            calls.append(tx)
+            return build_xdr_object(tx, operations)
+
+        monkeypatch.setattr(Transaction, "_build_xdr_object", _build)
+        signers = [Keypair.random() for _ in range(20)]
+        for signer in signers:
+            te.sign(signer)
+        te_xdr = te.to_xdr()
+        assert calls.count(te.transaction) == 1
+        assert te_xdr == te.to_xdr_object().to_xdr()
+        for signer, signature in zip(signers, te.signatures, strict=True):
+            signer.verify(te.hash(), signature.signature)
+
+    def test_attribute_assignment(self):
+        te = self._envelope()
+        te_hash = te.hash()
+        te.transaction.fee = 300
+        assert te.hash() != te_hash
+        assert te.hash() == self._rebuilt(te).hash()
+        assert te.to_xdr() == self._rebuilt(te).to_xdr()
+
+    def test_operation_changes(self):
+        te = self._envelope()
+        hashes = {te.hash()}
+        op = te.transaction.operations[0]
+        assert isinstance(op, Payment)
+        op.amount = "1.5"
+        hashes.add(te.hash())
+        te.transaction.operations.append(ManageData("key", "value"))
+        hashes.add(te.hash())
+        te.transaction.operations[2] = ManageData("key", "other value")
+        hashes.add(te.hash())
+        assert len(hashes) == 4
+        assert te.to_xdr() == self._rebuilt(te).to_xdr()
+
+    def test_to_xdr_object_returns_copy(self):
+        te = self._envelope()
+        te_xdr = te.to_xdr()
+        tx_xdr_object = te.transaction.to_xdr_object()
+        tx_xdr_object.fee.uint32 = 1
+        op_xdr_object = te.transaction.operations[0].to_xdr_object()
+        op_xdr_object.source_account = tx_xdr_object.source_account
+        assert te.to_xdr() == te_xdr
+
+    def test_operation_hash_and_eq(self):
+        op1 = Payment(Keypair.random().public_key, Asset.native(), "10")
+        op2 = Payment(op1.destination, Asset.native(), "10")
+        assert op1 == op2
+        assert hash(op1) == hash(op2)
+        op2.amount = "20"
+        assert op1 != op2
+
+    @pytest.mark.parametrize("v1", [True, False])
+    def test_lazy_from_xdr(self, v1):
+        te = self._envelope(v1)
+        te.sign(Keypair.random())
+        xdr = te.to_xdr()
+        lazy_te = TransactionEnvelope.from_xdr(
+            xdr, Network.PUBLIC_NETWORK_PASSPHRASE, lazy=True
+        )
+        assert lazy_te.to_xdr() == xdr
+        assert lazy_te.hash() == te.hash()
+        assert lazy_te == te
+        assert lazy_te.transaction.operations[1] == te.transaction.operations[1]
+
+    def test_lazy_fee_bump_from_xdr(self):
+        inner = self._envelope()
+        inner.sign(Keypair.random())
+        fee_source = Keypair.random()
+        fee_bump = TransactionBuilder.build_fee_bump_transaction(
+            fee_source.public_key, 200, inner, Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        fee_bump.sign(fee_source)
+        xdr = fee_bump.to_xdr()
+        lazy_fee_bump = FeeBumpTransactionEnvelope.from_xdr(
+            xdr, Network.PUBLIC_NETWORK_PASSPHRASE, lazy=True
+        )
+        lazy_inner = lazy_fee_bump.transaction.inner_transaction_envelope
+        assert lazy_fee_bump.to_xdr() == xdr
+        assert lazy_fee_bump.hash() == fee_bump.hash()
+        assert lazy_inner.transaction.operations == inner.transaction.operations
+
+
+class TestSignMany:
+    @staticmethod
+    def _envelopes(count: int) -> list[TransactionEnvelope]:
+        return [TestMemoizedXdr._envelope() for _ in range(count)]
+
+    def test_sign_many(self):
+        signers = [Keypair.random() for _ in range(5)]
+        te = TestMemoizedXdr._envelope()
+        expected = TestMemoizedXdr._envelope()
+        for signer in signers:
+            expected.sign(signer)
+        te.sign_many([signers[0].secret, *signers[1:]])
+        assert te.signatures == expected.signatures
+
+    def test_sign_many_already_signed(self):
+        signers = [Keypair.random() for _ in range(3)]
+        te = TestMemoizedXdr._envelope()
+        te.sign(signers[1])
+        with pytest.raises(
+            SignatureExistError, match=r"The keypair has already signed."
+        ):
+            te.sign_many(signers)
+        assert len(te.signatures) == 1
+        with pytest.raises(SignatureExistError):
+            te.sign_many([signers[0], signers[0]])
+        assert len(te.signatures) == 1
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_sign_envelopes(self, workers):
+        signers = [Keypair.random() for _ in range(3)]
+        envelopes = self._envelopes(5)
+        envelopes[2].transaction.sequence = 3
+        sign_envelopes(envelopes, signers, workers=workers, chunk_size=2)
+        for te in envelopes:
+            expected = TransactionEnvelope(te.transaction, te.network_passphrase)
+            expected.sign_many(signers)
+            assert te.signatures == expected.signatures
+        assert envelopes[2].signatures != envelopes[0].signatures
+
+    def test_sign_envelopes_executor(self):
+        signer = Keypair.random()
+        inner = TestMemoizedXdr._envelope()
+        inner.sign(signer)
+        fee_bump = TransactionBuilder.build_fee_bump_transaction(
+            signer, 200, inner, Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        envelopes = [inner, fee_bump]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(SignatureExistError):
+                sign_envelopes(envelopes, [signer], executor=executor)
+            sign_envelopes(envelopes[1:], [signer], executor=executor)
+        assert isinstance(fee_bump, FeeBumpTransactionEnvelope)
+        signer.verify(fee_bump.hash(), fee_bump.signatures[0].signature)
+
+    def test_sign_envelopes_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            sign_envelopes([], [Keypair.random()], chunk_size=0)
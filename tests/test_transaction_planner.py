@@ -0,0 +1,209 @@
+import contextlib
+import itertools
+import warnings
+
+import pytest
+
+from stellar_sdk import (
+    Account,
+    Asset,
+    Keypair,
+    Network,
+    TextMemo,
+    TransactionPlanner,
+)
+from stellar_sdk.operation import (
+    ChangeTrust,
+    CreateAccount,
+    ManageData,
+    Payment,
+    RestoreFootprint,
+)
+
+NETWORK_PASSPHRASE = Network.TESTNET_NETWORK_PASSPHRASE
+SOURCE = Keypair.from_raw_ed25519_seed(bytes([1]) * 32)
+ISSUER = Keypair.from_raw_ed25519_seed(bytes([2]) * 32)
+USERS = [Keypair.from_raw_ed25519_seed(bytes([3 + i]) * 32) for i in range(3)]
+ASSET = Asset("USD", ISSUER.public_key)
+
+
+def _payments(count):
+    for i in range(count):
+        yield Payment(USERS[i % len(USERS)].public_key, ASSET, "1")
+
+
+def _size(transaction_envelope):
+    return len(transaction_envelope.to_xdr_object().to_xdr_bytes())
+
+
+class TestTransactionPlanner:
+    def test_build(self):
+        account = Account(SOURCE.public_key, 100)
+        planner = TransactionPlanner(
+            account, NETWORK_PASSPHRASE, base_fee=200, signers=[SOURCE], timeout=60
+        )
+        envelopes = list(planner.build(_payments(250)))
+        assert [len(te.transaction.operations) for te in envelopes] == [100, 100, 50]
+        assert [te.transaction.sequence for te in envelopes] == [101, 102, 103]
+        assert [te.transaction.fee for te in envelopes] == [20000, 20000, 10000]
+        assert account.sequence == 103
+        for te in envelopes:
+            assert te.transaction.preconditions.time_bounds.max_time > 0
+            assert len(te.signatures) == 1
+            SOURCE.verify(te.hash(), te.signatures[0].signature)
+
+    def test_build_is_lazy(self):
+        account = Account(SOURCE.public_key, 100)
+        planner = TransactionPlanner(account, NETWORK_PASSPHRASE, timeout=60)
+        operations = _payments(10**9)
+        envelopes = planner.build(operations)
+        assert len(next(envelopes).transaction.operations) == 100
+        assert len(next(envelopes).transaction.operations) == 100
+        assert account.sequence == 102
+        # Only the operations of the built transactions and the next one have
+        # been read.
+        assert next(operations).destination.account_id == USERS[201 % 3].public_key
+
+    def test_operation_sources_sign(self):
+        user = USERS[0]
+        operations = [
+            CreateAccount(user.public_key, "5"),
+            ChangeTrust(ASSET, source=user.public_key),
+            Payment(user.public_key, ASSET, "10", source=ISSUER.public_key),
+        ]
+        planner = TransactionPlanner(
+            Account(SOURCE.public_key, 1),
+            NETWORK_PASSPHRASE,
+            signers=[ISSUER.secret, SOURCE, user],
+            timeout=60,
+        )
+        (te,) = planner.build(operations)
+        assert te.transaction.operations == operations
+        assert [sig.signature_hint for sig in te.signatures] == [
+            SOURCE.signature_hint(),
+            user.signature_hint(),
+            ISSUER.signature_hint(),
+        ]
+        for kp, sig in zip([SOURCE, user, ISSUER], te.signatures, strict=True):
+            kp.verify(te.hash(), sig.signature)
+
+    def test_unknown_signers_are_skipped(self):
+        operations = [ChangeTrust(ASSET, source=USERS[0].public_key)]
+        planner = TransactionPlanner(
+            Account(SOURCE.public_key, 1),
+            NETWORK_PASSPHRASE,
+            signers=[SOURCE],
+            timeout=60,
+        )
+        (te,) = planner.build(operations)
+        assert [sig.signature_hint for sig in te.signatures] == [
+            SOURCE.signature_hint()
+        ]
+
+    def test_no_timeout_warns_once(self):
+        with pytest.warns(UserWarning, match="timeout"):
+            planner = TransactionPlanner(
+                Account(SOURCE.public_key, 1), NETWORK_PASSPHRASE, max_operations=1
+            )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            envelopes = list(planner.build(_payments(3)))
+        assert len(envelopes) == 3
+        for te in envelopes:
+            time_bounds = te.transaction.preconditions.time_bounds
+            assert (time_bounds.min_time, time_bounds.max_time) == (0, 0)
+
+    @pytest.mark.parametrize("timeout", [None, 60])
+    def test_max_size(self, timeout):
+        data = [ManageData(f"key{i}", b"v" * (i % 64 + 1)) for i in range(300)]
+        operations = [
+            op.__class__(op.data_name, op.data_value, source=USERS[i % 3].public_key)
+            if i % 7 == 0
+            else op
+            for i, op in enumerate(data)
+        ]
+        signers = [SOURCE, *USERS]
+        max_size = 3000
+
+        def planner_for(sequence, max_size):
+            with (
+                pytest.warns(UserWarning, match="timeout")
+                if timeout is None
+                else contextlib.nullcontext()
+            ):
+                return TransactionPlanner(
+                    Account(SOURCE.public_key, sequence),
+                    NETWORK_PASSPHRASE,
+                    signers=signers,
+                    timeout=timeout,
+                    memo=TextMemo("airdrop"),
+                    max_size=max_size,
+                )
+
+        planner = planner_for(1, max_size)
+        envelopes = list(planner.build(operations))
+        assert (
+            list(
+                itertools.chain.from_iterable(
+                    te.transaction.operations for te in envelopes
+                )
+            )
+            == operations
+        )
+        offset = 0
+        for te in envelopes:
+            offset += len(te.transaction.operations)
+            assert _size(te) <= max_size
+            if offset < len(operations):
+                # The next operation would not have fit.
+                extended = [*te.transaction.operations, operations[offset]]
+                assert len(extended) > planner.max_operations or any(
+                    _size(candidate) > max_size
+                    for candidate in planner_for(
+                        te.transaction.sequence - 1, 10**6
+                    ).build(extended)
+                )
+
+    def test_max_operations(self):
+        planner = TransactionPlanner(
+            Account(SOURCE.public_key, 1),
+            NETWORK_PASSPHRASE,
+            timeout=60,
+            max_operations=3,
+        )
+        assert [len(batch) for batch in planner.plan(_payments(8))] == [3, 3, 2]
+
+    def test_plan_empty(self):
+        planner = TransactionPlanner(
+            Account(SOURCE.public_key, 1), NETWORK_PASSPHRASE, timeout=60
+        )
+        assert list(planner.plan([])) == []
+
+    def test_operation_too_large(self):
+        planner = TransactionPlanner(
+            Account(SOURCE.public_key, 1), NETWORK_PASSPHRASE, timeout=60, max_size=250
+        )
+        operations = [
+            ManageData("small", b"v"),
+            ManageData("large" * 12, b"v" * 64),
+        ]
+        batches = planner.plan(operations)
+        assert next(batches) == operations[:1]
+        with pytest.raises(ValueError, match="index 1 does not fit"):
+            next(batches)
+
+    def test_soroban_operation(self):
+        planner = TransactionPlanner(
+            Account(SOURCE.public_key, 1), NETWORK_PASSPHRASE, timeout=60
+        )
+        with pytest.raises(ValueError, match="index 1 is a Soroban operation"):
+            list(planner.plan([*_payments(1), RestoreFootprint()]))
+
+    @pytest.mark.parametrize("max_operations", [0, 101])
+    def test_invalid_max_operations(self, max_operations):
+        with pytest.raises(ValueError, match="max_operations must be between"):
+            TransactionPlanner(
+                Account(SOURCE.public_key, 1),
+                NETWORK_PASSPHRASE,
+                max_operations=max_operations,
+            )
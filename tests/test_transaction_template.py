@@ -0,0 +1,126 @@
+import pytest
+
+from stellar_sdk import (
+    Account,
+    Asset,
+    IdMemo,
+    Keypair,
+    MuxedAccount,
+    Network,
+    NoneMemo,
+    TextMemo,
+    TransactionBuilder,
+    TransactionEnvelope,
+    TransactionTemplate,
+)
+from stellar_sdk.memo import Memo
+
+SOURCE = Keypair.from_secret("SCCS5ZBI7WVIJ4SW36WGOQQIWJYCL3VOAULSXX3FB57USIO25EDOYQHH")
+DESTINATION = "GDJJRRMBK4IWLEPJGIE6SXD2LP7REGZODU7WDC3I2D6MR37F4XSHBKX2"
+ASSET = Asset("USD", "GCDNJUBQSX7AJWLJACMJ7I4BC3Z47BQUTMHEICZLE6MU4KQBRYG5JY6B")
+
+
+def _builder(sequence: int = 100, extra_ops: bool = False) -> TransactionBuilder:
+    builder = TransactionBuilder(
+        Account(SOURCE.public_key, sequence), Network.TESTNET_NETWORK_PASSPHRASE, 150
+    )
+    builder.add_time_bounds(0, 1700000000).add_text_memo("payout")
+    if extra_ops:
+        builder.append_manage_data_op("before", "value")
+    builder.append_payment_op(DESTINATION, ASSET, "1")
+    if extra_ops:
+        builder.append_bump_sequence_op(1).append_manage_data_op("after", None)
+    return builder
+
+
+def _expected(
+    destination, amount: str, memo: Memo | None, sequence: int, extra_ops: bool
+) -> TransactionEnvelope:
+    builder = TransactionBuilder(
+        Account(SOURCE.public_key, sequence - 1),
+        Network.TESTNET_NETWORK_PASSPHRASE,
+        150,
+    )
+    builder.add_time_bounds(0, 1700000000)
+    builder.add_memo(TextMemo("payout") if memo is None else memo)
+    if extra_ops:
+        builder.append_manage_data_op("before", "value")
+    builder.append_payment_op(destination, ASSET, amount)
+    if extra_ops:
+        builder.append_bump_sequence_op(1).append_manage_data_op("after", None)
+    te = builder.build()
+    te.sign(SOURCE)
+    return te
+
+
+class TestTransactionTemplate:
+    @pytest.mark.parametrize("extra_ops", [False, True])
+    @pytest.mark.parametrize(
+        ("destination", "amount", "memo"),
+        [
+            (DESTINATION, "12.5", None),
+            (Keypair.random().public_key, "0.0000001", IdMemo(2**64 - 1)),
+            (
+                "MAAAAAAAAAAAJURAAB2X52XFQP6FBXLGT6LWOOWMEXWHEWBDVRZ7V5WH34Y22MPFBHUHY",
+                "922337203685.4775807",
+                TextMemo("a longer memo text"),
+            ),
+            (MuxedAccount(DESTINATION, 1), "3", NoneMemo()),
+        ],
+    )
+    def test_matches_builder(self, destination, amount, memo, extra_ops):
+        template = TransactionTemplate.from_builder(
+            _builder(extra_ops=extra_ops), [SOURCE]
+        )
+        assert template.sequence == 101
+        signed = template.sign(destination, amount, memo)
+        expected = _expected(destination, amount, memo, 101, extra_ops)
+        assert signed.sequence == 101
+        assert signed.xdr == expected.to_xdr()
+        assert signed.hash == expected.hash()
+        assert signed.hash_hex() == expected.hash_hex()
+        assert template.transaction_xdr_bytes(
+            destination, amount, memo, sequence=101
+        ) == (expected.transaction.to_xdr_object().to_xdr_bytes())
+
+    def test_sequence(self):
+        builder = _builder(sequence=9)
+        template = TransactionTemplate.from_builder(builder, [SOURCE.secret])
+        assert builder.source_account.sequence == 10
+        sequences = [template.sign(DESTINATION, "1").sequence for _ in range(3)]
+        assert sequences == [10, 11, 12]
+        assert template.sign(DESTINATION, "1", sequence=50).sequence == 50
+        assert template.sequence == 13
+        te = TransactionEnvelope.from_xdr(
+            template.sign(DESTINATION, "1").xdr, Network.TESTNET_NETWORK_PASSPHRASE
+        )
+        assert te.transaction.sequence == 13
+        SOURCE.verify(te.hash(), te.signatures[0].signature)
+
+    def test_unsigned(self):
+        template = TransactionTemplate(_builder().build())
+        te = TransactionEnvelope.from_xdr(
+            template.sign(DESTINATION, "1").xdr, Network.TESTNET_NETWORK_PASSPHRASE
+        )
+        assert te.signatures == []
+
+    def test_invalid_amount(self):
+        template = TransactionTemplate(_builder().build())
+        with pytest.raises(ValueError, match="at most 7 digits"):
+            template.sign(DESTINATION, "0.00000001")
+
+    def test_v0_transaction(self):
+        builder = _builder()
+        builder.v1 = False
+        with pytest.raises(ValueError, match="Only V1 transactions"):
+            TransactionTemplate(builder.build())
+
+    @pytest.mark.parametrize("payments", [0, 2])
+    def test_payment_count(self, payments):
+        builder = TransactionBuilder(
+            Account(SOURCE.public_key, 1), Network.TESTNET_NETWORK_PASSPHRASE, 100
+        ).append_bump_sequence_op(1)
+        for _ in range(payments):
+            builder.append_payment_op(DESTINATION, ASSET, "1")
+        with pytest.raises(ValueError, match=f"got {payments}"):
+            TransactionTemplate(builder.set_timeout(30).build())
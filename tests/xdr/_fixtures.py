@@ -0,0 +1,77 @@
+"""XDR values shared by the tests of the generated XDR types."""
+
+from stellar_sdk import Keypair, scval
+from stellar_sdk import xdr as stellar_xdr
+
+KEYPAIR = Keypair.from_raw_ed25519_seed(bytes(range(32)))
+
+
+def sc_map() -> stellar_xdr.SCVal:
+    return scval.to_map(
+        {
+            scval.to_symbol("amount"): scval.to_int128(-(2**100)),
+            scval.to_symbol("owner"): scval.to_address(KEYPAIR.public_key),
+            scval.to_symbol("tags"): scval.to_vec(
+                [scval.to_string("a"), scval.to_bytes(b"\x00\x01")]
+            ),
+        }
+    )
+
+
+def contract_code_entry(code: bytes = bytes(range(256)) * 4) -> stellar_xdr.LedgerEntry:
+    return stellar_xdr.LedgerEntry(
+        last_modified_ledger_seq=stellar_xdr.Uint32(100),
+        data=stellar_xdr.LedgerEntryData(
+            type=stellar_xdr.LedgerEntryType.CONTRACT_CODE,
+            contract_code=stellar_xdr.ContractCodeEntry(
+                ext=stellar_xdr.ContractCodeEntryExt(v=0),
+                hash=stellar_xdr.Hash(b"\x01" * 32),
+                code=code,
+            ),
+        ),
+        ext=stellar_xdr.LedgerEntryExt(v=0),
+    )
+
+
+def deposit_op(pool_id: bytes) -> stellar_xdr.LiquidityPoolDepositOp:
+    return stellar_xdr.LiquidityPoolDepositOp(
+        liquidity_pool_id=stellar_xdr.PoolID(stellar_xdr.Hash(pool_id)),
+        max_amount_a=stellar_xdr.Int64(10**12),
+        max_amount_b=stellar_xdr.Int64(-1),
+        min_price=stellar_xdr.Price(stellar_xdr.Int32(1), stellar_xdr.Int32(3)),
+        max_price=stellar_xdr.Price(stellar_xdr.Int32(-7), stellar_xdr.Int32(2)),
+    )
+
+
+def nested_sc_val(levels: int, kind: str) -> stellar_xdr.SCVal:
+    value = scval.to_uint32(levels)
+    for i in range(levels):
+        if kind == "vec":
+            value = scval.to_vec([scval.to_uint32(i), value])
+        else:
+            value = scval.to_map({scval.to_uint32(i): value})
+    return value
+
+
+def transaction_meta() -> stellar_xdr.TransactionMeta:
+    entry = contract_code_entry()
+    changes = stellar_xdr.LedgerEntryChanges(
+        [
+            stellar_xdr.LedgerEntryChange(
+                stellar_xdr.LedgerEntryChangeType.LEDGER_ENTRY_CREATED, created=entry
+            ),
+            stellar_xdr.LedgerEntryChange(
+                stellar_xdr.LedgerEntryChangeType.LEDGER_ENTRY_STATE, state=entry
+            ),
+        ]
+    )
+    return stellar_xdr.TransactionMeta(
+        v=3,
+        v3=stellar_xdr.TransactionMetaV3(
+            ext=stellar_xdr.ExtensionPoint(0),
+            tx_changes_before=changes,
+            operations=[stellar_xdr.OperationMeta(changes)],
+            tx_changes_after=stellar_xdr.LedgerEntryChanges([]),
+            soroban_meta=None,
+        ),
+    )
@@ -0,0 +1,277 @@
+import copy
+import mmap
+import pickle
+
+import pytest
+from xdrlib3 import ConversionError, Packer
+
+from stellar_sdk import scval
+from stellar_sdk import xdr as stellar_xdr
+from tests.xdr import _fixtures as fx
+
+
+class TestZeroCopy:
+    code = bytes(range(256)) * 8
+
+    def test_large_opaque_values_are_views(self):
+        entry = fx.contract_code_entry(self.code)
+        data = bytearray(entry.to_xdr_bytes())
+        decoded = stellar_xdr.LedgerEntry.from_xdr_bytes(data, zero_copy=True)
+        contract_code = decoded.data.contract_code
+        assert isinstance(contract_code.code, memoryview)
+        assert isinstance(contract_code.hash.hash, bytes)
+        assert contract_code.code == self.code
+        assert decoded == entry
+        assert decoded.to_xdr_bytes() == bytes(data)
+        assert decoded.to_json() == entry.to_json()
+
+        # a writable input buffer is copied, so its changes are not seen
+        offset = bytes(data).index(self.code)
+        data[offset] = 0xFF
+        assert contract_code.code[0] == self.code[0]
+
+    @pytest.mark.parametrize(
+        "wrap",
+        [bytearray, lambda data: memoryview(bytearray(data))],
+        ids=["bytearray", "writable view"],
+    )
+    def test_views_of_writable_buffers_are_read_only(self, wrap):
+        entry = fx.contract_code_entry(self.code)
+        decoded = stellar_xdr.LedgerEntry.from_xdr_bytes(
+            wrap(entry.to_xdr_bytes()), zero_copy=True
+        )
+        code = decoded.data.contract_code.code
+        assert isinstance(code, memoryview)
+        assert code.readonly
+        assert hash(code) == hash(self.code)
+        assert hash(decoded) == hash(entry)
+
+    @pytest.mark.parametrize(
+        "wrap", [bytes, bytearray, memoryview], ids=["bytes", "bytearray", "view"]
+    )
+    def test_default_decodes_to_bytes(self, wrap):
+        entry = fx.contract_code_entry(self.code)
+        decoded = stellar_xdr.LedgerEntry.from_xdr_bytes(wrap(entry.to_xdr_bytes()))
+        assert type(decoded.data.contract_code.code) is bytes
+        assert decoded == entry
+
+    def test_strings_are_bytes(self):
+        sc_val = scval.to_string("x" * 1000)
+        data = memoryview(sc_val.to_xdr_bytes())
+        decoded = stellar_xdr.SCVal.from_xdr_bytes(data, zero_copy=True)
+        assert type(decoded.str.sc_string) is bytes
+        assert decoded == sc_val
+
+    def test_mmap(self, tmp_path):
+        entry = fx.contract_code_entry(self.code)
+        path = tmp_path / "entry.xdr"
+        path.write_bytes(entry.to_xdr_bytes())
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            assert stellar_xdr.LedgerEntry.from_xdr_bytes(m) == entry
+            decoded = stellar_xdr.LedgerEntry.from_xdr_bytes(m, zero_copy=True)
+            assert decoded == entry
+            code = bytes(decoded.data.contract_code.code)
+            del decoded
+        assert code == self.code
+
+    def test_trailing_bytes(self):
+        data = memoryview(
+            fx.contract_code_entry(self.code).to_xdr_bytes() + b"\x00" * 4
+        )
+        with pytest.raises(ValueError, match="Unexpected trailing 4 bytes"):
+            stellar_xdr.LedgerEntry.from_xdr_bytes(data, zero_copy=True)
+
+
+class TestFixedLayout:
+    def test_round_trip(self):
+        op = fx.deposit_op(bytes(range(32)))
+        data = op.to_xdr_bytes()
+        assert len(data) == 32 + 8 + 8 + 4 * 4
+        assert data[32:40] == (10**12).to_bytes(8, "big")
+        decoded = stellar_xdr.LiquidityPoolDepositOp.from_xdr_bytes(data)
+        assert decoded == op
+        assert isinstance(decoded.min_price.n, stellar_xdr.Int32)
+        assert isinstance(decoded.liquidity_pool_id.pool_id, stellar_xdr.Hash)
+        assert (
+            stellar_xdr.LiquidityPoolDepositOp.from_xdr_bytes(
+                memoryview(data), zero_copy=True
+            )
+            == op
+        )
+
+    def test_matches_member_encoding(self):
+        parts = stellar_xdr.Int128Parts(
+            hi=stellar_xdr.Int64(-(2**63)), lo=stellar_xdr.Uint64(2**64 - 1)
+        )
+        packer = Packer()
+        packer.pack_hyper(-(2**63))
+        packer.pack_uhyper(2**64 - 1)
+        assert parts.to_xdr_bytes() == packer.get_buffer()
+
+    def test_bytes_like_opaque_members(self):
+        op = fx.deposit_op(bytearray(range(32)))
+        assert op.to_xdr_bytes() == fx.deposit_op(bytes(range(32))).to_xdr_bytes()
+
+    def test_out_of_range(self):
+        price = stellar_xdr.Price(stellar_xdr.Int32(2**31), stellar_xdr.Int32(1))
+        with pytest.raises(ConversionError):
+            price.to_xdr_bytes()
+
+    def test_truncated(self):
+        data = fx.deposit_op(bytes(32)).to_xdr_bytes()
+        with pytest.raises(EOFError):
+            stellar_xdr.LiquidityPoolDepositOp.from_xdr_bytes(data[:-1])
+        unpacker = stellar_xdr.make_unpacker(data[:-4])
+        with pytest.raises(EOFError):
+            stellar_xdr.LiquidityPoolDepositOp.skip(unpacker)
+
+    def test_pack_into_shared_buffer(self):
+        layout = stellar_xdr.FixedLayout(">ii")
+        buffer = bytearray(12)
+        layout.pack_into(buffer, 4, 1, -3)
+        price = stellar_xdr.Price.from_xdr_bytes(bytes(buffer[4:]))
+        assert price == stellar_xdr.Price(stellar_xdr.Int32(1), stellar_xdr.Int32(-3))
+        assert layout.unpack_from(buffer, 4) == (1, -3)
+
+
+class TestFrozen:
+    def test_freeze(self):
+        sc_val = scval.to_vec([fx.sc_map(), scval.to_bytes(bytearray(b"\x01\x02"))])
+        frozen = sc_val.freeze()
+        assert isinstance(frozen, stellar_xdr.SCVal)
+        assert isinstance(frozen, stellar_xdr.FrozenXdr)
+        assert frozen.freeze() is frozen
+        assert frozen == sc_val
+        assert sc_val == frozen
+        assert frozen.to_xdr_bytes() == sc_val.to_xdr_bytes()
+        assert frozen.to_xdr_bytes() is frozen.to_xdr_bytes()
+        assert isinstance(frozen.vec.sc_vec, tuple)
+        assert frozen.vec.sc_vec[1].bytes.sc_bytes == b"\x01\x02"
+        assert stellar_xdr.SCValType.SCV_MAP.freeze() is stellar_xdr.SCValType.SCV_MAP
+
+    def test_immutable(self):
+        frozen = fx.sc_map().freeze()
+        with pytest.raises(AttributeError, match="SCVal is frozen"):
+            frozen.type = stellar_xdr.SCValType.SCV_VOID
+        with pytest.raises(AttributeError, match="SCSymbol is frozen"):
+            frozen.map.sc_map[0].key.sym.sc_symbol = b"x"
+        with pytest.raises(AttributeError):
+            del frozen.map
+
+    def test_hash_and_eq(self):
+        key = scval.to_symbol("balance")
+        frozen = key.freeze()
+        assert hash(frozen) == hash(key)
+        assert {frozen: 1}[key] == 1
+        assert {key: 1}[frozen] == 1
+        assert frozen != scval.to_symbol("other").freeze()
+        # values with arrays are only hashable when frozen
+        table = {fx.sc_map().freeze(): "map"}
+        assert table[fx.sc_map().freeze()] == "map"
+
+    def test_clone_thaws(self):
+        sc_val = scval.to_vec([fx.sc_map()])
+        frozen = sc_val.freeze()
+        clone = frozen.clone()
+        assert type(clone) is stellar_xdr.SCVal
+        assert clone == sc_val
+        clone.vec.sc_vec.append(scval.to_void())
+        assert frozen == sc_val
+
+        shallow = frozen.clone(deep=False)
+        assert type(shallow) is stellar_xdr.SCVal
+        assert shallow.vec is frozen.vec
+
+    def test_copy_and_pickle(self):
+        frozen = fx.sc_map().freeze()
+        assert copy.copy(frozen) is frozen
+        assert copy.deepcopy(frozen) is frozen
+        loaded = pickle.loads(pickle.dumps(frozen))
+        assert isinstance(loaded, stellar_xdr.FrozenXdr)
+        assert loaded == frozen
+
+
+class TestViews:
+    def test_members(self):
+        meta = fx.transaction_meta()
+        view = stellar_xdr.TransactionMeta.view(meta.to_xdr_bytes())
+        assert isinstance(view, stellar_xdr.XdrView)
+        assert type(view).__name__ == "TransactionMetaView"
+        assert view.v == 3
+        assert view.operations is None
+        assert view.v4 is None
+        v3 = view.v3
+        assert isinstance(v3, stellar_xdr.XdrView)
+        assert v3.ext == meta.v3.ext
+        assert v3.soroban_meta is None
+        changes = v3.tx_changes_before.ledger_entry_changes
+        assert isinstance(changes, list)
+        assert changes[1].type == stellar_xdr.LedgerEntryChangeType.LEDGER_ENTRY_STATE
+        assert changes[1].created is None
+        assert (
+            changes[1].state.to_xdr_object()
+            == meta.v3.operations[0].changes.ledger_entry_changes[1].state
+        )
+        assert v3.operations[0].changes.to_xdr_object() == meta.v3.tx_changes_before
+        assert v3.tx_changes_after.ledger_entry_changes == []
+        assert v3 is view.v3
+
+    def test_to_xdr(self):
+        meta = fx.transaction_meta()
+        data = meta.to_xdr_bytes()
+        view = stellar_xdr.TransactionMeta.view(data)
+        assert view.to_xdr_object() == meta
+        assert view.to_xdr_bytes() == data
+        nested = view.v3.operations[0]
+        assert nested.to_xdr_object() == meta.v3.operations[0]
+        assert nested.to_xdr_bytes() == meta.v3.operations[0].to_xdr_bytes()
+
+    def test_read_only(self):
+        view = stellar_xdr.TransactionMeta.view(fx.transaction_meta().to_xdr_bytes())
+        with pytest.raises(AttributeError, match="TransactionMetaView is read-only"):
+            view.v = 4
+        with pytest.raises(AttributeError, match="TransactionMetaView is read-only"):
+            del view.v3
+        with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+            view.nope  # noqa: B018
+
+    def test_decoding_errors(self):
+        data = fx.transaction_meta().to_xdr_bytes()
+        # the members are decoded in order, up to the one that is accessed
+        view = stellar_xdr.TransactionMeta.view(b"\x00\x00\x00\x09")
+        assert view.v == 9
+        for _ in range(2):
+            with pytest.raises(ValueError, match=r"Invalid v\."):
+                view.v3  # noqa: B018
+        # the members that come before the truncation can still be read
+        truncated = stellar_xdr.TransactionMeta.view(data[:-8]).v3
+        assert truncated.ext == stellar_xdr.ExtensionPoint(0)
+        with pytest.raises(EOFError):
+            truncated.soroban_meta  # noqa: B018
+
+    def test_sc_val(self):
+        sc_val = scval.to_vec([fx.sc_map(), scval.to_uint32(7)])
+        view = stellar_xdr.SCVal.view(sc_val.to_xdr_bytes())
+        assert view.type == stellar_xdr.SCValType.SCV_VEC
+        first, second = view.vec.sc_vec
+        assert [entry.key.sym.sc_symbol for entry in first.map.sc_map] == [
+            b"amount",
+            b"owner",
+            b"tags",
+        ]
+        assert second.u32 == stellar_xdr.Uint32(7)
+        assert view.to_xdr_object() == sc_val
+
+    def test_zero_copy(self):
+        code = bytes(range(256)) * 8
+        data = bytearray(fx.contract_code_entry(code).to_xdr_bytes())
+        view = stellar_xdr.LedgerEntry.view(data, zero_copy=True)
+        value = view.data.contract_code.code
+        assert isinstance(value, memoryview)
+        assert value == code
+        assert isinstance(
+            stellar_xdr.LedgerEntry.view(data).data.contract_code.code, bytes
+        )
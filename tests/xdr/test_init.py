@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+from stellar_sdk import xdr as stellar_xdr
+
+
+class TestLazyImports:
+    def test_types_resolve_on_access(self):
+        assert stellar_xdr.LedgerCloseMeta.__module__ == (
+            "stellar_sdk.xdr.ledger_close_meta"
+        )
+        assert "LedgerCloseMeta" in vars(stellar_xdr)
+        from stellar_sdk.xdr import TransactionEnvelope
+
+        assert TransactionEnvelope is stellar_xdr.TransactionEnvelope
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="NotAnXdrType"):
+            _ = stellar_xdr.NotAnXdrType
+        with pytest.raises(ImportError):
+            from stellar_sdk.xdr import NotAnXdrType  # noqa: F401
+
+    def test_dir_and_all(self):
+        assert "SCVal" in dir(stellar_xdr)
+        assert "Integer" in stellar_xdr.__all__
+        assert "MAX_OPS_PER_TX" in stellar_xdr.__all__
+        assert set(stellar_xdr._LAZY_IMPORTS) <= set(stellar_xdr.__all__)
+        namespace = {}
+        exec("from stellar_sdk.xdr import *", namespace)
+        assert namespace["SCVal"] is stellar_xdr.SCVal
+
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, stellar_sdk.xdr as x; "
+            "assert 'stellar_sdk.xdr.ledger_close_meta' not in sys.modules; "
+            "assert 'requests' not in sys.modules; "
+            "x.LedgerCloseMeta; "
+            "assert 'stellar_sdk.xdr.ledger_close_meta' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,7 +1,10 @@
+import io
 import json
 
 import pytest
 
+from stellar_sdk import Keypair, scval
+from stellar_sdk.xdr import dump_xdr_json, set_json_backend
 from stellar_sdk.xdr.account_id import AccountID
 from stellar_sdk.xdr.allow_trust_result import AllowTrustResult
 from stellar_sdk.xdr.allow_trust_result_code import AllowTrustResultCode
@@ -1156,3 +1159,66 @@ class TestRealWorld:
         assert json.loads(json_str) == json.loads(expected_json)
         restored = TransactionEnvelope.from_json(json_str)
         assert restored == tx
+
+
+class TestStreamingJson:
+    @pytest.fixture(autouse=True)
+    def _restore_backend(self):
+        yield
+        set_json_backend()
+
+    def _values(self):
+        return [
+            TransactionEnvelope.from_xdr(
+                "AAAAAgAAAADmmSZkwY3163TMouB2TY8MljqXw2IxVYTGyvDrR6YtAAAqmmQAABpuAAAAAQAAAAAAAAAAAAAAAQAAAAAAAAAYAAAAAQAAAAEAAAAAAAAAAQAAAAAAAAABAAAAAAAAAAAAAAABAAAABgAAAAHXkotywnA8z+r365/0701QSlWouXn8m0UOoshCtNHOYQAAABQAAAABAAI9fQAAAAAAAAD4AAAAAAAqmgAAAAABR6YtAAAAAEArDtxbqUI+CsdkRmV0lFhVt0wyB7fyrmmkM6Fr35wpPcK8WKcXeKTl4BQ+akE14MZtpaea9LMdhXopaW3pJA0E"
+            ),
+            scval.to_map(
+                {
+                    scval.to_symbol("text"): scval.to_string('tab\t "quoted" caf\xe9'),
+                    scval.to_symbol("bytes"): scval.to_bytes(bytes(range(10))),
+                    scval.to_symbol("vec"): scval.to_vec(
+                        [
+                            scval.to_void(),
+                            scval.to_int128(-(2**100)),
+                            scval.to_bool(True),
+                        ]
+                    ),
+                    scval.to_symbol("address"): scval.to_address(
+                        Keypair.from_raw_ed25519_seed(bytes(32)).public_key
+                    ),
+                }
+            ),
+            MuxedAccount(
+                type=CryptoKeyType.KEY_TYPE_MUXED_ED25519,
+                med25519=MuxedAccountMed25519(
+                    id=Uint64(7), ed25519=Uint256(_KEY_BYTES)
+                ),
+            ),
+            SCValType.SCV_MAP,
+            Preconditions(type=PreconditionType.PRECOND_NONE),
+        ]
+
+    def test_to_json_matches_json_dumps(self):
+        for value in self._values():
+            assert value.to_json() == json.dumps(value.to_json_dict())
+
+    def test_dump_xdr_json(self):
+        for value in self._values():
+            fp = io.StringIO()
+            dump_xdr_json(value, fp)
+            assert fp.getvalue() == value.to_json()
+
+    @pytest.mark.parametrize("backend", ["json", "orjson", "ujson"])
+    def test_backends(self, backend):
+        if backend != "json":
+            pytest.importorskip(backend)
+        assert set_json_backend(backend) == backend
+        for value in self._values():
+            assert type(value).from_json(value.to_json()) == value
+
+    def test_default_backend(self):
+        assert set_json_backend() in ("orjson", "ujson", "json")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend 'simplejson'"):
+            set_json_backend("simplejson")
@@ -0,0 +1,115 @@
+import pytest
+from xdrlib3 import Unpacker
+
+from stellar_sdk import scval
+from stellar_sdk import xdr as stellar_xdr
+from tests.xdr import _fixtures as fx
+
+
+class TestNestedScVal:
+    @pytest.mark.parametrize(("kind", "max_levels"), [("vec", 255), ("map", 170)])
+    def test_depth_limit(self, kind, max_levels):
+        # a vec level takes 2 units of the default depth limit, a map level 3
+        data = fx.nested_sc_val(max_levels, kind).to_xdr_bytes()
+        assert stellar_xdr.SCVal.from_xdr_bytes(data).to_xdr_bytes() == data
+        too_deep = fx.nested_sc_val(max_levels + 1, kind).to_xdr_bytes()
+        with pytest.raises(ValueError, match="Maximum decoding depth reached"):
+            stellar_xdr.SCVal.from_xdr_bytes(too_deep)
+
+    @pytest.mark.parametrize("kind", ["vec", "map"])
+    def test_no_recursion(self, kind):
+        value = fx.nested_sc_val(5000, kind)
+        data = value.to_xdr_bytes()
+        decoded = stellar_xdr.SCVal.unpack(Unpacker(data), depth_limit=10**6)
+        assert decoded.to_xdr_bytes() == data
+        assert decoded == value
+        assert decoded.xdr_size() == len(data)
+        clone = decoded.clone()
+        assert clone == decoded
+        assert clone.to_xdr_bytes() == data
+        text = decoded.to_json()
+        assert text.startswith(f'{{"{kind}": [')
+        assert text.count("{") == text.count("}")
+        assert decoded != fx.nested_sc_val(4999, kind)
+        # change the innermost value of the clone
+        parent = clone
+        for _ in range(4999):
+            parent = parent.vec.sc_vec[1] if kind == "vec" else parent.map.sc_map[0].val
+        if kind == "vec":
+            parent.vec.sc_vec[1] = scval.to_uint32(0)
+        else:
+            parent.map.sc_map[0].val = scval.to_uint32(0)
+        assert decoded != clone
+
+    def test_nested_methods_match_members(self):
+        absent_vec = stellar_xdr.SCVal(stellar_xdr.SCValType.SCV_VEC, vec=None)
+        value = scval.to_vec([fx.sc_map(), scval.to_vec([]), scval.to_map({})])
+        assert value.xdr_size() == len(value.to_xdr_bytes())
+        assert absent_vec.xdr_size() == len(absent_vec.to_xdr_bytes())
+        assert value.to_json() == (
+            f'{{"vec": [{fx.sc_map().to_json()}, {{"vec": []}}, {{"map": []}}]}}'
+        )
+        assert stellar_xdr.SCVal.from_json(value.to_json()) == value
+
+        clone = value.clone()
+        assert clone == value
+        assert clone.vec is not value.vec
+        assert clone.vec.sc_vec[0].map.sc_map[2].val is not (
+            value.vec.sc_vec[0].map.sc_map[2].val
+        )
+        clone.vec.sc_vec[0].map.sc_map[0].val = scval.to_int128(1)
+        assert clone != value
+        assert value.vec.sc_vec[0] == fx.sc_map()
+        assert absent_vec.clone() == absent_vec
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            scval.to_vec([scval.to_uint32(1), scval.to_uint32(3)]),
+            scval.to_vec([scval.to_uint32(1)]),
+            scval.to_map({scval.to_uint32(1): scval.to_uint32(2)}),
+            stellar_xdr.SCVal(stellar_xdr.SCValType.SCV_VEC, vec=None),
+        ],
+    )
+    def test_nested_inequality(self, other):
+        value = scval.to_vec([scval.to_uint32(1), scval.to_uint32(2)])
+        assert value != other
+        assert other != value
+        assert value == scval.to_vec([scval.to_uint32(1), scval.to_uint32(2)])
+        assert value.freeze() == value
+        assert value.freeze() != other
+
+    def test_decoded_types(self):
+        value = stellar_xdr.SCVal.from_xdr_bytes(fx.sc_map().to_xdr_bytes())
+        assert isinstance(value.map, stellar_xdr.SCMap)
+        entry = value.map.sc_map[2]
+        assert isinstance(entry, stellar_xdr.SCMapEntry)
+        assert isinstance(entry.val.vec, stellar_xdr.SCVec)
+        assert entry.val.vec.sc_vec == [
+            scval.to_string("a"),
+            scval.to_bytes(b"\x00\x01"),
+        ]
+
+    def test_absent_and_empty(self):
+        absent_vec = stellar_xdr.SCVal(stellar_xdr.SCValType.SCV_VEC, vec=None)
+        absent_map = stellar_xdr.SCVal(stellar_xdr.SCValType.SCV_MAP, map=None)
+        values = [
+            absent_vec,
+            absent_map,
+            scval.to_vec([]),
+            scval.to_map({}),
+            scval.to_vec([absent_vec, scval.to_map({}), absent_map]),
+        ]
+        for value in values:
+            assert stellar_xdr.SCVal.from_xdr_bytes(value.to_xdr_bytes()) == value
+        assert absent_vec.to_xdr_bytes() == bytes.fromhex("0000001000000000")
+        assert scval.to_map({}).to_xdr_bytes() == bytes.fromhex(
+            "000000110000000100000000"
+        )
+
+    def test_length_exceeds_input(self):
+        data = bytes.fromhex("00000010000000010000000a")
+        with pytest.raises(
+            ValueError, match="sc_vec length 10 exceeds remaining input length 0"
+        ):
+            stellar_xdr.SCVal.from_xdr_bytes(data)
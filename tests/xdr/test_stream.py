@@ -0,0 +1,261 @@
+import gzip
+import io
+import mmap
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from stellar_sdk import scval
+from stellar_sdk import xdr as stellar_xdr
+
+
+def _values(count: int = 5) -> list[stellar_xdr.SCVal]:
+    return [
+        scval.to_map(
+            {
+                scval.to_symbol("index"): scval.to_uint32(i),
+                scval.to_symbol("payload"): scval.to_bytes(bytes([i]) * 300 * i),
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def _record_stream(values) -> bytes:
+    return b"".join(stellar_xdr.pack_xdr_record(v) for v in values)
+
+
+def _fragmented_record(value, size: int) -> bytes:
+    data = value.to_xdr_bytes()
+    chunks = [data[i : i + size] for i in range(0, len(data), size)]
+    out = b""
+    for i, chunk in enumerate(chunks):
+        mark = len(chunk) | (0x80000000 if i == len(chunks) - 1 else 0)
+        out += mark.to_bytes(4, "big") + chunk
+    return out
+
+
+def _index(value: stellar_xdr.SCVal) -> int:
+    assert value.map is not None
+    return scval.from_uint32(value.map.sc_map[0].val)
+
+
+class TestIterXdrRecords:
+    def test_pack_xdr_record(self):
+        value = scval.to_uint32(7)
+        record = stellar_xdr.pack_xdr_record(value)
+        assert record == b"\x80\x00\x00\x08" + value.to_xdr_bytes()
+
+    @pytest.mark.parametrize(
+        "wrap", [bytes, bytearray, memoryview, io.BytesIO], ids=lambda w: w.__name__
+    )
+    def test_in_memory_sources(self, wrap):
+        values = _values()
+        records = stellar_xdr.iter_xdr_records(
+            wrap(_record_stream(values)), stellar_xdr.SCVal
+        )
+        assert list(records) == values
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_path(self, tmp_path, compress):
+        values = _values()
+        data = _record_stream(values)
+        path = tmp_path / "values.xdr"
+        path.write_bytes(gzip.compress(data) if compress else data)
+        assert list(stellar_xdr.iter_xdr_records(path, stellar_xdr.SCVal)) == values
+        assert list(stellar_xdr.iter_xdr_records(str(path), stellar_xdr.SCVal)) == (
+            values
+        )
+
+    def test_mmap(self, tmp_path):
+        values = _values()
+        path = tmp_path / "values.xdr"
+        path.write_bytes(_record_stream(values))
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            assert list(stellar_xdr.iter_xdr_records(m, stellar_xdr.SCVal)) == values
+
+    def test_zero_copy(self):
+        values = _values()
+        decoded = list(
+            stellar_xdr.iter_xdr_records(
+                io.BytesIO(_record_stream(values)), stellar_xdr.SCVal, zero_copy=True
+            )
+        )
+        assert decoded == values
+        assert isinstance(decoded[-1].map.sc_map[1].val.bytes.sc_bytes, memoryview)
+
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO], ids=["bytes", "file"])
+    def test_fragmented_records(self, wrap):
+        values = _values()
+        data = b"".join(_fragmented_record(v, 100) for v in values)
+        frames = list(stellar_xdr.iter_xdr_frames(wrap(data)))
+        assert [bytes(frame) for frame in frames] == [v.to_xdr_bytes() for v in values]
+        assert list(stellar_xdr.iter_xdr_records(wrap(data), stellar_xdr.SCVal)) == (
+            values
+        )
+
+    def test_empty_stream(self):
+        assert list(stellar_xdr.iter_xdr_records(b"", stellar_xdr.SCVal)) == []
+        assert list(stellar_xdr.iter_xdr_records(io.BytesIO(), stellar_xdr.SCVal)) == []
+
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO], ids=["bytes", "file"])
+    def test_truncated_record(self, wrap):
+        data = _record_stream(_values(2))
+        with pytest.raises(ValueError, match="Truncated XDR record: expected"):
+            list(stellar_xdr.iter_xdr_frames(wrap(data[:-1])))
+        with pytest.raises(ValueError, match="Truncated XDR record mark"):
+            list(stellar_xdr.iter_xdr_frames(wrap(data + b"\x80\x00")))
+
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO], ids=["bytes", "file"])
+    def test_max_record_size(self, wrap):
+        data = _fragmented_record(_values()[-1], 100)
+        with pytest.raises(ValueError, match="exceeds maximum 1000"):
+            list(stellar_xdr.iter_xdr_frames(wrap(data), max_record_size=1000))
+
+    def test_iterates_lazily(self):
+        values = _values()
+        data = _record_stream(values) + b"\x80\x00\x00\x04"
+        records = stellar_xdr.iter_xdr_records(io.BytesIO(data), stellar_xdr.SCVal)
+        assert [next(records) for _ in values] == values
+        with pytest.raises(ValueError, match="Truncated XDR record"):
+            next(records)
+
+
+class TestIterXdrEntries:
+    @pytest.mark.parametrize(
+        "wrap", [bytes, bytearray, memoryview, io.BytesIO], ids=lambda w: w.__name__
+    )
+    def test_in_memory_sources(self, wrap):
+        values = _values()
+        data = b"".join(v.to_xdr_bytes() for v in values)
+        assert list(stellar_xdr.iter_xdr_entries(wrap(data), stellar_xdr.SCVal)) == (
+            values
+        )
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_path(self, tmp_path, compress):
+        values = _values()
+        data = b"".join(v.to_xdr_bytes() for v in values)
+        path = tmp_path / "values.xdr"
+        path.write_bytes(gzip.compress(data) if compress else data)
+        decoded = list(
+            stellar_xdr.iter_xdr_entries(path, stellar_xdr.SCVal, zero_copy=True)
+        )
+        assert decoded == values
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.xdr"
+        path.write_bytes(b"")
+        assert list(stellar_xdr.iter_xdr_entries(path, stellar_xdr.SCVal)) == []
+
+    def test_truncated_entry(self):
+        data = _values(2)[1].to_xdr_bytes()
+        with pytest.raises(EOFError):
+            list(stellar_xdr.iter_xdr_entries(data[:-4], stellar_xdr.SCVal))
+
+
+def _json_lines(values) -> str:
+    fp = io.StringIO()
+    for value in values:
+        stellar_xdr.dump_xdr_json(value, fp)
+        fp.write("\n")
+    return fp.getvalue()
+
+
+class TestXdrJson:
+    def test_dump_xdr_json(self):
+        values = _values()
+        assert _json_lines(values) == "".join(v.to_json() + "\n" for v in values)
+
+    @pytest.mark.parametrize(
+        "wrap",
+        [io.StringIO, lambda text: io.BytesIO(text.encode())],
+        ids=["text", "binary"],
+    )
+    def test_file_objects(self, wrap):
+        values = _values()
+        source = wrap(_json_lines(values) + "\n\n")
+        assert list(stellar_xdr.iter_xdr_json(source, stellar_xdr.SCVal)) == values
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_path(self, tmp_path, compress):
+        values = _values()
+        data = _json_lines(values).encode()
+        path = tmp_path / "values.jsonl"
+        path.write_bytes(gzip.compress(data) if compress else data)
+        assert list(stellar_xdr.iter_xdr_json(path, stellar_xdr.SCVal)) == values
+
+    def test_iterates_lazily(self):
+        text = _json_lines(_values(2)) + "{not json\n"
+        values = stellar_xdr.iter_xdr_json(io.StringIO(text), stellar_xdr.SCVal)
+        assert next(values) == _values(1)[0]
+        next(values)
+        with pytest.raises(ValueError):
+            next(values)
+
+
+# Workers are spawned rather than forked, since other tests leave threads
+# running in this process.
+@pytest.fixture(scope="module")
+def executor():
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        yield executor
+
+
+class TestDecodeMany:
+    def test_inline(self):
+        values = _values(7)
+        items = [
+            v.to_xdr() if i % 2 else v.to_xdr_bytes() for i, v in enumerate(values)
+        ]
+        assert (
+            stellar_xdr.decode_many(stellar_xdr.SCVal, items, workers=1, chunk_size=3)
+            == values
+        )
+
+    def test_process_pool(self, executor):
+        values = _values(7)
+        items = (v.to_xdr() for v in values)
+        assert (
+            stellar_xdr.decode_many(
+                stellar_xdr.SCVal, items, workers=2, chunk_size=2, executor=executor
+            )
+            == values
+        )
+        # the executor is not shut down
+        assert executor.submit(abs, -1).result() == 1
+
+    def test_transform(self, executor):
+        items = [v.to_xdr_bytes() for v in _values(7)]
+        results = stellar_xdr.iter_decode_many(
+            stellar_xdr.SCVal, items, chunk_size=3, transform=_index, executor=executor
+        )
+        assert list(results) == list(range(7))
+
+    def test_iterates_lazily(self):
+        def items():
+            yield from (v.to_xdr() for v in _values(4))
+            yield "not xdr"
+
+        results = stellar_xdr.iter_decode_many(
+            stellar_xdr.SCVal, items(), workers=1, chunk_size=2, transform=_index
+        )
+        assert [next(results) for _ in range(4)] == [0, 1, 2, 3]
+        with pytest.raises(ValueError):
+            next(results)
+
+    def test_error_in_worker(self, executor):
+        items = [v.to_xdr() for v in _values(3)] + ["not xdr"]
+        with pytest.raises(ValueError):
+            stellar_xdr.decode_many(
+                stellar_xdr.SCVal, items, chunk_size=1, executor=executor
+            )
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            stellar_xdr.decode_many(stellar_xdr.SCVal, [], chunk_size=0)
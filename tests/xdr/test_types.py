@@ -0,0 +1,272 @@
+import copy
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from stellar_sdk import scval
+from stellar_sdk import xdr as stellar_xdr
+from tests.xdr import _fixtures as fx
+
+
+class TestSlots:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            stellar_xdr.Price(stellar_xdr.Int32(1), stellar_xdr.Int32(2)),
+            stellar_xdr.Hash(b"\x00" * 32),
+            fx.sc_map(),
+        ],
+    )
+    def test_no_instance_dict(self, obj):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unknown_attribute = 1
+
+    def test_slots_match_members(self):
+        assert stellar_xdr.Price.__slots__ == ("d", "n")
+        assert stellar_xdr.Hash.__slots__ == ("hash",)
+        assert "type" in stellar_xdr.SCVal.__slots__
+        assert "map" in stellar_xdr.SCVal.__slots__
+
+    def test_copy_and_pickle(self):
+        sc_val = fx.sc_map()
+        assert copy.copy(sc_val) == sc_val
+        assert copy.deepcopy(sc_val) == sc_val
+        assert pickle.loads(pickle.dumps(sc_val)) == sc_val
+
+
+class TestTableDispatch:
+    def test_enum_members(self):
+        for member in stellar_xdr.SCValType:
+            decoded = stellar_xdr.SCValType.from_xdr_bytes(member.to_xdr_bytes())
+            assert decoded is member
+
+    def test_enum_invalid_value(self):
+        data = (1000).to_bytes(4, "big")
+        with pytest.raises(ValueError, match="1000 is not a valid SCValType"):
+            stellar_xdr.SCValType.from_xdr_bytes(data)
+
+    def test_union_arms(self):
+        values = [
+            scval.to_void(),
+            scval.to_bool(True),
+            scval.to_uint32(7),
+            scval.to_int256(-(2**200)),
+            scval.to_symbol("sym"),
+            fx.sc_map(),
+            stellar_xdr.SCVal(stellar_xdr.SCValType.SCV_LEDGER_KEY_CONTRACT_INSTANCE),
+        ]
+        for value in values:
+            assert stellar_xdr.SCVal.from_xdr_bytes(value.to_xdr_bytes()) == value
+
+    def test_union_invalid_discriminant(self):
+        ext = stellar_xdr.TransactionExt(0)
+        assert stellar_xdr.TransactionExt.from_xdr_bytes(ext.to_xdr_bytes()) == ext
+        with pytest.raises(ValueError, match=r"Invalid v\."):
+            stellar_xdr.TransactionExt.from_xdr_bytes((5).to_bytes(4, "big"))
+
+    def test_circular_arm_types_import_on_first_decode(self):
+        code = (
+            "from stellar_sdk import scval; "
+            "from stellar_sdk.xdr import SCVal; "
+            "v = scval.to_vec([scval.to_map({scval.to_symbol('a'): scval.to_uint64(1)})]); "
+            "assert SCVal.from_xdr_bytes(v.to_xdr_bytes()) == v"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestFieldProjection:
+    def test_skip_consumes_value(self):
+        values = [
+            fx.sc_map(),
+            fx.contract_code_entry(),
+            stellar_xdr.Price(stellar_xdr.Int32(1), stellar_xdr.Int32(2)),
+            stellar_xdr.SCValType.SCV_U32,
+        ]
+        for value in values:
+            data = value.to_xdr_bytes() + b"\x00\x00\x00\x07"
+            unpacker = stellar_xdr.make_unpacker(data)
+            type(value).skip(unpacker)
+            assert unpacker.get_position() == len(data) - 4
+            assert unpacker.unpack_uint() == 7
+
+    def test_skip_truncated(self):
+        data = fx.contract_code_entry().to_xdr_bytes()[:-8]
+        with pytest.raises(EOFError):
+            stellar_xdr.LedgerEntry.skip(stellar_xdr.make_unpacker(data))
+
+    def test_decode_fields(self):
+        entry = fx.contract_code_entry()
+        result = stellar_xdr.LedgerEntry.decode_fields(
+            entry.to_xdr_bytes(),
+            [
+                "last_modified_ledger_seq",
+                "data.type",
+                "data.contract_code.hash",
+                "data.account",
+                "ext",
+            ],
+        )
+        assert result == {
+            "last_modified_ledger_seq": stellar_xdr.Uint32(100),
+            "data.type": stellar_xdr.LedgerEntryType.CONTRACT_CODE,
+            "data.contract_code.hash": stellar_xdr.Hash(b"\x01" * 32),
+            "data.account": None,
+            "ext": stellar_xdr.LedgerEntryExt(v=0),
+        }
+
+    def test_shorter_path_wins(self):
+        entry = fx.contract_code_entry()
+        result = stellar_xdr.LedgerEntry.decode_fields(
+            entry.to_xdr_bytes(), ["data.contract_code.ext.v", "data"]
+        )
+        assert result == {"data.contract_code.ext.v": 0, "data": entry.data}
+
+    def test_arrays_yield_lists(self):
+        sc_val = fx.sc_map()
+        result = stellar_xdr.SCVal.decode_fields(
+            sc_val.to_xdr_bytes(), ["map.sc_map.key.sym", "map.sc_map.val.type"]
+        )
+        assert [symbol.sc_symbol for symbol in result["map.sc_map.key.sym"]] == [
+            b"amount",
+            b"owner",
+            b"tags",
+        ]
+        assert result["map.sc_map.val.type"] == [
+            stellar_xdr.SCValType.SCV_I128,
+            stellar_xdr.SCValType.SCV_ADDRESS,
+            stellar_xdr.SCValType.SCV_VEC,
+        ]
+
+    def test_zero_copy(self):
+        entry = fx.contract_code_entry(bytes(range(256)) * 8)
+        result = stellar_xdr.LedgerEntry.decode_fields(
+            bytearray(entry.to_xdr_bytes()), ["data.contract_code.code"], zero_copy=True
+        )
+        code = result["data.contract_code.code"]
+        assert isinstance(code, memoryview)
+        assert code == entry.data.contract_code.code
+
+    @pytest.mark.parametrize(
+        ("path", "message"),
+        [
+            ("data.nope", "LedgerEntryData has no member nope"),
+            ("last_modified_ledger_seq.uint32.x", "Integer has no member x"),
+            ("data..type", "Invalid field path"),
+        ],
+    )
+    def test_invalid_paths(self, path, message):
+        data = fx.contract_code_entry().to_xdr_bytes()
+        with pytest.raises(ValueError, match=message):
+            stellar_xdr.LedgerEntry.decode_fields(data, [path])
+
+
+class TestXdrSize:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            stellar_xdr.SCValType.SCV_VOID,
+            stellar_xdr.Uint32(7),
+            stellar_xdr.Hash(b"\x01" * 32),
+            fx.deposit_op(b"\x02" * 32),
+            scval.to_void(),
+            scval.to_bytes(b"\x03" * 5),
+            scval.to_string("hello"),
+            scval.to_int256(-(2**200)),
+            scval.to_vec([scval.to_symbol("a"), scval.to_bool(False)]),
+            fx.sc_map(),
+            fx.contract_code_entry(b"\x00asm" + b"\x04" * 1001),
+            stellar_xdr.SorobanTransactionData(
+                ext=stellar_xdr.SorobanTransactionDataExt(0),
+                resources=stellar_xdr.SorobanResources(
+                    footprint=stellar_xdr.LedgerFootprint(read_only=[], read_write=[]),
+                    instructions=stellar_xdr.Uint32(100),
+                    disk_read_bytes=stellar_xdr.Uint32(200),
+                    write_bytes=stellar_xdr.Uint32(300),
+                ),
+                resource_fee=stellar_xdr.Int64(400),
+            ),
+        ],
+    )
+    def test_matches_encoded_length(self, value):
+        assert value.xdr_size() == len(value.to_xdr_bytes())
+
+    def test_transaction_envelope(self):
+        memo = stellar_xdr.Memo(stellar_xdr.MemoType.MEMO_TEXT, text=b"memo")
+        op = stellar_xdr.Operation(
+            source_account=None,
+            body=stellar_xdr.OperationBody(
+                stellar_xdr.OperationType.BUMP_SEQUENCE,
+                bump_sequence_op=stellar_xdr.BumpSequenceOp(
+                    stellar_xdr.SequenceNumber(stellar_xdr.Int64(1))
+                ),
+            ),
+        )
+        tx = stellar_xdr.Transaction(
+            source_account=fx.KEYPAIR.xdr_muxed_account(),
+            fee=stellar_xdr.Uint32(100),
+            seq_num=stellar_xdr.SequenceNumber(stellar_xdr.Int64(2)),
+            cond=stellar_xdr.Preconditions(stellar_xdr.PreconditionType.PRECOND_NONE),
+            memo=memo,
+            operations=[op, op],
+            ext=stellar_xdr.TransactionExt(0),
+        )
+        envelope = stellar_xdr.TransactionEnvelope(
+            stellar_xdr.EnvelopeType.ENVELOPE_TYPE_TX,
+            v1=stellar_xdr.TransactionV1Envelope(tx=tx, signatures=[]),
+        )
+        assert envelope.xdr_size() == len(envelope.to_xdr_bytes())
+
+    def test_invalid_discriminant(self):
+        ext = stellar_xdr.TransactionExt(5)
+        with pytest.raises(ValueError, match=r"Invalid v\."):
+            ext.xdr_size()
+
+
+class TestClone:
+    def test_deep_clone_copies_mutable_members(self):
+        sc_val = scval.to_vec([fx.sc_map(), scval.to_bytes(b"\x01" * 300)])
+        clone = sc_val.clone()
+        assert clone == sc_val
+        assert clone.vec is not sc_val.vec
+        assert clone.vec.sc_vec is not sc_val.vec.sc_vec
+        assert clone.vec.sc_vec[0] is not sc_val.vec.sc_vec[0]
+        # immutable leaves are shared
+        assert clone.vec.sc_vec[1].bytes.sc_bytes is sc_val.vec.sc_vec[1].bytes.sc_bytes
+        assert clone.type is sc_val.type
+
+        clone.vec.sc_vec[0].map.sc_map.pop()
+        clone.vec.sc_vec.append(scval.to_void())
+        assert sc_val == scval.to_vec([fx.sc_map(), scval.to_bytes(b"\x01" * 300)])
+
+    def test_shallow_clone_shares_members(self):
+        entry = fx.contract_code_entry(b"\x00asm")
+        clone = entry.clone(deep=False)
+        assert clone == entry
+        assert clone is not entry
+        assert clone.data is entry.data
+        clone.last_modified_ledger_seq = stellar_xdr.Uint32(5)
+        assert entry.last_modified_ledger_seq == stellar_xdr.Uint32(100)
+
+    def test_deepcopy_uses_clone(self):
+        data = fx.contract_code_entry(b"\x00asm" + b"\x02" * 500).to_xdr_bytes()
+        # memoryview values decoded with zero_copy=True cannot be deep-copied
+        # generically, clone shares them instead
+        entry = stellar_xdr.LedgerEntry.from_xdr_bytes(data, zero_copy=True)
+        copied = copy.deepcopy(entry)
+        assert copied == entry
+        assert copied.data is not entry.data
+
+    def test_enum_and_optional_members(self):
+        assert stellar_xdr.SCValType.SCV_MAP.clone() is stellar_xdr.SCValType.SCV_MAP
+        memo = stellar_xdr.Memo(stellar_xdr.MemoType.MEMO_NONE)
+        assert memo.clone() == memo
+        body = stellar_xdr.OperationBody(stellar_xdr.OperationType.INFLATION)
+        for source_account in [None, fx.KEYPAIR.xdr_muxed_account()]:
+            op = stellar_xdr.Operation(source_account=source_account, body=body)
+            clone = op.clone()
+            assert clone == op
+            if source_account is not None:
+                assert clone.source_account is not op.source_account
@@ -12,6 +12,9 @@ AST = Xdrgen::AST
 class Generator < Xdrgen::Generators::Base
   MAX_SIZE = (2 ** 32) - 1
   CIRCLE_IMPORT_UNION = %w[SCVal SCSpecTypeDef].freeze
+  # SCVal arms that are decoded and encoded with an explicit stack, see
+  # render_nested_scval_codec.
+  NESTED_SCVAL_ARMS = %w[vec map].freeze
   PYTHON_RESERVED_WORDS = %w[
     False None True and as assert async await break class continue def del
     elif else except finally for from global if import in is lambda match
@@ -34,11 +37,43 @@ class Generator < Xdrgen::Generators::Base
   # If a union arm name matches one of these, we suffix the local variable with _val
   # to avoid shadowing the builtin.
   PYTHON_BUILTINS = %w[str bytes int float bool list dict map type set].freeze
+  # `.base` symbols used by the generated from_xdr_bytes of every type.
+  XDR_UTILS_BASE_IMPORTS = %w[XdrBuffer json_loads make_unpacker xdr_to_json].freeze
+  # `.base` symbols used by the generated skip/unpack_fields of enums, and of
+  # the other types.
+  ENUM_FIELDS_BASE_IMPORTS = %w[Integer check_fields].freeze
+  FIELDS_BASE_IMPORTS = %w[DEFAULT_XDR_MAX_DEPTH check_fields decode_field_paths].freeze
+  # `.base` symbols used by the generated clone and freeze of types other
+  # than enums.
+  CLONE_BASE_IMPORTS = %w[make_frozen shallow_clone].freeze
+  # `.base` symbols used by the generated views, see render_view.
+  VIEW_BASE_IMPORTS = %w[XdrView make_view].freeze
+  # Hand-written modules copied verbatim from templates/ into the output.
+  TEMPLATE_MODULES = %w[base stream].freeze
+  # Matches ZERO_COPY_MIN_SIZE in templates/base.py: fixed opaque values at
+  # least this large are decoded as views in zero-copy mode, so they are kept
+  # out of fixed layouts, which always copy.
+  ZERO_COPY_MIN_SIZE = 256
+  STRUCT_FORMATS = {
+    AST::Typespecs::Int => "i",
+    AST::Typespecs::UnsignedInt => "I",
+    AST::Typespecs::Hyper => "q",
+    AST::Typespecs::UnsignedHyper => "Q",
+    AST::Typespecs::Float => "f",
+    AST::Typespecs::Double => "d",
+  }.freeze
+
+  # The precompiled `struct` layout of a value with a fixed-size encoding:
+  # `pack_values` are the expressions packed into it, `names` the variables
+  # unpacked from it, `build` the expression that rebuilds the value from
+  # those variables and `types` the classes `build` refers to.
+  Layout = Struct.new(:format, :pack_values, :names, :build, :types, keyword_init: true)
 
   def generate
     initialize_output_files
     render_base_classes
     render_definitions(@top)
+    render_init_file
   end
 
   private
@@ -51,16 +86,75 @@ class Generator < Xdrgen::Generators::Base
     EOS
 
     @init_out = @output.open("__init__.py")
+    @init_exports = []
+    @constant_names = []
+  end
+
+  def register_init_import(type_name)
+    @init_exports << [type_name, python_module_name(type_name)]
+  end
+
+  # Names exported by a template module, read from its `__all__` so the
+  # package `__all__` stays in sync with the template.
+  def template_exports(module_name)
+    content = IO.read("#{__dir__}/templates/#{module_name}.py")
+    content[/^__all__ = \[(.*?)\]/m, 1].scan(/"(\w+)"/).flatten
+  end
+
+  # The package __init__ does not import the generated modules eagerly:
+  # there are several hundred of them, and most programs only touch a
+  # handful. Each type is resolved through a module-level __getattr__ on
+  # first access instead, while `from stellar_sdk.xdr import X`, star
+  # imports and static type checkers keep working as before.
+  def render_init_file
     @init_out.puts <<~EOS
       # Automatically generated by xdrgen
       # DO NOT EDIT or your changes may be overwritten
+      import importlib
+      from typing import TYPE_CHECKING
+
       from .base import *
       from .constants import *
+      from .stream import *
     EOS
-  end
 
-  def register_init_import(type_name)
-    @init_out.puts "from .#{python_module_name(type_name)} import *"
+    unless @init_exports.empty?
+      @init_out.puts "if TYPE_CHECKING:"
+      @init_out.indent(2) do
+        @init_exports.each do |_, module_name|
+          @init_out.puts "from .#{module_name} import *"
+        end
+      end
+    end
+
+    @init_out.puts "_LAZY_IMPORTS = {"
+    @init_out.indent(2) do
+      @init_exports.each do |type_name, module_name|
+        @init_out.puts "\"#{type_name}\": \"#{module_name}\","
+      end
+    end
+    @init_out.puts "}"
+
+    @init_out.puts <<~EOS
+      def __getattr__(name: str):
+          module_name = _LAZY_IMPORTS.get(name)
+          if module_name is None:
+              raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+          value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+          globals()[name] = value
+          return value
+
+      def __dir__():
+          return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+    EOS
+
+    exports = template_exports("base") + @constant_names +
+              template_exports("stream") + @init_exports.map(&:first)
+    @init_out.puts "__all__ = ["
+    @init_out.indent(2) do
+      exports.each { |export| @init_out.puts "\"#{export}\"," }
+    end
+    @init_out.puts "]"
   end
 
   def open_definition_file(definition_name, used_base_imports = [], used_constants = [])
@@ -123,11 +217,12 @@ class Generator < Xdrgen::Generators::Base
 
   # Walk a definition's members/arms and return the sorted list of
   # `.base` symbols it actually needs. Enums emit no pack/unpack code
-  # that references these, so they get an empty list.
+  # that references these, so they only get what `from_xdr_bytes`, `skip`
+  # and `unpack_fields` use.
   def collect_base_imports_used(defn)
-    return [] if defn.is_a?(AST::Definitions::Enum)
+    return (XDR_UTILS_BASE_IMPORTS + ENUM_FIELDS_BASE_IMPORTS).sort if defn.is_a?(AST::Definitions::Enum)
 
-    imports = Set.new(["DEFAULT_XDR_MAX_DEPTH"])
+    imports = Set.new(XDR_UTILS_BASE_IMPORTS + FIELDS_BASE_IMPORTS + CLONE_BASE_IMPORTS)
 
     declarations =
       case defn
@@ -147,6 +242,16 @@ class Generator < Xdrgen::Generators::Base
       cls = base_class_for_type(decl.type)
       imports << cls if cls
     end
+    imports << "FixedLayout" if fixed_layout_members(defn)
+    # The explicit-stack helpers of SCVal leave frozen values to their methods.
+    imports << "FrozenXdr" if defn.is_a?(AST::Definitions::Union) && name(defn) == "SCVal"
+    imports.merge(write_json_base_imports(defn))
+    if view_type?(defn)
+      imports.merge(VIEW_BASE_IMPORTS)
+      view_declarations = declarations.select { |decl| view_declaration?(decl) }
+      imports << "unpack_view" if view_declarations.any? { |decl| decl.is_a?(AST::Declarations::Array) }
+      imports << "view_at" if view_declarations.any? { |decl| !decl.is_a?(AST::Declarations::Array) }
+    end
 
     imports.to_a.sort
   end
@@ -181,6 +286,7 @@ class Generator < Xdrgen::Generators::Base
   end
 
   def render_const(const)
+    @constant_names << safe_identifier(const.name)
     render_const_source_comment(@constants_out, const)
     @constants_out.puts "#{safe_identifier(const.name)}: int = #{const_value(const.value)}"
   end
@@ -204,15 +310,40 @@ class Generator < Xdrgen::Generators::Base
         def pack(self, packer: Packer) -> None:
             packer.pack_int(self.value)
 
+        def xdr_size(self) -> int:
+            return 4
+
         @classmethod
         def unpack(cls, unpacker: Unpacker) -> #{enum_name}:
             value = unpacker.unpack_int()
-            return cls(value)
+            member = _BY_VALUE.get(value)
+            if member is None:
+                raise ValueError(f"{value} is not a valid #{enum_name}")
+            return member
+
+        @classmethod
+        def skip(cls, unpacker: Unpacker) -> None:
+            Integer.skip(unpacker)
+
+        @classmethod
+        def unpack_fields(cls, unpacker: Unpacker, fields: dict | None) -> #{enum_name}:
+            check_fields(cls, fields)
+            return cls.unpack(unpacker)
       HEREDOC
 
       render_xdr_utils(out, enum_name)
       render_enum_to_json(out, enum_name)
+      render_enum_write_json(out, enum_name)
+      out.puts <<~HEREDOC
+        def clone(self, deep: bool = True) -> #{enum_name}:
+            return self
+
+        def freeze(self) -> #{enum_name}:
+            return self
+      HEREDOC
     end
+    # Looking members up in a dict is much cheaper than calling the enum class.
+    out.puts "_BY_VALUE = {member.value: member for member in #{enum_name}}"
 
     out.close
   end
@@ -223,12 +354,15 @@ class Generator < Xdrgen::Generators::Base
 
     out = open_definition_file(typedef_name, collect_base_imports_used(typedef), collect_constants_used(typedef))
     render_import(out, typedef, typedef_name)
+    layouts = fixed_layout_members(typedef)
+    render_fixed_layout(out, layouts, typedef_name)
 
     out.puts "__all__ = ['#{typedef_name}']"
 
     out.puts "class #{typedef_name}:"
     out.indent(2) do
       render_source_comment(out, typedef)
+      render_slots(out, [typedef_name_underscore])
       out.puts "def __init__(self, #{typedef_name_underscore}: #{type_hint_string(typedef, typedef_name)}) -> None:"
       out.indent(2) do
         render_array_length_checker(typedef, out)
@@ -237,8 +371,13 @@ class Generator < Xdrgen::Generators::Base
 
       out.puts "def pack(self, packer: Packer) -> None:"
       out.indent(2) do
-        encode_member(typedef, out)
+        if layouts
+          render_fixed_layout_pack(out, layouts)
+        else
+          encode_member(typedef, out)
+        end
       end
+      render_xdr_size(out, [[typedef.declaration, "self.#{typedef_name_underscore}"]])
 
       out.puts "@classmethod"
       out.puts "def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> #{typedef_name}:"
@@ -247,12 +386,38 @@ class Generator < Xdrgen::Generators::Base
         out.indent(2) do
           out.puts "raise ValueError(\"Maximum decoding depth reached\")"
         end
-        decode_member(typedef, out, depth_aware: true)
-        out.puts "return cls(#{typedef_name_underscore})"
+        if layouts
+          render_fixed_layout_read(out, layouts)
+          out.puts "return cls(#{layouts.first.build})"
+        else
+          decode_member(typedef, out, depth_aware: true)
+          out.puts "return cls(#{typedef_name_underscore})"
+        end
+      end
+
+      render_skip_header(out)
+      out.indent(2) do
+        if layouts
+          out.puts "_LAYOUT.skip(unpacker)"
+        else
+          skip_member(typedef, out)
+        end
+      end
+
+      render_unpack_fields_header(out, typedef_name)
+      out.indent(2) do
+        render_member_fields(typedef, out)
+        out.puts "return _result"
+      end
+      render_decode_fields(out)
+      render_view(out, typedef) do
+        render_view_member(typedef, out, last: true)
       end
 
       render_xdr_utils(out, typedef_name)
       render_typedef_to_json(out, typedef, typedef_name, typedef_name_underscore)
+      render_typedef_write_json(out, typedef, typedef_name, typedef_name_underscore)
+      render_clone(out, typedef_name, [[typedef.declaration, typedef_name_underscore]])
       render_hash_and_eq(out, [typedef_name_underscore])
       out.puts <<~HEREDOC
         def __repr__(self):
@@ -285,6 +450,7 @@ class Generator < Xdrgen::Generators::Base
           # imports inside the unpack method body.
           render_import(out, arm.declaration, union_name, track: false)
         end
+        out.puts "from .sc_map_entry import SCMapEntry" if union_name == "SCVal"
       end
       return
     end
@@ -331,97 +497,975 @@ class Generator < Xdrgen::Generators::Base
     if type_string(discriminant_type) == "Uint32"
       return "if #{discriminant_name}.uint32 == #{union_case.value.value}:"
     end
-
-    "if #{discriminant_name} == #{union_case.value.value}:"
+
+    "if #{discriminant_name} == #{union_case.value.value}:"
+  end
+
+  def render_union_pack(out, union, union_name, discriminant_name)
+    out.puts "def pack(self, packer: Packer) -> None:"
+    out.indent(2) do
+      if union_name == "SCVal"
+        out.puts "if self.type in _NESTED_TYPES:"
+        out.indent(2) do
+          out.puts "_pack_nested(self, packer)"
+          out.puts "return"
+        end
+      end
+      out.puts encode_type(union.discriminant, "self.#{discriminant_name}")
+
+      union.normal_arms.each do |arm|
+        next if nested_scval_arm?(union_name, arm)
+
+        arm.cases.each do |union_case|
+          condition = render_union_case_condition(union.discriminant.type, "self.#{discriminant_name}", union_case)
+          out.puts condition
+
+          out.indent(2) do
+            encode_member(arm, out, true) unless arm.void?
+            out.puts "return"
+          end
+        end
+      end
+
+      if union.default_arm.present?
+        encode_member(union.default_arm, out, true) unless union.default_arm.void?
+      else
+        out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
+      end
+    end
+  end
+
+  # `clone` copies the mutable parts of a value (XDR objects and arrays) and
+  # shares its immutable leaves (ints, bytes, enum members). With
+  # `deep=False` the copy shares all its members with the original.
+  def render_clone(out, type_name, declarations)
+    out.puts "def clone(self, deep: bool = True) -> #{type_name}:"
+    out.indent(2) do
+      out.puts "if not deep:"
+      out.indent(2) do
+        out.puts "return shallow_clone(self)"
+      end
+      if type_name == "SCVal"
+        out.puts "if self.type in _NESTED_TYPES:"
+        out.indent(2) do
+          out.puts "return _clone_nested(self)"
+        end
+      end
+      out.puts "result = object.__new__(self.__class__)"
+      declarations.each do |decl, attribute_name, optional|
+        out.puts "result.#{attribute_name} = #{clone_expression(decl, "self.#{attribute_name}", optional)}"
+      end
+      out.puts "return result"
+    end
+    out.puts "def __deepcopy__(self, memo: dict) -> #{type_name}:"
+    out.indent(2) do
+      out.puts "return self.clone()"
+    end
+    out.puts "def freeze(self) -> #{type_name}:"
+    out.indent(2) do
+      out.puts "return make_frozen(self)"
+    end
+  end
+
+  def clone_expression(decl, value, optional = false)
+    if decl.is_a?(AST::Declarations::Array)
+      item = item_clone_expression(decl.type, "item")
+      expression = item == "item" ? "list(#{value})" : "[#{item} for item in #{value}]"
+    else
+      expression = item_clone_expression(decl.type, value)
+      return value if expression == value
+    end
+
+    optional ||= decl.type.respond_to?(:sub_type) && decl.type.sub_type == :optional
+    optional ? "#{expression} if #{value} is not None else None" : expression
+  end
+
+  def item_clone_expression(type, value)
+    definition =
+      case type
+      when AST::Typespecs::Simple then type.resolved_type
+      when AST::Definitions::Base then type
+      end
+    return value if definition.nil? || definition.is_a?(AST::Definitions::Enum)
+
+    "#{value}.clone()"
+  end
+
+  # `xdr_size` returns the length of the XDR encoding of a value without
+  # packing it. Sizes known at generation time, such as those of enums and
+  # of types with a fixed layout, are emitted as constants.
+  def render_xdr_size(out, declarations)
+    constant = 0
+    terms = []
+    declarations.each do |decl, value|
+      size = static_size(decl)
+      if size
+        constant += size
+      else
+        terms << size_expression(decl, value)
+      end
+    end
+    terms.unshift(constant.to_s) if constant.positive? || terms.empty?
+
+    out.puts "def xdr_size(self) -> int:"
+    out.indent(2) do
+      out.puts "return #{terms.join(' + ')}"
+    end
+  end
+
+  def render_union_xdr_size(out, union, union_name, discriminant_name)
+    out.puts "def xdr_size(self) -> int:"
+    out.indent(2) do
+      if union_name == "SCVal"
+        out.puts "if self.type in _NESTED_TYPES:"
+        out.indent(2) do
+          out.puts "return _xdr_size_nested(self)"
+        end
+      end
+      union.normal_arms.each do |arm|
+        arm.cases.each do |union_case|
+          out.puts render_union_case_condition(union.discriminant.type, "self.#{discriminant_name}", union_case)
+          out.indent(2) do
+            render_union_arm_size(out, arm)
+          end
+        end
+      end
+
+      if union.default_arm.present?
+        render_union_arm_size(out, union.default_arm)
+      else
+        out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
+      end
+    end
+  end
+
+  def render_union_arm_size(out, arm)
+    size = arm.void? ? 0 : static_size(arm.declaration)
+    if size
+      out.puts "return #{4 + size}"
+      return
+    end
+
+    arm_name = safe_identifier(arm.name.underscore)
+    out.puts "assert self.#{arm_name} is not None"
+    out.puts "return 4 + #{size_expression(arm.declaration, "self.#{arm_name}")}"
+  end
+
+  def size_expression(decl, value)
+    size = static_size(decl)
+    return size.to_s if size
+
+    if decl.is_a?(AST::Declarations::Array)
+      count = decl.fixed? ? "" : "4 + "
+      item_size = type_static_size(decl.type)
+      return "#{count}#{item_size} * len(#{value})" if item_size
+
+      return "#{count}sum(#{item_size_expression(decl, "item")} for item in #{value})"
+    end
+
+    if decl.type.respond_to?(:sub_type) && decl.type.sub_type == :optional
+      return "4 + (#{item_size_expression(decl, value)} if #{value} is not None else 0)"
+    end
+
+    item_size_expression(decl, value)
+  end
+
+  def item_size_expression(decl, value)
+    case decl.type
+    when AST::Typespecs::Opaque, AST::Typespecs::String
+      padded = "(len(#{value}) + 3) // 4 * 4"
+      decl.is_a?(AST::Declarations::Opaque) && decl.fixed? ? padded : "4 + #{padded}"
+    else
+      size = type_static_size(decl.type)
+      size ? size.to_s : "#{value}.xdr_size()"
+    end
+  end
+
+  def static_size(decl)
+    return nil if decl.type.respond_to?(:sub_type) && decl.type.sub_type == :optional
+
+    if decl.is_a?(AST::Declarations::Array)
+      return nil unless decl.fixed?
+
+      _, count = decl.type.array_size
+      item_size = type_static_size(decl.type)
+      return item_size && count.to_s.match?(/\A\d+\z/) ? item_size * count.to_i : nil
+    end
+
+    case decl.type
+    when AST::Typespecs::Opaque
+      decl.fixed? && decl.size.to_s.match?(/\A\d+\z/) ? (decl.size.to_i + 3) / 4 * 4 : nil
+    when AST::Typespecs::String
+      nil
+    else
+      type_static_size(decl.type)
+    end
+  end
+
+  def type_static_size(type)
+    case type
+    when AST::Typespecs::Int, AST::Typespecs::UnsignedInt, AST::Typespecs::Float, AST::Typespecs::Bool
+      4
+    when AST::Typespecs::Hyper, AST::Typespecs::UnsignedHyper, AST::Typespecs::Double
+      8
+    when AST::Typespecs::Simple
+      definition_static_size(type.resolved_type)
+    when AST::Definitions::Base
+      definition_static_size(type)
+    end
+  end
+
+  def definition_static_size(defn)
+    case defn
+    when AST::Definitions::Enum
+      4
+    when AST::Definitions::Typedef
+      static_size(defn.declaration)
+    when AST::Definitions::Struct
+      sizes = defn.members.map { |member| static_size(member.declaration) }
+      sizes.all? ? sizes.sum : nil
+    end
+  end
+
+  # Unions decode the selected arm with a function looked up in a table keyed
+  # on the discriminant, rather than with a chain of comparisons: SCVal alone
+  # has more than twenty arms.
+  def render_union_unpack(out, union, union_name, discriminant_name, render_import_in_func)
+    out.puts "@classmethod"
+    out.puts "def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> #{union_name}:"
+    out.indent(2) do
+      out.puts "if depth_limit <= 0:"
+      out.indent(2) do
+        out.puts "raise ValueError(\"Maximum decoding depth reached\")"
+      end
+      if render_import_in_func
+        out.puts "if not _arm_types_imported:"
+        out.indent(2) do
+          out.puts "_import_arm_types()"
+        end
+      end
+      out.puts "#{discriminant_name} = #{decode_type(union.discriminant)}"
+      key = union_discriminant_key(union, discriminant_name)
+      if union.default_arm.present?
+        out.puts "unpack_arm = _UNPACK_ARMS.get(#{key}, #{union_unpack_arm_name(union.default_arm)})"
+      else
+        out.puts "unpack_arm = _UNPACK_ARMS.get(#{key})"
+        out.puts "if unpack_arm is None:"
+        out.indent(2) do
+          out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
+        end
+      end
+      out.puts "return unpack_arm(cls, #{discriminant_name}, unpacker, depth_limit)"
+    end
+  end
+
+  def render_union_unpack_arms(out, union, union_name, discriminant_name, render_import_in_func)
+    arms = union.normal_arms
+    arms += [union.default_arm] if union.default_arm.present?
+    if arms.any?(&:void?)
+      out.puts "def _unpack_void(cls, #{discriminant_name}, unpacker: Unpacker, depth_limit: int) -> #{union_name}:"
+      out.indent(2) do
+        out.puts "return cls(#{discriminant_name}=#{discriminant_name})"
+      end
+    end
+
+    arms.reject(&:void?).each do |arm|
+      next if nested_scval_arm?(union_name, arm)
+
+      out.puts "def #{union_unpack_arm_name(arm)}(cls, #{discriminant_name}, unpacker: Unpacker, depth_limit: int) -> #{union_name}:"
+      out.indent(2) do
+        decode_member(arm, out, depth_aware: true)
+        arm_name = safe_identifier(arm.name.underscore)
+        out.puts "return cls(#{discriminant_name}=#{discriminant_name}, #{arm_name}=#{arm_name})"
+      end
+    end
+
+    render_nested_scval_codec(out) if union_name == "SCVal"
+
+    out.puts "_UNPACK_ARMS = {"
+    out.indent(2) do
+      union.normal_arms.each do |arm|
+        arm_name = nested_scval_arm?(union_name, arm) ? "_unpack_nested" : union_unpack_arm_name(arm)
+        arm.cases.each do |union_case|
+          out.puts "#{union_case_key(union.discriminant.type, union_case)}: #{arm_name},"
+        end
+      end
+    end
+    out.puts "}"
+    render_union_arm_types_import(out, union, union_name) if render_import_in_func
+  end
+
+  # The arm types of circularly imported unions import this module, so they
+  # can't be imported at the top. Import them into the module namespace on
+  # first decode instead of running an import statement on every call.
+  def render_union_arm_types_import(out, union, union_name)
+    type_names = non_void_arms(union).reject { |arm| is_base_type(arm.declaration.type) }.map { |arm| type_string(arm.declaration.type) }
+    type_names = type_names.uniq - [union_name]
+    type_names.insert(type_names.index("SCMap") + 1, "SCMapEntry") if union_name == "SCVal"
+
+    out.puts "_arm_types_imported = False"
+    out.puts "def _import_arm_types() -> None:"
+    out.indent(2) do
+      out.puts "global _arm_types_imported"
+      type_names.each do |type_name|
+        out.puts "global #{type_name}"
+        out.puts "from .#{python_module_name(type_name)} import #{type_name}"
+      end
+      out.puts "_arm_types_imported = True"
+    end
+  end
+
+  def nested_scval_arm?(union_name, arm)
+    union_name == "SCVal" && !arm.void? && NESTED_SCVAL_ARMS.include?(arm.name.underscore)
+  end
+
+  # Decodes, encodes, sizes, writes as JSON, clones and compares the
+  # NESTED_SCVAL_ARMS of SCVal in place of their per-arm unpack functions and
+  # the branches of the methods.
+  def render_nested_scval_codec(out)
+    out.puts <<~HEREDOC
+      # SCV_VEC and SCV_MAP values can nest as deep as the depth limit allows, so
+      # they are decoded, encoded, sized, written as JSON, cloned and compared with
+      # an explicit stack instead of recursing through SCVec, SCMap and SCMapEntry.
+      # The depth limit is applied as if the recursive codec was used.
+      _NESTED_TYPES = frozenset((SCValType.SCV_VEC, SCValType.SCV_MAP))
+      def _unpack_nested(cls, type, unpacker: Unpacker, depth_limit: int) -> SCVal:
+          # A frame is (is_vec, children, child_count, child_depth_limit) of a vec
+          # or map being decoded, the children of a map are its keys and values.
+          stack: list[tuple[bool, list[SCVal], int, int]] = []
+          while True:
+              if type in _NESTED_TYPES:
+                  is_vec = type == SCValType.SCV_VEC
+                  value_cls = SCVal if stack else cls
+                  if not unpacker.unpack_uint():
+                      value = value_cls(type=type, vec=None) if is_vec else value_cls(type=type, map=None)
+                  else:
+                      if depth_limit <= 1:
+                          raise ValueError("Maximum decoding depth reached")
+                      length = unpacker.unpack_uint()
+                      _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                      if _remaining < length:
+                          raise ValueError(f"{'sc_vec' if is_vec else 'sc_map'} length {length} exceeds remaining input length {_remaining}")
+                      if length:
+                          # SCVal -> SCVec -> SCVal and SCVal -> SCMap -> SCMapEntry -> SCVal
+                          depth_limit -= 2 if is_vec else 3
+                          if depth_limit <= 0:
+                              raise ValueError("Maximum decoding depth reached")
+                          stack.append((is_vec, [], length if is_vec else 2 * length, depth_limit))
+                          type = SCValType.unpack(unpacker)
+                          continue
+                      value = value_cls(type=type, vec=SCVec([])) if is_vec else value_cls(type=type, map=SCMap([]))
+              else:
+                  value = _UNPACK_ARMS[type](SCVal, type, unpacker, depth_limit)
+              while stack:
+                  is_vec, children, count, depth_limit = stack[-1]
+                  children.append(value)
+                  if len(children) < count:
+                      break
+                  stack.pop()
+                  value_cls = SCVal if stack else cls
+                  if is_vec:
+                      value = value_cls(type=SCValType.SCV_VEC, vec=SCVec(children))
+                  else:
+                      entries = [SCMapEntry(key=key, val=val) for key, val in zip(children[::2], children[1::2], strict=True)]
+                      value = value_cls(type=SCValType.SCV_MAP, map=SCMap(entries))
+              else:
+                  return value
+              type = SCValType.unpack(unpacker)
+      def _pack_nested(sc_val: SCVal, packer: Packer) -> None:
+          # A frame is (is_map, items) of a vec or map being encoded, with the vec
+          # items or the map entries still to encode. Map keys, which are rarely
+          # vecs or maps themselves, are encoded by SCVal.pack.
+          stack: list[tuple[bool, Iterator]] = [(False, iter((sc_val,)))]
+          while stack:
+              is_map, items = stack[-1]
+              for value in items:
+                  if is_map:
+                      value.key.pack(packer)
+                      value = value.val
+                  if value.type not in _NESTED_TYPES:
+                      value.pack(packer)
+                      continue
+                  value.type.pack(packer)
+                  if value.type == SCValType.SCV_VEC:
+                      if value.vec is None:
+                          packer.pack_uint(0)
+                          continue
+                      packer.pack_uint(1)
+                      packer.pack_uint(len(value.vec.sc_vec))
+                      stack.append((False, iter(value.vec.sc_vec)))
+                  else:
+                      if value.map is None:
+                          packer.pack_uint(0)
+                          continue
+                      packer.pack_uint(1)
+                      packer.pack_uint(len(value.map.sc_map))
+                      stack.append((True, iter(value.map.sc_map)))
+                  break
+              else:
+                  stack.pop()
+      def _xdr_size_nested(sc_val: SCVal) -> int:
+          # Walks the vecs and maps like _pack_nested.
+          size = 0
+          stack: list[tuple[bool, Iterator]] = [(False, iter((sc_val,)))]
+          while stack:
+              is_map, items = stack[-1]
+              for value in items:
+                  if is_map:
+                      size += value.key.xdr_size()
+                      value = value.val
+                  if value.type not in _NESTED_TYPES:
+                      size += value.xdr_size()
+                      continue
+                  # the type, the optional flag and the length
+                  if value.type == SCValType.SCV_VEC:
+                      if value.vec is None:
+                          size += 8
+                          continue
+                      size += 12
+                      stack.append((False, iter(value.vec.sc_vec)))
+                  else:
+                      if value.map is None:
+                          size += 8
+                          continue
+                      size += 12
+                      stack.append((True, iter(value.map.sc_map)))
+                  break
+              else:
+                  stack.pop()
+          return size
+      def _write_json_nested(sc_val: SCVal, write: Callable[[str], object]) -> None:
+          # A frame is (is_map, items, closing) of a vec or map being written, with
+          # its (index, item) pairs still to write and the text that closes it.
+          stack: list[tuple[bool, Iterator, str]] = [(False, enumerate((sc_val,)), "")]
+          while stack:
+              is_map, items, _ = stack[-1]
+              for index, value in items:
+                  if index:
+                      write(", ")
+                  if is_map:
+                      write('{"key": ')
+                      value.key._write_json(write)
+                      write(', "val": ')
+                      value = value.val
+                  if value.type not in _NESTED_TYPES:
+                      value._write_json(write)
+                      if is_map:
+                          write("}")
+                      continue
+                  if value.type == SCValType.SCV_VEC:
+                      assert value.vec is not None
+                      write('{"vec": [')
+                      stack.append((False, enumerate(value.vec.sc_vec), "]}"))
+                  else:
+                      assert value.map is not None
+                      write('{"map": [')
+                      stack.append((True, enumerate(value.map.sc_map), "]}"))
+                  break
+              else:
+                  write(stack.pop()[2])
+                  # closes the map entry whose value this was
+                  if stack and stack[-1][0]:
+                      write("}")
+      def _clone_nested(sc_val: SCVal) -> SCVal:
+          # A frame is (value, items, copies) of a vec or map being copied, with
+          # the vec items or map entries still to copy and the copies made so far,
+          # a key and a value for each map entry. Frozen values are thawed by their
+          # own clone.
+          if not _arm_types_imported:
+              _import_arm_types()
+          stack: list[tuple[SCVal, Iterator, list]] = []
+          value = sc_val
+          while True:
+              copy = None
+              if value.type not in _NESTED_TYPES or isinstance(value, FrozenXdr):
+                  copy = value.clone()
+              elif value.type == SCValType.SCV_VEC and value.vec is not None:
+                  stack.append((value, iter(value.vec.sc_vec), []))
+              elif value.type == SCValType.SCV_MAP and value.map is not None:
+                  stack.append((value, iter(value.map.sc_map), []))
+              else:
+                  copy = shallow_clone(value)
+              while True:
+                  if copy is not None:
+                      if not stack:
+                          return copy
+                      stack[-1][2].append(copy)
+                      copy = None
+                  source, items, copies = stack[-1]
+                  item = next(items, None)
+                  if item is not None:
+                      break
+                  stack.pop()
+                  copy = shallow_clone(source)
+                  if source.type == SCValType.SCV_VEC:
+                      copy.vec = SCVec(copies)
+                  else:
+                      copy.map = SCMap(
+                          [
+                              SCMapEntry(key=key, val=val)
+                              for key, val in zip(copies[::2], copies[1::2], strict=True)
+                          ]
+                      )
+              if source.type == SCValType.SCV_MAP:
+                  copies.append(item.key.clone())
+                  item = item.val
+              value = item
+      def _eq_nested(sc_val: SCVal, other: SCVal) -> bool:
+          # Compares the vec items and the map values pair by pair, and everything
+          # else, map keys included, with ==.
+          pairs = [(sc_val, other)]
+          while pairs:
+              value, other_value = pairs.pop()
+              if value is other_value:
+                  continue
+              if (
+                  value.type not in _NESTED_TYPES
+                  or isinstance(value, FrozenXdr)
+                  or isinstance(other_value, FrozenXdr)
+                  or not isinstance(other_value, value.__class__)
+              ):
+                  if value != other_value:
+                      return False
+                  continue
+              if value.type != other_value.type or any(
+                  getattr(value, name) != getattr(other_value, name)
+                  for name in _SCALAR_SLOTS
+              ):
+                  return False
+              if value.type == SCValType.SCV_VEC:
+                  items, other_items = value.vec, other_value.vec
+                  if items is None or other_items is None:
+                      if items is not other_items:
+                          return False
+                      continue
+                  if len(items.sc_vec) != len(other_items.sc_vec):
+                      return False
+                  pairs.extend(zip(items.sc_vec, other_items.sc_vec, strict=True))
+              else:
+                  entries, other_entries = value.map, other_value.map
+                  if entries is None or other_entries is None:
+                      if entries is not other_entries:
+                          return False
+                      continue
+                  if len(entries.sc_map) != len(other_entries.sc_map):
+                      return False
+                  for entry, other_entry in zip(
+                      entries.sc_map, other_entries.sc_map, strict=True
+                  ):
+                      if entry.key != other_entry.key:
+                          return False
+                      pairs.append((entry.val, other_entry.val))
+          return True
+      # The members other than the type and the nested vec and map arms.
+      _SCALAR_SLOTS = tuple(name for name in SCVal.__slots__ if name not in ("type", "vec", "map"))
+    HEREDOC
+  end
+
+  def union_unpack_arm_name(arm)
+    arm.void? ? "_unpack_void" : "_unpack_#{safe_identifier(arm.name.underscore)}"
+  end
+
+  def union_discriminant_key(union, discriminant_name)
+    type_string(union.discriminant.type) == "Uint32" ? "#{discriminant_name}.uint32" : discriminant_name
+  end
+
+  def union_case_key(discriminant_type, union_case)
+    if union_case.value.is_a?(AST::Identifier)
+      "#{type_string(discriminant_type)}.#{safe_identifier(union_case.value.name)}"
+    else
+      union_case.value.value.to_s
+    end
+  end
+
+  # Returns the fixed layouts of the members of a struct or typedef whose
+  # encoding has a fixed size, or nil. Such types are packed and unpacked
+  # with a single precompiled `struct.Struct` call (`FixedLayout` in
+  # base.py) instead of one Packer/Unpacker call per member.
+  def fixed_layout_members(defn)
+    members =
+      case defn
+      when AST::Definitions::Struct then defn.members
+      when AST::Definitions::Typedef then [defn]
+      else return nil
+      end
+
+    layouts = members.map do |member|
+      member_name = safe_identifier(member.name.underscore)
+      fixed_layout(member.declaration, "self.#{member_name}", member_name)
+    end
+    return nil unless layouts.all?
+    # A lone fixed opaque value (Hash, Uint256, ...) is already read and
+    # written with a single Packer/Unpacker call.
+    return nil if layouts.map(&:format).join.match?(/\A\d+s(\d+x)?\z/)
+
+    layouts
+  end
+
+  def fixed_layout(decl, value, var)
+    return nil if decl.is_a?(AST::Declarations::Array)
+    return nil if decl.type.respond_to?(:sub_type) && decl.type.sub_type == :optional
+
+    case decl.type
+    when *STRUCT_FORMATS.keys
+      Layout.new(format: STRUCT_FORMATS[decl.type.class], pack_values: [value], names: [var], build: var, types: [])
+    when AST::Typespecs::Bool
+      Layout.new(format: "I", pack_values: ["1 if #{value} else 0"], names: [var], build: "bool(#{var})", types: [])
+    when AST::Typespecs::Opaque
+      return nil unless decl.fixed? && decl.size.to_s.match?(/\A\d+\z/)
+
+      size = decl.size.to_i
+      return nil if size >= ZERO_COPY_MIN_SIZE
+
+      padding = -size % 4
+      format = padding.zero? ? "#{size}s" : "#{size}s#{padding}x"
+      Layout.new(format: format, pack_values: [value], names: [var], build: var, types: [])
+    when AST::Typespecs::Simple
+      named_fixed_layout(decl.type.resolved_type, value, var)
+    end
+  end
+
+  def named_fixed_layout(defn, value, var)
+    type_name = name(defn)
+    case defn
+    when AST::Definitions::Enum
+      Layout.new(format: "i", pack_values: [value], names: [var], build: "#{type_name}(#{var})", types: [type_name])
+    when AST::Definitions::Typedef
+      inner = fixed_layout(defn.declaration, "#{value}.#{safe_identifier(defn.name.underscore)}", var)
+      return nil unless inner
+
+      Layout.new(
+        format: inner.format,
+        pack_values: inner.pack_values,
+        names: inner.names,
+        build: "#{type_name}(#{inner.build})",
+        types: [type_name] + inner.types
+      )
+    when AST::Definitions::Struct
+      parts = defn.members.map do |member|
+        member_name = safe_identifier(member.name.underscore)
+        fixed_layout(member.declaration, "#{value}.#{member_name}", "#{var}_#{member_name}")
+      end
+      return nil unless parts.all?
+
+      arguments = defn.members.zip(parts).map { |member, part| "#{safe_identifier(member.name.underscore)}=#{part.build}" }
+      Layout.new(
+        format: parts.map(&:format).join,
+        pack_values: parts.flat_map(&:pack_values),
+        names: parts.flat_map(&:names),
+        build: "#{type_name}(#{arguments.join(', ')})",
+        types: [type_name] + parts.flat_map(&:types)
+      )
+    end
+  end
+
+  def render_fixed_layout(out, layouts, container_name)
+    return unless layouts
+
+    layouts.flat_map(&:types).uniq.each do |type_name|
+      next if type_name == container_name || @imported_types.include?(type_name)
+
+      @imported_types.add(type_name)
+      out.puts "from .#{python_module_name(type_name)} import #{type_name}"
+    end
+    out.puts "_LAYOUT = FixedLayout(\">#{layouts.map(&:format).join}\")"
+  end
+
+  def render_fixed_layout_pack(out, layouts)
+    out.puts "_LAYOUT.write(packer, #{layouts.flat_map(&:pack_values).join(', ')})"
+  end
+
+  def render_fixed_layout_read(out, layouts)
+    names = layouts.flat_map(&:names)
+    targets = names.size == 1 ? "(#{names.first},)" : names.join(", ")
+    out.puts "#{targets} = _LAYOUT.read(unpacker)"
+  end
+
+  def render_union_skip(out, union, union_name, discriminant_name, render_import_in_func)
+    render_skip_header(out)
+    out.indent(2) do
+      out.puts "#{discriminant_name} = #{decode_type(union.discriminant)}"
+
+      union.normal_arms.each do |arm|
+        arm.cases.each do |union_case|
+          out.puts render_union_case_condition(union.discriminant.type, discriminant_name, union_case)
+          out.indent(2) do
+            unless arm.void?
+              render_import(out, arm.declaration, union_name, track: false) if render_import_in_func
+              skip_member(arm, out)
+            end
+            out.puts "return"
+          end
+        end
+      end
+
+      if !union.default_arm.present?
+        out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
+      elsif !union.default_arm.void?
+        skip_member(union.default_arm, out)
+      end
+    end
+  end
+
+  def render_union_unpack_fields(out, union, union_name, discriminant_name, render_import_in_func)
+    render_unpack_fields_header(out, union_name)
+    out.indent(2) do
+      out.puts "#{discriminant_name} = #{decode_type(union.discriminant)}"
+      out.puts "if \"#{discriminant_name}\" in fields:"
+      out.indent(2) do
+        out.puts "_result[\"#{discriminant_name}\"] = #{discriminant_name}"
+      end
+
+      union.normal_arms.each do |arm|
+        arm.cases.each do |union_case|
+          out.puts render_union_case_condition(union.discriminant.type, discriminant_name, union_case)
+          out.indent(2) do
+            unless arm.void?
+              render_import(out, arm.declaration, union_name, track: false) if render_import_in_func
+              render_member_fields(arm, out)
+            end
+            out.puts "return _result"
+          end
+        end
+      end
+
+      if !union.default_arm.present?
+        out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
+      else
+        render_member_fields(union.default_arm, out) unless union.default_arm.void?
+        out.puts "return _result"
+      end
+    end
+  end
+
+  # `skip` advances the unpacker past a value without building it, and
+  # `unpack_fields` decodes only the members selected by a tree of names,
+  # skipping the others. Together they let `decode_fields` pull a few values
+  # out of large payloads such as LedgerCloseMeta.
+  def render_skip_header(out)
+    out.puts "@classmethod"
+    out.puts "def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:"
+    out.indent(2) do
+      out.puts "if depth_limit <= 0:"
+      out.indent(2) do
+        out.puts "raise ValueError(\"Maximum decoding depth reached\")"
+      end
+    end
+  end
+
+  def render_unpack_fields_header(out, name)
+    out.puts "@classmethod"
+    out.puts "def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | #{name}:"
+    out.indent(2) do
+      out.puts "if fields is None:"
+      out.indent(2) do
+        out.puts "return cls.unpack(unpacker, depth_limit)"
+      end
+      out.puts "if depth_limit <= 0:"
+      out.indent(2) do
+        out.puts "raise ValueError(\"Maximum decoding depth reached\")"
+      end
+      out.puts "check_fields(cls, fields)"
+      out.puts "_result: dict = {}"
+    end
+  end
+
+  def render_decode_fields(out)
+    out.puts <<~HEREDOC
+      @classmethod
+      def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+          return decode_field_paths(cls, xdr, paths, zero_copy)
+    HEREDOC
+  end
+
+  # Whether the encoding of a value has a bounded size: no variable-length
+  # arrays, directly or in nested types. Views decode the members of such
+  # types as usual and return views of the members of other types.
+  def bounded_declaration?(decl)
+    return false if decl.is_a?(AST::Declarations::Array) && !decl.fixed?
+
+    case decl.type
+    when AST::Typespecs::Simple
+      bounded_definition?(decl.type.resolved_type)
+    when AST::Concerns::NestedDefinition
+      bounded_definition?(decl.type)
+    else
+      true
+    end
+  end
+
+  def bounded_definition?(defn)
+    @bounded_definitions ||= {}
+    key = name(defn)
+    return @bounded_definitions[key] if @bounded_definitions.key?(key)
+
+    # a type that contains itself is unbounded
+    @bounded_definitions[key] = false
+    @bounded_definitions[key] =
+      case defn
+      when AST::Definitions::Enum
+        true
+      when AST::Definitions::Struct
+        defn.members.all? { |member| bounded_declaration?(member.declaration) }
+      when AST::Definitions::Union
+        non_void_arms(defn).all? { |arm| bounded_declaration?(arm.declaration) }
+      when AST::Definitions::Typedef
+        bounded_declaration?(defn.declaration)
+      end
+  end
+
+  def view_type?(defn)
+    !defn.is_a?(AST::Definitions::Enum) && !bounded_definition?(defn)
+  end
+
+  def view_declaration?(decl)
+    case decl.type
+    when AST::Typespecs::Simple
+      view_type?(decl.type.resolved_type)
+    when AST::Concerns::NestedDefinition
+      view_type?(decl.type)
+    else
+      false
+    end
+  end
+
+  # Structs, unions and typedefs whose encoding can be large get a `view`
+  # method returning an XdrView (templates/base.py). `_view_members` yields
+  # the members in encoding order, with the values of unbounded types as
+  # views, and is resumed by the view as far as the accessed members. A
+  # member view is only skipped over once the next member is needed, so
+  # reading the first members of a large value does not scan all of it.
+  def render_view(out, defn)
+    return unless view_type?(defn)
+
+    out.puts <<~HEREDOC
+      @classmethod
+      def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+          return make_view(cls, xdr, zero_copy)
+      @classmethod
+      def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+    HEREDOC
+    out.indent(2) do
+      out.puts "if depth_limit <= 0:"
+      out.indent(2) do
+        out.puts "raise ValueError(\"Maximum decoding depth reached\")"
+      end
+      yield
+    end
   end
 
-  def render_union_pack(out, union, discriminant_name)
-    out.puts "def pack(self, packer: Packer) -> None:"
-    out.indent(2) do
-      out.puts encode_type(union.discriminant, "self.#{discriminant_name}")
+  def render_union_view(out, union, union_name, discriminant_name, render_import_in_func)
+    render_view(out, union) do
+      out.puts "#{discriminant_name} = #{decode_type(union.discriminant)}"
+      out.puts "yield \"#{discriminant_name}\", #{discriminant_name}"
 
       union.normal_arms.each do |arm|
         arm.cases.each do |union_case|
-          condition = render_union_case_condition(union.discriminant.type, "self.#{discriminant_name}", union_case)
-          out.puts condition
-
+          out.puts render_union_case_condition(union.discriminant.type, discriminant_name, union_case)
           out.indent(2) do
-            encode_member(arm, out, true) unless arm.void?
+            unless arm.void?
+              render_import(out, arm.declaration, union_name, track: false) if render_import_in_func
+              render_view_member(arm, out, last: true)
+            end
             out.puts "return"
           end
         end
       end
 
-      if union.default_arm.present?
-        encode_member(union.default_arm, out, true) unless union.default_arm.void?
-      else
+      if !union.default_arm.present?
         out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
+      elsif !union.default_arm.void?
+        render_view_member(union.default_arm, out, last: true)
       end
     end
   end
 
-  def render_union_unpack_match(out, arm, union_name, discriminant_name, render_import_in_func)
-    if arm.void?
-      out.puts "return cls(#{discriminant_name}=#{discriminant_name})"
+  def render_view_member(member, out, last: false)
+    member_name_underscore = safe_identifier(member.name.underscore)
+    type = type_string(member.declaration.type)
+    optional = member.type.sub_type == :optional
+
+    if member.declaration.is_a?(AST::Declarations::Array)
+      value =
+        if view_declaration?(member.declaration)
+          "unpack_view(#{type}, unpacker, depth_limit - 1)"
+        else
+          decode_type(member.declaration, depth_aware: true)
+        end
+      decode_member(member, out, decoded: value)
+      out.puts "yield \"#{member_name_underscore}\", #{member_name_underscore}"
       return
     end
 
-    render_import(out, arm.declaration, union_name, track: false) if render_import_in_func
-
-    decode_member(arm, out, depth_aware: true)
-    arm_name = safe_identifier(arm.name.underscore)
-    out.puts "return cls(#{discriminant_name}=#{discriminant_name}, #{arm_name}=#{arm_name})"
-  end
-
-  def render_union_default_unpack(out, union, discriminant_name)
-    if union.default_arm.present?
-      if !union.default_arm.void?
-        decode_member(union.default_arm, out, depth_aware: true)
-        arm_name = safe_identifier(union.default_arm.name.underscore)
-        out.puts "return cls(#{discriminant_name}=#{discriminant_name}, #{arm_name}=#{arm_name})"
-      else
-        out.puts "return cls(#{discriminant_name}=#{discriminant_name})"
-      end
+    unless view_declaration?(member.declaration)
+      value = decode_type(member.declaration, depth_aware: true)
+      value = "#{value} if unpacker.unpack_uint() else None" if optional
+      out.puts "yield \"#{member_name_underscore}\", #{value}"
       return
     end
 
-    out.puts "raise ValueError(\"Invalid #{discriminant_name}.\")"
-  end
+    value = "view_at(#{type}, unpacker, depth_limit - 1)"
+    value = "#{value} if unpacker.unpack_uint() else None" if optional
+    if last
+      out.puts "yield \"#{member_name_underscore}\", #{value}"
+      return
+    end
 
-  def render_union_unpack(out, union, union_name, discriminant_name, render_import_in_func)
-    out.puts "@classmethod"
-    out.puts "def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> #{union_name}:"
-    out.indent(2) do
-      out.puts "if depth_limit <= 0:"
+    out.puts "#{member_name_underscore} = #{value}"
+    out.puts "yield \"#{member_name_underscore}\", #{member_name_underscore}"
+    if optional
+      out.puts "if #{member_name_underscore} is not None:"
       out.indent(2) do
-        out.puts "raise ValueError(\"Maximum decoding depth reached\")"
-      end
-      out.puts "#{discriminant_name} = #{decode_type(union.discriminant)}"
-
-      union.normal_arms.each do |arm|
-        arm.cases.each do |union_case|
-          condition = render_union_case_condition(union.discriminant.type, discriminant_name, union_case)
-          out.puts condition
-
-          out.indent(2) do
-            render_union_unpack_match(out, arm, union_name, discriminant_name, render_import_in_func)
-          end
-        end
+        out.puts "#{type}.skip(unpacker, depth_limit - 1)"
       end
+    else
+      out.puts "#{type}.skip(unpacker, depth_limit - 1)"
+    end
+  end
 
-      render_union_default_unpack(out, union, discriminant_name)
+  def render_member_fields(member, out)
+    member_name_underscore = safe_identifier(member.name.underscore)
+    out.puts "if \"#{member_name_underscore}\" in fields:"
+    out.indent(2) do
+      decode_member(
+        member,
+        out,
+        target: "_result[\"#{member_name_underscore}\"]",
+        decoded: decode_fields_type(member.declaration, "fields[\"#{member_name_underscore}\"]")
+      )
+    end
+    out.puts "else:"
+    out.indent(2) do
+      skip_member(member, out)
     end
   end
 
-  def render_hash_and_eq(out, attribute_names)
+  # Generated classes only ever carry their XDR members, so declare them as
+  # __slots__: decoded trees hold no per-instance __dict__, which cuts memory
+  # use substantially for large payloads such as LedgerCloseMeta.
+  def render_slots(out, attribute_names)
+    slots = attribute_names.sort.map { |name| "\"#{name}\"" }
+    slots_str = slots.size == 1 ? "#{slots.first}," : slots.join(", ")
+    out.puts "__slots__ = (#{slots_str})"
+  end
+
+  def render_hash_and_eq(out, attribute_names, nested_scval: false)
     out.puts <<~HEREDOC
       def __hash__(self):
           return hash((#{attribute_names.map { |name| "self.#{name}" }.join(", ")},))
       def __eq__(self, other: object):
           if not isinstance(other, self.__class__):
               return NotImplemented
-          return #{attribute_names.map { |name| "self.#{name} == other.#{name}" }.join(" and ")}
     HEREDOC
+    out.indent(2) do
+      if nested_scval
+        out.puts "if self.type in _NESTED_TYPES:"
+        out.indent(2) do
+          out.puts "return _eq_nested(self, other)"
+        end
+      end
+      out.puts "return #{attribute_names.map { |name| "self.#{name} == other.#{name}" }.join(" and ")}"
+    end
   end
 
   def render_union_repr(out, union, union_name, discriminant_name)
@@ -452,17 +1496,32 @@ class Generator < Xdrgen::Generators::Base
     out.indent(2) do
       render_source_comment(out, union)
       discriminant_name = safe_identifier(union.discriminant.name.underscore)
+      attribute_names = [discriminant_name] + non_void_arms(union).map { |arm| safe_identifier(arm.name.underscore) }
+      render_slots(out, attribute_names)
       render_union_initializer(out, union, union_name, discriminant_name)
-      render_union_pack(out, union, discriminant_name)
+      render_union_pack(out, union, union_name, discriminant_name)
+      render_union_xdr_size(out, union, union_name, discriminant_name)
       render_union_unpack(out, union, union_name, discriminant_name, render_import_in_func)
+      render_union_skip(out, union, union_name, discriminant_name, render_import_in_func)
+      render_union_unpack_fields(out, union, union_name, discriminant_name, render_import_in_func)
+      render_decode_fields(out)
+      render_union_view(out, union, union_name, discriminant_name, render_import_in_func)
 
       render_xdr_utils(out, union_name)
       render_union_to_json(out, union, union_name, discriminant_name, render_import_in_func)
-
-      attribute_names = [discriminant_name] + non_void_arms(union).map { |arm| safe_identifier(arm.name.underscore) }
-      render_hash_and_eq(out, attribute_names)
+      render_union_write_json(out, union, union_name, discriminant_name)
+      render_clone(
+        out,
+        union_name,
+        [[union.discriminant, discriminant_name]] +
+          non_void_arms(union).map { |arm| [arm.declaration, safe_identifier(arm.name.underscore), true] }
+      )
+
+      render_hash_and_eq(out, attribute_names, nested_scval: union_name == "SCVal")
       render_union_repr(out, union, union_name, discriminant_name)
     end
+    discriminant_name = safe_identifier(union.discriminant.name.underscore)
+    render_union_unpack_arms(out, union, union_name, discriminant_name, render_import_in_func)
 
     out.close
   end
@@ -496,16 +1555,20 @@ class Generator < Xdrgen::Generators::Base
     end
   end
 
-  def render_struct_pack(out, struct)
+  def render_struct_pack(out, struct, layouts)
     out.puts "def pack(self, packer: Packer) -> None:"
     out.indent(2) do
-      struct.members.each do |member|
-        encode_member(member, out)
+      if layouts
+        render_fixed_layout_pack(out, layouts)
+      else
+        struct.members.each do |member|
+          encode_member(member, out)
+        end
       end
     end
   end
 
-  def render_struct_unpack(out, struct, struct_name)
+  def render_struct_unpack(out, struct, struct_name, layouts)
     out.puts "@classmethod"
     out.puts "def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> #{struct_name}:"
     out.indent(2) do
@@ -513,21 +1576,48 @@ class Generator < Xdrgen::Generators::Base
       out.indent(2) do
         out.puts "raise ValueError(\"Maximum decoding depth reached\")"
       end
-      struct.members.each do |member|
-        decode_member(member, out, depth_aware: true)
+      if layouts
+        render_fixed_layout_read(out, layouts)
+      else
+        struct.members.each do |member|
+          decode_member(member, out, depth_aware: true)
+        end
       end
 
       out.puts "return cls("
       out.indent(2) do
-        struct.members.each do |member|
+        struct.members.each_with_index do |member, i|
           member_name = safe_identifier(member.name.underscore)
-          out.puts "#{member_name}=#{member_name},"
+          out.puts "#{member_name}=#{layouts ? layouts[i].build : member_name},"
         end
       end
       out.puts ")"
     end
   end
 
+  def render_struct_skip(out, struct, layouts)
+    render_skip_header(out)
+    out.indent(2) do
+      if layouts
+        out.puts "_LAYOUT.skip(unpacker)"
+      else
+        struct.members.each do |member|
+          skip_member(member, out)
+        end
+      end
+    end
+  end
+
+  def render_struct_unpack_fields(out, struct, struct_name)
+    render_unpack_fields_header(out, struct_name)
+    out.indent(2) do
+      struct.members.each do |member|
+        render_member_fields(member, out)
+      end
+      out.puts "return _result"
+    end
+  end
+
   def render_struct_repr(out, struct_name, member_names)
     out.puts "def __repr__(self):"
     out.indent(2) do
@@ -549,20 +1639,34 @@ class Generator < Xdrgen::Generators::Base
     struct.members.each do |member|
       render_import(out, member.declaration, struct_name)
     end
+    layouts = fixed_layout_members(struct)
+    render_fixed_layout(out, layouts, struct_name)
 
     out.puts "__all__ = ['#{struct_name}']"
 
     out.puts "class #{struct_name}:"
     out.indent(2) do
       render_source_comment(out, struct)
+      member_names = struct_member_names(struct)
+      render_slots(out, member_names)
       render_struct_initializer(out, struct, struct_name)
-      render_struct_pack(out, struct)
-      render_struct_unpack(out, struct, struct_name)
+      render_struct_pack(out, struct, layouts)
+      render_xdr_size(out, struct.members.map { |member| [member.declaration, "self.#{safe_identifier(member.name.underscore)}"] })
+      render_struct_unpack(out, struct, struct_name, layouts)
+      render_struct_skip(out, struct, layouts)
+      render_struct_unpack_fields(out, struct, struct_name)
+      render_decode_fields(out)
+      render_view(out, struct) do
+        struct.members.each_with_index do |member, index|
+          render_view_member(member, out, last: index == struct.members.length - 1)
+        end
+      end
 
       render_xdr_utils(out, struct_name)
       render_struct_to_json(out, struct, struct_name)
+      render_struct_write_json(out, struct, struct_name)
+      render_clone(out, struct_name, struct.members.map { |member| [member.declaration, safe_identifier(member.name.underscore)] })
 
-      member_names = struct_member_names(struct)
       render_hash_and_eq(out, member_names)
       render_struct_repr(out, struct_name, member_names)
     end
@@ -605,34 +1709,62 @@ class Generator < Xdrgen::Generators::Base
     end
   end
 
-  def decode_member(member, out, depth_aware: false)
+  def decode_member(member, out, depth_aware: false, target: nil, decoded: nil)
     member_name_underscore = safe_identifier(member.name.underscore)
-    decoded_member_declaration = decode_type(member.declaration, depth_aware: depth_aware)
+    target ||= member_name_underscore
+    decoded_member_declaration = decoded || decode_type(member.declaration, depth_aware: depth_aware)
 
     case member.declaration
     when AST::Declarations::Array
-      if member.declaration.fixed?
-        _, size = member.declaration.type.array_size
-        out.puts "length = #{size}"
-      else
-        out.puts "length = unpacker.unpack_uint()"
-        # Add input length check to prevent DoS
-        out.puts "_remaining = len(unpacker.get_buffer()) - unpacker.get_position()"
-        out.puts "if _remaining < length:"
-        out.indent(2) do
-          out.puts "raise ValueError(f\"#{member_name_underscore} length {length} exceeds remaining input length {_remaining}\")"
-        end
-      end
+      render_array_length(member, out)
       out.puts <<~EOS
-        #{member_name_underscore} = []
+        #{target} = []
         for _ in range(length):
-            #{member_name_underscore}.append(#{decoded_member_declaration})
+            #{target}.append(#{decoded_member_declaration})
       EOS
     else
       if member.type.sub_type == :optional
-        out.puts "#{member_name_underscore} = #{decoded_member_declaration} if unpacker.unpack_uint() else None"
+        out.puts "#{target} = #{decoded_member_declaration} if unpacker.unpack_uint() else None"
+      else
+        out.puts "#{target} = #{decoded_member_declaration}"
+      end
+    end
+  end
+
+  def skip_member(member, out)
+    skipped_member_declaration = skip_type(member.declaration)
+
+    case member.declaration
+    when AST::Declarations::Array
+      render_array_length(member, out)
+      out.puts "for _ in range(length):"
+      out.indent(2) do
+        out.puts skipped_member_declaration
+      end
+    else
+      if member.type.sub_type == :optional
+        out.puts "if unpacker.unpack_uint():"
+        out.indent(2) do
+          out.puts skipped_member_declaration
+        end
       else
-        out.puts "#{member_name_underscore} = #{decoded_member_declaration}"
+        out.puts skipped_member_declaration
+      end
+    end
+  end
+
+  def render_array_length(member, out)
+    member_name_underscore = safe_identifier(member.name.underscore)
+    if member.declaration.fixed?
+      _, size = member.declaration.type.array_size
+      out.puts "length = #{size}"
+    else
+      out.puts "length = unpacker.unpack_uint()"
+      # Add input length check to prevent DoS
+      out.puts "_remaining = len(unpacker.get_buffer()) - unpacker.get_position()"
+      out.puts "if _remaining < length:"
+      out.indent(2) do
+        out.puts "raise ValueError(f\"#{member_name_underscore} length {length} exceeds remaining input length {_remaining}\")"
       end
     end
   end
@@ -644,7 +1776,7 @@ class Generator < Xdrgen::Generators::Base
       from __future__ import annotations
 
       import base64
-      import json
+      from collections.abc import Callable, Iterator
       from enum import IntEnum
       from typing import TYPE_CHECKING
       from xdrlib3 import Packer, Unpacker
@@ -712,10 +1844,10 @@ class Generator < Xdrgen::Generators::Base
           return packer.get_buffer()
 
       @classmethod
-      def from_xdr_bytes(cls, xdr: bytes) -> #{name}:
-          unpacker = Unpacker(xdr)
+      def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> #{name}:
+          unpacker = make_unpacker(xdr, zero_copy)
           result = cls.unpack(unpacker)
-          remaining = len(xdr) - unpacker.get_position()
+          remaining = len(unpacker.get_buffer()) - unpacker.get_position()
           if remaining != 0:
               raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
           return result
@@ -730,19 +1862,20 @@ class Generator < Xdrgen::Generators::Base
           return cls.from_xdr_bytes(xdr_bytes)
 
       def to_json(self) -> str:
-          return json.dumps(self.to_json_dict())
+          return xdr_to_json(self)
 
       @classmethod
       def from_json(cls, json_str: str) -> #{name}:
-          return cls.from_json_dict(json.loads(json_str))
+          return cls.from_json_dict(json_loads(json_str))
     HEREDOC
   end
 
   def render_base_classes
-    out = @output.open("base.py")
-    base_py_content = IO.read("#{__dir__}/templates/base.py")
-    out.puts(base_py_content)
-    out.close
+    TEMPLATE_MODULES.each do |module_name|
+      out = @output.open("#{module_name}.py")
+      out.puts(IO.read("#{__dir__}/templates/#{module_name}.py"))
+      out.close
+    end
   end
 
   def encode_type(decl, value)
@@ -811,6 +1944,84 @@ class Generator < Xdrgen::Generators::Base
     end
   end
 
+  def skip_type(decl)
+    case decl.type
+    when AST::Typespecs::Int
+      "Integer.skip(unpacker)"
+    when AST::Typespecs::UnsignedInt
+      "UnsignedInteger.skip(unpacker)"
+    when AST::Typespecs::Hyper
+      "Hyper.skip(unpacker)"
+    when AST::Typespecs::UnsignedHyper
+      "UnsignedHyper.skip(unpacker)"
+    when AST::Typespecs::Float
+      "Float.skip(unpacker)"
+    when AST::Typespecs::Double
+      "Double.skip(unpacker)"
+    when AST::Typespecs::Quadruple
+      raise "cannot render quadruple in Python"
+    when AST::Typespecs::Bool
+      "Boolean.skip(unpacker)"
+    when AST::Typespecs::Opaque
+      "Opaque.skip(unpacker, #{decl.size || MAX_SIZE}, #{decl.fixed? ? "True" : "False"})"
+    when AST::Typespecs::String
+      "String.skip(unpacker, #{decl.size || MAX_SIZE})"
+    when AST::Typespecs::Simple
+      if decl.type.resolved_type.is_a?(AST::Definitions::Enum)
+        "#{name(decl.type.resolved_type)}.skip(unpacker)"
+      else
+        "#{name(decl.type.resolved_type)}.skip(unpacker, depth_limit - 1)"
+      end
+    when AST::Concerns::NestedDefinition
+      if decl.type.is_a?(AST::Definitions::Enum)
+        "#{name(decl.type)}.skip(unpacker)"
+      else
+        "#{name(decl.type)}.skip(unpacker, depth_limit - 1)"
+      end
+    else
+      raise "Unknown typespec: #{decl.type.class.name}"
+    end
+  end
+
+  def decode_fields_type(decl, fields)
+    case decl.type
+    when AST::Typespecs::Int
+      "Integer.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::UnsignedInt
+      "UnsignedInteger.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::Hyper
+      "Hyper.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::UnsignedHyper
+      "UnsignedHyper.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::Float
+      "Float.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::Double
+      "Double.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::Quadruple
+      raise "cannot render quadruple in Python"
+    when AST::Typespecs::Bool
+      "Boolean.unpack_fields(unpacker, #{fields})"
+    when AST::Typespecs::Opaque
+      "Opaque.unpack_fields(unpacker, #{fields}, #{decl.size || MAX_SIZE}, #{decl.fixed? ? "True" : "False"})"
+    when AST::Typespecs::String
+      "String.unpack_fields(unpacker, #{fields}, #{decl.size || MAX_SIZE})"
+    when AST::Typespecs::Simple
+      if decl.type.resolved_type.is_a?(AST::Definitions::Enum)
+        "#{name(decl.type.resolved_type)}.unpack_fields(unpacker, #{fields})"
+      else
+        "#{name(decl.type.resolved_type)}.unpack_fields(unpacker, #{fields}, depth_limit - 1)"
+      end
+    when AST::Concerns::NestedDefinition
+      if decl.type.is_a?(AST::Definitions::Enum)
+        "#{name(decl.type)}.unpack_fields(unpacker, #{fields})"
+      else
+        "#{name(decl.type)}.unpack_fields(unpacker, #{fields}, depth_limit - 1)"
+      end
+    else
+      raise "Unknown typespec: #{decl.type.class.name}"
+    end
+  end
+
   # ============================================================================
   # JSON encoding/decoding helpers (SEP-0051)
   # ============================================================================
@@ -1327,6 +2538,178 @@ class Generator < Xdrgen::Generators::Base
     end
   end
 
+  # ============================================================================
+  # Streaming JSON writers
+  # ============================================================================
+
+  # `_write_json` writes the same text as `to_json`, in pieces, to a `write`
+  # callable (dump_xdr_json in templates/stream.py), so large values such as
+  # LedgerCloseMeta are never held as a to_json_dict tree. Values of base
+  # types go through json_encode, arrays of other types through
+  # write_json_array, and the Stellar-specific types, whose JSON is a single
+  # string, through their to_json_dict.
+  def write_json_base_imports(defn)
+    return %w[json_encode] if stellar_specific_type?(name(defn))
+
+    imports = []
+    declarations =
+      case defn
+      when AST::Definitions::Struct
+        defn.members.map(&:declaration)
+      when AST::Definitions::Union
+        non_void_arms(defn).map(&:declaration)
+      when AST::Definitions::Typedef
+        [defn.declaration]
+      end
+    if declarations.any? { |decl| base_class_for_type(decl.type) } ||
+       (defn.is_a?(AST::Definitions::Union) && defn.default_arm.present?)
+      imports << "json_encode"
+    end
+    if declarations.any? { |decl| decl.is_a?(AST::Declarations::Array) && !base_class_for_type(decl.type) }
+      imports << "write_json_array"
+    end
+    imports
+  end
+
+  def render_write_json_header(out)
+    out.puts "def _write_json(self, write: Callable[[str], object]) -> None:"
+  end
+
+  # json_expr is the to_json_dict expression of the value, used for values
+  # of base types.
+  def render_write_json_value(out, decl, value, json_expr, optional:)
+    if base_class_for_type(decl.type)
+      out.puts "write(json_encode(#{json_expr}))"
+    elsif decl.is_a?(AST::Declarations::Array)
+      out.puts "write_json_array(write, #{value})"
+    elsif optional
+      out.puts "if #{value} is None:"
+      out.indent(2) do
+        out.puts "write(\"null\")"
+      end
+      out.puts "else:"
+      out.indent(2) do
+        out.puts "#{value}._write_json(write)"
+      end
+    else
+      out.puts "#{value}._write_json(write)"
+    end
+  end
+
+  def render_stellar_write_json(out)
+    render_write_json_header(out)
+    out.indent(2) do
+      out.puts "write(json_encode(self.to_json_dict()))"
+    end
+  end
+
+  def render_enum_write_json(out, enum_name)
+    map_name = "_#{enum_name.underscore.upcase}_MAP"
+    render_write_json_header(out)
+    out.indent(2) do
+      out.puts "write(f'\"{#{map_name}[self.value]}\"')"
+    end
+  end
+
+  def render_struct_write_json(out, struct, struct_name)
+    return render_stellar_write_json(out) if stellar_specific_type?(struct_name)
+
+    render_write_json_header(out)
+    out.indent(2) do
+      if struct.members.empty?
+        out.puts "write(\"{}\")"
+        next
+      end
+
+      struct.members.each_with_index do |member, index|
+        original_name = member.name.underscore
+        member_name = safe_identifier(original_name)
+        separator = index.zero? ? "{" : ", "
+        out.puts "write('#{separator}\"#{original_name}\": ')"
+        render_write_json_value(
+          out,
+          member.declaration,
+          "self.#{member_name}",
+          encode_value_to_json(member.declaration, "self.#{member_name}"),
+          optional: member.declaration.type.sub_type == :optional,
+        )
+      end
+      out.puts "write(\"}\")"
+    end
+  end
+
+  def render_typedef_write_json(out, typedef, typedef_name, typedef_name_underscore)
+    return render_stellar_write_json(out) if stellar_specific_type?(typedef_name)
+
+    render_write_json_header(out)
+    out.indent(2) do
+      render_write_json_value(
+        out,
+        typedef.declaration,
+        "self.#{typedef_name_underscore}",
+        encode_value_to_json(typedef.declaration, "self.#{typedef_name_underscore}"),
+        optional: typedef.declaration.type.sub_type == :optional,
+      )
+    end
+  end
+
+  def render_union_write_json(out, union, union_name, discriminant_name)
+    return render_stellar_write_json(out) if stellar_specific_type?(union_name)
+
+    disc_enum = get_discriminant_enum(union)
+    render_write_json_header(out)
+    out.indent(2) do
+      if union_name == "SCVal"
+        out.puts "if self.type in _NESTED_TYPES:"
+        out.indent(2) do
+          out.puts "_write_json_nested(self, write)"
+          out.puts "return"
+        end
+      end
+      union.normal_arms.each do |arm|
+        arm.cases.each do |union_case|
+          json_key = json_key_for_case(union_case, disc_enum)
+          out.puts render_union_case_condition(union.discriminant.type, "self.#{discriminant_name}", union_case)
+          out.indent(2) do
+            if arm.void?
+              out.puts "write('\"#{json_key}\"')"
+            else
+              arm_name = safe_identifier(arm.name.underscore)
+              out.puts "assert self.#{arm_name} is not None"
+              out.puts "write('{\"#{json_key}\": ')"
+              render_write_json_value(
+                out, arm.declaration, "self.#{arm_name}", encode_union_arm_value(arm, arm_name), optional: false
+              )
+              out.puts "write(\"}\")"
+            end
+            out.puts "return"
+          end
+        end
+      end
+
+      if union.default_arm.present?
+        key_expr = disc_enum ? "self.#{discriminant_name}.to_json_dict()" : "f\"v{self.#{discriminant_name}}\""
+        if union.default_arm.void?
+          out.puts "write(json_encode(#{key_expr}))"
+        else
+          arm_name = safe_identifier(union.default_arm.name.underscore)
+          out.puts "assert self.#{arm_name} is not None"
+          out.puts "write(\"{\" + json_encode(#{key_expr}) + \": \")"
+          render_write_json_value(
+            out,
+            union.default_arm.declaration,
+            "self.#{arm_name}",
+            encode_union_arm_value(union.default_arm, arm_name),
+            optional: false,
+          )
+          out.puts "write(\"}\")"
+        end
+      else
+        out.puts "raise ValueError(f\"Unknown #{discriminant_name} in #{union_name}: {self.#{discriminant_name}}\")"
+      end
+    end
+  end
+
   # ============================================================================
   # Stellar-specific type helpers
   # ============================================================================
@@ -1,9 +1,31 @@
-from xdrlib3 import Packer, Unpacker
+import importlib.util
+import json
+import mmap
+import struct
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from xdrlib3 import ConversionError, Packer, Unpacker
 
 DEFAULT_XDR_MAX_DEPTH = 512
 
+# In zero-copy mode, opaque values shorter than this are still copied: a
+# memoryview object is larger than a copy of a short value such as a hash.
+ZERO_COPY_MIN_SIZE = 256
+
+XdrBuffer = bytes | bytearray | memoryview | mmap.mmap
+
 __all__ = [
     "DEFAULT_XDR_MAX_DEPTH",
+    "XdrBuffer",
+    "ZERO_COPY_MIN_SIZE",
+    "make_unpacker",
+    "make_frozen",
+    "make_view",
+    "FixedLayout",
+    "FrozenXdr",
+    "XdrView",
+    "set_json_backend",
     "Integer",
     "UnsignedInteger",
     "Float",
@@ -16,6 +38,506 @@ __all__ = [
 ]
 
 
+def make_unpacker(data: XdrBuffer, zero_copy: bool = False) -> Unpacker:
+    """Create an :class:`Unpacker` reading XDR data from ``data``.
+
+    By default the returned :class:`Unpacker` yields opaque values as
+    :class:`bytes`: ``bytes`` and ``mmap`` input is read in place, while
+    other buffers are copied once up front.
+
+    With ``zero_copy=True`` the data is read through a :class:`memoryview`
+    and opaque values of at least :data:`ZERO_COPY_MIN_SIZE` bytes (Wasm code,
+    large ``SCBytes`` and so on) are returned as :class:`memoryview` slices
+    of ``data`` instead of copies. Shorter values such as hashes and keys
+    are still returned as :class:`bytes`. These slices keep ``data`` alive;
+    call ``bytes()`` on the values that have to outlive the buffer. A
+    writable ``data``, such as a :class:`bytearray`, is copied once up front,
+    so that the decoded values stay hashable and do not change with it. Strings are always returned as
+    :class:`bytes`.
+
+    :param data: the XDR data.
+    :param zero_copy: return opaque values as views of ``data``.
+    :return: an :class:`Unpacker` positioned at the start of ``data``.
+    """
+    # Unpacker only indexes and slices its buffer, so it accepts any of
+    # these although it is annotated to take bytes.
+    if zero_copy:
+        view = memoryview(data)
+        if not view.readonly:
+            view = memoryview(bytes(view))
+        return Unpacker(view.cast("B"))  # type: ignore[arg-type]
+    if not isinstance(data, (bytes, mmap.mmap)):
+        data = bytes(data)
+    return Unpacker(data)  # type: ignore[arg-type]
+
+
+def decode_field_paths(
+    xdr_type, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False
+) -> dict:
+    """Decode only the values at ``paths`` from the XDR encoding of an ``xdr_type``.
+
+    Each path is a dot-separated list of attribute names, such as
+    ``"v1.ledger_header.header.ledger_seq"``. Struct members and union arms
+    that are not on any path are skipped without being decoded. A path that
+    goes through an array yields a list with one value per element, and a
+    path that goes through an absent optional value or another union arm
+    yields ``None``.
+
+    Unlike ``from_xdr_bytes``, decoding stops once the selected values are
+    known, so data after them is neither decoded nor validated.
+
+    :param xdr_type: the generated XDR class of the encoded value.
+    :param xdr: the XDR data.
+    :param paths: the paths of the values to decode.
+    :param zero_copy: return large opaque values as views of ``xdr``,
+        see :func:`make_unpacker`.
+    :return: a dict mapping each path to its decoded value.
+    :raises ValueError: if a path names an unknown member.
+    """
+    fields: dict = {}
+    for path in paths:
+        node = fields
+        names = path.split(".")
+        for i, name in enumerate(names):
+            if not name:
+                raise ValueError(f"Invalid field path: {path!r}")
+            if i == len(names) - 1:
+                node[name] = None
+                break
+            child = node.setdefault(name, {})
+            if child is None:
+                # a parent of this path is decoded as a whole
+                break
+            node = child
+    values = xdr_type.unpack_fields(make_unpacker(xdr, zero_copy), fields)
+    return {path: _select_field(values, path.split(".")) for path in paths}
+
+
+def check_fields(xdr_type, fields: dict | None) -> None:
+    """Check that ``fields`` only selects members of ``xdr_type``.
+
+    :raises ValueError: if ``fields`` selects a name that is not a member.
+    """
+    if fields:
+        unknown = fields.keys() - set(getattr(xdr_type, "__slots__", ()))
+        if unknown:
+            raise ValueError(
+                f"{xdr_type.__name__} has no member {', '.join(sorted(unknown))}."
+            )
+
+
+def _select_field(value, names: list[str]):
+    for i, name in enumerate(names):
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [_select_field(item, names[i:]) for item in value]
+        # values decoded as a whole for a shorter path are XDR objects
+        value = value.get(name) if isinstance(value, dict) else getattr(value, name)
+    return value
+
+
+def _skip(unpacker: Unpacker, size: int) -> None:
+    position = unpacker.get_position() + size
+    if position > len(unpacker.get_buffer()):
+        raise EOFError
+    unpacker.set_position(position)
+
+
+def shallow_clone(value):
+    """Return a copy of the generated XDR object ``value`` that shares all its
+    members with ``value``.
+
+    This is the ``deep=False`` mode of the generated ``clone`` methods. To
+    change a nested value without touching the original, clone each object
+    on the path to it and assign new values instead of mutating shared ones.
+    """
+    cls = value.__class__
+    result = object.__new__(cls)
+    for name in cls.__slots__:
+        setattr(result, name, getattr(value, name))
+    return result
+
+
+def make_frozen(value):
+    """Return an immutable copy of the generated XDR object ``value``.
+
+    This is what the generated ``freeze`` methods do. The copy is an instance
+    of a subclass of the type of ``value`` that also derives from
+    :class:`FrozenXdr`. Nested XDR objects are frozen as well, arrays become
+    tuples and mutable byte buffers become :class:`bytes`, so that setting
+    an attribute anywhere in the tree raises :class:`AttributeError`.
+
+    Frozen values compute their hash and their XDR encoding once and then
+    reuse them, so they are cheap to use as dict keys and compare by their
+    encoding. ``clone()`` returns a mutable copy of a frozen value.
+
+    :param value: an XDR object, or a member value of one.
+    :return: the frozen copy, or ``value`` itself if it is already immutable.
+    """
+    if value is None or isinstance(value, (bytes, int, str, float, FrozenXdr)):
+        return value
+    if isinstance(value, list):
+        return tuple(make_frozen(item) for item in value)
+    if isinstance(value, (bytearray, memoryview)):
+        return value if isinstance(value, memoryview) and value.readonly else bytes(value)
+    cls = value.__class__
+    frozen_cls = _FROZEN_TYPES.get(cls)
+    if frozen_cls is None:
+        frozen_cls = _FROZEN_TYPES[cls] = type(
+            cls.__name__,
+            (FrozenXdr, cls),
+            {
+                "__slots__": ("_xdr_bytes", "_xdr_hash"),
+                "__module__": cls.__module__,
+                "_xdr_type": cls,
+            },
+        )
+    result = object.__new__(frozen_cls)
+    set_member = object.__setattr__
+    for name in cls.__slots__:
+        member = getattr(value, name)
+        # most union arms are None, skip the call for them and other leaves
+        if member is not None and not isinstance(member, (bytes, int)):
+            member = make_frozen(member)
+        set_member(result, name, member)
+    set_member(result, "_xdr_bytes", None)
+    set_member(result, "_xdr_hash", None)
+    return result
+
+
+def _thaw(value, deep: bool):
+    if isinstance(value, tuple):
+        return [_thaw(item, True) if deep else item for item in value]
+    if not isinstance(value, FrozenXdr):
+        return value
+    cls = value._xdr_type
+    result = object.__new__(cls)
+    for name in cls.__slots__:
+        member = getattr(value, name)
+        setattr(result, name, _thaw(member, deep) if deep or isinstance(member, tuple) else member)
+    return result
+
+
+class FrozenXdr:
+    """Base of the immutable variants of the generated XDR classes, see
+    :func:`make_frozen`.
+
+    ``isinstance(value, FrozenXdr)`` tells whether ``value`` is frozen.
+    """
+
+    __slots__ = ()
+
+    # Set on, and stored in the slots of, the generated frozen subclasses.
+    _xdr_type: Any
+    _xdr_bytes: bytes | None
+    _xdr_hash: int | None
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is frozen, cannot set {name!r}.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is frozen, cannot delete {name!r}.")
+
+    def __hash__(self) -> int:
+        # The generated __hash__ of the unfrozen type combines the hashes of
+        # the members, which are frozen and memoized themselves, so frozen and
+        # unfrozen values that compare equal also hash alike.
+        value = self._xdr_hash
+        if value is None:
+            value = self._xdr_type.__hash__(self)
+            object.__setattr__(self, "_xdr_hash", value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, FrozenXdr):
+            if other._xdr_type is not self._xdr_type or hash(self) != hash(other):
+                return False
+            return self.to_xdr_bytes() == other.to_xdr_bytes()
+        if isinstance(other, self._xdr_type):
+            return self.to_xdr_bytes() == other.to_xdr_bytes()
+        return NotImplemented
+
+    def to_xdr_bytes(self) -> bytes:
+        value = self._xdr_bytes
+        if value is None:
+            value = self._xdr_type.to_xdr_bytes(self)
+            object.__setattr__(self, "_xdr_bytes", value)
+        return value
+
+    def clone(self, deep: bool = True):
+        """Return a mutable copy of this value.
+
+        With ``deep=False`` only the outermost object (and its arrays) is
+        mutable, nested values are the frozen ones of this value.
+        """
+        return _thaw(self, deep)
+
+    def freeze(self):
+        return self
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo: dict):
+        return self
+
+    def __reduce__(self):
+        return make_frozen, (self.clone(),)
+
+
+_FROZEN_TYPES: dict[type, type] = {}
+
+
+def make_view(xdr_type, xdr: XdrBuffer, zero_copy: bool = False) -> "XdrView":
+    """Return a read-only view of the XDR encoding of an ``xdr_type`` that
+    decodes its members when they are accessed.
+
+    This is what the generated ``view`` methods do, see :class:`XdrView`.
+    Like :func:`decode_field_paths`, a view only decodes and validates the
+    data up to the members that are accessed.
+
+    :param xdr_type: the generated XDR class of the encoded value.
+    :param xdr: the XDR data, which the view keeps a reference to.
+    :param zero_copy: return large opaque values as views of ``xdr``,
+        see :func:`make_unpacker`.
+    :return: the view, an instance of the view class of ``xdr_type``.
+    """
+    unpacker = make_unpacker(xdr, zero_copy)
+    return _view_type(xdr_type)(unpacker.get_buffer(), 0, DEFAULT_XDR_MAX_DEPTH)
+
+
+def view_at(xdr_type, unpacker: Unpacker, depth_limit: int) -> "XdrView":
+    """Return a view of the value of ``xdr_type`` at the position of
+    ``unpacker``, without moving it."""
+    return _view_type(xdr_type)(unpacker.get_buffer(), unpacker.get_position(), depth_limit)
+
+
+def unpack_view(xdr_type, unpacker: Unpacker, depth_limit: int) -> "XdrView":
+    """Skip a value of ``xdr_type`` in ``unpacker`` and return a view of it."""
+    view = view_at(xdr_type, unpacker, depth_limit)
+    xdr_type.skip(unpacker, depth_limit)
+    return view
+
+
+def _view_type(xdr_type) -> type:
+    view_cls = _VIEW_TYPES.get(xdr_type)
+    if view_cls is None:
+        view_cls = _VIEW_TYPES[xdr_type] = type(
+            f"{xdr_type.__name__}View",
+            (XdrView,),
+            {
+                "__slots__": xdr_type.__slots__,
+                "__module__": xdr_type.__module__,
+                "_xdr_type": xdr_type,
+            },
+        )
+    return view_cls
+
+
+class XdrView:
+    """Base of the lazy, read-only views of encoded XDR values, see
+    :func:`make_view`.
+
+    The view class of a generated XDR type (``LedgerCloseMetaView`` for
+    :class:`LedgerCloseMeta`) has the same attributes as the type. The first
+    access to a member decodes the members up to it, in encoding order, and
+    caches them. Members that are variable-size structs, unions or typedefs
+    are views themselves, and arrays of them lists of views, so the nested
+    values that are never accessed are skipped instead of decoded. Other
+    members, such as numbers, enums and opaque data, are decoded as usual.
+
+    ``to_xdr_object()`` decodes the whole value into the generated class. A
+    view must not be used from several threads at once.
+    """
+
+    __slots__ = ("_xdr_buffer", "_xdr_start", "_xdr_depth_limit", "_xdr_members")
+
+    # Set on the generated view subclasses.
+    _xdr_type: Any
+
+    def __init__(self, buffer, start: int, depth_limit: int) -> None:
+        set_member = object.__setattr__
+        set_member(self, "_xdr_buffer", buffer)
+        set_member(self, "_xdr_start", start)
+        set_member(self, "_xdr_depth_limit", depth_limit)
+        set_member(self, "_xdr_members", None)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the members that have not been decoded yet.
+        if name not in self._xdr_type.__slots__:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        members = self._xdr_members
+        if members is None:
+            members = self._xdr_type._view_members(self._unpacker(), self._xdr_depth_limit)
+            object.__setattr__(self, "_xdr_members", members)
+        try:
+            for member, value in members:
+                object.__setattr__(self, member, value)
+                if member == name:
+                    return value
+        except BaseException:
+            # decode again, and fail again, on the next access
+            object.__setattr__(self, "_xdr_members", None)
+            raise
+        # the arms of a union other than the selected one
+        object.__setattr__(self, name, None)
+        return None
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only, cannot set {name!r}.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only, cannot delete {name!r}.")
+
+    def _unpacker(self) -> Unpacker:
+        unpacker = Unpacker(self._xdr_buffer)
+        unpacker.set_position(self._xdr_start)
+        return unpacker
+
+    def to_xdr_object(self):
+        """Decode the viewed value into an instance of its generated class."""
+        return self._xdr_type.unpack(self._unpacker(), self._xdr_depth_limit)
+
+    def to_xdr_bytes(self) -> bytes:
+        unpacker = self._unpacker()
+        self._xdr_type.skip(unpacker, self._xdr_depth_limit)
+        return bytes(self._xdr_buffer[self._xdr_start : unpacker.get_position()])
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} at offset {self._xdr_start}>"
+
+
+_VIEW_TYPES: dict[type, type] = {}
+
+
+# Libraries that can parse XDR-JSON, fastest first, see set_json_backend.
+_JSON_BACKENDS = ("orjson", "ujson", "json")
+_json_loads: Callable[[str | bytes], Any] | None = None
+
+
+def set_json_backend(name: str | None = None) -> str:
+    """Select the library that the generated ``from_json`` methods and
+    :func:`iter_xdr_json` use to parse JSON.
+
+    By default the first one of ``orjson``, ``ujson`` and the standard
+    library's ``json`` that can be imported is used, which is selected on
+    first use. All of them parse SEP-51 XDR-JSON into the same values.
+
+    :param name: ``"orjson"``, ``"ujson"`` or ``"json"``, or ``None`` to
+        select the fastest installed library.
+    :return: the name of the selected library.
+    :raises ValueError: if ``name`` is not one of the above.
+    :raises ImportError: if ``name`` is given and cannot be imported.
+    """
+    global _json_loads
+    if name is None:
+        name = next(
+            backend
+            for backend in _JSON_BACKENDS
+            if importlib.util.find_spec(backend) is not None
+        )
+    elif name not in _JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}, must be one of: {', '.join(_JSON_BACKENDS)}"
+        )
+    _json_loads = importlib.import_module(name).loads
+    return name
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document with the library selected by :func:`set_json_backend`."""
+    if _json_loads is None:
+        set_json_backend()
+    assert _json_loads is not None
+    return _json_loads(data)
+
+
+# json.dumps with its default options, which to_json has always matched.
+_encode_json_string = json.encoder.encode_basestring_ascii
+_encode_json = json.JSONEncoder().encode
+
+
+def xdr_to_json(value) -> str:
+    """Return the SEP-51 JSON encoding of an XDR value, which the generated
+    ``to_json`` methods return.
+
+    The text is built from the pieces written by the ``_write_json`` methods,
+    without building the ``to_json_dict`` tree first.
+    """
+    chunks: list[str] = []
+    value._write_json(chunks.append)
+    return "".join(chunks)
+
+
+def json_encode(value) -> str:
+    """Encode a JSON value produced by ``to_json_dict`` like :func:`json.dumps`."""
+    if value.__class__ is str:
+        return _encode_json_string(value)
+    if value.__class__ is int:
+        return int.__repr__(value)
+    return _encode_json(value)
+
+
+def write_json_array(write: Callable[[str], object], items: Iterable) -> None:
+    """Write a JSON array of XDR values with their ``_write_json`` methods."""
+    write("[")
+    first = True
+    for item in items:
+        if not first:
+            write(", ")
+        first = False
+        item._write_json(write)
+    write("]")
+
+
+class FixedLayout(struct.Struct):
+    """A precompiled codec for XDR values whose encoding has a fixed size.
+
+    Generated structs and typedefs built only from fixed-size members (such
+    as :class:`Int128Parts`, :class:`Price` or :class:`Hash`) pack and unpack
+    the whole value with one of these instead of one call per member. The
+    inherited :meth:`~struct.Struct.pack_into` and
+    :meth:`~struct.Struct.unpack_from` read and write such values in place
+    in a larger buffer.
+    """
+
+    __slots__ = ()
+
+    def write(self, packer: Packer, *values) -> None:
+        try:
+            data = self.pack(*values)
+        except struct.error:
+            data = self._pack_converted(values)
+        packer.pack_fopaque(self.size, data)
+
+    def read(self, unpacker: Unpacker) -> tuple:
+        buffer = unpacker.get_buffer()
+        position = unpacker.get_position()
+        end = position + self.size
+        if end > len(buffer):
+            raise EOFError
+        unpacker.set_position(end)
+        return self.unpack_from(buffer, position)
+
+    def skip(self, unpacker: Unpacker) -> None:
+        _skip(unpacker, self.size)
+
+    def _pack_converted(self, values: tuple) -> bytes:
+        # `s` fields only accept bytes, while opaque values may also be
+        # bytearray or memoryview objects, e.g. from zero-copy decoding.
+        values = tuple(
+            bytes(value) if isinstance(value, (bytearray, memoryview)) else value
+            for value in values
+        )
+        try:
+            return self.pack(*values)
+        except struct.error as e:
+            raise ConversionError(str(e)) from e
+
+
 class Integer:
     def __init__(self, value: int) -> None:
         self.value = value
@@ -27,6 +549,15 @@ class Integer:
     def unpack(unpacker: Unpacker) -> int:
         return unpacker.unpack_int()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 4)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> int:
+        check_fields(Integer, fields)
+        return Integer.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -58,6 +589,15 @@ class UnsignedInteger:
     def unpack(unpacker: Unpacker) -> int:
         return unpacker.unpack_uint()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 4)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> int:
+        check_fields(UnsignedInteger, fields)
+        return UnsignedInteger.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -89,6 +629,15 @@ class Float:
     def unpack(unpacker: Unpacker) -> float:
         return unpacker.unpack_float()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 4)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> float:
+        check_fields(Float, fields)
+        return Float.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -120,6 +669,15 @@ class Double:
     def unpack(unpacker: Unpacker) -> float:
         return unpacker.unpack_double()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 8)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> float:
+        check_fields(Double, fields)
+        return Double.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -151,6 +709,15 @@ class Hyper:
     def unpack(unpacker: Unpacker) -> int:
         return unpacker.unpack_hyper()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 8)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> int:
+        check_fields(Hyper, fields)
+        return Hyper.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -182,6 +749,15 @@ class UnsignedHyper:
     def unpack(unpacker: Unpacker) -> int:
         return unpacker.unpack_uhyper()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 8)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> int:
+        check_fields(UnsignedHyper, fields)
+        return UnsignedHyper.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -213,6 +789,15 @@ class Boolean:
     def unpack(unpacker: Unpacker) -> bool:
         return unpacker.unpack_bool()
 
+    @staticmethod
+    def skip(unpacker: Unpacker) -> None:
+        _skip(unpacker, 4)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None) -> bool:
+        check_fields(Boolean, fields)
+        return Boolean.unpack(unpacker)
+
     def __hash__(self):
         return hash(self.value)
 
@@ -254,7 +839,21 @@ class String:
             raise ValueError(
                 f"String size {size} exceeds maximum {max_size}."
             )
-        return unpacker.unpack_fopaque(size)
+        return bytes(unpacker.unpack_fopaque(size))
+
+    @staticmethod
+    def skip(unpacker: Unpacker, max_size: int) -> None:
+        size = unpacker.unpack_uint()
+        if size > max_size:
+            raise ValueError(
+                f"String size {size} exceeds maximum {max_size}."
+            )
+        _skip(unpacker, (size + 3) // 4 * 4)
+
+    @staticmethod
+    def unpack_fields(unpacker: Unpacker, fields: dict | None, max_size: int) -> bytes:
+        check_fields(String, fields)
+        return String.unpack(unpacker, max_size)
 
     def __hash__(self):
         return hash((self.value, self.size))
@@ -370,7 +969,11 @@ class Opaque:
             packer.pack_uint(size)
         else:
             size = self.size
-        packer.pack_fopaque(size, self.value)
+        value = self.value
+        if not isinstance(value, bytes):
+            # memoryview values from zero-copy decoding
+            value = bytes(value)
+        packer.pack_fopaque(size, value)
 
     @staticmethod
     def unpack(unpacker: Unpacker, size: int, fixed: bool) -> bytes:
@@ -381,7 +984,28 @@ class Opaque:
                     f"Opaque data size {actual_size} exceeds maximum {size}."
                 )
             size = actual_size
-        return unpacker.unpack_fopaque(size)
+        value = unpacker.unpack_fopaque(size)
+        if size < ZERO_COPY_MIN_SIZE and not isinstance(value, bytes):
+            value = bytes(value)
+        return value
+
+    @staticmethod
+    def skip(unpacker: Unpacker, size: int, fixed: bool) -> None:
+        if not fixed:
+            actual_size = unpacker.unpack_uint()
+            if actual_size > size:
+                raise ValueError(
+                    f"Opaque data size {actual_size} exceeds maximum {size}."
+                )
+            size = actual_size
+        _skip(unpacker, (size + 3) // 4 * 4)
+
+    @staticmethod
+    def unpack_fields(
+        unpacker: Unpacker, fields: dict | None, size: int, fixed: bool
+    ) -> bytes:
+        check_fields(Opaque, fields)
+        return Opaque.unpack(unpacker, size, fixed)
 
     def __hash__(self):
         return hash((self.value, self.size, self.fixed))
@@ -1,6 +1,60 @@
 # Automatically generated by xdrgen
 # DO NOT EDIT or your changes may be overwritten
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import *
 from .constants import *
-from .test_array import *
-from .test_array2 import *
+from .stream import *
+if TYPE_CHECKING:
+    from .test_array import *
+    from .test_array2 import *
+_LAZY_IMPORTS = {
+    "TestArray": "test_array",
+    "TestArray2": "test_array2",
+}
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+__all__ = [
+    "DEFAULT_XDR_MAX_DEPTH",
+    "XdrBuffer",
+    "ZERO_COPY_MIN_SIZE",
+    "make_unpacker",
+    "make_frozen",
+    "make_view",
+    "FixedLayout",
+    "FrozenXdr",
+    "XdrView",
+    "set_json_backend",
+    "Integer",
+    "UnsignedInteger",
+    "Float",
+    "Double",
+    "Hyper",
+    "UnsignedHyper",
+    "Boolean",
+    "String",
+    "Opaque",
+    "FOO",
+    "DEFAULT_DECODE_CHUNK_SIZE",
+    "DEFAULT_MAX_RECORD_SIZE",
+    "XdrSource",
+    "decode_many",
+    "dump_xdr_json",
+    "iter_decode_many",
+    "iter_xdr_entries",
+    "iter_xdr_frames",
+    "iter_xdr_json",
+    "iter_xdr_records",
+    "pack_xdr_record",
+    "TestArray",
+    "TestArray2",
+]
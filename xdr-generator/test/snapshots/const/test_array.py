@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 from .constants import FOO
 
 __all__ = ['TestArray']
@@ -17,6 +17,7 @@ class TestArray:
 
         typedef int TestArray[FOO];
     """
+    __slots__ = ("test_array",)
     def __init__(self, test_array: list[int]) -> None:
         _expect_length = FOO
         if test_array and len(test_array) != _expect_length:
@@ -25,6 +26,8 @@ class TestArray:
     def pack(self, packer: Packer) -> None:
         for test_array_item in self.test_array:
             Integer(test_array_item).pack(packer)
+    def xdr_size(self) -> int:
+        return 4 * len(self.test_array)
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> TestArray:
         if depth_limit <= 0:
@@ -34,16 +37,44 @@ class TestArray:
         for _ in range(length):
             test_array.append(Integer.unpack(unpacker))
         return cls(test_array)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = FOO
+        for _ in range(length):
+            Integer.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | TestArray:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "test_array" in fields:
+            length = FOO
+            _result["test_array"] = []
+            for _ in range(length):
+                _result["test_array"].append(Integer.unpack_fields(unpacker, fields["test_array"]))
+        else:
+            length = FOO
+            for _ in range(length):
+                Integer.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TestArray:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TestArray:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -58,16 +89,28 @@ class TestArray:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TestArray:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return [Integer.to_json_dict(item) for item in self.test_array]
     @classmethod
     def from_json_dict(cls, json_value: list) -> TestArray:
         return cls([Integer.from_json_dict(item) for item in json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode([Integer.to_json_dict(item) for item in self.test_array]))
+    def clone(self, deep: bool = True) -> TestArray:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.test_array = list(self.test_array)
+        return result
+    def __deepcopy__(self, memo: dict) -> TestArray:
+        return self.clone()
+    def freeze(self) -> TestArray:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.test_array,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, XdrBuffer, XdrView, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, make_view, shallow_clone, xdr_to_json
 from .constants import FOO
 
 __all__ = ['TestArray2']
@@ -17,6 +17,7 @@ class TestArray2:
 
         typedef int TestArray2<FOO>;
     """
+    __slots__ = ("test_array2",)
     def __init__(self, test_array2: list[int]) -> None:
         _expect_max_length = FOO
         if test_array2 and len(test_array2) > _expect_max_length:
@@ -26,6 +27,8 @@ class TestArray2:
         packer.pack_uint(len(self.test_array2))
         for test_array2_item in self.test_array2:
             Integer(test_array2_item).pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + 4 * len(self.test_array2)
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> TestArray2:
         if depth_limit <= 0:
@@ -38,16 +41,68 @@ class TestArray2:
         for _ in range(length):
             test_array2.append(Integer.unpack(unpacker))
         return cls(test_array2)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(f"test_array2 length {length} exceeds remaining input length {_remaining}")
+        for _ in range(length):
+            Integer.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | TestArray2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "test_array2" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"test_array2 length {length} exceeds remaining input length {_remaining}")
+            _result["test_array2"] = []
+            for _ in range(length):
+                _result["test_array2"].append(Integer.unpack_fields(unpacker, fields["test_array2"]))
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"test_array2 length {length} exceeds remaining input length {_remaining}")
+            for _ in range(length):
+                Integer.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(f"test_array2 length {length} exceeds remaining input length {_remaining}")
+        test_array2 = []
+        for _ in range(length):
+            test_array2.append(Integer.unpack(unpacker))
+        yield "test_array2", test_array2
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> TestArray2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> TestArray2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -62,16 +117,28 @@ class TestArray2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> TestArray2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return [Integer.to_json_dict(item) for item in self.test_array2]
     @classmethod
     def from_json_dict(cls, json_value: list) -> TestArray2:
         return cls([Integer.from_json_dict(item) for item in json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode([Integer.to_json_dict(item) for item in self.test_array2]))
+    def clone(self, deep: bool = True) -> TestArray2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.test_array2 = list(self.test_array2)
+        return result
+    def __deepcopy__(self, memo: dict) -> TestArray2:
+        return self.clone()
+    def freeze(self) -> TestArray2:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.test_array2,))
     def __eq__(self, other: object):
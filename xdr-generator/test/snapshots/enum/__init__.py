@@ -1,8 +1,65 @@
 # Automatically generated by xdrgen
 # DO NOT EDIT or your changes may be overwritten
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import *
 from .constants import *
-from .message_type import *
-from .color import *
-from .color2 import *
-from .color3 import *
+from .stream import *
+if TYPE_CHECKING:
+    from .message_type import *
+    from .color import *
+    from .color2 import *
+    from .color3 import *
+_LAZY_IMPORTS = {
+    "MessageType": "message_type",
+    "Color": "color",
+    "Color2": "color2",
+    "Color3": "color3",
+}
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+__all__ = [
+    "DEFAULT_XDR_MAX_DEPTH",
+    "XdrBuffer",
+    "ZERO_COPY_MIN_SIZE",
+    "make_unpacker",
+    "make_frozen",
+    "make_view",
+    "FixedLayout",
+    "FrozenXdr",
+    "XdrView",
+    "set_json_backend",
+    "Integer",
+    "UnsignedInteger",
+    "Float",
+    "Double",
+    "Hyper",
+    "UnsignedHyper",
+    "Boolean",
+    "String",
+    "Opaque",
+    "DEFAULT_DECODE_CHUNK_SIZE",
+    "DEFAULT_MAX_RECORD_SIZE",
+    "XdrSource",
+    "decode_many",
+    "dump_xdr_json",
+    "iter_decode_many",
+    "iter_xdr_entries",
+    "iter_xdr_frames",
+    "iter_xdr_json",
+    "iter_xdr_records",
+    "pack_xdr_record",
+    "MessageType",
+    "Color",
+    "Color2",
+    "Color3",
+]
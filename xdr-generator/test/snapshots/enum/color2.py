@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
+from .base import Integer, XdrBuffer, check_fields, json_loads, make_unpacker, xdr_to_json
 
 _COLOR2_MAP = {0: "red2", 1: "green2", 2: "blue2"}
 _COLOR2_REVERSE_MAP = {"red2": 0, "green2": 1, "blue2": 2}
@@ -26,21 +27,35 @@ class Color2(IntEnum):
     BLUE2 = 2
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> Color2:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid Color2")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None) -> Color2:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Color2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Color2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -55,14 +70,22 @@ class Color2(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Color2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> str:
         return _COLOR2_MAP[self.value]
 
     @classmethod
     def from_json_dict(cls, json_value: str) -> Color2:
         return cls(_COLOR2_REVERSE_MAP[json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_COLOR2_MAP[self.value]}"')
+    def clone(self, deep: bool = True) -> Color2:
+        return self
+
+    def freeze(self) -> Color2:
+        return self
+_BY_VALUE = {member.value: member for member in Color2}
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
+from .base import Integer, XdrBuffer, check_fields, json_loads, make_unpacker, xdr_to_json
 
 _MESSAGE_TYPE_MAP = {0: "error_msg", 1: "hello", 2: "dont_have", 3: "get_peers", 4: "peers", 5: "get_tx_set", 6: "tx_set", 7: "get_validations", 8: "validations", 9: "transaction", 10: "json_transaction", 11: "get_fba_quorumset", 12: "fba_quorumset", 13: "fba_message"}
 _MESSAGE_TYPE_REVERSE_MAP = {"error_msg": 0, "hello": 1, "dont_have": 2, "get_peers": 3, "peers": 4, "get_tx_set": 5, "tx_set": 6, "get_validations": 7, "validations": 8, "transaction": 9, "json_transaction": 10, "get_fba_quorumset": 11, "fba_quorumset": 12, "fba_message": 13}
@@ -55,21 +56,35 @@ class MessageType(IntEnum):
     FBA_MESSAGE = 13
     def pack(self, packer: Packer) -> None:
         packer.pack_int(self.value)
+    def xdr_size(self) -> int:
+        return 4
 
     @classmethod
     def unpack(cls, unpacker: Unpacker) -> MessageType:
         value = unpacker.unpack_int()
-        return cls(value)
+        member = _BY_VALUE.get(value)
+        if member is None:
+            raise ValueError(f"{value} is not a valid MessageType")
+        return member
+
+    @classmethod
+    def skip(cls, unpacker: Unpacker) -> None:
+        Integer.skip(unpacker)
+
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None) -> MessageType:
+        check_fields(cls, fields)
+        return cls.unpack(unpacker)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MessageType:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> MessageType:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -84,14 +99,22 @@ class MessageType(IntEnum):
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MessageType:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> str:
         return _MESSAGE_TYPE_MAP[self.value]
 
     @classmethod
     def from_json_dict(cls, json_value: str) -> MessageType:
         return cls(_MESSAGE_TYPE_REVERSE_MAP[json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(f'"{_MESSAGE_TYPE_MAP[self.value]}"')
+    def clone(self, deep: bool = True) -> MessageType:
+        return self
+
+    def freeze(self) -> MessageType:
+        return self
+_BY_VALUE = {member.value: member for member in MessageType}
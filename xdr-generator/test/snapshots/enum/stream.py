@@ -0,0 +1,444 @@
+import collections
+import contextlib
+import gzip
+import itertools
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import IO, Any, Protocol, TypeVar
+
+from xdrlib3 import Packer, Unpacker
+
+from .base import XdrBuffer, json_loads, make_unpacker
+
+__all__ = [
+    "DEFAULT_DECODE_CHUNK_SIZE",
+    "DEFAULT_MAX_RECORD_SIZE",
+    "XdrSource",
+    "decode_many",
+    "dump_xdr_json",
+    "iter_decode_many",
+    "iter_xdr_entries",
+    "iter_xdr_frames",
+    "iter_xdr_json",
+    "iter_xdr_records",
+    "pack_xdr_record",
+]
+
+# Upper bound on the size of a single record, so that a corrupt record mark
+# fails fast instead of trying to allocate gigabytes.
+DEFAULT_MAX_RECORD_SIZE = 256 * 1024 * 1024
+
+# Number of values that decode_many sends to a worker process at a time.
+DEFAULT_DECODE_CHUNK_SIZE = 256
+
+_LAST_FRAGMENT = 0x80000000
+_GZIP_MAGIC = b"\x1f\x8b"
+_RECORD_MARK = struct.Struct(">I")
+
+XdrSource = str | os.PathLike | IO[bytes] | XdrBuffer
+
+
+class _XdrType(Protocol):
+    def pack(self, packer: Packer) -> None: ...
+
+    @classmethod
+    def unpack(cls, unpacker: Unpacker): ...
+
+    @classmethod
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False): ...
+
+    @classmethod
+    def from_xdr(cls, xdr: str): ...
+
+    @classmethod
+    def from_json_dict(cls, json_value): ...
+
+    def _write_json(self, write: Callable[[str], object]) -> None: ...
+
+
+_T = TypeVar("_T", bound=_XdrType)
+_V = TypeVar("_V")
+
+
+def iter_xdr_records(
+    source: XdrSource,
+    xdr_type: type[_T],
+    zero_copy: bool = False,
+    max_record_size: int = DEFAULT_MAX_RECORD_SIZE,
+) -> Iterator[_T]:
+    """Iterate over the values of a record-marked XDR stream.
+
+    Record-marked streams (`RFC 5531, section 11
+    <https://datatracker.ietf.org/doc/html/rfc5531#section-11>`_) prefix every
+    value with its length. History archive files such as
+    ``transactions-*.xdr.gz`` (:class:`TransactionHistoryEntry`),
+    ``results-*.xdr.gz`` (:class:`TransactionHistoryResultEntry`) and
+    ``ledger-*.xdr.gz`` (:class:`LedgerHeaderHistoryEntry`) use this format.
+
+    Only one record is held in memory at a time when reading from a file,
+    so arbitrarily large files can be processed with bounded memory.
+
+    Example::
+
+        for entry in iter_xdr_records(
+            "transactions-0000003f.xdr.gz", TransactionHistoryEntry
+        ):
+            print(entry.ledger_seq.uint32)
+
+    :param source: a file path, a binary file object, or a bytes-like object
+        such as ``bytes``, ``memoryview`` or ``mmap``. Paths to gzip-compressed
+        files are decompressed on the fly.
+    :param xdr_type: the XDR type of the values, e.g. :class:`LedgerCloseMetaBatch`.
+    :param zero_copy: return large opaque values as views of the record
+        buffer instead of copies, see :func:`make_unpacker`.
+    :param max_record_size: the maximum size of a single record in bytes.
+    :return: an iterator over the decoded values.
+    :raises ValueError: if the stream is truncated or a record is malformed.
+    """
+    for frame in iter_xdr_frames(source, max_record_size):
+        yield xdr_type.from_xdr_bytes(frame, zero_copy)
+
+
+def iter_xdr_frames(
+    source: XdrSource, max_record_size: int = DEFAULT_MAX_RECORD_SIZE
+) -> Iterator[XdrBuffer]:
+    """Iterate over the raw records of a record-marked XDR stream.
+
+    Records split over several fragments are reassembled. This is useful to
+    skip, count or forward records without decoding them, see
+    :func:`iter_xdr_records` for the supported sources.
+
+    :param source: a file path, a binary file object, or a bytes-like object.
+    :param max_record_size: the maximum size of a single record in bytes.
+    :return: an iterator over the record payloads. Records read from a
+        bytes-like source are views of it, other records are new buffers.
+    :raises ValueError: if the stream is truncated or a record is malformed.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with _open_path(source) as f:
+            yield from _iter_file_frames(f, max_record_size)
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        yield from _iter_buffer_frames(memoryview(source).cast("B"), max_record_size)
+    else:
+        yield from _iter_file_frames(source, max_record_size)
+
+
+def iter_xdr_entries(
+    source: XdrSource,
+    xdr_type: type[_T],
+    zero_copy: bool = False,
+) -> Iterator[_T]:
+    """Iterate over the values of an unframed XDR stream.
+
+    Unframed streams are plain concatenations of XDR values, as used by the
+    contract metadata and spec sections of Wasm files. Since the values carry
+    no length prefix, the whole stream is needed to decode them: files are
+    memory-mapped, while gzip-compressed files and file objects are read
+    into memory.
+
+    :param source: a file path, a binary file object, or a bytes-like object.
+    :param xdr_type: the XDR type of the values.
+    :param zero_copy: return large opaque values as views of the stream
+        buffer instead of copies, see :func:`make_unpacker`.
+    :return: an iterator over the decoded values.
+    :raises ValueError: if an entry is malformed.
+    :raises EOFError: if the stream ends in the middle of an entry.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        data = _read_entries_source(source)
+    elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        data = source
+    else:
+        data = source.read()
+    yield from _iter_entries(make_unpacker(data, zero_copy), xdr_type.unpack)
+
+
+def pack_xdr_record(value: _XdrType) -> bytes:
+    """Encode ``value`` as a single-fragment record of a record-marked XDR stream.
+
+    :param value: the XDR value to encode.
+    :return: the record mark followed by the XDR encoding of ``value``.
+    """
+    packer = Packer()
+    packer.pack_uint(0)  # placeholder for the record mark
+    value.pack(packer)
+    data = bytearray(packer.get_buffer())
+    _RECORD_MARK.pack_into(data, 0, _LAST_FRAGMENT | (len(data) - 4))
+    return bytes(data)
+
+
+def decode_many(
+    xdr_type: type[_T],
+    items: Iterable[str | bytes | bytearray],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_DECODE_CHUNK_SIZE,
+    transform: Callable[[_T], Any] | None = None,
+    executor: Executor | None = None,
+) -> list[Any]:
+    """Decode many XDR values in worker processes.
+
+    ``items`` are split into chunks of ``chunk_size`` values, which are
+    decoded in parallel by a :class:`~concurrent.futures.ProcessPoolExecutor`.
+    The results are returned in the order of ``items``. Use
+    :func:`iter_decode_many` to consume the results as they are decoded.
+
+    Decoded values are sent back to this process with :mod:`pickle`, and
+    unpickling a value costs about as much as decoding it, so decoding
+    whole values in other processes saves little time. The work done in the
+    workers scales with their number when ``transform`` reduces each value
+    to what is needed, e.g. the return value of a contract call or the
+    result of :func:`stellar_sdk.scval.to_native`, so that only that is sent
+    back::
+
+        def return_value(meta: TransactionMeta):
+            return scval.to_native(meta.v4.soroban_meta.return_value)
+
+        values = decode_many(TransactionMeta, result_meta_xdrs, transform=return_value)
+
+    ``transform`` and the values of ``items`` must be picklable: ``transform``
+    has to be a module-level function.
+
+    :param xdr_type: the XDR type of the values, e.g. :class:`TransactionMeta`.
+    :param items: base64-encoded XDR strings, such as the ``envelope_xdr`` of
+        Horizon transaction records, or the XDR bytes of the values.
+    :param workers: the number of worker processes, by default the number of
+        CPUs. With ``1``, the values are decoded in this process instead.
+    :param chunk_size: the number of values sent to a worker at a time.
+    :param transform: a function applied to each decoded value in the
+        worker, whose result is returned instead of the value.
+    :param executor: an executor to run the chunks on instead of a new
+        process pool, e.g. one that is shared by many calls. It is not
+        shut down.
+    :return: the decoded values, or the results of ``transform``.
+    """
+    return list(
+        iter_decode_many(xdr_type, items, workers, chunk_size, transform, executor)
+    )
+
+
+def iter_decode_many(
+    xdr_type: type[_T],
+    items: Iterable[str | bytes | bytearray],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_DECODE_CHUNK_SIZE,
+    transform: Callable[[_T], Any] | None = None,
+    executor: Executor | None = None,
+) -> Iterator[Any]:
+    """Decode many XDR values in worker processes, as they are iterated over.
+
+    This is the streaming form of :func:`decode_many`, with the same
+    parameters, for pipelines that read ``items`` from a stream. ``items``
+    is read as chunks are handed to the workers, with at most two chunks
+    per worker waiting to be decoded or consumed, and the results are
+    yielded in the order of ``items``. Closing the iterator cancels the
+    chunks that have not been decoded yet.
+
+    :return: an iterator over the decoded values, or the results of
+        ``transform``.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+    chunks = _iter_chunks(items, chunk_size)
+    if executor is None and workers == 1:
+        for chunk in chunks:
+            yield from _decode_chunk(xdr_type, transform, chunk)
+        return
+
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    pending: collections.deque[Future] = collections.deque()
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(_decode_chunk, xdr_type, transform, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is None:
+            pool.shutdown()
+
+
+def dump_xdr_json(value: _XdrType, fp: IO[str]) -> None:
+    """Write the SEP-51 JSON encoding of ``value`` to a text file.
+
+    The text is the same as ``value.to_json()``, but it is written to ``fp``
+    piece by piece as ``value`` is walked, so neither the ``to_json_dict()``
+    tree nor the whole text is held in memory. ``fp`` receives many small
+    writes and should be buffered, as the files returned by :func:`open` are.
+
+    To write a JSON Lines file that :func:`iter_xdr_json` can read back,
+    write a newline after each value::
+
+        with open("ledgers.jsonl", "w") as f:
+            for meta in iter_xdr_records("ledgers.xdr", LedgerCloseMeta):
+                dump_xdr_json(meta, f)
+                f.write("\\n")
+
+    :param value: the XDR value to encode.
+    :param fp: a text file object.
+    """
+    value._write_json(fp.write)
+
+
+def iter_xdr_json(
+    source: str | os.PathLike | IO[str] | IO[bytes], xdr_type: type[_T]
+) -> Iterator[_T]:
+    """Iterate over the values of a JSON Lines file of SEP-51 XDR-JSON.
+
+    Each non-blank line holds the JSON encoding of one value, as written by
+    :func:`dump_xdr_json` or ``to_json``. Lines are parsed one at a time with
+    the library selected by :func:`set_json_backend` (``orjson`` or
+    ``ujson`` when installed), so only one value is held in memory at a time.
+
+    :param source: a file path, or a text or binary file object. Paths to
+        gzip-compressed files are decompressed on the fly.
+    :param xdr_type: the XDR type of the values, e.g. :class:`LedgerCloseMeta`.
+    :return: an iterator over the decoded values.
+    :raises ValueError: if a line is not valid JSON.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with _open_path(source) as f:
+            yield from _iter_json_lines(f, xdr_type)
+    else:
+        yield from _iter_json_lines(source, xdr_type)
+
+
+@contextlib.contextmanager
+def _open_path(path: str | os.PathLike) -> Iterator[IO[bytes]]:
+    with open(path, "rb") as f:
+        if f.read(2) == _GZIP_MAGIC:
+            f.seek(0)
+            with gzip.GzipFile(fileobj=f, mode="rb") as gz:
+                yield gz  # type: ignore[misc]
+        else:
+            f.seek(0)
+            yield f
+
+
+def _read_mark(mark: int, max_record_size: int, total: int) -> tuple[int, bool]:
+    length = mark & ~_LAST_FRAGMENT
+    if total + length > max_record_size:
+        raise ValueError(
+            f"XDR record size {total + length} exceeds maximum {max_record_size}."
+        )
+    return length, bool(mark & _LAST_FRAGMENT)
+
+
+def _iter_buffer_frames(view: memoryview, max_record_size: int) -> Iterator[XdrBuffer]:
+    position = 0
+    end = len(view)
+    while position < end:
+        fragments = []
+        total = 0
+        last = False
+        while not last:
+            if end - position < 4:
+                raise ValueError("Truncated XDR record mark.")
+            (mark,) = _RECORD_MARK.unpack_from(view, position)
+            length, last = _read_mark(mark, max_record_size, total)
+            position += 4
+            if end - position < length:
+                raise ValueError(
+                    f"Truncated XDR record: expected {length} bytes, got {end - position}."
+                )
+            fragments.append(view[position : position + length])
+            position += length
+            total += length
+        yield fragments[0] if len(fragments) == 1 else b"".join(fragments)
+
+
+def _iter_file_frames(f: IO[bytes], max_record_size: int) -> Iterator[XdrBuffer]:
+    while True:
+        header = f.read(4)
+        if not header:
+            return
+        fragments = []
+        total = 0
+        last = False
+        while not last:
+            if len(header) < 4:
+                raise ValueError("Truncated XDR record mark.")
+            (mark,) = _RECORD_MARK.unpack(header)
+            length, last = _read_mark(mark, max_record_size, total)
+            fragment = _read_exactly(f, length)
+            if len(fragment) < length:
+                raise ValueError(
+                    f"Truncated XDR record: expected {length} bytes, got {len(fragment)}."
+                )
+            fragments.append(fragment)
+            total += length
+            if not last:
+                header = f.read(4)
+        yield fragments[0] if len(fragments) == 1 else b"".join(fragments)
+
+
+def _read_exactly(f: IO[bytes], size: int) -> bytes:
+    # `read` may return fewer bytes than requested before the end of the
+    # stream, for example on pipes and sockets.
+    data = f.read(size)
+    if len(data) == size or not data:
+        return data
+    chunks = [data]
+    remaining = size - len(data)
+    while remaining:
+        chunk = f.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_entries_source(path: str | os.PathLike) -> XdrBuffer:
+    with _open_path(path) as f:
+        if isinstance(f, gzip.GzipFile):
+            return f.read()
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap rejects empty files
+            return b""
+
+
+def _iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _decode_chunk(
+    xdr_type: type[_XdrType], transform: Callable | None, chunk: list
+) -> list:
+    values = [
+        xdr_type.from_xdr(item)
+        if isinstance(item, str)
+        else xdr_type.from_xdr_bytes(item)
+        for item in chunk
+    ]
+    if transform is not None:
+        return [transform(value) for value in values]
+    return values
+
+
+def _iter_json_lines(f: IO[str] | IO[bytes], xdr_type: type[_T]) -> Iterator[_T]:
+    for line in f:
+        if line.strip():
+            yield xdr_type.from_json_dict(json_loads(line))
+
+
+def _iter_entries(
+    unpacker: Unpacker, unpack_entry: Callable[[Unpacker], _V]
+) -> Iterator[_V]:
+    end = len(unpacker.get_buffer())
+    while unpacker.get_position() < end:
+        before = unpacker.get_position()
+        entry = unpack_entry(unpacker)
+        if unpacker.get_position() <= before:
+            raise ValueError("XDR decoder made no progress.")
+        yield entry
@@ -1,8 +1,67 @@
 # Automatically generated by xdrgen
 # DO NOT EDIT or your changes may be overwritten
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import *
 from .constants import *
-from .pass_ import *
-from .keyword_enum import *
-from .keyword_struct import *
-from .keyword_union import *
+from .stream import *
+if TYPE_CHECKING:
+    from .pass_ import *
+    from .keyword_enum import *
+    from .keyword_struct import *
+    from .keyword_union import *
+_LAZY_IMPORTS = {
+    "Pass": "pass_",
+    "KeywordEnum": "keyword_enum",
+    "KeywordStruct": "keyword_struct",
+    "KeywordUnion": "keyword_union",
+}
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+__all__ = [
+    "DEFAULT_XDR_MAX_DEPTH",
+    "XdrBuffer",
+    "ZERO_COPY_MIN_SIZE",
+    "make_unpacker",
+    "make_frozen",
+    "make_view",
+    "FixedLayout",
+    "FrozenXdr",
+    "XdrView",
+    "set_json_backend",
+    "Integer",
+    "UnsignedInteger",
+    "Float",
+    "Double",
+    "Hyper",
+    "UnsignedHyper",
+    "Boolean",
+    "String",
+    "Opaque",
+    "from_",
+    "import_",
+    "DEFAULT_DECODE_CHUNK_SIZE",
+    "DEFAULT_MAX_RECORD_SIZE",
+    "XdrSource",
+    "decode_many",
+    "dump_xdr_json",
+    "iter_decode_many",
+    "iter_xdr_entries",
+    "iter_xdr_frames",
+    "iter_xdr_json",
+    "iter_xdr_records",
+    "pack_xdr_record",
+    "Pass",
+    "KeywordEnum",
+    "KeywordStruct",
+    "KeywordUnion",
+]
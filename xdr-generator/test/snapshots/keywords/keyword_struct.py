@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, FixedLayout, XdrBuffer, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .pass_ import Pass
 from .keyword_enum import KeywordEnum
+_LAYOUT = FixedLayout(">ii")
 __all__ = ['KeywordStruct']
 class KeywordStruct:
     """
@@ -21,6 +22,7 @@ class KeywordStruct:
           keyword_enum return;
         };
     """
+    __slots__ = ("from_", "return_")
     def __init__(
         self,
         from_: Pass,
@@ -29,28 +31,53 @@ class KeywordStruct:
         self.from_ = from_
         self.return_ = return_
     def pack(self, packer: Packer) -> None:
-        self.from_.pack(packer)
-        self.return_.pack(packer)
+        _LAYOUT.write(packer, self.from_.pass_, self.return_)
+    def xdr_size(self) -> int:
+        return 8
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> KeywordStruct:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        from_ = Pass.unpack(unpacker, depth_limit - 1)
-        return_ = KeywordEnum.unpack(unpacker)
+        from_, return_ = _LAYOUT.read(unpacker)
         return cls(
-            from_=from_,
-            return_=return_,
+            from_=Pass(from_),
+            return_=KeywordEnum(return_),
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | KeywordStruct:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "from_" in fields:
+            _result["from_"] = Pass.unpack_fields(unpacker, fields["from_"], depth_limit - 1)
+        else:
+            Pass.skip(unpacker, depth_limit - 1)
+        if "return_" in fields:
+            _result["return_"] = KeywordEnum.unpack_fields(unpacker, fields["return_"])
+        else:
+            KeywordEnum.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> KeywordStruct:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> KeywordStruct:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -65,11 +92,11 @@ class KeywordStruct:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> KeywordStruct:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "from": self.from_.to_json_dict(),
@@ -83,6 +110,23 @@ class KeywordStruct:
             from_=from_,
             return_=return_,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"from": ')
+        self.from_._write_json(write)
+        write(', "return": ')
+        self.return_._write_json(write)
+        write("}")
+    def clone(self, deep: bool = True) -> KeywordStruct:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.from_ = self.from_.clone()
+        result.return_ = self.return_
+        return result
+    def __deepcopy__(self, memo: dict) -> KeywordStruct:
+        return self.clone()
+    def freeze(self) -> KeywordStruct:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.from_, self.return_,))
     def __eq__(self, other: object):
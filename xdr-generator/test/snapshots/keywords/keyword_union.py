@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .keyword_enum import KeywordEnum
 from .pass_ import Pass
@@ -24,6 +24,7 @@ class KeywordUnion:
                 void;
         };
     """
+    __slots__ = ("class_", "from_")
     def __init__(
         self,
         from_: KeywordEnum,
@@ -38,25 +39,56 @@ class KeywordUnion:
                 raise ValueError("class_ should not be None.")
             self.class_.pack(packer)
             return
+    def xdr_size(self) -> int:
+        if self.from_ == KeywordEnum.from_:
+            return 8
+        return 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> KeywordUnion:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        from_ = KeywordEnum.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(from_, _unpack_void)
+        return unpack_arm(cls, from_, unpacker, depth_limit)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         from_ = KeywordEnum.unpack(unpacker)
         if from_ == KeywordEnum.from_:
-            class_ = Pass.unpack(unpacker, depth_limit - 1)
-            return cls(from_=from_, class_=class_)
-        return cls(from_=from_)
+            Pass.skip(unpacker, depth_limit - 1)
+            return
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | KeywordUnion:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        from_ = KeywordEnum.unpack(unpacker)
+        if "from_" in fields:
+            _result["from_"] = from_
+        if from_ == KeywordEnum.from_:
+            if "class_" in fields:
+                _result["class_"] = Pass.unpack_fields(unpacker, fields["class_"], depth_limit - 1)
+            else:
+                Pass.skip(unpacker, depth_limit - 1)
+            return _result
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> KeywordUnion:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> KeywordUnion:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -71,11 +103,11 @@ class KeywordUnion:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> KeywordUnion:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         if self.from_ == KeywordEnum.from_:
             assert self.class_ is not None
@@ -96,6 +128,25 @@ class KeywordUnion:
             class_ = Pass.from_json_dict(json_value["from"])
             return cls(from_=from_, class_=class_)
         raise ValueError(f"Unknown key '{key}' for KeywordUnion")
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.from_ == KeywordEnum.from_:
+            assert self.class_ is not None
+            write('{"from": ')
+            self.class_._write_json(write)
+            write("}")
+            return
+        write(json_encode(self.from_.to_json_dict()))
+    def clone(self, deep: bool = True) -> KeywordUnion:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.from_ = self.from_
+        result.class_ = self.class_.clone() if self.class_ is not None else None
+        return result
+    def __deepcopy__(self, memo: dict) -> KeywordUnion:
+        return self.clone()
+    def freeze(self) -> KeywordUnion:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.from_, self.class_,))
     def __eq__(self, other: object):
@@ -108,3 +159,11 @@ class KeywordUnion:
         if self.class_ is not None:
             out.append(f'class_={self.class_}')
         return f"<KeywordUnion [{', '.join(out)}]>"
+def _unpack_void(cls, from_, unpacker: Unpacker, depth_limit: int) -> KeywordUnion:
+    return cls(from_=from_)
+def _unpack_class_(cls, from_, unpacker: Unpacker, depth_limit: int) -> KeywordUnion:
+    class_ = Pass.unpack(unpacker, depth_limit - 1)
+    return cls(from_=from_, class_=class_)
+_UNPACK_ARMS = {
+    KeywordEnum.from_: _unpack_class_,
+}
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, FixedLayout, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
+_LAYOUT = FixedLayout(">i")
 __all__ = ['Pass']
 class Pass:
     """
@@ -16,26 +17,50 @@ class Pass:
 
         typedef int pass;
     """
+    __slots__ = ("pass_",)
     def __init__(self, pass_: int) -> None:
         self.pass_ = pass_
     def pack(self, packer: Packer) -> None:
-        Integer(self.pass_).pack(packer)
+        _LAYOUT.write(packer, self.pass_)
+    def xdr_size(self) -> int:
+        return 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Pass:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        pass_ = Integer.unpack(unpacker)
+        (pass_,) = _LAYOUT.read(unpacker)
         return cls(pass_)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Pass:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "pass_" in fields:
+            _result["pass_"] = Integer.unpack_fields(unpacker, fields["pass_"])
+        else:
+            Integer.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Pass:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Pass:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -50,16 +75,28 @@ class Pass:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Pass:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return Integer.to_json_dict(self.pass_)
     @classmethod
     def from_json_dict(cls, json_value: int) -> Pass:
         return cls(Integer.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(Integer.to_json_dict(self.pass_)))
+    def clone(self, deep: bool = True) -> Pass:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.pass_ = self.pass_
+        return result
+    def __deepcopy__(self, memo: dict) -> Pass:
+        return self.clone()
+    def freeze(self) -> Pass:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.pass_,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .union_key import UnionKey
 from .my_union_one import MyUnionOne
@@ -34,6 +34,7 @@ class MyUnion:
                 void;
         };
     """
+    __slots__ = ("one", "two", "type")
     def __init__(
         self,
         type: UnionKey,
@@ -58,30 +59,76 @@ class MyUnion:
         if self.type == UnionKey.OFFER:
             return
         raise ValueError("Invalid type.")
+    def xdr_size(self) -> int:
+        if self.type == UnionKey.ONE:
+            return 8
+        if self.type == UnionKey.TWO:
+            return 12
+        if self.type == UnionKey.OFFER:
+            return 4
+        raise ValueError("Invalid type.")
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> MyUnion:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = UnionKey.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = UnionKey.unpack(unpacker)
         if type == UnionKey.ONE:
-            one = MyUnionOne.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, one=one)
+            MyUnionOne.skip(unpacker, depth_limit - 1)
+            return
         if type == UnionKey.TWO:
-            two = MyUnionTwo.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, two=two)
+            MyUnionTwo.skip(unpacker, depth_limit - 1)
+            return
         if type == UnionKey.OFFER:
-            return cls(type=type)
+            return
         raise ValueError("Invalid type.")
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | MyUnion:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = UnionKey.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == UnionKey.ONE:
+            if "one" in fields:
+                _result["one"] = MyUnionOne.unpack_fields(unpacker, fields["one"], depth_limit - 1)
+            else:
+                MyUnionOne.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == UnionKey.TWO:
+            if "two" in fields:
+                _result["two"] = MyUnionTwo.unpack_fields(unpacker, fields["two"], depth_limit - 1)
+            else:
+                MyUnionTwo.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == UnionKey.OFFER:
+            return _result
+        raise ValueError("Invalid type.")
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MyUnion:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> MyUnion:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -96,11 +143,11 @@ class MyUnion:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MyUnion:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         if self.type == UnionKey.ONE:
             assert self.one is not None
@@ -129,6 +176,35 @@ class MyUnion:
             two = MyUnionTwo.from_json_dict(json_value["two"])
             return cls(type=type, two=two)
         raise ValueError(f"Unknown key '{key}' for MyUnion")
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == UnionKey.ONE:
+            assert self.one is not None
+            write('{"one": ')
+            self.one._write_json(write)
+            write("}")
+            return
+        if self.type == UnionKey.TWO:
+            assert self.two is not None
+            write('{"two": ')
+            self.two._write_json(write)
+            write("}")
+            return
+        if self.type == UnionKey.OFFER:
+            write('"offer"')
+            return
+        raise ValueError(f"Unknown type in MyUnion: {self.type}")
+    def clone(self, deep: bool = True) -> MyUnion:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.one = self.one.clone() if self.one is not None else None
+        result.two = self.two.clone() if self.two is not None else None
+        return result
+    def __deepcopy__(self, memo: dict) -> MyUnion:
+        return self.clone()
+    def freeze(self) -> MyUnion:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.type, self.one, self.two,))
     def __eq__(self, other: object):
@@ -143,3 +219,16 @@ class MyUnion:
         if self.two is not None:
             out.append(f'two={self.two}')
         return f"<MyUnion [{', '.join(out)}]>"
+def _unpack_void(cls, type, unpacker: Unpacker, depth_limit: int) -> MyUnion:
+    return cls(type=type)
+def _unpack_one(cls, type, unpacker: Unpacker, depth_limit: int) -> MyUnion:
+    one = MyUnionOne.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, one=one)
+def _unpack_two(cls, type, unpacker: Unpacker, depth_limit: int) -> MyUnion:
+    two = MyUnionTwo.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, two=two)
+_UNPACK_ARMS = {
+    UnionKey.ONE: _unpack_one,
+    UnionKey.TWO: _unpack_two,
+    UnionKey.OFFER: _unpack_void,
+}
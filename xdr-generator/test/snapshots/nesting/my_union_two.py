@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, FixedLayout, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .foo import Foo
+_LAYOUT = FixedLayout(">ii")
 __all__ = ['MyUnionTwo']
 class MyUnionTwo:
     """
@@ -20,6 +21,7 @@ class MyUnionTwo:
                     Foo foo;
                 }
     """
+    __slots__ = ("foo", "some_int")
     def __init__(
         self,
         some_int: int,
@@ -28,28 +30,53 @@ class MyUnionTwo:
         self.some_int = some_int
         self.foo = foo
     def pack(self, packer: Packer) -> None:
-        Integer(self.some_int).pack(packer)
-        self.foo.pack(packer)
+        _LAYOUT.write(packer, self.some_int, self.foo.foo)
+    def xdr_size(self) -> int:
+        return 8
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> MyUnionTwo:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        some_int = Integer.unpack(unpacker)
-        foo = Foo.unpack(unpacker, depth_limit - 1)
+        some_int, foo = _LAYOUT.read(unpacker)
         return cls(
             some_int=some_int,
-            foo=foo,
+            foo=Foo(foo),
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | MyUnionTwo:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "some_int" in fields:
+            _result["some_int"] = Integer.unpack_fields(unpacker, fields["some_int"])
+        else:
+            Integer.skip(unpacker)
+        if "foo" in fields:
+            _result["foo"] = Foo.unpack_fields(unpacker, fields["foo"], depth_limit - 1)
+        else:
+            Foo.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MyUnionTwo:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> MyUnionTwo:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -64,11 +91,11 @@ class MyUnionTwo:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MyUnionTwo:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "some_int": Integer.to_json_dict(self.some_int),
@@ -82,6 +109,23 @@ class MyUnionTwo:
             some_int=some_int,
             foo=foo,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"some_int": ')
+        write(json_encode(Integer.to_json_dict(self.some_int)))
+        write(', "foo": ')
+        self.foo._write_json(write)
+        write("}")
+    def clone(self, deep: bool = True) -> MyUnionTwo:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.some_int = self.some_int
+        result.foo = self.foo.clone()
+        return result
+    def __deepcopy__(self, memo: dict) -> MyUnionTwo:
+        return self.clone()
+    def freeze(self) -> MyUnionTwo:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.some_int, self.foo,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 __all__ = ['Arr']
 class Arr:
@@ -16,6 +16,7 @@ class Arr:
 
         typedef int Arr[2];
     """
+    __slots__ = ("arr",)
     def __init__(self, arr: list[int]) -> None:
         _expect_length = 2
         if arr and len(arr) != _expect_length:
@@ -24,6 +25,8 @@ class Arr:
     def pack(self, packer: Packer) -> None:
         for arr_item in self.arr:
             Integer(arr_item).pack(packer)
+    def xdr_size(self) -> int:
+        return 8
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Arr:
         if depth_limit <= 0:
@@ -33,16 +36,44 @@ class Arr:
         for _ in range(length):
             arr.append(Integer.unpack(unpacker))
         return cls(arr)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = 2
+        for _ in range(length):
+            Integer.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Arr:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "arr" in fields:
+            length = 2
+            _result["arr"] = []
+            for _ in range(length):
+                _result["arr"].append(Integer.unpack_fields(unpacker, fields["arr"]))
+        else:
+            length = 2
+            for _ in range(length):
+                Integer.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Arr:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Arr:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -57,16 +88,28 @@ class Arr:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Arr:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return [Integer.to_json_dict(item) for item in self.arr]
     @classmethod
     def from_json_dict(cls, json_value: list) -> Arr:
         return cls([Integer.from_json_dict(item) for item in json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode([Integer.to_json_dict(item) for item in self.arr]))
+    def clone(self, deep: bool = True) -> Arr:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.arr = list(self.arr)
+        return result
+    def __deepcopy__(self, memo: dict) -> Arr:
+        return self.clone()
+    def freeze(self) -> Arr:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.arr,))
     def __eq__(self, other: object):
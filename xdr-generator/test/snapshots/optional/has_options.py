@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .arr import Arr
 __all__ = ['HasOptions']
@@ -22,6 +22,7 @@ class HasOptions:
           Arr *thirdOption;
         };
     """
+    __slots__ = ("first_option", "second_option", "third_option")
     def __init__(
         self,
         first_option: int | None,
@@ -47,6 +48,8 @@ class HasOptions:
         else:
             packer.pack_uint(1)
             self.third_option.pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + (4 if self.first_option is not None else 0) + 4 + (4 if self.second_option is not None else 0) + 4 + (8 if self.third_option is not None else 0)
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> HasOptions:
         if depth_limit <= 0:
@@ -59,16 +62,53 @@ class HasOptions:
             second_option=second_option,
             third_option=third_option,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            Integer.skip(unpacker)
+        if unpacker.unpack_uint():
+            Integer.skip(unpacker)
+        if unpacker.unpack_uint():
+            Arr.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | HasOptions:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "first_option" in fields:
+            _result["first_option"] = Integer.unpack_fields(unpacker, fields["first_option"]) if unpacker.unpack_uint() else None
+        else:
+            if unpacker.unpack_uint():
+                Integer.skip(unpacker)
+        if "second_option" in fields:
+            _result["second_option"] = Integer.unpack_fields(unpacker, fields["second_option"]) if unpacker.unpack_uint() else None
+        else:
+            if unpacker.unpack_uint():
+                Integer.skip(unpacker)
+        if "third_option" in fields:
+            _result["third_option"] = Arr.unpack_fields(unpacker, fields["third_option"], depth_limit - 1) if unpacker.unpack_uint() else None
+        else:
+            if unpacker.unpack_uint():
+                Arr.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HasOptions:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> HasOptions:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -83,11 +123,11 @@ class HasOptions:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HasOptions:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "first_option": Integer.to_json_dict(self.first_option) if self.first_option is not None else None,
@@ -104,6 +144,29 @@ class HasOptions:
             second_option=second_option,
             third_option=third_option,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"first_option": ')
+        write(json_encode(Integer.to_json_dict(self.first_option) if self.first_option is not None else None))
+        write(', "second_option": ')
+        write(json_encode(Integer.to_json_dict(self.second_option) if self.second_option is not None else None))
+        write(', "third_option": ')
+        if self.third_option is None:
+            write("null")
+        else:
+            self.third_option._write_json(write)
+        write("}")
+    def clone(self, deep: bool = True) -> HasOptions:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.first_option = self.first_option
+        result.second_option = self.second_option
+        result.third_option = self.third_option.clone() if self.third_option is not None else None
+        return result
+    def __deepcopy__(self, memo: dict) -> HasOptions:
+        return self.clone()
+    def freeze(self) -> HasOptions:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.first_option, self.second_option, self.third_option,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer, Opaque, String
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, Opaque, String, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .int64 import Int64
 __all__ = ['MyStruct']
@@ -24,6 +24,7 @@ class MyStruct:
             string maxString<100>;
         };
     """
+    __slots__ = ("a_big_int", "max_string", "some_int", "some_opaque", "some_string")
     def __init__(
         self,
         some_int: int,
@@ -52,6 +53,8 @@ class MyStruct:
         Opaque(self.some_opaque, 10, True).pack(packer)
         String(self.some_string, 4294967295).pack(packer)
         String(self.max_string, 100).pack(packer)
+    def xdr_size(self) -> int:
+        return 24 + 4 + (len(self.some_string) + 3) // 4 * 4 + 4 + (len(self.max_string) + 3) // 4 * 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> MyStruct:
         if depth_limit <= 0:
@@ -68,16 +71,57 @@ class MyStruct:
             some_string=some_string,
             max_string=max_string,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Integer.skip(unpacker)
+        Int64.skip(unpacker, depth_limit - 1)
+        Opaque.skip(unpacker, 10, True)
+        String.skip(unpacker, 4294967295)
+        String.skip(unpacker, 100)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | MyStruct:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "some_int" in fields:
+            _result["some_int"] = Integer.unpack_fields(unpacker, fields["some_int"])
+        else:
+            Integer.skip(unpacker)
+        if "a_big_int" in fields:
+            _result["a_big_int"] = Int64.unpack_fields(unpacker, fields["a_big_int"], depth_limit - 1)
+        else:
+            Int64.skip(unpacker, depth_limit - 1)
+        if "some_opaque" in fields:
+            _result["some_opaque"] = Opaque.unpack_fields(unpacker, fields["some_opaque"], 10, True)
+        else:
+            Opaque.skip(unpacker, 10, True)
+        if "some_string" in fields:
+            _result["some_string"] = String.unpack_fields(unpacker, fields["some_string"], 4294967295)
+        else:
+            String.skip(unpacker, 4294967295)
+        if "max_string" in fields:
+            _result["max_string"] = String.unpack_fields(unpacker, fields["max_string"], 100)
+        else:
+            String.skip(unpacker, 100)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MyStruct:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> MyStruct:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -92,11 +136,11 @@ class MyStruct:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MyStruct:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "some_int": Integer.to_json_dict(self.some_int),
@@ -119,6 +163,32 @@ class MyStruct:
             some_string=some_string,
             max_string=max_string,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"some_int": ')
+        write(json_encode(Integer.to_json_dict(self.some_int)))
+        write(', "a_big_int": ')
+        self.a_big_int._write_json(write)
+        write(', "some_opaque": ')
+        write(json_encode(Opaque.to_json_dict(self.some_opaque)))
+        write(', "some_string": ')
+        write(json_encode(String.to_json_dict(self.some_string)))
+        write(', "max_string": ')
+        write(json_encode(String.to_json_dict(self.max_string)))
+        write("}")
+    def clone(self, deep: bool = True) -> MyStruct:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.some_int = self.some_int
+        result.a_big_int = self.a_big_int.clone()
+        result.some_opaque = self.some_opaque
+        result.some_string = self.some_string
+        result.max_string = self.max_string
+        return result
+    def __deepcopy__(self, memo: dict) -> MyStruct:
+        return self.clone()
+    def freeze(self) -> MyStruct:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.some_int, self.a_big_int, self.some_opaque, self.some_string, self.max_string,))
     def __eq__(self, other: object):
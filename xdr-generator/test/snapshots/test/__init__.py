@@ -1,27 +1,124 @@
 # Automatically generated by xdrgen
 # DO NOT EDIT or your changes may be overwritten
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import *
 from .constants import *
-from .uint512 import *
-from .uint513 import *
-from .uint514 import *
-from .str import *
-from .str2 import *
-from .hash import *
-from .hashes1 import *
-from .hashes2 import *
-from .hashes3 import *
-from .opt_hash1 import *
-from .opt_hash2 import *
-from .int1 import *
-from .int2 import *
-from .int3 import *
-from .int4 import *
-from .my_struct import *
-from .lots_of_my_structs import *
-from .has_stuff import *
-from .color import *
-from .nester_nested_enum import *
-from .nester_nested_struct import *
-from .nester_nested_union import *
-from .nester import *
+from .stream import *
+if TYPE_CHECKING:
+    from .uint512 import *
+    from .uint513 import *
+    from .uint514 import *
+    from .str import *
+    from .str2 import *
+    from .hash import *
+    from .hashes1 import *
+    from .hashes2 import *
+    from .hashes3 import *
+    from .opt_hash1 import *
+    from .opt_hash2 import *
+    from .int1 import *
+    from .int2 import *
+    from .int3 import *
+    from .int4 import *
+    from .my_struct import *
+    from .lots_of_my_structs import *
+    from .has_stuff import *
+    from .color import *
+    from .nester_nested_enum import *
+    from .nester_nested_struct import *
+    from .nester_nested_union import *
+    from .nester import *
+_LAZY_IMPORTS = {
+    "Uint512": "uint512",
+    "Uint513": "uint513",
+    "Uint514": "uint514",
+    "Str": "str",
+    "Str2": "str2",
+    "Hash": "hash",
+    "Hashes1": "hashes1",
+    "Hashes2": "hashes2",
+    "Hashes3": "hashes3",
+    "OptHash1": "opt_hash1",
+    "OptHash2": "opt_hash2",
+    "Int1": "int1",
+    "Int2": "int2",
+    "Int3": "int3",
+    "Int4": "int4",
+    "MyStruct": "my_struct",
+    "LotsOfMyStructs": "lots_of_my_structs",
+    "HasStuff": "has_stuff",
+    "Color": "color",
+    "NesterNestedEnum": "nester_nested_enum",
+    "NesterNestedStruct": "nester_nested_struct",
+    "NesterNestedUnion": "nester_nested_union",
+    "Nester": "nester",
+}
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+__all__ = [
+    "DEFAULT_XDR_MAX_DEPTH",
+    "XdrBuffer",
+    "ZERO_COPY_MIN_SIZE",
+    "make_unpacker",
+    "make_frozen",
+    "make_view",
+    "FixedLayout",
+    "FrozenXdr",
+    "XdrView",
+    "set_json_backend",
+    "Integer",
+    "UnsignedInteger",
+    "Float",
+    "Double",
+    "Hyper",
+    "UnsignedHyper",
+    "Boolean",
+    "String",
+    "Opaque",
+    "FOO",
+    "BAR",
+    "DEFAULT_DECODE_CHUNK_SIZE",
+    "DEFAULT_MAX_RECORD_SIZE",
+    "XdrSource",
+    "decode_many",
+    "dump_xdr_json",
+    "iter_decode_many",
+    "iter_xdr_entries",
+    "iter_xdr_frames",
+    "iter_xdr_json",
+    "iter_xdr_records",
+    "pack_xdr_record",
+    "Uint512",
+    "Uint513",
+    "Uint514",
+    "Str",
+    "Str2",
+    "Hash",
+    "Hashes1",
+    "Hashes2",
+    "Hashes3",
+    "OptHash1",
+    "OptHash2",
+    "Int1",
+    "Int2",
+    "Int3",
+    "Int4",
+    "MyStruct",
+    "LotsOfMyStructs",
+    "HasStuff",
+    "Color",
+    "NesterNestedEnum",
+    "NesterNestedStruct",
+    "NesterNestedUnion",
+    "Nester",
+]
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, XdrView, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, make_view, shallow_clone, view_at, xdr_to_json
 
 from .lots_of_my_structs import LotsOfMyStructs
 __all__ = ['HasStuff']
@@ -20,6 +20,7 @@ class HasStuff:
           LotsOfMyStructs data;
         };
     """
+    __slots__ = ("data",)
     def __init__(
         self,
         data: LotsOfMyStructs,
@@ -27,6 +28,8 @@ class HasStuff:
         self.data = data
     def pack(self, packer: Packer) -> None:
         self.data.pack(packer)
+    def xdr_size(self) -> int:
+        return self.data.xdr_size()
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> HasStuff:
         if depth_limit <= 0:
@@ -35,16 +38,45 @@ class HasStuff:
         return cls(
             data=data,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        LotsOfMyStructs.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | HasStuff:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "data" in fields:
+            _result["data"] = LotsOfMyStructs.unpack_fields(unpacker, fields["data"], depth_limit - 1)
+        else:
+            LotsOfMyStructs.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "data", view_at(LotsOfMyStructs, unpacker, depth_limit - 1)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> HasStuff:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> HasStuff:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -59,11 +91,11 @@ class HasStuff:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> HasStuff:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "data": self.data.to_json_dict(),
@@ -74,6 +106,20 @@ class HasStuff:
         return cls(
             data=data,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"data": ')
+        self.data._write_json(write)
+        write("}")
+    def clone(self, deep: bool = True) -> HasStuff:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.data = self.data.clone()
+        return result
+    def __deepcopy__(self, memo: dict) -> HasStuff:
+        return self.clone()
+    def freeze(self) -> HasStuff:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.data,))
     def __eq__(self, other: object):
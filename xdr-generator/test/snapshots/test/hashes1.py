@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, shallow_clone, write_json_array, xdr_to_json
 
 from .hash import Hash
 __all__ = ['Hashes1']
@@ -17,6 +17,7 @@ class Hashes1:
 
         typedef Hash Hashes1[12];
     """
+    __slots__ = ("hashes1",)
     def __init__(self, hashes1: list[Hash]) -> None:
         _expect_length = 12
         if hashes1 and len(hashes1) != _expect_length:
@@ -25,6 +26,8 @@ class Hashes1:
     def pack(self, packer: Packer) -> None:
         for hashes1_item in self.hashes1:
             hashes1_item.pack(packer)
+    def xdr_size(self) -> int:
+        return 384
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Hashes1:
         if depth_limit <= 0:
@@ -34,16 +37,44 @@ class Hashes1:
         for _ in range(length):
             hashes1.append(Hash.unpack(unpacker, depth_limit - 1))
         return cls(hashes1)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = 12
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Hashes1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "hashes1" in fields:
+            length = 12
+            _result["hashes1"] = []
+            for _ in range(length):
+                _result["hashes1"].append(Hash.unpack_fields(unpacker, fields["hashes1"], depth_limit - 1))
+        else:
+            length = 12
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Hashes1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Hashes1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -58,16 +89,28 @@ class Hashes1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Hashes1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.hashes1]
     @classmethod
     def from_json_dict(cls, json_value: list) -> Hashes1:
         return cls([Hash.from_json_dict(item) for item in json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.hashes1)
+    def clone(self, deep: bool = True) -> Hashes1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.hashes1 = [item.clone() for item in self.hashes1]
+        return result
+    def __deepcopy__(self, memo: dict) -> Hashes1:
+        return self.clone()
+    def freeze(self) -> Hashes1:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.hashes1,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, XdrView, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, make_view, shallow_clone, write_json_array, xdr_to_json
 
 from .hash import Hash
 __all__ = ['Hashes2']
@@ -17,6 +17,7 @@ class Hashes2:
 
         typedef Hash Hashes2<12>;
     """
+    __slots__ = ("hashes2",)
     def __init__(self, hashes2: list[Hash]) -> None:
         _expect_max_length = 12
         if hashes2 and len(hashes2) > _expect_max_length:
@@ -26,6 +27,8 @@ class Hashes2:
         packer.pack_uint(len(self.hashes2))
         for hashes2_item in self.hashes2:
             hashes2_item.pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + 32 * len(self.hashes2)
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Hashes2:
         if depth_limit <= 0:
@@ -38,16 +41,68 @@ class Hashes2:
         for _ in range(length):
             hashes2.append(Hash.unpack(unpacker, depth_limit - 1))
         return cls(hashes2)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(f"hashes2 length {length} exceeds remaining input length {_remaining}")
+        for _ in range(length):
+            Hash.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Hashes2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "hashes2" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"hashes2 length {length} exceeds remaining input length {_remaining}")
+            _result["hashes2"] = []
+            for _ in range(length):
+                _result["hashes2"].append(Hash.unpack_fields(unpacker, fields["hashes2"], depth_limit - 1))
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"hashes2 length {length} exceeds remaining input length {_remaining}")
+            for _ in range(length):
+                Hash.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(f"hashes2 length {length} exceeds remaining input length {_remaining}")
+        hashes2 = []
+        for _ in range(length):
+            hashes2.append(Hash.unpack(unpacker, depth_limit - 1))
+        yield "hashes2", hashes2
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Hashes2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Hashes2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -62,16 +117,28 @@ class Hashes2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Hashes2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return [item.to_json_dict() for item in self.hashes2]
     @classmethod
     def from_json_dict(cls, json_value: list) -> Hashes2:
         return cls([Hash.from_json_dict(item) for item in json_value])
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write_json_array(write, self.hashes2)
+    def clone(self, deep: bool = True) -> Hashes2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.hashes2 = [item.clone() for item in self.hashes2]
+        return result
+    def __deepcopy__(self, memo: dict) -> Hashes2:
+        return self.clone()
+    def freeze(self) -> Hashes2:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.hashes2,))
     def __eq__(self, other: object):
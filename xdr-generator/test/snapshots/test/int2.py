@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Hyper
+from .base import DEFAULT_XDR_MAX_DEPTH, FixedLayout, Hyper, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
+_LAYOUT = FixedLayout(">q")
 __all__ = ['Int2']
 class Int2:
     """
@@ -16,26 +17,50 @@ class Int2:
 
         typedef hyper           int2;
     """
+    __slots__ = ("int2",)
     def __init__(self, int2: int) -> None:
         self.int2 = int2
     def pack(self, packer: Packer) -> None:
-        Hyper(self.int2).pack(packer)
+        _LAYOUT.write(packer, self.int2)
+    def xdr_size(self) -> int:
+        return 8
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Int2:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        int2 = Hyper.unpack(unpacker)
+        (int2,) = _LAYOUT.read(unpacker)
         return cls(int2)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Int2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "int2" in fields:
+            _result["int2"] = Hyper.unpack_fields(unpacker, fields["int2"])
+        else:
+            Hyper.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Int2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Int2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -50,16 +75,28 @@ class Int2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Int2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return Hyper.to_json_dict(self.int2)
     @classmethod
     def from_json_dict(cls, json_value: str) -> Int2:
         return cls(Hyper.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(Hyper.to_json_dict(self.int2)))
+    def clone(self, deep: bool = True) -> Int2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.int2 = self.int2
+        return result
+    def __deepcopy__(self, memo: dict) -> Int2:
+        return self.clone()
+    def freeze(self) -> Int2:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.int2,))
     def __eq__(self, other: object):
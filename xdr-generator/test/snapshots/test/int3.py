@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, UnsignedInteger
+from .base import DEFAULT_XDR_MAX_DEPTH, FixedLayout, UnsignedInteger, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
+_LAYOUT = FixedLayout(">I")
 __all__ = ['Int3']
 class Int3:
     """
@@ -16,26 +17,50 @@ class Int3:
 
         typedef unsigned int    int3;
     """
+    __slots__ = ("int3",)
     def __init__(self, int3: int) -> None:
         self.int3 = int3
     def pack(self, packer: Packer) -> None:
-        UnsignedInteger(self.int3).pack(packer)
+        _LAYOUT.write(packer, self.int3)
+    def xdr_size(self) -> int:
+        return 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Int3:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        int3 = UnsignedInteger.unpack(unpacker)
+        (int3,) = _LAYOUT.read(unpacker)
         return cls(int3)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Int3:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "int3" in fields:
+            _result["int3"] = UnsignedInteger.unpack_fields(unpacker, fields["int3"])
+        else:
+            UnsignedInteger.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Int3:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Int3:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -50,16 +75,28 @@ class Int3:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Int3:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return UnsignedInteger.to_json_dict(self.int3)
     @classmethod
     def from_json_dict(cls, json_value: int) -> Int3:
         return cls(UnsignedInteger.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(UnsignedInteger.to_json_dict(self.int3)))
+    def clone(self, deep: bool = True) -> Int3:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.int3 = self.int3
+        return result
+    def __deepcopy__(self, memo: dict) -> Int3:
+        return self.clone()
+    def freeze(self) -> Int3:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.int3,))
     def __eq__(self, other: object):
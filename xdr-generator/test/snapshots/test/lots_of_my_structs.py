@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, XdrView, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, make_view, shallow_clone, write_json_array, xdr_to_json
 
 from .my_struct import MyStruct
 __all__ = ['LotsOfMyStructs']
@@ -20,6 +20,7 @@ class LotsOfMyStructs:
             MyStruct members<>;
         };
     """
+    __slots__ = ("members",)
     def __init__(
         self,
         members: list[MyStruct],
@@ -32,6 +33,8 @@ class LotsOfMyStructs:
         packer.pack_uint(len(self.members))
         for members_item in self.members:
             members_item.pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + sum(item.xdr_size() for item in self.members)
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> LotsOfMyStructs:
         if depth_limit <= 0:
@@ -46,16 +49,68 @@ class LotsOfMyStructs:
         return cls(
             members=members,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(f"members length {length} exceeds remaining input length {_remaining}")
+        for _ in range(length):
+            MyStruct.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | LotsOfMyStructs:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "members" in fields:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"members length {length} exceeds remaining input length {_remaining}")
+            _result["members"] = []
+            for _ in range(length):
+                _result["members"].append(MyStruct.unpack_fields(unpacker, fields["members"], depth_limit - 1))
+        else:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"members length {length} exceeds remaining input length {_remaining}")
+            for _ in range(length):
+                MyStruct.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        length = unpacker.unpack_uint()
+        _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+        if _remaining < length:
+            raise ValueError(f"members length {length} exceeds remaining input length {_remaining}")
+        members = []
+        for _ in range(length):
+            members.append(MyStruct.unpack(unpacker, depth_limit - 1))
+        yield "members", members
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> LotsOfMyStructs:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> LotsOfMyStructs:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -70,11 +125,11 @@ class LotsOfMyStructs:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> LotsOfMyStructs:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "members": [item.to_json_dict() for item in self.members],
@@ -85,6 +140,20 @@ class LotsOfMyStructs:
         return cls(
             members=members,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"members": ')
+        write_json_array(write, self.members)
+        write("}")
+    def clone(self, deep: bool = True) -> LotsOfMyStructs:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.members = [item.clone() for item in self.members]
+        return result
+    def __deepcopy__(self, memo: dict) -> LotsOfMyStructs:
+        return self.clone()
+    def freeze(self) -> LotsOfMyStructs:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.members,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import Boolean, DEFAULT_XDR_MAX_DEPTH, Double, Float, UnsignedInteger
+from .base import Boolean, DEFAULT_XDR_MAX_DEPTH, Double, Float, UnsignedInteger, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .uint512 import Uint512
 from .opt_hash1 import OptHash1
@@ -28,6 +28,7 @@ class MyStruct:
             bool field7;
         };
     """
+    __slots__ = ("field1", "field2", "field3", "field4", "field5", "field6", "field7")
     def __init__(
         self,
         field1: Uint512,
@@ -53,6 +54,8 @@ class MyStruct:
         Float(self.field5).pack(packer)
         Double(self.field6).pack(packer)
         Boolean(self.field7).pack(packer)
+    def xdr_size(self) -> int:
+        return 88 + self.field2.xdr_size()
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> MyStruct:
         if depth_limit <= 0:
@@ -73,16 +76,67 @@ class MyStruct:
             field6=field6,
             field7=field7,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Uint512.skip(unpacker, depth_limit - 1)
+        OptHash1.skip(unpacker, depth_limit - 1)
+        Int1.skip(unpacker, depth_limit - 1)
+        UnsignedInteger.skip(unpacker)
+        Float.skip(unpacker)
+        Double.skip(unpacker)
+        Boolean.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | MyStruct:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "field1" in fields:
+            _result["field1"] = Uint512.unpack_fields(unpacker, fields["field1"], depth_limit - 1)
+        else:
+            Uint512.skip(unpacker, depth_limit - 1)
+        if "field2" in fields:
+            _result["field2"] = OptHash1.unpack_fields(unpacker, fields["field2"], depth_limit - 1)
+        else:
+            OptHash1.skip(unpacker, depth_limit - 1)
+        if "field3" in fields:
+            _result["field3"] = Int1.unpack_fields(unpacker, fields["field3"], depth_limit - 1)
+        else:
+            Int1.skip(unpacker, depth_limit - 1)
+        if "field4" in fields:
+            _result["field4"] = UnsignedInteger.unpack_fields(unpacker, fields["field4"])
+        else:
+            UnsignedInteger.skip(unpacker)
+        if "field5" in fields:
+            _result["field5"] = Float.unpack_fields(unpacker, fields["field5"])
+        else:
+            Float.skip(unpacker)
+        if "field6" in fields:
+            _result["field6"] = Double.unpack_fields(unpacker, fields["field6"])
+        else:
+            Double.skip(unpacker)
+        if "field7" in fields:
+            _result["field7"] = Boolean.unpack_fields(unpacker, fields["field7"])
+        else:
+            Boolean.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> MyStruct:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> MyStruct:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -97,11 +151,11 @@ class MyStruct:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> MyStruct:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "field1": self.field1.to_json_dict(),
@@ -130,6 +184,38 @@ class MyStruct:
             field6=field6,
             field7=field7,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"field1": ')
+        self.field1._write_json(write)
+        write(', "field2": ')
+        self.field2._write_json(write)
+        write(', "field3": ')
+        self.field3._write_json(write)
+        write(', "field4": ')
+        write(json_encode(UnsignedInteger.to_json_dict(self.field4)))
+        write(', "field5": ')
+        write(json_encode(Float.to_json_dict(self.field5)))
+        write(', "field6": ')
+        write(json_encode(Double.to_json_dict(self.field6)))
+        write(', "field7": ')
+        write(json_encode(Boolean.to_json_dict(self.field7)))
+        write("}")
+    def clone(self, deep: bool = True) -> MyStruct:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.field1 = self.field1.clone()
+        result.field2 = self.field2.clone()
+        result.field3 = self.field3.clone()
+        result.field4 = self.field4
+        result.field5 = self.field5
+        result.field6 = self.field6
+        result.field7 = self.field7
+        return result
+    def __deepcopy__(self, memo: dict) -> MyStruct:
+        return self.clone()
+    def freeze(self) -> MyStruct:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.field1, self.field2, self.field3, self.field4, self.field5, self.field6, self.field7,))
     def __eq__(self, other: object):
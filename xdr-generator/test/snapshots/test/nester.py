@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .nester_nested_enum import NesterNestedEnum
 from .nester_nested_struct import NesterNestedStruct
@@ -38,6 +38,7 @@ class Nester:
 
         };
     """
+    __slots__ = ("nested_enum", "nested_struct", "nested_union")
     def __init__(
         self,
         nested_enum: NesterNestedEnum,
@@ -51,6 +52,8 @@ class Nester:
         self.nested_enum.pack(packer)
         self.nested_struct.pack(packer)
         self.nested_union.pack(packer)
+    def xdr_size(self) -> int:
+        return 8 + self.nested_union.xdr_size()
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Nester:
         if depth_limit <= 0:
@@ -63,16 +66,47 @@ class Nester:
             nested_struct=nested_struct,
             nested_union=nested_union,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        NesterNestedEnum.skip(unpacker)
+        NesterNestedStruct.skip(unpacker, depth_limit - 1)
+        NesterNestedUnion.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Nester:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "nested_enum" in fields:
+            _result["nested_enum"] = NesterNestedEnum.unpack_fields(unpacker, fields["nested_enum"])
+        else:
+            NesterNestedEnum.skip(unpacker)
+        if "nested_struct" in fields:
+            _result["nested_struct"] = NesterNestedStruct.unpack_fields(unpacker, fields["nested_struct"], depth_limit - 1)
+        else:
+            NesterNestedStruct.skip(unpacker, depth_limit - 1)
+        if "nested_union" in fields:
+            _result["nested_union"] = NesterNestedUnion.unpack_fields(unpacker, fields["nested_union"], depth_limit - 1)
+        else:
+            NesterNestedUnion.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Nester:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Nester:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -87,11 +121,11 @@ class Nester:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Nester:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "nested_enum": self.nested_enum.to_json_dict(),
@@ -108,6 +142,26 @@ class Nester:
             nested_struct=nested_struct,
             nested_union=nested_union,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"nested_enum": ')
+        self.nested_enum._write_json(write)
+        write(', "nested_struct": ')
+        self.nested_struct._write_json(write)
+        write(', "nested_union": ')
+        self.nested_union._write_json(write)
+        write("}")
+    def clone(self, deep: bool = True) -> Nester:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.nested_enum = self.nested_enum
+        result.nested_struct = self.nested_struct.clone()
+        result.nested_union = self.nested_union.clone()
+        return result
+    def __deepcopy__(self, memo: dict) -> Nester:
+        return self.clone()
+    def freeze(self) -> Nester:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.nested_enum, self.nested_struct, self.nested_union,))
     def __eq__(self, other: object):
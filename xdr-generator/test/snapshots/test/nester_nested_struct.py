@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, FixedLayout, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
+_LAYOUT = FixedLayout(">i")
 __all__ = ['NesterNestedStruct']
 class NesterNestedStruct:
     """
@@ -18,31 +19,55 @@ class NesterNestedStruct:
             int blah;
           }
     """
+    __slots__ = ("blah",)
     def __init__(
         self,
         blah: int,
     ) -> None:
         self.blah = blah
     def pack(self, packer: Packer) -> None:
-        Integer(self.blah).pack(packer)
+        _LAYOUT.write(packer, self.blah)
+    def xdr_size(self) -> int:
+        return 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> NesterNestedStruct:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
-        blah = Integer.unpack(unpacker)
+        (blah,) = _LAYOUT.read(unpacker)
         return cls(
             blah=blah,
         )
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        _LAYOUT.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | NesterNestedStruct:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "blah" in fields:
+            _result["blah"] = Integer.unpack_fields(unpacker, fields["blah"])
+        else:
+            Integer.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> NesterNestedStruct:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> NesterNestedStruct:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -57,11 +82,11 @@ class NesterNestedStruct:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> NesterNestedStruct:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self) -> dict:
         return {
             "blah": Integer.to_json_dict(self.blah),
@@ -72,6 +97,20 @@ class NesterNestedStruct:
         return cls(
             blah=blah,
         )
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write('{"blah": ')
+        write(json_encode(Integer.to_json_dict(self.blah)))
+        write("}")
+    def clone(self, deep: bool = True) -> NesterNestedStruct:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.blah = self.blah
+        return result
+    def __deepcopy__(self, memo: dict) -> NesterNestedStruct:
+        return self.clone()
+    def freeze(self) -> NesterNestedStruct:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.blah,))
     def __eq__(self, other: object):
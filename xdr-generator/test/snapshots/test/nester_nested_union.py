@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .color import Color
 __all__ = ['NesterNestedUnion']
@@ -22,6 +22,7 @@ class NesterNestedUnion:
               int blah2;
           }
     """
+    __slots__ = ("blah2", "color")
     def __init__(
         self,
         color: Color,
@@ -36,25 +37,56 @@ class NesterNestedUnion:
         if self.blah2 is None:
             raise ValueError("blah2 should not be None.")
         Integer(self.blah2).pack(packer)
+    def xdr_size(self) -> int:
+        if self.color == Color.RED:
+            return 4
+        return 8
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> NesterNestedUnion:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        color = Color.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(color, _unpack_blah2)
+        return unpack_arm(cls, color, unpacker, depth_limit)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         color = Color.unpack(unpacker)
         if color == Color.RED:
-            return cls(color=color)
-        blah2 = Integer.unpack(unpacker)
-        return cls(color=color, blah2=blah2)
+            return
+        Integer.skip(unpacker)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | NesterNestedUnion:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        color = Color.unpack(unpacker)
+        if "color" in fields:
+            _result["color"] = color
+        if color == Color.RED:
+            return _result
+        if "blah2" in fields:
+            _result["blah2"] = Integer.unpack_fields(unpacker, fields["blah2"])
+        else:
+            Integer.skip(unpacker)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> NesterNestedUnion:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> NesterNestedUnion:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -69,11 +101,11 @@ class NesterNestedUnion:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> NesterNestedUnion:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         if self.color == Color.RED:
             return "red"
@@ -92,6 +124,25 @@ class NesterNestedUnion:
         color = Color.from_json_dict(key)
         blah2 = Integer.from_json_dict(json_value[key])
         return cls(color=color, blah2=blah2)
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.color == Color.RED:
+            write('"red"')
+            return
+        assert self.blah2 is not None
+        write("{" + json_encode(self.color.to_json_dict()) + ": ")
+        write(json_encode(Integer.to_json_dict(self.blah2)))
+        write("}")
+    def clone(self, deep: bool = True) -> NesterNestedUnion:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.color = self.color
+        result.blah2 = self.blah2
+        return result
+    def __deepcopy__(self, memo: dict) -> NesterNestedUnion:
+        return self.clone()
+    def freeze(self) -> NesterNestedUnion:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.color, self.blah2,))
     def __eq__(self, other: object):
@@ -104,3 +155,11 @@ class NesterNestedUnion:
         if self.blah2 is not None:
             out.append(f'blah2={self.blah2}')
         return f"<NesterNestedUnion [{', '.join(out)}]>"
+def _unpack_void(cls, color, unpacker: Unpacker, depth_limit: int) -> NesterNestedUnion:
+    return cls(color=color)
+def _unpack_blah2(cls, color, unpacker: Unpacker, depth_limit: int) -> NesterNestedUnion:
+    blah2 = Integer.unpack(unpacker)
+    return cls(color=color, blah2=blah2)
+_UNPACK_ARMS = {
+    Color.RED: _unpack_void,
+}
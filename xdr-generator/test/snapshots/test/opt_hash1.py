@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 from .hash import Hash
 __all__ = ['OptHash1']
@@ -17,6 +17,7 @@ class OptHash1:
 
         typedef Hash *optHash1;
     """
+    __slots__ = ("opt_hash1",)
     def __init__(self, opt_hash1: Hash | None) -> None:
         self.opt_hash1 = opt_hash1
     def pack(self, packer: Packer) -> None:
@@ -25,22 +26,47 @@ class OptHash1:
         else:
             packer.pack_uint(1)
             self.opt_hash1.pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + (32 if self.opt_hash1 is not None else 0)
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> OptHash1:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         opt_hash1 = Hash.unpack(unpacker, depth_limit - 1) if unpacker.unpack_uint() else None
         return cls(opt_hash1)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        if unpacker.unpack_uint():
+            Hash.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | OptHash1:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "opt_hash1" in fields:
+            _result["opt_hash1"] = Hash.unpack_fields(unpacker, fields["opt_hash1"], depth_limit - 1) if unpacker.unpack_uint() else None
+        else:
+            if unpacker.unpack_uint():
+                Hash.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> OptHash1:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> OptHash1:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -55,16 +81,31 @@ class OptHash1:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> OptHash1:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return self.opt_hash1.to_json_dict() if self.opt_hash1 is not None else None
     @classmethod
     def from_json_dict(cls, json_value: str | None) -> OptHash1:
         return cls(Hash.from_json_dict(json_value) if json_value is not None else None)
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.opt_hash1 is None:
+            write("null")
+        else:
+            self.opt_hash1._write_json(write)
+    def clone(self, deep: bool = True) -> OptHash1:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.opt_hash1 = self.opt_hash1.clone() if self.opt_hash1 is not None else None
+        return result
+    def __deepcopy__(self, memo: dict) -> OptHash1:
+        return self.clone()
+    def freeze(self) -> OptHash1:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.opt_hash1,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, String
+from .base import DEFAULT_XDR_MAX_DEPTH, String, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 __all__ = ['Str2']
 class Str2:
@@ -16,6 +16,7 @@ class Str2:
 
         typedef string str2<>;
     """
+    __slots__ = ("str2",)
     def __init__(self, str2: bytes) -> None:
         _expect_max_length = 4294967295
         if str2 and len(str2) > _expect_max_length:
@@ -23,22 +24,45 @@ class Str2:
         self.str2 = str2
     def pack(self, packer: Packer) -> None:
         String(self.str2, 4294967295).pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + (len(self.str2) + 3) // 4 * 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Str2:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         str2 = String.unpack(unpacker, 4294967295)
         return cls(str2)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        String.skip(unpacker, 4294967295)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Str2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "str2" in fields:
+            _result["str2"] = String.unpack_fields(unpacker, fields["str2"], 4294967295)
+        else:
+            String.skip(unpacker, 4294967295)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Str2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Str2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -53,16 +77,28 @@ class Str2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Str2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return String.to_json_dict(self.str2)
     @classmethod
     def from_json_dict(cls, json_value: str) -> Str2:
         return cls(String.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(String.to_json_dict(self.str2)))
+    def clone(self, deep: bool = True) -> Str2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.str2 = self.str2
+        return result
+    def __deepcopy__(self, memo: dict) -> Str2:
+        return self.clone()
+    def freeze(self) -> Str2:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.str2,))
     def __eq__(self, other: object):
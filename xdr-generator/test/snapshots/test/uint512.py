@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import DEFAULT_XDR_MAX_DEPTH, Opaque, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 __all__ = ['Uint512']
 class Uint512:
@@ -16,6 +16,7 @@ class Uint512:
 
         typedef opaque uint512[64];
     """
+    __slots__ = ("uint512",)
     def __init__(self, uint512: bytes) -> None:
         _expect_length = 64
         if uint512 and len(uint512) != _expect_length:
@@ -23,22 +24,45 @@ class Uint512:
         self.uint512 = uint512
     def pack(self, packer: Packer) -> None:
         Opaque(self.uint512, 64, True).pack(packer)
+    def xdr_size(self) -> int:
+        return 64
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Uint512:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         uint512 = Opaque.unpack(unpacker, 64, True)
         return cls(uint512)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 64, True)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Uint512:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "uint512" in fields:
+            _result["uint512"] = Opaque.unpack_fields(unpacker, fields["uint512"], 64, True)
+        else:
+            Opaque.skip(unpacker, 64, True)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Uint512:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Uint512:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -53,16 +77,28 @@ class Uint512:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Uint512:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return Opaque.to_json_dict(self.uint512)
     @classmethod
     def from_json_dict(cls, json_value: str) -> Uint512:
         return cls(Opaque.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(Opaque.to_json_dict(self.uint512)))
+    def clone(self, deep: bool = True) -> Uint512:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.uint512 = self.uint512
+        return result
+    def __deepcopy__(self, memo: dict) -> Uint512:
+        return self.clone()
+    def freeze(self) -> Uint512:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.uint512,))
     def __eq__(self, other: object):
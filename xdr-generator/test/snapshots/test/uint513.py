@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Opaque
+from .base import DEFAULT_XDR_MAX_DEPTH, Opaque, XdrBuffer, check_fields, decode_field_paths, json_encode, json_loads, make_frozen, make_unpacker, shallow_clone, xdr_to_json
 
 __all__ = ['Uint513']
 class Uint513:
@@ -16,6 +16,7 @@ class Uint513:
 
         typedef opaque uint513<64>;
     """
+    __slots__ = ("uint513",)
     def __init__(self, uint513: bytes) -> None:
         _expect_max_length = 64
         if uint513 and len(uint513) > _expect_max_length:
@@ -23,22 +24,45 @@ class Uint513:
         self.uint513 = uint513
     def pack(self, packer: Packer) -> None:
         Opaque(self.uint513, 64, False).pack(packer)
+    def xdr_size(self) -> int:
+        return 4 + (len(self.uint513) + 3) // 4 * 4
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> Uint513:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         uint513 = Opaque.unpack(unpacker, 64, False)
         return cls(uint513)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        Opaque.skip(unpacker, 64, False)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | Uint513:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "uint513" in fields:
+            _result["uint513"] = Opaque.unpack_fields(unpacker, fields["uint513"], 64, False)
+        else:
+            Opaque.skip(unpacker, 64, False)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> Uint513:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> Uint513:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -53,16 +77,28 @@ class Uint513:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> Uint513:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return Opaque.to_json_dict(self.uint513)
     @classmethod
     def from_json_dict(cls, json_value: str) -> Uint513:
         return cls(Opaque.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        write(json_encode(Opaque.to_json_dict(self.uint513)))
+    def clone(self, deep: bool = True) -> Uint513:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.uint513 = self.uint513
+        return result
+    def __deepcopy__(self, memo: dict) -> Uint513:
+        return self.clone()
+    def freeze(self) -> Uint513:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.uint513,))
     def __eq__(self, other: object):
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH, Integer
+from .base import DEFAULT_XDR_MAX_DEPTH, Integer, XdrBuffer, XdrView, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, make_view, shallow_clone, write_json_array, xdr_to_json
 
 from .error import Error
 from .multi import Multi
@@ -25,6 +25,7 @@ class IntUnion:
 
         };
     """
+    __slots__ = ("error", "things", "type")
     def __init__(
         self,
         type: int,
@@ -52,14 +53,89 @@ class IntUnion:
                 things_item.pack(packer)
             return
         raise ValueError("Invalid type.")
+    def xdr_size(self) -> int:
+        if self.type == 0:
+            return 8
+        if self.type == 1:
+            assert self.things is not None
+            return 4 + 4 + 4 * len(self.things)
+        raise ValueError("Invalid type.")
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> IntUnion:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = Integer.unpack(unpacker)
+        unpack_arm = _UNPACK_ARMS.get(type)
+        if unpack_arm is None:
+            raise ValueError("Invalid type.")
+        return unpack_arm(cls, type, unpacker, depth_limit)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         type = Integer.unpack(unpacker)
         if type == 0:
-            error = Error.unpack(unpacker, depth_limit - 1)
-            return cls(type=type, error=error)
+            Error.skip(unpacker, depth_limit - 1)
+            return
+        if type == 1:
+            length = unpacker.unpack_uint()
+            _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+            if _remaining < length:
+                raise ValueError(f"things length {length} exceeds remaining input length {_remaining}")
+            for _ in range(length):
+                Multi.skip(unpacker, depth_limit - 1)
+            return
+        raise ValueError("Invalid type.")
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | IntUnion:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        type = Integer.unpack(unpacker)
+        if "type" in fields:
+            _result["type"] = type
+        if type == 0:
+            if "error" in fields:
+                _result["error"] = Error.unpack_fields(unpacker, fields["error"], depth_limit - 1)
+            else:
+                Error.skip(unpacker, depth_limit - 1)
+            return _result
+        if type == 1:
+            if "things" in fields:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(f"things length {length} exceeds remaining input length {_remaining}")
+                _result["things"] = []
+                for _ in range(length):
+                    _result["things"].append(Multi.unpack_fields(unpacker, fields["things"], depth_limit - 1))
+            else:
+                length = unpacker.unpack_uint()
+                _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+                if _remaining < length:
+                    raise ValueError(f"things length {length} exceeds remaining input length {_remaining}")
+                for _ in range(length):
+                    Multi.skip(unpacker, depth_limit - 1)
+            return _result
+        raise ValueError("Invalid type.")
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        type = Integer.unpack(unpacker)
+        yield "type", type
+        if type == 0:
+            yield "error", Error.unpack(unpacker, depth_limit - 1)
+            return
         if type == 1:
             length = unpacker.unpack_uint()
             _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
@@ -68,7 +144,8 @@ class IntUnion:
             things = []
             for _ in range(length):
                 things.append(Multi.unpack(unpacker, depth_limit - 1))
-            return cls(type=type, things=things)
+            yield "things", things
+            return
         raise ValueError("Invalid type.")
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
@@ -76,10 +153,10 @@ class IntUnion:
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> IntUnion:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> IntUnion:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -94,11 +171,11 @@ class IntUnion:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> IntUnion:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         if self.type == 0:
             assert self.error is not None
@@ -120,6 +197,32 @@ class IntUnion:
             things = [Multi.from_json_dict(item) for item in json_value["v1"]]
             return cls(type=type, things=things)
         raise ValueError(f"Unknown key '{key}' for IntUnion")
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        if self.type == 0:
+            assert self.error is not None
+            write('{"v0": ')
+            self.error._write_json(write)
+            write("}")
+            return
+        if self.type == 1:
+            assert self.things is not None
+            write('{"v1": ')
+            write_json_array(write, self.things)
+            write("}")
+            return
+        raise ValueError(f"Unknown type in IntUnion: {self.type}")
+    def clone(self, deep: bool = True) -> IntUnion:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.type = self.type
+        result.error = self.error.clone() if self.error is not None else None
+        result.things = [item.clone() for item in self.things] if self.things is not None else None
+        return result
+    def __deepcopy__(self, memo: dict) -> IntUnion:
+        return self.clone()
+    def freeze(self) -> IntUnion:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.type, self.error, self.things,))
     def __eq__(self, other: object):
@@ -134,3 +237,19 @@ class IntUnion:
         if self.things is not None:
             out.append(f'things={self.things}')
         return f"<IntUnion [{', '.join(out)}]>"
+def _unpack_error(cls, type, unpacker: Unpacker, depth_limit: int) -> IntUnion:
+    error = Error.unpack(unpacker, depth_limit - 1)
+    return cls(type=type, error=error)
+def _unpack_things(cls, type, unpacker: Unpacker, depth_limit: int) -> IntUnion:
+    length = unpacker.unpack_uint()
+    _remaining = len(unpacker.get_buffer()) - unpacker.get_position()
+    if _remaining < length:
+        raise ValueError(f"things length {length} exceeds remaining input length {_remaining}")
+    things = []
+    for _ in range(length):
+        things.append(Multi.unpack(unpacker, depth_limit - 1))
+    return cls(type=type, things=things)
+_UNPACK_ARMS = {
+    0: _unpack_error,
+    1: _unpack_things,
+}
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import base64
-import json
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from typing import TYPE_CHECKING
 from xdrlib3 import Packer, Unpacker
-from .base import DEFAULT_XDR_MAX_DEPTH
+from .base import DEFAULT_XDR_MAX_DEPTH, XdrBuffer, XdrView, check_fields, decode_field_paths, json_loads, make_frozen, make_unpacker, make_view, shallow_clone, view_at, xdr_to_json
 
 from .int_union import IntUnion
 __all__ = ['IntUnion2']
@@ -17,26 +17,58 @@ class IntUnion2:
 
         typedef IntUnion IntUnion2;
     """
+    __slots__ = ("int_union2",)
     def __init__(self, int_union2: IntUnion) -> None:
         self.int_union2 = int_union2
     def pack(self, packer: Packer) -> None:
         self.int_union2.pack(packer)
+    def xdr_size(self) -> int:
+        return self.int_union2.xdr_size()
     @classmethod
     def unpack(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> IntUnion2:
         if depth_limit <= 0:
             raise ValueError("Maximum decoding depth reached")
         int_union2 = IntUnion.unpack(unpacker, depth_limit - 1)
         return cls(int_union2)
+    @classmethod
+    def skip(cls, unpacker: Unpacker, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> None:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        IntUnion.skip(unpacker, depth_limit - 1)
+    @classmethod
+    def unpack_fields(cls, unpacker: Unpacker, fields: dict | None, depth_limit: int = DEFAULT_XDR_MAX_DEPTH) -> dict | IntUnion2:
+        if fields is None:
+            return cls.unpack(unpacker, depth_limit)
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        check_fields(cls, fields)
+        _result: dict = {}
+        if "int_union2" in fields:
+            _result["int_union2"] = IntUnion.unpack_fields(unpacker, fields["int_union2"], depth_limit - 1)
+        else:
+            IntUnion.skip(unpacker, depth_limit - 1)
+        return _result
+    @classmethod
+    def decode_fields(cls, xdr: XdrBuffer, paths: list[str], zero_copy: bool = False) -> dict:
+        return decode_field_paths(cls, xdr, paths, zero_copy)
+    @classmethod
+    def view(cls, xdr: XdrBuffer, zero_copy: bool = False) -> XdrView:
+        return make_view(cls, xdr, zero_copy)
+    @classmethod
+    def _view_members(cls, unpacker: Unpacker, depth_limit: int) -> Iterator[tuple]:
+        if depth_limit <= 0:
+            raise ValueError("Maximum decoding depth reached")
+        yield "int_union2", view_at(IntUnion, unpacker, depth_limit - 1)
     def to_xdr_bytes(self) -> bytes:
         packer = Packer()
         self.pack(packer)
         return packer.get_buffer()
 
     @classmethod
-    def from_xdr_bytes(cls, xdr: bytes) -> IntUnion2:
-        unpacker = Unpacker(xdr)
+    def from_xdr_bytes(cls, xdr: XdrBuffer, zero_copy: bool = False) -> IntUnion2:
+        unpacker = make_unpacker(xdr, zero_copy)
         result = cls.unpack(unpacker)
-        remaining = len(xdr) - unpacker.get_position()
+        remaining = len(unpacker.get_buffer()) - unpacker.get_position()
         if remaining != 0:
             raise ValueError(f"Unexpected trailing {remaining} bytes in XDR data")
         return result
@@ -51,16 +83,28 @@ class IntUnion2:
         return cls.from_xdr_bytes(xdr_bytes)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_json_dict())
+        return xdr_to_json(self)
 
     @classmethod
     def from_json(cls, json_str: str) -> IntUnion2:
-        return cls.from_json_dict(json.loads(json_str))
+        return cls.from_json_dict(json_loads(json_str))
     def to_json_dict(self):
         return self.int_union2.to_json_dict()
     @classmethod
     def from_json_dict(cls, json_value) -> IntUnion2:
         return cls(IntUnion.from_json_dict(json_value))
+    def _write_json(self, write: Callable[[str], object]) -> None:
+        self.int_union2._write_json(write)
+    def clone(self, deep: bool = True) -> IntUnion2:
+        if not deep:
+            return shallow_clone(self)
+        result = object.__new__(self.__class__)
+        result.int_union2 = self.int_union2.clone()
+        return result
+    def __deepcopy__(self, memo: dict) -> IntUnion2:
+        return self.clone()
+    def freeze(self) -> IntUnion2:
+        return make_frozen(self)
     def __hash__(self):
         return hash((self.int_union2,))
     def __eq__(self, other: object):